@@ -0,0 +1,321 @@
+/*
+ * Client-side renderer for the data bundle written by
+ * `python -m sockperf_tools bundle` (see sockperf_tools/bundle.py).
+ *
+ * No libraries and no build step: charts are drawn on <canvas> from typed
+ * arrays decoded straight out of the bundle. The time-series chart zooms
+ * by dragging (double-click resets) and draws the finest resolution level
+ * whose visible points fit the canvas.
+ */
+(function (root) {
+    'use strict';
+
+    var DTYPES = { '<f4': Float32Array, '<f8': Float64Array, '<u4': Uint32Array };
+    var COLORS = ['#e74c3c', '#2ecc71', '#3498db', '#9b59b6', '#f39c12', '#1abc9c'];
+    var PERCENTILE_TICKS = [[0, '0%'], [1, '90%'], [2, '99%'], [3, '99.9%'], [4, '99.99%'], [5, '99.999%'],
+                            [6, '99.9999%']];
+
+    function decode(array) {
+        var binary = atob(array.b64);
+        var bytes = new Uint8Array(binary.length);
+        for (var i = 0; i < binary.length; i++) {
+            bytes[i] = binary.charCodeAt(i);
+        }
+        return new DTYPES[array.dtype](bytes.buffer);
+    }
+
+    function lowerBound(values, target) {
+        var lo = 0, hi = values.length;
+        while (lo < hi) {
+            var mid = (lo + hi) >> 1;
+            if (values[mid] < target) { lo = mid + 1; } else { hi = mid; }
+        }
+        return lo;
+    }
+
+    // Finest level (levels are coarse to fine) with at most `budget` points in [lo, hi]
+    function levelFor(levels, lo, hi, budget) {
+        for (var i = levels.length - 1; i > 0; i--) {
+            var t = levels[i].time;
+            if (lowerBound(t, hi) - lowerBound(t, lo) <= budget) {
+                return levels[i];
+            }
+        }
+        return levels[0];
+    }
+
+    // Latency by percentile on a "nines" axis: x = -log10(1 - p)
+    function percentileCurve(histogram) {
+        var upper = decode(histogram.upper_us), counts = decode(histogram.counts);
+        var total = 0, i;
+        for (i = 0; i < counts.length; i++) { total += counts[i]; }
+        var x = new Float64Array(counts.length), y = new Float64Array(counts.length);
+        var cumulative = 0, limit = Math.log10(total);
+        for (i = 0; i < counts.length; i++) {
+            cumulative += counts[i];
+            x[i] = cumulative >= total ? limit : Math.min(-Math.log10(1 - cumulative / total), limit);
+            y[i] = Math.min(upper[i], histogram.max_us);
+        }
+        return { x: x, y: y };
+    }
+
+    function niceTicks(lo, hi, count) {
+        var raw = (hi - lo) / Math.max(count, 1);
+        var scale = Math.pow(10, Math.floor(Math.log10(raw)));
+        var step = [1, 2, 5, 10].map(function (s) { return s * scale; }).find(function (s) { return s >= raw; });
+        var ticks = [];
+        for (var v = Math.ceil(lo / step) * step; v <= hi + step * 1e-9; v += step) {
+            ticks.push([v, +v.toPrecision(6) + '']);
+        }
+        return ticks;
+    }
+
+    function extent(lines, key, range) {
+        var lo = Infinity, hi = -Infinity;
+        lines.forEach(function (line) {
+            for (var i = 0; i < line.x.length; i++) {
+                var v = line[key][i];
+                if (range && (line.x[i] < range[0] || line.x[i] > range[1])) { continue; }
+                if (isFinite(v)) { lo = Math.min(lo, v); hi = Math.max(hi, v); }
+            }
+        });
+        if (!isFinite(lo)) { return [0, 1]; }
+        return lo === hi ? [lo - 1, hi + 1] : [lo, hi];
+    }
+
+    // spec: {lines: [{x, y, color, label, width, dash}], xLabel, yLabel, xRange, xTicks, title}
+    function plot(canvas, spec) {
+        var ratio = root.devicePixelRatio || 1;
+        var width = canvas.clientWidth, height = canvas.clientHeight;
+        canvas.width = width * ratio;
+        canvas.height = height * ratio;
+        var ctx = canvas.getContext('2d');
+        ctx.setTransform(ratio, 0, 0, ratio, 0, 0);
+        ctx.clearRect(0, 0, width, height);
+        var m = { left: 60, right: 15, top: 28, bottom: 40 };
+        var w = width - m.left - m.right, h = height - m.top - m.bottom;
+        var xr = spec.xRange || extent(spec.lines, 'x');
+        var yr = extent(spec.lines, 'y', spec.xRange);
+        yr = [Math.min(yr[0], spec.yMin === undefined ? yr[0] : spec.yMin), yr[1] + (yr[1] - yr[0]) * 0.05];
+        var sx = function (v) { return m.left + (v - xr[0]) / (xr[1] - xr[0]) * w; };
+        var sy = function (v) { return m.top + h - (v - yr[0]) / (yr[1] - yr[0]) * h; };
+        canvas.view = { x: xr, margin: m, width: w };
+
+        ctx.font = '12px sans-serif';
+        ctx.strokeStyle = '#e0e0e0';
+        ctx.fillStyle = '#555';
+        ctx.textAlign = 'center';
+        (spec.xTicks || niceTicks(xr[0], xr[1], Math.max(2, Math.floor(w / 90)))).forEach(function (tick) {
+            if (tick[0] < xr[0] || tick[0] > xr[1]) { return; }
+            ctx.beginPath(); ctx.moveTo(sx(tick[0]), m.top); ctx.lineTo(sx(tick[0]), m.top + h); ctx.stroke();
+            ctx.fillText(tick[1], sx(tick[0]), m.top + h + 16);
+        });
+        ctx.textAlign = 'right';
+        niceTicks(yr[0], yr[1], Math.max(2, Math.floor(h / 50))).forEach(function (tick) {
+            ctx.beginPath(); ctx.moveTo(m.left, sy(tick[0])); ctx.lineTo(m.left + w, sy(tick[0])); ctx.stroke();
+            ctx.fillText(tick[1], m.left - 6, sy(tick[0]) + 4);
+        });
+        ctx.textAlign = 'center';
+        ctx.fillText(spec.xLabel || '', m.left + w / 2, height - 6);
+        ctx.save(); ctx.translate(14, m.top + h / 2); ctx.rotate(-Math.PI / 2);
+        ctx.fillText(spec.yLabel || '', 0, 0); ctx.restore();
+        ctx.font = 'bold 13px sans-serif';
+        ctx.fillText(spec.title || '', m.left + w / 2, 18);
+
+        ctx.save();
+        ctx.beginPath(); ctx.rect(m.left, m.top, w, h); ctx.clip();
+        spec.lines.forEach(function (line) {
+            ctx.strokeStyle = line.color;
+            ctx.lineWidth = line.width || 1.5;
+            ctx.setLineDash(line.dash || []);
+            ctx.beginPath();
+            var pen = false;
+            for (var i = 0; i < line.x.length; i++) {
+                if (!isFinite(line.y[i])) { pen = false; continue; }
+                if (pen) { ctx.lineTo(sx(line.x[i]), sy(line.y[i])); } else { ctx.moveTo(sx(line.x[i]), sy(line.y[i])); }
+                pen = true;
+            }
+            ctx.stroke();
+        });
+        ctx.restore();
+
+        ctx.setLineDash([]);
+        ctx.font = '11px sans-serif';
+        ctx.textAlign = 'left';
+        spec.lines.forEach(function (line, i) {
+            if (!line.label) { return; }
+            ctx.fillStyle = line.color;
+            ctx.fillRect(m.left + 8, m.top + 8 + i * 15, 10, 3);
+            ctx.fillStyle = '#333';
+            ctx.fillText(line.label, m.left + 24, m.top + 12 + i * 15);
+        });
+    }
+
+    function message(canvas, text) {
+        plot(canvas, { lines: [], title: text });
+    }
+
+    function Dashboard(bundle, element) {
+        this.bundle = bundle;
+        this.el = function (role) { return element.querySelector('[data-role="' + role + '"]'); };
+        this.cache = {};
+        this.zoom = null;
+        var self = this;
+        var topologies = Object.keys(bundle.topologies);
+        this.el('topology').innerHTML = topologies.map(function (t) {
+            return '<option value="' + t + '">' + bundle.topologies[t].name + '</option>';
+        }).join('');
+        this.el('topology').onchange = function () { self.showTopology(); };
+        this.el('filter').oninput = function () { self.table(); };
+        this.el('run').onchange = function () { self.select(self.el('run').value); };
+        this.bindZoom(this.el('time'));
+        this.showTopology();
+    }
+
+    Dashboard.prototype.runs = function () {
+        return this.bundle.topologies[this.el('topology').value].runs;
+    };
+
+    Dashboard.prototype.showTopology = function () {
+        var topology = this.bundle.topologies[this.el('topology').value];
+        this.el('path').textContent = topology.path;
+        this.el('run').innerHTML = topology.runs.filter(function (r) { return r.histogram; }).map(function (r) {
+            return '<option>' + r.label + '</option>';
+        }).join('');
+        this.table();
+        this.select(this.el('run').value);
+    };
+
+    Dashboard.prototype.table = function () {
+        var self = this, filter = this.el('filter').value.toLowerCase();
+        var fmt = function (v, digits) { return v === undefined || v === null ? '-' : v.toFixed(digits); };
+        var rows = this.runs().filter(function (r) { return r.label.toLowerCase().indexOf(filter) >= 0; });
+        this.el('table').innerHTML = rows.map(function (r) {
+            var m = r.metrics, p = m.percentiles || {};
+            return '<tr data-label="' + r.label + '"><td>' + r.label + '</td><td>' + fmt(m.avg_latency_us, 2) +
+                '</td><td>' + fmt(p['50.0'], 2) + '</td><td>' + fmt(p['99.0'], 2) + '</td><td>' +
+                fmt(p['99.9'], 2) + '</td><td>' + fmt(m.max_latency_us, 2) + '</td><td>' +
+                fmt(m.jitter_us, 2) + '</td><td>' + (m.bandwidth_mbps ? fmt(m.bandwidth_mbps, 1) + ' Mbps' :
+                fmt(m.msg_rate, 0)) + '</td><td>' + (r.source || '-') + '</td></tr>';
+        }).join('');
+        Array.prototype.forEach.call(this.el('table').querySelectorAll('tr'), function (tr) {
+            tr.onclick = function () { self.select(tr.getAttribute('data-label')); };
+        });
+    };
+
+    Dashboard.prototype.decoded = function (topology, run) {
+        var key = topology + '\u0000' + run.label;
+        if (!this.cache[key]) {
+            var entry = { curve: percentileCurve(run.histogram) };
+            if (run.samples) {
+                entry.levels = run.samples.map(function (level) {
+                    return { time: decode(level.time_s), latency: decode(level.latency_us) };
+                });
+                entry.series = { time: decode(run.series.time_s), p99: decode(run.series.p99_us),
+                                 window: run.series.window_s };
+            }
+            this.cache[key] = entry;
+        }
+        return this.cache[key];
+    };
+
+    Dashboard.prototype.select = function (label) {
+        if (!label) { return; }
+        this.el('run').value = label;
+        this.label = label;
+        this.zoom = null;
+        this.drawDistribution();
+        this.drawTime();
+    };
+
+    // The selected test in every topology that has it, so boards overlay
+    Dashboard.prototype.drawDistribution = function () {
+        var self = this, lines = [];
+        Object.keys(this.bundle.topologies).forEach(function (t, i) {
+            var run = self.bundle.topologies[t].runs.find(function (r) { return r.label === self.label; });
+            if (!run || !run.histogram) { return; }
+            var curve = self.decoded(t, run).curve;
+            lines.push({ x: curve.x, y: curve.y, color: COLORS[i % COLORS.length],
+                         label: self.bundle.topologies[t].name + ' (' + (run.source || 'summary') + ')' });
+        });
+        plot(this.el('distribution'), { lines: lines, xTicks: PERCENTILE_TICKS, xLabel: 'Percentile',
+                                        yLabel: 'Latency (μs)', title: this.label + ': latency by percentile' });
+    };
+
+    Dashboard.prototype.drawTime = function () {
+        var canvas = this.el('time'), topology = this.el('topology').value;
+        var run = this.runs().find(function (r) { return r.label === this.label; }, this);
+        if (!run || !run.samples) {
+            return message(canvas, 'No full log for this run: record it with sockperf --full-log');
+        }
+        var data = this.decoded(topology, run);
+        var all = data.levels[data.levels.length - 1].time;
+        var range = this.zoom || [all[0], all[all.length - 1]];
+        var level = levelFor(data.levels, range[0], range[1], 2 * canvas.clientWidth);
+        plot(canvas, {
+            lines: [
+                { x: level.time, y: level.latency, color: '#3498db', width: 0.8, label: 'samples (min/max, ' +
+                  (lowerBound(level.time, range[1]) - lowerBound(level.time, range[0])) + ' points)' },
+                { x: data.series.time, y: data.series.p99, color: '#e74c3c', width: 1.5,
+                  label: 'p99 per ' + +(data.series.window * 1000).toPrecision(3) + ' ms' },
+            ],
+            xRange: range, xLabel: 'Time (s)', yLabel: 'Latency (μs)', yMin: 0,
+            title: this.label + ' over time (drag to zoom, double-click to reset)',
+        });
+    };
+
+    Dashboard.prototype.bindZoom = function (canvas) {
+        var self = this, start = null;
+        var at = function (event) {
+            var v = canvas.view, rect = canvas.getBoundingClientRect();
+            var f = (event.clientX - rect.left - v.margin.left) / v.width;
+            return v.x[0] + Math.min(Math.max(f, 0), 1) * (v.x[1] - v.x[0]);
+        };
+        canvas.onmousedown = function (event) { if (canvas.view) { start = at(event); } };
+        canvas.onmouseup = function (event) {
+            if (start === null) { return; }
+            var end = at(event);
+            if (Math.abs(end - start) > (canvas.view.x[1] - canvas.view.x[0]) / 200) {
+                self.zoom = [Math.min(start, end), Math.max(start, end)];
+                self.drawTime();
+            }
+            start = null;
+        };
+        canvas.ondblclick = function () { self.zoom = null; self.drawTime(); };
+    };
+
+    function load(url) {
+        return fetch(url).then(function (response) {
+            if (!response.ok) { throw new Error(url + ': ' + response.status); }
+            if (/\.gz$/.test(url)) {
+                return new Response(response.body.pipeThrough(new DecompressionStream('gzip'))).json();
+            }
+            return response.json();
+        });
+    }
+
+    function start(element) {
+        var ready = root.SOCKPERF_BUNDLE ? Promise.resolve(root.SOCKPERF_BUNDLE)
+            : load('dashboard_data.json.gz').catch(function () { return load('dashboard_data.json'); });
+        ready.then(function (bundle) {
+            element.querySelector('[data-role="version"]').textContent =
+                'format ' + bundle.version + ', parser v' + bundle.parser;
+            return new Dashboard(bundle, element);
+        }).catch(function () {
+            element.querySelector('[data-role="status"]').textContent =
+                'No data bundle found: run `python -m sockperf_tools bundle` next to this page.';
+        });
+    }
+
+    var api = { decode: decode, lowerBound: lowerBound, levelFor: levelFor, percentileCurve: percentileCurve,
+                niceTicks: niceTicks, start: start };
+    if (typeof module !== 'undefined' && module.exports) {
+        module.exports = api;
+    } else {
+        root.SockperfDashboard = api;
+        root.addEventListener('DOMContentLoaded', function () {
+            var element = document.getElementById('explorer');
+            if (element) { start(element); }
+        });
+    }
+})(typeof window !== 'undefined' ? window : globalThis);
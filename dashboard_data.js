@@ -0,0 +1 @@
+window.SOCKPERF_BUNDLE = {"version":1,"parser":3,"topologies":{"dual":{"name":"Dual-Board","path":"192.168.1.2 \u2192 LAN9662-1 \u2192 LAN9662-2 \u2192 192.168.1.3","runs":[{"label":"Ping-Pong (Default)","metrics":{"filename":"sockperf_pingpong_udp.txt","version":"3.7-no.git","protocol":"UDP","target_ip":"192.168.1.3","target_port":11111,"run_time_sec":30.0,"warmup_msec":400.0,"sent_messages":284434,"received_messages":284433,"packet_loss_pct":0.00035157540940744525,"avg_latency_us":52.688,"std_dev_us":15.909,"jitter_us":15.909,"min_latency_us":38.754,"max_latency_us":551.355,"total_observations":280219,"percentiles":{"99.999":432.27,"99.99":265.907,"99.9":187.827,"99.0":122.602,"90.0":62.333,"75.0":50.83,"50.0":47.32,"25.0":46.283},"valid_sent":280219,"valid_received":280219,"errors":[],"test_type":"ping-pong","topology":"dual","run_date":"2025-11-05"},"histogram":{"digits":3,"count":280219,"mean_us":52.688,"std_dev_us":15.909,"min_us":38.754,"max_us":551.355,"upper_us":{"dtype":"<f4","b64":"yyEbQo9CG0JUYxtCGYQbQt2kG0KixRtCZuYbQisHHELwJxxCtEgcQnlpHEI9ihxCAqscQsfLHEKL7BxCUA0dQhQuHULZTh1Cnm8dQmKQHUInsR1C7NEdQrDyHUJ1Ex5COTQeQv5UHkLDdR5Ch5YeQky3HkIQ2B5C1fgeQpoZH0JeOh9CI1sfQud7H0KsnB9Ccb0fQjXeH0L6/h9Cvh8gQoNAIEJIYSBCDIIgQtGiIEKWwyBCWuQgQh8FIULjJSFCqEYhQm1nIUIxiCFC9qghQrrJIUJ/6iFCRAsiQggsIkLNTCJCkW0iQlaOIkIbryJC388iQqTwIkJoESNCLTIjQvJSI0K2cyNCe5QjQj+1I0IE1iNCyfYjQo0XJEJSOCRCF1kkQtt5JEKgmiRCZLskQincJELu/CRCsh0lQnc+JUI7XyVCAIAlQsWgJUKJwSVCTuIlQhIDJkLXIyZCnEQmQmBlJkIlhiZC6aYmQq7HJkJz6CZCNwknQvwpJ0LBSidChWsnQkqMJ0IOrSdC080nQpjuJ0JcDyhCITAoQuVQKEKqcShCb5IoQjOzKEL40yhCvPQoQoEVKUJGNilCClcpQs93KUKTmClCWLkpQh3aKULh+ilCphsqQmo8KkIvXSpC9H0qQrieKkJ9vypCQuAqQgYBK0LLIStCj0IrQlRjK0IZhCtC3aQrQqLFK0Jm5itCKwcsQvAnLEK0SCxCeWksQj2KLEICqyxCx8ssQovsLEJQDS1CFC4tQtlOLUKeby1CYpAtQiexLULs0S1CsPItQnUTLkI5NC5C/lQuQsN1LkKHli5CTLcuQhDYLkLV+C5CmhkvQl46L0IjWy9C53svQqycL0JxvS9CNd4vQvr+L0K+HzBCg0AwQkhhMEIMgjBC0aIwQpbDMEJa5DBCHwUxQuMlMUKoRjFCbWcxQjGIMUL2qDFCuskxQn/qMUJECzJCCCwyQs1MMkKRbTJCVo4yQhuvMkLfzzJCpPAyQmgRM0ItMjNC8lIzQrZzM0J7lDNCP7UzQgTWM0LJ9jNCjRc0QlI4NEIXWTRC23k0QqCaNEJkuzRCKdw0Qu78NEKyHTVCdz41QjtfNUIAgDVCxaA1QonBNUJO4jVCEgM2QtcjNkKcRDZCYGU2QiWGNkLppjZCrsc2QnPoNkI3CTdC/Ck3QsFKN0KFazdCSow3Qg6tN0LTzTdCmO43QlwPOEIhMDhC5VA4QqpxOEJvkjhCM7M4QvjTOEK89DhCgRU5QkY2OUIKVzlCz3c5QpOYOUJYuTlCHdo5QuH6OUKmGzpCajw6Qi9dOkL0fTpCuJ46Qn2/OkJC4DpCBgE7QsshO0KPQjtCVGM7QhmEO0LdpDtCosU7QmbmO0IrBzxC8Cc8QrRIPEJ5aTxCPYo8QgKrPELHyzxCi+w8QlANPUIULj1C2U49Qp5vPUJikD1CJ7E9QuzRPUKw8j1CdRM+Qjk0PkL+VD5Cw3U+QoeWPkJMtz5CENg+QtX4PkKaGT9CXjo/QiNbP0Lnez9CrJw/QnG9P0I13j9C+v4/Qr4fQEKDQEBCSGFAQgyCQELRokBClsNAQlrkQEIfBUFC4yVBQqhGQUJtZ0FCMYhBQvaoQUK6yUFCf+pBQkQLQkIILEJCzUxCQpFtQkJWjkJCG69CQt/PQkKk8EJCaBFDQi0yQ0LyUkNCtnNDQnuUQ0I/tUNCBNZDQsn2Q0KNF0RCUjhEQhdZRELbeURCoJpEQmS7REIp3ERC7vxEQrIdRUJ3PkVCO19FQgCARULFoEVCicFFQk7iRUISA0ZC1yNGQpxERkJgZUZCJYZGQummRkKux0ZCc+hGQjcJR0L8KUdCwUpHQoVrR0JKjEdCDq1HQtPNR0KY7kdCXA9IQiEwSELlUEhCqnFIQm+SSEIzs0hC+NNIQrz0SEKBFUlCRjZJQgpXSULPd0lCk5hJQli5SUId2klC4fpJQqYbSkJqPEpCL11KQvR9SkK4nkpCfb9KQkLgSkIGAUtCyyFLQo9CS0JUY0tCGYRLQt2kS0KixUtCZuZLQisHTELwJ0xCtEhMQnlpTEI9ikxCAqtMQsfLTEKL7ExCUA1NQhQuTULZTk1Cnm9NQmKQTUInsU1C7NFNQrDyTUJ1E05COTROQv5UTkLDdU5Ch5ZOQky3TkIQ2E5C1fhOQpoZT0JeOk9CI1tPQud7T0KsnE9Ccb1PQjXeT0L6/k9Cvh9QQoNAUEJIYVBCDIJQQtGiUEKWw1BCWuRQQh8FUULjJVFCqEZRQm1nUUIxiFFC9qhRQrrJUUJ/6lFCRAtSQggsUkLNTFJCkW1SQlaOUkIbr1JC389SQqTwUkJoEVNCLTJTQvJSU0K2c1NCe5RTQj+1U0IE1lNCyfZTQo0XVEJSOFRCF1lUQtt5VEKgmlRCZLtUQincVELu/FRCsh1VQnc+VUI7X1VCAIBVQsWgVUKJwVVCTuJVQhIDVkLXI1ZCnERWQmBlVkIlhlZC6aZWQq7HVkJz6FZCNwlXQvwpV0LBSldChWtXQkqMV0IOrVdC081XQpjuV0JcD1hCITBYQuVQWEKqcVhCb5JYQjOzWEL401hCvPRYQoEVWUJGNllCCldZQs93WUKTmFlCWLlZQh3aWULh+llCphtaQmo8WkIvXVpC9H1aQrieWkJ9v1pCQuBaQgYBW0LLIVtCj0JbQlRjW0IZhFtC3aRbQqLFW0Jm5ltCKwdcQvAnXEK0SFxCeWlcQj2KXEICq1xCx8tcQovsXEJQDV1CFC5dQtlOXUKeb11CYpBdQiexXULs0V1CsPJdQnUTXkI5NF5C/lReQsN1XkKHll5CTLdeQhDYXkLV+F5CmhlfQl46X0IjW19C53tfQqycX0JxvV9CNd5fQvr+X0K+H2BCg0BgQkhhYEIMgmBC0aJgQpbDYEJa5GBCHwVhQuMlYUKoRmFCbWdhQjGIYUL2qGFCuslhQn/qYUJEC2JCCCxiQs1MYkKRbWJCVo5iQhuvYkLfz2JCpPBiQmgRY0ItMmNC8lJjQrZzY0J7lGNCP7VjQgTWY0LJ9mNCjRdkQlI4ZEIXWWRC23lkQqCaZEJku2RCKdxkQu78ZEKyHWVCdz5lQjtfZUIAgGVCxaBlQonBZUJO4mVCEgNmQtcjZkKcRGZCYGVmQiWGZkLppmZCrsdmQnPoZkI3CWdC/ClnQsFKZ0KFa2dCSoxnQg6tZ0LTzWdCmO5nQlwPaEIhMGhC5VBoQqpxaEJvkmhCM7NoQvjTaEK89GhCgRVpQkY2aUIKV2lCz3dpQpOYaUJYuWlCHdppQuH6aUKmG2pCajxqQi9dakL0fWpCuJ5qQn2/akJC4GpCBgFrQssha0KPQmtCVGNrQhmEa0LdpGtCosVrQmbma0IrB2xC8CdsQrRIbEJ5aWxCPYpsQgKrbELHy2xCi+xsQlANbUIULm1C2U5tQp5vbUJikG1CJ7FtQuzRbUKw8m1CdRNuQjk0bkL+VG5Cw3VuQoeWbkJMt25CENhuQtX4bkKaGW9CXjpvQiNbb0Lne29CrJxvQnG9b0I13m9C+v5vQr4fcEKDQHBCSGFwQgyCcELRonBClsNwQlrkcEIfBXFC4yVxQqhGcUJtZ3FCMYhxQvaocUK6yXFCf+pxQkQLckIILHJCzUxyQpFtckJWjnJCG69yQt/PckKk8HJCaBFzQi0yc0LyUnNCtnNzQnuUc0I/tXNCBNZzQsn2c0KNF3RCUjh0QhdZdELbeXRCoJp0QmS7dEIp3HRC7vx0QrIddUJ3PnVCO191QgCAdULFoHVCicF1Qk7idUISA3ZC1yN2QpxEdkJgZXZCJYZ2QummdkKux3ZCc+h2QjcJd0L8KXdCwUp3QoVrd0JKjHdCDq13QtPNd0KY7ndCXA94QiEweELlUHhCqnF4Qm+SeEIzs3hC+NN4Qrz0eEKBFXlCRjZ5QgpXeULPd3lCk5h5Qli5eUId2nlC4fp5QqYbekJqPHpCL116QvR9ekK4nnpCfb96QkLgekIGAXtCyyF7Qo9Ce0JUY3tCGYR7Qt2ke0KixXtCZuZ7QisHfELwJ3xCtEh8QnlpfEI9inxCAqt8QsfLfEKL7HxCUA19QhQufULZTn1Cnm99QmKQfUInsX1C7NF9QrDyfUJ1E35COTR+Qv5UfkLDdX5Ch5Z+Qky3fkIQ2H5C1fh+QpoZf0JeOn9CI1t/Qud7f0KsnH9Ccb1/QjXef0L6/n9C3w+AQkIggEKkMIBCBkGAQmhRgELLYYBCLXKAQo+CgELykoBCVKOAQrazgEIZxIBCe9SAQt3kgEI/9YBCogWBQgQWgUJmJoFCyTaBQitHgUKNV4FC8GeBQlJ4gUK0iIFCF5mBQnmpgULbuYFCPcqBQqDagUIC64FCZPuBQscLgkIpHIJCiyyCQu48gkJQTYJCsl2CQhRugkJ3foJC2Y6CQjufgkKer4JCAMCCQmLQgkLF4IJCJ/GCQokBg0LsEYNCsDKDQnVTg0I5dINC/pSDQsO1g0KH1oNCTPeDQhAYhELVOIRCmlmEQl56hEIjm4RC57uEQqzchEJx/YRCNR6FQvo+hUK+X4VCg4CFQkihhUIMwoVC0eKFQpYDhkJaJIZCH0WGQuNlhkKohoZCbaeGQjHIhkL26IZCugmHQn8qh0JES4dCCGyHQs2Mh0KRrYdCVs6HQhvvh0LfD4hCpDCIQmhRiEItcohC8pKIQraziEJ71IhCP/WIQgQWiULJNolCjVeJQlJ4iUIXmYlC27mJQqDaiUJk+4lCKRyKQu48ikKyXYpCd36KQjufikIAwIpCxeCKQokBi0JOIotCEkOLQtdji0KchItCYKWLQiXGi0Lp5otCrgeMQnMojEI3SYxC/GmMQsGKjEKFq4xCSsyMQg7tjELTDY1CmC6NQlxPjUIhcI1C5ZCNQqqxjUJv0o1CM/ONQvgTjkK8NI5CgVWOQkZ2jkIKl45Cz7eOQpPYjkJY+Y5CHRqPQuE6j0KmW49CanyPQi+dj0L0vY9CuN6PQn3/j0JCIJBCBkGQQsthkEKPgpBCVKOQQhnEkELd5JBCogWRQmYmkUIrR5FC8GeRQrSIkUJ5qZFCPcqRQgLrkULHC5JCiyySQlBNkkIUbpJC2Y6SQp6vkkJi0JJCJ/GSQuwRk0KwMpNCdVOTQjl0k0L+lJNCw7WTQofWk0JM95NCEBiUQtU4lEKaWZRCXnqUQiOblELnu5RCrNyUQnH9lEI1HpVC+j6VQr5flUKDgJVCSKGVQgzClULR4pVClgOWQloklkIfRZZC42WWQqiGlkJtp5ZCMciWQvbolkK6CZdCfyqXQkRLl0IIbJdCzYyXQpGtl0JWzpdCG++XQt8PmEKkMJhCaFGYQi1ymELykphCtrOYQnvUmEI/9ZhCBBaZQsk2mUKNV5lCUniZQheZmULbuZlCoNqZQmT7mUIpHJpC7jyaQrJdmkJ3fppCO5+aQgDAmkLF4JpCiQGbQk4im0ISQ5tC12ObQpyEm0JgpZtCJcabQunmm0KuB5xCcyicQjdJnEL8aZxCwYqcQoWrnEJKzJxCDu2cQtMNnUKYLp1CXE+dQiFwnULlkJ1CqrGdQm/SnUIz851C+BOeQrw0nkKBVZ5CRnaeQgqXnkLPt55Ck9ieQlj5nkIdGp9C4TqfQqZbn0JqfJ9CL52fQvS9n0K43p9Cff+fQkIgoEIGQaBCy2GgQo+CoEJUo6BCGcSgQt3koEKiBaFCZiahQitHoULwZ6FCtIihQnmpoUI9yqFCAuuhQscLokKLLKJCUE2iQhRuokLZjqJCnq+iQmLQokIn8aJC7BGjQrAyo0J1U6NCOXSjQv6Uo0LDtaNCh9ajQkz3o0IQGKRC1TikQppZpEJeeqRCI5ukQue7pEKs3KRCcf2kQjUepUL6PqVCvl+lQoOApUJIoaVCDMKlQtHipUKWA6ZCWiSmQh9FpkLjZaZCqIamQm2npkIxyKZC9uimQroJp0J/KqdCREunQghsp0LNjKdCka2nQlbOp0Ib76dC3w+oQqQwqEJoUahCLXKoQvKSqEK2s6hCe9SoQj/1qEIEFqlCyTapQo1XqUJSeKlCF5mpQtu5qUKg2qlCZPupQikcqkLuPKpCsl2qQnd+qkI7n6pCAMCqQsXgqkKJAatCTiKrQhJDq0LXY6tCnISrQmClq0IlxqtC6earQq4HrEJzKKxCN0msQvxprELBiqxChausQkrMrEIO7axC0w2tQpgurUJcT61CIXCtQuWQrUKqsa1Cb9KtQjPzrUL4E65CvDSuQoFVrkJGdq5CCpeuQs+3rkKT2K5CWPmuQh0ar0LhOq9CpluvQmp8r0Ivna9C9L2vQrjer0J9/69CQiCwQgZBsELLYbBCj4KwQlSjsEIZxLBC3eSwQqIFsUJmJrFCK0exQvBnsUK0iLFCeamxQj3KsUIC67FCxwuyQossskJQTbJCFG6yQtmOskKer7JCYtCyQifxskLsEbNCsDKzQnVTs0I5dLNC/pSzQsO1s0KH1rNCTPezQhAYtELVOLRCmlm0Ql56tEIjm7RC57u0QqzctEJx/bRCNR61Qvo+tUK+X7VCg4C1QkihtUIMwrVC0eK1QpYDtkJaJLZCH0W2QuNltkKohrZCbae2QjHItkL26LZCugm3Qn8qt0JES7dCCGy3Qs2Mt0KRrbdCVs63Qhvvt0LfD7hCpDC4QmhRuEItcrhC8pK4QrazuEJ71LhCP/W4QgQWuULJNrlCjVe5QlJ4uUIXmblC27m5QqDauUJk+7lCKRy6Qu48ukKyXbpCd366QjufukIAwLpCxeC6QokBu0JOIrtCEkO7Qtdju0KchLtCYKW7QiXGu0Lp5rtCrge8QnMovEI3SbxC/Gm8QsGKvEKFq7xCSsy8Qg7tvELTDb1CmC69QlxPvUIhcL1C5ZC9QqqxvUJv0r1CM/O9QvgTvkK8NL5CgVW+QkZ2vkIKl75Cz7e+QpPYvkJY+b5CHRq/QuE6v0KmW79Cany/Qi+dv0L0vb9CuN6/Qn3/v0JCIMBCBkHAQsthwEKPgsBCVKPAQhnEwELd5MBCogXBQmYmwUIrR8FC8GfBQrSIwUJ5qcFCPcrBQgLrwULHC8JCiyzCQlBNwkIUbsJC2Y7CQp6vwkJi0MJCJ/HCQuwRw0KwMsNCdVPDQjl0w0L+lMNCw7XDQofWw0JM98NCEBjEQtU4xEKaWcRCXnrEQiObxELnu8RCrNzEQnH9xEI1HsVC+j7FQr5fxUKDgMVCSKHFQgzCxULR4sVClgPGQlokxkIfRcZC42XGQqiGxkJtp8ZCMcjGQvboxkK6CcdCfyrHQkRLx0IIbMdCzYzHQpGtx0JWzsdCG+/HQt8PyEKkMMhCaFHIQi1yyELykshCtrPIQnvUyEI/9chCBBbJQsk2yUKNV8lCUnjJQheZyULbuclCoNrJQmT7yUIpHMpC7jzKQrJdykJ3fspCO5/KQgDAykLF4MpCiQHLQk4iy0ISQ8tC12PLQpyEy0JgpctCJcbLQunmy0KuB8xCcyjMQjdJzEL8acxCwYrMQoWrzEJKzMxCDu3MQtMNzUKYLs1CXE/NQiFwzULlkM1CqrHNQm/SzUIz881C+BPOQrw0zkKBVc5CRnbOQgqXzkLPt85Ck9jOQlj5zkIdGs9C4TrPQqZbz0JqfM9CL53PQvS9z0K43s9Cff/PQkIg0EIGQdBCy2HQQo+C0EJUo9BCGcTQQt3k0EKiBdFCZibRQitH0ULwZ9FCtIjRQnmp0UI9ytFCAuvRQscL0kKLLNJCUE3SQhRu0kLZjtJCnq/SQmLQ0kIn8dJC7BHTQrAy00J1U9NCOXTTQv6U00LDtdNCh9bTQkz300IQGNRC1TjUQppZ1EJeetRCI5vUQue71EKs3NRCcf3UQjUe1UL6PtVCvl/VQoOA1UJIodVCDMLVQtHi1UKWA9ZCWiTWQh9F1kLjZdZCqIbWQm2n1kIxyNZC9ujWQroJ10J/KtdCREvXQghs10LNjNdCka3XQlbO10Ib79dC3w/YQqQw2EJoUdhCLXLYQvKS2EK2s9hCe9TYQj/12EIEFtlCyTbZQo1X2UJSeNlCF5nZQtu52UKg2tlCZPvZQikc2kLuPNpCsl3aQnd+2kI7n9pCAMDaQsXg2kKJAdtCTiLbQhJD20LXY9tCnITbQmCl20IlxttC6ebbQq4H3EJzKNxCN0ncQvxp3ELBitxChavcQkrM3EIO7dxC0w3dQpgu3UJcT91CIXDdQuWQ3UKqsd1Cb9LdQjPz3UL4E95CvDTeQoFV3kJGdt5CCpfeQs+33kKT2N5CWPneQh0a30LhOt9CplvfQmp830Ivnd9C9L3fQrje30J9/99CQiDgQgZB4ELLYeBCj4LgQlSj4EIZxOBC3eTgQqIF4UJmJuFCK0fhQvBn4UK0iOFCeanhQj3K4UIC6+FCxwviQoss4kJQTeJCFG7iQtmO4kKer+JCYtDiQifx4kLsEeNCsDLjQnVT40I5dONC/pTjQsO140KH1uNCTPfjQhAY5ELVOORCmlnkQl565EIjm+RC57vkQqzc5EJx/eRCNR7lQvo+5UK+X+VCg4DlQkih5UIMwuVC0eLlQpYD5kJaJOZCH0XmQuNl5kKohuZCbafmQjHI5kL26OZCugnnQn8q50JES+dCCGznQs2M50KRredCVs7nQhvv50LfD+hCpDDoQmhR6EItcuhC8pLoQraz6EJ71OhCP/XoQgQW6ULJNulCjVfpQlJ46UIXmelC27npQqDa6UJk++lCKRzqQu486kKyXepCd37qQjuf6kIAwOpCxeDqQokB60JOIutCEkPrQtdj60KchOtCYKXrQiXG60Lp5utCrgfsQnMo7EI3SexC/GnsQsGK7EKFq+xCSszsQg7t7ELTDe1CmC7tQlxP7UIhcO1C5ZDtQqqx7UJv0u1CM/PtQvgT7kK8NO5CgVXuQkZ27kIKl+5Cz7fuQpPY7kJY+e5CHRrvQuE670KmW+9CanzvQi+d70L0ve9CuN7vQn3/70JCIPBCBkHwQsth8EKPgvBCVKPwQhnE8ELd5PBCogXxQmYm8UIrR/FC8GfxQrSI8UJ5qfFCPcrxQgLr8ULHC/JCiyzyQlBN8kIUbvJC2Y7yQp6v8kJi0PJCJ/HyQuwR80KwMvNCdVPzQjl080L+lPNCw7XzQofW80JM9/NCEBj0QtU49EKaWfRCXnr0QiOb9ELnu/RCrNz0QnH99EI1HvVC+j71Qr5f9UKDgPVCSKH1QgzC9ULR4vVClgP2Qlok9kIfRfZC42X2QqiG9kJtp/ZCMcj2Qvbo9kK6CfdCfyr3QkRL90IIbPdCzYz3QpGt90JWzvdCG+/3Qt8P+EKkMPhCaFH4Qi1y+ELykvhCtrP4QnvU+EI/9fhCBBb5Qsk2+UKNV/lCUnj5QheZ+ULbuflCoNr5QmT7+UIpHPpC7jz6QrJd+kJ3fvpCO5/6QgDA+kLF4PpCiQH7Qk4i+0ISQ/tC12P7QpyE+0JgpftCJcb7Qunm+0KuB/xCcyj8QjdJ/EL8afxCwYr8QoWr/EJKzPxCDu38QtMN/UKYLv1CXE/9QiFw/ULlkP1CqrH9Qm/S/UIz8/1C+BP+Qrw0/kKBVf5CRnb+QgqX/kLPt/5Ck9j+Qlj5/kIdGv9C4Tr/QqZb/0JqfP9CL53/QvS9/0K43v9Cff//QiEQAEODIABD5TAAQ0hBAEOqUQBDDGIAQ29yAEPRggBDM5MAQ5ajAEP4swBDWsQAQ7zUAEMf5QBDgfUAQ+MFAUNGFgFDqCYBQwo3AUNtRwFDz1cBQzFoAUOTeAFD9ogBQ1iZAUO6qQFDHboBQ3/KAUPh2gFDROsBQ6b7AUMIDAJDahwCQ80sAkMvPQJDkU0CQ/RdAkNWbgJDuH4CQxuPAkN9nwJD368CQ0LAAkOk0AJDBuECQ2jxAkPLAQNDLRIDQ/IyA0O2UwNDe3QDQz+VA0MEtgNDydYDQ433A0NSGARDFzkEQ9tZBEOgegRDZJsEQym8BEPu3ARDsv0EQ3ceBUM7PwVDAGAFQ8WABUOJoQVDTsIFQxLjBUPXAwZDnCQGQ2BFBkMlZgZD6YYGQ66nBkNzyAZDN+kGQ/wJB0PBKgdDhUsHQ0psB0MOjQdD060HQ5jOB0Nc7wdDIRAIQ+UwCEOqUQhDb3IIQzOTCEP4swhDvNQIQ4H1CENGFglDCjcJQ89XCUOTeAlDWJkJQx26CUPh2glDpvsJQ2ocCkMvPQpD9F0KQ7h+CkN9nwpDQsAKQwbhCkPLAQtDjyILQ1RDC0MZZAtD3YQLQ6KlC0NmxgtDK+cLQ/AHDEO0KAxDeUkMQz1qDEMCiwxDx6sMQ4vMDENQ7QxDFA4NQ9kuDUOeTw1DYnANQyeRDUPssQ1DsNINQ3XzDUM5FA5D/jQOQ8NVDkOHdg5DTJcOQxC4DkPV2A5DmvkOQ14aD0MjOw9D51sPQ6x8D0NxnQ9DNb4PQ/reD0O+/w9DgyAQQ0hBEEMMYhBD0YIQQ5ajEENaxBBDH+UQQ+MFEUOoJhFDbUcRQzFoEUP2iBFDuqkRQ3/KEUNE6xFDCAwSQ80sEkORTRJDVm4SQxuPEkPfrxJDpNASQ2jxEkMtEhND8jITQ7ZTE0N7dBNDP5UTQwS2E0PJ1hNDjfcTQ1IYFEMXORRD21kUQ6B6FENkmxRDKbwUQ+7cFEOy/RRDdx4VQzs/FUMAYBVDxYAVQ4mhFUNOwhVDEuMVQ9cDFkOcJBZDYEUWQyVmFkPphhZDrqcWQ3PIFkM36RZD/AkXQ8EqF0OFSxdDSmwXQw6NF0PTrRdDmM4XQ1zvF0MhEBhD5TAYQ6pRGENvchhDM5MYQ/izGEO81BhDgfUYQ0YWGUMKNxlDz1cZQ5N4GUNYmRlDHboZQ+HaGUOm+xlDahwaQy89GkP0XRpDuH4aQ32fGkNCwBpDBuEaQ8sBG0OPIhtDVEMbQxlkG0PdhBtDoqUbQ2bGG0Mr5xtD8AccQ7QoHEN5SRxDPWocQwKLHEPHqxxDi8wcQ1DtHEMUDh1D2S4dQ55PHUNicB1DJ5EdQ+yxHUOw0h1DdfMdQzkUHkP+NB5Dw1UeQ4d2HkNMlx5DELgeQ9XYHkOa+R5DXhofQyM7H0PnWx9DrHwfQ3GdH0M1vh9D+t4fQ77/H0ODICBDSEEgQwxiIEPRgiBDlqMgQ1rEIEMf5SBD4wUhQ6gmIUNtRyFDMWghQ/aIIUO6qSFDf8ohQ0TrIUMIDCJDzSwiQ5FNIkNWbiJDG48iQ9+vIkOk0CJDaPEiQy0SI0PyMiNDtlMjQ3t0I0M/lSNDBLYjQ8nWI0ON9yNDUhgkQxc5JEPbWSRDoHokQ2SbJEMpvCRD7twkQ7L9JEN3HiVDOz8lQwBgJUPFgCVDiaElQ07CJUMS4yVD1wMmQ5wkJkNgRSZDJWYmQ+mGJkOupyZDc8gmQzfpJkP8CSdDwSonQ4VLJ0NKbCdDDo0nQ9OtJ0OYzidDXO8nQyEQKEPlMChDqlEoQ29yKEMzkyhD+LMoQ7zUKEOB9ShDRhYpQwo3KUPPVylDk3gpQ1iZKUMduilD4dopQ6b7KUNqHCpDLz0qQ/RdKkO4fipDfZ8qQ0LAKkMG4SpDywErQ48iK0NUQytDGWQrQ92EK0OipStDZsYrQyvnK0PwByxDtCgsQ3lJLEM9aixDAossQ8erLEOLzCxDUO0sQxQOLUPZLi1Dnk8tQ2JwLUMnkS1D7LEtQ7DSLUN18y1DORQuQ/40LkPDVS5Dh3YuQ0yXLkMQuC5D1dguQ5r5LkNeGi9DIzsvQ+dbL0OsfC9DcZ0vQzW+L0P63i9Dvv8vQ4MgMENIQTBDDGIwQ9GCMEOWozBDWsQwQx/lMEPjBTFDqCYxQ21HMUMxaDFD9ogxQ7qpMUN/yjFDROsxQwgMMkPNLDJDkU0yQ1ZuMkMbjzJD368yQ6TQMkNo8TJDLRIzQ/IyM0O2UzNDe3QzQz+VM0MEtjNDydYzQ433M0NSGDRDFzk0Q9tZNEOgejRDZJs0Qym8NEPu3DRDsv00Q3ceNUM7PzVDAGA1Q8WANUOJoTVDTsI1QxLjNUPXAzZDnCQ2Q2BFNkMlZjZD6YY2Q66nNkNzyDZDN+k2Q/wJN0PBKjdDhUs3Q0psN0MOjTdD0603Q5jON0Nc7zdDIRA4Q+UwOEOqUThDb3I4QzOTOEP4szhDvNQ4Q4H1OENGFjlDCjc5Q89XOUOTeDlDWJk5Qx26OUPh2jlDpvs5Q2ocOkMvPTpD9F06Q7h+OkN9nzpDQsA6QwbhOkPLATtDjyI7Q1RDO0MZZDtD3YQ7Q6KlO0NmxjtDK+c7Q7QoPEM9ajxDx6s8QxQOPUOeTz1D7LE9Q3XzPUPDVT5DTJc+Q9XYPkMjOz9DrHw/Q/reP0ODIEBD0YJAQ1rEQEPjBUFDMWhBQ7qpQUMIDEJDkU1CQxuPQkNo8UJD8jJDQz+VQ0PJ1kNDFzlEQ6B6REMpvERDdx5FQwBgRUNOwkVD1wNGQ2BFRkOup0ZDN+lGQ4VLR0MOjUdDXO9HQ+UwSENvckhDvNRIQ0YWSUOTeElDHbpJQ6b7SUP0XUpDfZ9KQ8sBS0NUQ0tDoqVLQyvnS0O0KExDAotMQ4vMTEPZLk1DYnBNQ7DSTUM5FE5Dw1VOQxC4TkOa+U5D51tPQ3GdT0P63k9DSEFQQ9GCUEMf5VBDqCZRQ/aIUUN/ylFDCAxSQ1ZuUkPfr1JDLRJTQ7ZTU0M/lVNDjfdTQxc5VENkm1RD7txUQzs/VUPFgFVDTsJVQ5wkVkMlZlZDc8hWQ/wJV0OFS1dD061XQ1zvV0OqUVhDM5NYQ4H1WEMKN1lDk3hZQ+HaWUNqHFpDuH5aQ0LAWkOPIltDGWRbQ6KlW0PwB1xDeUlcQ8erXENQ7VxD2S5dQyeRXUOw0l1D/jReQ4d2XkPV2F5DXhpfQ+dbX0M1vl9Dvv9fQwxiYEOWo2BDH+VgQ21HYUP2iGFDROthQ80sYkMbj2JDpNBiQy0SY0N7dGNDBLZjQ1IYZEPbWWRDZJtkQ7L9ZEM7P2VDiaFlQxLjZUNgRWZD6YZmQ3PIZkPBKmdDSmxnQ5jOZ0MhEGhDb3JoQ/izaEOB9WhDz1dpQ1iZaUOm+2lDLz1qQ7h+akMG4WpDjyJrQ92Ea0NmxmtDtChsQz1qbEPHq2xDFA5tQ55PbUPssW1DdfNtQ/40bkNMl25D1dhuQyM7b0OsfG9D+t5vQ4MgcEMMYnBDWsRwQ+MFcUMxaHFDuqlxQwgMckORTXJDG49yQ2jxckPyMnNDP5VzQ8nWc0NSGHRDoHp0Qym8dEN3HnVDAGB1Q07CdUPXA3ZDYEV2Q66ndkM36XZDhUt3Qw6Nd0OYzndD5TB4Q29yeEO81HhDRhZ5Q5N4eUMdunlDpvt5Q/RdekN9n3pDywF7Q1RDe0PdhHtDK+d7Q7QofEMCi3xDi8x8Q9kufUNicH1D7LF9QzkUfkPDVX5DELh+Q5r5fkPnW39DcZ1/Q/ref0OkIIBDaEGAQ49ygENUk4BDGbSAQz/lgEMEBoFDKzeBQ/BXgUMXiYFD26mBQ6DKgUPH+4FDixyCQ7JNgkN3boJDO4+CQ2LAgkMn4YJDThKDQxIzg0OcdINDYJWDQyW2g0Pp1oNDrveDQzc5hEP8WYRDwXqEQ4WbhENKvIRD0/2EQ5PIhkPH+4lDvk+NQ7ajkEOu95ND4SqXQ9l+mkPR0p1DySahQ8F6pEP0radD7AGrQ+NVrkPbqbFDDt20QwYxuEP+hLtD9ti+QykMwkMhYMVDGbTIQxAIzEMIXM9DO4/SQzPj1UNtl95D6dbzQ5abBEQ="},"counts":{"dtype":"<u4","b64":"EgEAACoBAAAqAQAAKgEAACkBAAAqAQAAKgEAACoBAAApAQAAKgEAACoBAAAqAQAAKQEAACoBAAAqAQAAKgEAACkBAAAqAQAAKgEAACoBAAApAQAAKgEAACoBAAAqAQAAKQEAACoBAAAqAQAAKgEAACkBAAAqAQAAKgEAACoBAAApAQAAKgEAACoBAAAqAQAAKQEAACoBAAAqAQAAKgEAACkBAAAqAQAAKgEAACoBAAApAQAAKgEAACoBAAAqAQAAKQEAACoBAAAqAQAAKgEAACkBAAAqAQAAKgEAACoBAAApAQAAKgEAACoBAAAqAQAAKQEAACoBAAAqAQAAKgEAACkBAAAqAQAAKgEAACoBAAApAQAAKgEAACoBAAAqAQAAKQEAACoBAAAqAQAAKgEAACkBAAAqAQAAKgEAACoBAAApAQAAKgEAACoBAAAqAQAAKQEAACoBAAAqAQAAKgEAACkBAAAqAQAAKgEAACoBAAApAQAAKgEAACoBAAAqAQAAKQEAACoBAAAqAQAAKgEAACkBAAAqAQAAKgEAACoBAAApAQAAKgEAACoBAAAqAQAAKQEAACoBAAAqAQAAKgEAACkBAAAqAQAAKgEAACoBAAApAQAAKgEAACoBAAAqAQAAKQEAACoBAAAqAQAAKgEAACkBAAAqAQAAKgEAACoBAAApAQAAKgEAACoBAAAqAQAAKQEAACoBAAAqAQAAKgEAACkBAAAqAQAAKgEAACoBAAApAQAAKgEAACoBAAAqAQAAKQEAACoBAAAqAQAAKgEAACkBAAAqAQAAKgEAACoBAAApAQAAKgEAACoBAAAqAQAAKQEAACoBAAAqAQAAKgEAACkBAAAqAQAAKgEAACoBAAApAQAAKgEAACoBAAAqAQAAKQEAACoBAAAqAQAAKgEAACkBAAAqAQAAKgEAACoBAAApAQAAKgEAACoBAAAqAQAAKQEAACoBAAAqAQAAKgEAACkBAAAqAQAAKgEAACoBAAApAQAAKgEAACoBAAAqAQAAKQEAACoBAAAqAQAAKgEAACkBAAAqAQAAKgEAACoBAAApAQAAKgEAACoBAAAqAQAAKQEAACoBAAAqAQAAKgEAACkBAAAqAQAAKgEAACoBAAApAQAAKgEAACoBAAAqAQAAKQEAACoBAAAqAQAAKgEAACkBAAAqAQAAKgEAACoBAAApAQAAKgEAACoBAAAqAQAAKQEAACoBAAAqAQAAKQEAACoBAAAqAQAAKgEAANQFAABxCAAAcggAAHIIAAByCAAAcQgAAHIIAAByCAAAcggAAHIIAABxCAAAcggAAHIIAAByCAAAcQgAAHIIAAByCAAAcggAAHEIAAByCAAAcggAAHIIAABxCAAAcggAAHIIAAByCAAAcggAAHEIAAByCAAAcggAAHIIAABxCAAADQcAAH8CAAB/AgAAfgIAAH8CAAB/AgAAfgIAAH8CAAB/AgAAfgIAAH8CAAB/AgAAfgIAAH8CAAB/AgAAfgIAAH8CAAB/AgAAfgIAAH8CAAB/AgAAfgIAAH8CAAB/AgAAfgIAAH8CAAB/AgAAfgIAAH8CAAB/AgAAfgIAAH8CAAB/AgAAfgIAAH8CAAB/AgAAfwIAAH4CAAB/AgAAfwIAAH4CAAB/AgAAfwIAAH4CAAB/AgAAfwIAAH4CAAB/AgAAfwIAAH4CAAB/AgAAfwIAAH4CAAB/AgAAfwIAAH4CAAB/AgAAfwIAAH4CAAB/AgAAfwIAAH4CAAB/AgAAfwIAAH4CAAB/AgAAfwIAAH4CAAB/AgAAfwIAAH4CAAB/AgAAfwIAAH8CAAB+AgAAfwIAAH8CAAB+AgAAfwIAAH8CAAB+AgAAfwIAAH8CAAB+AgAAfwIAAH8CAAB+AgAAfwIAAH8CAAB+AgAAfwIAAH8CAAB+AgAAfwIAAH8CAAB+AgAAfwIAAH8CAAB+AgAAfwIAAH8CAAB+AgAAfwIAAH8CAAB+AgAAfwIAAH8CAAB+AgAAfwIAAH8CAABhAQAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHQAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdAAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB0AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB0AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHQAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdAAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdAAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB0AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB0AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHQAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdAAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdAAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB0AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHQAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHQAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdAAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdAAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB0AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHQAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHQAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdAAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdAAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB0AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHQAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHUAAAB1AAAAdQAAAHQAAAB1AAAAdQAAAG0AAAAOAAAADQAAAA0AAAAOAAAADQAAAA0AAAAOAAAADQAAAA4AAAANAAAADQAAAA4AAAANAAAADgAAAA0AAAANAAAADgAAAA0AAAAOAAAADQAAAA0AAAAOAAAADQAAAA4AAAANAAAADQAAAA4AAAANAAAADQAAAA4AAAANAAAADgAAAA0AAAANAAAADgAAAA0AAAAOAAAADQAAAA0AAAAOAAAADQAAAA4AAAANAAAADQAAAA4AAAANAAAADQAAAA4AAAANAAAADgAAAA0AAAANAAAADgAAAA0AAAAOAAAADQAAAA0AAAAOAAAADQAAAA4AAAANAAAADQAAAA4AAAANAAAADgAAAA0AAAANAAAADgAAAA0AAAANAAAADgAAAA0AAAAOAAAADQAAAA0AAAAOAAAADQAAAA4AAAANAAAADQAAAA4AAAANAAAADgAAAA0AAAANAAAADgAAAA0AAAAOAAAADQAAAA0AAAAOAAAADQAAAA0AAAAOAAAADQAAAA4AAAANAAAADQAAAA4AAAANAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAEwAAAAIAAAADAAAAAgAAAAMAAAACAAAAAgAAAAMAAAACAAAAAwAAAAIAAAADAAAAAgAAAAMAAAACAAAAAwAAAAIAAAADAAAAAgAAAAMAAAACAAAAAwAAAAIAAAADAAAAAgAAAAMAAAACAAAAAgAAAAMAAAACAAAAAwAAAAIAAAADAAAAAgAAAAMAAAACAAAAAwAAAAIAAAADAAAAAgAAAAMAAAACAAAAAwAAAAIAAAADAAAAAgAAAAIAAAADAAAAAgAAAAMAAAACAAAAAwAAAAIAAAADAAAAAgAAAAMAAAACAAAAAwAAAAIAAAADAAAAAgAAAAMAAAACAAAAAwAAAAIAAAACAAAAAwAAAAIAAAADAAAAAgAAAAMAAAACAAAAAwAAAAIAAAADAAAAAgAAAAMAAAACAAAAAwAAAAIAAAADAAAAAgAAAAMAAAACAAAAAwAAAAIAAAACAAAAAwAAAAIAAAADAAAAAgAAAAMAAAACAAAAAwAAAAIAAAADAAAAAgAAAAMAAAACAAAAAwAAAAIAAAADAAAAAgAAAAMAAAACAAAAAgAAAAMAAAACAAAAAwAAAAIAAAADAAAAAgAAAAMAAAACAAAAAwAAAAIAAAADAAAAAgAAAAMAAAACAAAAAwAAAAIAAAADAAAAAgAAAAIAAAADAAAAAgAAAAMAAAACAAAAAwAAAAIAAAADAAAAAgAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAQAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABAAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAQAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABAAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAEAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABAAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAEAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAQAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABAAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAQAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABAAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAEAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABAAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAEAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAQAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAEAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAQAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABAAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAQAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABAAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAEAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAQAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAAAgAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAA="}},"source":"summary"},{"label":"Ping-Pong (64B)","metrics":{"filename":"sockperf_pingpong_64B.txt","version":"3.7-no.git","protocol":"UDP","target_ip":"192.168.1.3","target_port":11111,"run_time_sec":20.0,"warmup_msec":400.0,"sent_messages":175838,"received_messages":175837,"packet_loss_pct":0.0005687052855418706,"avg_latency_us":56.829,"std_dev_us":17.426,"jitter_us":17.426,"min_latency_us":41.207,"max_latency_us":399.046,"total_observations":171898,"percentiles":{"99.999":370.627,"99.99":277.94,"99.9":196.952,"99.0":128.272,"90.0":83.708,"75.0":54.418,"50.0":50.286,"25.0":49.02},"valid_sent":171898,"valid_received":171898,"errors":[],"test_type":"ping-pong","msg_size":64,"topology":"dual","run_date":"2025-11-05"},"histogram":{"digits":3,"count":171898,"mean_us":56.829,"std_dev_us":17.426,"min_us":41.207,"max_us":399.046,"upper_us":{"dtype":"<f4","b64":"KdwkQu78JEKyHSVCdz4lQjtfJUIAgCVCxaAlQonBJUJO4iVCEgMmQtcjJkKcRCZCYGUmQiWGJkLppiZCrscmQnPoJkI3CSdC/CknQsFKJ0KFaydCSownQg6tJ0LTzSdCmO4nQlwPKEIhMChC5VAoQqpxKEJvkihCM7MoQvjTKEK89ChCgRUpQkY2KUIKVylCz3cpQpOYKUJYuSlCHdopQuH6KUKmGypCajwqQi9dKkL0fSpCuJ4qQn2/KkJC4CpCBgErQsshK0KPQitCVGMrQhmEK0LdpCtCosUrQmbmK0IrByxC8CcsQrRILEJ5aSxCPYosQgKrLELHyyxCi+wsQlANLUIULi1C2U4tQp5vLUJikC1CJ7EtQuzRLUKw8i1CdRMuQjk0LkL+VC5Cw3UuQoeWLkJMty5CENguQtX4LkKaGS9CXjovQiNbL0Lney9CrJwvQnG9L0I13i9C+v4vQr4fMEKDQDBCSGEwQgyCMELRojBClsMwQlrkMEIfBTFC4yUxQqhGMUJtZzFCMYgxQvaoMUK6yTFCf+oxQkQLMkIILDJCzUwyQpFtMkJWjjJCG68yQt/PMkKk8DJCaBEzQi0yM0LyUjNCtnMzQnuUM0I/tTNCBNYzQsn2M0KNFzRCUjg0QhdZNELbeTRCoJo0QmS7NEIp3DRC7vw0QrIdNUJ3PjVCO181QgCANULFoDVCicE1Qk7iNUISAzZC1yM2QpxENkJgZTZCJYY2QummNkKuxzZCc+g2QjcJN0L8KTdCwUo3QoVrN0JKjDdCDq03QtPNN0KY7jdCXA84QiEwOELlUDhCqnE4Qm+SOEIzszhC+NM4Qrz0OEKBFTlCRjY5QgpXOULPdzlCk5g5Qli5OUId2jlC4fo5QqYbOkJqPDpCL106QvR9OkK4njpCfb86QkLgOkIGATtCyyE7Qo9CO0JUYztCGYQ7Qt2kO0KixTtCZuY7QisHPELwJzxCtEg8QnlpPEI9ijxCAqs8QsfLPEKL7DxCUA09QhQuPULZTj1Cnm89QmKQPUInsT1C7NE9QrDyPUJ1Ez5COTQ+Qv5UPkLDdT5Ch5Y+Qky3PkIQ2D5C1fg+QpoZP0JeOj9CI1s/Qud7P0KsnD9Ccb0/QjXeP0L6/j9Cvh9AQoNAQEJIYUBCDIJAQtGiQEKWw0BCWuRAQh8FQULjJUFCqEZBQm1nQUIxiEFC9qhBQrrJQUJ/6kFCRAtCQggsQkLNTEJCkW1CQlaOQkIbr0JC389CQqTwQkJoEUNCLTJDQvJSQ0K2c0NCe5RDQj+1Q0IE1kNCyfZDQo0XREJSOERCF1lEQtt5REKgmkRCZLtEQincRELu/ERCsh1FQnc+RUI7X0VCAIBFQsWgRUKJwUVCTuJFQhIDRkLXI0ZCnERGQmBlRkIlhkZC6aZGQq7HRkJz6EZCNwlHQvwpR0LBSkdChWtHQkqMR0IOrUdC081HQpjuR0JcD0hCITBIQuVQSEKqcUhCb5JIQjOzSEL400hCvPRIQoEVSUJGNklCCldJQs93SUKTmElCWLlJQh3aSULh+klCphtKQmo8SkIvXUpC9H1KQrieSkJ9v0pCQuBKQgYBS0LLIUtCj0JLQlRjS0IZhEtC3aRLQqLFS0Jm5ktCKwdMQvAnTEK0SExCeWlMQj2KTEICq0xCx8tMQovsTEJQDU1CFC5NQtlOTUKeb01CYpBNQiexTULs0U1CsPJNQnUTTkI5NE5C/lROQsN1TkKHlk5CTLdOQhDYTkLV+E5CmhlPQl46T0IjW09C53tPQqycT0JxvU9CNd5PQvr+T0K+H1BCg0BQQkhhUEIMglBC0aJQQpbDUEJa5FBCHwVRQuMlUUKoRlFCbWdRQjGIUUL2qFFCuslRQn/qUUJEC1JCCCxSQs1MUkKRbVJCVo5SQhuvUkLfz1JCpPBSQmgRU0ItMlNC8lJTQrZzU0J7lFNCP7VTQgTWU0LJ9lNCjRdUQlI4VEIXWVRC23lUQqCaVEJku1RCKdxUQu78VEKyHVVCdz5VQjtfVUIAgFVCxaBVQonBVUJO4lVCEgNWQtcjVkKcRFZCYGVWQiWGVkLpplZCrsdWQnPoVkI3CVdC/ClXQsFKV0KFa1dCSoxXQg6tV0LTzVdCmO5XQlwPWEIhMFhC5VBYQqpxWEJvklhCM7NYQvjTWEK89FhCgRVZQkY2WUIKV1lCz3dZQpOYWUJYuVlCHdpZQuH6WUKmG1pCajxaQi9dWkL0fVpCuJ5aQn2/WkJC4FpCBgFbQsshW0KPQltCVGNbQhmEW0LdpFtCosVbQmbmW0IrB1xC8CdcQrRIXEJ5aVxCPYpcQgKrXELHy1xCi+xcQlANXUIULl1C2U5dQp5vXUJikF1CJ7FdQuzRXUKw8l1CdRNeQjk0XkL+VF5Cw3VeQoeWXkJMt15CENheQtX4XkKaGV9CXjpfQiNbX0Lne19CrJxfQnG9X0I13l9C+v5fQr4fYEKDQGBCSGFgQgyCYELRomBClsNgQlrkYEIfBWFC4yVhQqhGYUJtZ2FCMYhhQvaoYUK6yWFCf+phQkQLYkIILGJCzUxiQpFtYkJWjmJCG69iQt/PYkKk8GJCaBFjQi0yY0LyUmNCtnNjQnuUY0I/tWNCBNZjQsn2Y0KNF2RCUjhkQhdZZELbeWRCoJpkQmS7ZEIp3GRC7vxkQrIdZUJ3PmVCO19lQgCAZULFoGVCicFlQk7iZUISA2ZC1yNmQpxEZkJgZWZCJYZmQummZkKux2ZCc+hmQjcJZ0L8KWdCwUpnQoVrZ0JKjGdCDq1nQtPNZ0KY7mdCXA9oQiEwaELlUGhCqnFoQm+SaEIzs2hC+NNoQrz0aEKBFWlCRjZpQgpXaULPd2lCk5hpQli5aUId2mlC4fppQqYbakJqPGpCL11qQvR9akK4nmpCfb9qQkLgakIGAWtCyyFrQo9Ca0JUY2tCGYRrQt2ka0KixWtCZuZrQisHbELwJ2xCtEhsQnlpbEI9imxCAqtsQsfLbEKL7GxCUA1tQhQubULZTm1Cnm9tQmKQbUInsW1C7NFtQrDybUJ1E25COTRuQv5UbkLDdW5Ch5ZuQky3bkIQ2G5C1fhuQpoZb0JeOm9CI1tvQud7b0KsnG9Ccb1vQjXeb0L6/m9Cvh9wQoNAcEJIYXBCDIJwQtGicEKWw3BCWuRwQh8FcULjJXFCqEZxQm1ncUIxiHFC9qhxQrrJcUJ/6nFCRAtyQggsckLNTHJCkW1yQlaOckIbr3JC389yQqTwckJoEXNCLTJzQvJSc0K2c3NCe5RzQj+1c0IE1nNCyfZzQo0XdEJSOHRCF1l0Qtt5dEKgmnRCZLt0QincdELu/HRCsh11Qnc+dUI7X3VCAIB1QsWgdUKJwXVCTuJ1QhIDdkLXI3ZCnER2QmBldkIlhnZC6aZ2Qq7HdkJz6HZCNwl3Qvwpd0LBSndChWt3QkqMd0IOrXdC0813Qpjud0JcD3hCITB4QuVQeEKqcXhCb5J4QjOzeEL403hCvPR4QoEVeUJGNnlCCld5Qs93eUKTmHlCWLl5Qh3aeULh+nlCpht6Qmo8ekIvXXpC9H16QrieekJ9v3pCQuB6QgYBe0LLIXtCj0J7QlRje0IZhHtC3aR7QqLFe0Jm5ntCKwd8QvAnfEK0SHxCeWl8Qj2KfEICq3xCx8t8QovsfEJQDX1CFC59QtlOfUKeb31CYpB9QiexfULs0X1CsPJ9QnUTfkI5NH5C/lR+QsN1fkKHln5CTLd+QhDYfkLV+H5Cmhl/Ql46f0IjW39C53t/Qqycf0JxvX9CNd5/Qvr+f0LfD4BCQiCAQqQwgEIGQYBCaFGAQsthgEItcoBCj4KAQvKSgEJUo4BCtrOAQhnEgEJ71IBC3eSAQj/1gEKiBYFCBBaBQmYmgULJNoFCK0eBQo1XgULwZ4FCUniBQrSIgUIXmYFCeamBQtu5gUI9yoFCoNqBQgLrgUJk+4FCxwuCQikcgkKLLIJC7jyCQlBNgkKyXYJCFG6CQnd+gkLZjoJCO5+CQp6vgkIAwIJCYtCCQsXggkIn8YJCiQGDQuwRg0KwMoNCdVODQjl0g0L+lINCw7WDQofWg0JM94NCEBiEQtU4hEKaWYRCXnqEQiObhELnu4RCrNyEQnH9hEI1HoVC+j6FQr5fhUKDgIVCSKGFQgzChULR4oVClgOGQlokhkIfRYZC42WGQqiGhkJtp4ZCMciGQvbohkK6CYdCfyqHQkRLh0IIbIdCzYyHQpGth0JWzodCG++HQt8PiEKkMIhCaFGIQi1yiELykohCtrOIQnvUiEI/9YhCBBaJQsk2iUKNV4lCUniJQheZiULbuYlCoNqJQmT7iUIpHIpC7jyKQrJdikJ3fopCO5+KQgDAikLF4IpCiQGLQk4ii0ISQ4tC12OLQpyEi0JgpYtCJcaLQunmi0KuB4xCcyiMQjdJjEL8aYxCwYqMQoWrjEJKzIxCDu2MQtMNjUKYLo1CXE+NQiFwjULlkI1CqrGNQm/SjUIz841C+BOOQrw0jkKBVY5CRnaOQgqXjkLPt45Ck9iOQlj5jkIdGo9C4TqPQqZbj0JqfI9CL52PQvS9j0K43o9Cff+PQkIgkEIGQZBCy2GQQo+CkEJUo5BCGcSQQt3kkEKiBZFCZiaRQitHkULwZ5FCtIiRQnmpkUI9ypFCAuuRQscLkkKLLJJCUE2SQhRukkLZjpJCnq+SQmLQkkIn8ZJC7BGTQrAyk0J1U5NCOXSTQv6Uk0LDtZNCh9aTQkz3k0IQGJRC1TiUQppZlEJeepRCI5uUQue7lEKs3JRCcf2UQjUelUL6PpVCvl+VQoOAlUJIoZVCDMKVQtHilUKWA5ZCWiSWQh9FlkLjZZZCqIaWQm2nlkIxyJZC9uiWQroJl0J/KpdCREuXQghsl0LNjJdCka2XQlbOl0Ib75dC3w+YQqQwmEJoUZhCLXKYQvKSmEK2s5hCe9SYQj/1mEIEFplCyTaZQo1XmUJSeJlCF5mZQtu5mUKg2plCZPuZQikcmkLuPJpCsl2aQnd+mkI7n5pCAMCaQsXgmkKJAZtCTiKbQhJDm0LXY5tCnISbQmClm0IlxptC6eabQq4HnEJzKJxCN0mcQvxpnELBipxChaucQkrMnEIO7ZxC0w2dQpgunUJcT51CIXCdQuWQnUKqsZ1Cb9KdQjPznUL4E55CvDSeQoFVnkJGdp5CCpeeQs+3nkKT2J5CWPmeQh0an0LhOp9CplufQmp8n0IvnZ9C9L2fQrjen0J9/59CQiCgQgZBoELLYaBCj4KgQlSjoEIZxKBC3eSgQqIFoUJmJqFCK0ehQvBnoUK0iKFCeamhQj3KoUIC66FCxwuiQossokJQTaJCFG6iQtmOokKer6JCYtCiQifxokLsEaNCsDKjQnVTo0I5dKNC/pSjQsO1o0KH1qNCTPejQhAYpELVOKRCmlmkQl56pEIjm6RC57ukQqzcpEJx/aRCNR6lQvo+pUK+X6VCg4ClQkihpUIMwqVC0eKlQpYDpkJaJKZCH0WmQuNlpkKohqZCbaemQjHIpkL26KZCugmnQn8qp0JES6dCCGynQs2Mp0KRradCVs6nQhvvp0LfD6hCpDCoQmhRqEItcqhC8pKoQrazqEJ71KhCP/WoQgQWqULJNqlCjVepQlJ4qUIXmalC27mpQqDaqUJk+6lCKRyqQu48qkKyXapCd36qQjufqkIAwKpCxeCqQokBq0JOIqtCEkOrQtdjq0KchKtCYKWrQiXGq0Lp5qtCrgesQnMorEI3SaxC/GmsQsGKrEKFq6xCSsysQg7trELTDa1CmC6tQlxPrUIhcK1C5ZCtQqqxrUJv0q1CM/OtQvgTrkK8NK5CgVWuQkZ2rkIKl65Cz7euQpPYrkJY+a5CHRqvQuE6r0KmW69CanyvQi+dr0L0va9CuN6vQn3/r0JCILBCBkGwQsthsEKPgrBCVKOwQhnEsELd5LBCogWxQmYmsUIrR7FC8GexQrSIsUJ5qbFCPcqxQgLrsULHC7JCiyyyQlBNskIUbrJC2Y6yQp6vskJi0LJCJ/GyQuwRs0KwMrNCdVOzQjl0s0L+lLNCw7WzQofWs0JM97NCEBi0QtU4tEKaWbRCXnq0QiObtELnu7RCrNy0QnH9tEI1HrVC+j61Qr5ftUKDgLVCSKG1QgzCtULR4rVClgO2QloktkIfRbZC42W2QqiGtkJtp7ZCMci2QvbotkK6CbdCfyq3QkRLt0IIbLdCzYy3QpGtt0JWzrdCG++3Qt8PuEKkMLhCaFG4Qi1yuELykrhCtrO4QnvUuEI/9bhCBBa5Qsk2uUKNV7lCUni5QheZuULbublCoNq5QmT7uUIpHLpC7jy6QrJdukJ3frpCO5+6QgDAukLF4LpCiQG7Qk4iu0ISQ7tC12O7QpyEu0JgpbtCJca7Qunmu0KuB7xCcyi8QjdJvEL8abxCwYq8QoWrvEJKzLxCDu28QtMNvUKYLr1CXE+9QiFwvULlkL1CqrG9Qm/SvUIz871C+BO+Qrw0vkKBVb5CRna+QgqXvkLPt75Ck9i+Qlj5vkIdGr9C4Tq/QqZbv0JqfL9CL52/QvS9v0K43r9Cff+/QkIgwEIGQcBCy2HAQo+CwEJUo8BCGcTAQt3kwEKiBcFCZibBQitHwULwZ8FCtIjBQnmpwUI9ysFCAuvBQscLwkKLLMJCUE3CQhRuwkLZjsJCnq/CQmLQwkIn8cJC7BHDQrAyw0J1U8NCOXTDQv6Uw0LDtcNCh9bDQkz3w0IQGMRC1TjEQppZxEJeesRCI5vEQue7xEKs3MRCcf3EQjUexUL6PsVCvl/FQoOAxUJIocVCDMLFQtHixUKWA8ZCWiTGQh9FxkLjZcZCqIbGQm2nxkIxyMZC9ujGQroJx0J/KsdCREvHQghsx0LNjMdCka3HQlbOx0Ib78dC3w/IQqQwyEJoUchCLXLIQvKSyEK2s8hCe9TIQj/1yEIEFslCyTbJQo1XyUJSeMlCF5nJQtu5yUKg2slCZPvJQikcykLuPMpCsl3KQnd+ykI7n8pCAMDKQsXgykKJActCTiLLQhJDy0LXY8tCnITLQmCly0IlxstC6ebLQq4HzEJzKMxCN0nMQvxpzELBisxChavMQkrMzEIO7cxC0w3NQpguzUJcT81CIXDNQuWQzUKqsc1Cb9LNQjPzzUL4E85CvDTOQoFVzkJGds5CCpfOQs+3zkKT2M5CWPnOQh0az0LhOs9CplvPQmp8z0Ivnc9C9L3PQrjez0J9/89CQiDQQgZB0ELLYdBCj4LQQlSj0EIZxNBC3eTQQqIF0UJmJtFCK0fRQvBn0UK0iNFCeanRQj3K0UIC69FCxwvSQoss0kJQTdJCFG7SQtmO0kKer9JCYtDSQifx0kLsEdNCsDLTQnVT00I5dNNC/pTTQsO100KH1tNCTPfTQhAY1ELVONRCmlnUQl561EIjm9RC57vUQqzc1EJx/dRCNR7VQvo+1UK+X9VCg4DVQkih1UIMwtVC0eLVQpYD1kJaJNZCH0XWQuNl1kKohtZCbafWQjHI1kL26NZCugnXQn8q10JES9dCCGzXQs2M10KRrddCVs7XQhvv10LfD9hCpDDYQmhR2EItcthC8pLYQraz2EJ71NhCP/XYQgQW2ULJNtlCjVfZQlJ42UIXmdlC27nZQqDa2UJk+9lCKRzaQu482kKyXdpCd37aQjuf2kIAwNpCxeDaQokB20JOIttCEkPbQtdj20KchNtCYKXbQiXG20Lp5ttCrgfcQnMo3EI3SdxC/GncQsGK3EKFq9xCSszcQg7t3ELTDd1CmC7dQlxP3UIhcN1C5ZDdQqqx3UJv0t1CM/PdQvgT3kK8NN5CgVXeQkZ23kIKl95Cz7feQpPY3kJY+d5CHRrfQuE630KmW99CanzfQi+d30L0vd9CuN7fQn3/30JCIOBCBkHgQsth4EKPguBCVKPgQhnE4ELd5OBCogXhQmYm4UIrR+FC8GfhQrSI4UJ5qeFCPcrhQgLr4ULHC+JCiyziQlBN4kIUbuJC2Y7iQp6v4kJi0OJCJ/HiQuwR40KwMuNCdVPjQjl040L+lONCw7XjQofW40JM9+NCEBjkQtU45EKaWeRCXnrkQiOb5ELnu+RCrNzkQnH95EI1HuVC+j7lQr5f5UKDgOVCSKHlQgzC5ULR4uVClgPmQlok5kIfReZC42XmQqiG5kJtp+ZCMcjmQvbo5kK6CedCfyrnQkRL50IIbOdCzYznQpGt50JWzudCG+/nQt8P6EKkMOhCaFHoQi1y6ELykuhCtrPoQnvU6EI/9ehCBBbpQsk26UKNV+lCUnjpQheZ6ULbuelCoNrpQmT76UIpHOpC7jzqQrJd6kJ3fupCO5/qQgDA6kLF4OpCiQHrQk4i60ISQ+tC12PrQpyE60JgpetCJcbrQunm60KuB+xCcyjsQjdJ7EL8aexCwYrsQoWr7EJKzOxCDu3sQtMN7UKYLu1CXE/tQiFw7ULlkO1CqrHtQm/S7UIz8+1C+BPuQrw07kKBVe5CRnbuQgqX7kLPt+5Ck9juQlj57kIdGu9C4TrvQqZb70JqfO9CL53vQvS970K43u9Cff/vQkIg8EIGQfBCy2HwQo+C8EJUo/BCGcTwQt3k8EKiBfFCZibxQitH8ULwZ/FCtIjxQnmp8UI9yvFCAuvxQscL8kKLLPJCUE3yQhRu8kLZjvJCnq/yQmLQ8kIn8fJC7BHzQrAy80J1U/NCOXTzQv6U80LDtfNCh9bzQkz380IQGPRC1Tj0QppZ9EJeevRCI5v0Que79EKs3PRCcf30QjUe9UL6PvVCvl/1QoOA9UJIofVCDML1QtHi9UKWA/ZCWiT2Qh9F9kLjZfZCqIb2Qm2n9kIxyPZC9uj2QroJ90J/KvdCREv3Qghs90LNjPdCka33QlbO90Ib7/dC3w/4QqQw+EJoUfhCLXL4QvKS+EK2s/hCe9T4Qj/1+EIEFvlCyTb5Qo1X+UJSePlCF5n5Qtu5+UKg2vlCZPv5Qikc+kLuPPpCsl36Qnd++kI7n/pCAMD6QsXg+kKJAftCTiL7QhJD+0LXY/tCnIT7QmCl+0IlxvtC6eb7Qq4H/EJzKPxCN0n8Qvxp/ELBivxChav8QkrM/EIO7fxC0w39Qpgu/UJcT/1CIXD9QuWQ/UKqsf1Cb9L9QjPz/UL4E/5CvDT+QoFV/kJGdv5CCpf+Qs+3/kKT2P5CWPn+Qh0a/0LhOv9Cplv/Qmp8/0Ivnf9C9L3/Qrje/0J9//9CIRAAQ4MgAEPlMABDSEEAQ6pRAEMMYgBDb3IAQ9GCAEMzkwBDlqMAQ/izAENaxABDvNQAQx/lAEOB9QBD4wUBQ0YWAUOoJgFDCjcBQ21HAUPPVwFDMWgBQ5N4AUP2iAFDWJkBQ7qpAUMdugFDf8oBQ+HaAUNE6wFDpvsBQwgMAkNqHAJDzSwCQy89AkORTQJD9F0CQ1ZuAkO4fgJDG48CQ32fAkPfrwJDQsACQ6TQAkMG4QJDaPECQ8sBA0MtEgND8jIDQ7ZTA0N7dANDP5UDQwS2A0PJ1gNDjfcDQ1IYBEMXOQRD21kEQ6B6BENkmwRDKbwEQ+7cBEOy/QRDdx4FQzs/BUMAYAVDxYAFQ4mhBUNOwgVDEuMFQ9cDBkOcJAZDYEUGQyVmBkPphgZDrqcGQ3PIBkM36QZD/AkHQ8EqB0OFSwdDSmwHQw6NB0PTrQdDmM4HQ1zvB0MhEAhD5TAIQ6pRCENvcghDM5MIQ/izCEO81AhDgfUIQ0YWCUMKNwlDz1cJQ5N4CUNYmQlDHboJQ+HaCUOm+wlDahwKQy89CkP0XQpDuH4KQ32fCkNCwApDBuEKQ8sBC0OPIgtDVEMLQxlkC0PdhAtDoqULQ2bGC0Mr5wtD8AcMQ7QoDEN5SQxDPWoMQwKLDEPHqwxDi8wMQ1DtDEMUDg1D2S4NQ55PDUNicA1DJ5ENQ+yxDUOw0g1DdfMNQzkUDkP+NA5Dw1UOQ4d2DkNMlw5DELgOQ9XYDkOa+Q5DXhoPQyM7D0PnWw9DrHwPQ3GdD0M1vg9D+t4PQ77/D0ODIBBDSEEQQwxiEEPRghBDlqMQQ1rEEEMf5RBD4wURQ6gmEUNtRxFDMWgRQ/aIEUO6qRFDf8oRQ0TrEUMIDBJDzSwSQ5FNEkNWbhJDG48SQ9+vEkOk0BJDaPESQy0SE0PyMhNDtlMTQ3t0E0M/lRNDBLYTQ8nWE0ON9xNDUhgUQxc5FEPbWRRDoHoUQ2SbFEMpvBRD7twUQ7L9FEN3HhVDOz8VQwBgFUPFgBVDiaEVQ07CFUMS4xVD1wMWQ5wkFkNgRRZDJWYWQ+mGFkOupxZDc8gWQzfpFkP8CRdDwSoXQ4VLF0NKbBdDDo0XQ9OtF0OYzhdDXO8XQyEQGEPlMBhDqlEYQ29yGEMzkxhD+LMYQ7zUGEOB9RhDRhYZQwo3GUPPVxlDk3gZQ1iZGUMduhlD4doZQ6b7GUNqHBpDLz0aQ/RdGkO4fhpDfZ8aQ0LAGkMG4RpDywEbQ48iG0NUQxtDGWQbQ92EG0OipRtDZsYbQyvnG0PwBxxDtCgcQ3lJHEM9ahxDAoscQ8erHEOLzBxDUO0cQxQOHUPZLh1Dnk8dQ2JwHUMnkR1D7LEdQ7DSHUN18x1DORQeQ/40HkPDVR5Dh3YeQ0yXHkMQuB5D1dgeQ5r5HkNeGh9DIzsfQ+dbH0OsfB9DcZ0fQzW+H0P63h9Dvv8fQ4MgIENIQSBDDGIgQ9GCIEOWoyBDWsQgQx/lIEPjBSFDqCYhQ21HIUMxaCFD9oghQ7qpIUN/yiFDROshQwgMIkPNLCJDkU0iQ1ZuIkMbjyJD368iQ6TQIkNo8SJDLRIjQ/IyI0O2UyNDe3QjQz+VI0MEtiNDydYjQ433I0NSGCRDFzkkQ9tZJEOgeiRDZJskQym8JEPu3CRDsv0kQ3ceJUM7PyVDAGAlQ8WAJUOJoSVDTsIlQxLjJUPXAyZDnCQmQ2BFJkMlZiZD6YYmQ66nJkNzyCZDN+kmQ/wJJ0PBKidDhUsnQ0psJ0MOjSdD060nQ5jOJ0Nc7ydDIRAoQ+UwKEOqUShDb3IoQzOTKEP4syhDvNQoQ4H1KENGFilDCjcpQ89XKUOTeClDWJkpQx26KUPh2ilDpvspQ2ocKkMvPSpD9F0qQ7h+KkN9nypDQsAqQwbhKkPLAStDjyIrQ1RDK0MZZCtD3YQrQ6KlK0NmxitDK+crQ/AHLEO0KCxDeUksQz1qLEMCiyxDx6ssQ4vMLENQ7SxDFA4tQ9kuLUOeTy1DYnAtQyeRLUPssS1DsNItQ3XzLUM5FC5D/jQuQ8NVLkOHdi5DTJcuQxC4LkPV2C5DmvkuQ14aL0MjOy9D51svQ6x8L0NxnS9DNb4vQ/reL0O+/y9DgyAwQ0hBMEMMYjBD0YIwQ5ajMENaxDBDH+UwQ+MFMUOoJjFDbUcxQzFoMUP2iDFDuqkxQ3/KMUNE6zFDCAwyQ80sMkORTTJDVm4yQxuPMkPfrzJDpNAyQ2jxMkMtEjND8jIzQ7ZTM0N7dDNDP5UzQwS2M0PJ1jNDjfczQ1IYNEMXOTRD21k0Q6B6NENkmzRDKbw0Q+7cNEOy/TRDdx41Qzs/NUMAYDVDxYA1Q4mhNUNOwjVDEuM1Q9cDNkOcJDZDYEU2QyVmNkPphjZDrqc2Q3PINkM36TZD/Ak3Q8EqN0OFSzdDSmw3Qw6NN0PTrTdDmM43Q1zvN0MhEDhD5TA4Q6pROENvcjhDM5M4Q/izOEO81DhDgfU4Q0YWOUMKNzlDz1c5Q5N4OUNYmTlDHbo5Q+HaOUOm+zlDahw6Qy89OkP0XTpDuH46Q32fOkNCwDpDBuE6Q8sBO0OPIjtDVEM7QxlkO0PdhDtDoqU7Q2bGO0Mr5ztD8Ac8Q7QoPEN5STxDPWo8QwKLPEPHqzxDi8w8Q1DtPEMUDj1D2S49Q55PPUNicD1DJ5E9Q+yxPUOw0j1DdfM9QzkUPkP+ND5Dw1U+Q4d2PkNMlz5DELg+Q9XYPkOa+T5DXho/QyM7P0PnWz9DrHw/Q3GdP0M1vj9D+t4/Q77/P0ODIEBDSEFAQwxiQEPRgkBDlqNAQ1rEQEMf5UBD4wVBQ6gmQUNtR0FDMWhBQ/aIQUO6qUFDf8pBQ0TrQUMIDEJDzSxCQ5FNQkNWbkJDG49CQ9+vQkOk0EJDaPFCQy0SQ0PyMkNDtlNDQ3t0Q0M/lUNDBLZDQ8nWQ0ON90NDUhhEQxc5REPbWURDoHpEQ2SbREMpvERD7txEQ7L9REM7P0VDTsJFQ2BFRkNzyEZDhUtHQ5jOR0OqUUhDvNRIQ5N4SUOm+0lDuH5KQ8sBS0PdhEtD8AdMQwKLTEMUDk1DJ5FNQzkUTkNMl05DIztPQzW+T0NIQVBDWsRQQ21HUUN/ylFDkU1SQ6TQUkO2U1NDydZTQ9tZVEOy/VRDxYBVQ9cDVkPphlZD/AlXQw6NV0MhEFhDM5NYQ0YWWUNYmVlDahxaQ32fWkNUQ1tDZsZbQ3lJXEOLzFxDnk9dQ7DSXUPDVV5D1dheQ+dbX0P63l9DDGJgQ+MFYUP2iGFDCAxiQxuPYkMtEmNDP5VjQ1IYZENkm2RDdx5lQ4mhZUOcJGZDc8hmQ4VLZ0OYzmdDqlFoQ7zUaEPPV2lD4dppQ/RdakMG4WpDGWRrQyvna0MCi2xDFA5tQyeRbUM5FG5DTJduQ14ab0NxnW9DgyBwQ5ajcEOoJnFDuqlxQ5FNckOk0HJDtlNzQ8nWc0PbWXRD7tx0QwBgdUMS43VDJWZ2QzfpdkNKbHdDIRB4QzOTeENGFnlDWJl5Q2ocekN9n3pDjyJ7Q6Kle0O0KHxDx6t8Q9kufUOw0n1Dw1V+Q9XYfkPnW39D+t5/QwYxgEOPcoBDGbSAQ6L1gEMrN4FDtHiBQ6DKgUMpDIJDsk2CQzuPgkPF0IJDThKDQ9dTg0NglYND6daDQ3MYhEP8WYRDhZuEQ9P9hENcP4VD5YCFQ2/ChUP4A4ZDgUWGQwqHhkOTyIZDHQqHQ6ZLh0MvjYdDuM6HQ0IQiEPLUYhDVJOIQ93UiENmFolD8FeJQ3mZiUMC24lDixyKQxReikNiwIpD7AGLQzUOjUOkIJBDThKTQ7wklkNmFplDEAicQ38an0MpDKJDmB6lQ0IQqEPsAatDWhSuQwQGsUNzGLRDHQq3Q7Aiu0OcdMND"},"counts":{"dtype":"<u4","b64":"LwAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALEAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACxAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACxAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAABMBAAA/BAAAPgQAAD4EAAA+BAAAPwQAAD4EAAA+BAAAPgQAAD4EAAA/BAAAPgQAAD4EAAA+BAAAPwQAAD4EAAA+BAAAPgQAAD8EAAA+BAAAPgQAAD4EAAA/BAAAPgQAAD4EAAA+BAAAPwQAAD4EAAA+BAAAPgQAAD8EAAA+BAAAPgQAAD4EAAA/BAAAPgQAAD4EAAA+BAAAPwQAAD4EAACiAgAATQEAAE0BAABMAQAATQEAAE0BAABNAQAATQEAAE0BAABMAQAATQEAAE0BAABNAQAATQEAAEwBAABNAQAATQEAAE0BAABNAQAATAEAAE0BAABNAQAATQEAAE0BAABNAQAATAEAAE0BAABNAQAATQEAAE0BAABMAQAATQEAAE0BAABNAQAATQEAAEwBAABNAQAATQEAAE0BAABNAQAATQEAAEwBAABNAQAATQEAAE0BAABNAQAATAEAAE0BAABNAQAATQEAAE0BAABMAQAATQEAAE0BAABNAQAATQEAAE0BAABMAQAATQEAAE0BAABNAQAATQEAAEwBAABNAQAATQEAAE0BAABNAQAATAEAAE0BAABNAQAATQEAAE0BAABNAQAATAEAAE0BAABNAQAATQEAAE0BAABMAQAATQEAAE0BAABNAQAATQEAAEwBAABNAQAATQEAAE0BAABNAQAATQEAAEwBAABNAQAATQEAAE0BAABNAQAATAEAAE0BAABNAQAATQEAAE0BAABNAQAATAEAAE0BAABNAQAATQEAAE0BAABMAQAATQEAAE0BAABNAQAATQEAAEwBAABNAQAATQEAAE0BAABNAQAATQEAAEwBAABNAQAATQEAAE0BAABNAQAATAEAAE0BAABNAQAATQEAAE0BAABMAQAATQEAAE0BAADMAAAAHQAAABwAAAAcAAAAHAAAABwAAAAcAAAAHQAAABwAAAAcAAAAHAAAABwAAAAcAAAAHQAAABwAAAAcAAAAHAAAABwAAAAcAAAAHQAAABwAAAAcAAAAHAAAABwAAAAcAAAAHQAAABwAAAAcAAAAHAAAABwAAAAcAAAAHQAAABwAAAAcAAAAHAAAABwAAAAdAAAAHAAAABwAAAAcAAAAHAAAABwAAAAdAAAAHAAAABwAAAAcAAAAHAAAABwAAAAdAAAAHAAAABwAAAAcAAAAHAAAABwAAAAdAAAAHAAAABwAAAAcAAAAHAAAABwAAAAdAAAAHAAAABwAAAAcAAAAHAAAABwAAAAdAAAAHAAAABwAAAAcAAAAHAAAABwAAAAdAAAAHAAAABwAAAAcAAAAHAAAAB0AAAAcAAAAHAAAABwAAAAcAAAAHAAAAB0AAAAcAAAAHAAAABwAAAAcAAAAHAAAAB0AAAAcAAAAHAAAABwAAAAcAAAAHAAAAB0AAAAcAAAAHAAAABwAAAAcAAAAHAAAAB0AAAAcAAAAHAAAABwAAAAcAAAAHAAAAB0AAAAcAAAAHAAAABwAAAAcAAAAHAAAAB0AAAAcAAAAHAAAABwAAAAcAAAAHAAAAB0AAAAcAAAAHAAAABwAAAAcAAAAHQAAABwAAAAcAAAAHAAAABwAAAAcAAAAHQAAABwAAAAcAAAAHAAAABwAAAAcAAAAHQAAABwAAAAcAAAAHAAAABwAAAAcAAAAHQAAABwAAAAcAAAAHAAAABwAAAAcAAAAHQAAABwAAAAcAAAAHAAAABwAAAAcAAAAHQAAABwAAAAcAAAAHAAAABwAAAAcAAAAHQAAABwAAAAcAAAAHAAAABwAAAAcAAAAHQAAABwAAAAcAAAAHAAAABwAAAAdAAAAHAAAABwAAAAcAAAAHAAAABwAAAAdAAAAHAAAABwAAAAcAAAAHAAAABwAAAAdAAAAHAAAABwAAAAcAAAAHAAAABwAAAAdAAAAHAAAABwAAAAcAAAAHAAAABwAAAAdAAAAHAAAABwAAAAcAAAAHAAAABwAAAAdAAAAHAAAABwAAAAcAAAAHAAAABwAAAAdAAAAHAAAABwAAAAcAAAAHAAAAB0AAAAcAAAAHAAAABwAAAAcAAAAHAAAAB0AAAAcAAAAHAAAABwAAAAcAAAAHAAAAB0AAAAcAAAAHAAAABwAAAAcAAAAHAAAAB0AAAAcAAAAHAAAABwAAAAcAAAAHAAAAB0AAAAcAAAAHAAAABwAAAAcAAAAHAAAAB0AAAAcAAAAHAAAABwAAAAcAAAAHAAAAB0AAAAcAAAAHAAAABwAAAAcAAAAHAAAAB0AAAAcAAAAHAAAABwAAAAcAAAAHQAAABwAAAAcAAAAHAAAABwAAAAcAAAAHQAAABwAAAAcAAAAHAAAABwAAAAcAAAAHQAAABwAAAAcAAAAHAAAABwAAAAcAAAAHQAAABwAAAAcAAAAHAAAABwAAAAcAAAAHQAAABwAAAAcAAAAHAAAABwAAAAcAAAAHQAAABwAAAAcAAAAHAAAABwAAAAcAAAAHQAAABwAAAAcAAAAHAAAABwAAAAcAAAAHQAAABwAAAAcAAAAHAAAABwAAAAdAAAAHAAAABwAAAAcAAAAHAAAABwAAAAdAAAAHAAAABwAAAAcAAAAHAAAABwAAAAdAAAAHAAAABwAAAAcAAAAHAAAABwAAAAdAAAAHAAAABwAAAAcAAAAHAAAABwAAAAdAAAAHAAAABwAAAAcAAAAHAAAABwAAAAdAAAAHAAAABwAAAAcAAAAHAAAABwAAAAdAAAAHAAAABwAAAAcAAAAHAAAAB0AAAA4AAAAOAAAADkAAAA4AAAAOAAAADkAAAA4AAAAOAAAADkAAAA4AAAAOAAAADkAAAA4AAAAOAAAADkAAAA4AAAAOAAAADkAAAA4AAAAOAAAADkAAAA4AAAAOAAAADkAAAA4AAAAOAAAADkAAAA4AAAAOAAAADkAAAA4AAAAOAAAADkAAAA4AAAAOAAAADkAAAA4AAAAOAAAADkAAAA4AAAAOAAAADkAAAA4AAAAOAAAADkAAAA4AAAAOQAAADgAAAA4AAAAOQAAADgAAAA4AAAAOQAAADgAAAA4AAAAOQAAADgAAAA4AAAAOQAAADgAAAA4AAAAOQAAADgAAAA4AAAAOQAAADgAAAA4AAAAOQAAADgAAAA4AAAAOQAAADgAAAA4AAAAOQAAADgAAAA4AAAAOQAAADgAAAA4AAAAOQAAADgAAAA4AAAAOQAAADgAAAA4AAAAOQAAADgAAAA4AAAAOQAAADgAAAA5AAAAOAAAADgAAAA5AAAAOAAAADgAAAA5AAAAOAAAADgAAAA5AAAAOAAAADgAAAA5AAAAOAAAADgAAAA5AAAAOAAAADgAAAA5AAAAOAAAADgAAAA5AAAAOAAAADgAAAA5AAAAOAAAADgAAAA5AAAAOAAAADgAAAA5AAAAOAAAADgAAAA5AAAAOAAAADgAAAA5AAAAOAAAADgAAAA5AAAAOAAAADgAAAA5AAAAOAAAADkAAAA4AAAAOAAAADkAAAA4AAAAOAAAADkAAAA4AAAAOAAAADkAAAA4AAAAOAAAADkAAAA4AAAAOAAAADkAAAA4AAAAOAAAADkAAAA4AAAAOAAAADkAAAA4AAAAOAAAADkAAAA4AAAAOAAAADkAAAA4AAAAOAAAADkAAAA4AAAAOAAAADkAAAA4AAAAOAAAADkAAAA4AAAAOAAAADkAAAA4AAAAOAAAADkAAAA4AAAAOQAAADgAAAA4AAAAOQAAADgAAAA4AAAAOQAAADgAAAA4AAAAOQAAADgAAAA4AAAAOQAAADgAAAA4AAAAOQAAADgAAAA4AAAAOQAAADgAAAA4AAAAOQAAADgAAAA4AAAAOQAAADgAAAA4AAAAOQAAADgAAAA4AAAAOQAAADgAAAA4AAAAOQAAADgAAAA4AAAAOQAAADgAAAA4AAAAOQAAADgAAAA4AAAAOQAAADgAAAA4AAAAOQAAADgAAAA5AAAAOAAAADgAAAA5AAAAOAAAADgAAAA5AAAAOAAAADgAAAA5AAAAOAAAADgAAAA5AAAAOAAAADgAAAA5AAAAOAAAADgAAAA5AAAAOAAAADgAAAA5AAAAOAAAADgAAAA5AAAAOAAAADgAAAA5AAAAOAAAADgAAAA5AAAAOAAAADgAAAA5AAAAOAAAADgAAAA5AAAAOAAAADgAAAA5AAAAOAAAADgAAAA5AAAAOAAAADkAAAA4AAAAOAAAADkAAAA4AAAAOAAAADkAAAA4AAAAOAAAADkAAAA4AAAAOAAAADkAAAA4AAAANgAAABcAAAAWAAAAFgAAABYAAAAXAAAAFgAAABYAAAAWAAAAFgAAABcAAAAWAAAAFgAAABYAAAAWAAAAFwAAABYAAAAWAAAAFgAAABcAAAAWAAAAFgAAABYAAAAWAAAAFwAAABYAAAAWAAAAFgAAABcAAAAWAAAAFgAAABYAAAAWAAAAFwAAABYAAAAWAAAAFgAAABYAAAAXAAAAFgAAABYAAAAWAAAAFwAAABYAAAAWAAAAFgAAABYAAAAXAAAAFgAAABYAAAAWAAAAFwAAABYAAAAWAAAAFgAAABYAAAAXAAAAFgAAABYAAAAWAAAAFwAAABYAAAAWAAAAFgAAABYAAAAXAAAAFgAAABYAAAAWAAAAFgAAABcAAAAWAAAAFgAAABYAAAAXAAAAFgAAABYAAAAWAAAAFgAAABcAAAAWAAAAFgAAABYAAAAXAAAAFgAAABYAAAAWAAAAFgAAABcAAAAWAAAAFgAAABYAAAAWAAAAFwAAABYAAAAWAAAAFgAAABcAAAAWAAAAFgAAABYAAAAWAAAAFwAAABYAAAAWAAAAFgAAABcAAAAWAAAAFgAAABYAAAAWAAAAFwAAABYAAAAWAAAAFgAAABcAAAAWAAAAFgAAABYAAAAWAAAAFwAAABYAAAAWAAAAFgAAABYAAAAXAAAAFgAAABYAAAAWAAAAFwAAABYAAAAWAAAAFgAAABYAAAAXAAAAFgAAABYAAAAWAAAAFwAAABYAAAAWAAAAFgAAABYAAAAXAAAAFgAAABYAAAAWAAAAFgAAABcAAAAWAAAAFgAAABYAAAAXAAAAFgAAABYAAAAWAAAAFgAAABcAAAAWAAAAFgAAABYAAAAXAAAAFgAAABYAAAAWAAAAFgAAABcAAAAWAAAAFgAAABYAAAAXAAAAFgAAABYAAAAWAAAAFgAAABcAAAAWAAAAFgAAABYAAAAWAAAAFwAAABYAAAAWAAAAFgAAABcAAAAWAAAAFgAAABYAAAAWAAAAFwAAABYAAAAWAAAAFgAAABcAAAAWAAAAFgAAABYAAAAWAAAAFwAAABYAAAAWAAAAFgAAABYAAAAXAAAAFgAAABYAAAAWAAAAFwAAABYAAAAWAAAAFgAAABYAAAAXAAAAFgAAABYAAAAWAAAAFwAAABYAAAAWAAAAFgAAABYAAAAXAAAAFgAAABYAAAAWAAAAFwAAABYAAAAWAAAAFgAAABYAAAAXAAAAFgAAABYAAAAWAAAAFgAAABcAAAAWAAAAFgAAABYAAAAXAAAAFgAAABYAAAAWAAAAFgAAABcAAAAWAAAAFgAAABYAAAAXAAAAFgAAABYAAAAWAAAAFgAAABcAAAAWAAAAFgAAABYAAAAWAAAAFwAAABYAAAAWAAAAFgAAABcAAAAWAAAAFgAAABYAAAAWAAAAFwAAABYAAAAWAAAAFgAAABcAAAAWAAAAFgAAABYAAAAWAAAAFwAAABYAAAAWAAAAFgAAABcAAAAWAAAAFgAAABYAAAAWAAAAFwAAABYAAAAWAAAAFgAAABYAAAAXAAAAFgAAABYAAAAWAAAAFwAAABYAAAAWAAAAFgAAABYAAAAXAAAAFgAAABYAAAAWAAAAFwAAABYAAAAWAAAAFgAAABYAAAAXAAAAFgAAABYAAAAWAAAAFgAAABcAAAAWAAAAFgAAABYAAAAXAAAAFgAAABYAAAAWAAAAFgAAABcAAAAWAAAAFgAAABYAAAAXAAAAFgAAABYAAAAWAAAAFgAAABcAAAAWAAAAFgAAABYAAAAXAAAAFgAAABYAAAAWAAAAFgAAABcAAAAWAAAAFgAAABYAAAAWAAAAFwAAABYAAAAWAAAAFgAAABcAAAAWAAAAFgAAABYAAAAWAAAAFwAAABYAAAAWAAAAFgAAABcAAAAWAAAAFgAAABYAAAAWAAAAFwAAABYAAAAWAAAAFgAAABYAAAAXAAAAFgAAABYAAAAWAAAAFwAAABYAAAAWAAAAFgAAABYAAAAXAAAAFgAAABYAAAAWAAAAFwAAABYAAAAWAAAAFgAAABYAAAAXAAAAFgAAABYAAAAWAAAAFwAAABYAAAAWAAAAFgAAABYAAAAXAAAAFgAAABYAAAAWAAAAFgAAABcAAAAWAAAAFgAAABYAAAAXAAAAFgAAABYAAAAWAAAAFgAAABcAAAAWAAAAFgAAABYAAAAXAAAAFgAAABYAAAAWAAAAFgAAABcAAAAWAAAAFgAAABYAAAAXAAAAFgAAABYAAAAWAAAAFgAAABcAAAAWAAAAFgAAABYAAAAWAAAAFwAAABYAAAAWAAAAFgAAABcAAAAWAAAAFgAAABYAAAAWAAAAFwAAABYAAAAWAAAAFgAAABcAAAAWAAAAFgAAABYAAAAWAAAAFwAAABYAAAAWAAAAFgAAABYAAAAXAAAAFgAAABYAAAAWAAAAFwAAABYAAAAWAAAAFgAAABYAAAAXAAAAFgAAABYAAAAWAAAAFwAAABYAAAAWAAAAFgAAABYAAAAXAAAAFgAAABYAAAAWAAAAFwAAABYAAAAWAAAAFgAAABYAAAAXAAAAFgAAABYAAAAWAAAAFgAAABcAAAAWAAAAFgAAABYAAAAXAAAAFgAAABYAAAAWAAAAFgAAABcAAAAWAAAAFgAAABYAAAAXAAAAFgAAABYAAAAWAAAAFgAAABcAAAAWAAAAFgAAABYAAAAWAAAAFwAAABYAAAAWAAAAFgAAABcAAAAWAAAAFgAAABYAAAAWAAAAFwAAABYAAAAWAAAAFgAAABcAAAAWAAAAFgAAABYAAAAWAAAAFwAAABYAAAAWAAAAFgAAABcAAAAWAAAAFgAAABYAAAAWAAAAFwAAABYAAAAWAAAAFgAAABYAAAAXAAAAFgAAABYAAAAWAAAAFwAAABYAAAAWAAAAFgAAABYAAAAXAAAAFgAAABYAAAAWAAAAFwAAABYAAAAWAAAAFgAAABYAAAAXAAAAFgAAABYAAAAWAAAAFgAAABcAAAAWAAAAFgAAABYAAAAXAAAAFgAAABYAAAAWAAAAFgAAABcAAAAWAAAAFgAAABYAAAAXAAAAFgAAABYAAAAWAAAAFgAAABcAAAAWAAAAFgAAABYAAAAXAAAAFgAAABYAAAAWAAAAFgAAABcAAAAWAAAAFgAAABYAAAAWAAAAFwAAABYAAAAWAAAAFgAAABcAAAAWAAAAFgAAABYAAAAWAAAAFwAAABYAAAAWAAAAFgAAABcAAAAWAAAAFgAAABYAAAAWAAAAFwAAABYAAAAWAAAAFgAAABYAAAAXAAAAFgAAABYAAAAWAAAAFwAAABYAAAAWAAAAFgAAABYAAAAXAAAAFgAAABYAAAAWAAAAFwAAABYAAAAWAAAAFgAAABYAAAAXAAAAFgAAABYAAAAWAAAAFwAAABYAAAAWAAAAFgAAABYAAAAXAAAAFgAAABYAAAAWAAAAFgAAABcAAAAWAAAAFgAAABYAAAAXAAAAFgAAABYAAAAWAAAAFgAAABcAAAAWAAAAFgAAABYAAAAXAAAAFgAAABYAAAAWAAAAFgAAABcAAAAWAAAAFgAAABYAAAAWAAAAFwAAABYAAAAWAAAAFgAAABcAAAAWAAAAFgAAABYAAAAWAAAAFwAAABYAAAAWAAAAFgAAABcAAAAWAAAAFgAAABYAAAAWAAAAFwAAABYAAAAWAAAAFgAAAAcAAAACAAAAAQAAAAEAAAACAAAAAQAAAAIAAAABAAAAAgAAAAEAAAACAAAAAQAAAAEAAAACAAAAAQAAAAIAAAABAAAAAgAAAAEAAAABAAAAAgAAAAEAAAACAAAAAQAAAAIAAAABAAAAAgAAAAEAAAABAAAAAgAAAAEAAAACAAAAAQAAAAIAAAABAAAAAgAAAAEAAAABAAAAAgAAAAEAAAACAAAAAQAAAAIAAAABAAAAAwAAAAMAAAADAAAAAwAAAAIAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAIAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAIAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAgAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAgAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAACAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAACAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAIAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAIAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAIAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAgAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAgAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAACAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAACAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAIAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAIAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAIAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAgAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAgAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAACAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAACAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAIAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAIAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAIAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAgAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAgAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAACAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAACAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAIAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAIAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAIAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAgAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAgAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAACAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAACAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAIAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAIAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAIAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAgAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAgAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAACAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAACAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAIAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAIAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAIAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAgAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAgAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAACAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAACAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAIAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAIAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAIAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAgAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAgAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAACAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAACAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAIAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAIAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAIAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAgAAAAMAAAADAAAAAwAAAAIAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAA"}},"source":"summary"},{"label":"Ping-Pong (512B)","metrics":{"filename":"sockperf_pingpong_512B.txt","version":"3.7-no.git","protocol":"UDP","target_ip":"192.168.1.3","target_port":11111,"run_time_sec":20.0,"warmup_msec":400.0,"sent_messages":106739,"received_messages":106738,"packet_loss_pct":0.0009368646886276366,"avg_latency_us":93.64,"std_dev_us":18.867,"jitter_us":18.867,"min_latency_us":65.018,"max_latency_us":389.945,"total_observations":104349,"percentiles":{"99.999":376.181,"99.99":316.757,"99.9":247.449,"99.0":173.579,"90.0":110.689,"75.0":102.375,"50.0":85.894,"25.0":83.711},"valid_sent":104349,"valid_received":104349,"errors":[],"test_type":"ping-pong","msg_size":512,"topology":"dual","run_date":"2025-11-05"},"histogram":{"digits":3,"count":104349,"mean_us":93.64,"std_dev_us":18.867,"min_us":65.018,"max_us":389.945,"upper_us":{"dtype":"<f4","b64":"xwuCQikcgkKLLIJC7jyCQlBNgkKyXYJCFG6CQnd+gkLZjoJCO5+CQp6vgkIAwIJCYtCCQsXggkIn8YJCiQGDQuwRg0KwMoNCdVODQjl0g0L+lINCw7WDQofWg0JM94NCEBiEQtU4hEKaWYRCXnqEQiObhELnu4RCrNyEQnH9hEI1HoVC+j6FQr5fhUKDgIVCSKGFQgzChULR4oVClgOGQlokhkIfRYZC42WGQqiGhkJtp4ZCMciGQvbohkK6CYdCfyqHQkRLh0IIbIdCzYyHQpGth0JWzodCG++HQt8PiEKkMIhCaFGIQi1yiELykohCtrOIQnvUiEI/9YhCBBaJQsk2iUKNV4lCUniJQheZiULbuYlCoNqJQmT7iUIpHIpC7jyKQrJdikJ3fopCO5+KQgDAikLF4IpCiQGLQk4ii0ISQ4tC12OLQpyEi0JgpYtCJcaLQunmi0KuB4xCcyiMQjdJjEL8aYxCwYqMQoWrjEJKzIxCDu2MQtMNjUKYLo1CXE+NQiFwjULlkI1CqrGNQm/SjUIz841C+BOOQrw0jkKBVY5CRnaOQgqXjkLPt45Ck9iOQlj5jkIdGo9C4TqPQqZbj0JqfI9CL52PQvS9j0K43o9Cff+PQkIgkEIGQZBCy2GQQo+CkEJUo5BCGcSQQt3kkEKiBZFCZiaRQitHkULwZ5FCtIiRQnmpkUI9ypFCAuuRQscLkkKLLJJCUE2SQhRukkLZjpJCnq+SQmLQkkIn8ZJC7BGTQrAyk0J1U5NCOXSTQv6Uk0LDtZNCh9aTQkz3k0IQGJRC1TiUQppZlEJeepRCI5uUQue7lEKs3JRCcf2UQjUelUL6PpVCvl+VQoOAlUJIoZVCDMKVQtHilUKWA5ZCWiSWQh9FlkLjZZZCqIaWQm2nlkIxyJZC9uiWQroJl0J/KpdCREuXQghsl0LNjJdCka2XQlbOl0Ib75dC3w+YQqQwmEJoUZhCLXKYQvKSmEK2s5hCe9SYQj/1mEIEFplCyTaZQo1XmUJSeJlCF5mZQtu5mUKg2plCZPuZQikcmkLuPJpCsl2aQnd+mkI7n5pCAMCaQsXgmkKJAZtCTiKbQhJDm0LXY5tCnISbQmClm0IlxptC6eabQq4HnEJzKJxCN0mcQvxpnELBipxChaucQkrMnEIO7ZxC0w2dQpgunUJcT51CIXCdQuWQnUKqsZ1Cb9KdQjPznUL4E55CvDSeQoFVnkJGdp5CCpeeQs+3nkKT2J5CWPmeQh0an0LhOp9CplufQmp8n0IvnZ9C9L2fQrjen0J9/59CQiCgQgZBoELLYaBCj4KgQlSjoEIZxKBC3eSgQqIFoUJmJqFCK0ehQvBnoUK0iKFCeamhQj3KoUIC66FCxwuiQossokJQTaJCFG6iQtmOokKer6JCYtCiQifxokLsEaNCsDKjQnVTo0I5dKNC/pSjQsO1o0KH1qNCTPejQhAYpELVOKRCmlmkQl56pEIjm6RC57ukQqzcpEJx/aRCNR6lQvo+pUK+X6VCg4ClQkihpUIMwqVC0eKlQpYDpkJaJKZCH0WmQuNlpkKohqZCbaemQjHIpkL26KZCugmnQn8qp0JES6dCCGynQs2Mp0KRradCVs6nQhvvp0LfD6hCpDCoQmhRqEItcqhC8pKoQrazqEJ71KhCP/WoQgQWqULJNqlCjVepQlJ4qUIXmalC27mpQqDaqUJk+6lCKRyqQu48qkKyXapCd36qQjufqkIAwKpCxeCqQokBq0JOIqtCEkOrQtdjq0KchKtCYKWrQiXGq0Lp5qtCrgesQnMorEI3SaxC/GmsQsGKrEKFq6xCSsysQg7trELTDa1CmC6tQlxPrUIhcK1C5ZCtQqqxrUJv0q1CM/OtQvgTrkK8NK5CgVWuQkZ2rkIKl65Cz7euQpPYrkJY+a5CHRqvQuE6r0KmW69CanyvQi+dr0L0va9CuN6vQn3/r0JCILBCBkGwQsthsEKPgrBCVKOwQhnEsELd5LBCogWxQmYmsUIrR7FC8GexQrSIsUJ5qbFCPcqxQgLrsULHC7JCiyyyQlBNskIUbrJC2Y6yQp6vskJi0LJCJ/GyQuwRs0KwMrNCdVOzQjl0s0L+lLNCw7WzQofWs0JM97NCEBi0QtU4tEKaWbRCXnq0QiObtELnu7RCrNy0QnH9tEI1HrVC+j61Qr5ftUKDgLVCSKG1QgzCtULR4rVClgO2QloktkIfRbZC42W2QqiGtkJtp7ZCMci2QvbotkK6CbdCfyq3QkRLt0IIbLdCzYy3QpGtt0JWzrdCG++3Qt8PuEKkMLhCaFG4Qi1yuELykrhCtrO4QnvUuEI/9bhCBBa5Qsk2uUKNV7lCUni5QheZuULbublCoNq5QmT7uUIpHLpC7jy6QrJdukJ3frpCO5+6QgDAukLF4LpCiQG7Qk4iu0ISQ7tC12O7QpyEu0JgpbtCJca7Qunmu0KuB7xCcyi8QjdJvEL8abxCwYq8QoWrvEJKzLxCDu28QtMNvUKYLr1CXE+9QiFwvULlkL1CqrG9Qm/SvUIz871C+BO+Qrw0vkKBVb5CRna+QgqXvkLPt75Ck9i+Qlj5vkIdGr9C4Tq/QqZbv0JqfL9CL52/QvS9v0K43r9Cff+/QkIgwEIGQcBCy2HAQo+CwEJUo8BCGcTAQt3kwEKiBcFCZibBQitHwULwZ8FCtIjBQnmpwUI9ysFCAuvBQscLwkKLLMJCUE3CQhRuwkLZjsJCnq/CQmLQwkIn8cJC7BHDQrAyw0J1U8NCOXTDQv6Uw0LDtcNCh9bDQkz3w0IQGMRC1TjEQppZxEJeesRCI5vEQue7xEKs3MRCcf3EQjUexUL6PsVCvl/FQoOAxUJIocVCDMLFQtHixUKWA8ZCWiTGQh9FxkLjZcZCqIbGQm2nxkIxyMZC9ujGQroJx0J/KsdCREvHQghsx0LNjMdCka3HQlbOx0Ib78dC3w/IQqQwyEJoUchCLXLIQvKSyEK2s8hCe9TIQj/1yEIEFslCyTbJQo1XyUJSeMlCF5nJQtu5yUKg2slCZPvJQikcykLuPMpCsl3KQnd+ykI7n8pCAMDKQsXgykKJActCTiLLQhJDy0LXY8tCnITLQmCly0IlxstC6ebLQq4HzEJzKMxCN0nMQvxpzELBisxChavMQkrMzEIO7cxC0w3NQpguzUJcT81CIXDNQuWQzUKqsc1Cb9LNQjPzzUL4E85CvDTOQoFVzkJGds5CCpfOQs+3zkKT2M5CWPnOQh0az0LhOs9CplvPQmp8z0Ivnc9C9L3PQrjez0J9/89CQiDQQgZB0ELLYdBCj4LQQlSj0EIZxNBC3eTQQqIF0UJmJtFCK0fRQvBn0UK0iNFCeanRQj3K0UIC69FCxwvSQoss0kJQTdJCFG7SQtmO0kKer9JCYtDSQifx0kLsEdNCsDLTQnVT00I5dNNC/pTTQsO100KH1tNCTPfTQhAY1ELVONRCmlnUQl561EIjm9RC57vUQqzc1EJx/dRCNR7VQvo+1UK+X9VCg4DVQkih1UIMwtVC0eLVQpYD1kJaJNZCH0XWQuNl1kKohtZCbafWQjHI1kL26NZCugnXQn8q10JES9dCCGzXQs2M10KRrddCVs7XQhvv10LfD9hCpDDYQmhR2EItcthC8pLYQraz2EJ71NhCP/XYQgQW2ULJNtlCjVfZQlJ42UIXmdlC27nZQqDa2UJk+9lCKRzaQu482kKyXdpCd37aQjuf2kIAwNpCxeDaQokB20JOIttCEkPbQtdj20KchNtCYKXbQiXG20Lp5ttCrgfcQnMo3EI3SdxC/GncQsGK3EKFq9xCSszcQg7t3ELTDd1CmC7dQlxP3UIhcN1C5ZDdQqqx3UJv0t1CM/PdQvgT3kK8NN5CgVXeQkZ23kIKl95Cz7feQpPY3kJY+d5CHRrfQuE630KmW99CanzfQi+d30L0vd9CuN7fQn3/30JCIOBCBkHgQsth4EKPguBCVKPgQhnE4ELd5OBCogXhQmYm4UIrR+FC8GfhQrSI4UJ5qeFCPcrhQgLr4ULHC+JCiyziQlBN4kIUbuJC2Y7iQp6v4kJi0OJCJ/HiQuwR40KwMuNCdVPjQjl040L+lONCw7XjQofW40JM9+NCEBjkQtU45EKaWeRCXnrkQiOb5ELnu+RCrNzkQnH95EI1HuVC+j7lQr5f5UKDgOVCSKHlQgzC5ULR4uVClgPmQlok5kIfReZC42XmQqiG5kJtp+ZCMcjmQvbo5kK6CedCfyrnQkRL50IIbOdCzYznQpGt50JWzudCG+/nQt8P6EKkMOhCaFHoQi1y6ELykuhCtrPoQnvU6EI/9ehCBBbpQsk26UKNV+lCUnjpQheZ6ULbuelCoNrpQmT76UIpHOpC7jzqQrJd6kJ3fupCO5/qQgDA6kLF4OpCiQHrQk4i60ISQ+tC12PrQpyE60JgpetCJcbrQunm60KuB+xCcyjsQjdJ7EL8aexCwYrsQoWr7EJKzOxCDu3sQtMN7UKYLu1CXE/tQiFw7ULlkO1CqrHtQm/S7UIz8+1C+BPuQrw07kKBVe5CRnbuQgqX7kLPt+5Ck9juQlj57kIdGu9C4TrvQqZb70JqfO9CL53vQvS970K43u9Cff/vQkIg8EIGQfBCy2HwQo+C8EJUo/BCGcTwQt3k8EKiBfFCZibxQitH8ULwZ/FCtIjxQnmp8UI9yvFCAuvxQscL8kKLLPJCUE3yQhRu8kLZjvJCnq/yQmLQ8kIn8fJC7BHzQrAy80J1U/NCOXTzQv6U80LDtfNCh9bzQkz380IQGPRC1Tj0QppZ9EJeevRCI5v0Que79EKs3PRCcf30QjUe9UL6PvVCvl/1QoOA9UJIofVCDML1QtHi9UKWA/ZCWiT2Qh9F9kLjZfZCqIb2Qm2n9kIxyPZC9uj2QroJ90J/KvdCREv3Qghs90LNjPdCka33QlbO90Ib7/dC3w/4QqQw+EJoUfhCLXL4QvKS+EK2s/hCe9T4Qj/1+EIEFvlCyTb5Qo1X+UJSePlCF5n5Qtu5+UKg2vlCZPv5Qikc+kLuPPpCsl36Qnd++kI7n/pCAMD6QsXg+kKJAftCTiL7QhJD+0LXY/tCnIT7QmCl+0IlxvtC6eb7Qq4H/EJzKPxCN0n8Qvxp/ELBivxChav8QkrM/EIO7fxC0w39Qpgu/UJcT/1CIXD9QuWQ/UKqsf1Cb9L9QjPz/UL4E/5CvDT+QoFV/kJGdv5CCpf+Qs+3/kKT2P5CWPn+Qh0a/0LhOv9Cplv/Qmp8/0Ivnf9C9L3/Qrje/0J9//9CIRAAQ4MgAEPlMABDSEEAQ6pRAEMMYgBDb3IAQ9GCAEMzkwBDlqMAQ/izAENaxABDvNQAQx/lAEOB9QBD4wUBQ0YWAUOoJgFDCjcBQ21HAUPPVwFDMWgBQ5N4AUP2iAFDWJkBQ7qpAUMdugFDf8oBQ+HaAUNE6wFDpvsBQwgMAkNqHAJDzSwCQy89AkORTQJD9F0CQ1ZuAkO4fgJDG48CQ32fAkPfrwJDQsACQ6TQAkMG4QJDaPECQ8sBA0MtEgND8jIDQ7ZTA0N7dANDP5UDQwS2A0PJ1gNDjfcDQ1IYBEMXOQRD21kEQ6B6BENkmwRDKbwEQ+7cBEOy/QRDdx4FQzs/BUMAYAVDxYAFQ4mhBUNOwgVDEuMFQ9cDBkOcJAZDYEUGQyVmBkPphgZDrqcGQ3PIBkM36QZD/AkHQ8EqB0OFSwdDSmwHQw6NB0PTrQdDmM4HQ1zvB0MhEAhD5TAIQ6pRCENvcghDM5MIQ/izCEO81AhDgfUIQ0YWCUMKNwlDz1cJQ5N4CUNYmQlDHboJQ+HaCUOm+wlDahwKQy89CkP0XQpDuH4KQ32fCkNCwApDBuEKQ8sBC0OPIgtDVEMLQxlkC0PdhAtDoqULQ2bGC0Mr5wtD8AcMQ7QoDEN5SQxDPWoMQwKLDEPHqwxDi8wMQ1DtDEMUDg1D2S4NQ55PDUNicA1DJ5ENQ+yxDUOw0g1DdfMNQzkUDkP+NA5Dw1UOQ4d2DkNMlw5DELgOQ9XYDkOa+Q5DXhoPQyM7D0PnWw9DrHwPQ3GdD0M1vg9D+t4PQ77/D0ODIBBDSEEQQwxiEEPRghBDlqMQQ1rEEEMf5RBD4wURQ6gmEUNtRxFDMWgRQ/aIEUO6qRFDf8oRQ0TrEUMIDBJDzSwSQ5FNEkNWbhJDG48SQ9+vEkOk0BJDaPESQy0SE0PyMhNDtlMTQ3t0E0M/lRNDBLYTQ8nWE0ON9xNDUhgUQxc5FEPbWRRDoHoUQ2SbFEMpvBRD7twUQ7L9FEN3HhVDOz8VQwBgFUPFgBVDiaEVQ07CFUMS4xVD1wMWQ5wkFkNgRRZDJWYWQ+mGFkOupxZDc8gWQzfpFkP8CRdDwSoXQ4VLF0NKbBdDDo0XQ9OtF0OYzhdDXO8XQyEQGEPlMBhDqlEYQ29yGEMzkxhD+LMYQ7zUGEOB9RhDRhYZQwo3GUPPVxlDk3gZQ1iZGUMduhlD4doZQ6b7GUNqHBpDLz0aQ/RdGkO4fhpDfZ8aQ0LAGkMG4RpDywEbQ48iG0NUQxtDGWQbQ92EG0OipRtDZsYbQyvnG0PwBxxDtCgcQ3lJHEM9ahxDAoscQ8erHEOLzBxDUO0cQxQOHUPZLh1Dnk8dQ2JwHUMnkR1D7LEdQ7DSHUN18x1DORQeQ/40HkPDVR5Dh3YeQ0yXHkMQuB5D1dgeQ5r5HkNeGh9DIzsfQ+dbH0OsfB9DcZ0fQzW+H0P63h9Dvv8fQ4MgIENIQSBDDGIgQ9GCIEOWoyBDWsQgQx/lIEPjBSFDqCYhQ21HIUMxaCFD9oghQ7qpIUN/yiFDROshQwgMIkPNLCJDkU0iQ1ZuIkMbjyJD368iQ6TQIkNo8SJDLRIjQ/IyI0O2UyNDe3QjQz+VI0MEtiNDydYjQ433I0NSGCRDFzkkQ9tZJEOgeiRDZJskQym8JEPu3CRDsv0kQ3ceJUM7PyVDAGAlQ8WAJUOJoSVDTsIlQxLjJUPXAyZDnCQmQ2BFJkMlZiZD6YYmQ66nJkNzyCZDN+kmQ/wJJ0PBKidDhUsnQ0psJ0MOjSdD060nQ5jOJ0Nc7ydDIRAoQ+UwKEOqUShDb3IoQzOTKEP4syhDvNQoQ4H1KENGFilDCjcpQ89XKUOTeClDWJkpQx26KUPh2ilDpvspQ2ocKkMvPSpD9F0qQ7h+KkN9nypDQsAqQwbhKkPLAStDjyIrQ1RDK0MZZCtD3YQrQ6KlK0NmxitDK+crQ/AHLEO0KCxDeUksQz1qLEMCiyxDx6ssQ4vMLENQ7SxDFA4tQ9kuLUOeTy1DYnAtQyeRLUPssS1DsNItQ3XzLUM5FC5D/jQuQ8NVLkOHdi5DTJcuQxC4LkPV2C5DmvkuQ14aL0MjOy9D51svQ6x8L0NxnS9DNb4vQ/reL0O+/y9DgyAwQ0hBMEMMYjBD0YIwQ5ajMENaxDBDH+UwQ+MFMUOoJjFDbUcxQzFoMUP2iDFDuqkxQ3/KMUNE6zFDCAwyQ80sMkORTTJDVm4yQxuPMkPfrzJDpNAyQ2jxMkMtEjND8jIzQ7ZTM0N7dDNDP5UzQwS2M0PJ1jNDjfczQ1IYNEMXOTRD21k0Q6B6NENkmzRDKbw0Q+7cNEOy/TRDdx41Qzs/NUMAYDVDxYA1Q4mhNUNOwjVDEuM1Q9cDNkOcJDZDYEU2QyVmNkPphjZDrqc2Q3PINkM36TZD/Ak3Q8EqN0OFSzdDSmw3Qw6NN0PTrTdDmM43Q1zvN0MhEDhD5TA4Q6pROENvcjhDM5M4Q/izOEO81DhDgfU4Q0YWOUMKNzlDz1c5Q5N4OUNYmTlDHbo5Q+HaOUOm+zlDahw6Qy89OkP0XTpDuH46Q32fOkNCwDpDBuE6Q8sBO0OPIjtDVEM7QxlkO0PdhDtDoqU7Q2bGO0Mr5ztD8Ac8Q7QoPEN5STxDPWo8QwKLPEPHqzxDi8w8Q1DtPEMUDj1D2S49Q55PPUNicD1DJ5E9Q+yxPUOw0j1DdfM9QzkUPkP+ND5Dw1U+Q4d2PkNMlz5DELg+Q9XYPkOa+T5DXho/QyM7P0PnWz9DrHw/Q3GdP0M1vj9D+t4/Q77/P0ODIEBDSEFAQwxiQEPRgkBDlqNAQ1rEQEMf5UBD4wVBQ6gmQUNtR0FDMWhBQ/aIQUO6qUFDf8pBQ0TrQUMIDEJDzSxCQ5FNQkNWbkJDG49CQ9+vQkOk0EJDaPFCQy0SQ0PyMkNDtlNDQ3t0Q0M/lUNDBLZDQ8nWQ0ON90NDUhhEQxc5REPbWURDoHpEQ2SbREMpvERD7txEQ7L9REN3HkVDOz9FQwBgRUPFgEVDiaFFQ07CRUMS40VD1wNGQ5wkRkNgRUZDJWZGQ+mGRkOup0ZDc8hGQzfpRkP8CUdDwSpHQ4VLR0NKbEdDDo1HQ9OtR0OYzkdDXO9HQyEQSEPlMEhDqlFIQ29ySEMzk0hD+LNIQ7zUSEOB9UhDRhZJQwo3SUPPV0lDk3hJQ1iZSUMduklD4dpJQ6b7SUNqHEpDLz1KQ/RdSkO4fkpDfZ9KQ0LASkMG4UpDywFLQ48iS0NUQ0tDGWRLQ92ES0OipUtDZsZLQyvnS0PwB0xDtChMQ3lJTEM9akxDAotMQ8erTEOLzExDUO1MQxQOTUPZLk1Dnk9NQ2JwTUMnkU1D7LFNQ7DSTUN1801DORROQ/40TkPDVU5Dh3ZOQ0yXTkMQuE5D1dhOQ5r5TkNeGk9DIztPQ+dbT0OsfE9DcZ1PQzW+T0P63k9Dvv9PQ4MgUENIQVBDDGJQQ9GCUEOWo1BDWsRQQx/lUEPjBVFDqCZRQ21HUUMxaFFD9ohRQ7qpUUN/ylFDROtRQwgMUkPNLFJDkU1SQ1ZuUkMbj1JD369SQ6TQUkNo8VJDLRJTQ/IyU0O2U1NDe3RTQz+VU0MEtlNDydZTQ433U0NSGFRDFzlUQ9tZVEOgelRDZJtUQym8VEPu3FRDsv1UQ3ceVUM7P1VDAGBVQ8WAVUOJoVVDTsJVQxLjVUPXA1ZDnCRWQ2BFVkMlZlZD6YZWQ66nVkNzyFZDN+lWQ/wJV0PBKldDhUtXQ0psV0MOjVdD061XQ5jOV0Nc71dDIRBYQ+UwWEOqUVhDb3JYQzOTWEP4s1hDvNRYQ4H1WENGFllDCjdZQ89XWUOTeFlDWJlZQx26WUPh2llDpvtZQ2ocWkMvPVpD9F1aQ7h+WkN9n1pDQsBaQwbhWkPLAVtDjyJbQ1RDW0MZZFtD3YRbQ6KlW0NmxltDK+dbQ/AHXEO0KFxDeUlcQz1qXEMCi1xDx6tcQ4vMXENQ7VxDFA5dQ9kuXUOeT11DYnBdQyeRXUPssV1DsNJdQ3XzXUM5FF5D/jReQ8NVXkOHdl5DTJdeQxC4XkPV2F5DmvleQ14aX0MjO19D51tfQ6x8X0NxnV9DNb5fQ/reX0O+/19DgyBgQ0hBYEMMYmBD0YJgQ5ajYENaxGBDH+VgQ+MFYUOoJmFDbUdhQzFoYUP2iGFDuqlhQ3/KYUNE62FDCAxiQ80sYkORTWJDVm5iQxuPYkPfr2JDpNBiQ2jxYkMtEmND8jJjQ7ZTY0N7dGNDP5VjQwS2Y0PJ1mNDjfdjQ1IYZEMXOWRD21lkQ6B6ZENkm2RDKbxkQ+7cZEOy/WRDdx5lQzs/ZUMAYGVDxYBlQ4mhZUNOwmVDEuNlQ9cDZkOcJGZDYEVmQyVmZkPphmZDrqdmQ3PIZkM36WZD/AlnQ8EqZ0OFS2dDSmxnQw6NZ0PTrWdDmM5nQ1zvZ0MhEGhD5TBoQ6pRaENvcmhDM5NoQ/izaEO81GhDgfVoQ0YWaUMKN2lDz1dpQ5N4aUNYmWlDHbppQ+HaaUOm+2lDahxqQy89akP0XWpDuH5qQ32fakNCwGpDBuFqQ8sBa0OPImtDVENrQxlka0PdhGtDoqVrQ2bGa0Mr52tD8AdsQ7QobEN5SWxDPWpsQwKLbEPHq2xDi8xsQ1DtbEMUDm1D2S5tQ55PbUNicG1DJ5FtQ+yxbUOw0m1DdfNtQzkUbkP+NG5Dw1VuQ4d2bkNMl25DELhuQ9XYbkOa+W5DXhpvQyM7b0PnW29DrHxvQ3Gdb0M1vm9D+t5vQ77/b0ODIHBDSEFwQwxicEPRgnBDlqNwQ1rEcEMf5XBD4wVxQ6gmcUNtR3FDMWhxQ/aIcUO6qXFDf8pxQ0TrcUMIDHJDzSxyQ5FNckNWbnJDG49yQ9+vckOk0HJDaPFyQy0Sc0PyMnNDtlNzQ3t0c0M/lXNDBLZzQ8nWc0ON93NDUhh0Qxc5dEPbWXRDoHp0Q2SbdEMpvHRD7tx0Q7L9dEN3HnVDOz91QwBgdUPFgHVDiaF1Q07CdUMS43VD1wN2Q5wkdkNgRXZDJWZ2Q+mGdkOup3ZDc8h2QzfpdkP8CXdDwSp3Q4VLd0NKbHdDDo13Q+UweEO81HhDWJl5Q/RdekOPIntDZsZ7QwKLfEOeT31DORR+QxC4fkOsfH9DpCCAQ/KCgEM/5YBDKzeBQ3mZgUPH+4FDFF6CQwCwgkNOEoNDnHSDQ+nWg0M3OYRDhZuEQ9P9hEMhYIVDqqGFQ/gDhkNGZoZDk8iGQ+Eqh0MvjYdDfe+HQ8tRiEMZtIhDovWIQ/BXiUM9uolDixyKQ9l+ikMn4YpDdUOLQ8Oli0MQCIxDmkmMQ+erjEM1Do1Dg3CNQ9HSjUMfNY5DbZeOQ7r5jkNEO49DkZ2PQ9//j0MtYpBDe8SQQ8kmkUMXiZFDZOuRQ7JNkkM7j5JDifGSQ9dTk0MltpNDcxiUQ8F6lEMO3ZRDXD+VQ+WAlUMz45VDgUWWQ8+nlkMdCpdDamyXQ7jOl0MGMZhDVJOYQ93UmEMrN5lDeZmZQ8f7mUMUXppDYsCaQ7Aim0P+hJtDh8abQ9UonEMji5xDce2cQ75PnUMMsp1DWhSeQ6h2nkNSaKFDhZukQ/Stp0Mn4apDWhSuQ41HsUP8WbRDL423Q2LAukNWvr9D"},"counts":{"dtype":"<u4","b64":"CAAAACwAAAAtAAAALQAAACwAAAAtAAAALQAAACwAAAAtAAAALQAAACwAAAAtAAAALQAAACwAAAAtAAAALQAAACwAAABaAAAAWQAAAFkAAABZAAAAWgAAAFkAAABZAAAAWgAAAFkAAABZAAAAWgAAAFkAAABZAAAAWgAAAFkAAABZAAAAWgAAAFkAAABZAAAAWgAAAFkAAABZAAAAWQAAAFoAAABZAAAAWQAAAFoAAABZAAAAWQAAAFoAAABZAAAAWQAAAFoAAABZAAAAWQAAAFoAAABZAAAAWQAAAFoAAABZAAAAWQAAAFkAAABaAAAAWQAAAFkAAABaAAAAWQAAAFkAAABaAAAAWQAAAFkAAABaAAAAWQAAAFkAAABaAAAAWQAAAFkAAABaAAAAWQAAAFkAAABZAAAAWgAAAFkAAABZAAAAWgAAAFkAAABZAAAAWgAAAFkAAABZAAAAWgAAAFkAAABZAAAAWgAAAFkAAABZAAAAWgAAAFkAAABZAAAAWQAAAFoAAABZAAAAWQAAAFoAAABZAAAAWQAAAFoAAABZAAAAWQAAAFoAAABZAAAAWQAAAFoAAABZAAAAWQAAAFoAAABZAAAAWQAAAFkAAABaAAAAWQAAAFkAAABaAAAAWQAAAFkAAABaAAAAWQAAAFkAAABaAAAAWQAAAFkAAABaAAAAWQAAAFkAAABaAAAAWQAAAFkAAABZAAAAWgAAAFkAAABZAAAAWgAAAFkAAABZAAAAWgAAAFkAAABZAAAAWgAAAFkAAABZAAAAWgAAAFkAAABZAAAAWgAAAFkAAABZAAAAWQAAAFoAAABZAAAAWQAAAFoAAABZAAAAWQAAAFoAAABZAAAAWQAAAFoAAABZAAAAWQAAAFoAAABZAAAAWQAAAFoAAABZAAAAWQAAAFkAAABaAAAAWQAAAFkAAABaAAAAWQAAAFkAAABaAAAAWQAAAFkAAABaAAAAWQAAAFkAAABaAAAAWQAAAFkAAABaAAAAWQAAAFkAAABaAAAAWQAAAFkAAABZAAAAWgAAAFkAAABZAAAAWgAAAFkAAABZAAAAWgAAAFkAAABZAAAAWgAAAFkAAABZAAAAWgAAAFkAAABZAAAAWgAAAFkAAABZAAAAWQAAAFoAAABZAAAAWQAAAFoAAABZAAAAWQAAAFoAAABZAAAAWQAAAFoAAABZAAAAWQAAAFoAAABZAAAAWQAAAFoAAABZAAAAWQAAAFkAAABaAAAAWQAAAFkAAABaAAAAWQAAAFkAAABaAAAAWQAAAFkAAABaAAAAWQAAAFkAAABaAAAAWQAAAFkAAABaAAAAWQAAAFkAAABZAAAAWgAAAFkAAABZAAAAWgAAAFkAAABZAAAAWgAAAFkAAABZAAAAWgAAAFkAAABZAAAAWgAAAFkAAABZAAAAWgAAAFkAAABZAAAAWQAAAFoAAABZAAAAWQAAAFoAAABZAAAAWQAAAFoAAABZAAAAWQAAAFoAAABZAAAAWQAAAFoAAABZAAAAWQAAAFoAAABZAAAAWQAAAFkAAABaAAAAWQAAAFkAAABaAAAAWQAAAFkAAABaAAAAWQAAAFkAAABaAAAAXgAAAP0CAAD9AgAA/QIAAPwCAAD9AgAA/QIAAP0CAAD9AgAA/QIAAPwCAAD9AgAA/QIAAP0CAAD9AgAA/AIAAP0CAAD9AgAA/QIAAP0CAAD8AgAA/QIAAP0CAAD9AgAA/QIAAP0CAAD8AgAA/QIAAP0CAAD9AgAA/QIAAPwCAAD9AgAA/QIAAP0CAACpAAAAZQAAAGUAAABlAAAAZgAAAGUAAABlAAAAZgAAAGUAAABlAAAAZgAAAGUAAABlAAAAZQAAAGYAAABlAAAAZQAAAGYAAABlAAAAZQAAAGYAAABlAAAAZQAAAGUAAABmAAAAZQAAAGUAAABmAAAAZQAAAGUAAABmAAAAZQAAAGUAAABmAAAAZQAAAGUAAABlAAAAZgAAAGUAAABlAAAAZgAAAGUAAABlAAAAZgAAAGUAAABlAAAAZQAAAGYAAABlAAAAZQAAAGYAAABlAAAAZQAAAGYAAABlAAAAZQAAAGYAAABlAAAAZQAAAGUAAABmAAAAZQAAAGUAAABmAAAAZQAAAGUAAABmAAAAZQAAAGUAAABlAAAAZgAAAGUAAABlAAAAZgAAAGUAAABlAAAAZgAAAGUAAABlAAAAZQAAAGYAAABlAAAAZQAAAGYAAABlAAAAZQAAAGYAAABlAAAAZQAAAGYAAABlAAAAZQAAAGUAAABmAAAAZQAAAGUAAABmAAAAZQAAAGUAAABmAAAAZQAAAGUAAABlAAAAZgAAAGUAAABlAAAAZgAAAGUAAABlAAAAZgAAAGUAAABlAAAAZgAAAGUAAABlAAAAZQAAAGYAAABlAAAAZQAAAGYAAABlAAAAZQAAAGYAAABlAAAAZQAAAGUAAABmAAAAZQAAAGUAAABmAAAAZQAAAGUAAABmAAAAZQAAAGUAAABlAAAAZgAAAGUAAABlAAAAZgAAAGUAAABlAAAAZgAAAGUAAABlAAAAZgAAAGUAAABlAAAAZQAAAGYAAABlAAAAZQAAAGYAAABlAAAAZQAAAGYAAABlAAAAZQAAAGUAAABmAAAAZQAAAGUAAABmAAAAZQAAAGUAAABmAAAAZQAAAGUAAABmAAAAZQAAAGUAAABlAAAAZgAAAGUAAABlAAAAZgAAAGUAAABlAAAAZgAAAGUAAABlAAAAZQAAAGYAAABlAAAAZQAAAGYAAABlAAAAZQAAAGYAAABlAAAAZQAAAGUAAABmAAAAZQAAAGUAAABmAAAAZQAAAGUAAABmAAAAZQAAAGUAAABmAAAAZQAAAGUAAABlAAAAZgAAAGUAAABlAAAAZgAAAGUAAABlAAAAZgAAAGUAAABlAAAAZQAAAGYAAABlAAAAZQAAAGYAAABlAAAAZQAAAGYAAABlAAAAZQAAAGYAAABlAAAAZQAAAGUAAABmAAAAZQAAAGUAAABmAAAAZQAAAGUAAABmAAAAZQAAAGUAAABlAAAAZgAAAGUAAABlAAAAZgAAAGUAAABlAAAAZgAAAGUAAABlAAAAZQAAAGYAAABlAAAAZQAAAGYAAABlAAAAZQAAAGYAAABlAAAAZQAAAG0AAAB4AAAAeQAAAHgAAAB5AAAAeAAAAHkAAAB4AAAAeQAAAHgAAAB5AAAAeAAAAHkAAAB4AAAAeQAAAHgAAAB5AAAAeAAAAHkAAAB4AAAAeQAAAHgAAAB5AAAAeAAAAHkAAAB4AAAAeQAAAHgAAAB5AAAAeAAAAHkAAAB4AAAAeQAAAHgAAAB5AAAAeAAAAHgAAAB5AAAAeAAAAHkAAAB4AAAAeQAAAHgAAAB5AAAAeAAAAHkAAAB4AAAAeQAAAHgAAAB5AAAAeAAAAHkAAAB4AAAAeQAAAHgAAAB5AAAAeAAAAHkAAAB4AAAAeQAAAHgAAAB5AAAAeAAAAHkAAAB4AAAAeQAAAHgAAAB5AAAAeAAAAHkAAAB4AAAAeQAAAHgAAAB5AAAAeAAAAHkAAAB4AAAAeQAAAHgAAAB5AAAAeAAAAHkAAAB4AAAAeQAAAHgAAAB4AAAAeQAAAHgAAAB5AAAAeAAAAHkAAAB4AAAAeQAAAHgAAAB5AAAAeAAAAHkAAAB4AAAAeQAAAHgAAAB5AAAAeAAAAHkAAAB4AAAAeQAAAHgAAAB5AAAAeAAAAHkAAAB4AAAAeQAAAHgAAAB5AAAAeAAAAHkAAAB4AAAAeQAAAHgAAAB5AAAAeAAAAHkAAAB4AAAAeQAAAHgAAAB5AAAAeAAAAHkAAAB4AAAAeQAAAHgAAABEAAAACQAAAAoAAAAJAAAACgAAAAkAAAAKAAAACgAAAAkAAAAKAAAACQAAAAoAAAAJAAAACgAAAAkAAAAKAAAACgAAAAkAAAAKAAAACQAAAAoAAAAJAAAACgAAAAkAAAAKAAAACgAAAAkAAAAKAAAACQAAAAoAAAAJAAAACgAAAAkAAAAKAAAACgAAAAkAAAAKAAAACQAAAAoAAAAJAAAACgAAAAkAAAAKAAAACgAAAAkAAAAKAAAACQAAAAoAAAAJAAAACgAAAAoAAAAJAAAACgAAAAkAAAAKAAAACQAAAAoAAAAJAAAACgAAAAoAAAAJAAAACgAAAAkAAAAKAAAACQAAAAoAAAAJAAAACgAAAAoAAAAJAAAACgAAAAkAAAAKAAAACQAAAAoAAAAJAAAACgAAAAoAAAAJAAAACgAAAAkAAAAKAAAACQAAAAoAAAAJAAAACgAAAAoAAAAJAAAACgAAAAkAAAAKAAAACQAAAAoAAAAJAAAACgAAAAoAAAAJAAAACgAAAAkAAAAKAAAACQAAAAoAAAAJAAAACgAAAAoAAAAJAAAACgAAAAkAAAAKAAAACQAAAAoAAAAKAAAACQAAAAoAAAAJAAAACgAAAAkAAAAKAAAACQAAAAoAAAAKAAAACQAAAAoAAAAJAAAACgAAAAkAAAAKAAAACQAAAAoAAAAKAAAACQAAAAoAAAAJAAAACgAAAAkAAAAKAAAACQAAAAoAAAAKAAAACQAAAAoAAAAJAAAACgAAAAkAAAAKAAAACQAAAAoAAAAKAAAACQAAAAoAAAAJAAAACgAAAAkAAAAKAAAACQAAAAoAAAAKAAAACQAAAAoAAAAJAAAACgAAAAkAAAAKAAAACQAAAAoAAAAKAAAACQAAAAoAAAAJAAAACgAAAAkAAAAKAAAACQAAAAoAAAAKAAAACQAAAAoAAAAJAAAACgAAAAkAAAAKAAAACgAAAAkAAAAKAAAACQAAAAoAAAAJAAAACgAAAAkAAAAKAAAACgAAAAkAAAAKAAAACQAAAAoAAAAJAAAACgAAAAkAAAAKAAAACgAAAAkAAAAKAAAACQAAAAoAAAAJAAAACgAAAAkAAAAKAAAACgAAAAkAAAAKAAAACQAAAAoAAAAJAAAACgAAAAkAAAAKAAAACgAAAAkAAAAKAAAACQAAAAoAAAAJAAAACgAAAAkAAAAKAAAACgAAAAkAAAAKAAAACQAAAAoAAAAJAAAACgAAAAkAAAAKAAAACgAAAAkAAAAKAAAACQAAAAoAAAAJAAAACgAAAAkAAAAKAAAACgAAAAkAAAAKAAAACQAAAAoAAAAJAAAACgAAAAoAAAAJAAAACgAAAAkAAAAKAAAACQAAAAoAAAAJAAAACgAAAAoAAAAJAAAACgAAAAkAAAAKAAAACQAAAAoAAAAJAAAACgAAAAoAAAAJAAAACgAAAAkAAAAKAAAACQAAAAoAAAAJAAAACgAAAAoAAAAJAAAACgAAAAkAAAAKAAAACQAAAAoAAAAJAAAACgAAAAoAAAAJAAAACgAAAAkAAAAKAAAACQAAAAoAAAAJAAAACgAAAAoAAAAJAAAACgAAAAkAAAAKAAAACQAAAAoAAAAJAAAACgAAAAoAAAAJAAAACgAAAAkAAAAKAAAACQAAAAoAAAAJAAAACgAAAAoAAAAJAAAACgAAAAkAAAAKAAAAEwAAABMAAAATAAAAEwAAABMAAAAUAAAAEwAAABMAAAATAAAAEwAAABMAAAATAAAAEwAAABMAAAAUAAAAEwAAABMAAAATAAAAEwAAABMAAAATAAAAEwAAABMAAAAUAAAAEwAAABMAAAATAAAAEwAAABMAAAATAAAAEwAAABMAAAAUAAAAEwAAABMAAAATAAAAEwAAABMAAAATAAAAEwAAABQAAAATAAAAEwAAABMAAAATAAAAEwAAABMAAAATAAAAEwAAABQAAAATAAAAEwAAABMAAAATAAAAEwAAABMAAAATAAAAEwAAABQAAAATAAAAEwAAABMAAAATAAAAEwAAABMAAAATAAAAEwAAABQAAAATAAAAEwAAABMAAAATAAAAEwAAABMAAAATAAAAFAAAABMAAAATAAAAEwAAABMAAAATAAAAEwAAABMAAAATAAAAFAAAABMAAAATAAAAEwAAABMAAAATAAAAEwAAABMAAAATAAAAFAAAABMAAAATAAAAEwAAABMAAAATAAAAEwAAABMAAAATAAAAFAAAABMAAAATAAAAEwAAABMAAAATAAAAEwAAABMAAAAUAAAAEwAAABMAAAATAAAAEwAAABMAAAATAAAAEwAAABMAAAAUAAAAEwAAABMAAAATAAAAEwAAABMAAAATAAAAEwAAABMAAAAUAAAAEwAAABMAAAATAAAAEwAAABMAAAATAAAAEwAAABMAAAAUAAAAEwAAABMAAAATAAAAEwAAABMAAAATAAAAEwAAABQAAAATAAAAEwAAABMAAAATAAAAEwAAABMAAAATAAAAEwAAABQAAAATAAAAEwAAABMAAAATAAAAEwAAABMAAAATAAAAEwAAABQAAAATAAAAEwAAABMAAAATAAAAEwAAABMAAAATAAAAEwAAABQAAAATAAAAEwAAABMAAAATAAAAEwAAABMAAAATAAAAFAAAABMAAAATAAAAEwAAABMAAAATAAAAEwAAABMAAAATAAAAFAAAABMAAAATAAAAEwAAABMAAAATAAAAEwAAABMAAAATAAAAFAAAABMAAAATAAAAEwAAABMAAAATAAAAEwAAABMAAAAUAAAAEwAAABMAAAATAAAAEwAAABMAAAATAAAAEwAAABMAAAAUAAAAEwAAABMAAAATAAAAEwAAABMAAAATAAAAEwAAABMAAAAUAAAAEwAAABMAAAATAAAAEwAAABMAAAATAAAAEwAAABMAAAAUAAAAEwAAABMAAAATAAAAEwAAABMAAAATAAAAEwAAABQAAAATAAAAEwAAABMAAAATAAAAEwAAABMAAAATAAAAEwAAABQAAAATAAAAEwAAABMAAAATAAAAEwAAABMAAAATAAAAEwAAABQAAAATAAAAEwAAABMAAAATAAAAEwAAABMAAAATAAAAEwAAABQAAAATAAAAEwAAABMAAAATAAAAEwAAABMAAAATAAAAFAAAABMAAAATAAAAEwAAABMAAAATAAAAEwAAABMAAAATAAAAFAAAABMAAAATAAAAEwAAABMAAAATAAAAEwAAABMAAAATAAAAFAAAABMAAAATAAAAEwAAABMAAAATAAAAEwAAABMAAAATAAAAFAAAABMAAAATAAAAEwAAABMAAAATAAAAEwAAABMAAAAUAAAAEwAAABMAAAATAAAAEwAAABMAAAATAAAAEwAAABMAAAAUAAAAEwAAABMAAAATAAAAEwAAABMAAAATAAAAEwAAABMAAAAUAAAAEwAAABMAAAADAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAABAAAAAgAAAAIAAAABAAAAAgAAAAIAAAABAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAABAAAAAgAAAAIAAAABAAAAAgAAAAIAAAABAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAABAAAAAgAAAAIAAAABAAAAAgAAAAIAAAABAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAABAAAAAgAAAAIAAAABAAAAAgAAAAIAAAABAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAABAAAAAgAAAAIAAAABAAAAAgAAAAIAAAABAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAABAAAAAgAAAAIAAAABAAAAAgAAAAIAAAABAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAABAAAAAgAAAAIAAAABAAAAAgAAAAIAAAABAAAAAgAAAAIAAAABAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAABAAAAAgAAAAIAAAABAAAAAgAAAAIAAAABAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAABAAAAAgAAAAIAAAABAAAAAgAAAAIAAAABAAAAAgAAAAIAAAABAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAABAAAAAgAAAAIAAAABAAAAAgAAAAIAAAABAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAABAAAAAgAAAAIAAAABAAAAAgAAAAIAAAABAAAAAgAAAAIAAAABAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAABAAAAAgAAAAIAAAABAAAAAgAAAAIAAAABAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAABAAAAAgAAAAIAAAABAAAAAgAAAAIAAAABAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAABAAAAAgAAAAIAAAABAAAAAgAAAAIAAAABAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAABAAAAAgAAAAIAAAABAAAAAgAAAAIAAAABAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAABAAAAAgAAAAIAAAABAAAAAgAAAAIAAAABAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAABAAAAAgAAAAIAAAABAAAAAgAAAAIAAAABAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAABAAAAAgAAAAIAAAABAAAAAgAAAAIAAAABAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAABAAAAAgAAAAIAAAABAAAAAgAAAAIAAAABAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAABAAAAAgAAAAIAAAABAAAAAgAAAAIAAAABAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAABAAAAAgAAAAIAAAABAAAAAgAAAAIAAAABAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAABAAAAAgAAAAIAAAABAAAAAgAAAAIAAAABAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAABAAAAAgAAAAIAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAA"}},"source":"summary"},{"label":"Ping-Pong (1472B)","metrics":{"filename":"sockperf_pingpong_1472B.txt","version":"3.7-no.git","protocol":"UDP","target_ip":"192.168.1.3","target_port":11111,"run_time_sec":20.0,"warmup_msec":400.0,"sent_messages":76036,"received_messages":76035,"packet_loss_pct":0.001315166500082121,"avg_latency_us":131.392,"std_dev_us":21.953,"jitter_us":21.953,"min_latency_us":110.71,"max_latency_us":1251.222,"total_observations":74372,"percentiles":{"99.999":603.56,"99.99":426.706,"99.9":301.62,"99.0":219.864,"90.0":158.09,"75.0":127.52,"50.0":123.619,"25.0":122.139},"valid_sent":74372,"valid_received":74372,"errors":[],"test_type":"ping-pong","msg_size":1472,"topology":"dual","run_date":"2025-11-05"},"histogram":{"digits":3,"count":74372,"mean_us":131.392,"std_dev_us":21.953,"min_us":110.71,"max_us":1251.222,"upper_us":{"dtype":"<f4","b64":"IXDdQuWQ3UKqsd1Cb9LdQjPz3UL4E95CvDTeQoFV3kJGdt5CCpfeQs+33kKT2N5CWPneQh0a30LhOt9CplvfQmp830Ivnd9C9L3fQrje30J9/99CQiDgQgZB4ELLYeBCj4LgQlSj4EIZxOBC3eTgQqIF4UJmJuFCK0fhQvBn4UK0iOFCeanhQj3K4UIC6+FCxwviQoss4kJQTeJCFG7iQtmO4kKer+JCYtDiQifx4kLsEeNCsDLjQnVT40I5dONC/pTjQsO140KH1uNCTPfjQhAY5ELVOORCmlnkQl565EIjm+RC57vkQqzc5EJx/eRCNR7lQvo+5UK+X+VCg4DlQkih5UIMwuVC0eLlQpYD5kJaJOZCH0XmQuNl5kKohuZCbafmQjHI5kL26OZCugnnQn8q50JES+dCCGznQs2M50KRredCVs7nQhvv50LfD+hCpDDoQmhR6EItcuhC8pLoQraz6EJ71OhCP/XoQgQW6ULJNulCjVfpQlJ46UIXmelC27npQqDa6UJk++lCKRzqQu486kKyXepCd37qQjuf6kIAwOpCxeDqQokB60JOIutCEkPrQtdj60KchOtCYKXrQiXG60Lp5utCrgfsQnMo7EI3SexC/GnsQsGK7EKFq+xCSszsQg7t7ELTDe1CmC7tQlxP7UIhcO1C5ZDtQqqx7UJv0u1CM/PtQvgT7kK8NO5CgVXuQkZ27kIKl+5Cz7fuQpPY7kJY+e5CHRrvQuE670KmW+9CanzvQi+d70L0ve9CuN7vQn3/70JCIPBCBkHwQsth8EKPgvBCVKPwQhnE8ELd5PBCogXxQmYm8UIrR/FC8GfxQrSI8UJ5qfFCPcrxQgLr8ULHC/JCiyzyQlBN8kIUbvJC2Y7yQp6v8kJi0PJCJ/HyQuwR80KwMvNCdVPzQjl080L+lPNCw7XzQofW80JM9/NCEBj0QtU49EKaWfRCXnr0QiOb9ELnu/RCrNz0QnH99EI1HvVC+j71Qr5f9UKDgPVCSKH1QgzC9ULR4vVClgP2Qlok9kIfRfZC42X2QqiG9kJtp/ZCMcj2Qvbo9kK6CfdCfyr3QkRL90IIbPdCzYz3QpGt90JWzvdCG+/3Qt8P+EKkMPhCaFH4Qi1y+ELykvhCtrP4QnvU+EI/9fhCBBb5Qsk2+UKNV/lCUnj5QheZ+ULbuflCoNr5QmT7+UIpHPpC7jz6QrJd+kJ3fvpCO5/6QgDA+kLF4PpCiQH7Qk4i+0ISQ/tC12P7QpyE+0JgpftCJcb7Qunm+0KuB/xCcyj8QjdJ/EL8afxCwYr8QoWr/EJKzPxCDu38QtMN/UKYLv1CXE/9QiFw/ULlkP1CqrH9Qm/S/UIz8/1C+BP+Qrw0/kKBVf5CRnb+QgqX/kLPt/5Ck9j+Qlj5/kIdGv9C4Tr/QqZb/0JqfP9CL53/QvS9/0K43v9Cff//QiEQAEODIABD5TAAQ0hBAEOqUQBDDGIAQ29yAEPRggBDM5MAQ5ajAEP4swBDWsQAQ7zUAEMf5QBDgfUAQ+MFAUNGFgFDqCYBQwo3AUNtRwFDz1cBQzFoAUOTeAFD9ogBQ1iZAUO6qQFDHboBQ3/KAUPh2gFDROsBQ6b7AUMIDAJDahwCQ80sAkMvPQJDkU0CQ/RdAkNWbgJDuH4CQxuPAkN9nwJD368CQ0LAAkOk0AJDBuECQ2jxAkPLAQNDLRIDQ/IyA0O2UwNDe3QDQz+VA0MEtgNDydYDQ433A0NSGARDFzkEQ9tZBEOgegRDZJsEQym8BEPu3ARDsv0EQ3ceBUM7PwVDAGAFQ8WABUOJoQVDTsIFQxLjBUPXAwZDnCQGQ2BFBkMlZgZD6YYGQ66nBkNzyAZDN+kGQ/wJB0PBKgdDhUsHQ0psB0MOjQdD060HQ5jOB0Nc7wdDIRAIQ+UwCEOqUQhDb3IIQzOTCEP4swhDvNQIQ4H1CENGFglDCjcJQ89XCUOTeAlDWJkJQx26CUPh2glDpvsJQ2ocCkMvPQpD9F0KQ7h+CkN9nwpDQsAKQwbhCkPLAQtDjyILQ1RDC0MZZAtD3YQLQ6KlC0NmxgtDK+cLQ/AHDEO0KAxDeUkMQz1qDEMCiwxDx6sMQ4vMDENQ7QxDFA4NQ9kuDUOeTw1DYnANQyeRDUPssQ1DsNINQ3XzDUM5FA5D/jQOQ8NVDkOHdg5DTJcOQxC4DkPV2A5DmvkOQ14aD0MjOw9D51sPQ6x8D0NxnQ9DNb4PQ/reD0O+/w9DgyAQQ0hBEEMMYhBD0YIQQ5ajEENaxBBDH+UQQ+MFEUOoJhFDbUcRQzFoEUP2iBFDuqkRQ3/KEUNE6xFDCAwSQ80sEkORTRJDVm4SQxuPEkPfrxJDpNASQ2jxEkMtEhND8jITQ7ZTE0N7dBNDP5UTQwS2E0PJ1hNDjfcTQ1IYFEMXORRD21kUQ6B6FENkmxRDKbwUQ+7cFEOy/RRDdx4VQzs/FUMAYBVDxYAVQ4mhFUNOwhVDEuMVQ9cDFkOcJBZDYEUWQyVmFkPphhZDrqcWQ3PIFkM36RZD/AkXQ8EqF0OFSxdDSmwXQw6NF0PTrRdDmM4XQ1zvF0MhEBhD5TAYQ6pRGENvchhDM5MYQ/izGEO81BhDgfUYQ0YWGUMKNxlDz1cZQ5N4GUNYmRlDHboZQ+HaGUOm+xlDahwaQy89GkP0XRpDuH4aQ32fGkNCwBpDBuEaQ8sBG0OPIhtDVEMbQxlkG0PdhBtDoqUbQ2bGG0Mr5xtD8AccQ7QoHEN5SRxDPWocQwKLHEPHqxxDi8wcQ1DtHEMUDh1D2S4dQ55PHUNicB1DJ5EdQ+yxHUOw0h1DdfMdQzkUHkP+NB5Dw1UeQ4d2HkNMlx5DELgeQ9XYHkOa+R5DXhofQyM7H0PnWx9DrHwfQ3GdH0M1vh9D+t4fQ77/H0ODICBDSEEgQwxiIEPRgiBDlqMgQ1rEIEMf5SBD4wUhQ6gmIUNtRyFDMWghQ/aIIUO6qSFDf8ohQ0TrIUMIDCJDzSwiQ5FNIkNWbiJDG48iQ9+vIkOk0CJDaPEiQy0SI0PyMiNDtlMjQ3t0I0M/lSNDBLYjQ8nWI0ON9yNDUhgkQxc5JEPbWSRDoHokQ2SbJEMpvCRD7twkQ7L9JEN3HiVDOz8lQwBgJUPFgCVDiaElQ07CJUMS4yVD1wMmQ5wkJkNgRSZDJWYmQ+mGJkOupyZDc8gmQzfpJkP8CSdDwSonQ4VLJ0NKbCdDDo0nQ9OtJ0OYzidDXO8nQyEQKEPlMChDqlEoQ29yKEMzkyhD+LMoQ7zUKEOB9ShDRhYpQwo3KUPPVylDk3gpQ1iZKUMduilD4dopQ6b7KUNqHCpDLz0qQ/RdKkO4fipDfZ8qQ0LAKkMG4SpDywErQ48iK0NUQytDGWQrQ92EK0OipStDZsYrQyvnK0PwByxDtCgsQ3lJLEM9aixDAossQ8erLEOLzCxDUO0sQxQOLUPZLi1Dnk8tQ2JwLUMnkS1D7LEtQ7DSLUN18y1DORQuQ/40LkPDVS5Dh3YuQ0yXLkMQuC5D1dguQ5r5LkNeGi9DIzsvQ+dbL0OsfC9DcZ0vQzW+L0P63i9Dvv8vQ4MgMENIQTBDDGIwQ9GCMEOWozBDWsQwQx/lMEPjBTFDqCYxQ21HMUMxaDFD9ogxQ7qpMUN/yjFDROsxQwgMMkPNLDJDkU0yQ1ZuMkMbjzJD368yQ6TQMkNo8TJDLRIzQ/IyM0O2UzNDe3QzQz+VM0MEtjNDydYzQ433M0NSGDRDFzk0Q9tZNEOgejRDZJs0Qym8NEPu3DRDsv00Q3ceNUM7PzVDAGA1Q8WANUOJoTVDTsI1QxLjNUPXAzZDnCQ2Q2BFNkMlZjZD6YY2Q66nNkNzyDZDN+k2Q/wJN0PBKjdDhUs3Q0psN0MOjTdD0603Q5jON0Nc7zdDIRA4Q+UwOEOqUThDb3I4QzOTOEP4szhDvNQ4Q4H1OENGFjlDCjc5Q89XOUOTeDlDWJk5Qx26OUPh2jlDpvs5Q2ocOkMvPTpD9F06Q7h+OkN9nzpDQsA6QwbhOkPLATtDjyI7Q1RDO0MZZDtD3YQ7Q6KlO0NmxjtDK+c7Q/AHPEO0KDxDeUk8Qz1qPEMCizxDx6s8Q4vMPENQ7TxDFA49Q9kuPUOeTz1DYnA9QyeRPUPssT1DsNI9Q3XzPUM5FD5D/jQ+Q8NVPkOHdj5DTJc+QxC4PkPV2D5Dmvk+Q14aP0MjOz9D51s/Q6x8P0NxnT9DNb4/Q/reP0O+/z9DgyBAQ0hBQEMMYkBD0YJAQ5ajQENaxEBDH+VAQ+MFQUOoJkFDbUdBQzFoQUP2iEFDuqlBQ3/KQUNE60FDCAxCQ80sQkORTUJDVm5CQxuPQkPfr0JDpNBCQ2jxQkMtEkND8jJDQ7ZTQ0N7dENDP5VDQwS2Q0PJ1kNDjfdDQ1IYREMXOURD21lEQ6B6RENkm0RDKbxEQ+7cREOy/URDdx5FQzs/RUMAYEVDxYBFQ4mhRUNOwkVDEuNFQ9cDRkOcJEZDYEVGQyVmRkPphkZDrqdGQ3PIRkM36UZD/AlHQ8EqR0OFS0dDSmxHQw6NR0PTrUdDmM5HQ1zvR0MhEEhD5TBIQ6pRSENvckhDM5NIQ/izSEO81EhDgfVIQ0YWSUMKN0lDz1dJQ5N4SUNYmUlDHbpJQ+HaSUOm+0lDahxKQy89SkP0XUpDuH5KQ32fSkNCwEpDBuFKQ8sBS0OPIktDVENLQxlkS0PdhEtDoqVLQ2bGS0Mr50tD8AdMQ7QoTEN5SUxDPWpMQwKLTEPHq0xDi8xMQ1DtTEMUDk1D2S5NQ55PTUNicE1DJ5FNQ+yxTUOw0k1DdfNNQzkUTkP+NE5Dw1VOQ4d2TkNMl05DELhOQ9XYTkOa+U5DXhpPQyM7T0PnW09DrHxPQ3GdT0M1vk9D+t5PQ77/T0ODIFBDSEFQQwxiUEPRglBDlqNQQ1rEUEMf5VBD4wVRQ6gmUUNtR1FDMWhRQ/aIUUO6qVFDf8pRQ0TrUUMIDFJDzSxSQ5FNUkNWblJDG49SQ9+vUkOk0FJDaPFSQy0SU0PyMlNDtlNTQ3t0U0M/lVNDBLZTQ8nWU0ON91NDUhhUQxc5VEPbWVRDoHpUQ2SbVEMpvFRD7txUQ7L9VEN3HlVDOz9VQwBgVUPFgFVDiaFVQ07CVUMS41VD1wNWQ5wkVkNgRVZDJWZWQ+mGVkOup1ZDc8hWQzfpVkP8CVdDwSpXQ4VLV0NKbFdDDo1XQ9OtV0OYzldDXO9XQyEQWEPlMFhDqlFYQ29yWEMzk1hD+LNYQ7zUWEOB9VhDRhZZQwo3WUPPV1lDk3hZQ1iZWUMdullD4dpZQ6b7WUNqHFpDLz1aQ/RdWkO4flpDfZ9aQ0LAWkMG4VpDywFbQ48iW0NUQ1tDGWRbQ92EW0OipVtDZsZbQyvnW0PwB1xDtChcQ3lJXEM9alxDAotcQ8erXEOLzFxDUO1cQxQOXUPZLl1Dnk9dQ2JwXUMnkV1D7LFdQ7DSXUN1811DORReQ/40XkPDVV5Dh3ZeQ0yXXkMQuF5D1dheQ5r5XkNeGl9DIztfQ+dbX0OsfF9DcZ1fQzW+X0P63l9Dvv9fQ4MgYENIQWBDDGJgQ9GCYEOWo2BDWsRgQx/lYEPjBWFDqCZhQ21HYUMxaGFD9ohhQ7qpYUN/ymFDROthQwgMYkPNLGJDkU1iQ1ZuYkMbj2JD369iQ6TQYkNo8WJDLRJjQ/IyY0O2U2NDe3RjQz+VY0MEtmNDydZjQ433Y0NSGGRDFzlkQ9tZZEOgemRDZJtkQym8ZEPu3GRDsv1kQ3ceZUM7P2VDAGBlQ8WAZUOJoWVDTsJlQxLjZUPXA2ZDnCRmQ2BFZkMlZmZD6YZmQ66nZkNzyGZDN+lmQ/wJZ0PBKmdDhUtnQ0psZ0MOjWdD061nQ5jOZ0Nc72dDIRBoQ+UwaEOqUWhDb3JoQzOTaEP4s2hDvNRoQ4H1aENGFmlDCjdpQ89XaUOTeGlDWJlpQx26aUPh2mlDpvtpQ2ocakMvPWpD9F1qQ7h+akN9n2pDQsBqQwbhakPLAWtDjyJrQ1RDa0MZZGtD3YRrQ6Kla0NmxmtDK+drQ/AHbEO0KGxDeUlsQz1qbEMCi2xDx6tsQ4vMbENQ7WxDFA5tQ9kubUOeT21DYnBtQyeRbUPssW1DsNJtQ3XzbUM5FG5D/jRuQ8NVbkOHdm5DTJduQxC4bkPV2G5DmvluQ14ab0MjO29D51tvQ6x8b0NxnW9DNb5vQ/reb0O+/29DgyBwQ0hBcEMMYnBD0YJwQ5ajcENaxHBDH+VwQ+MFcUOoJnFDbUdxQzFocUP2iHFDuqlxQ3/KcUNE63FDCAxyQ80sckORTXJDVm5yQxuPckPfr3JDpNByQ2jxckMtEnND8jJzQ7ZTc0N7dHNDP5VzQwS2c0PJ1nNDjfdzQ1IYdEMXOXRD21l0Q6B6dENkm3RDKbx0Q+7cdEOy/XRDdx51Qzs/dUMAYHVDxYB1Q4mhdUNOwnVDEuN1Q9cDdkOcJHZDYEV2QyVmdkPphnZDrqd2Q3PIdkM36XZD/Al3Q8Eqd0OFS3dDSmx3Qw6Nd0PTrXdDmM53Q1zvd0MhEHhD5TB4Q6pReENvcnhDM5N4Q/izeEO81HhDgfV4Q0YWeUMKN3lDz1d5Q5N4eUNYmXlDHbp5Q+HaeUOm+3lDahx6Qy89ekP0XXpDuH56Q32fekNCwHpDBuF6Q8sBe0OPIntDVEN7Qxlke0PdhHtDoqV7Q2bGe0Mr53tD8Ad8Q7QofEN5SXxDPWp8QwKLfEPHq3xDi8x8Q1DtfEMUDn1D2S59Q55PfUNicH1DJ5F9Q+yxfUOw0n1DdfN9QzkUfkP+NH5Dw1V+Q4d2fkNMl35DELh+Q9XYfkOa+X5DXhp/QyM7f0PnW39DrHx/Q3Gdf0M1vn9D+t5/Q77/f0NCEIBDpCCAQwYxgENoQYBDy1GAQy1igEOPcoBD8oKAQ1STgEO2o4BDGbSAQ3vEgEPd1IBDP+WAQ6L1gEMEBoFDZhaBQ8kmgUMrN4FDjUeBQ/BXgUNSaIFDtHiBQxeJgUN5mYFD26mBQz26gUOgyoFDAtuBQ2TrgUPH+4FDKQyCQ4scgkPuLIJDUD2CQ7JNgkMUXoJDd26CQ9l+gkM7j4JDnp+CQwCwgkNiwIJDxdCCQyfhgkOJ8YJD7AGDQ04Sg0MSM4ND11ODQ5x0g0NglYNDJbaDQ+nWg0Ou94NDcxiEQzc5hEP8WYRDwXqEQ4WbhENKvIRDDt2EQ9P9hEOYHoVDXD+FQyFghUPlgIVDqqGFQ2/ChUMz44VD+AOGQ7wkhkOBRYZDRmaGQwqHhkPPp4ZDk8iGQ1jphkMdCodD4SqHQ6ZLh0NqbIdDL42HQ/Sth0O4zodDfe+HQ0IQiEMGMYhDy1GIQ49yiENUk4hDGbSIQ93UiEOi9YhDZhaJQys3iUPwV4lDtHiJQ3mZiUM9uolDAtuJQ8f7iUOLHIpDUD2KQxReikPZfopDnp+KQ2LAikMn4YpD7AGLQ7Aii0N1Q4tDOWSLQ/6Ei0PDpYtDh8aLQ0zni0MQCIxD1SiMQ5pJjENeaoxDI4uMQ+erjEOszIxDce2MQzUOjUP6Lo1Dvk+NQ4NwjUNIkY1DDLKNQ9HSjUOW841DWhSOQx81jkPjVY5DqHaOQ22XjkMxuI5D9tiOQ7r5jkN/Go9DRDuPQwhcj0PNfI9DkZ2PQ1a+j0Mb349D3/+PQ6QgkENoQZBDLWKQQ/KCkEO2o5BDe8SQQz/lkEMEBpFDySaRQ41HkUNSaJFDF4mRQ9upkUOgypFDZOuRQykMkkPuLJJDsk2SQ3dukkM7j5JDALCSQ8XQkkOJ8ZJDThKTQxIzk0PXU5NDnHSTQ2CVk0MltpND6daTQ673k0NzGJRDNzmUQ/xZlEPBepRDhZuUQ0q8lEMO3ZRD0/2UQ5gelUNcP5VDIWCVQ+WAlUOqoZVDb8KVQzPjlUP4A5ZDvCSWQ4FFlkNGZpZDCoeWQ8+nlkOTyJZDWOmWQ/Stl0NUk5hDeZmZQ9l+mkM5ZJtDXmqcQ75PnUMfNZ5DfxqfQ6QgoEMEBqFDZOuhQ4nxokPp1qNDSrykQ2/CpUPPp6ZDL42nQ49yqEO0eKlDFF6qQ3VDq0OaSaxD+i6tQ1oUrkN/Gq9D3/+vQz/lsEOgyrFDxdCyQyW2s0OFm7RDqqG1QwqHtkNqbLdDj3K4Q/BXuUNQPbpDsCK7Q9UovEM1Dr1DlvO9Q7r5vkMb379De8TAQ6DKwUMAsMJDYJXDQ8F6xEPlgMVDRmbGQ6ZLx0PLUchDKzfJQ4scykOwIstDEAjMQ3HtzEPR0s1D9tjOQ1a+z0O2o9BD26nRQzuP0kOcdNNDwXrUQyFg1UOgyuFDuvnuQ9Uo/ENavARESmQLRHXrEUQhCExE"},"counts":{"dtype":"<u4","b64":"DwAAAGkAAABoAAAAaAAAAGgAAABoAAAAaAAAAGgAAABoAAAAaQAAAGgAAABoAAAAaAAAAGgAAABoAAAAaAAAAGgAAABoAAAAaQAAAGgAAABoAAAAaAAAAGgAAABoAAAAaAAAAGgAAABoAAAAaQAAAGgAAABoAAAAaAAAAGgAAABoAAAAaAAAAGgAAABpAAAAaAAAAGgAAABoAAAAaAAAAGgAAABoAAAAaAAAAGgAAABpAAAAaAAAAGgAAABoAAAAaAAAAGgAAABoAAAAaAAAAGkAAABoAAAAaAAAAGgAAABoAAAAaAAAAGgAAABoAAAAaAAAAGkAAABoAAAAaAAAAGgAAABoAAAAaAAAAGgAAABoAAAAaQAAAGgAAABoAAAAaAAAAGgAAABoAAAAaAAAAGgAAABoAAAAaQAAAGgAAABoAAAAaAAAAGgAAABoAAAAaAAAAGgAAABpAAAAaAAAAGgAAABoAAAAaAAAAGgAAABoAAAAaAAAAGgAAABpAAAAaAAAAGgAAABoAAAAaAAAAGgAAABoAAAAaAAAAGgAAABpAAAAaAAAAGgAAABoAAAAaAAAAGgAAABoAAAAaAAAAGkAAABoAAAAaAAAAGgAAABoAAAAaAAAAGgAAABoAAAAaAAAAGkAAABoAAAAaAAAAGgAAABoAAAAaAAAAGgAAABoAAAAaQAAAGgAAABoAAAAaAAAAGgAAABoAAAAaAAAAGgAAABoAAAAaQAAAGgAAABoAAAAaAAAAGgAAABoAAAAaAAAAGgAAABpAAAAaAAAAGgAAABoAAAAaAAAAGgAAABoAAAAaAAAAGgAAABpAAAAaAAAAGgAAABoAAAAaAAAAGgAAABoAAAAaAAAAGkAAABoAAAAaAAAAGgAAABoAAAAaAAAAGgAAABoAAAAaAAAAGkAAABoAAAAaAAAAGgAAABoAAAAaAAAAGgAAAD4AQAAJAMAACQDAAAkAwAAJAMAACQDAAAkAwAAJAMAACQDAAAkAwAAJAMAACQDAAAkAwAAJAMAACQDAAAkAwAAJAMAACQDAAAkAwAAJAMAACQDAAAkAwAAJAMAAEYCAAAxAQAAMQEAADEBAAAxAQAAMQEAADEBAAAxAQAAMQEAADEBAAAxAQAAMQEAADEBAAAxAQAAMQEAADEBAAAxAQAAMQEAADIBAAAxAQAAMQEAADEBAAAxAQAAMQEAADEBAAAxAQAAMQEAADEBAAAxAQAAMQEAADEBAAAxAQAAMQEAADEBAAAxAQAAMQEAADEBAAAxAQAAMQEAADEBAAAxAQAAMQEAADEBAAAxAQAAMQEAADIBAAAxAQAAMQEAADEBAAAxAQAAMQEAADEBAAAxAQAAMQEAADEBAAAxAQAAMQEAADEBAAAxAQAAMQEAADEBAACmAAAAGAAAABcAAAAYAAAAFwAAABcAAAAYAAAAFwAAABcAAAAYAAAAFwAAABcAAAAYAAAAFwAAABcAAAAYAAAAFwAAABgAAAAXAAAAFwAAABgAAAAXAAAAFwAAABgAAAAXAAAAFwAAABgAAAAXAAAAFwAAABgAAAAXAAAAGAAAABcAAAAXAAAAGAAAABcAAAAXAAAAGAAAABcAAAAXAAAAGAAAABcAAAAXAAAAGAAAABcAAAAXAAAAGAAAABcAAAAYAAAAFwAAABcAAAAYAAAAFwAAABcAAAAYAAAAFwAAAC8AAAAuAAAALwAAAC8AAAAvAAAALgAAAC8AAAAvAAAALgAAAC8AAAAvAAAALwAAAC4AAAAvAAAALwAAAC4AAAAvAAAALwAAAC8AAAAuAAAALwAAAC8AAAAuAAAALwAAAC8AAAAvAAAALgAAAC8AAAAvAAAALgAAAC8AAAAvAAAALgAAAC8AAAAvAAAALwAAAC4AAAAvAAAALwAAAC4AAAAvAAAALwAAAC8AAAAuAAAALwAAAC8AAAAuAAAALwAAAC8AAAAvAAAALgAAAC8AAAAvAAAALgAAAC8AAAAvAAAALwAAAC4AAAAvAAAALwAAAC4AAAAvAAAALwAAAC8AAAAuAAAALwAAAC8AAAAuAAAALwAAAC8AAAAuAAAALwAAAC8AAAAvAAAALgAAAC8AAAAvAAAALgAAAC8AAAAvAAAALwAAAC4AAAAvAAAALwAAAC4AAAAvAAAALwAAAC8AAAAuAAAALwAAAC8AAAAuAAAALwAAAC8AAAAvAAAALgAAAC8AAAAvAAAALgAAAC8AAAAvAAAALwAAAC4AAAAvAAAALwAAAC4AAAAvAAAALwAAAC4AAAAvAAAALwAAAC8AAAAuAAAALwAAAC8AAAAuAAAALwAAAC8AAAAvAAAALgAAAC8AAAAvAAAALgAAAC8AAAAvAAAALwAAAC4AAAAvAAAALwAAAC4AAAAvAAAALwAAAC8AAAAuAAAALwAAAC8AAAAuAAAALwAAAC8AAAAvAAAALgAAAC8AAAAvAAAALgAAAC8AAAAvAAAALgAAAC8AAAAvAAAALwAAAC4AAAAvAAAALwAAAC4AAAAvAAAALwAAAC8AAAAuAAAALwAAAC8AAAAuAAAALwAAAC8AAAAvAAAALgAAAC8AAAAvAAAALgAAAC8AAAAvAAAALwAAAC4AAAAvAAAALwAAAC4AAAAvAAAALwAAAC8AAAAuAAAALwAAAC8AAAAuAAAALwAAAC8AAAAuAAAALwAAAC8AAAAvAAAALgAAAC8AAAAvAAAALgAAAC8AAAAvAAAALwAAAC4AAAAvAAAALwAAAC4AAAAvAAAALwAAAC8AAAAuAAAALwAAAC8AAAAuAAAALwAAAC8AAAAvAAAALgAAAC8AAAARAAAADQAAAA4AAAAOAAAADgAAAA4AAAAOAAAADgAAAA0AAAAOAAAADgAAAA4AAAAOAAAADgAAAA4AAAAOAAAADQAAAA4AAAAOAAAADgAAAA4AAAAOAAAADgAAAA4AAAANAAAADgAAAA4AAAAOAAAADgAAAA4AAAAOAAAADQAAAA4AAAAOAAAADgAAAA4AAAAOAAAADgAAAA4AAAANAAAADgAAAA4AAAAOAAAADgAAAA4AAAAOAAAADgAAAA0AAAAOAAAADgAAAA4AAAAOAAAADgAAAA4AAAANAAAADgAAAA4AAAAOAAAADgAAAA4AAAAOAAAADgAAAA0AAAAOAAAADgAAAA4AAAAOAAAADgAAAA4AAAAOAAAADQAAAA4AAAAOAAAADgAAAA4AAAAOAAAADgAAAA0AAAAOAAAADgAAAA4AAAAOAAAADgAAAA4AAAAOAAAADQAAAA4AAAAOAAAADgAAAA4AAAAOAAAADgAAAA4AAAANAAAADgAAAA4AAAAOAAAADgAAAA4AAAAOAAAADQAAAA4AAAAOAAAADgAAAA4AAAAOAAAADgAAAA4AAAANAAAADgAAAA4AAAAOAAAADgAAAA4AAAAOAAAADgAAAA0AAAAOAAAADgAAAA4AAAAOAAAADgAAAA4AAAANAAAADgAAAA4AAAAOAAAADgAAAA4AAAAOAAAADgAAAA0AAAAOAAAADgAAAA4AAAAOAAAADgAAAA4AAAAOAAAADQAAAA4AAAAOAAAADgAAAA4AAAAOAAAADgAAAA0AAAAOAAAADgAAAA4AAAAOAAAADgAAAA4AAAAOAAAADQAAAA4AAAAOAAAADgAAAA4AAAAOAAAADgAAAA0AAAAOAAAADgAAAA4AAAAOAAAADgAAAA4AAAAOAAAADQAAAA4AAAAOAAAADgAAAA4AAAAOAAAADgAAAA4AAAANAAAADgAAAA4AAAAOAAAADgAAAA4AAAAOAAAADQAAAA4AAAAOAAAADgAAAA4AAAAOAAAADgAAAA4AAAANAAAADgAAAA4AAAAOAAAADgAAAA4AAAAOAAAADgAAAA0AAAAOAAAADgAAAA4AAAAOAAAADgAAAA4AAAANAAAADgAAAA4AAAAOAAAADgAAAA4AAAAOAAAADgAAAA0AAAAOAAAADgAAAA4AAAAOAAAADgAAAA4AAAAOAAAADQAAAA4AAAAOAAAADgAAAA4AAAAOAAAADgAAAA0AAAAOAAAADgAAAA4AAAAOAAAADgAAAA4AAAAOAAAADQAAAA4AAAAOAAAADgAAAA4AAAAOAAAADgAAAA4AAAANAAAADgAAAA4AAAAOAAAADgAAAA4AAAAOAAAADQAAAA4AAAAOAAAADgAAAA4AAAAOAAAADgAAAA4AAAANAAAADgAAAA4AAAAOAAAADgAAAA4AAAAOAAAADgAAAA0AAAAOAAAADgAAAA4AAAAOAAAADgAAAA4AAAANAAAADgAAAA4AAAAOAAAADgAAAA4AAAAOAAAADgAAAA0AAAAOAAAADgAAAA4AAAAOAAAADgAAAA4AAAAOAAAADQAAAA4AAAAOAAAADgAAAA4AAAAOAAAADgAAAA0AAAAOAAAADgAAAA4AAAAOAAAADgAAAA4AAAAOAAAADQAAAA4AAAAOAAAADgAAAA4AAAAOAAAADgAAAA4AAAANAAAADgAAAA4AAAAOAAAADgAAAA4AAAAOAAAADQAAAA4AAAAOAAAADgAAAA4AAAAOAAAADgAAAA4AAAANAAAADgAAAA4AAAAOAAAADgAAAA4AAAAOAAAADgAAAA0AAAAOAAAADgAAAA4AAAAOAAAADgAAAA4AAAANAAAADgAAAA4AAAAOAAAADgAAAA4AAAAOAAAADgAAAA0AAAAOAAAADgAAAA4AAAAOAAAADgAAAA4AAAANAAAADgAAAA4AAAAOAAAADgAAAA4AAAAOAAAADgAAAA0AAAAOAAAADgAAAA4AAAAOAAAADgAAAA4AAAAOAAAADQAAAA4AAAAOAAAADgAAAA4AAAAOAAAADgAAAA0AAAAOAAAADgAAAA4AAAAOAAAADgAAAA4AAAAOAAAADQAAAA4AAAAOAAAADgAAAA4AAAAOAAAADgAAAA4AAAANAAAADgAAAA4AAAAOAAAADgAAAA4AAAAOAAAADQAAAA4AAAAOAAAADgAAAA4AAAAOAAAADgAAAA4AAAANAAAADgAAAA4AAAAOAAAADgAAAA4AAAAOAAAADgAAAA0AAAAOAAAADgAAAA4AAAAOAAAADgAAAA4AAAANAAAADgAAAA4AAAAOAAAADgAAAA4AAAAOAAAADgAAAA0AAAAOAAAADgAAAA4AAAAOAAAADgAAAA4AAAAOAAAADQAAAA4AAAAOAAAADgAAAA4AAAAOAAAADgAAAA0AAAAOAAAADgAAAA4AAAAOAAAADgAAAA4AAAAOAAAADQAAAA4AAAAOAAAADgAAAA4AAAAOAAAADgAAAA4AAAANAAAADgAAAA4AAAAOAAAADgAAAA4AAAAOAAAADQAAAA4AAAAOAAAADgAAAA4AAAAOAAAADgAAAAoAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAADAAAAAgAAAAIAAAACAAAAAgAAAAIAAAACAAAAAgAAAAIAAAACAAAAAgAAAAMAAAACAAAAAgAAAAIAAAACAAAAAgAAAAIAAAACAAAAAgAAAAIAAAADAAAAAgAAAAIAAAACAAAAAgAAAAIAAAACAAAAAgAAAAIAAAACAAAAAgAAAAMAAAACAAAAAgAAAAIAAAACAAAAAgAAAAIAAAACAAAAAgAAAAIAAAADAAAAAgAAAAIAAAACAAAAAgAAAAIAAAACAAAAAgAAAAIAAAACAAAAAwAAAAIAAAACAAAAAgAAAAIAAAACAAAAAgAAAAIAAAACAAAAAgAAAAIAAAADAAAAAgAAAAIAAAACAAAAAgAAAAIAAAACAAAAAgAAAAIAAAACAAAAAwAAAAIAAAACAAAAAgAAAAIAAAACAAAAAgAAAAIAAAACAAAAAgAAAAIAAAADAAAAAgAAAAIAAAACAAAAAgAAAAIAAAACAAAAAgAAAAIAAAACAAAAAwAAAAIAAAACAAAAAgAAAAIAAAACAAAAAgAAAAIAAAACAAAAAgAAAAIAAAADAAAAAgAAAAIAAAACAAAAAgAAAAIAAAACAAAAAgAAAAIAAAACAAAAAwAAAAIAAAACAAAAAgAAAAIAAAACAAAAAgAAAAIAAAACAAAAAgAAAAMAAAACAAAAAgAAAAIAAAACAAAAAgAAAAIAAAACAAAAAgAAAAIAAAACAAAAAwAAAAIAAAACAAAAAgAAAAIAAAACAAAAAgAAAAIAAAACAAAAAgAAAAMAAAACAAAAAgAAAAIAAAACAAAAAgAAAAIAAAACAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAA"}},"source":"summary"},{"label":"Under Load","metrics":{"filename":"sockperf_underload_udp.txt","version":"3.7-no.git","protocol":"UDP","target_ip":"192.168.1.3","target_port":11111,"run_time_sec":30.0,"warmup_msec":400.0,"sent_messages":300004,"received_messages":3000,"packet_loss_pct":0.0,"avg_latency_us":99.398,"std_dev_us":23.692,"jitter_us":23.692,"min_latency_us":53.535,"max_latency_us":270.931,"total_observations":2953,"percentiles":{"99.999":270.931,"99.99":270.931,"99.9":228.172,"99.0":172.622,"90.0":130.571,"75.0":107.082,"50.0":95.329,"25.0":84.32},"valid_sent":295201,"valid_received":2953,"errors":[],"test_type":"under-load","reply_every":100,"topology":"dual","run_date":"2025-11-05"},"histogram":{"digits":3,"count":2953,"mean_us":99.398,"std_dev_us":23.692,"min_us":53.535,"max_us":270.931,"upper_us":{"dtype":"<f4","b64":"nERWQmBlVkLpplZCrsdWQnPoVkL8KVdCwUpXQoVrV0IOrVdC081XQpjuV0JcD1hC5VBYQqpxWEJvklhC+NNYQrz0WEKBFVlCCldZQs93WUKTmFlCHdpZQuH6WUKmG1pCajxaQvR9WkK4nlpCfb9aQgYBW0LLIVtCj0JbQhmEW0LdpFtCosVbQmbmW0LwJ1xCtEhcQnlpXEICq1xCx8tcQovsXEIULl1C2U5dQp5vXUJikF1C7NFdQrDyXUJ1E15C/lReQsN1XkKHll5CENheQtX4XkKaGV9CI1tfQud7X0KsnF9Ccb1fQvr+X0K+H2BCg0BgQgyCYELRomBClsNgQh8FYULjJWFCqEZhQm1nYUL2qGFCuslhQn/qYUIILGJCzUxiQpFtYkIbr2JC389iQqTwYkJoEWNC8lJjQrZzY0J7lGNCBNZjQsn2Y0KNF2RCF1lkQtt5ZEKgmmRCKdxkQu78ZEKyHWVCdz5lQgCAZULFoGVCicFlQhIDZkLXI2ZCnERmQiWGZkLppmZCrsdmQnPoZkL8KWdCwUpnQoVrZ0IOrWdC081nQpjuZ0IhMGhC5VBoQqpxaEJvkmhC+NNoQrz0aEKBFWlCCldpQs93aUKTmGlCHdppQuH6aUKmG2pCL11qQvR9akK4nmpCfb9qQgYBa0LLIWtCj0JrQhmEa0LdpGtCosVrQisHbELwJ2xCtEhsQnlpbEICq2xCx8tsQovsbEIULm1C2U5tQp5vbUInsW1C7NFtQrDybUJ1E25C/lRuQsN1bkKHlm5CENhuQtX4bkKaGW9CI1tvQud7b0KsnG9CNd5vQvr+b0K+H3BCg0BwQgyCcELRonBClsNwQh8FcULjJXFCqEZxQjGIcUL2qHFCuslxQn/qcUIILHJCzUxyQpFtckIbr3JC389yQqTwckItMnNC8lJzQrZzc0J7lHNCBNZzQsn2c0KNF3RCF1l0Qtt5dEKgmnRCKdx0Qu78dEKyHXVCO191QgCAdULFoHVCicF1QhIDdkLXI3ZCnER2QiWGdkLppnZCrsd2QjcJd0L8KXdCwUp3QoVrd0IOrXdC0813Qpjud0IhMHhC5VB4QqpxeEIzs3hC+NN4Qrz0eEKBFXlCCld5Qs93eUKTmHlCHdp5QuH6eUKmG3pCL116QvR9ekK4nnpCQuB6QgYBe0LLIXtCj0J7QhmEe0LdpHtCosV7QisHfELwJ3xCtEh8Qj2KfEICq3xCx8t8QovsfEIULn1C2U59Qp5vfUInsX1C7NF9QrDyfUI5NH5C/lR+QsN1fkKHln5CENh+QtX4fkKaGX9CI1t/Qud7f0KsnH9CNd5/Qvr+f0LfD4BCpDCAQgZBgEJoUYBCy2GAQo+CgELykoBCVKOAQhnEgEJ71IBC3eSAQqIFgUIEFoFCZiaBQsk2gUKNV4FC8GeBQlJ4gUIXmYFCeamBQtu5gUKg2oFCAuuBQmT7gULHC4JCiyyCQu48gkJQTYJCFG6CQnd+gkLZjoJCnq+CQgDAgkJi0IJCJ/GCQokBg0LsEYNCsDKDQnVTg0I5dINC/pSDQsO1g0KH1oNCTPeDQhAYhELVOIRCmlmEQl56hEIjm4RC57uEQqzchEJx/YRCNR6FQvo+hUK+X4VCg4CFQkihhUIMwoVC0eKFQpYDhkJaJIZCH0WGQuNlhkKohoZCbaeGQjHIhkL26IZCugmHQn8qh0JES4dCCGyHQs2Mh0KRrYdCVs6HQhvvh0LfD4hCpDCIQmhRiEItcohC8pKIQraziEJ71IhCP/WIQgQWiULJNolCjVeJQlJ4iUIXmYlC27mJQqDaiUJk+4lCKRyKQu48ikKyXYpCd36KQjufikIAwIpCxeCKQokBi0JOIotCEkOLQtdji0KchItCYKWLQiXGi0Lp5otCrgeMQnMojEI3SYxC/GmMQsGKjEKFq4xCSsyMQg7tjELTDY1CmC6NQlxPjUIhcI1C5ZCNQqqxjUJv0o1CM/ONQvgTjkK8NI5CgVWOQkZ2jkIKl45Cz7eOQpPYjkJY+Y5CHRqPQuE6j0KmW49CanyPQi+dj0L0vY9CuN6PQn3/j0JCIJBCBkGQQsthkEKPgpBCVKOQQhnEkELd5JBCogWRQmYmkUIrR5FC8GeRQrSIkUJ5qZFCPcqRQgLrkULHC5JCiyySQlBNkkIUbpJC2Y6SQp6vkkJi0JJCJ/GSQuwRk0KwMpNCdVOTQjl0k0L+lJNCw7WTQofWk0JM95NCEBiUQtU4lEKaWZRCXnqUQiOblELnu5RCrNyUQnH9lEI1HpVC+j6VQr5flUKDgJVCSKGVQgzClULR4pVClgOWQloklkIfRZZC42WWQqiGlkJtp5ZCMciWQvbolkK6CZdCfyqXQkRLl0IIbJdCzYyXQpGtl0JWzpdCG++XQt8PmEKkMJhCaFGYQi1ymELykphCtrOYQnvUmEI/9ZhCBBaZQsk2mUKNV5lCUniZQheZmULbuZlCoNqZQmT7mUIpHJpC7jyaQrJdmkJ3fppCO5+aQgDAmkLF4JpCiQGbQk4im0ISQ5tC12ObQpyEm0JgpZtCJcabQunmm0KuB5xCcyicQjdJnEL8aZxCwYqcQoWrnEJKzJxCDu2cQtMNnUKYLp1CXE+dQiFwnULlkJ1CqrGdQm/SnUIz851C+BOeQrw0nkKBVZ5CRnaeQgqXnkLPt55Ck9ieQlj5nkIdGp9C4TqfQqZbn0JqfJ9CL52fQvS9n0K43p9Cff+fQkIgoEIGQaBCy2GgQo+CoEJUo6BCGcSgQt3koEKiBaFCZiahQitHoULwZ6FCtIihQnmpoUI9yqFCAuuhQscLokKLLKJCUE2iQhRuokLZjqJCnq+iQmLQokIn8aJC7BGjQrAyo0J1U6NCOXSjQv6Uo0LDtaNCh9ajQkz3o0IQGKRC1TikQppZpEJeeqRCI5ukQue7pEKs3KRCcf2kQjUepUL6PqVCvl+lQoOApUJIoaVCDMKlQtHipUKWA6ZCWiSmQh9FpkLjZaZCqIamQm2npkIxyKZC9uimQroJp0J/KqdCREunQghsp0LNjKdCka2nQlbOp0Ib76dC3w+oQqQwqEJoUahCLXKoQvKSqEK2s6hCe9SoQj/1qEIEFqlCyTapQo1XqUJSeKlCF5mpQtu5qUKg2qlCZPupQikcqkLuPKpCsl2qQnd+qkI7n6pCAMCqQsXgqkKJAatCTiKrQhJDq0LXY6tCnISrQmClq0IlxqtC6earQq4HrEJzKKxCN0msQvxprELBiqxChausQkrMrEIO7axC0w2tQpgurUJcT61CIXCtQuWQrUKqsa1Cb9KtQjPzrUL4E65CvDSuQoFVrkJGdq5CCpeuQs+3rkKT2K5CWPmuQh0ar0LhOq9CpluvQmp8r0Ivna9C9L2vQrjer0J9/69CQiCwQgZBsELLYbBCj4KwQlSjsEIZxLBC3eSwQqIFsUJmJrFCK0exQvBnsUK0iLFCeamxQj3KsUIC67FCxwuyQossskJQTbJCFG6yQtmOskKer7JCYtCyQifxskLsEbNCsDKzQnVTs0I5dLNC/pSzQsO1s0KH1rNCTPezQhAYtELVOLRCmlm0Ql56tEIjm7RC57u0QqzctEJx/bRCNR61Qvo+tUK+X7VCg4C1QkihtUIMwrVC0eK1QpYDtkJaJLZCH0W2QuNltkKohrZCbae2QjHItkL26LZCugm3Qn8qt0JES7dCCGy3Qs2Mt0KRrbdCVs63Qhvvt0LfD7hCpDC4QmhRuEItcrhC8pK4QrazuEJ71LhCP/W4QgQWuULJNrlCjVe5QlJ4uUIXmblC27m5QqDauUJk+7lCKRy6Qu48ukKyXbpCd366QjufukIAwLpCxeC6QokBu0JOIrtCEkO7Qtdju0KchLtCYKW7QiXGu0Lp5rtCrge8QnMovEI3SbxC/Gm8QsGKvEKFq7xCSsy8Qg7tvELTDb1CmC69QlxPvUIhcL1C5ZC9QqqxvUJv0r1CM/O9QvgTvkK8NL5CgVW+QkZ2vkIKl75Cz7e+QpPYvkJY+b5CHRq/QuE6v0KmW79Cany/Qi+dv0L0vb9CuN6/Qn3/v0JCIMBCBkHAQsthwEKPgsBCVKPAQhnEwELd5MBCogXBQmYmwUIrR8FC8GfBQrSIwUJ5qcFCPcrBQgLrwULHC8JCiyzCQlBNwkIUbsJC2Y7CQp6vwkJi0MJCJ/HCQuwRw0KwMsNCdVPDQjl0w0L+lMNCw7XDQofWw0JM98NCEBjEQtU4xEKaWcRCXnrEQiObxELnu8RCrNzEQnH9xEI1HsVC+j7FQr5fxUKDgMVCSKHFQgzCxULR4sVClgPGQlokxkIfRcZC42XGQqiGxkJtp8ZCMcjGQvboxkK6CcdCfyrHQkRLx0IIbMdCzYzHQpGtx0JWzsdCG+/HQt8PyEKkMMhCaFHIQi1yyELykshCtrPIQnvUyEI/9chCBBbJQsk2yUKNV8lCUnjJQheZyULbuclCoNrJQmT7yUIpHMpC7jzKQrJdykJ3fspCO5/KQgDAykLF4MpCiQHLQk4iy0ISQ8tC12PLQpyEy0JgpctCJcbLQunmy0KuB8xCcyjMQjdJzEL8acxCwYrMQoWrzEJKzMxCDu3MQtMNzUKYLs1CXE/NQiFwzULlkM1CqrHNQm/SzUIz881C+BPOQrw0zkKBVc5CRnbOQgqXzkLPt85Ck9jOQlj5zkIdGs9C4TrPQqZbz0JqfM9CL53PQvS9z0K43s9Cff/PQkIg0EIGQdBCy2HQQo+C0EJUo9BCGcTQQt3k0EKiBdFCZibRQitH0ULwZ9FCtIjRQnmp0UI9ytFCAuvRQscL0kKLLNJCUE3SQhRu0kLZjtJCnq/SQmLQ0kIn8dJC7BHTQrAy00J1U9NCOXTTQv6U00LDtdNCh9bTQkz300IQGNRC1TjUQppZ1EJeetRCI5vUQue71EKs3NRCcf3UQjUe1UL6PtVCvl/VQoOA1UJIodVCDMLVQtHi1UKWA9ZCWiTWQh9F1kLjZdZCqIbWQm2n1kIxyNZC9ujWQroJ10J/KtdCREvXQghs10LNjNdCka3XQlbO10Ib79dC3w/YQqQw2EJoUdhCLXLYQvKS2EK2s9hCe9TYQj/12EIEFtlCyTbZQo1X2UJSeNlCF5nZQtu52UKg2tlCZPvZQikc2kLuPNpCsl3aQnd+2kI7n9pCAMDaQsXg2kKJAdtCTiLbQhJD20LXY9tCnITbQmCl20IlxttC6ebbQq4H3EJzKNxCN0ncQvxp3ELBitxChavcQkrM3EIO7dxC0w3dQpgu3UJcT91CIXDdQuWQ3UKqsd1Cb9LdQjPz3UL4E95CvDTeQoFV3kJGdt5CCpfeQs+33kKT2N5CWPneQh0a30LhOt9CplvfQmp830Ivnd9C9L3fQrje30J9/99CQiDgQgZB4ELLYeBCj4LgQlSj4EIZxOBC3eTgQqIF4UJmJuFCK0fhQvBn4UK0iOFCeanhQj3K4UIC6+FCxwviQoss4kJQTeJCFG7iQtmO4kKer+JCYtDiQifx4kLsEeNCsDLjQnVT40I5dONC/pTjQsO140KH1uNCTPfjQhAY5ELVOORCmlnkQl565EIjm+RC57vkQqzc5EJx/eRCNR7lQvo+5UK+X+VCg4DlQkih5UIMwuVC0eLlQpYD5kJaJOZCH0XmQuNl5kKohuZCbafmQjHI5kL26OZCugnnQn8q50JES+dCCGznQs2M50KRredCVs7nQhvv50LfD+hCpDDoQmhR6EItcuhC8pLoQraz6EJ71OhCP/XoQgQW6ULJNulCjVfpQlJ46UIXmelC27npQqDa6UJk++lCKRzqQu486kKyXepCd37qQjuf6kIAwOpCxeDqQokB60JOIutCEkPrQtdj60KchOtCYKXrQiXG60Lp5utCrgfsQnMo7EI3SexC/GnsQsGK7EKFq+xCSszsQg7t7ELTDe1CmC7tQlxP7UIhcO1C5ZDtQqqx7UJv0u1CM/PtQvgT7kK8NO5CgVXuQkZ27kIKl+5Cz7fuQpPY7kJY+e5CHRrvQuE670KmW+9CanzvQi+d70L0ve9CuN7vQn3/70JCIPBCBkHwQsth8EKPgvBCVKPwQhnE8ELd5PBCogXxQmYm8UIrR/FC8GfxQrSI8UJ5qfFCPcrxQgLr8ULHC/JCiyzyQlBN8kIUbvJC2Y7yQp6v8kJi0PJCJ/HyQuwR80KwMvNCdVPzQjl080L+lPNCw7XzQofW80JM9/NCEBj0QtU49EKaWfRCXnr0QiOb9ELnu/RCrNz0QnH99EI1HvVC+j71Qr5f9UKDgPVCSKH1QgzC9ULR4vVClgP2Qlok9kIfRfZC42X2QqiG9kJtp/ZCMcj2Qvbo9kK6CfdCfyr3QkRL90IIbPdCzYz3QpGt90JWzvdCG+/3Qt8P+EKkMPhCaFH4Qi1y+ELykvhCtrP4QnvU+EI/9fhCBBb5Qsk2+UKNV/lCUnj5QheZ+ULbuflCoNr5QmT7+UIpHPpC7jz6QrJd+kJ3fvpCO5/6QgDA+kLF4PpCiQH7Qk4i+0ISQ/tC12P7QpyE+0JgpftCJcb7Qunm+0KuB/xCcyj8QjdJ/EL8afxCwYr8QoWr/EJKzPxCDu38QtMN/UKYLv1CXE/9QiFw/ULlkP1CqrH9Qm/S/UIz8/1C+BP+Qrw0/kKBVf5CRnb+QgqX/kLPt/5Ck9j+Qlj5/kIdGv9C4Tr/QqZb/0JqfP9CL53/QvS9/0K43v9Cff//QiEQAEODIABD5TAAQ0hBAEOqUQBDDGIAQ29yAEPRggBDM5MAQ5ajAEP4swBDWsQAQ7zUAEMf5QBDgfUAQ+MFAUNGFgFDqCYBQwo3AUNtRwFDz1cBQzFoAUOTeAFD9ogBQ1iZAUO6qQFDHboBQ3/KAUPh2gFDROsBQ6b7AUMIDAJDahwCQ80sAkMvPQJDkU0CQ/RdAkNWbgJDuH4CQxuPAkN9nwJDQsACQwbhAkMtEgND8jIDQ3t0A0M/lQNDBLYDQ8nWA0ON9wNDFzkEQ9tZBEOgegRDZJsEQ+7cBEOy/QRDdx4FQzs/BUPFgAVDiaEFQ07CBUMS4wVDnCQGQ2BFBkMlZgZD6YYGQ66nBkM36QZD/AkHQ8EqB0OFSwdDDo0HQ9OtB0OYzgdDXO8HQ+UwCEOqUQhDb3IIQzOTCEO81AhDgfUIQ0YWCUMKNwlDz1cJQ1iZCUMduglD4doJQ6b7CUMvPQpD9F0KQ7h+CkN9nwpDBuEKQ8sBC0OPIgtDVEMLQ92EC0OipQtDZsYLQyvnC0O0KAxDeUkMQz1qDEMCiwxDx6sMQ1DtDEMUDg1D2S4NQ55PDUMnkQ1D7LENQ7DSDUN18w1D/jQOQ8NVDkOHdg5DTJcOQ9XYDkOa+Q5DXhoPQyM7D0PnWw9DcZ0PQzW+D0P63g9Dvv8PQ0hBEEMMYhBD0YIQQ5ajEEMf5RBD4wURQ6gmEUNtRxFD9ogRQ7qpEUN/yhFDROsRQwgMEkORTRJDVm4SQxuPEkPfrxJDaPESQy0SE0PyMhNDtlMTQz+VE0MEthNDydYTQ433E0MXORRD21kUQ6B6FENkmxRDKbwUQ7L9FEN3HhVDOz8VQwBgFUOJoRVDTsIVQxLjFUPXAxZDYEUWQyVmFkPphhZDrqcWQzfpFkP8CRdDwSoXQ4VLF0MOjRdD060XQ5jOF0Nc7xdDIRAYQ6pRGENvchhDM5MYQ/izGEOB9RhDRhYZQwo3GUPPVxlDWJkZQx26GUPh2hlDpvsZQy89GkP0XRpDuH4aQ32fGkNCwBpDywEbQ48iG0NUQxtDGWQbQ6KlG0NmxhtDK+cbQ/AHHEN5SRxDPWocQwKLHEPHqxxDUO0cQxQOHUPZLh1Dnk8dQ2JwHUPssR1DsNIdQ3XzHUM5FB5Dw1UeQ4d2HkNMlx5DELgeQ5r5HkNeGh9DIzsfQ+dbH0NxnR9DNb4fQ/reH0O+/x9DgyAgQwxiIEPRgiBDlqMgQ1rEIEPjBSFDqCYhQ21HIUMxaCFDuqkhQ3/KIUNE6yFDCAwiQ5FNIkNWbiJDG48iQ9+vIkNo8SJDLRIjQ/IyI0O2UyNDe3QjQwS2I0PJ1iNDjfcjQ1IYJEPbWSRDoHokQ2SbJEMpvCRDsv0kQ3ceJUM7PyVDAGAlQ4mhJUNOwiVDEuMlQ9cDJkOcJCZDJWYmQ+mGJkOupyZDc8gmQ/wJJ0PBKidDhUsnQ0psJ0PTrSdDmM4nQ1zvJ0MhEChDqlEoQ29yKEMzkyhD+LMoQ7zUKENGFilDCjcpQ89XKUOTeClDHbopQ+HaKUOm+ylDahwqQ/RdKkO4fipDfZ8qQ0LAKkPLAStDjyIrQ1RDK0MZZCtD3YQrQ2bGK0Mr5ytD8AcsQ7QoLEM9aixDAossQ4vMLEPV2C5DH+UwQy0SM0N3HjVDwSo3Q89XOUMZZDtDYnA9Q3GdP0O6qUFDBLZDQxLjRUNc70dDpvtJQ7QoTEP+NE5DSEFQQ1ZuUkOgelRD6YZWQ/izWENCwFpDi8xcQ5r5XkPjBWFDLRJjQ92Ea0OipXtDM+OFQw=="},"counts":{"dtype":"<u4","b64":"AQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAQAAAAIAAAABAAAAAgAAAAEAAAACAAAAAQAAAAIAAAABAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAQAAAAIAAAABAAAAAgAAAAEAAAACAAAAAQAAAAIAAAABAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAQAAAAIAAAABAAAAAgAAAAEAAAACAAAAAQAAAAIAAAABAAAAAgAAAAIAAAABAAAAAgAAAAEAAAACAAAAAQAAAAIAAAABAAAAAgAAAAEAAAACAAAAAQAAAAIAAAABAAAAAgAAAAIAAAABAAAAAgAAAAEAAAACAAAAAQAAAAIAAAABAAAAAgAAAAEAAAACAAAAAQAAAAIAAAABAAAAAgAAAAIAAAABAAAAAgAAAAEAAAACAAAAAQAAAAIAAAABAAAAAgAAAAEAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAABAAAAAgAAAAEAAAACAAAAAQAAAAIAAAABAAAAAgAAAAEAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAABAAAAAgAAAAEAAAACAAAAAQAAAAIAAAABAAAAAgAAAAEAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAABAAAAAgAAAAEAAAACAAAAAQAAAAIAAAABAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAQAAAAIAAAABAAAAAgAAAAEAAAACAAAAAQAAAAIAAAABAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAQAAAAIAAAABAAAAAgAAAAEAAAACAAAAAQAAAAIAAAABAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAQAAAAIAAAABAAAAAgAAAAEAAAACAAAAAQAAAAIAAAABAAAAAgAAAAIAAAABAAAAAgAAAAEAAAACAAAAAQAAAAIAAAABAAAAAgAAAAEAAAACAAAAAQAAAAIAAAABAAAAAgAAAAIAAAABAAAAAgAAAAEAAAACAAAAAQAAAAIAAAABAAAAAgAAAAEAAAACAAAAAQAAAAIAAAABAAAAAgAAAAIAAAABAAAAAgAAAAEAAAACAAAAAQAAAAIAAAABAAAAAgAAAAEAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAABAAAAAgAAAAEAAAACAAAAAQAAAAIAAAABAAAAAgAAAAEAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAABAAAAAgAAAAEAAAACAAAAAQAAAAIAAAABAAAAAgAAAAEAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAABAAAAAgAAAAEAAAACAAAAAQAAAAIAAAABAAAAAgAAAAEAAAACAAAAAQAAAAIAAAACAAAAAQAAAAIAAAABAAAAAgAAAAEAAAACAAAAAQAAAAIAAAABAAAAAgAAAAEAAAACAAAAAgAAAAEAAAACAAAAAQAAAAIAAAABAAAAAgAAAAEAAAACAAAAAQAAAAIAAAABAAAAAgAAAAEAAAADAAAABQAAAAQAAAAEAAAABQAAAAQAAAAEAAAABAAAAAUAAAAEAAAABAAAAAUAAAAEAAAABAAAAAQAAAAFAAAABAAAAAQAAAAFAAAABAAAAAQAAAAEAAAABQAAAAQAAAAEAAAABQAAAAQAAAAEAAAABQAAAAQAAAAEAAAABAAAAAUAAAAEAAAABAAAAAUAAAAEAAAABAAAAAQAAAAFAAAABAAAAAQAAAAFAAAABAAAAAQAAAAEAAAABQAAAAQAAAAEAAAABQAAAAQAAAAEAAAABQAAAAQAAAAEAAAABAAAAAUAAAAEAAAABAAAAAUAAAAEAAAABAAAAAQAAAAFAAAABAAAAAQAAAAFAAAABAAAAAQAAAAEAAAABQAAAAQAAAAEAAAABQAAAAQAAAAEAAAABQAAAAQAAAAEAAAABAAAAAUAAAAEAAAABAAAAAUAAAAEAAAABAAAAAQAAAAFAAAABAAAAAQAAAAFAAAABAAAAAQAAAAEAAAABQAAAAQAAAAEAAAABQAAAAQAAAAEAAAABQAAAAQAAAAEAAAABAAAAAUAAAAEAAAABAAAAAUAAAAEAAAABAAAAAQAAAAFAAAABAAAAAQAAAAFAAAABAAAAAQAAAAEAAAABQAAAAQAAAAEAAAABQAAAAQAAAAEAAAABQAAAAQAAAAEAAAABAAAAAUAAAAEAAAABAAAAAUAAAAEAAAABAAAAAQAAAAFAAAABAAAAAQAAAAFAAAABAAAAAQAAAAFAAAABAAAAAQAAAAEAAAABQAAAAQAAAAEAAAABQAAAAQAAAAEAAAABAAAAAUAAAAEAAAABAAAAAUAAAAEAAAABAAAAAQAAAAFAAAABAAAAAQAAAAFAAAABAAAAAQAAAAFAAAABAAAAAQAAAAEAAAABQAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAFAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABQAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAFAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAUAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAIAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAA=="}},"source":"summary"},{"label":"Throughput","metrics":{"filename":"sockperf_throughput_udp.txt","version":"3.7-no.git","protocol":"UDP","target_ip":"192.168.1.3","target_port":11111,"run_time_sec":30.0,"percentiles":{},"bandwidth_mbps":912.723,"bandwidth_MBps":114.09,"msg_rate":81272,"throughput_messages":2438169,"errors":[],"test_type":"throughput","msg_size":1472,"topology":"dual","run_date":"2025-11-05"}}]},"single":{"name":"Single-Board","path":"192.168.1.2 \u2192 LAN9662 \u2192 192.168.1.3","runs":[{"label":"Ping-Pong (Default)","metrics":{"filename":"sockperf_single_pingpong_udp.txt","version":"3.7-no.git","protocol":"UDP","target_ip":"192.168.1.3","target_port":11111,"run_time_sec":30.0,"warmup_msec":400.0,"sent_messages":337614,"received_messages":337613,"packet_loss_pct":0.0002961962477843194,"avg_latency_us":44.375,"std_dev_us":16.079,"jitter_us":16.079,"min_latency_us":30.564,"max_latency_us":544.181,"total_observations":332707,"percentiles":{"99.999":402.987,"99.99":252.306,"99.9":176.613,"99.0":117.491,"90.0":46.306,"75.0":40.871,"50.0":40.072,"25.0":39.595},"valid_sent":332707,"valid_received":332707,"errors":[],"test_type":"ping-pong","topology":"single","run_date":"2025-11-05"},"histogram":{"digits":3,"count":332707,"mean_us":44.375,"std_dev_us":16.079,"min_us":30.564,"max_us":544.181,"upper_us":{"dtype":"<f4","b64":"mpn0QV669EEj2/RB5/v0Qawc9UFxPfVBNV71Qfp+9UG+n/VBg8D1QUjh9UEMAvZB0SL2QZZD9kFaZPZBH4X2QeOl9kGoxvZBbef2QTEI90H2KPdBukn3QX9q90FEi/dBCKz3Qc3M90GR7fdBVg74QRsv+EHfT/hBpHD4QWiR+EEtsvhB8tL4Qbbz+EF7FPlBPzX5QQRW+UHJdvlBjZf5QVK4+UEX2flB2/n5QaAa+kFkO/pBKVz6Qe58+kGynfpBd776QTvf+kEAAPtBxSD7QYlB+0FOYvtBEoP7Qdej+0GcxPtBYOX7QSUG/EHpJvxBrkf8QXNo/EE3ifxB/Kn8QcHK/EGF6/xBSgz9QQ4t/UHTTf1BmG79QVyP/UEhsP1B5dD9Qarx/UFvEv5BMzP+QfhT/kG8dP5BgZX+QUa2/kEK1/5Bz/f+QZMY/0FYOf9BHVr/QeF6/0Gmm/9Barz/QS/d/0H0/f9BXA8AQr4fAEIhMABCg0AAQuVQAEJIYQBCqnEAQgyCAEJvkgBC0aIAQjOzAEKWwwBC+NMAQlrkAEK89ABCHwUBQoEVAULjJQFCRjYBQqhGAUIKVwFCbWcBQs93AUIxiAFCk5gBQvaoAUJYuQFCuskBQh3aAUJ/6gFC4foBQkQLAkKmGwJCCCwCQmo8AkLNTAJCL10CQpFtAkL0fQJCVo4CQrieAkIbrwJCfb8CQt/PAkJC4AJCpPACQgYBA0JoEQNCLTIDQvJSA0K2cwNCe5QDQj+1A0IE1gNCyfYDQo0XBEJSOARCF1kEQtt5BEKgmgRCZLsEQincBELu/ARCsh0FQnc+BUI7XwVCAIAFQsWgBUKJwQVCTuIFQhIDBkLXIwZCnEQGQmBlBkIlhgZC6aYGQq7HBkJz6AZCNwkHQvwpB0LBSgdChWsHQkqMB0IOrQdC080HQpjuB0JcDwhCITAIQuVQCEKqcQhCb5IIQjOzCEL40whCvPQIQoEVCUJGNglCClcJQs93CUKTmAlCWLkJQh3aCULh+glCphsKQmo8CkIvXQpC9H0KQrieCkJ9vwpCQuAKQgYBC0LLIQtCj0ILQlRjC0IZhAtC3aQLQqLFC0Jm5gtCKwcMQvAnDEK0SAxCeWkMQj2KDEICqwxCx8sMQovsDEJQDQ1CFC4NQtlODUKebw1CYpANQiexDULs0Q1CsPINQnUTDkI5NA5C/lQOQsN1DkKHlg5CTLcOQhDYDkLV+A5CmhkPQl46D0IjWw9C53sPQqycD0JxvQ9CNd4PQvr+D0K+HxBCg0AQQkhhEEIMghBC0aIQQpbDEEJa5BBCHwURQuMlEUKoRhFCbWcRQjGIEUL2qBFCuskRQn/qEUJECxJCCCwSQs1MEkKRbRJCVo4SQhuvEkLfzxJCpPASQmgRE0ItMhNC8lITQrZzE0J7lBNCP7UTQgTWE0LJ9hNCjRcUQlI4FEIXWRRC23kUQqCaFEJkuxRCKdwUQu78FEKyHRVCdz4VQjtfFUIAgBVCxaAVQonBFUJO4hVCEgMWQtcjFkKcRBZCYGUWQiWGFkLpphZCrscWQnPoFkI3CRdC/CkXQsFKF0KFaxdCSowXQg6tF0LTzRdCmO4XQlwPGEIhMBhC5VAYQqpxGEJvkhhCM7MYQvjTGEK89BhCgRUZQkY2GUIKVxlCz3cZQpOYGUJYuRlCHdoZQuH6GUKmGxpCajwaQi9dGkL0fRpCuJ4aQn2/GkJC4BpCBgEbQsshG0KPQhtCVGMbQhmEG0LdpBtCosUbQmbmG0IrBxxC8CccQrRIHEJ5aRxCPYocQgKrHELHyxxCi+wcQlANHUIULh1C2U4dQp5vHUJikB1CJ7EdQuzRHUKw8h1CdRMeQjk0HkL+VB5Cw3UeQoeWHkJMtx5CENgeQtX4HkKaGR9CXjofQiNbH0Lnex9CrJwfQnG9H0I13h9C+v4fQr4fIEKDQCBCSGEgQgyCIELRoiBClsMgQlrkIEIfBSFC4yUhQqhGIUJtZyFCMYghQvaoIUK6ySFCf+ohQkQLIkIILCJCzUwiQpFtIkJWjiJCG68iQt/PIkKk8CJCaBEjQi0yI0LyUiNCtnMjQnuUI0I/tSNCBNYjQsn2I0KNFyRCUjgkQhdZJELbeSRCoJokQmS7JEIp3CRC7vwkQrIdJUJ3PiVCO18lQgCAJULFoCVCicElQk7iJUISAyZC1yMmQpxEJkJgZSZCJYYmQummJkKuxyZCc+gmQjcJJ0L8KSdCwUonQoVrJ0JKjCdCDq0nQtPNJ0KY7idCXA8oQiEwKELlUChCqnEoQm+SKEIzsyhC+NMoQrz0KEKBFSlCRjYpQgpXKULPdylCk5gpQli5KUId2ilC4fopQqYbKkJqPCpCL10qQvR9KkK4nipCfb8qQkLgKkIGAStCyyErQo9CK0JUYytCGYQrQt2kK0KixStCZuYrQisHLELwJyxCtEgsQnlpLEI9iixCAqssQsfLLEKL7CxCUA0tQhQuLULZTi1Cnm8tQmKQLUInsS1C7NEtQrDyLUJ1Ey5COTQuQv5ULkLDdS5Ch5YuQky3LkIQ2C5C1fguQpoZL0JeOi9CI1svQud7L0KsnC9Ccb0vQjXeL0L6/i9Cvh8wQoNAMEJIYTBCDIIwQtGiMEKWwzBCWuQwQh8FMULjJTFCqEYxQm1nMUIxiDFC9qgxQrrJMUJ/6jFCRAsyQggsMkLNTDJCkW0yQlaOMkIbrzJC388yQqTwMkJoETNCLTIzQvJSM0K2czNCe5QzQj+1M0IE1jNCyfYzQo0XNEJSODRCF1k0Qtt5NEKgmjRCZLs0QincNELu/DRCsh01Qnc+NUI7XzVCAIA1QsWgNUKJwTVCTuI1QhIDNkLXIzZCnEQ2QmBlNkIlhjZC6aY2Qq7HNkJz6DZCNwk3QvwpN0LBSjdChWs3QkqMN0IOrTdC0803QpjuN0JcDzhCITA4QuVQOEKqcThCb5I4QjOzOEL40zhCvPQ4QoEVOUJGNjlCClc5Qs93OUKTmDlCWLk5Qh3aOULh+jlCphs6Qmo8OkIvXTpC9H06QrieOkJ9vzpCQuA6QgYBO0LLITtCj0I7QlRjO0IZhDtC3aQ7QqLFO0Jm5jtCKwc8QvAnPEK0SDxCeWk8Qj2KPEICqzxCx8s8QovsPEJQDT1CFC49QtlOPUKebz1CYpA9QiexPULs0T1CsPI9QnUTPkI5ND5C/lQ+QsN1PkKHlj5CTLc+QhDYPkLV+D5Cmhk/Ql46P0IjWz9C53s/QqycP0JxvT9CNd4/Qvr+P0K+H0BCg0BAQkhhQEIMgkBC0aJAQpbDQEJa5EBCHwVBQuMlQUKoRkFCbWdBQjGIQUL2qEFCuslBQn/qQUJEC0JCCCxCQs1MQkKRbUJCVo5CQhuvQkLfz0JCpPBCQmgRQ0ItMkNC8lJDQrZzQ0J7lENCP7VDQgTWQ0LJ9kNCjRdEQlI4REIXWURC23lEQqCaREJku0RCKdxEQu78REKyHUVCdz5FQjtfRUIAgEVCxaBFQonBRUJO4kVCEgNGQtcjRkKcREZCYGVGQiWGRkLppkZCrsdGQnPoRkI3CUdC/ClHQsFKR0KFa0dCSoxHQg6tR0LTzUdCmO5HQlwPSEIhMEhC5VBIQqpxSEJvkkhCM7NIQvjTSEK89EhCgRVJQkY2SUIKV0lCz3dJQpOYSUJYuUlCHdpJQuH6SUKmG0pCajxKQi9dSkL0fUpCuJ5KQn2/SkJC4EpCBgFLQsshS0KPQktCVGNLQhmES0LdpEtCosVLQmbmS0IrB0xC8CdMQrRITEJ5aUxCPYpMQgKrTELHy0xCi+xMQlANTUIULk1C2U5NQp5vTUJikE1CJ7FNQuzRTUKw8k1CdRNOQjk0TkL+VE5Cw3VOQoeWTkJMt05CENhOQtX4TkKaGU9CXjpPQiNbT0Lne09CrJxPQnG9T0I13k9C+v5PQr4fUEKDQFBCSGFQQgyCUELRolBClsNQQlrkUEIfBVFC4yVRQqhGUUJtZ1FCMYhRQvaoUUK6yVFCf+pRQkQLUkIILFJCzUxSQpFtUkJWjlJCG69SQt/PUkKk8FJCaBFTQi0yU0LyUlNCtnNTQnuUU0I/tVNCBNZTQsn2U0KNF1RCUjhUQhdZVELbeVRCoJpUQmS7VEIp3FRC7vxUQrIdVUJ3PlVCO19VQgCAVULFoFVCicFVQk7iVUISA1ZC1yNWQpxEVkJgZVZCJYZWQummVkKux1ZCc+hWQjcJV0L8KVdCwUpXQoVrV0JKjFdCDq1XQtPNV0KY7ldCXA9YQiEwWELlUFhCqnFYQm+SWEIzs1hC+NNYQrz0WEKBFVlCRjZZQgpXWULPd1lCk5hZQli5WUId2llC4fpZQqYbWkJqPFpCL11aQvR9WkK4nlpCfb9aQkLgWkIGAVtCyyFbQo9CW0JUY1tCGYRbQt2kW0KixVtCZuZbQisHXELwJ1xCtEhcQnlpXEI9ilxCAqtcQsfLXEKL7FxCUA1dQhQuXULZTl1Cnm9dQmKQXUInsV1C7NFdQrDyXUJ1E15COTReQv5UXkLDdV5Ch5ZeQky3XkIQ2F5C1fheQpoZX0JeOl9CI1tfQud7X0KsnF9Ccb1fQjXeX0L6/l9Cvh9gQoNAYEJIYWBCDIJgQtGiYEKWw2BCWuRgQh8FYULjJWFCqEZhQm1nYUIxiGFC9qhhQrrJYUJ/6mFCRAtiQggsYkLNTGJCkW1iQlaOYkIbr2JC389iQqTwYkJoEWNCLTJjQvJSY0K2c2NCe5RjQj+1Y0IE1mNCyfZjQo0XZEJSOGRCF1lkQtt5ZEKgmmRCZLtkQincZELu/GRCsh1lQnc+ZUI7X2VCAIBlQsWgZUKJwWVCTuJlQhIDZkLXI2ZCnERmQmBlZkIlhmZC6aZmQq7HZkJz6GZCNwlnQvwpZ0LBSmdChWtnQkqMZ0IOrWdC081nQpjuZ0JcD2hCITBoQuVQaEKqcWhCb5JoQjOzaEL402hCvPRoQoEVaUJGNmlCCldpQs93aUKTmGlCWLlpQh3aaULh+mlCphtqQmo8akIvXWpC9H1qQrieakJ9v2pCQuBqQgYBa0LLIWtCj0JrQlRja0IZhGtC3aRrQqLFa0Jm5mtCKwdsQvAnbEK0SGxCeWlsQj2KbEICq2xCx8tsQovsbEJQDW1CFC5tQtlObUKeb21CYpBtQiexbULs0W1CsPJtQnUTbkI5NG5C/lRuQsN1bkKHlm5CTLduQhDYbkLV+G5CmhlvQl46b0IjW29C53tvQqycb0JxvW9CNd5vQvr+b0K+H3BCg0BwQkhhcEIMgnBC0aJwQpbDcEJa5HBCHwVxQuMlcUKoRnFCbWdxQjGIcUL2qHFCuslxQn/qcUJEC3JCCCxyQs1MckKRbXJCVo5yQhuvckLfz3JCpPByQmgRc0ItMnNC8lJzQrZzc0J7lHNCP7VzQgTWc0LJ9nNCjRd0QlI4dEIXWXRC23l0QqCadEJku3RCKdx0Qu78dEKyHXVCdz51QjtfdUIAgHVCxaB1QonBdUJO4nVCEgN2QtcjdkKcRHZCYGV2QiWGdkLppnZCrsd2QnPodkI3CXdC/Cl3QsFKd0KFa3dCSox3Qg6td0LTzXdCmO53QlwPeEIhMHhC5VB4QqpxeEJvknhCM7N4QvjTeEK89HhCgRV5QkY2eUIKV3lCz3d5QpOYeUJYuXlCHdp5QuH6eUKmG3pCajx6Qi9dekL0fXpCuJ56Qn2/ekJC4HpCBgF7Qsshe0KPQntCVGN7QhmEe0LdpHtCosV7Qmbme0IrB3xC8Cd8QrRIfEJ5aXxCPYp8QgKrfELHy3xCi+x8QlANfUIULn1C2U59Qp5vfUJikH1CJ7F9QuzRfUKw8n1CdRN+Qjk0fkL+VH5Cw3V+QoeWfkJMt35CENh+QtX4fkKaGX9CXjp/QiNbf0Lne39CrJx/QnG9f0I13n9C+v5/Qt8PgEJCIIBCpDCAQgZBgEJoUYBCy2GAQi1ygEKPgoBC8pKAQlSjgEK2s4BCGcSAQnvUgELd5IBCP/WAQqIFgUIEFoFCZiaBQsk2gUIrR4FCjVeBQvBngUJSeIFCtIiBQheZgUJ5qYFC27mBQj3KgUKg2oFCAuuBQmT7gULHC4JCKRyCQossgkLuPIJCUE2CQrJdgkIUboJCd36CQtmOgkI7n4JCnq+CQgDAgkJi0IJCxeCCQifxgkKJAYNC7BGDQrAyg0J1U4NCOXSDQv6Ug0LDtYNCh9aDQkz3g0IQGIRC1TiEQppZhEJeeoRCI5uEQue7hEKs3IRCcf2EQjUehUL6PoVCvl+FQoOAhUJIoYVCDMKFQtHihUKWA4ZCWiSGQh9FhkLjZYZCqIaGQm2nhkIxyIZC9uiGQroJh0J/KodCREuHQghsh0LNjIdCka2HQlbOh0Ib74dC3w+IQqQwiEJoUYhCLXKIQvKSiEK2s4hCe9SIQj/1iEIEFolCyTaJQo1XiUJSeIlCF5mJQtu5iUKg2olCZPuJQikcikLuPIpCsl2KQnd+ikI7n4pCAMCKQsXgikKJAYtCTiKLQhJDi0LXY4tCnISLQmCli0IlxotC6eaLQq4HjEJzKIxCN0mMQvxpjELBioxChauMQkrMjEIO7YxC0w2NQpgujUJcT41CIXCNQuWQjUKqsY1Cb9KNQjPzjUL4E45CvDSOQoFVjkJGdo5CCpeOQs+3jkKT2I5CWPmOQh0aj0LhOo9CpluPQmp8j0IvnY9C9L2PQrjej0J9/49CQiCQQgZBkELLYZBCj4KQQlSjkEIZxJBC3eSQQqIFkUJmJpFCK0eRQvBnkUK0iJFCeamRQj3KkUIC65FCxwuSQosskkJQTZJCFG6SQtmOkkKer5JCYtCSQifxkkLsEZNCsDKTQnVTk0I5dJNC/pSTQsO1k0KH1pNCTPeTQhAYlELVOJRCmlmUQl56lEIjm5RC57uUQqzclEJx/ZRCNR6VQvo+lUK+X5VCg4CVQkihlUIMwpVC0eKVQpYDlkJaJJZCH0WWQuNllkKohpZCbaeWQjHIlkL26JZCugmXQn8ql0JES5dCCGyXQs2Ml0KRrZdCVs6XQhvvl0LfD5hCpDCYQmhRmEItcphC8pKYQrazmEJ71JhCP/WYQgQWmULJNplCjVeZQlJ4mUIXmZlC27mZQqDamUJk+5lCKRyaQu48mkKyXZpCd36aQjufmkIAwJpCxeCaQokBm0JOIptCEkObQtdjm0KchJtCYKWbQiXGm0Lp5ptCrgecQnMonEI3SZxC/GmcQsGKnEKFq5xCSsycQg7tnELTDZ1CmC6dQlxPnUIhcJ1C5ZCdQqqxnUJv0p1CM/OdQvgTnkK8NJ5CgVWeQkZ2nkIKl55Cz7eeQpPYnkJY+Z5CHRqfQuE6n0KmW59CanyfQi+dn0L0vZ9CuN6fQn3/n0JCIKBCBkGgQsthoEKPgqBCVKOgQhnEoELd5KBCogWhQmYmoUIrR6FC8GehQrSIoUJ5qaFCPcqhQgLroULHC6JCiyyiQlBNokIUbqJC2Y6iQp6vokJi0KJCJ/GiQuwRo0KwMqNCdVOjQjl0o0L+lKNCw7WjQofWo0JM96NCEBikQtU4pEKaWaRCXnqkQiObpELnu6RCrNykQnH9pEI1HqVC+j6lQr5fpUKDgKVCSKGlQgzCpULR4qVClgOmQlokpkIfRaZC42WmQqiGpkJtp6ZCMcimQvbopkK6CadCfyqnQkRLp0IIbKdCzYynQpGtp0JWzqdCG++nQt8PqEKkMKhCaFGoQi1yqELykqhCtrOoQnvUqEI/9ahCBBapQsk2qUKNV6lCUnipQheZqULbualCoNqpQmT7qUIpHKpC7jyqQrJdqkJ3fqpCO5+qQgDAqkLF4KpCiQGrQk4iq0ISQ6tC12OrQpyEq0JgpatCJcarQunmq0KuB6xCcyisQjdJrEL8aaxCwYqsQoWrrEJKzKxCDu2sQtMNrUKYLq1CXE+tQiFwrULlkK1CqrGtQm/SrUIz861C+BOuQrw0rkKBVa5CRnauQgqXrkLPt65Ck9iuQlj5rkIdGq9C4TqvQqZbr0JqfK9CL52vQvS9r0K43q9Cff+vQkIgsEIGQbBCy2GwQo+CsEJUo7BCGcSwQt3ksEKiBbFCZiaxQitHsULwZ7FCtIixQnmpsUI9yrFCAuuxQscLskKLLLJCUE2yQhRuskLZjrJCnq+yQmLQskIn8bJC7BGzQrAys0J1U7NCOXSzQv6Us0LDtbNCh9azQkz3s0IQGLRC1Ti0QppZtEJeerRCI5u0Que7tEKs3LRCcf20QjUetUL6PrVCvl+1QoOAtUJIobVCDMK1QtHitUKWA7ZCWiS2Qh9FtkLjZbZCqIa2Qm2ntkIxyLZC9ui2QroJt0J/KrdCREu3Qghst0LNjLdCka23QlbOt0Ib77dC3w+4QqQwuEJoUbhCLXK4QvKSuEK2s7hCe9S4Qj/1uEIEFrlCyTa5Qo1XuUJSeLlCF5m5Qtu5uUKg2rlCZPu5QikcukLuPLpCsl26Qnd+ukI7n7pCAMC6QsXgukKJAbtCTiK7QhJDu0LXY7tCnIS7QmClu0IlxrtC6ea7Qq4HvEJzKLxCN0m8QvxpvELBirxChau8QkrMvEIO7bxC0w29QpguvUJcT71CIXC9QuWQvUKqsb1Cb9K9QjPzvUL4E75CvDS+QoFVvkJGdr5CCpe+Qs+3vkKT2L5CWPm+Qh0av0LhOr9Cplu/Qmp8v0Ivnb9C9L2/Qrjev0J9/79CQiDAQgZBwELLYcBCj4LAQlSjwEIZxMBC3eTAQqIFwUJmJsFCK0fBQvBnwUK0iMFCeanBQj3KwUIC68FCxwvCQosswkJQTcJCFG7CQtmOwkKer8JCYtDCQifxwkLsEcNCsDLDQnVTw0I5dMNC/pTDQsO1w0KH1sNCTPfDQhAYxELVOMRCmlnEQl56xEIjm8RC57vEQqzcxEJx/cRCNR7FQvo+xUK+X8VCg4DFQkihxUIMwsVC0eLFQpYDxkJaJMZCH0XGQuNlxkKohsZCbafGQjHIxkL26MZCugnHQn8qx0JES8dCCGzHQs2Mx0KRrcdCVs7HQhvvx0LfD8hCpDDIQmhRyEItcshC8pLIQrazyEJ71MhCP/XIQgQWyULJNslCjVfJQlJ4yUIXmclC27nJQqDayUJk+8lCKRzKQu48ykKyXcpCd37KQjufykIAwMpCxeDKQokBy0JOIstCEkPLQtdjy0KchMtCYKXLQiXGy0Lp5stCrgfMQnMozEI3ScxC/GnMQsGKzEKFq8xCSszMQg7tzELTDc1CmC7NQlxPzUIhcM1C5ZDNQqqxzUJv0s1CM/PNQvgTzkK8NM5CgVXOQkZ2zkIKl85Cz7fOQpPYzkJY+c5CHRrPQuE6z0KmW89CanzPQi+dz0L0vc9CuN7PQn3/z0JCINBCBkHQQsth0EKPgtBCVKPQQhnE0ELd5NBCogXRQmYm0UIrR9FC8GfRQrSI0UJ5qdFCPcrRQgLr0ULHC9JCiyzSQlBN0kIUbtJC2Y7SQp6v0kJi0NJCJ/HSQuwR00KwMtNCdVPTQjl000L+lNNCw7XTQofW00JM99NCEBjUQtU41EKaWdRCXnrUQiOb1ELnu9RCrNzUQnH91EI1HtVC+j7VQr5f1UKDgNVCSKHVQgzC1ULR4tVClgPWQlok1kIfRdZC42XWQqiG1kJtp9ZCMcjWQvbo1kK6CddCfyrXQkRL10IIbNdCzYzXQpGt10JWztdCG+/XQt8P2EKkMNhCaFHYQi1y2ELykthCtrPYQnvU2EI/9dhCBBbZQsk22UKNV9lCUnjZQheZ2ULbudlCoNrZQmT72UIpHNpC7jzaQrJd2kJ3ftpCO5/aQgDA2kLF4NpCiQHbQk4i20ISQ9tC12PbQpyE20JgpdtCJcbbQunm20KuB9xCcyjcQjdJ3EL8adxCwYrcQoWr3EJKzNxCDu3cQtMN3UKYLt1CXE/dQiFw3ULlkN1CqrHdQm/S3UIz891C+BPeQrw03kKBVd5CRnbeQgqX3kLPt95Ck9jeQlj53kIdGt9C4TrfQqZb30JqfN9CL53fQvS930K43t9Cff/fQkIg4EIGQeBCy2HgQo+C4EJUo+BCGcTgQt3k4EKiBeFCZibhQitH4ULwZ+FCtIjhQnmp4UI9yuFCAuvhQscL4kKLLOJCUE3iQhRu4kLZjuJCnq/iQmLQ4kIn8eJC7BHjQrAy40J1U+NCOXTjQv6U40LDteNCh9bjQkz340IQGORC1TjkQppZ5EJeeuRCI5vkQue75EKs3ORCcf3kQjUe5UL6PuVCvl/lQoOA5UJIoeVCDMLlQtHi5UKWA+ZCWiTmQh9F5kLjZeZCqIbmQm2n5kIxyOZC9ujmQroJ50J/KudCREvnQghs50LNjOdCka3nQlbO50Ib7+dC3w/oQqQw6EJoUehCLXLoQvKS6EK2s+hCe9ToQj/16EIEFulCyTbpQo1X6UJSeOlCF5npQtu56UKg2ulCZPvpQikc6kLuPOpCsl3qQnd+6kI7n+pCAMDqQsXg6kKJAetCTiLrQhJD60LXY+tCnITrQmCl60IlxutC6ebrQq4H7EJzKOxCN0nsQvxp7ELBiuxChavsQkrM7EIO7exC0w3tQpgu7UJcT+1CIXDtQuWQ7UKqse1Cb9LtQjPz7UL4E+5CvDTuQoFV7kJGdu5CCpfuQs+37kKT2O5CWPnuQh0a70LhOu9CplvvQmp870Ivne9C9L3vQrje70J9/+9CQiDwQgZB8ELLYfBCj4LwQlSj8EIZxPBC3eTwQqIF8UJmJvFCK0fxQvBn8UK0iPFCeanxQj3K8UIC6/FCxwvyQoss8kJQTfJCFG7yQtmO8kKer/JCYtDyQifx8kLsEfNCsDLzQnVT80I5dPNC/pTzQsO180KH1vNCTPfzQhAY9ELVOPRCmln0Ql569EIjm/RC57v0Qqzc9EJx/fRCNR71Qvo+9UK+X/VCg4D1Qkih9UIMwvVC0eL1QpYD9kJaJPZCH0X2QuNl9kKohvZCbaf2QjHI9kL26PZCugn3Qn8q90JES/dCCGz3Qs2M90KRrfdCVs73Qhvv90LfD/hCpDD4QmhR+EItcvhC8pL4Qraz+EJ71PhCP/X4QgQW+ULJNvlCjVf5QlJ4+UIXmflC27n5QqDa+UJk+/lCKRz6Qu48+kKyXfpCd376Qjuf+kIAwPpCxeD6QokB+0JOIvtCEkP7Qtdj+0KchPtCYKX7QiXG+0Lp5vtCrgf8QnMo/EI3SfxC/Gn8QsGK/EKFq/xCSsz8Qg7t/ELTDf1CmC79QlxP/UIhcP1C5ZD9Qqqx/UJv0v1CM/P9QvgT/kK8NP5CgVX+QkZ2/kIKl/5Cz7f+QpPY/kJY+f5CHRr/QuE6/0KmW/9Canz/Qi+d/0L0vf9CuN7/Qn3//0IhEABDgyAAQ+UwAENIQQBDqlEAQwxiAENvcgBD0YIAQzOTAEOWowBD+LMAQ1rEAEO81ABDH+UAQ4H1AEPjBQFDRhYBQ6gmAUMKNwFDbUcBQ89XAUMxaAFDk3gBQ/aIAUNYmQFDuqkBQx26AUN/ygFD4doBQ0TrAUOm+wFDCAwCQ2ocAkPNLAJDLz0CQ5FNAkP0XQJDVm4CQ7h+AkMbjwJDfZ8CQ9+vAkNCwAJDpNACQwbhAkNo8QJDywEDQy0SA0PyMgNDtlMDQ3t0A0M/lQNDBLYDQ8nWA0ON9wNDUhgEQxc5BEPbWQRDoHoEQ2SbBEMpvARD7twEQ7L9BEN3HgVDOz8FQwBgBUPFgAVDiaEFQ07CBUMS4wVD1wMGQ5wkBkNgRQZDJWYGQ+mGBkOupwZDc8gGQzfpBkP8CQdDwSoHQ4VLB0NKbAdDDo0HQ9OtB0OYzgdDXO8HQyEQCEPlMAhDqlEIQ29yCEMzkwhD+LMIQ7zUCEOB9QhDRhYJQwo3CUPPVwlDk3gJQ1iZCUMduglD4doJQ6b7CUNqHApDLz0KQ/RdCkO4fgpDfZ8KQ0LACkMG4QpDywELQ48iC0NUQwtDGWQLQ92EC0OipQtDZsYLQyvnC0PwBwxDtCgMQ3lJDEM9agxDAosMQ8erDEOLzAxDUO0MQxQODUPZLg1Dnk8NQ2JwDUMnkQ1D7LENQ7DSDUN18w1DORQOQ/40DkPDVQ5Dh3YOQ0yXDkMQuA5D1dgOQ5r5DkNeGg9DIzsPQ+dbD0OsfA9DcZ0PQzW+D0P63g9Dvv8PQ4MgEENIQRBDDGIQQ9GCEEOWoxBDWsQQQx/lEEPjBRFDqCYRQ21HEUMxaBFD9ogRQ7qpEUN/yhFDROsRQwgMEkPNLBJDkU0SQ1ZuEkMbjxJD368SQ6TQEkNo8RJDLRITQ/IyE0O2UxNDe3QTQz+VE0MEthNDydYTQ433E0NSGBRDFzkUQ9tZFEOgehRDZJsUQym8FEPu3BRDsv0UQ3ceFUM7PxVDAGAVQ8WAFUOJoRVDTsIVQxLjFUPXAxZDnCQWQ2BFFkMlZhZD6YYWQ66nFkNzyBZDN+kWQ/wJF0PBKhdDhUsXQ0psF0MOjRdD060XQ5jOF0Nc7xdDIRAYQ+UwGEOqURhDb3IYQzOTGEP4sxhDvNQYQ4H1GENGFhlDCjcZQ89XGUOTeBlDWJkZQx26GUPh2hlDpvsZQ2ocGkMvPRpD9F0aQ7h+GkN9nxpDQsAaQwbhGkPLARtDjyIbQ1RDG0MZZBtD3YQbQ6KlG0NmxhtDK+cbQ/AHHEO0KBxDeUkcQz1qHEMCixxDx6scQ4vMHENQ7RxDFA4dQ9kuHUOeTx1DYnAdQyeRHUPssR1DsNIdQ3XzHUM5FB5D/jQeQ8NVHkOHdh5DTJceQxC4HkPV2B5DmvkeQ14aH0MjOx9D51sfQ6x8H0NxnR9DNb4fQ/reH0O+/x9DgyAgQ0hBIEMMYiBD0YIgQ5ajIENaxCBDH+UgQ+MFIUOoJiFDbUchQzFoIUP2iCFDuqkhQ3/KIUNE6yFDCAwiQ80sIkORTSJDVm4iQxuPIkPfryJDpNAiQ2jxIkMtEiND8jIjQ7ZTI0N7dCNDP5UjQwS2I0PJ1iNDjfcjQ1IYJEMXOSRD21kkQ6B6JENkmyRDKbwkQ+7cJEOy/SRDdx4lQzs/JUMAYCVDxYAlQ4mhJUNOwiVDEuMlQ9cDJkOcJCZDYEUmQyVmJkPphiZDrqcmQ3PIJkM36SZD/AknQ8EqJ0OFSydDSmwnQw6NJ0PTrSdDmM4nQ1zvJ0MhEChD5TAoQ6pRKENvcihDM5MoQ/izKEO81ChDgfUoQ0YWKUMKNylDz1cpQ5N4KUNYmSlDHbopQ+HaKUOm+ylDahwqQy89KkP0XSpDuH4qQ32fKkNCwCpDBuEqQ8sBK0OPIitDVEMrQxlkK0PdhCtDoqUrQ2bGK0Mr5ytD8AcsQ7QoLEN5SSxDPWosQwKLLEPHqyxDi8wsQ1DtLEMUDi1D2S4tQ55PLUNicC1DJ5EtQ+yxLUOw0i1DdfMtQzkULkP+NC5Dw1UuQ4d2LkNMly5DELguQ9XYLkOa+S5DXhovQyM7L0PnWy9DrHwvQ3GdL0M1vi9D+t4vQ77/L0ODIDBDSEEwQwxiMEPRgjBDlqMwQ1rEMEPjBTFDbUcxQ/aIMUN/yjFDCAwyQ5FNMkMbjzJDpNAyQ2jxMkPyMjNDe3QzQwS2M0ON9zNDFzk0Q6B6NEMpvDRDsv00Qzs/NUPFgDVDTsI1Q9cDNkNgRTZD6YY2Q3PINkP8CTdDhUs3Qw6NN0OYzjdDIRA4Q6pROEMzkzhDvNQ4Q0YWOUPPVzlDWJk5Q+HaOUNqHDpD9F06Q32fOkMG4TpDjyI7QxlkO0OipTtDK+c7Q7QoPEM9ajxDx6s8Q4vMPEMUDj1Dnk89QyeRPUOw0j1DORQ+Q8NVPkNMlz5D1dg+Q14aP0PnWz9DcZ0/Q/reP0ODIEBDDGJAQ5ajQEMf5UBDqCZBQzFoQUO6qUFDROtBQ80sQkNWbkJD369CQ2jxQkPyMkNDe3RDQwS2Q0ON90NDFzlEQ6B6REMpvERDsv1EQzs/RUPFgEVDTsJFQ9cDRkNgRUZD6YZGQ3PIRkM36UZDwSpHQ0psR0PTrUdDXO9HQ+UwSENvckhD+LNIQ4H1SEMKN0lDk3hJQx26SUOm+0lDLz1KQ7h+SkNCwEpDywFLQ1RDS0PdhEtDZsZLQ/AHTEN5SUxDAotMQ4vMTEMUDk1Dnk9NQyeRTUOw0k1DORROQ8NVTkNMl05D1dhOQ14aT0PnW09DcZ1PQ/reT0ODIFBDDGJQQ5ajUEMf5VBD4wVRQ21HUUP2iFFDf8pRQwgMUkORTVJDG49SQ6TQUkMtElNDtlNTQz+VU0PJ1lNDUhhUQ9tZVENkm1RD7txUQ3ceVUMAYFVDiaFVQxLjVUOcJFZDJWZWQ66nVkM36VZDwSpXQ0psV0PTrVdDXO9XQ+UwWENvclhD+LNYQ4H1WEMKN1lDk3hZQx26WUOm+1lDLz1aQ7h+WkNCwFpDywFbQ48iW0MZZFtDoqVbQyvnW0O0KFxDPWpcQ8erXENQ7VxD2S5dQ2JwXUPssV1DdfNdQ/40XkOHdl5DELheQ5r5XkMjO19DrHxfQzW+X0O+/19DSEFgQ9GCYENaxGBD4wVhQ21HYUP2iGFDf8phQwgMYkORTWJDG49iQ6TQYkMtEmNDtlNjQz+VY0PJ1mNDUhhkQ9tZZENkm2RD7txkQ3ceZUM7P2VDxYBlQ07CZUPXA2ZDYEVmQ+mGZkNzyGZD/AlnQ4VLZ0MOjWdDmM5nQyEQaEOqUWhDM5NoQ7zUaENGFmlDz1dpQ1iZaUPh2mlDahxqQ/RdakN9n2pDBuFqQ48ia0MZZGtDoqVrQyvna0O0KGxDPWpsQ8erbENQ7WxD2S5tQ2JwbUPssW1DdfNtQ/40bkOHdm5DELhuQ5r5bkNeGm9D51tvQ3Gdb0P63m9DgyBwQwxicEOWo3BDH+VwQ6gmcUMxaHFDuqlxQ0TrcUPNLHJDVm5yQ9+vckNo8XJD8jJzQ3t0c0MEtnNDjfdzQxc5dEOgenRDKbx0Q7L9dEM7P3VDxYB1Q07CdUPXA3ZDYEV2Q+mGdkNzyHZD/Al3Q4VLd0MOjXdDmM53QyEQeEOqUXhDM5N4Q7zUeENGFnlDCjd5Q5N4eUMdunlDpvt5Qy89ekO4fnpDQsB6Q8sBe0NUQ3tD3YR7Q2bGe0PwB3xDeUl8Q6QggEOen4JDXD+FQ/Sth0NQPYpDrMyMQ0Q7j0OgypFDNzmUQ5PIlkPwV5lDh8abQ+NVnkM/5aBD11OjQzPjpUOPcqhDJ+GqQ4NwrUPf/69Dd26yQ9P9tEMvjbdDx/u5QyOLvEN/Gr9DF4nBQ3MYxEPPp8ZDZhbJQ7Ai20MtYvBDc8ACRA=="},"counts":{"dtype":"<u4","b64":"agAAAJMAAACUAAAAkwAAAJMAAACUAAAAkwAAAJMAAACUAAAAkwAAAJQAAACTAAAAkwAAAJQAAACTAAAAkwAAAJQAAACTAAAAkwAAAJQAAACTAAAAlAAAAJMAAACTAAAAlAAAAJMAAACTAAAAlAAAAJMAAACTAAAAlAAAAJMAAACUAAAAkwAAAJMAAACUAAAAkwAAAJMAAACUAAAAkwAAAJMAAACUAAAAkwAAAJMAAACUAAAAkwAAAJQAAACTAAAAkwAAAJQAAACTAAAAkwAAAJQAAACTAAAAkwAAAJQAAACTAAAAlAAAAJMAAACTAAAAlAAAAJMAAACTAAAAlAAAAJMAAACTAAAAlAAAAJMAAACUAAAAkwAAAJMAAACUAAAAkwAAAJMAAACUAAAAkwAAAJMAAACUAAAAkwAAAJQAAACTAAAAkwAAAJQAAACTAAAAkwAAAJQAAACTAAAAkwAAAJQAAACTAAAAlAAAAJMAAACTAAAAlAAAAJMAAACTAAAAlAAAAJMAAACTAAAAlAAAAJMAAACTAAAAlAAAAJMAAACUAAAAkwAAAJMAAACUAAAAkwAAAJMAAACUAAAAkwAAAJMAAACUAAAAkwAAAJQAAACTAAAAkwAAAJQAAACTAAAAkwAAAJQAAACTAAAAkwAAAJQAAACTAAAAlAAAAJMAAACTAAAAlAAAAJMAAACTAAAAlAAAAJMAAACTAAAAlAAAAJMAAACUAAAAJgEAACcBAAAnAQAAJgEAACcBAAAnAQAAJwEAACYBAAAnAQAAJwEAACcBAAAmAQAAJwEAACcBAAAmAQAAJwEAACcBAAAnAQAAJgEAACcBAAAnAQAAJgEAACcBAAAnAQAAJwEAACYBAAAnAQAAJwEAACcBAAAmAQAAJwEAACcBAAAmAQAAJwEAACcBAAAnAQAAJgEAACcBAAAnAQAAJwEAACYBAAAnAQAAJwEAACYBAAAnAQAAJwEAACcBAAAmAQAAJwEAACcBAAAmAQAAJwEAACcBAAAnAQAAJgEAACcBAAAnAQAAJwEAACYBAAAnAQAAJwEAACYBAAAnAQAAJwEAACcBAAAmAQAAJwEAACcBAAAnAQAAJgEAACcBAAAnAQAAJgEAACcBAAAnAQAAJwEAACYBAAAnAQAAJwEAACYBAAAnAQAAJwEAACcBAAAmAQAAJwEAACcBAAAnAQAAJgEAACcBAAAnAQAAJgEAACcBAAAnAQAAJwEAACYBAAAnAQAAJwEAACcBAAAmAQAAJwEAACcBAAAmAQAAJwEAACcBAAAnAQAAJgEAACcBAAAnAQAAJgEAACcBAAAnAQAAJwEAACYBAAAnAQAAJwEAACcBAAAmAQAAJwEAACcBAAAmAQAAJwEAACcBAAAnAQAAJgEAACcBAAAnAQAAJwEAACYBAAAnAQAAJwEAACYBAAAnAQAAJwEAACcBAAAmAQAAJwEAACcBAAAnAQAAJgEAACcBAAAnAQAAJgEAACcBAAAnAQAAJwEAACYBAAAnAQAAJwEAACYBAAAnAQAAJwEAACcBAAAmAQAAJwEAACcBAAAnAQAAJgEAACcBAAAnAQAAJgEAACcBAAAnAQAAJwEAACYBAAAnAQAAJwEAACcBAAAmAQAAJwEAACcBAAAmAQAAJwEAACcBAAAnAQAAJgEAACcBAAAnAQAAJgEAACcBAAAnAQAAJwEAACYBAAAnAQAAJwEAACcBAAAmAQAAJwEAACcBAAAmAQAAJwEAACcBAAAnAQAAJgEAACcBAAAnAQAAJwEAACYBAAAnAQAAJwEAACYBAAAnAQAAJwEAACcBAAAmAQAAJwEAACcBAAAmAQAAJwEAACcBAAAnAQAAJgEAACcBAAAnAQAAYA4AAMwVAADMFQAAzBUAAMwVAADMFQAAzBUAAMwVAADMFQAAzBUAAMwVAADMFQAAzBUAAMwVAADMFQAAWQ8AAAMNAAADDQAABA0AAAMNAAADDQAAAw0AAAQNAAADDQAAAw0AAAMNAAADDQAABA0AAAMNAAADDQAAAw0AAAQNAAADDQAAAw0AAAMNAAAEDQAAAw0AAAMNAAADDQAAAw0AAO4DAAAmAQAAJgEAACYBAAAmAQAAJQEAACYBAAAmAQAAJgEAACYBAAAmAQAAJQEAACYBAAAmAQAAJgEAACYBAAAmAQAAJQEAACYBAAAmAQAAJgEAACYBAAAmAQAAJQEAACYBAAAmAQAAJgEAACYBAAAmAQAAJQEAACYBAAAmAQAAJgEAACYBAAAmAQAAJQEAACYBAAAmAQAAJgEAACYBAAAmAQAAJQEAACYBAAAmAQAAJgEAACYBAAAmAQAAJQEAACYBAAAmAQAAJgEAACYBAAAmAQAAJQEAACYBAAAmAQAAJgEAACYBAAAmAQAAJQEAACYBAAAmAQAAJgEAACYBAAAmAQAAJQEAACYBAAAmAQAAJgEAACYBAAAmAQAAJgEAACUBAAAmAQAAJgEAACYBAAAmAQAAJgEAACUBAAAmAQAAJgEAACYBAAAmAQAAJgEAACUBAAAmAQAAJgEAACYBAAAmAQAAJgEAACUBAAAmAQAAJgEAACYBAAAmAQAAJgEAACUBAAAmAQAAJgEAACYBAAAmAQAAJgEAACUBAAAmAQAAJgEAACYBAAAmAQAAJgEAACUBAAAmAQAAJgEAACYBAAAmAQAAJgEAACUBAAAmAQAAJgEAACYBAAAmAQAAJgEAACUBAAAmAQAAJgEAACYBAAAmAQAAJgEAACUBAAAmAQAAJgEAACYBAAAmAQAAJgEAACUBAAAmAQAAJgEAACYBAAAmAQAAJgEAACUBAAAmAQAAJgEAACYBAAAmAQAAJgEAACUBAAAmAQAAJgEAACYBAAAmAQAAJgEAACUBAAAmAQAAJgEAACYBAAAmAQAAJgEAACUBAAAmAQAAJgEAACYBAAAmAQAAJgEAACUBAAAmAQAAJgEAACYBAAAmAQAAJgEAACYBAAAlAQAAJAAAAA0AAAAOAAAADQAAAA4AAAANAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAANAAAADgAAAA0AAAAOAAAADQAAAA4AAAANAAAADgAAAA0AAAAOAAAADQAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGgAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABoAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABsAAAAaAAAAGwAAABsAAAAXAAAAAwAAAAMAAAADAAAABAAAAAMAAAADAAAAAwAAAAMAAAAEAAAAAwAAAAMAAAADAAAABAAAAAMAAAADAAAAAwAAAAQAAAADAAAAAwAAAAMAAAAEAAAAAwAAAAMAAAADAAAABAAAAAMAAAADAAAAAwAAAAQAAAADAAAAAwAAAAMAAAAEAAAAAwAAAAMAAAADAAAAAwAAAAQAAAADAAAAAwAAAAMAAAAEAAAAAwAAAAMAAAADAAAABAAAAAMAAAADAAAAAwAAAAQAAAADAAAAAwAAAAMAAAAEAAAAAwAAAAMAAAADAAAABAAAAAMAAAADAAAAAwAAAAQAAAADAAAAAwAAAAMAAAADAAAABAAAAAMAAAADAAAAAwAAAAQAAAADAAAAAwAAAAMAAAAEAAAAAwAAAAMAAAADAAAABAAAAAMAAAADAAAAAwAAAAQAAAADAAAAAwAAAAMAAAAEAAAAAwAAAAMAAAADAAAABAAAAAMAAAADAAAAAwAAAAMAAAAEAAAAAwAAAAMAAAADAAAABAAAAAMAAAADAAAAAwAAAAQAAAADAAAAAwAAAAMAAAAEAAAAAwAAAAMAAAADAAAABAAAAAMAAAADAAAAAwAAAAQAAAADAAAAAwAAAAMAAAAEAAAAAwAAAAMAAAADAAAAAwAAAAQAAAADAAAAAwAAAAMAAAAEAAAAAwAAAAMAAAADAAAABAAAAAMAAAADAAAAAwAAAAQAAAADAAAAAwAAAAMAAAAEAAAAAwAAAAMAAAADAAAABAAAAAMAAAADAAAAAwAAAAQAAAADAAAAAwAAAAMAAAAEAAAAAwAAAAMAAAADAAAAAwAAAAQAAAADAAAAAwAAAAMAAAAEAAAAAwAAAAMAAAADAAAABAAAAAMAAAADAAAAAwAAAAQAAAADAAAAAwAAAAMAAAAEAAAAAwAAAAMAAAADAAAABAAAAAMAAAADAAAAAwAAAAQAAAADAAAAAwAAAAMAAAADAAAABAAAAAMAAAADAAAAAwAAAAQAAAADAAAAAwAAAAMAAAAEAAAAAwAAAAMAAAADAAAABAAAAAMAAAADAAAAAwAAAAQAAAADAAAAAwAAAAMAAAAEAAAAAwAAAAMAAAADAAAABAAAAAMAAAAGAAAABwAAAAYAAAAHAAAABgAAAAcAAAAGAAAABwAAAAYAAAAHAAAABgAAAAcAAAAGAAAABwAAAAYAAAAGAAAABwAAAAYAAAAHAAAABgAAAAcAAAAGAAAABwAAAAYAAAAHAAAABgAAAAcAAAAGAAAABwAAAAYAAAAHAAAABgAAAAcAAAAGAAAABwAAAAYAAAAHAAAABgAAAAcAAAAGAAAABwAAAAYAAAAHAAAABgAAAAYAAAAHAAAABgAAAAcAAAAGAAAABwAAAAYAAAAHAAAABgAAAAcAAAAGAAAABwAAAAYAAAAHAAAABgAAAAcAAAAGAAAABwAAAAYAAAAHAAAABgAAAAcAAAAGAAAABwAAAAYAAAAHAAAABgAAAAcAAAAGAAAABgAAAAcAAAAGAAAABwAAAAYAAAAHAAAABgAAAAcAAAAGAAAABwAAAAYAAAAHAAAABgAAAAcAAAAGAAAABwAAAAYAAAAHAAAABgAAAAcAAAAGAAAABwAAAAYAAAAHAAAABgAAAAcAAAAGAAAABwAAAAYAAAAGAAAABwAAAAYAAAAHAAAABgAAAAcAAAAGAAAABwAAAAYAAAAHAAAABgAAAAcAAAAGAAAABwAAAAYAAAAHAAAABgAAAAcAAAAGAAAABwAAAAYAAAAHAAAABgAAAAcAAAAGAAAABwAAAAYAAAAHAAAABgAAAAYAAAAHAAAABgAAAAcAAAAGAAAABwAAAAYAAAAHAAAABgAAAAcAAAAGAAAABwAAAAYAAAAHAAAABgAAAAcAAAAGAAAABwAAAAYAAAAHAAAABgAAAAcAAAAGAAAABwAAAAYAAAAHAAAABgAAAAcAAAAGAAAABgAAAAcAAAAGAAAABwAAAAYAAAAHAAAABgAAAAcAAAAGAAAABwAAAAYAAAAHAAAABgAAAAcAAAAGAAAABwAAAAYAAAAHAAAABgAAAAcAAAAGAAAABwAAAAYAAAAHAAAABgAAAAcAAAAGAAAABwAAAAYAAAAGAAAABwAAAAYAAAAHAAAABgAAAAcAAAAGAAAABwAAAAYAAAAHAAAABgAAAAcAAAAGAAAABwAAAAYAAAAHAAAABgAAAAcAAAAGAAAABwAAAAYAAAAHAAAABgAAAAcAAAAGAAAABwAAAAYAAAAHAAAABgAAAAYAAAAHAAAABgAAAAcAAAAGAAAABwAAAAYAAAAHAAAABgAAAAcAAAAGAAAABwAAAAYAAAAHAAAABgAAAAcAAAAGAAAABwAAAAYAAAAHAAAABgAAAAcAAAAGAAAABwAAAAYAAAAHAAAABgAAAAcAAAAGAAAABgAAAAcAAAAGAAAABwAAAAYAAAAHAAAABgAAAAcAAAAGAAAABwAAAAYAAAAHAAAABgAAAAcAAAAGAAAABwAAAAYAAAAHAAAABgAAAAcAAAAGAAAABwAAAAYAAAAHAAAABgAAAAcAAAAGAAAABwAAAAYAAAAGAAAABwAAAAYAAAAHAAAABgAAAAcAAAAGAAAABwAAAAYAAAAHAAAABgAAAAcAAAAGAAAABwAAAAYAAAAHAAAABgAAAAcAAAAGAAAABwAAAAYAAAAHAAAABgAAAAcAAAAGAAAABwAAAAYAAAAHAAAABgAAAAYAAAAHAAAABgAAAAcAAAAGAAAABwAAAAYAAAAHAAAABgAAAAcAAAAGAAAABwAAAAYAAAAHAAAABgAAAAcAAAAGAAAABwAAAAYAAAAHAAAABgAAAAcAAAAGAAAABwAAAAYAAAAHAAAABgAAAAcAAAAGAAAABgAAAAcAAAAGAAAABwAAAAYAAAAHAAAABgAAAAcAAAAGAAAABwAAAAYAAAAHAAAABgAAAAcAAAAGAAAABwAAAAYAAAAHAAAABgAAAAcAAAAGAAAABQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAA=="}},"source":"summary"},{"label":"Ping-Pong (64B)","metrics":{"filename":"sockperf_single_pingpong_64B.txt","version":"3.7-no.git","protocol":"UDP","target_ip":"192.168.1.3","target_port":11111,"run_time_sec":20.0,"warmup_msec":400.0,"sent_messages":215536,"received_messages":215535,"packet_loss_pct":0.0004639596169586646,"avg_latency_us":46.313,"std_dev_us":17.322,"jitter_us":17.322,"min_latency_us":32.402,"max_latency_us":331.947,"total_observations":210900,"percentiles":{"99.999":289.755,"99.99":242.06,"99.9":174.36,"99.0":117.895,"90.0":52.729,"75.0":42.303,"50.0":40.777,"25.0":40.043},"valid_sent":210900,"valid_received":210900,"errors":[],"test_type":"ping-pong","msg_size":64,"topology":"single","run_date":"2025-11-05"},"histogram":{"digits":3,"count":210900,"mean_us":46.313,"std_dev_us":17.322,"min_us":32.402,"max_us":331.947,"upper_us":{"dtype":"<f4","b64":"9qgBQli5AUK6yQFCHdoBQn/qAULh+gFCRAsCQqYbAkIILAJCajwCQs1MAkIvXQJCkW0CQvR9AkJWjgJCuJ4CQhuvAkJ9vwJC388CQkLgAkKk8AJCBgEDQmgRA0ItMgNC8lIDQrZzA0J7lANCP7UDQgTWA0LJ9gNCjRcEQlI4BEIXWQRC23kEQqCaBEJkuwRCKdwEQu78BEKyHQVCdz4FQjtfBUIAgAVCxaAFQonBBUJO4gVCEgMGQtcjBkKcRAZCYGUGQiWGBkLppgZCrscGQnPoBkI3CQdC/CkHQsFKB0KFawdCSowHQg6tB0LTzQdCmO4HQlwPCEIhMAhC5VAIQqpxCEJvkghCM7MIQvjTCEK89AhCgRUJQkY2CUIKVwlCz3cJQpOYCUJYuQlCHdoJQuH6CUKmGwpCajwKQi9dCkL0fQpCuJ4KQn2/CkJC4ApCBgELQsshC0KPQgtCVGMLQhmEC0LdpAtCosULQmbmC0IrBwxC8CcMQrRIDEJ5aQxCPYoMQgKrDELHywxCi+wMQlANDUIULg1C2U4NQp5vDUJikA1CJ7ENQuzRDUKw8g1CdRMOQjk0DkL+VA5Cw3UOQoeWDkJMtw5CENgOQtX4DkKaGQ9CXjoPQiNbD0Lnew9CrJwPQnG9D0I13g9C+v4PQr4fEEKDQBBCSGEQQgyCEELRohBClsMQQlrkEEIfBRFC4yURQqhGEUJtZxFCMYgRQvaoEUK6yRFCf+oRQkQLEkIILBJCzUwSQpFtEkJWjhJCG68SQt/PEkKk8BJCaBETQi0yE0LyUhNCtnMTQnuUE0I/tRNCBNYTQsn2E0KNFxRCUjgUQhdZFELbeRRCoJoUQmS7FEIp3BRC7vwUQrIdFUJ3PhVCO18VQgCAFULFoBVCicEVQk7iFUISAxZC1yMWQpxEFkJgZRZCJYYWQummFkKuxxZCc+gWQjcJF0L8KRdCwUoXQoVrF0JKjBdCDq0XQtPNF0KY7hdCXA8YQiEwGELlUBhCqnEYQm+SGEIzsxhC+NMYQrz0GEKBFRlCRjYZQgpXGULPdxlCk5gZQli5GUId2hlC4foZQqYbGkJqPBpCL10aQvR9GkK4nhpCfb8aQkLgGkIGARtCyyEbQo9CG0JUYxtCGYQbQt2kG0KixRtCZuYbQisHHELwJxxCtEgcQnlpHEI9ihxCAqscQsfLHEKL7BxCUA0dQhQuHULZTh1Cnm8dQmKQHUInsR1C7NEdQrDyHUJ1Ex5COTQeQv5UHkLDdR5Ch5YeQky3HkIQ2B5C1fgeQpoZH0JeOh9CI1sfQud7H0KsnB9Ccb0fQjXeH0L6/h9Cvh8gQoNAIEJIYSBCDIIgQtGiIEKWwyBCWuQgQh8FIULjJSFCqEYhQm1nIUIxiCFC9qghQrrJIUJ/6iFCRAsiQggsIkLNTCJCkW0iQlaOIkIbryJC388iQqTwIkJoESNCLTIjQvJSI0K2cyNCe5QjQj+1I0IE1iNCyfYjQo0XJEJSOCRCF1kkQtt5JEKgmiRCZLskQincJELu/CRCsh0lQnc+JUI7XyVCAIAlQsWgJUKJwSVCTuIlQhIDJkLXIyZCnEQmQmBlJkIlhiZC6aYmQq7HJkJz6CZCNwknQvwpJ0LBSidChWsnQkqMJ0IOrSdC080nQpjuJ0JcDyhCITAoQuVQKEKqcShCb5IoQjOzKEL40yhCvPQoQoEVKUJGNilCClcpQs93KUKTmClCWLkpQh3aKULh+ilCphsqQmo8KkIvXSpC9H0qQrieKkJ9vypCQuAqQgYBK0LLIStCj0IrQlRjK0IZhCtC3aQrQqLFK0Jm5itCKwcsQvAnLEK0SCxCeWksQj2KLEICqyxCx8ssQovsLEJQDS1CFC4tQtlOLUKeby1CYpAtQiexLULs0S1CsPItQnUTLkI5NC5C/lQuQsN1LkKHli5CTLcuQhDYLkLV+C5CmhkvQl46L0IjWy9C53svQqycL0JxvS9CNd4vQvr+L0K+HzBCg0AwQkhhMEIMgjBC0aIwQpbDMEJa5DBCHwUxQuMlMUKoRjFCbWcxQjGIMUL2qDFCuskxQn/qMUJECzJCCCwyQs1MMkKRbTJCVo4yQhuvMkLfzzJCpPAyQmgRM0ItMjNC8lIzQrZzM0J7lDNCP7UzQgTWM0LJ9jNCjRc0QlI4NEIXWTRC23k0QqCaNEJkuzRCKdw0Qu78NEKyHTVCdz41QjtfNUIAgDVCxaA1QonBNUJO4jVCEgM2QtcjNkKcRDZCYGU2QiWGNkLppjZCrsc2QnPoNkI3CTdC/Ck3QsFKN0KFazdCSow3Qg6tN0LTzTdCmO43QlwPOEIhMDhC5VA4QqpxOEJvkjhCM7M4QvjTOEK89DhCgRU5QkY2OUIKVzlCz3c5QpOYOUJYuTlCHdo5QuH6OUKmGzpCajw6Qi9dOkL0fTpCuJ46Qn2/OkJC4DpCBgE7QsshO0KPQjtCVGM7QhmEO0LdpDtCosU7QmbmO0IrBzxC8Cc8QrRIPEJ5aTxCPYo8QgKrPELHyzxCi+w8QlANPUIULj1C2U49Qp5vPUJikD1CJ7E9QuzRPUKw8j1CdRM+Qjk0PkL+VD5Cw3U+QoeWPkJMtz5CENg+QtX4PkKaGT9CXjo/QiNbP0Lnez9CrJw/QnG9P0I13j9C+v4/Qr4fQEKDQEBCSGFAQgyCQELRokBClsNAQlrkQEIfBUFC4yVBQqhGQUJtZ0FCMYhBQvaoQUK6yUFCf+pBQkQLQkIILEJCzUxCQpFtQkJWjkJCG69CQt/PQkKk8EJCaBFDQi0yQ0LyUkNCtnNDQnuUQ0I/tUNCBNZDQsn2Q0KNF0RCUjhEQhdZRELbeURCoJpEQmS7REIp3ERC7vxEQrIdRUJ3PkVCO19FQgCARULFoEVCicFFQk7iRUISA0ZC1yNGQpxERkJgZUZCJYZGQummRkKux0ZCc+hGQjcJR0L8KUdCwUpHQoVrR0JKjEdCDq1HQtPNR0KY7kdCXA9IQiEwSELlUEhCqnFIQm+SSEIzs0hC+NNIQrz0SEKBFUlCRjZJQgpXSULPd0lCk5hJQli5SUId2klC4fpJQqYbSkJqPEpCL11KQvR9SkK4nkpCfb9KQkLgSkIGAUtCyyFLQo9CS0JUY0tCGYRLQt2kS0KixUtCZuZLQisHTELwJ0xCtEhMQnlpTEI9ikxCAqtMQsfLTEKL7ExCUA1NQhQuTULZTk1Cnm9NQmKQTUInsU1C7NFNQrDyTUJ1E05COTROQv5UTkLDdU5Ch5ZOQky3TkIQ2E5C1fhOQpoZT0JeOk9CI1tPQud7T0KsnE9Ccb1PQjXeT0L6/k9Cvh9QQoNAUEJIYVBCDIJQQtGiUEKWw1BCWuRQQh8FUULjJVFCqEZRQm1nUUIxiFFC9qhRQrrJUUJ/6lFCRAtSQggsUkLNTFJCkW1SQlaOUkIbr1JC389SQqTwUkJoEVNCLTJTQvJSU0K2c1NCe5RTQj+1U0IE1lNCyfZTQo0XVEJSOFRCF1lUQtt5VEKgmlRCZLtUQincVELu/FRCsh1VQnc+VUI7X1VCAIBVQsWgVUKJwVVCTuJVQhIDVkLXI1ZCnERWQmBlVkIlhlZC6aZWQq7HVkJz6FZCNwlXQvwpV0LBSldChWtXQkqMV0IOrVdC081XQpjuV0JcD1hCITBYQuVQWEKqcVhCb5JYQjOzWEL401hCvPRYQoEVWUJGNllCCldZQs93WUKTmFlCWLlZQh3aWULh+llCphtaQmo8WkIvXVpC9H1aQrieWkJ9v1pCQuBaQgYBW0LLIVtCj0JbQlRjW0IZhFtC3aRbQqLFW0Jm5ltCKwdcQvAnXEK0SFxCeWlcQj2KXEICq1xCx8tcQovsXEJQDV1CFC5dQtlOXUKeb11CYpBdQiexXULs0V1CsPJdQnUTXkI5NF5C/lReQsN1XkKHll5CTLdeQhDYXkLV+F5CmhlfQl46X0IjW19C53tfQqycX0JxvV9CNd5fQvr+X0K+H2BCg0BgQkhhYEIMgmBC0aJgQpbDYEJa5GBCHwVhQuMlYUKoRmFCbWdhQjGIYUL2qGFCuslhQn/qYUJEC2JCCCxiQs1MYkKRbWJCVo5iQhuvYkLfz2JCpPBiQmgRY0ItMmNC8lJjQrZzY0J7lGNCP7VjQgTWY0LJ9mNCjRdkQlI4ZEIXWWRC23lkQqCaZEJku2RCKdxkQu78ZEKyHWVCdz5lQjtfZUIAgGVCxaBlQonBZUJO4mVCEgNmQtcjZkKcRGZCYGVmQiWGZkLppmZCrsdmQnPoZkI3CWdC/ClnQsFKZ0KFa2dCSoxnQg6tZ0LTzWdCmO5nQlwPaEIhMGhC5VBoQqpxaEJvkmhCM7NoQvjTaEK89GhCgRVpQkY2aUIKV2lCz3dpQpOYaUJYuWlCHdppQuH6aUKmG2pCajxqQi9dakL0fWpCuJ5qQn2/akJC4GpCBgFrQssha0KPQmtCVGNrQhmEa0LdpGtCosVrQmbma0IrB2xC8CdsQrRIbEJ5aWxCPYpsQgKrbELHy2xCi+xsQlANbUIULm1C2U5tQp5vbUJikG1CJ7FtQuzRbUKw8m1CdRNuQjk0bkL+VG5Cw3VuQoeWbkJMt25CENhuQtX4bkKaGW9CXjpvQiNbb0Lne29CrJxvQnG9b0I13m9C+v5vQr4fcEKDQHBCSGFwQgyCcELRonBClsNwQlrkcEIfBXFC4yVxQqhGcUJtZ3FCMYhxQvaocUK6yXFCf+pxQkQLckIILHJCzUxyQpFtckJWjnJCG69yQt/PckKk8HJCaBFzQi0yc0LyUnNCtnNzQnuUc0I/tXNCBNZzQsn2c0KNF3RCUjh0QhdZdELbeXRCoJp0QmS7dEIp3HRC7vx0QrIddUJ3PnVCO191QgCAdULFoHVCicF1Qk7idUISA3ZC1yN2QpxEdkJgZXZCJYZ2QummdkKux3ZCc+h2QjcJd0L8KXdCwUp3QoVrd0JKjHdCDq13QtPNd0KY7ndCXA94QiEweELlUHhCqnF4Qm+SeEIzs3hC+NN4Qrz0eEKBFXlCRjZ5QgpXeULPd3lCk5h5Qli5eUId2nlC4fp5QqYbekJqPHpCL116QvR9ekK4nnpCfb96QkLgekIGAXtCyyF7Qo9Ce0JUY3tCGYR7Qt2ke0KixXtCZuZ7QisHfELwJ3xCtEh8QnlpfEI9inxCAqt8QsfLfEKL7HxCUA19QhQufULZTn1Cnm99QmKQfUInsX1C7NF9QrDyfUJ1E35COTR+Qv5UfkLDdX5Ch5Z+Qky3fkIQ2H5C1fh+QpoZf0JeOn9CI1t/Qud7f0KsnH9Ccb1/QjXef0L6/n9C3w+AQkIggEKkMIBCBkGAQmhRgELLYYBCLXKAQo+CgELykoBCVKOAQrazgEIZxIBCe9SAQt3kgEI/9YBCogWBQgQWgUJmJoFCyTaBQitHgUKNV4FC8GeBQlJ4gUK0iIFCF5mBQnmpgULbuYFCPcqBQqDagUIC64FCZPuBQscLgkIpHIJCiyyCQu48gkJQTYJCsl2CQhRugkJ3foJC2Y6CQjufgkKer4JCAMCCQmLQgkLF4IJCJ/GCQokBg0LsEYNCsDKDQnVTg0I5dINC/pSDQsO1g0KH1oNCTPeDQhAYhELVOIRCmlmEQl56hEIjm4RC57uEQqzchEJx/YRCNR6FQvo+hUK+X4VCg4CFQkihhUIMwoVC0eKFQpYDhkJaJIZCH0WGQuNlhkKohoZCbaeGQjHIhkL26IZCugmHQn8qh0JES4dCCGyHQs2Mh0KRrYdCVs6HQhvvh0LfD4hCpDCIQmhRiEItcohC8pKIQraziEJ71IhCP/WIQgQWiULJNolCjVeJQlJ4iUIXmYlC27mJQqDaiUJk+4lCKRyKQu48ikKyXYpCd36KQjufikIAwIpCxeCKQokBi0JOIotCEkOLQtdji0KchItCYKWLQiXGi0Lp5otCrgeMQnMojEI3SYxC/GmMQsGKjEKFq4xCSsyMQg7tjELTDY1CmC6NQlxPjUIhcI1C5ZCNQqqxjUJv0o1CM/ONQvgTjkK8NI5CgVWOQkZ2jkIKl45Cz7eOQpPYjkJY+Y5CHRqPQuE6j0KmW49CanyPQi+dj0L0vY9CuN6PQn3/j0JCIJBCBkGQQsthkEKPgpBCVKOQQhnEkELd5JBCogWRQmYmkUIrR5FC8GeRQrSIkUJ5qZFCPcqRQgLrkULHC5JCiyySQlBNkkIUbpJC2Y6SQp6vkkJi0JJCJ/GSQuwRk0KwMpNCdVOTQjl0k0L+lJNCw7WTQofWk0JM95NCEBiUQtU4lEKaWZRCXnqUQiOblELnu5RCrNyUQnH9lEI1HpVC+j6VQr5flUKDgJVCSKGVQgzClULR4pVClgOWQloklkIfRZZC42WWQqiGlkJtp5ZCMciWQvbolkK6CZdCfyqXQkRLl0IIbJdCzYyXQpGtl0JWzpdCG++XQt8PmEKkMJhCaFGYQi1ymELykphCtrOYQnvUmEI/9ZhCBBaZQsk2mUKNV5lCUniZQheZmULbuZlCoNqZQmT7mUIpHJpC7jyaQrJdmkJ3fppCO5+aQgDAmkLF4JpCiQGbQk4im0ISQ5tC12ObQpyEm0JgpZtCJcabQunmm0KuB5xCcyicQjdJnEL8aZxCwYqcQoWrnEJKzJxCDu2cQtMNnUKYLp1CXE+dQiFwnULlkJ1CqrGdQm/SnUIz851C+BOeQrw0nkKBVZ5CRnaeQgqXnkLPt55Ck9ieQlj5nkIdGp9C4TqfQqZbn0JqfJ9CL52fQvS9n0K43p9Cff+fQkIgoEIGQaBCy2GgQo+CoEJUo6BCGcSgQt3koEKiBaFCZiahQitHoULwZ6FCtIihQnmpoUI9yqFCAuuhQscLokKLLKJCUE2iQhRuokLZjqJCnq+iQmLQokIn8aJC7BGjQrAyo0J1U6NCOXSjQv6Uo0LDtaNCh9ajQkz3o0IQGKRC1TikQppZpEJeeqRCI5ukQue7pEKs3KRCcf2kQjUepUL6PqVCvl+lQoOApUJIoaVCDMKlQtHipUKWA6ZCWiSmQh9FpkLjZaZCqIamQm2npkIxyKZC9uimQroJp0J/KqdCREunQghsp0LNjKdCka2nQlbOp0Ib76dC3w+oQqQwqEJoUahCLXKoQvKSqEK2s6hCe9SoQj/1qEIEFqlCyTapQo1XqUJSeKlCF5mpQtu5qUKg2qlCZPupQikcqkLuPKpCsl2qQnd+qkI7n6pCAMCqQsXgqkKJAatCTiKrQhJDq0LXY6tCnISrQmClq0IlxqtC6earQq4HrEJzKKxCN0msQvxprELBiqxChausQkrMrEIO7axC0w2tQpgurUJcT61CIXCtQuWQrUKqsa1Cb9KtQjPzrUL4E65CvDSuQoFVrkJGdq5CCpeuQs+3rkKT2K5CWPmuQh0ar0LhOq9CpluvQmp8r0Ivna9C9L2vQrjer0J9/69CQiCwQgZBsELLYbBCj4KwQlSjsEIZxLBC3eSwQqIFsUJmJrFCK0exQvBnsUK0iLFCeamxQj3KsUIC67FCxwuyQossskJQTbJCFG6yQtmOskKer7JCYtCyQifxskLsEbNCsDKzQnVTs0I5dLNC/pSzQsO1s0KH1rNCTPezQhAYtELVOLRCmlm0Ql56tEIjm7RC57u0QqzctEJx/bRCNR61Qvo+tUK+X7VCg4C1QkihtUIMwrVC0eK1QpYDtkJaJLZCH0W2QuNltkKohrZCbae2QjHItkL26LZCugm3Qn8qt0JES7dCCGy3Qs2Mt0KRrbdCVs63Qhvvt0LfD7hCpDC4QmhRuEItcrhC8pK4QrazuEJ71LhCP/W4QgQWuULJNrlCjVe5QlJ4uUIXmblC27m5QqDauUJk+7lCKRy6Qu48ukKyXbpCd366QjufukIAwLpCxeC6QokBu0JOIrtCEkO7Qtdju0KchLtCYKW7QiXGu0Lp5rtCrge8QnMovEI3SbxC/Gm8QsGKvEKFq7xCSsy8Qg7tvELTDb1CmC69QlxPvUIhcL1C5ZC9QqqxvUJv0r1CM/O9QvgTvkK8NL5CgVW+QkZ2vkIKl75Cz7e+QpPYvkJY+b5CHRq/QuE6v0KmW79Cany/Qi+dv0L0vb9CuN6/Qn3/v0JCIMBCBkHAQsthwEKPgsBCVKPAQhnEwELd5MBCogXBQmYmwUIrR8FC8GfBQrSIwUJ5qcFCPcrBQgLrwULHC8JCiyzCQlBNwkIUbsJC2Y7CQp6vwkJi0MJCJ/HCQuwRw0KwMsNCdVPDQjl0w0L+lMNCw7XDQofWw0JM98NCEBjEQtU4xEKaWcRCXnrEQiObxELnu8RCrNzEQnH9xEI1HsVC+j7FQr5fxUKDgMVCSKHFQgzCxULR4sVClgPGQlokxkIfRcZC42XGQqiGxkJtp8ZCMcjGQvboxkK6CcdCfyrHQkRLx0IIbMdCzYzHQpGtx0JWzsdCG+/HQt8PyEKkMMhCaFHIQi1yyELykshCtrPIQnvUyEI/9chCBBbJQsk2yUKNV8lCUnjJQheZyULbuclCoNrJQmT7yUIpHMpC7jzKQrJdykJ3fspCO5/KQgDAykLF4MpCiQHLQk4iy0ISQ8tC12PLQpyEy0JgpctCJcbLQunmy0KuB8xCcyjMQjdJzEL8acxCwYrMQoWrzEJKzMxCDu3MQtMNzUKYLs1CXE/NQiFwzULlkM1CqrHNQm/SzUIz881C+BPOQrw0zkKBVc5CRnbOQgqXzkLPt85Ck9jOQlj5zkIdGs9C4TrPQqZbz0JqfM9CL53PQvS9z0K43s9Cff/PQkIg0EIGQdBCy2HQQo+C0EJUo9BCGcTQQt3k0EKiBdFCZibRQitH0ULwZ9FCtIjRQnmp0UI9ytFCAuvRQscL0kKLLNJCUE3SQhRu0kLZjtJCnq/SQmLQ0kIn8dJC7BHTQrAy00J1U9NCOXTTQv6U00LDtdNCh9bTQkz300IQGNRC1TjUQppZ1EJeetRCI5vUQue71EKs3NRCcf3UQjUe1UL6PtVCvl/VQoOA1UJIodVCDMLVQtHi1UKWA9ZCWiTWQh9F1kLjZdZCqIbWQm2n1kIxyNZC9ujWQroJ10J/KtdCREvXQghs10LNjNdCka3XQlbO10Ib79dC3w/YQqQw2EJoUdhCLXLYQvKS2EK2s9hCe9TYQj/12EIEFtlCyTbZQo1X2UJSeNlCF5nZQtu52UKg2tlCZPvZQikc2kLuPNpCsl3aQnd+2kI7n9pCAMDaQsXg2kKJAdtCTiLbQhJD20LXY9tCnITbQmCl20IlxttC6ebbQq4H3EJzKNxCN0ncQvxp3ELBitxChavcQkrM3EIO7dxC0w3dQpgu3UJcT91CIXDdQuWQ3UKqsd1Cb9LdQjPz3UL4E95CvDTeQoFV3kJGdt5CCpfeQs+33kKT2N5CWPneQh0a30LhOt9CplvfQmp830Ivnd9C9L3fQrje30J9/99CQiDgQgZB4ELLYeBCj4LgQlSj4EIZxOBC3eTgQqIF4UJmJuFCK0fhQvBn4UK0iOFCeanhQj3K4UIC6+FCxwviQoss4kJQTeJCFG7iQtmO4kKer+JCYtDiQifx4kLsEeNCsDLjQnVT40I5dONC/pTjQsO140KH1uNCTPfjQhAY5ELVOORCmlnkQl565EIjm+RC57vkQqzc5EJx/eRCNR7lQvo+5UK+X+VCg4DlQkih5UIMwuVC0eLlQpYD5kJaJOZCH0XmQuNl5kKohuZCbafmQjHI5kL26OZCugnnQn8q50JES+dCCGznQs2M50KRredCVs7nQhvv50LfD+hCpDDoQmhR6EItcuhC8pLoQraz6EJ71OhCP/XoQgQW6ULJNulCjVfpQlJ46UIXmelC27npQqDa6UJk++lCKRzqQu486kKyXepCd37qQjuf6kIAwOpCxeDqQokB60JOIutCEkPrQtdj60KchOtCYKXrQiXG60Lp5utCrgfsQnMo7EI3SexC/GnsQsGK7EKFq+xCSszsQg7t7ELTDe1CmC7tQlxP7UIhcO1C5ZDtQqqx7UJv0u1CM/PtQvgT7kK8NO5CgVXuQkZ27kIKl+5Cz7fuQpPY7kJY+e5CHRrvQuE670KmW+9CanzvQi+d70L0ve9CuN7vQn3/70JCIPBCBkHwQsth8EKPgvBCVKPwQhnE8ELd5PBCogXxQmYm8UIrR/FC8GfxQrSI8UJ5qfFCPcrxQgLr8ULHC/JCiyzyQlBN8kIUbvJC2Y7yQp6v8kJi0PJCJ/HyQuwR80KwMvNCdVPzQjl080L+lPNCw7XzQofW80JM9/NCEBj0QtU49EKaWfRCXnr0QiOb9ELnu/RCrNz0QnH99EI1HvVC+j71Qr5f9UKDgPVCSKH1QgzC9ULR4vVClgP2Qlok9kIfRfZC42X2QqiG9kJtp/ZCMcj2Qvbo9kK6CfdCfyr3QkRL90IIbPdCzYz3QpGt90JWzvdCG+/3Qt8P+EKkMPhCaFH4Qi1y+ELykvhCtrP4QnvU+EI/9fhCBBb5Qsk2+UKNV/lCUnj5QheZ+ULbuflCoNr5QmT7+UIpHPpC7jz6QrJd+kJ3fvpCO5/6QgDA+kLF4PpCiQH7Qk4i+0ISQ/tC12P7QpyE+0JgpftCJcb7Qunm+0KuB/xCcyj8QjdJ/EL8afxCwYr8QoWr/EJKzPxCDu38QtMN/UKYLv1CXE/9QiFw/ULlkP1CqrH9Qm/S/UIz8/1C+BP+Qrw0/kKBVf5CRnb+QgqX/kLPt/5Ck9j+Qlj5/kIdGv9C4Tr/QqZb/0JqfP9CL53/QvS9/0K43v9Cff//QiEQAEODIABD5TAAQ0hBAEOqUQBDDGIAQ29yAEPRggBDM5MAQ5ajAEP4swBDWsQAQ7zUAEMf5QBDgfUAQ+MFAUNGFgFDqCYBQwo3AUNtRwFDz1cBQzFoAUOTeAFD9ogBQ1iZAUO6qQFDHboBQ3/KAUPh2gFDROsBQ6b7AUMIDAJDahwCQ80sAkMvPQJDkU0CQ/RdAkNWbgJDuH4CQxuPAkN9nwJD368CQ0LAAkOk0AJDBuECQ2jxAkPLAQNDLRIDQ/IyA0O2UwNDe3QDQz+VA0MEtgNDydYDQ433A0NSGARDFzkEQ9tZBEOgegRDZJsEQym8BEPu3ARDsv0EQ3ceBUM7PwVDAGAFQ8WABUOJoQVDTsIFQxLjBUPXAwZDnCQGQ2BFBkMlZgZD6YYGQ66nBkNzyAZDN+kGQ/wJB0PBKgdDhUsHQ0psB0MOjQdD060HQ5jOB0Nc7wdDIRAIQ+UwCEOqUQhDb3IIQzOTCEP4swhDvNQIQ4H1CENGFglDCjcJQ89XCUOTeAlDWJkJQx26CUPh2glDpvsJQ2ocCkMvPQpD9F0KQ7h+CkN9nwpDQsAKQwbhCkPLAQtDjyILQ1RDC0MZZAtD3YQLQ6KlC0NmxgtDK+cLQ/AHDEO0KAxDeUkMQz1qDEMCiwxDx6sMQ4vMDENQ7QxDFA4NQ9kuDUOeTw1DYnANQyeRDUPssQ1DsNINQ3XzDUM5FA5D/jQOQ8NVDkOHdg5DTJcOQxC4DkPV2A5DmvkOQ14aD0MjOw9D51sPQ6x8D0NxnQ9DNb4PQ/reD0O+/w9DgyAQQ0hBEEMMYhBD0YIQQ5ajEENaxBBDH+UQQ+MFEUOoJhFDbUcRQzFoEUP2iBFDuqkRQ3/KEUNE6xFDCAwSQ80sEkORTRJDVm4SQxuPEkPfrxJDpNASQ2jxEkMtEhND8jITQ7ZTE0N7dBNDP5UTQwS2E0PJ1hNDjfcTQ1IYFEMXORRD21kUQ6B6FENkmxRDKbwUQ+7cFEOy/RRDdx4VQzs/FUMAYBVDxYAVQ4mhFUNOwhVDEuMVQ9cDFkOcJBZDYEUWQyVmFkPphhZDrqcWQ3PIFkM36RZD/AkXQ8EqF0OFSxdDSmwXQw6NF0PTrRdDmM4XQ1zvF0MhEBhD5TAYQ6pRGENvchhDM5MYQ/izGEO81BhDgfUYQ0YWGUMKNxlDz1cZQ5N4GUNYmRlDHboZQ+HaGUOm+xlDahwaQy89GkP0XRpDuH4aQ32fGkNCwBpDBuEaQ8sBG0OPIhtDVEMbQxlkG0PdhBtDoqUbQ2bGG0Mr5xtD8AccQ7QoHEN5SRxDPWocQwKLHEPHqxxDi8wcQ1DtHEMUDh1D2S4dQ55PHUNicB1DJ5EdQ+yxHUOw0h1DdfMdQzkUHkP+NB5Dw1UeQ4d2HkNMlx5DELgeQ9XYHkOa+R5DXhofQyM7H0PnWx9DrHwfQ3GdH0M1vh9D+t4fQ77/H0ODICBDSEEgQwxiIEPRgiBDlqMgQ1rEIEMf5SBD4wUhQ6gmIUNtRyFDMWghQ/aIIUO6qSFDf8ohQ0TrIUMIDCJDzSwiQ5FNIkNWbiJDG48iQ9+vIkOk0CJDaPEiQy0SI0PyMiNDtlMjQ3t0I0M/lSNDBLYjQ8nWI0ON9yNDUhgkQxc5JEPbWSRDoHokQ2SbJEMpvCRD7twkQ7L9JEN3HiVDOz8lQwBgJUPFgCVDiaElQ07CJUMS4yVD1wMmQ5wkJkNgRSZDJWYmQ+mGJkOupyZDc8gmQzfpJkP8CSdDwSonQ4VLJ0NKbCdDDo0nQ9OtJ0OYzidDXO8nQyEQKEPlMChDqlEoQ29yKEMzkyhD+LMoQ7zUKEOB9ShDRhYpQwo3KUPPVylDk3gpQ1iZKUMduilD4dopQ6b7KUNqHCpDLz0qQ/RdKkO4fipDfZ8qQ0LAKkMG4SpDywErQ48iK0NUQytDGWQrQ92EK0OipStDZsYrQyvnK0PwByxDtCgsQ3lJLEM9aixDAossQ8erLEOLzCxDUO0sQxQOLUPZLi1Dnk8tQ2JwLUMnkS1D7LEtQ7DSLUN18y1DORQuQ/40LkPDVS5Dh3YuQ0yXLkOa+S5DIzsvQ3GdL0O+/y9DDGIwQ1rEMEPjBTFDMWgxQ3/KMUPNLDJDVm4yQ6TQMkPyMjNDP5UzQ433M0MXOTRDZJs0Q7L9NEMAYDVDTsI1Q9cDNkMlZjZDc8g2Q8EqN0NKbDdDmM43Q+UwOEMzkzhDgfU4Qwo3OUNYmTlDpvs5Q/RdOkNCwDpDywE7QxlkO0NmxjtDtCg8Qz1qPEOLzDxD2S49QyeRPUN18z1D/jQ+Q0yXPkOa+T5D51s/QzW+P0O+/z9DDGJAQ1rEQEOoJkFDMWhBQ3/KQUPNLEJDG49CQ2jxQkPyMkNDP5VDQ433Q0PbWURDKbxEQ7L9REMAYEVDTsJFQ5wkRkPphkZDc8hGQ8EqR0MOjUdDXO9HQ+UwSEMzk0hDgfVIQ89XSUMduklDpvtJQ/RdSkNCwEpDjyJLQ92ES0NmxktDtChMQwKLTENQ7UxD2S5NQyeRTUN1801Dw1VOQxC4TkOa+U5D51tPQzW+T0ODIFBD0YJQQ1rEUEOoJlFD9ohRQ0TrUUPNLFJDG49SQ2jxUkO2U1NDBLZTQ433U0PbWVRDKbxUQ3ceVUPFgFVDTsJVQ5wkVkPphlZDN+lWQ8EqV0MOjVdDXO9XQ6pRWEP4s1hDgfVYQ89XWUMdullDahxaQ7h+WkNCwFpDjyJbQ92EW0Mr51tDtChcQwKLXENQ7VxDnk9dQ+yxXUN1811Dw1VeQxC4XkNeGl9DrHxfQzW+X0ODIGBD0YJgQx/lYEOoJmFD9ohhQ0TrYUORTWJD369iQ2jxYkO2U2NDBLZjQ1IYZEOgemRDKbxkQ3ceZUPFgGVDEuNlQ2BFZkPphmZDN+lmQ4VLZ0PTrWdDXO9nQ6pRaEP4s2hDRhZpQ5N4aUMdumlDahxqQ7h+akMG4WpDVENrQ92Ea0Mr52tDeUlsQ8erbENQ7WxDnk9tQ+yxbUM5FG5Dh3ZuQxC4bkNeGm9DrHxvQ/reb0NIQXBD0YJwQx/lcENtR3FDuqlxQ0TrcUM/lXNDnCR2QzOTeEOPIntD7LF9Q0IQgEPwV4FDnp+CQ+nWg0OYHoVDRmaGQ/Sth0Oi9YhDixyKQzlki0Pnq4xDlvONQ0Q7j0PygpBDHQqXQwQGoUM="},"counts":{"dtype":"<u4","b64":"XQAAAG8AAABuAAAAbgAAAG8AAABuAAAAbwAAAG4AAABuAAAAbwAAAG4AAABvAAAAbgAAAG4AAABvAAAAbgAAAG8AAABuAAAAbgAAAG8AAABuAAAAbwAAAG4AAADdAAAA3QAAANwAAADdAAAA3QAAAN0AAADdAAAA3QAAANwAAADdAAAA3QAAAN0AAADdAAAA3AAAAN0AAADdAAAA3QAAAN0AAADcAAAA3QAAAN0AAADdAAAA3QAAANwAAADdAAAA3QAAAN0AAADdAAAA3QAAANwAAADdAAAA3QAAAN0AAADdAAAA3AAAAN0AAADdAAAA3QAAAN0AAADcAAAA3QAAAN0AAADdAAAA3QAAANwAAADdAAAA3QAAAN0AAADdAAAA3AAAAN0AAADdAAAA3QAAAN0AAADdAAAA3AAAAN0AAADdAAAA3QAAAN0AAADcAAAA3QAAAN0AAADdAAAA3QAAANwAAADdAAAA3QAAAN0AAADdAAAA3AAAAN0AAADdAAAA3QAAAN0AAADdAAAA3AAAAN0AAADdAAAA3QAAAN0AAADcAAAA3QAAAN0AAADdAAAA3QAAANwAAADdAAAA3QAAAN0AAADdAAAA3AAAAN0AAADdAAAA3QAAAN0AAADdAAAA3AAAAN0AAADdAAAA3QAAAN0AAADcAAAA3QAAAN0AAADdAAAA3QAAANwAAADdAAAA3QAAAN0AAADdAAAA3AAAAN0AAADdAAAA3QAAAN0AAADcAAAA3QAAAN0AAADdAAAA3QAAAN0AAADcAAAA3QAAAN0AAADdAAAA3QAAANwAAADdAAAA3QAAAN0AAADdAAAA3AAAAN0AAADdAAAA3QAAAN0AAADcAAAA3QAAAN0AAADdAAAA3QAAAN0AAADcAAAA3QAAAN0AAADdAAAA3QAAANwAAADdAAAA3QAAAN0AAADdAAAA3AAAAN0AAADdAAAA3QAAAN0AAADcAAAA3QAAAN0AAADdAAAA3QAAAN0AAADcAAAA3QAAAN0AAADdAAAA3QAAANwAAADdAAAA3QAAAN0AAADdAAAA3AAAAN0AAADdAAAA3QAAAN0AAADcAAAA3QAAAN0AAADdAAAA3QAAANwAAADdAAAA3QAAAN0AAADdAAAA3QAAANwAAADdAAAA3QAAAN0AAADdAAAA3AAAAN0AAADdAAAA3QAAAN0AAADcAAAA3QAAAN0AAADdAAAA3QAAANwAAADdAAAA3QAAAN0AAADdAAAA3QAAANwAAADdAAAA3QAAAN0AAADdAAAA3AAAAN0AAADdAAAA3QAAAN0AAADcAAAA3QAAAN0AAADdAAAA3QAAABAGAAD6CAAA+wgAAPoIAAD7CAAA+wgAAPoIAAD7CAAA+wgAAPoIAAD7CAAA+wgAAPoIAAD7CAAA+ggAAPsIAAD7CAAA+ggAAPsIAAD7CAAA+ggAAPsIAAD7CAAAswUAAFIEAABSBAAAUQQAAFIEAABSBAAAUQQAAFIEAABRBAAAUgQAAFIEAABRBAAAUgQAAFIEAABRBAAAUgQAAFIEAABRBAAAUgQAAFEEAABSBAAAUgQAAFEEAABSBAAAUgQAAFEEAABSBAAAUgQAAFEEAABSBAAAUQQAAFIEAABSBAAAUQQAAFIEAABSBAAAUQQAAFIEAABSBAAAUQQAAFIEAABRBAAAUgQAAFIEAABRBAAAUgQAAFIEAABCBAAAYQAAAGEAAABhAAAAYQAAAGEAAABhAAAAYQAAAGEAAABhAAAAYQAAAGIAAABhAAAAYQAAAGEAAABhAAAAYQAAAGEAAABhAAAAYQAAAGEAAABiAAAAYQAAAGEAAABhAAAAYQAAAGEAAABhAAAAYQAAAGEAAABhAAAAYQAAAGIAAABhAAAAYQAAAGEAAABhAAAAYQAAAGEAAABhAAAAYQAAAGEAAABiAAAAYQAAAGEAAABhAAAAYQAAAGEAAABhAAAAYQAAAGEAAABhAAAAYQAAAGIAAABhAAAAYQAAAGEAAABhAAAAYQAAAGEAAABhAAAAYQAAAGEAAABiAAAAYQAAAGEAAABhAAAAYQAAAGEAAABhAAAAYQAAAGEAAABhAAAAYgAAAGEAAABhAAAAYQAAAGEAAABhAAAAYQAAAGEAAABhAAAAYQAAAGEAAABiAAAAYQAAAGEAAABhAAAAYQAAAGEAAABhAAAAYQAAAGEAAABhAAAAYgAAAGEAAABhAAAAYQAAAGEAAABhAAAAYQAAAGEAAABhAAAAYQAAAGEAAABiAAAAYQAAAGEAAABhAAAAYQAAAGEAAABhAAAAYQAAAGEAAABhAAAAYgAAAGEAAABhAAAAYQAAAGEAAABhAAAAYQAAAGEAAABhAAAAYQAAAGEAAABiAAAAYQAAAGEAAABhAAAAYQAAAGEAAABhAAAAYQAAAGEAAABhAAAAYgAAAGEAAABhAAAAYQAAAGEAAABhAAAAYQAAAGEAAABhAAAAYQAAAGEAAABiAAAAYQAAAGEAAABhAAAAYQAAAGEAAABhAAAAYQAAAGEAAABhAAAAYgAAAGEAAABhAAAAYQAAAGEAAABhAAAAYQAAAGEAAABhAAAAYQAAAGIAAABhAAAAYQAAAGEAAABhAAAAYQAAAGEAAABhAAAAYQAAAGEAAABhAAAAYgAAAGEAAABhAAAAYQAAAGEAAABhAAAAYQAAAGEAAABhAAAAYQAAAGIAAABhAAAAYQAAAGEAAABhAAAAYQAAAGEAAABhAAAAYQAAAGEAAABhAAAAYgAAAGEAAABhAAAAYQAAAGEAAABhAAAAYQAAAGEAAABhAAAAYQAAAGIAAABhAAAAYQAAAGEAAABhAAAAYQAAAGEAAABhAAAAYQAAAGEAAABhAAAAYgAAAGEAAABhAAAAYQAAAGEAAABhAAAAYQAAAGEAAABhAAAAYQAAAGIAAABhAAAAYQAAAGEAAABhAAAAYQAAAGEAAABhAAAAYQAAAGEAAABhAAAAYgAAAGEAAABhAAAAYQAAAGEAAABhAAAAYQAAAGEAAABhAAAAYQAAAGIAAABhAAAAYQAAAGEAAABhAAAAYQAAAGEAAABhAAAAYQAAAGEAAABiAAAAYQAAAGEAAABhAAAAYQAAAGEAAABhAAAAYQAAAGEAAABhAAAAYQAAAGIAAABhAAAAYQAAAGEAAABhAAAAYQAAAGEAAABhAAAAYQAAAGEAAABiAAAAYQAAAGEAAABhAAAAYQAAAGEAAABhAAAAYQAAAGEAAABhAAAAYQAAAGIAAABhAAAAYQAAAGEAAABhAAAAYQAAAGEAAABhAAAAYQAAAGEAAABiAAAAYQAAAGEAAABhAAAAYQAAAGEAAABhAAAAYQAAAGEAAABhAAAAYQAAAGIAAABhAAAAYQAAAGEAAABhAAAAYQAAAGEAAABhAAAAYQAAAGEAAABiAAAAYQAAAE8AAAAJAAAACgAAAAkAAAAJAAAACQAAAAoAAAAJAAAACQAAAAoAAAAJAAAACQAAAAoAAAAJAAAACQAAAAoAAAAJAAAACQAAAAoAAAAJAAAACQAAAAoAAAAJAAAACQAAAAoAAAAJAAAACQAAAAoAAAAJAAAACQAAAAoAAAAJAAAACQAAAAkAAAAKAAAACQAAAAkAAAAKAAAACQAAAAkAAAAKAAAACQAAAAkAAAAKAAAACQAAAAkAAAAKAAAACQAAAAkAAAAKAAAACQAAAAkAAAAKAAAACQAAAAkAAAAKAAAACQAAAAkAAAAJAAAACgAAAAkAAAAJAAAACgAAAAkAAAAJAAAACgAAAAkAAAAJAAAACgAAAAkAAAAJAAAACgAAAAkAAAAJAAAACgAAAAkAAAAJAAAACgAAAAkAAAAJAAAACgAAAAkAAAAJAAAACgAAAAkAAAAJAAAACQAAAAoAAAAJAAAACQAAAAoAAAAJAAAACQAAAAoAAAAJAAAACQAAAAoAAAAJAAAACQAAAAoAAAAJAAAACQAAAAoAAAAJAAAACQAAAAoAAAAJAAAACQAAAAoAAAAJAAAACQAAAAkAAAAKAAAACQAAAAkAAAAKAAAACQAAAAkAAAAKAAAACQAAAAkAAAAKAAAACQAAAAkAAAAKAAAACQAAAAkAAAAKAAAACQAAAAkAAAAKAAAACQAAAAkAAAAKAAAACQAAAAkAAAAKAAAACQAAAAkAAAAJAAAACgAAAAkAAAAJAAAACgAAAAkAAAAJAAAACgAAAAkAAAAJAAAACgAAAAkAAAAJAAAACgAAAAkAAAAJAAAACgAAAAkAAAAJAAAACgAAAAkAAAAJAAAACgAAAAkAAAAJAAAACQAAAAoAAAAJAAAACQAAAAoAAAAJAAAACQAAAAoAAAAJAAAACQAAAAoAAAAJAAAACQAAAAoAAAAJAAAACQAAAAoAAAAJAAAACQAAAAoAAAAJAAAACQAAAAoAAAAJAAAACQAAAAoAAAAJAAAACQAAAAkAAAAKAAAACQAAAAkAAAAKAAAACQAAAAkAAAAKAAAACQAAAAkAAAAKAAAACQAAAAkAAAAKAAAACQAAAAkAAAAKAAAACQAAAAkAAAAKAAAACQAAAAkAAAAKAAAACQAAAAkAAAAJAAAACgAAAAkAAAAJAAAACgAAAAkAAAAJAAAACgAAAAkAAAAJAAAACgAAAAkAAAAJAAAACgAAAAkAAAAJAAAACgAAAAkAAAAJAAAACgAAAAkAAAAJAAAACgAAAAkAAAAJAAAACQAAAAoAAAAJAAAACQAAAAoAAAAJAAAACQAAAAoAAAAJAAAACQAAAAoAAAAJAAAACQAAAAoAAAAJAAAACQAAAAoAAAAJAAAACQAAAAoAAAAJAAAACQAAAAoAAAAJAAAACQAAAAoAAAAJAAAACQAAAAkAAAAKAAAACQAAAAkAAAAKAAAACQAAAAkAAAAKAAAACQAAAAkAAAAKAAAACQAAAAkAAAAKAAAACQAAAAkAAAAKAAAACQAAAAkAAAAKAAAACQAAAAkAAAAKAAAACQAAAAkAAAAJAAAACgAAAAkAAAAJAAAACgAAAAkAAAAJAAAACgAAAAkAAAAJAAAACgAAAAkAAAAJAAAACgAAAAkAAAAJAAAACgAAAAkAAAAJAAAACgAAAAkAAAAJAAAACgAAAAkAAAAJAAAACgAAAAkAAAAJAAAACQAAAAoAAAAJAAAACQAAAAoAAAAJAAAACQAAAAoAAAAJAAAACQAAAAoAAAAJAAAACQAAAAoAAAAJAAAACQAAAAoAAAAJAAAACQAAAAoAAAAJAAAACQAAAAoAAAAJAAAACQAAAAkAAAAKAAAACQAAAAkAAAAKAAAACQAAAAkAAAAKAAAACQAAAAkAAAAKAAAACQAAAAkAAAAKAAAACQAAAAkAAAAKAAAACQAAAAkAAAAKAAAACQAAAAkAAAAKAAAACQAAAAkAAAAKAAAACQAAAAkAAAAJAAAACgAAAAkAAAAJAAAACgAAAAkAAAAJAAAACgAAAAkAAAAJAAAACgAAAAkAAAAJAAAACgAAAAkAAAAJAAAACgAAAAkAAAAJAAAACgAAAAkAAAAJAAAACgAAAAkAAAAJAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABMAAAASAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEwAAABIAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAATAAAAEgAAABMAAAAEAAAAAgAAAAIAAAACAAAAAwAAAAIAAAACAAAAAgAAAAIAAAACAAAAAgAAAAMAAAACAAAAAgAAAAIAAAACAAAAAgAAAAIAAAADAAAAAgAAAAIAAAACAAAAAgAAAAIAAAADAAAAAgAAAAIAAAACAAAAAgAAAAIAAAACAAAAAwAAAAIAAAACAAAAAgAAAAIAAAACAAAAAwAAAAIAAAACAAAAAgAAAAIAAAACAAAAAgAAAAMAAAACAAAAAgAAAAIAAAACAAAAAgAAAAIAAAADAAAAAgAAAAIAAAACAAAAAgAAAAIAAAADAAAAAgAAAAIAAAACAAAAAgAAAAIAAAACAAAAAwAAAAIAAAACAAAAAgAAAAIAAAACAAAAAgAAAAMAAAACAAAAAgAAAAIAAAACAAAAAgAAAAMAAAACAAAAAgAAAAIAAAACAAAAAgAAAAIAAAADAAAAAgAAAAIAAAACAAAAAgAAAAIAAAADAAAAAgAAAAIAAAACAAAAAgAAAAIAAAACAAAAAwAAAAIAAAACAAAAAgAAAAIAAAACAAAAAgAAAAMAAAACAAAAAgAAAAIAAAACAAAAAgAAAAMAAAACAAAAAgAAAAIAAAACAAAAAgAAAAIAAAADAAAAAgAAAAIAAAACAAAAAgAAAAIAAAADAAAAAgAAAAIAAAACAAAAAgAAAAIAAAACAAAAAwAAAAIAAAACAAAAAgAAAAIAAAACAAAAAgAAAAMAAAACAAAAAgAAAAIAAAACAAAAAgAAAAMAAAACAAAAAgAAAAIAAAACAAAAAgAAAAIAAAADAAAAAgAAAAIAAAACAAAAAgAAAAIAAAADAAAAAgAAAAIAAAACAAAAAgAAAAIAAAACAAAAAwAAAAIAAAACAAAAAgAAAAIAAAACAAAAAgAAAAMAAAACAAAAAgAAAAIAAAACAAAAAgAAAAMAAAACAAAAAgAAAAIAAAACAAAAAgAAAAIAAAADAAAAAgAAAAIAAAACAAAAAgAAAAIAAAADAAAAAgAAAAIAAAACAAAAAgAAAAIAAAACAAAAAwAAAAIAAAACAAAAAgAAAAIAAAACAAAAAgAAAAMAAAACAAAAAgAAAAQAAAAFAAAABAAAAAQAAAAEAAAABQAAAAQAAAAEAAAABQAAAAQAAAAEAAAABQAAAAQAAAAEAAAABAAAAAUAAAAEAAAABAAAAAUAAAAEAAAABAAAAAUAAAAEAAAABAAAAAUAAAAEAAAABAAAAAQAAAAFAAAABAAAAAQAAAAFAAAABAAAAAQAAAAFAAAABAAAAAQAAAAEAAAABQAAAAQAAAAEAAAABQAAAAQAAAAEAAAABQAAAAQAAAAEAAAABAAAAAUAAAAEAAAABAAAAAUAAAAEAAAABAAAAAUAAAAEAAAABAAAAAQAAAAFAAAABAAAAAQAAAAFAAAABAAAAAQAAAAFAAAABAAAAAQAAAAFAAAABAAAAAQAAAAEAAAABQAAAAQAAAAEAAAABQAAAAQAAAAEAAAABQAAAAQAAAAEAAAABAAAAAUAAAAEAAAABAAAAAUAAAAEAAAABAAAAAUAAAAEAAAABAAAAAQAAAAFAAAABAAAAAQAAAAFAAAABAAAAAQAAAAFAAAABAAAAAQAAAAFAAAABAAAAAQAAAAEAAAABQAAAAQAAAAEAAAABQAAAAQAAAAEAAAABQAAAAQAAAAEAAAABAAAAAUAAAAEAAAABAAAAAUAAAAEAAAABAAAAAUAAAAEAAAABAAAAAQAAAAFAAAABAAAAAQAAAAFAAAABAAAAAQAAAAFAAAABAAAAAQAAAAFAAAABAAAAAQAAAAEAAAABQAAAAQAAAAEAAAABQAAAAQAAAAEAAAABQAAAAQAAAAEAAAABAAAAAUAAAAEAAAABAAAAAUAAAAEAAAABAAAAAUAAAAEAAAABAAAAAQAAAAFAAAABAAAAAQAAAAFAAAABAAAAAQAAAAFAAAABAAAAAQAAAAFAAAABAAAAAQAAAAEAAAABQAAAAQAAAAEAAAABQAAAAQAAAAEAAAABQAAAAQAAAAEAAAABAAAAAUAAAAEAAAABAAAAAUAAAAEAAAABAAAAAUAAAAEAAAABAAAAAQAAAAFAAAABAAAAAQAAAAFAAAABAAAAAQAAAAFAAAABAAAAAQAAAAEAAAABQAAAAQAAAAEAAAABQAAAAQAAAAEAAAABQAAAAQAAAAEAAAABQAAAAQAAAAEAAAABAAAAAUAAAAEAAAABAAAAAUAAAAEAAAABAAAAAUAAAAEAAAABAAAAAQAAAAFAAAABAAAAAQAAAAFAAAABAAAAAQAAAAFAAAABAAAAAQAAAAEAAAABQAAAAQAAAAEAAAABQAAAAQAAAAEAAAABQAAAAQAAAAEAAAABQAAAAQAAAAEAAAABAAAAAUAAAAEAAAABAAAAAUAAAAEAAAABAAAAAUAAAAEAAAABAAAAAQAAAAFAAAABAAAAAQAAAAFAAAABAAAAAQAAAAFAAAABAAAAAQAAAAEAAAABQAAAAQAAAAEAAAABQAAAAQAAAAEAAAABQAAAAQAAAAEAAAABQAAAAQAAAAEAAAABAAAAAUAAAAEAAAABAAAAAUAAAAEAAAABAAAAAUAAAAEAAAABAAAAAQAAAAFAAAABAAAAAQAAAAFAAAABAAAAAQAAAAFAAAABAAAAAQAAAAEAAAABQAAAAQAAAAEAAAABQAAAAQAAAAEAAAABQAAAAQAAAAEAAAABAAAAAUAAAAEAAAABAAAAAUAAAAEAAAABAAAAAUAAAAEAAAABAAAAAUAAAAEAAAABAAAAAQAAAAFAAAABAAAAAQAAAAFAAAABAAAAAQAAAAFAAAABAAAAAQAAAAEAAAABQAAAAQAAAAEAAAABQAAAAQAAAAEAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAA="}},"source":"summary"},{"label":"Ping-Pong (512B)","metrics":{"filename":"sockperf_single_pingpong_512B.txt","version":"3.7-no.git","protocol":"UDP","target_ip":"192.168.1.3","target_port":11111,"run_time_sec":20.0,"warmup_msec":400.0,"sent_messages":139285,"received_messages":139284,"packet_loss_pct":0.0007179523997535853,"avg_latency_us":71.744,"std_dev_us":23.702,"jitter_us":23.702,"min_latency_us":51.185,"max_latency_us":589.313,"total_observations":136180,"percentiles":{"99.999":491.367,"99.99":294.506,"99.9":215.2,"99.0":156.674,"90.0":111.548,"75.0":65.56,"50.0":61.104,"25.0":59.906},"valid_sent":136180,"valid_received":136180,"errors":[],"test_type":"ping-pong","msg_size":512,"topology":"single","run_date":"2025-11-05"},"histogram":{"digits":3,"count":136180,"mean_us":71.744,"std_dev_us":23.702,"min_us":51.185,"max_us":589.313,"upper_us":{"dtype":"<f4","b64":"x8tMQovsTEJQDU1CFC5NQtlOTUKeb01CYpBNQiexTULs0U1CsPJNQnUTTkI5NE5C/lROQsN1TkKHlk5CTLdOQhDYTkLV+E5CmhlPQl46T0IjW09C53tPQqycT0JxvU9CNd5PQvr+T0K+H1BCg0BQQkhhUEIMglBC0aJQQpbDUEJa5FBCHwVRQuMlUUKoRlFCbWdRQjGIUUL2qFFCuslRQn/qUUJEC1JCCCxSQs1MUkKRbVJCVo5SQhuvUkLfz1JCpPBSQmgRU0ItMlNC8lJTQrZzU0J7lFNCP7VTQgTWU0LJ9lNCjRdUQlI4VEIXWVRC23lUQqCaVEJku1RCKdxUQu78VEKyHVVCdz5VQjtfVUIAgFVCxaBVQonBVUJO4lVCEgNWQtcjVkKcRFZCYGVWQiWGVkLpplZCrsdWQnPoVkI3CVdC/ClXQsFKV0KFa1dCSoxXQg6tV0LTzVdCmO5XQlwPWEIhMFhC5VBYQqpxWEJvklhCM7NYQvjTWEK89FhCgRVZQkY2WUIKV1lCz3dZQpOYWUJYuVlCHdpZQuH6WUKmG1pCajxaQi9dWkL0fVpCuJ5aQn2/WkJC4FpCBgFbQsshW0KPQltCVGNbQhmEW0LdpFtCosVbQmbmW0IrB1xC8CdcQrRIXEJ5aVxCPYpcQgKrXELHy1xCi+xcQlANXUIULl1C2U5dQp5vXUJikF1CJ7FdQuzRXUKw8l1CdRNeQjk0XkL+VF5Cw3VeQoeWXkJMt15CENheQtX4XkKaGV9CXjpfQiNbX0Lne19CrJxfQnG9X0I13l9C+v5fQr4fYEKDQGBCSGFgQgyCYELRomBClsNgQlrkYEIfBWFC4yVhQqhGYUJtZ2FCMYhhQvaoYUK6yWFCf+phQkQLYkIILGJCzUxiQpFtYkJWjmJCG69iQt/PYkKk8GJCaBFjQi0yY0LyUmNCtnNjQnuUY0I/tWNCBNZjQsn2Y0KNF2RCUjhkQhdZZELbeWRCoJpkQmS7ZEIp3GRC7vxkQrIdZUJ3PmVCO19lQgCAZULFoGVCicFlQk7iZUISA2ZC1yNmQpxEZkJgZWZCJYZmQummZkKux2ZCc+hmQjcJZ0L8KWdCwUpnQoVrZ0JKjGdCDq1nQtPNZ0KY7mdCXA9oQiEwaELlUGhCqnFoQm+SaEIzs2hC+NNoQrz0aEKBFWlCRjZpQgpXaULPd2lCk5hpQli5aUId2mlC4fppQqYbakJqPGpCL11qQvR9akK4nmpCfb9qQkLgakIGAWtCyyFrQo9Ca0JUY2tCGYRrQt2ka0KixWtCZuZrQisHbELwJ2xCtEhsQnlpbEI9imxCAqtsQsfLbEKL7GxCUA1tQhQubULZTm1Cnm9tQmKQbUInsW1C7NFtQrDybUJ1E25COTRuQv5UbkLDdW5Ch5ZuQky3bkIQ2G5C1fhuQpoZb0JeOm9CI1tvQud7b0KsnG9Ccb1vQjXeb0L6/m9Cvh9wQoNAcEJIYXBCDIJwQtGicEKWw3BCWuRwQh8FcULjJXFCqEZxQm1ncUIxiHFC9qhxQrrJcUJ/6nFCRAtyQggsckLNTHJCkW1yQlaOckIbr3JC389yQqTwckJoEXNCLTJzQvJSc0K2c3NCe5RzQj+1c0IE1nNCyfZzQo0XdEJSOHRCF1l0Qtt5dEKgmnRCZLt0QincdELu/HRCsh11Qnc+dUI7X3VCAIB1QsWgdUKJwXVCTuJ1QhIDdkLXI3ZCnER2QmBldkIlhnZC6aZ2Qq7HdkJz6HZCNwl3Qvwpd0LBSndChWt3QkqMd0IOrXdC0813Qpjud0JcD3hCITB4QuVQeEKqcXhCb5J4QjOzeEL403hCvPR4QoEVeUJGNnlCCld5Qs93eUKTmHlCWLl5Qh3aeULh+nlCpht6Qmo8ekIvXXpC9H16QrieekJ9v3pCQuB6QgYBe0LLIXtCj0J7QlRje0IZhHtC3aR7QqLFe0Jm5ntCKwd8QvAnfEK0SHxCeWl8Qj2KfEICq3xCx8t8QovsfEJQDX1CFC59QtlOfUKeb31CYpB9QiexfULs0X1CsPJ9QnUTfkI5NH5C/lR+QsN1fkKHln5CTLd+QhDYfkLV+H5Cmhl/Ql46f0IjW39C53t/Qqycf0JxvX9CNd5/Qvr+f0LfD4BCQiCAQqQwgEIGQYBCaFGAQsthgEItcoBCj4KAQvKSgEJUo4BCtrOAQhnEgEJ71IBC3eSAQj/1gEKiBYFCBBaBQmYmgULJNoFCK0eBQo1XgULwZ4FCUniBQrSIgUIXmYFCeamBQtu5gUI9yoFCoNqBQgLrgUJk+4FCxwuCQikcgkKLLIJC7jyCQlBNgkKyXYJCFG6CQnd+gkLZjoJCO5+CQp6vgkIAwIJCYtCCQsXggkIn8YJCiQGDQuwRg0KwMoNCdVODQjl0g0L+lINCw7WDQofWg0JM94NCEBiEQtU4hEKaWYRCXnqEQiObhELnu4RCrNyEQnH9hEI1HoVC+j6FQr5fhUKDgIVCSKGFQgzChULR4oVClgOGQlokhkIfRYZC42WGQqiGhkJtp4ZCMciGQvbohkK6CYdCfyqHQkRLh0IIbIdCzYyHQpGth0JWzodCG++HQt8PiEKkMIhCaFGIQi1yiELykohCtrOIQnvUiEI/9YhCBBaJQsk2iUKNV4lCUniJQheZiULbuYlCoNqJQmT7iUIpHIpC7jyKQrJdikJ3fopCO5+KQgDAikLF4IpCiQGLQk4ii0ISQ4tC12OLQpyEi0JgpYtCJcaLQunmi0KuB4xCcyiMQjdJjEL8aYxCwYqMQoWrjEJKzIxCDu2MQtMNjUKYLo1CXE+NQiFwjULlkI1CqrGNQm/SjUIz841C+BOOQrw0jkKBVY5CRnaOQgqXjkLPt45Ck9iOQlj5jkIdGo9C4TqPQqZbj0JqfI9CL52PQvS9j0K43o9Cff+PQkIgkEIGQZBCy2GQQo+CkEJUo5BCGcSQQt3kkEKiBZFCZiaRQitHkULwZ5FCtIiRQnmpkUI9ypFCAuuRQscLkkKLLJJCUE2SQhRukkLZjpJCnq+SQmLQkkIn8ZJC7BGTQrAyk0J1U5NCOXSTQv6Uk0LDtZNCh9aTQkz3k0IQGJRC1TiUQppZlEJeepRCI5uUQue7lEKs3JRCcf2UQjUelUL6PpVCvl+VQoOAlUJIoZVCDMKVQtHilUKWA5ZCWiSWQh9FlkLjZZZCqIaWQm2nlkIxyJZC9uiWQroJl0J/KpdCREuXQghsl0LNjJdCka2XQlbOl0Ib75dC3w+YQqQwmEJoUZhCLXKYQvKSmEK2s5hCe9SYQj/1mEIEFplCyTaZQo1XmUJSeJlCF5mZQtu5mUKg2plCZPuZQikcmkLuPJpCsl2aQnd+mkI7n5pCAMCaQsXgmkKJAZtCTiKbQhJDm0LXY5tCnISbQmClm0IlxptC6eabQq4HnEJzKJxCN0mcQvxpnELBipxChaucQkrMnEIO7ZxC0w2dQpgunUJcT51CIXCdQuWQnUKqsZ1Cb9KdQjPznUL4E55CvDSeQoFVnkJGdp5CCpeeQs+3nkKT2J5CWPmeQh0an0LhOp9CplufQmp8n0IvnZ9C9L2fQrjen0J9/59CQiCgQgZBoELLYaBCj4KgQlSjoEIZxKBC3eSgQqIFoUJmJqFCK0ehQvBnoUK0iKFCeamhQj3KoUIC66FCxwuiQossokJQTaJCFG6iQtmOokKer6JCYtCiQifxokLsEaNCsDKjQnVTo0I5dKNC/pSjQsO1o0KH1qNCTPejQhAYpELVOKRCmlmkQl56pEIjm6RC57ukQqzcpEJx/aRCNR6lQvo+pUK+X6VCg4ClQkihpUIMwqVC0eKlQpYDpkJaJKZCH0WmQuNlpkKohqZCbaemQjHIpkL26KZCugmnQn8qp0JES6dCCGynQs2Mp0KRradCVs6nQhvvp0LfD6hCpDCoQmhRqEItcqhC8pKoQrazqEJ71KhCP/WoQgQWqULJNqlCjVepQlJ4qUIXmalC27mpQqDaqUJk+6lCKRyqQu48qkKyXapCd36qQjufqkIAwKpCxeCqQokBq0JOIqtCEkOrQtdjq0KchKtCYKWrQiXGq0Lp5qtCrgesQnMorEI3SaxC/GmsQsGKrEKFq6xCSsysQg7trELTDa1CmC6tQlxPrUIhcK1C5ZCtQqqxrUJv0q1CM/OtQvgTrkK8NK5CgVWuQkZ2rkIKl65Cz7euQpPYrkJY+a5CHRqvQuE6r0KmW69CanyvQi+dr0L0va9CuN6vQn3/r0JCILBCBkGwQsthsEKPgrBCVKOwQhnEsELd5LBCogWxQmYmsUIrR7FC8GexQrSIsUJ5qbFCPcqxQgLrsULHC7JCiyyyQlBNskIUbrJC2Y6yQp6vskJi0LJCJ/GyQuwRs0KwMrNCdVOzQjl0s0L+lLNCw7WzQofWs0JM97NCEBi0QtU4tEKaWbRCXnq0QiObtELnu7RCrNy0QnH9tEI1HrVC+j61Qr5ftUKDgLVCSKG1QgzCtULR4rVClgO2QloktkIfRbZC42W2QqiGtkJtp7ZCMci2QvbotkK6CbdCfyq3QkRLt0IIbLdCzYy3QpGtt0JWzrdCG++3Qt8PuEKkMLhCaFG4Qi1yuELykrhCtrO4QnvUuEI/9bhCBBa5Qsk2uUKNV7lCUni5QheZuULbublCoNq5QmT7uUIpHLpC7jy6QrJdukJ3frpCO5+6QgDAukLF4LpCiQG7Qk4iu0ISQ7tC12O7QpyEu0JgpbtCJca7Qunmu0KuB7xCcyi8QjdJvEL8abxCwYq8QoWrvEJKzLxCDu28QtMNvUKYLr1CXE+9QiFwvULlkL1CqrG9Qm/SvUIz871C+BO+Qrw0vkKBVb5CRna+QgqXvkLPt75Ck9i+Qlj5vkIdGr9C4Tq/QqZbv0JqfL9CL52/QvS9v0K43r9Cff+/QkIgwEIGQcBCy2HAQo+CwEJUo8BCGcTAQt3kwEKiBcFCZibBQitHwULwZ8FCtIjBQnmpwUI9ysFCAuvBQscLwkKLLMJCUE3CQhRuwkLZjsJCnq/CQmLQwkIn8cJC7BHDQrAyw0J1U8NCOXTDQv6Uw0LDtcNCh9bDQkz3w0IQGMRC1TjEQppZxEJeesRCI5vEQue7xEKs3MRCcf3EQjUexUL6PsVCvl/FQoOAxUJIocVCDMLFQtHixUKWA8ZCWiTGQh9FxkLjZcZCqIbGQm2nxkIxyMZC9ujGQroJx0J/KsdCREvHQghsx0LNjMdCka3HQlbOx0Ib78dC3w/IQqQwyEJoUchCLXLIQvKSyEK2s8hCe9TIQj/1yEIEFslCyTbJQo1XyUJSeMlCF5nJQtu5yUKg2slCZPvJQikcykLuPMpCsl3KQnd+ykI7n8pCAMDKQsXgykKJActCTiLLQhJDy0LXY8tCnITLQmCly0IlxstC6ebLQq4HzEJzKMxCN0nMQvxpzELBisxChavMQkrMzEIO7cxC0w3NQpguzUJcT81CIXDNQuWQzUKqsc1Cb9LNQjPzzUL4E85CvDTOQoFVzkJGds5CCpfOQs+3zkKT2M5CWPnOQh0az0LhOs9CplvPQmp8z0Ivnc9C9L3PQrjez0J9/89CQiDQQgZB0ELLYdBCj4LQQlSj0EIZxNBC3eTQQqIF0UJmJtFCK0fRQvBn0UK0iNFCeanRQj3K0UIC69FCxwvSQoss0kJQTdJCFG7SQtmO0kKer9JCYtDSQifx0kLsEdNCsDLTQnVT00I5dNNC/pTTQsO100KH1tNCTPfTQhAY1ELVONRCmlnUQl561EIjm9RC57vUQqzc1EJx/dRCNR7VQvo+1UK+X9VCg4DVQkih1UIMwtVC0eLVQpYD1kJaJNZCH0XWQuNl1kKohtZCbafWQjHI1kL26NZCugnXQn8q10JES9dCCGzXQs2M10KRrddCVs7XQhvv10LfD9hCpDDYQmhR2EItcthC8pLYQraz2EJ71NhCP/XYQgQW2ULJNtlCjVfZQlJ42UIXmdlC27nZQqDa2UJk+9lCKRzaQu482kKyXdpCd37aQjuf2kIAwNpCxeDaQokB20JOIttCEkPbQtdj20KchNtCYKXbQiXG20Lp5ttCrgfcQnMo3EI3SdxC/GncQsGK3EKFq9xCSszcQg7t3ELTDd1CmC7dQlxP3UIhcN1C5ZDdQqqx3UJv0t1CM/PdQvgT3kK8NN5CgVXeQkZ23kIKl95Cz7feQpPY3kJY+d5CHRrfQuE630KmW99CanzfQi+d30L0vd9CuN7fQn3/30JCIOBCBkHgQsth4EKPguBCVKPgQhnE4ELd5OBCogXhQmYm4UIrR+FC8GfhQrSI4UJ5qeFCPcrhQgLr4ULHC+JCiyziQlBN4kIUbuJC2Y7iQp6v4kJi0OJCJ/HiQuwR40KwMuNCdVPjQjl040L+lONCw7XjQofW40JM9+NCEBjkQtU45EKaWeRCXnrkQiOb5ELnu+RCrNzkQnH95EI1HuVC+j7lQr5f5UKDgOVCSKHlQgzC5ULR4uVClgPmQlok5kIfReZC42XmQqiG5kJtp+ZCMcjmQvbo5kK6CedCfyrnQkRL50IIbOdCzYznQpGt50JWzudCG+/nQt8P6EKkMOhCaFHoQi1y6ELykuhCtrPoQnvU6EI/9ehCBBbpQsk26UKNV+lCUnjpQheZ6ULbuelCoNrpQmT76UIpHOpC7jzqQrJd6kJ3fupCO5/qQgDA6kLF4OpCiQHrQk4i60ISQ+tC12PrQpyE60JgpetCJcbrQunm60KuB+xCcyjsQjdJ7EL8aexCwYrsQoWr7EJKzOxCDu3sQtMN7UKYLu1CXE/tQiFw7ULlkO1CqrHtQm/S7UIz8+1C+BPuQrw07kKBVe5CRnbuQgqX7kLPt+5Ck9juQlj57kIdGu9C4TrvQqZb70JqfO9CL53vQvS970K43u9Cff/vQkIg8EIGQfBCy2HwQo+C8EJUo/BCGcTwQt3k8EKiBfFCZibxQitH8ULwZ/FCtIjxQnmp8UI9yvFCAuvxQscL8kKLLPJCUE3yQhRu8kLZjvJCnq/yQmLQ8kIn8fJC7BHzQrAy80J1U/NCOXTzQv6U80LDtfNCh9bzQkz380IQGPRC1Tj0QppZ9EJeevRCI5v0Que79EKs3PRCcf30QjUe9UL6PvVCvl/1QoOA9UJIofVCDML1QtHi9UKWA/ZCWiT2Qh9F9kLjZfZCqIb2Qm2n9kIxyPZC9uj2QroJ90J/KvdCREv3Qghs90LNjPdCka33QlbO90Ib7/dC3w/4QqQw+EJoUfhCLXL4QvKS+EK2s/hCe9T4Qj/1+EIEFvlCyTb5Qo1X+UJSePlCF5n5Qtu5+UKg2vlCZPv5Qikc+kLuPPpCsl36Qnd++kI7n/pCAMD6QsXg+kKJAftCTiL7QhJD+0LXY/tCnIT7QmCl+0IlxvtC6eb7Qq4H/EJzKPxCN0n8Qvxp/ELBivxChav8QkrM/EIO7fxC0w39Qpgu/UJcT/1CIXD9QuWQ/UKqsf1Cb9L9QjPz/UL4E/5CvDT+QoFV/kJGdv5CCpf+Qs+3/kKT2P5CWPn+Qh0a/0LhOv9Cplv/Qmp8/0Ivnf9C9L3/Qrje/0J9//9CIRAAQ4MgAEPlMABDSEEAQ6pRAEMMYgBDb3IAQ9GCAEMzkwBDlqMAQ/izAENaxABDvNQAQx/lAEOB9QBD4wUBQ0YWAUOoJgFDCjcBQ21HAUPPVwFDMWgBQ5N4AUP2iAFDWJkBQ7qpAUMdugFDf8oBQ+HaAUNE6wFDpvsBQwgMAkNqHAJDzSwCQy89AkORTQJD9F0CQ1ZuAkO4fgJDG48CQ32fAkPfrwJDQsACQ6TQAkMG4QJDaPECQ8sBA0MtEgND8jIDQ7ZTA0N7dANDP5UDQwS2A0PJ1gNDjfcDQ1IYBEMXOQRD21kEQ6B6BENkmwRDKbwEQ+7cBEOy/QRDdx4FQzs/BUMAYAVDxYAFQ4mhBUNOwgVDEuMFQ9cDBkOcJAZDYEUGQyVmBkPphgZDrqcGQ3PIBkM36QZD/AkHQ8EqB0OFSwdDSmwHQw6NB0PTrQdDmM4HQ1zvB0MhEAhD5TAIQ6pRCENvcghDM5MIQ/izCEO81AhDgfUIQ0YWCUMKNwlDz1cJQ5N4CUNYmQlDHboJQ+HaCUOm+wlDahwKQy89CkP0XQpDuH4KQ32fCkNCwApDBuEKQ8sBC0OPIgtDVEMLQxlkC0PdhAtDoqULQ2bGC0Mr5wtD8AcMQ7QoDEN5SQxDPWoMQwKLDEPHqwxDi8wMQ1DtDEMUDg1D2S4NQ55PDUNicA1DJ5ENQ+yxDUOw0g1DdfMNQzkUDkP+NA5Dw1UOQ4d2DkNMlw5DELgOQ9XYDkOa+Q5DXhoPQyM7D0PnWw9DrHwPQ3GdD0M1vg9D+t4PQ77/D0ODIBBDSEEQQwxiEEPRghBDlqMQQ1rEEEMf5RBD4wURQ6gmEUNtRxFDMWgRQ/aIEUO6qRFDf8oRQ0TrEUMIDBJDzSwSQ5FNEkNWbhJDG48SQ9+vEkOk0BJDaPESQy0SE0PyMhNDtlMTQ3t0E0M/lRNDBLYTQ8nWE0ON9xNDUhgUQxc5FEPbWRRDoHoUQ2SbFEMpvBRD7twUQ7L9FEN3HhVDOz8VQwBgFUPFgBVDiaEVQ07CFUMS4xVD1wMWQ5wkFkNgRRZDJWYWQ+mGFkOupxZDc8gWQzfpFkP8CRdDwSoXQ4VLF0NKbBdDDo0XQ9OtF0OYzhdDXO8XQyEQGEPlMBhDqlEYQ29yGEMzkxhD+LMYQ7zUGEOB9RhDRhYZQwo3GUPPVxlDk3gZQ1iZGUMduhlD4doZQ6b7GUNqHBpDLz0aQ/RdGkO4fhpDfZ8aQ0LAGkMG4RpDywEbQ48iG0NUQxtDGWQbQ92EG0OipRtDZsYbQyvnG0PwBxxDtCgcQ3lJHEM9ahxDAoscQ8erHEOLzBxDUO0cQxQOHUPZLh1Dnk8dQ2JwHUMnkR1D7LEdQ7DSHUN18x1DORQeQ/40HkPDVR5Dh3YeQ0yXHkMQuB5D1dgeQ5r5HkNeGh9DIzsfQ+dbH0OsfB9DcZ0fQzW+H0P63h9Dvv8fQ4MgIENIQSBDDGIgQ9GCIEOWoyBDWsQgQx/lIEPjBSFDqCYhQ21HIUMxaCFD9oghQ7qpIUN/yiFDROshQwgMIkPNLCJDkU0iQ1ZuIkMbjyJD368iQ6TQIkNo8SJDLRIjQ/IyI0O2UyNDe3QjQz+VI0MEtiNDydYjQ433I0NSGCRDFzkkQ9tZJEOgeiRDZJskQym8JEPu3CRDsv0kQ3ceJUM7PyVDAGAlQ8WAJUOJoSVDTsIlQxLjJUPXAyZDnCQmQ2BFJkMlZiZD6YYmQ66nJkNzyCZDN+kmQ/wJJ0PBKidDhUsnQ0psJ0MOjSdD060nQ5jOJ0Nc7ydDIRAoQ+UwKEOqUShDb3IoQzOTKEP4syhDvNQoQ4H1KENGFilDCjcpQ89XKUOTeClDWJkpQx26KUPh2ilDpvspQ2ocKkMvPSpD9F0qQ7h+KkN9nypDQsAqQwbhKkPLAStDjyIrQ1RDK0MZZCtD3YQrQ6KlK0NmxitDK+crQ/AHLEO0KCxDeUksQz1qLEMCiyxDx6ssQ4vMLENQ7SxDFA4tQ9kuLUOeTy1DYnAtQyeRLUPssS1DsNItQ3XzLUM5FC5D/jQuQ8NVLkOHdi5DTJcuQxC4LkPV2C5DmvkuQ14aL0MjOy9D51svQ6x8L0NxnS9DNb4vQ/reL0O+/y9DgyAwQ0hBMEMMYjBD0YIwQ5ajMENaxDBDH+UwQ+MFMUOoJjFDbUcxQzFoMUP2iDFDuqkxQ3/KMUNE6zFDCAwyQ80sMkORTTJDVm4yQxuPMkPfrzJDpNAyQ2jxMkMtEjND8jIzQ7ZTM0N7dDNDP5UzQwS2M0PJ1jNDjfczQ1IYNEMXOTRD21k0Q6B6NENkmzRDKbw0Q+7cNEOy/TRDdx41Qzs/NUMAYDVDxYA1Q4mhNUNOwjVDEuM1Q9cDNkOcJDZDYEU2QyVmNkPphjZDrqc2Q3PINkM36TZD/Ak3Q8EqN0OFSzdDSmw3Qw6NN0PTrTdDmM43Q1zvN0MhEDhD5TA4Q6pROENvcjhDM5M4Q/izOEO81DhDgfU4Q0YWOUMKNzlDz1c5Q5N4OUNYmTlDHbo5Q+HaOUOm+zlDahw6Qy89OkP0XTpDuH46Q32fOkNCwDpDBuE6Q8sBO0OPIjtDVEM7QxlkO0PdhDtDoqU7Q2bGO0Mr5ztD8Ac8Q7QoPEN5STxDPWo8QwKLPEPHqzxDi8w8Q1DtPEMUDj1D2S49Q55PPUNicD1DJ5E9Q+yxPUOw0j1DdfM9QzkUPkP+ND5Dw1U+Q4d2PkNMlz5DELg+Q9XYPkOa+T5DXho/QyM7P0PnWz9DrHw/Q3GdP0M1vj9D+t4/Q77/P0ODIEBDSEFAQwxiQEPRgkBDlqNAQ1rEQEMf5UBD4wVBQ6gmQUNtR0FDMWhBQ/aIQUO6qUFDf8pBQ0TrQUMIDEJDzSxCQ5FNQkNWbkJDG49CQ9+vQkOk0EJDaPFCQy0SQ0PyMkNDtlNDQ3t0Q0M/lUNDBLZDQ8nWQ0ON90NDUhhEQxc5REPbWURDoHpEQ2SbREMpvERD7txEQ7L9REN3HkVDOz9FQwBgRUPFgEVDiaFFQ07CRUMS40VD1wNGQ5wkRkNgRUZDJWZGQ+mGRkOup0ZDc8hGQzfpRkP8CUdDwSpHQ4VLR0NKbEdDDo1HQ9OtR0OYzkdDXO9HQyEQSEPlMEhDqlFIQ29ySEMzk0hD+LNIQ7zUSEOB9UhDRhZJQwo3SUPPV0lDk3hJQ1iZSUMduklD4dpJQ6b7SUNqHEpDLz1KQ/RdSkO4fkpDfZ9KQ0LASkMG4UpDywFLQ48iS0NUQ0tDGWRLQ92ES0OipUtDZsZLQyvnS0PwB0xDtChMQ3lJTEM9akxDAotMQ8erTEOLzExDUO1MQxQOTUPZLk1Dnk9NQ2JwTUMnkU1D7LFNQ7DSTUN1801DORROQ/40TkPDVU5Dh3ZOQ0yXTkMQuE5D1dhOQ5r5TkNeGk9DIztPQ+dbT0OsfE9DcZ1PQzW+T0P63k9Dvv9PQ4MgUENIQVBDDGJQQ9GCUEOWo1BDWsRQQx/lUEPjBVFDqCZRQ21HUUMxaFFD9ohRQ7qpUUN/ylFDROtRQwgMUkPNLFJDkU1SQ1ZuUkMbj1JD369SQ6TQUkNo8VJDLRJTQ/IyU0O2U1NDe3RTQz+VU0MEtlNDydZTQ433U0NSGFRDFzlUQ9tZVEOgelRDZJtUQym8VEPu3FRDsv1UQ3ceVUM7P1VDAGBVQ8WAVUOJoVVDTsJVQxLjVUPXA1ZDnCRWQ2BFVkMlZlZD6YZWQ66nVkNzyFZDN+lWQ/wJV0PBKldDhUtXQ9OtV0OqUVhDgfVYQ1iZWUMvPVpDBuFaQ6KlW0N5SVxDUO1cQyeRXUP+NF5D1dheQ6x8X0ODIGBDWsRgQzFoYUMIDGJD369iQ7ZTY0ON92NDZJtkQzs/ZUMS42VD6YZmQ4VLZ0Nc72dDM5NoQwo3aUPh2mlDuH5qQ48ia0NmxmtDPWpsQxQObUPssW1Dw1VuQ5r5bkNxnW9DSEFwQx/lcEP2iHFDzSxyQ2jxckM/lXNDFzl0Q+7cdEPFgHVDnCR2Q3PIdkNKbHdDIRB4Q/izeEPPV3lDpvt5Q32fekNUQ3tDK+d7QwKLfEPZLn1DsNJ9Q0yXfkMjO39D+t5/Q2hBgENUk4BDP+WAQys3gUMXiYFDAtuBQ+4sgkPZfoJDxdCCQxIzg0OcdIND6daDQ3MYhEPBeoRDSryEQ5gehUPlgIVDb8KFQ7wkhkNGZoZDk8iGQx0Kh0NqbIdD9K2HQ0IQiEPLUYhDGbSIQ6L1iEPwV4lDeZmJQ8f7iUNQPYpDnp+KQyfhikN1Q4tDw6WLQ0zni0OaSYxDI4uMQ3HtjEP6Lo1DSJGNQ9HSjUMfNY5DqHaOQ/bYjkN/Go9DzXyPQ1a+j0OkIJBDLWKQQ3vEkEPJJpFDUmiRQ6DKkUMpDJJDd26SQwCwkkNOEpNDNzmUQ5pJnEP8WaRDXmqsQ/xZtENearxDwXrEQyOLzEPBetRDI4vcQ4Wb5EMji+xDhZv0QyVeCkQ="},"counts":{"dtype":"<u4","b64":"OQAAAH0AAAB8AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB9AAAAfAAAAH0AAAB9AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB9AAAAfAAAAH0AAAB9AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB9AAAAfQAAAHwAAAB9AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB8AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB8AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB9AAAAfAAAAH0AAAB9AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB9AAAAfQAAAHwAAAB9AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB8AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB8AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB9AAAAfAAAAH0AAAB9AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB9AAAAfQAAAHwAAAB9AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB8AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB8AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB9AAAAfAAAAH0AAAB9AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB9AAAAfQAAAHwAAAB9AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB8AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB8AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB9AAAAfAAAAH0AAAB9AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB9AAAAfQAAAHwAAAB9AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB9AAAAfQAAAHwAAAB9AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB9AAAAfQAAAH0AAAB8AAAAfQAAAH0AAAB9AAAAUAMAAI4DAACNAwAAjQMAAI4DAACNAwAAjgMAAI0DAACNAwAAjgMAAI0DAACOAwAAjQMAAI0DAACOAwAAjQMAAI0DAACOAwAAjQMAAI4DAACNAwAAjQMAAI4DAACNAwAAjgMAAI0DAACNAwAAjgMAAI0DAACNAwAAjgMAAI0DAACOAwAAjQMAAI0DAACOAwAAjQMAAEsCAAD1AAAA9AAAAPUAAAD0AAAA9QAAAPQAAAD1AAAA9AAAAPUAAAD0AAAA9QAAAPQAAAD1AAAA9AAAAPUAAAD0AAAA9QAAAPQAAAD1AAAA9AAAAPUAAAD0AAAA9QAAAPQAAAD1AAAA9AAAAPUAAAD0AAAA9QAAAPQAAAD1AAAA9AAAAPUAAAD0AAAA9QAAAPQAAAD0AAAA9QAAAPQAAAD1AAAA9AAAAPUAAAD0AAAA9QAAAPQAAAD1AAAA9AAAAPUAAAD0AAAA9QAAAPQAAAD1AAAA9AAAAPUAAAD0AAAA9QAAAPQAAAD1AAAA9AAAAPUAAAD0AAAA9QAAAPQAAAD1AAAA9AAAAPUAAAD0AAAA9QAAAPQAAAD1AAAA9AAAAPUAAAD0AAAA9QAAAPQAAAD1AAAA9AAAAPUAAAD0AAAA9AAAAPUAAAD0AAAA9QAAAPQAAAD1AAAA9AAAAPUAAAD0AAAA9QAAAPQAAAD1AAAA9AAAAPUAAAD0AAAA9QAAAPQAAAD1AAAA9AAAAPUAAAD0AAAA9QAAAPQAAAD1AAAA9AAAAPUAAAD0AAAA9QAAAPQAAAD1AAAA9AAAAPUAAAD0AAAA9QAAAPQAAAD1AAAA9AAAAPUAAAD0AAAA9QAAAPQAAAD1AAAA9AAAAPQAAAD1AAAA9AAAAPUAAAD0AAAA9QAAAPQAAAD1AAAA9AAAAPUAAAD0AAAA9QAAAPQAAAD1AAAA9AAAAPUAAADNAAAAHAAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAcAAAAHQAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAdAAAAHAAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAcAAAAHQAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAdAAAAHAAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAdAAAAHAAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAcAAAAHQAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAdAAAAHAAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAcAAAAHQAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAdAAAAHAAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAcAAAAHQAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAdAAAAHAAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAcAAAAHQAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAdAAAAHAAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAcAAAAHQAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAdAAAAHAAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAcAAAAHQAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAdAAAAHAAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAcAAAAHQAAABwAAAAdAAAAHAAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAcAAAAHQAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAdAAAAHAAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAcAAAAHQAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAdAAAAHAAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAcAAAAHQAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAdAAAAHAAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAcAAAAHQAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAdAAAAHAAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAcAAAAHQAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAdAAAAHAAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAcAAAAHQAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAdAAAAHAAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAcAAAAHQAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAcAAAAHQAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAdAAAAHAAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAcAAAAHQAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAdAAAAHAAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAcAAAAHQAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAdAAAAHAAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAcAAAAHQAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAdAAAAHAAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAcAAAAHQAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAdAAAAHAAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAcAAAAHQAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAdAAAAHAAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAcAAAAHQAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAdAAAAHAAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAdAAAAHAAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAcAAAAHQAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAdAAAAHAAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAcAAAAHQAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAdAAAAHAAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAcAAAAHQAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAdAAAAHAAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAcAAAAHQAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAdAAAAHAAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAcAAAAHQAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAdAAAAHAAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAcAAAAHQAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAdAAAAHAAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAcAAAAHQAAABwAAAAdAAAAHAAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAcAAAAHQAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAdAAAAHAAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAcAAAAHQAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAdAAAAHAAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAcAAAAHQAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAdAAAAHAAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAcAAAAHQAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHAAAAB0AAAAcAAAAHQAAABwAAAAdAAAAHAAAABwAAAAdAAAAHAAAAB0AAAAcAAAAHAAAABEAAAASAAAAEQAAABEAAAASAAAAEQAAABIAAAARAAAAEQAAABIAAAARAAAAEgAAABEAAAARAAAAEgAAABEAAAARAAAAEgAAABEAAAASAAAAEQAAABEAAAASAAAAEQAAABIAAAARAAAAEQAAABIAAAARAAAAEQAAABIAAAARAAAAEgAAABEAAAARAAAAEgAAABEAAAARAAAAEgAAABEAAAASAAAAEQAAABEAAAASAAAAEQAAABIAAAARAAAAEQAAABIAAAARAAAAEQAAABIAAAARAAAAEgAAABEAAAARAAAAEgAAABEAAAASAAAAEQAAABEAAAASAAAAEQAAABEAAAASAAAAEQAAABIAAAARAAAAEQAAABIAAAARAAAAEQAAABIAAAARAAAAEgAAABEAAAARAAAAEgAAABEAAAASAAAAEQAAABEAAAASAAAAEQAAABEAAAASAAAAEQAAABIAAAARAAAAEQAAABIAAAARAAAAEgAAABEAAAARAAAAEgAAABEAAAARAAAAEgAAABEAAAASAAAAEQAAABEAAAASAAAAEQAAABEAAAASAAAAEQAAABIAAAARAAAAEQAAABIAAAARAAAAEgAAABEAAAARAAAAEgAAABEAAAARAAAAEgAAABEAAAASAAAAEQAAABEAAAASAAAAEQAAABIAAAARAAAAEQAAABIAAAARAAAAEQAAABIAAAARAAAAEgAAABEAAAARAAAAEgAAABEAAAARAAAAEgAAABEAAAASAAAAEQAAABEAAAASAAAAEQAAABIAAAARAAAAEQAAABIAAAARAAAAEQAAABIAAAARAAAAEgAAABEAAAARAAAAEgAAABEAAAASAAAAEQAAABEAAAASAAAAEQAAABEAAAASAAAAEQAAABIAAAARAAAAEQAAABIAAAARAAAAEQAAABIAAAARAAAAEgAAABEAAAARAAAAEgAAABEAAAASAAAAEQAAABEAAAASAAAAEQAAABEAAAASAAAAEQAAABIAAAARAAAAEQAAABIAAAARAAAAEgAAABEAAAARAAAAEgAAABEAAAARAAAAEgAAABEAAAASAAAAEQAAABEAAAASAAAAEQAAABEAAAASAAAAEQAAABIAAAARAAAAEQAAABIAAAARAAAAEgAAABEAAAARAAAAEgAAABEAAAARAAAAEgAAABEAAAASAAAAEQAAABEAAAASAAAAEQAAABIAAAARAAAAEQAAABIAAAARAAAAEQAAABIAAAARAAAAEgAAABEAAAARAAAAEgAAABEAAAARAAAAEgAAABEAAAASAAAAEQAAABEAAAASAAAAEQAAABIAAAARAAAAEQAAABIAAAARAAAAEQAAABIAAAARAAAAEgAAABEAAAARAAAAEgAAABEAAAASAAAAEQAAABEAAAASAAAAEQAAABEAAAASAAAAEQAAABIAAAARAAAAEQAAABIAAAARAAAAEQAAABIAAAARAAAAEgAAABEAAAARAAAAEgAAABEAAAASAAAAEQAAABEAAAASAAAAEQAAABEAAAASAAAAEQAAABIAAAARAAAAEQAAABIAAAARAAAAEgAAABEAAAARAAAAEgAAABEAAAARAAAAEgAAABEAAAASAAAAIgAAACMAAAAjAAAAIwAAACIAAAAjAAAAIwAAACMAAAAiAAAAIwAAACMAAAAjAAAAIwAAACIAAAAjAAAAIwAAACMAAAAiAAAAIwAAACMAAAAjAAAAIgAAACMAAAAjAAAAIwAAACIAAAAjAAAAIwAAACMAAAAjAAAAIgAAACMAAAAjAAAAIwAAACIAAAAjAAAAIwAAACMAAAAiAAAAIwAAACMAAAAjAAAAIgAAACMAAAAjAAAAIwAAACMAAAAiAAAAIwAAACMAAAAjAAAAIgAAACMAAAAjAAAAIwAAACIAAAAjAAAAIwAAACMAAAAiAAAAIwAAACMAAAAjAAAAIwAAACIAAAAjAAAAIwAAACMAAAAiAAAAIwAAACMAAAAjAAAAIgAAACMAAAAjAAAAIwAAACIAAAAjAAAAIwAAACMAAAAjAAAAIgAAACMAAAAjAAAAIwAAACIAAAAjAAAAIwAAACMAAAAiAAAAIwAAACMAAAAjAAAAIgAAACMAAAAjAAAAIwAAACMAAAAiAAAAIwAAACMAAAAjAAAAIgAAACMAAAAjAAAAIwAAACIAAAAjAAAAIwAAACMAAAAiAAAAIwAAACMAAAAjAAAAIwAAACIAAAAjAAAAIwAAACMAAAAiAAAAIwAAACMAAAAjAAAAIgAAACMAAAAjAAAAIwAAACIAAAAjAAAAIwAAACMAAAAjAAAAIgAAACMAAAAjAAAAIwAAACIAAAAjAAAAIwAAACMAAAAiAAAAIwAAACMAAAAjAAAAIgAAACMAAAAjAAAAIwAAACMAAAAiAAAAIwAAACMAAAAjAAAAIgAAACMAAAAjAAAAIwAAACIAAAAjAAAAIwAAACMAAAAiAAAAIwAAACMAAAAjAAAAIwAAACIAAAAjAAAAIwAAACMAAAAiAAAAIwAAACMAAAAjAAAAIgAAACMAAAAjAAAAIwAAACIAAAAjAAAAIwAAACMAAAAjAAAAIgAAACMAAAAjAAAAIwAAACIAAAAjAAAAIwAAACMAAAAiAAAAIwAAACMAAAAjAAAAIgAAACMAAAAjAAAAIwAAACMAAAADAAAAAwAAAAIAAAADAAAAAwAAAAIAAAADAAAAAwAAAAIAAAADAAAAAwAAAAIAAAADAAAAAwAAAAIAAAADAAAAAwAAAAIAAAADAAAAAwAAAAIAAAADAAAAAwAAAAIAAAADAAAAAwAAAAMAAAACAAAAAwAAAAMAAAACAAAAAwAAAAMAAAACAAAAAwAAAAMAAAACAAAAAwAAAAMAAAACAAAAAwAAAAMAAAACAAAAAwAAAAMAAAACAAAAAwAAAAMAAAACAAAAAwAAAAMAAAADAAAAAgAAAAMAAAADAAAAAgAAAAMAAAADAAAAAgAAAAMAAAADAAAAAgAAAAMAAAADAAAAAgAAAAMAAAADAAAAAgAAAAMAAAADAAAAAgAAAAMAAAADAAAAAwAAAAIAAAADAAAAAwAAAAIAAAADAAAAAwAAAAIAAAADAAAAAwAAAAIAAAADAAAAAwAAAAIAAAADAAAAAwAAAAIAAAADAAAAAwAAAAIAAAADAAAAAwAAAAIAAAADAAAAAwAAAAMAAAACAAAAAwAAAAMAAAACAAAAAwAAAAMAAAACAAAAAwAAAAMAAAACAAAAAwAAAAMAAAACAAAAAwAAAAMAAAACAAAAAwAAAAMAAAACAAAAAwAAAAMAAAACAAAAAwAAAAMAAAADAAAAAgAAAAMAAAADAAAAAgAAAAMAAAADAAAAAgAAAAMAAAADAAAAAgAAAAMAAAADAAAAAgAAAAMAAAADAAAAAgAAAAMAAAADAAAAAgAAAAMAAAADAAAAAwAAAAIAAAADAAAAAwAAAAIAAAADAAAAAwAAAAIAAAADAAAAAwAAAAIAAAADAAAAAwAAAAIAAAADAAAAAwAAAAIAAAADAAAAAwAAAAIAAAADAAAAAwAAAAIAAAADAAAAAwAAAAMAAAACAAAAAwAAAAMAAAACAAAAAwAAAAMAAAACAAAAAwAAAAMAAAACAAAAAwAAAAMAAAACAAAAAwAAAAMAAAACAAAAAwAAAAMAAAACAAAAAwAAAAMAAAACAAAAAwAAAAMAAAADAAAAAgAAAAMAAAADAAAAAgAAAAMAAAADAAAAAgAAAAMAAAADAAAAAgAAAAMAAAADAAAAAgAAAAMAAAADAAAAAgAAAAMAAAADAAAAAgAAAAMAAAADAAAAAgAAAAMAAAADAAAAAwAAAAIAAAADAAAAAwAAAAIAAAADAAAAAwAAAAIAAAADAAAAAwAAAAIAAAADAAAAAwAAAAIAAAADAAAAAwAAAAIAAAADAAAAAwAAAAIAAAADAAAAAwAAAAMAAAACAAAAAwAAAAMAAAACAAAAAwAAAAMAAAACAAAAAwAAAAMAAAACAAAAAwAAAAMAAAACAAAAAwAAAAMAAAACAAAAAwAAAAMAAAACAAAAAwAAAAMAAAACAAAAAwAAAAMAAAADAAAAAgAAAAMAAAADAAAAAgAAAAMAAAADAAAAAgAAAAMAAAADAAAAAgAAAAMAAAADAAAAAgAAAAMAAAADAAAAAgAAAAMAAAADAAAAAgAAAAMAAAADAAAAAgAAAAMAAAADAAAAAwAAAAIAAAADAAAAAwAAAAIAAAADAAAAAwAAAAIAAAADAAAAAwAAAAIAAAADAAAAAwAAAAIAAAADAAAAAwAAAAIAAAADAAAAAwAAAAIAAAADAAAAAwAAAAMAAAACAAAAAwAAAAMAAAACAAAAAwAAAAMAAAACAAAAAwAAAAMAAAACAAAAAwAAAAMAAAACAAAAAwAAAAMAAAACAAAAAwAAAAMAAAACAAAAAwAAAAMAAAACAAAAAwAAAAMAAAADAAAAAgAAAAMAAAADAAAAAgAAAAMAAAADAAAAAgAAAAMAAAADAAAAAgAAAAMAAAADAAAAAgAAAAMAAAADAAAAAgAAAAMAAAADAAAAAgAAAAMAAAADAAAAAgAAAAMAAAADAAAAAwAAAAIAAAADAAAAAwAAAAIAAAADAAAAAwAAAAIAAAADAAAAAwAAAAIAAAADAAAAAwAAAAIAAAADAAAAAwAAAAIAAAADAAAAAwAAAAIAAAADAAAAAwAAAAMAAAACAAAAAwAAAAMAAAACAAAAAwAAAAMAAAACAAAAAwAAAAMAAAACAAAAAwAAAAMAAAACAAAAAwAAAAMAAAACAAAAAwAAAAMAAAACAAAAAwAAAAMAAAACAAAAAwAAAAMAAAADAAAAAgAAAAMAAAADAAAAAgAAAAMAAAADAAAAAgAAAAMAAAADAAAAAgAAAAMAAAADAAAAAgAAAAMAAAADAAAAAgAAAAMAAAADAAAAAgAAAAMAAAADAAAAAgAAAAMAAAADAAAAAwAAAAIAAAADAAAAAwAAAAIAAAADAAAAAwAAAAIAAAADAAAAAwAAAAIAAAADAAAAAwAAAAIAAAADAAAAAwAAAAIAAAADAAAAAwAAAAIAAAADAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAA="}},"source":"summary"},{"label":"Ping-Pong (1472B)","metrics":{"filename":"sockperf_single_pingpong_1472B.txt","version":"3.7-no.git","protocol":"UDP","target_ip":"192.168.1.3","target_port":11111,"run_time_sec":20.0,"warmup_msec":400.0,"sent_messages":78338,"received_messages":78337,"packet_loss_pct":0.001276519696702394,"avg_latency_us":127.55,"std_dev_us":22.019,"jitter_us":22.019,"min_latency_us":106.577,"max_latency_us":485.474,"total_observations":76611,"percentiles":{"99.999":433.16,"99.99":371.845,"99.9":282.583,"99.0":208.444,"90.0":164.582,"75.0":122.766,"50.0":118.241,"25.0":116.97},"valid_sent":76611,"valid_received":76611,"errors":[],"test_type":"ping-pong","msg_size":1472,"topology":"single","run_date":"2025-11-05"},"histogram":{"digits":3,"count":76611,"mean_us":127.55,"std_dev_us":22.019,"min_us":106.577,"max_us":485.474,"upper_us":{"dtype":"<f4","b64":"+j7VQr5f1UKDgNVCSKHVQgzC1ULR4tVClgPWQlok1kIfRdZC42XWQqiG1kJtp9ZCMcjWQvbo1kK6CddCfyrXQkRL10IIbNdCzYzXQpGt10JWztdCG+/XQt8P2EKkMNhCaFHYQi1y2ELykthCtrPYQnvU2EI/9dhCBBbZQsk22UKNV9lCUnjZQheZ2ULbudlCoNrZQmT72UIpHNpC7jzaQrJd2kJ3ftpCO5/aQgDA2kLF4NpCiQHbQk4i20ISQ9tC12PbQpyE20JgpdtCJcbbQunm20KuB9xCcyjcQjdJ3EL8adxCwYrcQoWr3EJKzNxCDu3cQtMN3UKYLt1CXE/dQiFw3ULlkN1CqrHdQm/S3UIz891C+BPeQrw03kKBVd5CRnbeQgqX3kLPt95Ck9jeQlj53kIdGt9C4TrfQqZb30JqfN9CL53fQvS930K43t9Cff/fQkIg4EIGQeBCy2HgQo+C4EJUo+BCGcTgQt3k4EKiBeFCZibhQitH4ULwZ+FCtIjhQnmp4UI9yuFCAuvhQscL4kKLLOJCUE3iQhRu4kLZjuJCnq/iQmLQ4kIn8eJC7BHjQrAy40J1U+NCOXTjQv6U40LDteNCh9bjQkz340IQGORC1TjkQppZ5EJeeuRCI5vkQue75EKs3ORCcf3kQjUe5UL6PuVCvl/lQoOA5UJIoeVCDMLlQtHi5UKWA+ZCWiTmQh9F5kLjZeZCqIbmQm2n5kIxyOZC9ujmQroJ50J/KudCREvnQghs50LNjOdCka3nQlbO50Ib7+dC3w/oQqQw6EJoUehCLXLoQvKS6EK2s+hCe9ToQj/16EIEFulCyTbpQo1X6UJSeOlCF5npQtu56UKg2ulCZPvpQikc6kLuPOpCsl3qQnd+6kI7n+pCAMDqQsXg6kKJAetCTiLrQhJD60LXY+tCnITrQmCl60IlxutC6ebrQq4H7EJzKOxCN0nsQvxp7ELBiuxChavsQkrM7EIO7exC0w3tQpgu7UJcT+1CIXDtQuWQ7UKqse1Cb9LtQjPz7UL4E+5CvDTuQoFV7kJGdu5CCpfuQs+37kKT2O5CWPnuQh0a70LhOu9CplvvQmp870Ivne9C9L3vQrje70J9/+9CQiDwQgZB8ELLYfBCj4LwQlSj8EIZxPBC3eTwQqIF8UJmJvFCK0fxQvBn8UK0iPFCeanxQj3K8UIC6/FCxwvyQoss8kJQTfJCFG7yQtmO8kKer/JCYtDyQifx8kLsEfNCsDLzQnVT80I5dPNC/pTzQsO180KH1vNCTPfzQhAY9ELVOPRCmln0Ql569EIjm/RC57v0Qqzc9EJx/fRCNR71Qvo+9UK+X/VCg4D1Qkih9UIMwvVC0eL1QpYD9kJaJPZCH0X2QuNl9kKohvZCbaf2QjHI9kL26PZCugn3Qn8q90JES/dCCGz3Qs2M90KRrfdCVs73Qhvv90LfD/hCpDD4QmhR+EItcvhC8pL4Qraz+EJ71PhCP/X4QgQW+ULJNvlCjVf5QlJ4+UIXmflC27n5QqDa+UJk+/lCKRz6Qu48+kKyXfpCd376Qjuf+kIAwPpCxeD6QokB+0JOIvtCEkP7Qtdj+0KchPtCYKX7QiXG+0Lp5vtCrgf8QnMo/EI3SfxC/Gn8QsGK/EKFq/xCSsz8Qg7t/ELTDf1CmC79QlxP/UIhcP1C5ZD9Qqqx/UJv0v1CM/P9QvgT/kK8NP5CgVX+QkZ2/kIKl/5Cz7f+QpPY/kJY+f5CHRr/QuE6/0KmW/9Canz/Qi+d/0L0vf9CuN7/Qn3//0IhEABDgyAAQ+UwAENIQQBDqlEAQwxiAENvcgBD0YIAQzOTAEOWowBD+LMAQ1rEAEO81ABDH+UAQ4H1AEPjBQFDRhYBQ6gmAUMKNwFDbUcBQ89XAUMxaAFDk3gBQ/aIAUNYmQFDuqkBQx26AUN/ygFD4doBQ0TrAUOm+wFDCAwCQ2ocAkPNLAJDLz0CQ5FNAkP0XQJDVm4CQ7h+AkMbjwJDfZ8CQ9+vAkNCwAJDpNACQwbhAkNo8QJDywEDQy0SA0PyMgNDtlMDQ3t0A0M/lQNDBLYDQ8nWA0ON9wNDUhgEQxc5BEPbWQRDoHoEQ2SbBEMpvARD7twEQ7L9BEN3HgVDOz8FQwBgBUPFgAVDiaEFQ07CBUMS4wVD1wMGQ5wkBkNgRQZDJWYGQ+mGBkOupwZDc8gGQzfpBkP8CQdDwSoHQ4VLB0NKbAdDDo0HQ9OtB0OYzgdDXO8HQyEQCEPlMAhDqlEIQ29yCEMzkwhD+LMIQ7zUCEOB9QhDRhYJQwo3CUPPVwlDk3gJQ1iZCUMduglD4doJQ6b7CUNqHApDLz0KQ/RdCkO4fgpDfZ8KQ0LACkMG4QpDywELQ48iC0NUQwtDGWQLQ92EC0OipQtDZsYLQyvnC0PwBwxDtCgMQ3lJDEM9agxDAosMQ8erDEOLzAxDUO0MQxQODUPZLg1Dnk8NQ2JwDUMnkQ1D7LENQ7DSDUN18w1DORQOQ/40DkPDVQ5Dh3YOQ0yXDkMQuA5D1dgOQ5r5DkNeGg9DIzsPQ+dbD0OsfA9DcZ0PQzW+D0P63g9Dvv8PQ4MgEENIQRBDDGIQQ9GCEEOWoxBDWsQQQx/lEEPjBRFDqCYRQ21HEUMxaBFD9ogRQ7qpEUN/yhFDROsRQwgMEkPNLBJDkU0SQ1ZuEkMbjxJD368SQ6TQEkNo8RJDLRITQ/IyE0O2UxNDe3QTQz+VE0MEthNDydYTQ433E0NSGBRDFzkUQ9tZFEOgehRDZJsUQym8FEPu3BRDsv0UQ3ceFUM7PxVDAGAVQ8WAFUOJoRVDTsIVQxLjFUPXAxZDnCQWQ2BFFkMlZhZD6YYWQ66nFkNzyBZDN+kWQ/wJF0PBKhdDhUsXQ0psF0MOjRdD060XQ5jOF0Nc7xdDIRAYQ+UwGEOqURhDb3IYQzOTGEP4sxhDvNQYQ4H1GENGFhlDCjcZQ89XGUOTeBlDWJkZQx26GUPh2hlDpvsZQ2ocGkMvPRpD9F0aQ7h+GkN9nxpDQsAaQwbhGkPLARtDjyIbQ1RDG0MZZBtD3YQbQ6KlG0NmxhtDK+cbQ/AHHEO0KBxDeUkcQz1qHEMCixxDx6scQ4vMHENQ7RxDFA4dQ9kuHUOeTx1DYnAdQyeRHUPssR1DsNIdQ3XzHUM5FB5D/jQeQ8NVHkOHdh5DTJceQxC4HkPV2B5DmvkeQ14aH0MjOx9D51sfQ6x8H0NxnR9DNb4fQ/reH0O+/x9DgyAgQ0hBIEMMYiBD0YIgQ5ajIENaxCBDH+UgQ+MFIUOoJiFDbUchQzFoIUP2iCFDuqkhQ3/KIUNE6yFDCAwiQ80sIkORTSJDVm4iQxuPIkPfryJDpNAiQ2jxIkMtEiND8jIjQ7ZTI0N7dCNDP5UjQwS2I0PJ1iNDjfcjQ1IYJEMXOSRD21kkQ6B6JENkmyRDKbwkQ+7cJEOy/SRDdx4lQzs/JUMAYCVDxYAlQ4mhJUNOwiVDEuMlQ9cDJkOcJCZDYEUmQyVmJkPphiZDrqcmQ3PIJkM36SZD/AknQ8EqJ0OFSydDSmwnQw6NJ0PTrSdDmM4nQ1zvJ0MhEChD5TAoQ6pRKENvcihDM5MoQ/izKEO81ChDgfUoQ0YWKUMKNylDz1cpQ5N4KUNYmSlDHbopQ+HaKUOm+ylDahwqQy89KkP0XSpDuH4qQ32fKkNCwCpDBuEqQ8sBK0OPIitDVEMrQxlkK0PdhCtDoqUrQ2bGK0Mr5ytD8AcsQ7QoLEN5SSxDPWosQwKLLEPHqyxDi8wsQ1DtLEMUDi1D2S4tQ55PLUNicC1DJ5EtQ+yxLUOw0i1DdfMtQzkULkP+NC5Dw1UuQ4d2LkNMly5DELguQ9XYLkOa+S5DXhovQyM7L0PnWy9DrHwvQ3GdL0M1vi9D+t4vQ77/L0ODIDBDSEEwQwxiMEPRgjBDlqMwQ1rEMEMf5TBD4wUxQ6gmMUNtRzFDMWgxQ/aIMUO6qTFDf8oxQ0TrMUMIDDJDzSwyQ5FNMkNWbjJDG48yQ9+vMkOk0DJDaPEyQy0SM0PyMjNDtlMzQ3t0M0M/lTNDBLYzQ8nWM0ON9zNDUhg0Qxc5NEPbWTRDoHo0Q2SbNEMpvDRD7tw0Q7L9NEN3HjVDOz81QwBgNUPFgDVDiaE1Q07CNUMS4zVD1wM2Q5wkNkNgRTZDJWY2Q+mGNkOupzZDc8g2QzfpNkP8CTdDwSo3Q4VLN0NKbDdDDo03Q9OtN0OYzjdDXO83QyEQOEPlMDhDqlE4Q29yOEMzkzhD+LM4Q7zUOEOB9ThDRhY5Qwo3OUPPVzlDk3g5Q1iZOUMdujlD4do5Q6b7OUNqHDpDLz06Q/RdOkO4fjpDfZ86Q0LAOkMG4TpDywE7Q48iO0NUQztDGWQ7Q92EO0OipTtDZsY7QyvnO0PwBzxDtCg8Q3lJPEM9ajxDAos8Q8erPEOLzDxDUO08QxQOPUPZLj1Dnk89Q2JwPUMnkT1D7LE9Q7DSPUN18z1DORQ+Q/40PkPDVT5Dh3Y+Q0yXPkMQuD5D1dg+Q5r5PkNeGj9DIzs/Q+dbP0OsfD9DcZ0/QzW+P0P63j9Dvv8/Q4MgQENIQUBDDGJAQ9GCQEOWo0BDWsRAQx/lQEPjBUFDqCZBQ21HQUMxaEFD9ohBQ7qpQUN/ykFDROtBQwgMQkPNLEJDkU1CQ1ZuQkMbj0JD369CQ6TQQkNo8UJDLRJDQ/IyQ0O2U0NDe3RDQz+VQ0MEtkNDydZDQ433Q0NSGERDFzlEQ9tZREOgekRDZJtEQym8REPu3ERDsv1EQ3ceRUM7P0VDAGBFQ8WARUOJoUVDTsJFQxLjRUPXA0ZDnCRGQ2BFRkMlZkZD6YZGQ66nRkNzyEZDN+lGQ/wJR0PBKkdDhUtHQ0psR0MOjUdD061HQ5jOR0Nc70dDIRBIQ+UwSEOqUUhDb3JIQzOTSEP4s0hDvNRIQ4H1SENGFklDCjdJQ89XSUOTeElDWJlJQx26SUPh2klDpvtJQ2ocSkMvPUpD9F1KQ7h+SkN9n0pDQsBKQwbhSkPLAUtDjyJLQ1RDS0MZZEtD3YRLQ6KlS0NmxktDK+dLQ/AHTEO0KExDeUlMQz1qTEMCi0xDx6tMQ4vMTENQ7UxDFA5NQ9kuTUOeT01DYnBNQyeRTUPssU1DsNJNQ3XzTUM5FE5D/jROQ8NVTkOHdk5DTJdOQxC4TkPV2E5DmvlOQ14aT0MjO09D51tPQ6x8T0NxnU9DNb5PQ/reT0O+/09DgyBQQ0hBUEMMYlBD0YJQQ5ajUENaxFBDH+VQQ+MFUUOoJlFDbUdRQzFoUUP2iFFDuqlRQ3/KUUNE61FDCAxSQ80sUkORTVJDVm5SQxuPUkPfr1JDpNBSQ2jxUkMtElND8jJTQ7ZTU0N7dFNDP5VTQwS2U0PJ1lNDjfdTQ1IYVEMXOVRD21lUQ6B6VENkm1RDKbxUQ+7cVEOy/VRDdx5VQzs/VUMAYFVDxYBVQ4mhVUNOwlVDEuNVQ9cDVkOcJFZDYEVWQyVmVkPphlZDrqdWQ3PIVkM36VZD/AlXQ8EqV0OFS1dDSmxXQw6NV0PTrVdDmM5XQ1zvV0MhEFhD5TBYQ6pRWENvclhDM5NYQ/izWEO81FhDgfVYQ0YWWUMKN1lDz1dZQ5N4WUNYmVlDHbpZQ+HaWUOm+1lDahxaQy89WkP0XVpDuH5aQ32fWkNCwFpDBuFaQ8sBW0OPIltDVENbQxlkW0PdhFtDoqVbQ2bGW0Mr51tD8AdcQ7QoXEN5SVxDPWpcQwKLXEPHq1xDi8xcQ1DtXEMUDl1D2S5dQ55PXUNicF1DJ5FdQ+yxXUOw0l1DdfNdQzkUXkP+NF5Dw1VeQ4d2XkNMl15DELheQ9XYXkOa+V5DXhpfQyM7X0PnW19DrHxfQ3GdX0M1vl9D+t5fQ77/X0ODIGBDSEFgQwxiYEPRgmBDlqNgQ1rEYEMf5WBD4wVhQ6gmYUNtR2FDMWhhQ/aIYUO6qWFDf8phQ0TrYUMIDGJDzSxiQ5FNYkNWbmJDG49iQ9+vYkOk0GJDaPFiQy0SY0PyMmNDtlNjQ3t0Y0M/lWNDBLZjQ8nWY0ON92NDUhhkQxc5ZEPbWWRDoHpkQ2SbZEMpvGRD7txkQ7L9ZEN3HmVDOz9lQwBgZUPFgGVDiaFlQ07CZUMS42VD1wNmQ5wkZkNgRWZDJWZmQ+mGZkOup2ZDc8hmQzfpZkP8CWdDwSpnQ4VLZ0NKbGdDDo1nQ9OtZ0OYzmdDXO9nQyEQaEPlMGhDqlFoQ29yaEMzk2hD+LNoQ7zUaEOB9WhDRhZpQwo3aUPPV2lDk3hpQ1iZaUMdumlD4dppQ6b7aUNqHGpDLz1qQ/RdakO4fmpDfZ9qQ0LAakMG4WpDywFrQ48ia0NUQ2tDGWRrQ92Ea0OipWtDZsZrQyvna0PwB2xDtChsQ3lJbEM9amxDAotsQ8erbEOLzGxDUO1sQxQObUPZLm1Dnk9tQ2JwbUMnkW1D7LFtQ7DSbUN1821DORRuQ/40bkPDVW5Dh3ZuQ0yXbkMQuG5D1dhuQ5r5bkNeGm9DIztvQ+dbb0OsfG9DcZ1vQzW+b0P63m9Dvv9vQ4MgcENIQXBDDGJwQ9GCcEOWo3BDWsRwQx/lcEPjBXFDqCZxQ21HcUMxaHFD9ohxQ7qpcUN/ynFDROtxQwgMckPNLHJDkU1yQ1ZuckMbj3JD369yQ6TQckNo8XJDLRJzQ/Iyc0O2U3NDe3RzQz+Vc0MEtnNDydZzQ433c0NSGHRDFzl0Q9tZdEOgenRDZJt0Qym8dEPu3HRDsv10Q3cedUM7P3VDAGB1Q8WAdUOJoXVDTsJ1QxLjdUPXA3ZDnCR2Q2BFdkMlZnZD6YZ2Q66ndkNzyHZDN+l2Q/wJd0PBKndDhUt3Q0psd0MOjXdD0613Q5jOd0Nc73dDIRB4Q+UweEOqUXhDb3J4QzOTeEP4s3hDvNR4Q4H1eENGFnlDCjd5Q89XeUOTeHlDWJl5Qx26eUPh2nlDpvt5Q2ocekMvPXpD9F16Q7h+ekN9n3pDQsB6QwbhekPLAXtDjyJ7Q1RDe0MZZHtD3YR7Q6Kle0NmxntDK+d7Q/AHfEO0KHxDeUl8Qz1qfEMCi3xDx6t8Q4vMfENQ7XxDFA59Q9kufUOeT31DYnB9QyeRfUPssX1DsNJ9Q3XzfUM5FH5D/jR+Q8NVfkOHdn5DTJd+QxC4fkPV2H5Dmvl+Q14af0MjO39D51t/Q6x8f0NxnX9DNb5/Q/ref0O+/39DQhCAQ6QggEMGMYBDaEGAQ8tRgEMtYoBDj3KAQ/KCgENUk4BDtqOAQxm0gEN7xIBD3dSAQz/lgEOi9YBDBAaBQ2YWgUPJJoFDKzeBQ41HgUPwV4FDUmiBQ7R4gUMXiYFDeZmBQ9upgUM9uoFDoMqBQwLbgUNk64FDx/uBQykMgkOLHIJD7iyCQ1A9gkOyTYJDFF6CQ3dugkPZfoJDO4+CQ56fgkMAsIJDYsCCQ8XQgkMn4YJDifGCQ+wBg0NOEoNDEjODQ9dTg0OcdINDYJWDQyW2g0Pp1oNDrveDQ3MYhEM3OYRD/FmEQ8F6hEOFm4RDSryEQw7dhEPT/YRDmB6FQ1w/hUMhYIVD5YCFQ6qhhUNvwoVDM+OFQ/gDhkO8JIZDgUWGQ0ZmhkMKh4ZDz6eGQ5PIhkNY6YZDHQqHQ+Eqh0OmS4dDamyHQy+Nh0P0rYdDuM6HQ33vh0NCEIhDBjGIQ8tRiEOPcohDVJOIQxm0iEPd1IhDovWIQ2YWiUMrN4lD8FeJQ7R4iUN5mYlDPbqJQwLbiUPH+4lDixyKQ1A9ikMUXopD2X6KQ56fikNiwIpDJ+GKQ+wBi0OwIotDdUOLQzlki0P+hItDw6WLQ4fGi0NM54tDEAiMQ9UojEOaSYxDXmqMQyOLjEPnq4xDrMyMQ3HtjEM1Do1D+i6NQ75PjUODcI1DWhSOQzG4jkMIXI9D3/+PQ7ajkEONR5FDZOuRQzuPkkMSM5ND6daTQ4WblENcP5VDM+OVQwqHlkPhKpdDuM6XQ49ymENmFplDPbqZQxRemkPsAZtDw6WbQ5pJnENx7ZxDSJGdQx81nkP22J5DzXyfQ2hBoEM/5aBDF4mhQ+4sokPF0KJDnHSjQ3MYpENKvKRDIWClQ/gDpkPPp6ZDpkunQ33vp0NUk6hDKzepQwLbqUPZfqpDdUOrQ0znq0Mji6xD+i6tQ9HSrUOodq5DfxqvQ1a+r0MtYrBDBAaxQ9upsUOyTbJDifGyQ2CVs0M3ObRDDt20Q+WAtUO8JLZDWOm2Qy+Nt0MGMbhD3dS4Q7R4uUNiwLpDfxq/Q2CVw0NCEMhDI4vMQz/l0EMhYNVDoMrhQw=="},"counts":{"dtype":"<u4","b64":"VgAAAHYAAAB2AAAAdgAAAHUAAAB2AAAAdgAAAHYAAAB2AAAAdgAAAHYAAAB2AAAAdgAAAHYAAAB2AAAAdgAAAHYAAAB2AAAAdgAAAHYAAAB2AAAAdQAAAHYAAAB2AAAAdgAAAHYAAAB2AAAAdgAAAHYAAAB2AAAAdgAAAHYAAAB2AAAAdgAAAHYAAAB2AAAAdgAAAHYAAAB2AAAAdQAAAHYAAAB2AAAAdgAAAHYAAAB2AAAAdgAAAHYAAAB2AAAAdgAAAHYAAAB2AAAAdgAAAHYAAAB2AAAAdgAAAHYAAAB1AAAAdgAAAHYAAAB2AAAAdgAAAHYAAAB2AAAAdgAAAHYAAAB2AAAAdgAAAHYAAAB2AAAAdgAAAHYAAAB2AAAAdgAAAHUAAAB2AAAAdgAAAHYAAAB2AAAAdgAAAHYAAAB2AAAAdgAAAHYAAAB2AAAAdgAAAHYAAAB2AAAAdgAAAHYAAAB2AAAAdgAAAHUAAAB2AAAAdgAAAHYAAAB2AAAAdgAAAHYAAAB2AAAAdgAAAHYAAAB2AAAAdgAAAHYAAAB2AAAAdgAAAHYAAAB2AAAAdQAAAHYAAAB2AAAAdgAAAHYAAAB2AAAAdgAAAHYAAAB2AAAAdgAAAHYAAAB2AAAAdgAAAHYAAAB2AAAAdgAAAHYAAAB2AAAAdQAAAHYAAAB2AAAAdgAAAHYAAAB2AAAAdgAAAHYAAAB2AAAAdgAAAHYAAAB2AAAAdgAAAHYAAAB2AAAAdgAAAHYAAAB1AAAAdgAAAHYAAAB2AAAAdgAAAHYAAAB2AAAAdgAAAHYAAAB2AAAAdgAAAHYAAAB2AAAAdgAAAHYAAAB2AAAAdgAAAHUAAAB2AAAAkwEAAMQDAADFAwAAxAMAAMQDAADFAwAAxAMAAMUDAADEAwAAxQMAAMQDAADEAwAAxQMAAMQDAADFAwAAxAMAAMQDAADFAwAAxAMAAMUDAAB6AgAADgEAAA8BAAAPAQAADwEAAA8BAAAPAQAADwEAAA8BAAAPAQAADgEAAA8BAAAPAQAADwEAAA8BAAAPAQAADwEAAA8BAAAPAQAADwEAAA4BAAAPAQAADwEAAA8BAAAPAQAADwEAAA8BAAAPAQAADwEAAA4BAAAPAQAADwEAAA8BAAAPAQAADwEAAA8BAAAPAQAADwEAAA4BAAAPAQAADwEAAA8BAAAPAQAADwEAAA8BAAAPAQAADwEAAA4BAAAPAQAADwEAAA8BAAAPAQAADwEAAA8BAAAPAQAADwEAAA4BAAAPAQAADwEAAA8BAAAPAQAADwEAAA8BAAAPAQAADwEAAA4BAAAPAQAADwEAAA8BAAAPAQAADwEAAEsAAAARAAAAEgAAABIAAAARAAAAEgAAABEAAAASAAAAEgAAABEAAAASAAAAEQAAABIAAAARAAAAEgAAABIAAAARAAAAEgAAABEAAAASAAAAEgAAABEAAAASAAAAEQAAABIAAAASAAAAEQAAABIAAAARAAAAEgAAABEAAAASAAAAEgAAABEAAAASAAAAEQAAABIAAAASAAAAEQAAABIAAAARAAAAEgAAABIAAAARAAAAEgAAABEAAAASAAAAEQAAABIAAAASAAAAEQAAABIAAAARAAAAEgAAABIAAAARAAAAEgAAABEAAAASAAAAEgAAABEAAAASAAAAEQAAABIAAAARAAAAEgAAABIAAAARAAAAEgAAABEAAAASAAAAEgAAABEAAAASAAAAEQAAABIAAAASAAAAEQAAABIAAAARAAAAEgAAABEAAAASAAAAEgAAABEAAAASAAAAEQAAABIAAAASAAAAEQAAABIAAAARAAAAEgAAABIAAAARAAAAEgAAABEAAAASAAAAEQAAABIAAAASAAAAEQAAABIAAAARAAAAEgAAABIAAAARAAAAEgAAABEAAAASAAAAEgAAABEAAAASAAAAEQAAABIAAAARAAAAEgAAABIAAAARAAAAEgAAABEAAAASAAAAEgAAABEAAAASAAAAEQAAABIAAAASAAAAEQAAABIAAAAjAAAAIwAAACMAAAAjAAAAJAAAACMAAAAjAAAAIwAAACMAAAAjAAAAJAAAACMAAAAjAAAAIwAAACMAAAAkAAAAIwAAACMAAAAjAAAAIwAAACMAAAAkAAAAIwAAACMAAAAjAAAAIwAAACMAAAAkAAAAIwAAACMAAAAjAAAAIwAAACQAAAAjAAAAIwAAACMAAAAjAAAAIwAAACQAAAAjAAAAIwAAACMAAAAjAAAAIwAAACQAAAAjAAAAIwAAACMAAAAjAAAAJAAAACMAAAAjAAAAIwAAACMAAAAjAAAAJAAAACMAAAAjAAAAIwAAACMAAAAjAAAAJAAAACMAAAAjAAAAIwAAACMAAAAkAAAAIwAAACMAAAAjAAAAIwAAACMAAAAkAAAAIwAAACMAAAAjAAAAIwAAACMAAAAkAAAAIwAAACMAAAAjAAAAIwAAACQAAAAjAAAAIwAAACMAAAAjAAAAIwAAACQAAAAjAAAAIwAAACMAAAAjAAAAIwAAACQAAAAjAAAAIwAAACMAAAAjAAAAJAAAACMAAAAjAAAAIwAAACMAAAAjAAAAJAAAACMAAAAjAAAAIwAAACMAAAAjAAAAJAAAACMAAAAjAAAAIwAAACMAAAAkAAAAIwAAACMAAAAjAAAAIwAAACMAAAAkAAAAIwAAACMAAAAjAAAAIwAAACMAAAAkAAAAIwAAACMAAAAjAAAAIwAAACQAAAAjAAAAIwAAACMAAAAjAAAAIwAAACQAAAAjAAAAIwAAACMAAAAjAAAAIwAAACQAAAAjAAAAIwAAACMAAAAjAAAAJAAAACMAAAAjAAAAIwAAACMAAAAjAAAAJAAAACMAAAAjAAAAIwAAACMAAAAjAAAAJAAAACMAAAAjAAAAIwAAACMAAAAkAAAAIwAAACMAAAAjAAAAIwAAACMAAAAkAAAAIwAAACMAAAAjAAAAIwAAACMAAAAkAAAAIwAAACMAAAAjAAAAIwAAACQAAAAjAAAAIwAAACMAAAAjAAAAIwAAACQAAAAjAAAAIwAAACMAAAAjAAAAIwAAACQAAAAjAAAAIwAAACMAAAAjAAAAJAAAACMAAAAjAAAAIwAAACMAAAAjAAAAJAAAACMAAAAjAAAAIwAAACMAAAAjAAAAJAAAACMAAAAjAAAAIwAAACMAAAAkAAAAIwAAACMAAAAjAAAAIwAAACMAAAAkAAAAIwAAACMAAAAjAAAAIwAAACMAAAAkAAAAIwAAACMAAAAjAAAAIwAAACQAAAAjAAAAIwAAACMAAAAjAAAAIwAAACQAAAAjAAAAIwAAACMAAAAjAAAAIwAAACQAAAAjAAAAIwAAACMAAAAjAAAAIwAAACQAAAAjAAAAIwAAACMAAAAjAAAAJAAAACMAAAAgAAAAFAAAABQAAAAUAAAAFAAAABUAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABUAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFQAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAVAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABUAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABUAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFQAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAVAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABUAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABUAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFQAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAVAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABUAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABUAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFQAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAVAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABUAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABUAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFQAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAVAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABUAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABUAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFQAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAVAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABUAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABUAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFQAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAVAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABUAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABUAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFQAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAVAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABUAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABUAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFQAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAVAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABUAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABUAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFQAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAVAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABUAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAACwAAAAEAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAwAAAAIAAAACAAAAAwAAAAIAAAADAAAAAgAAAAIAAAADAAAAAgAAAAIAAAADAAAAAgAAAAMAAAACAAAAAgAAAAMAAAACAAAAAwAAAAIAAAACAAAAAwAAAAIAAAACAAAAAwAAAAIAAAADAAAAAgAAAAIAAAADAAAAAgAAAAIAAAADAAAAAgAAAAMAAAACAAAAAgAAAAMAAAACAAAAAwAAAAIAAAACAAAAAwAAAAIAAAACAAAAAwAAAAIAAAADAAAAAgAAAAIAAAADAAAAAgAAAAIAAAADAAAAAgAAAAMAAAACAAAAAgAAAAMAAAACAAAAAwAAAAIAAAACAAAAAwAAAAIAAAACAAAAAwAAAAIAAAADAAAAAgAAAAIAAAADAAAAAgAAAAIAAAADAAAAAgAAAAMAAAACAAAAAgAAAAIAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAA=="}},"source":"summary"},{"label":"Under Load","metrics":{"filename":"sockperf_single_underload_udp.txt","version":"3.7-no.git","protocol":"UDP","target_ip":"192.168.1.3","target_port":11111,"run_time_sec":30.0,"warmup_msec":400.0,"sent_messages":300004,"received_messages":3000,"packet_loss_pct":0.0,"avg_latency_us":87.911,"std_dev_us":15.551,"jitter_us":15.551,"min_latency_us":58.291,"max_latency_us":226.849,"total_observations":2953,"percentiles":{"99.999":226.849,"99.99":226.849,"99.9":177.883,"99.0":158.651,"90.0":102.22,"75.0":92.412,"50.0":83.039,"25.0":79.416},"valid_sent":295201,"valid_received":2953,"errors":[],"test_type":"under-load","reply_every":100,"topology":"single","run_date":"2025-11-05"},"histogram":{"digits":3,"count":2953,"mean_us":87.911,"std_dev_us":15.551,"min_us":58.291,"max_us":226.849,"upper_us":{"dtype":"<f4","b64":"CldpQs93aUKTmGlCWLlpQh3aaULh+mlCphtqQmo8akIvXWpC9H1qQrieakJ9v2pCQuBqQgYBa0LLIWtCj0JrQlRja0IZhGtC3aRrQqLFa0Jm5mtCKwdsQvAnbEK0SGxCeWlsQj2KbEICq2xCx8tsQovsbEJQDW1CFC5tQtlObUKeb21CYpBtQiexbULs0W1CsPJtQnUTbkI5NG5C/lRuQsN1bkKHlm5CTLduQhDYbkLV+G5CmhlvQl46b0IjW29C53tvQqycb0JxvW9CNd5vQvr+b0K+H3BCg0BwQkhhcEIMgnBC0aJwQpbDcEJa5HBCHwVxQuMlcUKoRnFCbWdxQjGIcUL2qHFCuslxQn/qcUJEC3JCCCxyQs1MckKRbXJCVo5yQhuvckLfz3JCpPByQmgRc0ItMnNC8lJzQrZzc0J7lHNCP7VzQgTWc0LJ9nNCjRd0QlI4dEIXWXRC23l0QqCadEJku3RCKdx0Qu78dEKyHXVCdz51QjtfdUIAgHVCxaB1QonBdUJO4nVCEgN2QtcjdkKcRHZCYGV2QiWGdkLppnZCrsd2QnPodkI3CXdC/Cl3QsFKd0KFa3dCSox3Qg6td0LTzXdCmO53QlwPeEIhMHhC5VB4QqpxeEJvknhCM7N4QvjTeEK89HhCgRV5QkY2eUIKV3lCz3d5QpOYeUJYuXlCHdp5QuH6eUKmG3pCajx6Qi9dekL0fXpCuJ56Qn2/ekJC4HpCBgF7Qsshe0KPQntCVGN7QhmEe0LdpHtCosV7Qmbme0IrB3xC8Cd8QrRIfEJ5aXxCPYp8QgKrfELHy3xCi+x8QlANfUIULn1C2U59Qp5vfUJikH1CJ7F9QuzRfUKw8n1CdRN+Qjk0fkL+VH5Cw3V+QoeWfkJMt35CENh+QtX4fkKaGX9CXjp/QiNbf0Lne39CrJx/QnG9f0I13n9C+v5/Qt8PgEJCIIBCpDCAQgZBgEJoUYBCy2GAQi1ygEKPgoBC8pKAQlSjgEK2s4BCGcSAQnvUgELd5IBCP/WAQqIFgUIEFoFCZiaBQsk2gUIrR4FCjVeBQvBngUJSeIFCtIiBQheZgUJ5qYFC27mBQj3KgUKg2oFCAuuBQmT7gULHC4JCKRyCQossgkLuPIJCUE2CQrJdgkIUboJCd36CQtmOgkI7n4JCnq+CQgDAgkJi0IJCxeCCQifxgkKJAYNC7BGDQrAyg0J1U4NCOXSDQv6Ug0LDtYNCh9aDQkz3g0IQGIRC1TiEQppZhEJeeoRCI5uEQue7hEKs3IRCcf2EQjUehUL6PoVCvl+FQoOAhUJIoYVCDMKFQtHihUKWA4ZCWiSGQh9FhkLjZYZCqIaGQm2nhkIxyIZC9uiGQroJh0J/KodCREuHQghsh0LNjIdCka2HQlbOh0Ib74dC3w+IQqQwiEJoUYhCLXKIQvKSiEK2s4hCe9SIQj/1iEIEFolCyTaJQo1XiUJSeIlCF5mJQtu5iUKg2olCZPuJQikcikLuPIpCsl2KQnd+ikI7n4pCAMCKQsXgikKJAYtCTiKLQhJDi0LXY4tCnISLQmCli0IlxotC6eaLQq4HjEJzKIxCN0mMQvxpjELBioxChauMQkrMjEIO7YxC0w2NQpgujUJcT41CIXCNQuWQjUKqsY1Cb9KNQjPzjUL4E45CvDSOQoFVjkJGdo5CCpeOQs+3jkKT2I5CWPmOQh0aj0LhOo9CpluPQmp8j0IvnY9C9L2PQrjej0J9/49CQiCQQgZBkELLYZBCj4KQQlSjkEIZxJBC3eSQQqIFkUJmJpFCK0eRQvBnkUK0iJFCeamRQj3KkUIC65FCxwuSQosskkJQTZJCFG6SQtmOkkKer5JCYtCSQifxkkLsEZNCsDKTQnVTk0I5dJNC/pSTQsO1k0KH1pNCTPeTQhAYlELVOJRCmlmUQl56lEIjm5RC57uUQqzclEJx/ZRCNR6VQvo+lUK+X5VCg4CVQkihlUIMwpVC0eKVQpYDlkJaJJZCH0WWQuNllkKohpZCbaeWQjHIlkL26JZCugmXQn8ql0JES5dCCGyXQs2Ml0KRrZdCVs6XQhvvl0LfD5hCpDCYQmhRmEItcphC8pKYQrazmEJ71JhCP/WYQgQWmULJNplCjVeZQlJ4mUIXmZlC27mZQqDamUJk+5lCKRyaQu48mkKyXZpCd36aQjufmkIAwJpCxeCaQokBm0JOIptCEkObQtdjm0KchJtCYKWbQiXGm0Lp5ptCrgecQnMonEI3SZxC/GmcQsGKnEKFq5xCSsycQg7tnELTDZ1CmC6dQlxPnUIhcJ1C5ZCdQqqxnUJv0p1CM/OdQvgTnkK8NJ5CgVWeQkZ2nkIKl55Cz7eeQpPYnkJY+Z5CHRqfQuE6n0KmW59CanyfQi+dn0L0vZ9CuN6fQn3/n0JCIKBCBkGgQsthoEKPgqBCVKOgQhnEoELd5KBCogWhQmYmoUIrR6FC8GehQrSIoUJ5qaFCPcqhQgLroULHC6JCiyyiQlBNokIUbqJC2Y6iQp6vokJi0KJCJ/GiQuwRo0KwMqNCdVOjQjl0o0L+lKNCw7WjQofWo0JM96NCEBikQtU4pEKaWaRCXnqkQiObpELnu6RCrNykQnH9pEI1HqVC+j6lQr5fpUKDgKVCSKGlQgzCpULR4qVClgOmQlokpkIfRaZC42WmQqiGpkJtp6ZCMcimQvbopkK6CadCfyqnQkRLp0IIbKdCzYynQpGtp0JWzqdCG++nQt8PqEKkMKhCaFGoQi1yqELykqhCtrOoQnvUqEI/9ahCBBapQsk2qUKNV6lCUnipQheZqULbualCoNqpQmT7qUIpHKpC7jyqQrJdqkJ3fqpCO5+qQgDAqkLF4KpCiQGrQk4iq0ISQ6tC12OrQpyEq0JgpatCJcarQunmq0KuB6xCcyisQjdJrEL8aaxCwYqsQoWrrEJKzKxCDu2sQtMNrUKYLq1CXE+tQiFwrULlkK1CqrGtQm/SrUIz861C+BOuQrw0rkKBVa5CRnauQgqXrkLPt65Ck9iuQlj5rkIdGq9C4TqvQqZbr0JqfK9CL52vQvS9r0K43q9Cff+vQkIgsEIGQbBCy2GwQo+CsEJUo7BCGcSwQt3ksEKiBbFCZiaxQitHsULwZ7FCtIixQnmpsUI9yrFCAuuxQscLskKLLLJCUE2yQhRuskLZjrJCnq+yQmLQskIn8bJC7BGzQrAys0J1U7NCOXSzQv6Us0LDtbNCh9azQkz3s0IQGLRC1Ti0QppZtEJeerRCI5u0Que7tEKs3LRCcf20QjUetUL6PrVCvl+1QoOAtUJIobVCDMK1QtHitUKWA7ZCWiS2Qh9FtkLjZbZCqIa2Qm2ntkIxyLZC9ui2QroJt0J/KrdCREu3Qghst0LNjLdCka23QlbOt0Ib77dC3w+4QqQwuEJoUbhCLXK4QvKSuEK2s7hCe9S4Qj/1uEIEFrlCyTa5Qo1XuUJSeLlCF5m5Qtu5uUKg2rlCZPu5QikcukLuPLpCsl26Qnd+ukI7n7pCAMC6QsXgukKJAbtCTiK7QhJDu0LXY7tCnIS7QmClu0IlxrtC6ea7Qq4HvEJzKLxCN0m8QvxpvELBirxChau8QkrMvEIO7bxC0w29QpguvUJcT71CIXC9QuWQvUKqsb1Cb9K9QjPzvUL4E75CvDS+QoFVvkJGdr5CCpe+Qs+3vkKT2L5CWPm+Qh0av0LhOr9Cplu/Qmp8v0Ivnb9C9L2/Qrjev0J9/79CQiDAQgZBwELLYcBCj4LAQlSjwEIZxMBC3eTAQqIFwUJmJsFCK0fBQvBnwUK0iMFCeanBQj3KwUIC68FCxwvCQosswkJQTcJCFG7CQtmOwkKer8JCYtDCQifxwkLsEcNCsDLDQnVTw0I5dMNC/pTDQsO1w0KH1sNCTPfDQhAYxELVOMRCmlnEQl56xEIjm8RC57vEQqzcxEJx/cRCNR7FQvo+xUK+X8VCg4DFQkihxUIMwsVC0eLFQpYDxkJaJMZCH0XGQuNlxkKohsZCbafGQjHIxkL26MZCugnHQn8qx0JES8dCCGzHQs2Mx0KRrcdCVs7HQhvvx0LfD8hCpDDIQmhRyEItcshC8pLIQrazyEJ71MhCP/XIQgQWyULJNslCjVfJQlJ4yUIXmclC27nJQqDayUJk+8lCKRzKQu48ykKyXcpCd37KQjufykIAwMpCxeDKQokBy0JOIstCEkPLQtdjy0KchMtCYKXLQiXGy0Lp5stCrgfMQnMozEI3ScxC/GnMQsGKzEJKzMxCXE/NQqqxzUL4E85CCpfOQlj5zkKmW89CuN7PQgZB0EJUo9BCZibRQrSI0UIC69FCUE3SQmLQ0kKwMtNC/pTTQhAY1EJeetRCrNzUQr5f1UIMwtVCWiTWQm2n1kK6CddCCGzXQhvv10JoUdhCtrPYQsk22UIXmdlCZPvZQnd+2kLF4NpCEkPbQmCl20JzKNxCwYrcQg7t3EIhcN1Cb9LdQrw03kLPt95CHRrfQmp830J9/99Cy2HgQhnE4EIrR+FCeanhQscL4kLZjuJCJ/HiQnVT40KH1uNC1TjkQiOb5EJx/eRCg4DlQtHi5UIfReZCMcjmQn8q50LNjOdC3w/oQi1y6EJ71OhCjVfpQtu56UIpHOpCO5/qQokB60LXY+tC6ebrQjdJ7EKFq+xC0w3tQuWQ7UIz8+1CgVXuQpPY7kLhOu9CL53vQkIg8EKPgvBC3eTwQvBn8UI9yvFCiyzyQp6v8kLsEfNCOXTzQkz380KaWfRC57v0Qvo+9UJIofVClgP2QuNl9kL26PZCREv3QpGt90KkMPhC8pL4Qj/1+EJSePlCoNr5Qu48+kIAwPpCTiL7QpyE+0KuB/xC/Gn8QkrM/EJcT/1CqrH9QvgT/kIKl/5CWPn+QqZb/0L0vf9CgyAAQ6pRAEPRggBDWsQAQ4H1AEOoJgFDMWgBQ1iZAUN/ygFDCAwCQy89AkNWbgJD368CQwbhAkMtEgNDtlMDQz+VA0MEtgNDjfcDQxc5BEPbWQRDZJsEQ+7cBEOy/QRDOz8FQ8WABUOJoQVDEuMFQ5wkBkNgRQZD6YYGQ3PIBkM36QZDwSoHQ0psB0MOjQdDmM4HQyEQCEPlMAhDb3IIQzOTCEO81AhDRhYJQwo3CUOTeAlDHboJQ+HaCUNqHApD9F0KQ7h+CkNCwApDywELQ48iC0MZZAtDoqULQ2bGC0PwBwxDeUkMQz1qDEPHqwxDUO0MQxQODUOeTw1DJ5ENQ+yxDUN18w1D/jQOQ8NVDkNMlw5D1dgOQ5r5DkMjOw9DrHwPQ3GdD0P63g9DgyAQQ0hBEEPRghBDWsQQQx/lEEOoJhFDMWgRQ/aIEUN/yhFDROsRQ80sEkNWbhJDG48SQ6TQEkMtEhND8jITQ3t0E0MEthNDydYTQ1IYFEPbWRRDoHoUQym8FEOy/RRDdx4VQwBgFUOJoRVDTsIVQ9cDFkNgRRZDJWYWQ66nFkM36RZD/AkXQ4VLF0MOjRdD060XQ1zvF0PlMBhDqlEYQzOTGEO81BhDgfUYQwo3GUOTeBlDWJkZQ+HaGUNqHBpDLz0aQ7h+GkN9nxpDBuEaQ48iG0NUQxtD3YQbQ2bGG0Mr5xtDtCgcQz1qHEMCixxDi8wcQxQOHUPZLh1DYnAdQ+yxHUOw0h1DORQeQ8NVHkOHdh5DELgeQ6x8H0ODICBDH+UgQ7qpIUORTSJDLRIjQ8nWI0OgeiRDOz8lQ9cDJkOupyZDSmwnQ+UwKEO81ChDWJkpQ/RdKkPLAStDZsYrQwKLLEPZLi1DdfMtQxC4LkPnWy9DgyAwQ1rEMEP2iDFDLz06Q8erTENeGl9D"},"counts":{"dtype":"<u4","b64":"AgAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAgAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAACAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAIAAAABAAAAAQAAAAEAAAABAAAAAQAAAAIAAAADAAAAAgAAAAIAAAACAAAAAwAAAAIAAAACAAAAAgAAAAMAAAACAAAAAgAAAAIAAAACAAAAAwAAAAIAAAACAAAAAgAAAAMAAAACAAAAAgAAAAIAAAADAAAAAgAAAAIAAAACAAAAAwAAAAIAAAACAAAAAgAAAAMAAAACAAAAAgAAAAIAAAACAAAAAwAAAAIAAAACAAAAAgAAAAMAAAACAAAAAgAAAAIAAAADAAAAAgAAAAIAAAACAAAAAwAAAAIAAAACAAAAAgAAAAIAAAADAAAAAgAAAAIAAAACAAAAAwAAAAIAAAACAAAAAgAAAAMAAAACAAAAAgAAAAIAAAADAAAAAgAAAAIAAAACAAAAAgAAAAMAAAACAAAAAgAAAAIAAAADAAAAAgAAAAIAAAACAAAAAwAAAAIAAAACAAAAAgAAAAMAAAACAAAAAgAAAAIAAAADAAAAAgAAAAIAAAACAAAAAgAAAAMAAAACAAAAAgAAAAIAAAADAAAAAgAAAAIAAAACAAAAAwAAAAIAAAACAAAAAgAAAAMAAAACAAAAAgAAAAIAAAACAAAAAwAAAAIAAAACAAAAAgAAAAMAAAACAAAAAgAAAAIAAAADAAAAAgAAAAIAAAACAAAAAwAAAAIAAAACAAAAAgAAAAMAAAACAAAAAgAAAAIAAAACAAAAAwAAAAIAAAACAAAAAgAAAAMAAAACAAAAAgAAAAIAAAADAAAAAgAAAAIAAAACAAAAAwAAAAIAAAACAAAAAgAAAAIAAAADAAAAAgAAAAIAAAACAAAAAwAAAAIAAAACAAAAAgAAAAMAAAACAAAAAgAAAAIAAAADAAAAAgAAAAIAAAACAAAAAgAAAAMAAAACAAAAAgAAAAIAAAADAAAAAgAAAAIAAAACAAAAAwAAAAIAAAACAAAAAgAAAAMAAAACAAAAAgAAAAIAAAADAAAAAgAAAAIAAAACAAAAAgAAAAMAAAACAAAAAgAAAAIAAAADAAAAAgAAAAIAAAACAAAAAwAAAAIAAAACAAAAAgAAAAMAAAACAAAAAgAAAAIAAAACAAAAAwAAAAIAAAACAAAAAgAAAAMAAAACAAAAAgAAAAIAAAADAAAAAgAAAAIAAAACAAAAAwAAAAIAAAACAAAAAgAAAAQAAAANAAAADQAAAA0AAAANAAAADQAAAA0AAAANAAAADQAAAA0AAAANAAAADQAAAA0AAAANAAAADQAAAA0AAAANAAAADQAAAA4AAAANAAAADQAAAA0AAAANAAAADQAAAA0AAAANAAAADQAAAA0AAAANAAAADQAAAA0AAAANAAAADQAAAA0AAAANAAAADQAAAA0AAAANAAAADQAAAA0AAAANAAAADQAAAA4AAAANAAAADQAAAA0AAAANAAAADQAAAA0AAAANAAAADQAAAA0AAAANAAAADQAAAA0AAAANAAAADQAAAAkAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABgAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAYAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAYAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAGAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAGAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABgAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAMAAAADAAAAAwAAAAIAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAIAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAIAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAACAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAACAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAACAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAACAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAACAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAACAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAACAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAACAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAgAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAgAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAgAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAgAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAgAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAgAAAAMAAAADAAAAAwAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAA"}},"source":"summary"},{"label":"Throughput","metrics":{"filename":"sockperf_single_throughput_udp.txt","version":"3.7-no.git","protocol":"UDP","target_ip":"192.168.1.3","target_port":11111,"run_time_sec":30.0,"percentiles":{},"bandwidth_mbps":912.723,"bandwidth_MBps":114.09,"msg_rate":81272,"throughput_messages":2438206,"errors":[],"test_type":"throughput","msg_size":1472,"topology":"single","run_date":"2025-11-05"}}]}}};
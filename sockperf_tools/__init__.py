@@ -0,0 +1,6 @@
+"""
+Shared helpers for analysing sockperf results from the LAN9662 test rig.
+
+Modules are imported explicitly (e.g. ``from sockperf_tools import fulllog``)
+so that lightweight entry points do not pay for NumPy or matplotlib.
+"""
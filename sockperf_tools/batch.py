@@ -0,0 +1,314 @@
+"""
+Batch analysis over whole directories of sockperf results.
+
+Files are found by directory, glob or manifest, parsed on a process pool and
+grouped by (topology, test type, payload). Test type and payload come from
+the file contents (see parser._classify); topology and firmware come from
+the manifest when one is given, otherwise from the path.
+
+Usage:
+    python -m sockperf_tools.batch results/2025-11-05/ [--jobs 8] [--json]
+    python -m sockperf_tools.batch --manifest nightly.csv
+"""
+
+import glob
+import math
+import os
+from datetime import date
+from pathlib import Path
+
+from .cache import ParseCache, cache_enabled
+from .instrument import stage
+from .parser import parse_sockperf_file
+
+DEFAULT_PATTERN = 'sockperf_*.txt'
+
+DEFAULT_MSG_SIZE = 14  # Approximate sockperf default payload, used when a run does not say
+
+# Below this many files a process pool costs more than it saves
+POOL_THRESHOLD = 32
+
+TEST_TYPE_ORDER = ('ping-pong', 'under-load', 'throughput', 'playback')
+
+
+def discover(paths, pattern=DEFAULT_PATTERN):
+    """Expand directories and glob patterns into a sorted list of result files"""
+    found = set()
+    for path in paths:
+        path = str(path)
+        if os.path.isdir(path):
+            found.update(glob.glob(os.path.join(path, '**', pattern), recursive=True))
+        elif glob.has_magic(path):
+            found.update(glob.glob(path, recursive=True))
+        elif os.path.exists(path):
+            found.add(path)
+    return sorted(found)
+
+
+def read_manifest(filename):
+    """Read a manifest of result files.
+
+    Either one path per line, or a CSV with a 'path' column and optional
+    'topology', 'firmware', 'board' and 'date' (YYYY-MM-DD) columns. Relative paths are resolved
+    against the manifest's directory. Returns a list of (path, metadata).
+    """
+    import csv
+
+    base = Path(filename).parent
+    with open(filename, newline='') as f:
+        lines = [line for line in f if line.strip() and not line.startswith('#')]
+
+    entries = []
+    if lines and 'path' in lines[0].split(','):
+        for row in csv.DictReader(lines):
+            path = row.pop('path').strip()
+            entries.append((str(base / path), {k: v.strip() for k, v in row.items() if v}))
+    else:
+        for line in lines:
+            entries.append((str(base / line.strip()), {}))
+    return entries
+
+
+def topology_from_path(filename):
+    """Guess the board topology from the file or directory names ('loopback' for host-only runs)"""
+    parts = [p.lower() for p in Path(filename).parts]
+    for part in reversed(parts):
+        if 'single' in part:
+            return 'single'
+        if 'dual' in part:
+            return 'dual'
+        if 'loopback' in part:
+            return 'loopback'
+    return 'dual'
+
+
+def test_label(result):
+    """Human-readable test name as used in the dashboards"""
+    if result.test_type == 'ping-pong':
+        size = f"{result.msg_size}B" if result.msg_size else 'Default'
+        return f"Ping-Pong ({size})"
+    if result.test_type == 'under-load':
+        return 'Under Load'
+    if result.test_type == 'throughput':
+        return 'Throughput'
+    return (result.test_type or 'unknown').title()
+
+
+_worker_caches = {}
+
+
+def _worker_cache(directory):
+    """One ParseCache per worker process, reused across its chunk of files"""
+    if directory not in _worker_caches:
+        _worker_caches[directory] = ParseCache(directory)
+    return _worker_caches[directory]
+
+
+def _parse_one(args):
+    filename, metadata, cache_dir, key = args
+    with stage('parse', file=filename):
+        if key:
+            result = _worker_cache(cache_dir).parse(filename, key)
+        else:
+            result = parse_sockperf_file(filename)
+        return _annotate(result, filename, metadata)
+
+
+def _annotate(result, filename, metadata):
+    result.topology = metadata.get('topology') or topology_from_path(filename)
+    result.firmware = metadata.get('firmware')
+    result.board = metadata.get('board')
+    result.run_date = metadata.get('date') or date.fromtimestamp(os.stat(filename).st_mtime).isoformat()
+    return result
+
+
+def parse_files(entries, jobs=None, cache=None):
+    """Parse (path, metadata) entries, on a process pool when worthwhile.
+
+    jobs=None picks os.cpu_count() for large batches and runs small batches
+    in-process; jobs=1 always runs serially. With a ParseCache, cached files
+    are loaded in this process and only the misses are parsed.
+    """
+    entries = [(e, {}) if isinstance(e, (str, os.PathLike)) else e for e in entries]
+    results = [None] * len(entries)
+    todo = []
+    with stage('cache-lookup', files=len(entries)):
+        for i, (filename, metadata) in enumerate(entries):
+            key = None
+            if cache is not None:
+                key = cache.key(filename)
+                cached = cache.get(key)
+                if cached is not None:
+                    cached.filename = str(filename)
+                    results[i] = _annotate(cached, filename, metadata)
+                    continue
+            todo.append((i, (filename, metadata, cache.directory if cache else None, key)))
+
+    if cache is not None:
+        # Misses parsed in this process go through the caller's cache object
+        _worker_caches[cache.directory] = cache
+    if jobs is None:
+        jobs = os.cpu_count() if len(todo) >= POOL_THRESHOLD else 1
+    if jobs <= 1 or len(todo) < 2:
+        parsed = [_parse_one(args) for _, args in todo]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Hand each worker a few large chunks so IPC is amortised across files
+        chunksize = max(1, math.ceil(len(todo) / (jobs * 4)))
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            parsed = list(pool.map(_parse_one, [args for _, args in todo], chunksize=chunksize))
+        if cache is not None:
+            for _, (_, _, _, key) in todo:
+                cache.note_written(key)
+
+    for (i, _), result in zip(todo, parsed):
+        results[i] = result
+    if cache is not None:
+        cache.close()
+    return results
+
+
+def sort_key(result):
+    """Order results the way the dashboards list them"""
+    rank = TEST_TYPE_ORDER.index(result.test_type) if result.test_type in TEST_TYPE_ORDER else len(TEST_TYPE_ORDER)
+    return (rank, result.msg_size or 0, result.filename or '')
+
+
+def default_cache():
+    """The shared parse cache, or None when disabled via SOCKPERF_CACHE=0"""
+    return ParseCache() if cache_enabled() else None
+
+
+def load_results(paths, topology=None, jobs=None, cache=None):
+    """Discover, parse and label results: returns {test label: result}.
+
+    When several runs share a label the last one in path order wins; use
+    aggregate() to combine them instead.
+    """
+    by_topology = load_by_topology(paths, jobs, cache)
+    if topology:
+        return by_topology.get(topology, {})
+    merged = {}
+    for labelled in by_topology.values():
+        merged.update(labelled)
+    return merged
+
+
+def load_by_topology(paths, jobs=None, cache=None):
+    """Parse results once and split them: returns {topology: {test label: result}}"""
+    results = [r for r in parse_files(discover(paths), jobs, cache) if r.test_type in TEST_TYPE_ORDER]
+    by_topology = {}
+    for result in sorted(results, key=sort_key):
+        by_topology.setdefault(result.topology, {})[test_label(result)] = result
+    return by_topology
+
+
+def aggregate(results, cache=None):
+    """Group runs by (topology, test type, payload) and pool their statistics.
+
+    Means and standard deviations are pooled weighted by observation count,
+    so the combined std-dev includes the spread between runs. Percentiles come
+    from the merged latency histogram of the group (exact samples via the
+    cache where full logs exist) rather than from averaging per-run values.
+    """
+    from .fulllog import SOCKPERF_PERCENTILES
+    from .histogram import LatencyHistogram, histogram_for
+
+    groups = {}
+    for result in results:
+        if result.test_type not in TEST_TYPE_ORDER:
+            continue
+        key = (result.topology, result.test_type, result.msg_size)
+        groups.setdefault(key, []).append(result)
+
+    summary = []
+    for (topology, test_type, msg_size), runs in sorted(groups.items(), key=lambda kv: (
+            kv[0][0] or '', sort_key(kv[1][0]))):
+        row = {
+            'topology': topology,
+            'test_type': test_type,
+            'msg_size': msg_size,
+            'label': test_label(runs[0]),
+            'runs': len(runs),
+            'files': [r.filename for r in runs],
+        }
+
+        latency_runs = [r for r in runs if r.avg_latency_us is not None and r.total_observations]
+        if latency_runs:
+            n = sum(r.total_observations for r in latency_runs)
+            mean = sum(r.avg_latency_us * r.total_observations for r in latency_runs) / n
+            sq = sum(r.total_observations * (r.std_dev_us ** 2 + (r.avg_latency_us - mean) ** 2)
+                     for r in latency_runs)
+            row['total_observations'] = n
+            row['avg_latency_us'] = mean
+            row['std_dev_us'] = math.sqrt(sq / n)
+            row['min_latency_us'] = min(r.min_latency_us for r in latency_runs)
+            row['max_latency_us'] = max(r.max_latency_us for r in latency_runs)
+            merged = LatencyHistogram.merged(histogram_for(r, cache) for r in latency_runs)
+            row['percentiles'] = merged.percentiles(SOCKPERF_PERCENTILES)
+
+        throughput_runs = [r for r in runs if r.bandwidth_mbps is not None]
+        if throughput_runs:
+            row['bandwidth_mbps'] = sum(r.bandwidth_mbps for r in throughput_runs) / len(throughput_runs)
+            row['msg_rate'] = sum(r.msg_rate for r in throughput_runs) / len(throughput_runs)
+
+        summary.append(row)
+    return summary
+
+
+def print_summary(summary):
+    print(f"{'Topology':<9} {'Test':<20} {'Runs':>5} {'Obs':>10} {'Avg (μs)':>10} "
+          f"{'Std (μs)':>10} {'Min (μs)':>10} {'P99 (μs)':>10} {'P99.9':>10} {'Max (μs)':>10} {'Mbps':>9}")
+    print("-" * 123)
+    for row in summary:
+        def fmt(key, spec):
+            return format(row[key], spec) if key in row else '-'
+
+        def pct(p):
+            value = row.get('percentiles', {}).get(p)
+            return '-' if value is None else f"{value:.2f}"
+        print(f"{row['topology']:<9} {row['label']:<20} {row['runs']:>5} "
+              f"{fmt('total_observations', ','):>10} {fmt('avg_latency_us', '.2f'):>10} "
+              f"{fmt('std_dev_us', '.2f'):>10} {fmt('min_latency_us', '.2f'):>10} "
+              f"{pct(99.0):>10} {pct(99.9):>10} "
+              f"{fmt('max_latency_us', '.2f'):>10} {fmt('bandwidth_mbps', '.2f'):>9}")
+
+
+def main(argv=None):
+    import argparse
+    import json
+    import time
+
+    ap = argparse.ArgumentParser(description="Parse and aggregate sockperf result directories")
+    ap.add_argument('paths', nargs='*', help="result files, directories or glob patterns")
+    ap.add_argument('--manifest', help="file listing result paths (plain or CSV with a 'path' column)")
+    ap.add_argument('--pattern', default=DEFAULT_PATTERN, help="filename pattern inside directories")
+    ap.add_argument('-j', '--jobs', type=int, default=None, help="worker processes (default: all cores)")
+    ap.add_argument('--json', action='store_true', help="print the aggregate as JSON")
+    ap.add_argument('--no-cache', action='store_true', help="parse every file even if cached")
+    args = ap.parse_args(argv)
+
+    entries = read_manifest(args.manifest) if args.manifest else []
+    if args.paths or not args.manifest:
+        entries += [(path, {}) for path in discover(args.paths or ['.'], args.pattern)]
+
+    start = time.perf_counter()
+    cache = None if args.no_cache else default_cache()
+    results = parse_files(entries, args.jobs, cache)
+    elapsed = time.perf_counter() - start
+    summary = aggregate(results, cache)
+
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        print(f"Parsed {len(results)} files in {elapsed * 1000:.1f} ms")
+        skipped = [r for r in results if r.test_type not in TEST_TYPE_ORDER]
+        for r in skipped:
+            print(f"  skipped {r.filename} ({r.test_type})")
+        print()
+        print_summary(summary)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,432 @@
+"""
+Benchmarks for the analysis pipeline on synthetic sockperf output.
+
+The generator writes realistic sockperf summaries and --full-log CSVs:
+a gamma-shaped latency body plus rare exponential spikes, dual/single
+topologies and the usual test mix. Corpora range from 1 to 10k files and
+full logs from 1k to 100M samples. Generated data is kept in a work
+directory and reused across benchmark runs.
+
+Each scenario runs in a fresh interpreter, so its peak RSS is its own
+(including its untimed setup, e.g. parsing before aggregation):
+
+    parse-summaries   parse_files() over a corpus, no cache
+    parse-cached      the same with a warm parse cache
+    parse-full-log    parse_sockperf_file() on one summary + full log
+    aggregate         aggregate() over a parsed corpus
+    render-overview   dual-board dashboard, all panels redrawn
+    render-comparison dual- vs single-board dashboard, all panels redrawn
+
+Results can be saved as JSON and compared against a stored baseline. A
+scenario slower than the baseline by more than --threshold (and by more than
+a few milliseconds) fails the run.
+
+Usage:
+    python -m sockperf_tools.bench run [--scale quick|default|full] [--save bench.json] [--baseline old.json]
+    python -m sockperf_tools.bench generate corpus/ --files 1000 --samples 100000 [--full-log]
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+GENERATOR_VERSION = 1
+DEFAULT_WORK_DIR = 'bench_data'
+DEFAULT_THRESHOLD = 0.10
+MIN_REGRESSION_SECONDS = 0.005  # smaller slowdowns are timer and scheduler noise
+SUMMARY_SAMPLES = 10_000  # observations behind each corpus summary
+CHUNK = 1_000_000  # samples generated and written per block
+
+# (test, payload) cycled through a corpus, as in the LAN9662 campaign
+TEST_MIX = (('ping-pong', None), ('ping-pong', 64), ('ping-pong', 512), ('ping-pong', 1472),
+            ('under-load', None), ('throughput', None))
+
+# one-way latency model per topology: (base µs, extra µs per payload byte)
+TOPOLOGY_MODEL = {'dual': (45.0, 0.020), 'single': (28.0, 0.012)}
+
+SCALES = {
+    'quick': {'files': (1, 100), 'samples': (1_000, 100_000)},
+    'default': {'files': (1, 100, 1_000), 'samples': (1_000, 100_000, 1_000_000)},
+    'full': {'files': (1, 100, 1_000, 10_000), 'samples': (1_000, 100_000, 1_000_000, 10_000_000, 100_000_000)},
+}
+
+_START_NS = 1_730_790_000 * 1_000_000_000
+
+
+# generator
+
+def synthetic_latencies(n, rng, base_us=45.0, spike_rate=1e-3, spike_us=60.0):
+    """n one-way latencies (µs): base + gamma body + occasional spikes"""
+    latencies = base_us + rng.gamma(2.0, 2.5, n)
+    spikes = rng.random(n) < spike_rate
+    latencies[spikes] += rng.exponential(spike_us, int(spikes.sum()))
+    return latencies
+
+
+def _digits(values, width):
+    """ASCII digits of non-negative integers, zero-padded: uint8 array (n, width)"""
+    out = np.empty((len(values), width), dtype=np.uint8)
+    values = values.copy()
+    for i in range(width - 1, -1, -1):
+        out[:, i] = values % 10 + 48
+        values //= 10
+    return out
+
+
+def _csv_rows(seq, tx_ns, rx_ns):
+    """sockperf full-log rows ("seq, sec.nnnnnnnnn, sec.nnnnnnnnn") built without a Python loop"""
+    def constant(text, n):
+        return np.frombuffer(text.encode(), dtype=np.uint8)[None, :].repeat(n, axis=0)
+
+    blocks = []
+    # Sequence numbers are not padded, so rows are built per digit count
+    bounds = np.searchsorted(seq, [10 ** k for k in range(1, 19)])
+    start = 0
+    for width, stop in enumerate(bounds, 1):
+        if stop == start:
+            continue
+        part = slice(start, stop)
+        n = stop - start
+        blocks.append(np.concatenate([
+            _digits(seq[part], width), constant(', ', n),
+            _digits(tx_ns[part] // 1_000_000_000, 10), constant('.', n),
+            _digits(tx_ns[part] % 1_000_000_000, 9), constant(', ', n),
+            _digits(rx_ns[part] // 1_000_000_000, 10), constant('.', n),
+            _digits(rx_ns[part] % 1_000_000_000, 9), constant('\n', n),
+        ], axis=1).tobytes())
+        start = stop
+    return b''.join(blocks)
+
+
+def write_synthetic_run(output, samples, test='ping-pong', msg_size=None, topology='dual',
+                        full_log=False, seed=0):
+    """Write <output>.txt (and <output>.csv with full_log) for one synthetic run.
+
+    Latency runs are generated in blocks of CHUNK samples, so memory stays
+    bounded for 100M-sample logs. Returns the summary path.
+    """
+    from .histogram import LatencyHistogram
+    from .loopback import DEFAULT_MSG_SIZE, Outcome, format_summary, parameters_text
+
+    rng = np.random.default_rng(seed)
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    size = msg_size or DEFAULT_MSG_SIZE
+    base_us, per_byte = TOPOLOGY_MODEL.get(topology, TOPOLOGY_MODEL['dual'])
+    reply_every = 100 if test == 'under-load' else 1
+    outcome = Outcome()
+
+    if test == 'throughput':
+        rate = 1e6 / (base_us / 4 + size * per_byte)
+        outcome.run_time_sec = samples / rate
+        outcome.sent = samples
+        parameters = parameters_text(test, 'udp', '192.168.1.3', 11111, size, outcome.run_time_sec,
+                                     None, None, 'blocking')
+        text = format_summary(test, 'udp', '192.168.1.3', 11111, parameters, outcome, 400, 'blocking', size)
+        summary = output.with_suffix('.txt')
+        summary.write_text(text)
+        return summary
+
+    hist = LatencyHistogram()
+    clock = _START_NS
+    log = None
+    parameters = None
+    try:
+        for start in range(0, samples, CHUNK):
+            n = min(CHUNK, samples - start)
+            latencies = synthetic_latencies(n, rng, base_us + size * per_byte)
+            hist.record(latencies)
+            rtt_ns = np.rint(latencies * 2000.0).astype(np.int64)
+            if reply_every == 1:
+                gap_ns = rtt_ns + rng.integers(500, 1500, n)
+            else:  # --mps 10000: one reply every reply_every * 100 µs
+                gap_ns = np.full(n, reply_every * 100_000)
+            tx_ns = clock + np.cumsum(gap_ns) - gap_ns
+            clock = int(tx_ns[-1] + gap_ns[-1])
+            if full_log:
+                if log is None:
+                    duration = samples * (clock - _START_NS) / n / 1e9
+                    parameters = parameters_text(test, 'udp', '192.168.1.3', 11111, size, duration,
+                                                 10_000, reply_every, 'blocking')
+                    log = open(output.with_suffix('.csv'), 'wb')
+                    log.write((f"------------------------------\n"
+                               f"test was performed using the following parameters: {parameters}\n"
+                               f"------------------------------\n"
+                               f"packet, txTime(sec), rxTime(sec)\n").encode())
+                log.write(_csv_rows(np.arange(start, start + n, dtype=np.int64), tx_ns, tx_ns + rtt_ns))
+    finally:
+        if log is not None:
+            log.close()
+
+    run_time = (clock - _START_NS) / 1e9
+    outcome.valid_received = samples
+    outcome.valid_sent = samples * reply_every
+    outcome.sent = outcome.valid_sent + 1
+    outcome.received = samples + 1
+    outcome.valid_run_time_sec = run_time
+    outcome.run_time_sec = run_time + 0.4
+    if parameters is None:
+        parameters = parameters_text(test, 'udp', '192.168.1.3', 11111, size, run_time,
+                                     10_000, reply_every, 'blocking')
+    text = format_summary(test, 'udp', '192.168.1.3', 11111, parameters, outcome, 400, 'blocking', size,
+                          stats=hist.stats())
+    summary = output.with_suffix('.txt')
+    summary.write_text(text)
+    return summary
+
+
+def generate_corpus(directory, files, samples=SUMMARY_SAMPLES, full_log=False, seed=0):
+    """Write files synthetic runs split between dual/ and single/, cycling through TEST_MIX"""
+    directory = Path(directory)
+    paths = []
+    for i in range(files):
+        topology = ('dual', 'single')[i % 2]
+        test, size = TEST_MIX[(i // 2) % len(TEST_MIX)]
+        name = f"sockperf_{test.replace('-', '')}_{f'{size}B' if size else 'udp'}_{i:05d}"
+        paths.append(write_synthetic_run(directory / topology / name, samples, test, size, topology,
+                                         full_log, seed + i))
+    return paths
+
+
+def _prepared(work_dir, name, build):
+    """Generated data directory, built once and reused while the generator is unchanged"""
+    path = Path(work_dir) / f"{name}_v{GENERATOR_VERSION}"
+    if not (path / '.complete').exists():
+        import shutil
+        shutil.rmtree(path, ignore_errors=True)
+        print(f"  generating {path} ...", flush=True)
+        build(path)
+        (path / '.complete').touch()
+    return path
+
+
+def prepare_corpus(work_dir, files):
+    return _prepared(work_dir, f"corpus_{files}", lambda path: generate_corpus(path, files))
+
+
+def prepare_full_log(work_dir, samples):
+    return _prepared(work_dir, f"fulllog_{samples}", lambda path: write_synthetic_run(
+        path / 'dual' / 'sockperf_pingpong_64B', samples, 'ping-pong', 64, full_log=True))
+
+
+# scenarios (run in a child interpreter)
+
+def _parse_summaries(corpus):
+    from .batch import discover, parse_files
+
+    paths = discover([corpus])
+    start = time.perf_counter()
+    parse_files(paths, jobs=1)
+    return time.perf_counter() - start, len(paths), sum(os.path.getsize(p) for p in paths)
+
+
+def _parse_cached(corpus):
+    import tempfile
+
+    from .batch import discover, parse_files
+    from .cache import ParseCache
+
+    paths = discover([corpus])
+    with tempfile.TemporaryDirectory() as cache_dir:
+        parse_files(paths, jobs=1, cache=ParseCache(cache_dir))
+        start = time.perf_counter()
+        parse_files(paths, jobs=1, cache=ParseCache(cache_dir))
+        elapsed = time.perf_counter() - start
+    return elapsed, len(paths), sum(os.path.getsize(p) for p in paths)
+
+
+def _parse_full_log(directory):
+    from .parser import parse_sockperf_file
+
+    summary = Path(directory) / 'dual' / 'sockperf_pingpong_64B.txt'
+    start = time.perf_counter()
+    result = parse_sockperf_file(summary)
+    return time.perf_counter() - start, result.total_observations, summary.with_suffix('.csv').stat().st_size
+
+
+def _aggregate(corpus):
+    from .batch import aggregate, discover, parse_files
+
+    results = parse_files(discover([corpus]), jobs=1)
+    start = time.perf_counter()
+    aggregate(results)
+    return time.perf_counter() - start, len(results), 0
+
+
+def _render(corpus, comparison):
+    import tempfile
+
+    from .batch import load_by_topology
+
+    by_topology = load_by_topology([corpus], jobs=1)
+    with tempfile.TemporaryDirectory() as tmp:
+        output = os.path.join(tmp, 'bench.png')
+        start = time.perf_counter()
+        if comparison:
+            from .comparison import render_comparison
+            render_comparison(by_topology.get('dual', {}), by_topology.get('single', {}), output, jobs=1)
+        else:
+            from .overview import render_overview
+            render_overview(by_topology.get('dual', {}), output, jobs=1)
+        elapsed = time.perf_counter() - start
+    return elapsed, 1, 0
+
+
+SCENARIOS = {
+    'parse-summaries': ('files', _parse_summaries),
+    'parse-cached': ('files', _parse_cached),
+    'parse-full-log': ('samples', _parse_full_log),
+    'aggregate': ('files', _aggregate),
+    'render-overview': ('render', lambda corpus: _render(corpus, False)),
+    'render-comparison': ('render', lambda corpus: _render(corpus, True)),
+}
+
+
+def _child():
+    """Entry point of the scenario subprocess: prints one JSON line"""
+    import contextlib
+    import io
+    import resource
+
+    name, data = sys.argv[1], sys.argv[2]
+    with contextlib.redirect_stdout(io.StringIO()):
+        seconds, items, size = SCENARIOS[name][1](data)
+    print(json.dumps({'seconds': seconds, 'items': items, 'bytes': size,
+                      'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024}))
+
+
+def run_scenario(name, data, repeat=1):
+    """Run a scenario repeat times, each in a fresh interpreter; keeps the fastest time"""
+    runs = []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, '-c', 'from sockperf_tools.bench import _child; _child()',
+                              name, str(data)], capture_output=True, text=True, check=True,
+                             env=dict(os.environ, SOCKPERF_CACHE='0'))
+        runs.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    best = min(runs, key=lambda r: r['seconds'])
+    best['peak_rss_mb'] = max(r['peak_rss_mb'] for r in runs)
+    return best
+
+
+def run_suite(scale='quick', work_dir=DEFAULT_WORK_DIR, scenarios=None, repeat=3):
+    """Run the scenarios over the scale's corpus sizes; returns a list of result dicts"""
+    sizes = SCALES[scale]
+    results = []
+    for name, (axis, _) in SCENARIOS.items():
+        if scenarios and name not in scenarios:
+            continue
+        if axis == 'samples':
+            points = [(n, prepare_full_log(work_dir, n)) for n in sizes['samples']]
+        elif axis == 'render':
+            points = [(max(sizes['files']), prepare_corpus(work_dir, max(sizes['files'])))]
+        else:
+            points = [(n, prepare_corpus(work_dir, n)) for n in sizes['files']]
+        for n, data in points:
+            row = run_scenario(name, data, repeat)
+            row.update(scenario=name, size=n, unit='samples' if axis == 'samples' else 'files')
+            results.append(row)
+            print(_format_row(row), flush=True)
+    return results
+
+
+def environment():
+    """What the numbers depend on: versions, CPU count and the git revision"""
+    import platform
+
+    import matplotlib
+
+    try:
+        revision = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                                  cwd=Path(__file__).parent).stdout.strip() or None
+    except OSError:
+        revision = None
+    return {
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'matplotlib': matplotlib.__version__,
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'revision': revision,
+        'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+
+
+def _format_row(row, baseline=None):
+    seconds = row['seconds']
+    rate = f"{row['items'] / seconds:,.0f}/s" if seconds and row['scenario'].startswith('parse') else ''
+    bandwidth = f"{row['bytes'] / seconds / 1e6:,.1f} MB/s" if seconds and row['bytes'] else ''
+    text = (f"{row['scenario']:<18} {row['size']:>11,} {row['unit']:<7} {seconds * 1000:>10.1f} ms "
+            f"{rate:>14} {bandwidth:>12} {row['peak_rss_mb']:>8.1f} MB")
+    if baseline:
+        text += f"  {(seconds / baseline['seconds'] - 1.0) * 100:+6.1f}%"
+    return text
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """Print results next to a baseline; returns the rows slower by more than threshold"""
+    old = {(r['scenario'], r['size']): r for r in baseline['results']}
+    regressions = []
+    print(f"\nCompared with baseline {baseline['environment'].get('revision') or ''} "
+          f"({baseline['environment'].get('date', '?')}):")
+    for row in results:
+        previous = old.get((row['scenario'], row['size']))
+        line = _format_row(row, previous)
+        if previous and row['seconds'] > previous['seconds'] * (1.0 + threshold) \
+                and row['seconds'] - previous['seconds'] > MIN_REGRESSION_SECONDS:
+            regressions.append(row)
+            line += "  ⚠ slower"
+        print(line)
+    return regressions
+
+
+def main(argv=None):
+    import argparse
+
+    ap = argparse.ArgumentParser(description="Benchmark the sockperf analysis pipeline on synthetic data")
+    sub = ap.add_subparsers(dest='command', required=True)
+
+    run = sub.add_parser('run', help="run the benchmark suite")
+    run.add_argument('--scale', choices=list(SCALES), default='quick')
+    run.add_argument('--scenario', action='append', choices=list(SCENARIOS), help="run only these scenarios")
+    run.add_argument('--repeat', type=int, default=3, help="runs per scenario; the fastest is kept")
+    run.add_argument('--work-dir', default=DEFAULT_WORK_DIR, help="where generated data is kept")
+    run.add_argument('--save', metavar='JSON', help="write the results here")
+    run.add_argument('--baseline', metavar='JSON', help="compare against saved results")
+    run.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                     help="relative slowdown that counts as a regression")
+
+    gen = sub.add_parser('generate', help="write a synthetic corpus")
+    gen.add_argument('directory')
+    gen.add_argument('--files', type=int, default=100)
+    gen.add_argument('--samples', type=int, default=SUMMARY_SAMPLES, help="observations per run")
+    gen.add_argument('--full-log', action='store_true', help="also write the per-message CSVs")
+    gen.add_argument('--seed', type=int, default=0)
+    args = ap.parse_args(argv)
+
+    if args.command == 'generate':
+        start = time.perf_counter()
+        paths = generate_corpus(args.directory, args.files, args.samples, args.full_log, args.seed)
+        print(f"✓ Wrote {len(paths)} runs to {args.directory} in {time.perf_counter() - start:.1f} s")
+        return
+
+    print(f"{'Scenario':<18} {'Size':>11} {'':<7} {'Time':>13} {'Throughput':>14} {'':>12} {'Peak RSS':>11}")
+    print("-" * 95)
+    results = run_suite(args.scale, args.work_dir, args.scenario, args.repeat)
+    report = {'environment': environment(), 'scale': args.scale, 'results': results}
+    if args.save:
+        Path(args.save).write_text(json.dumps(report, indent=2))
+        print(f"\n✓ Results saved to {args.save}")
+    if args.baseline:
+        regressions = compare(results, json.loads(Path(args.baseline).read_text()), args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} scenario(s) slower than the baseline by more than {args.threshold:.0%}")
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
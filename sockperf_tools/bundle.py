@@ -0,0 +1,188 @@
+"""
+Data bundle for the interactive dashboard in index.html.
+
+The PNG dashboards are static and cost a Python toolchain to regenerate.
+This module exports what the page's own renderer (dashboard.js) needs to
+draw zoomable, filterable charts in the browser:
+
+    runs        every run's summary metrics, per topology and test label
+    histogram   the run's latency histogram as its non-empty buckets
+                (exact from a full log, otherwise rebuilt from the summary)
+    series      windowed p50/p99/max and msgs/s over time (full logs only)
+    samples     min/max-decimated raw samples at a few resolutions, coarse
+                to fine; the page draws the finest level that fits the
+                zoomed range
+
+Arrays are packed as little-endian typed arrays in base64, which the page
+decodes straight into Float32Array/Uint32Array views. The size depends on
+the number of test labels and resolution levels, not on how many samples
+or runs the archive holds, so the page opens quickly either way.
+
+The default output is a script (dashboard_data.js) that sets
+window.SOCKPERF_BUNDLE, so index.html also works when opened from disk;
+a .json or .json.gz output is fetched instead when the page is served.
+
+The bundle carries no timestamp, only the parser version, so rebuilding it
+from the same results gives the same bytes. The checked-in dashboard_data.js
+is tested against a fresh build: a change to a parsed metric has to
+regenerate it in the same commit.
+
+Usage:
+    python -m sockperf_tools.bundle [paths ...] [-o dashboard_data.js] [--levels 500,4000,16000]
+"""
+
+import base64
+import json
+
+BUNDLE_VERSION = 1
+DEFAULT_OUTPUT = 'dashboard_data.js'
+DEFAULT_LEVELS = (500, 4000, 16000)
+JS_GLOBAL = 'SOCKPERF_BUNDLE'
+SERIES_KEYS = ('p50_us', 'p99_us', 'max_us', 'msg_rate')
+
+
+def encode(values, dtype='<f4'):
+    """{'dtype', 'b64'} of an array packed as a little-endian typed array"""
+    import numpy as np
+
+    data = np.ascontiguousarray(values, dtype=dtype).tobytes()
+    return {'dtype': dtype, 'b64': base64.b64encode(data).decode('ascii')}
+
+
+def decode(array):
+    """The NumPy array of an encode() dict"""
+    import numpy as np
+
+    return np.frombuffer(base64.b64decode(array['b64']), dtype=array['dtype'])
+
+
+def histogram_data(hist):
+    """Non-empty buckets (highest equivalent value, count) and exact moments of a LatencyHistogram"""
+    import numpy as np
+
+    nonzero = np.flatnonzero(hist.counts)
+    counts = hist.counts[nonzero]
+    return {
+        'digits': hist.significant_digits,
+        'count': hist.count,
+        'mean_us': hist.mean,
+        'std_dev_us': hist.std_dev_us,
+        'min_us': hist.min_us,
+        'max_us': hist.max_us,
+        'upper_us': encode(hist.bucket_edges_us()[1][nonzero]),
+        'counts': encode(counts, '<u4' if counts.max() < 2 ** 32 else '<f8'),
+    }
+
+
+def samples_data(filename, levels=DEFAULT_LEVELS):
+    """Min/max-decimated (time_s, latency_us) of a full log at each resolution, coarse to fine"""
+    from .timeseries import downsample, downsample_log
+
+    times, values = downsample_log(filename, max(levels))
+    data = []
+    for points in sorted(levels):
+        x, y = downsample(times, values, points) if points < max(levels) else (times, values)
+        data.append({'points': len(x), 'time_s': encode(x), 'latency_us': encode(y)})
+    return data
+
+
+def run_data(label, result, cache=None, levels=DEFAULT_LEVELS):
+    """Bundle entry of one parsed run"""
+    from pathlib import Path
+
+    from .parser import full_log_path
+
+    metrics = result.as_dict()
+    metrics['filename'] = Path(result.filename).name
+    run = {'label': label, 'metrics': metrics}
+    if 'avg_latency_us' not in result:
+        return run
+
+    from .histogram import histogram_for
+    from .timeseries import series_for
+
+    run['histogram'] = histogram_data(histogram_for(result, cache))
+    log_file = full_log_path(result.filename)
+    run['source'] = 'full-log' if log_file else 'summary'
+    if log_file:
+        series = series_for(result)
+        run['series'] = {'window_s': series['window_s'], 'time_s': encode(series['time_s']),
+                         **{key: encode(series[key]) for key in SERIES_KEYS}}
+        run['samples'] = samples_data(log_file, levels)
+    return run
+
+
+def build_bundle(by_topology, cache=None, levels=DEFAULT_LEVELS):
+    """Bundle dict for {topology: {test label: result}}"""
+    from .overview import TOPOLOGIES
+    from .parser import PARSER_VERSION
+
+    bundle = {'version': BUNDLE_VERSION, 'parser': PARSER_VERSION, 'topologies': {}}
+    for topology, results in by_topology.items():
+        name, path = TOPOLOGIES.get(topology, (topology.title(), 'unknown path'))
+        bundle['topologies'][topology] = {
+            'name': name,
+            'path': path,
+            'runs': [run_data(label, result, cache, levels) for label, result in results.items()],
+        }
+    return _json_ready(bundle)
+
+
+def write_bundle(bundle, output=DEFAULT_OUTPUT):
+    """Write a bundle as a script (.js), JSON (.json) or gzip-compressed JSON (.gz); returns the size in bytes"""
+    import gzip
+    from pathlib import Path
+
+    output = Path(output)
+    text = json.dumps(bundle, separators=(',', ':'), allow_nan=False)
+    if output.suffix == '.js':
+        data = f'window.{JS_GLOBAL} = {text};\n'.encode()
+    elif output.suffix == '.gz':
+        data = gzip.compress(text.encode(), mtime=0)
+    else:
+        data = text.encode()
+    output.write_bytes(data)
+    return len(data)
+
+
+def _json_ready(value):
+    """Replace NaN/inf (not valid JSON) with None and number keys with strings, recursively"""
+    import math
+
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key if isinstance(key, str) else json.dumps(key): _json_ready(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_ready(item) for item in value]
+    return value
+
+
+def main(argv=None):
+    import argparse
+
+    from .batch import DEFAULT_PATTERN, default_cache, load_by_topology
+
+    ap = argparse.ArgumentParser(description="Export the data bundle drawn by index.html")
+    ap.add_argument('paths', nargs='*', default=[DEFAULT_PATTERN], help="result files, directories or globs")
+    ap.add_argument('-o', '--output', default=DEFAULT_OUTPUT, help=f"bundle file: .js, .json or .json.gz "
+                                                                   f"(default {DEFAULT_OUTPUT})")
+    ap.add_argument('--levels', default=','.join(map(str, DEFAULT_LEVELS)),
+                    help="sample points per time-series resolution level")
+    ap.add_argument('-j', '--jobs', type=int, help="parsing processes (default: all cores)")
+    args = ap.parse_args(argv)
+
+    cache = default_cache()
+    by_topology = load_by_topology(args.paths, jobs=args.jobs, cache=cache)
+    levels = tuple(int(points) for points in args.levels.split(','))
+    bundle = build_bundle(by_topology, cache, levels)
+    if cache:
+        cache.save_index()
+    size = write_bundle(bundle, args.output)
+    runs = sum(len(topology['runs']) for topology in bundle['topologies'].values())
+    print(f"✓ Bundle of {runs} runs in {len(bundle['topologies'])} topologies written to {args.output} "
+          f"({size / 1024:.0f} KiB)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,289 @@
+"""
+Content-addressed cache of parsed sockperf results.
+
+Entries are keyed by a SHA-256 of the summary file, its --full-log CSV (if
+any) and PARSER_VERSION, so renaming or copying archived results still hits
+and a parser change invalidates everything. Each entry is a pickled
+SockperfResult plus, for full logs, the raw latency samples as a .npy file
+that can be memory-mapped back without re-reading the CSV.
+
+Hashing a multi-gigabyte CSV on every run would defeat the purpose, so
+digests are memoised in an index: one (size, mtime_ns) stamp and digest per
+result file, replaced when the file changes and dropped once its entry is
+evicted. The cache is bounded by total size; the least recently used entries
+are evicted first. The index also tracks the cache's size, so the directory
+is only scanned when that estimate goes over the limit.
+
+The cache lives in $SOCKPERF_CACHE_DIR, defaulting to ~/.cache/sockperf_tools.
+Set SOCKPERF_CACHE=0 to disable it.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+from pathlib import Path
+
+from .instrument import stage
+from .parser import PARSER_VERSION, full_log_path, parse_sockperf_file
+
+CACHE_FORMAT = 1
+INDEX_FORMAT = 2
+DEFAULT_MAX_BYTES = 2 * 1024 ** 3
+HASH_BLOCK = 4 * 1024 * 1024
+SAMPLE_SUFFIX = '.sps'  # samples.SUFFIX, without importing NumPy here
+
+
+def default_cache_dir():
+    return Path(os.environ.get('SOCKPERF_CACHE_DIR') or Path.home() / '.cache' / 'sockperf_tools')
+
+
+def cache_enabled():
+    return os.environ.get('SOCKPERF_CACHE', '1').lower() not in ('0', 'false', 'no', 'off')
+
+
+def _hash_file(hasher, filename):
+    with open(filename, 'rb') as f:
+        while True:
+            block = f.read(HASH_BLOCK)
+            if not block:
+                break
+            hasher.update(block)
+
+
+def content_key(filename):
+    """SHA-256 over a result file, its full log (if any) and the parser version"""
+    hasher = hashlib.sha256(f"sockperf-parse:{CACHE_FORMAT}:{PARSER_VERSION}".encode())
+    paths = [Path(filename)]
+    log_file = full_log_path(filename)
+    if log_file:
+        paths.append(log_file)
+    for path in paths:
+        hasher.update(b'\0' + path.suffix.encode() + b'\0')
+        _hash_file(hasher, path)
+    return hasher.hexdigest()
+
+
+def _atomic_write(path, write):
+    """Write via a temp file + rename so concurrent workers never see partial entries"""
+    import tempfile
+
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            write(f)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+class ParseCache:
+    """On-disk parse cache with size-bounded LRU eviction"""
+
+    def __init__(self, directory=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = Path(directory) if directory else default_cache_dir()
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._index_file = self.directory / 'index.json'
+        self._index_dirty = False
+        index = self._read_index()
+        self._memo = index.get('memo', {})  # resolved path -> [stamp, digest]
+        self._bytes = index.get('bytes')  # size at the last scan plus later writes; None: unknown
+        self._written = 0  # bytes of entries written since the index was last saved
+        self._live = None  # digests still cached after an eviction scan
+
+    def _read_index(self):
+        try:
+            with open(self._index_file) as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return index if isinstance(index, dict) and index.get('format') == INDEX_FORMAT else {}
+
+    def key(self, filename):
+        """Content key for a result file (and its full log, if present)"""
+        paths = [Path(filename)]
+        log_file = full_log_path(filename)
+        if log_file:
+            paths.append(log_file)
+
+        stamp = []
+        for path in paths:
+            st = path.stat()
+            stamp.append([str(path.resolve()), st.st_size, st.st_mtime_ns])
+        memo = self._memo.get(stamp[0][0])
+        if memo and memo[0] == stamp:
+            return memo[1]
+
+        digest = content_key(filename)
+        # One memo per result file: a new version replaces the old one
+        self._memo[stamp[0][0]] = [stamp, digest]
+        self._index_dirty = True
+        return digest
+
+    def _entry(self, key, suffix):
+        return self.directory / key[:2] / (key + suffix)
+
+    def get(self, key):
+        """Return the cached result for key, or None"""
+        path = self._entry(key, '.pkl')
+        try:
+            with open(path, 'rb') as f:
+                result = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+        os.utime(path)  # mark as recently used
+        return result
+
+    def put(self, key, result):
+        """Store a parsed result"""
+        path = self._entry(key, '.pkl')
+        path.parent.mkdir(exist_ok=True)
+        _atomic_write(path, lambda f: pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL))
+        self._track(path)
+
+    def put_samples(self, key, samples):
+        """Store raw latency samples as a .npy file"""
+        import numpy as np
+        path = self._entry(key, '.npy')
+        path.parent.mkdir(exist_ok=True)
+        _atomic_write(path, lambda f: np.save(f, samples))
+        self._track(path)
+
+    def _track(self, path):
+        try:
+            self._written += path.stat().st_size
+        except OSError:
+            pass
+
+    def note_written(self, key):
+        """Count entries another process wrote for key towards the size limit"""
+        for suffix in ('.pkl', '.npy'):
+            self._track(self._entry(key, suffix))
+
+    def samples(self, key):
+        """Memory-map the cached latency samples for key, or None"""
+        path = self._entry(key, '.npy')
+        if not path.exists():
+            return None
+        import numpy as np
+        os.utime(path)
+        return np.load(path, mmap_mode='r')
+
+    def parse(self, filename, key=None):
+        """Parse a result file through the cache"""
+        key = key or self.key(filename)
+        result = self.get(key)
+        if result is None:
+            result = parse_sockperf_file(filename, use_full_log=False)
+            log_file = full_log_path(filename)
+            if log_file and log_file.suffix == SAMPLE_SUFFIX:
+                # Already memory-mapped, with its statistics in the header
+                from .fulllog import full_log_stats
+                with stage('full-log', file=log_file):
+                    result.update(full_log_stats(log_file))
+            elif log_file:
+                from .fulllog import latency_stats, read_latencies
+                with stage('full-log', file=log_file):
+                    samples, seq = read_latencies(log_file, with_seq=True)
+                    self.put_samples(key, samples)
+                    # latency_stats sorts in place, so only after the time-ordered
+                    # samples are safely on disk
+                    result.update(latency_stats(samples, jitter=True, seq=seq))
+            self.put(key, result)
+        result.filename = str(filename)
+        return result
+
+    def load_latencies(self, filename):
+        """Raw latency samples (µs) in message order for a run with a full log, or None"""
+        log_file = full_log_path(filename)
+        if not log_file:
+            return None
+        if log_file.suffix == SAMPLE_SUFFIX:
+            from .samples import SampleFile
+            return SampleFile(log_file).latencies()
+        key = self.key(filename)
+        samples = self.samples(key)
+        if samples is None:
+            from .fulllog import read_latencies
+            self.put_samples(key, read_latencies(log_file))
+            samples = self.samples(key)
+        return samples
+
+    def save_index(self):
+        """Write the memo and tracked size, merged with what other processes saved meanwhile"""
+        if not (self._index_dirty or self._written):
+            return
+        disk = self._read_index()
+        memo = disk.get('memo', {})
+        memo.update(self._memo)
+        size = disk.get('bytes')
+        if self._live is not None:
+            memo = {path: m for path, m in memo.items() if m[1] in self._live}
+            size, self._live = self._bytes, None
+        self._memo = memo
+        self._bytes = None if size is None else size + self._written
+        self._written = 0
+        index = {'format': INDEX_FORMAT, 'bytes': self._bytes, 'memo': self._memo}
+        _atomic_write(self._index_file, lambda f: f.write(json.dumps(index).encode()))
+        self._index_dirty = False
+
+    def evict(self, force=False):
+        """Drop least recently used entries until the cache fits in max_bytes.
+
+        Scans the directory only when the tracked size is unknown or over the
+        limit (or with force). Returns the cache size.
+        """
+        if not force and self._bytes is not None and self._bytes + self._written <= self.max_bytes:
+            return self._bytes + self._written
+        entries = {}
+        for path in self.directory.glob('*/*'):
+            if path.name.startswith('.tmp-'):
+                continue
+            st = path.stat()
+            used, size, paths = entries.get(path.stem, (0, 0, []))
+            entries[path.stem] = (max(used, st.st_mtime), size + st.st_size, paths + [path])
+
+        total = sum(size for _, size, _ in entries.values())
+        for _, size, paths in sorted(entries.values()):
+            if total <= self.max_bytes:
+                break
+            for path in paths:
+                path.unlink(missing_ok=True)
+            del entries[paths[0].stem]
+            total -= size
+
+        self._live = set(entries)
+        self._bytes, self._written = total, 0
+        self._index_dirty = True
+        return total
+
+    def close(self):
+        self.save_index()
+        self.evict()
+        self.save_index()
+
+
+def main(argv=None):
+    import argparse
+
+    ap = argparse.ArgumentParser(description="Inspect or clear the sockperf parse cache")
+    ap.add_argument('action', choices=['info', 'clear', 'evict'])
+    ap.add_argument('--max-bytes', type=int, default=DEFAULT_MAX_BYTES)
+    args = ap.parse_args(argv)
+
+    cache = ParseCache(max_bytes=args.max_bytes)
+    if args.action == 'clear':
+        cache.max_bytes = 0
+    if args.action in ('clear', 'evict'):
+        cache.evict(force=True)
+        cache.save_index()
+    files = [p for p in cache.directory.glob('*/*') if not p.name.startswith('.tmp-')]
+    total = sum(p.stat().st_size for p in files)
+    print(f"{cache.directory}: {len(files)} files, {total / 1024 ** 2:.1f} MiB "
+          f"(limit {cache.max_bytes / 1024 ** 2:.0f} MiB)")
+
+
+if __name__ == '__main__':
+    main()
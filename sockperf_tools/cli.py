@@ -0,0 +1,224 @@
+"""
+Command-line entry point: ``python -m sockperf_tools <command> ...``
+
+Commands:
+    summary   console or JSON summary of a result set (no plotting)
+    analyze   dual-board dashboard (analyze_results.py)
+    compare   dual- vs single-board dashboard (compare_dual_vs_single.py)
+    nway      rank and compare any number of configurations
+    batch     aggregate whole result directories
+    store     ingest into / query the SQLite results store
+    cache     inspect or clear the parse cache
+    fulllog   exact statistics from --full-log CSV files
+    samples   convert full logs to memory-mapped binary sample files
+    jitter    IPDV, PDV and spike analysis of full-log samples
+    sequence  loss bursts, reordering and duplicates from full-log sequence numbers
+    timeseries  windowed latency over time and downsampled samples
+    hostnoise  sample host noise (IRQs, softirqs, NICs) and correlate it with spikes
+    pcap      per-hop latency from packet captures at several taps
+    bundle    export the data bundle drawn by index.html
+    significance  bootstrap comparison of two runs
+    watch     live statistics while sockperf is running
+    loopback  host-only ping-pong/throughput baseline in sockperf's formats
+    matrix    run a declarative test matrix and analyse results as they arrive
+    sweep     latency-vs-load curves and knee detection over under-load sweeps
+    playback  generate playback schedules; latency of playback runs by time slice and size
+    bench     benchmark the analysis pipeline on synthetic data
+
+Each command imports only what it needs, so ``summary`` never loads NumPy or
+matplotlib unless a full-log CSV has to be parsed.
+"""
+
+import argparse
+import sys
+
+from .instrument import stage
+
+# Commands implemented by a module's own main(argv)
+_DELEGATES = {
+    'nway': ('sockperf_tools.nway', "rank and compare any number of configurations"),
+    'batch': ('sockperf_tools.batch', "aggregate whole result directories"),
+    'store': ('sockperf_tools.store', "ingest into / query the SQLite results store"),
+    'cache': ('sockperf_tools.cache', "inspect or clear the parse cache"),
+    'fulllog': ('sockperf_tools.fulllog', "exact statistics from --full-log CSV files"),
+    'samples': ('sockperf_tools.samples', "convert full logs to memory-mapped binary sample files"),
+    'jitter': ('sockperf_tools.jitter', "IPDV, PDV and spike analysis of full-log samples"),
+    'sequence': ('sockperf_tools.sequence', "loss bursts, reordering and duplicates from full-log sequence numbers"),
+    'timeseries': ('sockperf_tools.timeseries', "windowed latency over time and downsampled samples"),
+    'hostnoise': ('sockperf_tools.hostnoise', "sample host noise (IRQs, softirqs, NICs) and correlate it with spikes"),
+    'pcap': ('sockperf_tools.pcap', "per-hop latency from packet captures at several taps"),
+    'bundle': ('sockperf_tools.bundle', "export the data bundle drawn by index.html"),
+    'significance': ('sockperf_tools.significance', "bootstrap comparison of two runs"),
+    'watch': ('sockperf_tools.watch', "live statistics while sockperf is running"),
+    'loopback': ('sockperf_tools.loopback', "host-only ping-pong/throughput baseline in sockperf's formats"),
+    'matrix': ('sockperf_tools.matrix', "run a declarative test matrix and analyse results as they arrive"),
+    'sweep': ('sockperf_tools.sweep', "latency-vs-load curves and knee detection over under-load sweeps"),
+    'playback': ('sockperf_tools.playback', "generate playback schedules; latency of playback runs by time slice and size"),
+    'bench': ('sockperf_tools.bench', "benchmark the analysis pipeline on synthetic data"),
+}
+
+
+def _add_paths(parser):
+    from .batch import DEFAULT_PATTERN
+
+    parser.add_argument('paths', nargs='*', default=[DEFAULT_PATTERN], help="result files, directories or globs")
+    parser.add_argument('--profile', metavar='JSON', help="write per-stage time and memory to this report")
+    parser.add_argument('--profile-capture', choices=['cprofile', 'sample'],
+                        help="also profile the slowest stage in detail (with --profile)")
+    parser.add_argument('--profile-no-memory', action='store_true',
+                        help="skip tracemalloc (lower overhead, no peak allocations)")
+
+
+def _add_plot_options(parser, output):
+    parser.add_argument('--store', metavar='DB', help="also ingest the parsed runs into this results store")
+    parser.add_argument('-o', '--output', default=output, help=f"image file (default {output})")
+    parser.add_argument('--dpi', type=int, default=300)
+    parser.add_argument('--format', dest='fmt', help="image format (default: from the output suffix)")
+    parser.add_argument('-j', '--jobs', type=int, help="panel rendering processes (default: all cores)")
+    parser.add_argument('--no-plot', action='store_true', help="print the report without rendering")
+
+
+def _store(filename, results, cache):
+    from .store import ResultStore
+
+    with ResultStore(filename) as store:
+        print(f"✓ Stored {store.ingest(results, cache)} runs in {filename}")
+
+
+def _render_options(args):
+    """Output path and keyword arguments shared by the dashboard renderers"""
+    from pathlib import Path
+
+    from .cache import cache_enabled, default_cache_dir
+
+    output = Path(args.output)
+    if args.fmt and output.suffix.lstrip('.') != args.fmt:
+        output = output.with_suffix('.' + args.fmt)
+    # Stages drawn in worker processes would be missing from a profile
+    jobs = 1 if args.profile else args.jobs
+    return output, dict(dpi=args.dpi, fmt=args.fmt, jobs=jobs,
+                        cache_dir=default_cache_dir() if cache_enabled() else None)
+
+
+def cmd_summary(args):
+    import json
+
+    from .batch import default_cache, load_by_topology
+    from .overview import print_overview
+
+    with stage('load'):
+        by_topology = load_by_topology(args.paths, cache=default_cache())
+    if args.topology != 'all':
+        by_topology = {args.topology: by_topology.get(args.topology, {})}
+
+    with stage('report'):
+        if args.json:
+            print(json.dumps({topology: {label: result.as_dict() for label, result in results.items()}
+                              for topology, results in by_topology.items()}, indent=2))
+        else:
+            for topology, results in by_topology.items():
+                print_overview(results, topology)
+
+
+def cmd_analyze(args):
+    from .batch import default_cache, load_results
+    from .overview import print_overview, render_overview
+
+    cache = default_cache()
+    with stage('load'):
+        results = load_results(args.paths, topology='dual', cache=cache)
+    for test_name, result in results.items():
+        print(f"✓ Parsed {test_name} ({result.filename})")
+
+    if args.store:
+        with stage('store'):
+            _store(args.store, results.values(), cache)
+    if not args.no_plot:
+        output, options = _render_options(args)
+        with stage('render', output=output):
+            render_overview(results, output, **options)
+    with stage('report'):
+        print_overview(results)
+
+
+def cmd_compare(args):
+    from .batch import default_cache, load_by_topology
+    from .comparison import print_comparison, render_comparison
+
+    cache = default_cache()
+    with stage('load'):
+        by_topology = load_by_topology(args.paths, cache=cache)
+    dual_results = by_topology.get('dual', {})
+    single_results = by_topology.get('single', {})
+
+    for test_name in dual_results:
+        print(f"✓ Parsed dual-board {test_name}")
+    for test_name in single_results:
+        print(f"✓ Parsed single-board {test_name}")
+
+    if args.store:
+        with stage('store'):
+            _store(args.store, list(dual_results.values()) + list(single_results.values()), cache)
+    if not args.no_plot:
+        output, options = _render_options(args)
+        with stage('render', output=output):
+            render_comparison(dual_results, single_results, output, **options)
+    with stage('report'):
+        print_comparison(dual_results, single_results)
+
+    if not args.no_stats:
+        from .significance import compare_runs, print_significance
+
+        tests = [t for t in dual_results if t in single_results and 'avg_latency_us' in dual_results[t]]
+        comparisons = {}
+        for test in tests:
+            with stage('significance', test=test):
+                comparisons[test] = compare_runs(dual_results[test], single_results[test],
+                                                 resamples=args.resamples, cache=cache, seed=args.seed)
+        print_significance(comparisons)
+
+
+def build_parser():
+    ap = argparse.ArgumentParser(prog='sockperf_tools', description="LAN9662 sockperf result analysis")
+    sub = ap.add_subparsers(dest='command', metavar='command', required=True)
+
+    p = sub.add_parser('summary', help="console or JSON summary of a result set (no plotting)")
+    _add_paths(p)
+    p.add_argument('--topology', choices=['dual', 'single', 'loopback', 'all'], default='dual')
+    p.add_argument('--json', action='store_true', help="print the parsed runs as JSON")
+    p.set_defaults(func=cmd_summary)
+
+    p = sub.add_parser('analyze', help="dual-board dashboard and report")
+    _add_paths(p)
+    _add_plot_options(p, 'test_results_visualization.png')
+    p.set_defaults(func=cmd_analyze)
+
+    p = sub.add_parser('compare', help="dual- vs single-board dashboard and report")
+    _add_paths(p)
+    _add_plot_options(p, 'comparison_dual_vs_single.png')
+    p.add_argument('--resamples', type=int, default=10_000, help="bootstrap resamples (0: rank test only)")
+    p.add_argument('--seed', type=int, help="bootstrap random seed")
+    p.add_argument('--no-stats', action='store_true', help="skip the significance tests")
+    p.set_defaults(func=cmd_compare)
+
+    for name, (_, help_text) in _DELEGATES.items():
+        sub.add_parser(name, help=help_text, add_help=False)
+    return ap
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv and argv[0] in _DELEGATES:
+        import importlib
+        return importlib.import_module(_DELEGATES[argv[0]][0]).main(argv[1:])
+
+    args = build_parser().parse_args(argv)
+    if not args.profile:
+        return args.func(args)
+
+    from .instrument import print_profile, profiling
+
+    with profiling(args.profile, not args.profile_no_memory, args.profile_capture, ['sockperf_tools'] + argv) as profiler:
+        args.func(args)
+    print_profile(profiler.result)
+    print(f"\n✓ Profile written to {args.profile}")
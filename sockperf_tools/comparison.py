@@ -0,0 +1,371 @@
+"""
+Dual-board vs single-board comparison dashboard and console report.
+
+The 3x3 figure and the text report produced by compare_dual_vs_single.py,
+with one function per panel for the incremental renderer in render.py. When
+both boards have a full log for the same run, a fourth row overlays them
+over time.
+"""
+
+from .batch import DEFAULT_MSG_SIZE
+from .render import Panel, pick, render_dashboard
+from .timeseries import draw_latency_over_time, draw_rate_over_time, draw_samples_over_time, full_log_runs
+
+DEFAULT_OUTPUT = 'comparison_dual_vs_single.png'
+
+TITLE = ('LAN9662 Dual-Board vs Single-Board Performance Comparison\n'
+         'Comprehensive Network Performance Analysis')
+
+
+def _ping_pong_tests(dual_results, single_results):
+    """Ping-pong labels present for both boards, and their payload sizes"""
+    tests = [t for t in dual_results if dual_results[t].test_type == 'ping-pong' and t in single_results]
+    return tests, [dual_results[t].msg_size or DEFAULT_MSG_SIZE for t in tests]
+
+
+def _draw_latency(ax, dual_results, single_results):
+    """Latency Comparison by Message Size"""
+    ping_pong_tests, msg_sizes = _ping_pong_tests(dual_results, single_results)
+
+    dual_latencies = [dual_results[t]['avg_latency_us'] for t in ping_pong_tests if t in dual_results]
+    single_latencies = [single_results[t]['avg_latency_us'] for t in ping_pong_tests if t in single_results]
+
+    ax.plot(msg_sizes[:len(dual_latencies)], dual_latencies, 'o-', linewidth=2, markersize=8,
+             label='Dual Board', color='#e74c3c')
+    ax.plot(msg_sizes[:len(single_latencies)], single_latencies, 's-', linewidth=2, markersize=8,
+             label='Single Board', color='#2ecc71')
+    ax.set_xlabel('Message Size (Bytes)', fontsize=11, fontweight='bold')
+    ax.set_ylabel('Latency (μs)', fontsize=11, fontweight='bold')
+    ax.set_title('Average Latency Comparison', fontsize=12, fontweight='bold')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+    ax.set_xscale('log')
+
+
+def _draw_jitter(ax, dual_results, single_results):
+    """Jitter Comparison"""
+    from .jitter import METRIC_LABELS, jitter_metric, jitter_value
+
+    ping_pong_tests, msg_sizes = _ping_pong_tests(dual_results, single_results)
+    metric = jitter_metric([dual_results[t] for t in ping_pong_tests if t in dual_results] +
+                           [single_results[t] for t in ping_pong_tests if t in single_results])
+    dual_jitters = [jitter_value(dual_results[t], metric) for t in ping_pong_tests if t in dual_results]
+    single_jitters = [jitter_value(single_results[t], metric) for t in ping_pong_tests if t in single_results]
+
+    ax.plot(msg_sizes[:len(dual_jitters)], dual_jitters, 'o-', linewidth=2, markersize=8,
+             label='Dual Board', color='#e74c3c')
+    ax.plot(msg_sizes[:len(single_jitters)], single_jitters, 's-', linewidth=2, markersize=8,
+             label='Single Board', color='#2ecc71')
+    ax.set_xlabel('Message Size (Bytes)', fontsize=11, fontweight='bold')
+    ax.set_ylabel(METRIC_LABELS[metric], fontsize=11, fontweight='bold')
+    ax.set_title('Jitter Comparison', fontsize=12, fontweight='bold')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+    ax.set_xscale('log')
+
+
+def _draw_improvement(ax, dual_results, single_results):
+    """Latency Improvement (%)"""
+    ping_pong_tests, msg_sizes = _ping_pong_tests(dual_results, single_results)
+    improvements = []
+    labels = []
+    for i, test in enumerate(ping_pong_tests):
+        if test in dual_results and test in single_results:
+            dual_lat = dual_results[test]['avg_latency_us']
+            single_lat = single_results[test]['avg_latency_us']
+            improvement = ((dual_lat - single_lat) / dual_lat) * 100
+            improvements.append(improvement)
+            labels.append(f"{msg_sizes[i]}B")
+
+    colors = ['#2ecc71' if x > 0 else '#e74c3c' for x in improvements]
+    bars = ax.bar(labels, improvements, color=colors)
+    ax.set_ylabel('Improvement (%)', fontsize=11, fontweight='bold')
+    ax.set_title('Single-Board Latency Improvement', fontsize=12, fontweight='bold')
+    ax.axhline(y=0, color='black', linestyle='-', linewidth=0.5)
+    ax.grid(True, alpha=0.3, axis='y')
+
+    # Add value labels on bars
+    for bar, val in zip(bars, improvements):
+        height = bar.get_height()
+        ax.text(bar.get_x() + bar.get_width()/2., height,
+                f'{val:.1f}%',
+                ha='center', va='bottom' if val > 0 else 'top', fontweight='bold', fontsize=9)
+
+
+def _draw_side_by_side(ax, dual_results, single_results):
+    """Side-by-side latency comparison"""
+    import numpy as np
+
+    ping_pong_tests, _ = _ping_pong_tests(dual_results, single_results)
+    dual_latencies = [dual_results[t]['avg_latency_us'] for t in ping_pong_tests]
+    single_latencies = [single_results[t]['avg_latency_us'] for t in ping_pong_tests]
+    x_pos = np.arange(len(ping_pong_tests))
+    width = 0.35
+
+    ax.bar(x_pos - width/2, dual_latencies, width, label='Dual Board', color='#e74c3c', alpha=0.8)
+    ax.bar(x_pos + width/2, single_latencies, width, label='Single Board', color='#2ecc71', alpha=0.8)
+
+    ax.set_ylabel('Latency (μs)', fontsize=11, fontweight='bold')
+    ax.set_title('Latency Side-by-Side Comparison', fontsize=12, fontweight='bold')
+    ax.set_xticks(x_pos)
+    ax.set_xticklabels([t.replace('Ping-Pong ', '') for t in ping_pong_tests], rotation=15, ha='right')
+    ax.legend()
+    ax.grid(True, alpha=0.3, axis='y')
+
+
+def _draw_range(ax, dual_results, single_results):
+    """Min/Max Latency Range Comparison"""
+    ping_pong_tests, _ = _ping_pong_tests(dual_results, single_results)
+    for i, test in enumerate(ping_pong_tests):
+        if test in dual_results:
+            dual_min = dual_results[test].get('min_latency_us', 0)
+            dual_max = dual_results[test].get('max_latency_us', 0)
+            dual_avg = dual_results[test]['avg_latency_us']
+            ax.plot([i-0.1, i-0.1], [dual_min, dual_max], 'o-', color='#e74c3c', linewidth=2, markersize=6)
+            ax.plot(i-0.1, dual_avg, 's', color='#e74c3c', markersize=8)
+
+        if test in single_results:
+            single_min = single_results[test].get('min_latency_us', 0)
+            single_max = single_results[test].get('max_latency_us', 0)
+            single_avg = single_results[test]['avg_latency_us']
+            ax.plot([i+0.1, i+0.1], [single_min, single_max], 's-', color='#2ecc71', linewidth=2, markersize=6)
+            ax.plot(i+0.1, single_avg, 'o', color='#2ecc71', markersize=8)
+
+    ax.set_ylabel('Latency (μs)', fontsize=11, fontweight='bold')
+    ax.set_title('Min/Avg/Max Latency Range', fontsize=12, fontweight='bold')
+    ax.set_xticks(range(len(ping_pong_tests)))
+    ax.set_xticklabels([t.replace('Ping-Pong ', '') for t in ping_pong_tests], rotation=15, ha='right')
+    ax.grid(True, alpha=0.3)
+    ax.legend(['Dual (range)', 'Dual (avg)', 'Single (range)', 'Single (avg)'], loc='upper left', fontsize=8)
+
+
+def _draw_percentiles(ax, dual_results, single_results):
+    """Percentile Distribution Comparison (Default payload)"""
+    test_name = 'Ping-Pong (Default)'
+    if test_name in dual_results and 'percentiles' in dual_results[test_name]:
+        pcts = sorted(dual_results[test_name]['percentiles'].keys())
+        dual_vals = [dual_results[test_name]['percentiles'][p] for p in pcts]
+        ax.plot(pcts, dual_vals, 'o-', label='Dual Board', color='#e74c3c', linewidth=2)
+
+    if test_name in single_results and 'percentiles' in single_results[test_name]:
+        pcts = sorted(single_results[test_name]['percentiles'].keys())
+        single_vals = [single_results[test_name]['percentiles'][p] for p in pcts]
+        ax.plot(pcts, single_vals, 's-', label='Single Board', color='#2ecc71', linewidth=2)
+
+    ax.set_xlabel('Percentile', fontsize=11, fontweight='bold')
+    ax.set_ylabel('Latency (μs)', fontsize=11, fontweight='bold')
+    ax.set_title('Percentile Distribution (Default Payload)', fontsize=12, fontweight='bold')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+
+
+def _draw_under_load(ax, dual_results, single_results):
+    """Under Load Comparison"""
+    if 'Under Load' in dual_results and 'Under Load' in single_results:
+        import numpy as np
+
+        from .jitter import METRIC_NAMES, jitter_metric, jitter_value
+
+        dual, single = dual_results['Under Load'], single_results['Under Load']
+        metric = jitter_metric([dual, single])
+        metric_labels = ['Avg', METRIC_NAMES[metric], 'Min', 'Max']
+        dual_vals = [dual.get('avg_latency_us', 0), jitter_value(dual, metric),
+                     dual.get('min_latency_us', 0), dual.get('max_latency_us', 0)]
+        single_vals = [single.get('avg_latency_us', 0), jitter_value(single, metric),
+                       single.get('min_latency_us', 0), single.get('max_latency_us', 0)]
+
+        x_pos = np.arange(len(metric_labels))
+        width = 0.35
+
+        ax.bar(x_pos - width/2, dual_vals, width, label='Dual Board', color='#e74c3c', alpha=0.8)
+        ax.bar(x_pos + width/2, single_vals, width, label='Single Board', color='#2ecc71', alpha=0.8)
+
+        ax.set_ylabel('Latency (μs)', fontsize=11, fontweight='bold')
+        ax.set_title('Under Load Performance (10k msg/sec)', fontsize=12, fontweight='bold')
+        ax.set_xticks(x_pos)
+        ax.set_xticklabels(metric_labels)
+        ax.legend()
+        ax.grid(True, alpha=0.3, axis='y')
+
+
+def _draw_difference(ax, dual_results, single_results):
+    """Absolute Latency Difference (μs)"""
+    ping_pong_tests, msg_sizes = _ping_pong_tests(dual_results, single_results)
+    differences = []
+    labels = []
+    for i, test in enumerate(ping_pong_tests):
+        if test in dual_results and test in single_results:
+            diff = dual_results[test]['avg_latency_us'] - single_results[test]['avg_latency_us']
+            differences.append(diff)
+            labels.append(f"{msg_sizes[i]}B")
+
+    bars = ax.bar(labels, differences, color='#3498db')
+    ax.set_ylabel('Latency Difference (μs)', fontsize=11, fontweight='bold')
+    ax.set_title('Absolute Latency Reduction (Dual - Single)', fontsize=12, fontweight='bold')
+    ax.grid(True, alpha=0.3, axis='y')
+
+    for bar, val in zip(bars, differences):
+        height = bar.get_height()
+        ax.text(bar.get_x() + bar.get_width()/2., height,
+                f'{val:.2f}',
+                ha='center', va='bottom', fontweight='bold', fontsize=9)
+
+
+def _draw_summary_table(ax, dual_results, single_results):
+    """Summary Comparison Table"""
+    ping_pong_tests, _ = _ping_pong_tests(dual_results, single_results)
+    ax.axis('off')
+
+    summary_data = []
+    for test in ping_pong_tests:
+        if test in dual_results and test in single_results:
+            dual_lat = dual_results[test]['avg_latency_us']
+            single_lat = single_results[test]['avg_latency_us']
+            improvement = ((dual_lat - single_lat) / dual_lat) * 100
+
+            summary_data.append([
+                test.replace('Ping-Pong ', ''),
+                f"{dual_lat:.2f}",
+                f"{single_lat:.2f}",
+                f"{improvement:.1f}%"
+            ])
+
+    table = ax.table(cellText=summary_data,
+                     colLabels=['Test', 'Dual (μs)', 'Single (μs)', 'Improve'],
+                     cellLoc='center',
+                     loc='center',
+                     colWidths=[0.3, 0.23, 0.23, 0.24])
+
+    table.auto_set_font_size(False)
+    table.set_fontsize(9)
+    table.scale(1, 2)
+
+    # Style header row
+    for i in range(4):
+        table[(0, i)].set_facecolor('#3498db')
+        table[(0, i)].set_text_props(weight='bold', color='white')
+
+    # Color improvement column
+    for i in range(1, len(summary_data) + 1):
+        for j in range(4):
+            if i % 2 == 0:
+                table[(i, j)].set_facecolor('#ecf0f1')
+            if j == 3:  # Improvement column
+                table[(i, j)].set_facecolor('#d5f4e6')
+
+    ax.set_title('Summary Comparison', fontsize=12, fontweight='bold', pad=20)
+
+
+def _select_ping_pong(dual_results, single_results):
+    tests = set(_ping_pong_tests(dual_results, single_results)[0])
+    return (pick(dual_results, lambda label, result: label in tests),
+            pick(single_results, lambda label, result: label in tests))
+
+
+def _select_label(wanted):
+    def select(dual_results, single_results):
+        return (pick(dual_results, lambda label, result: label == wanted),
+                pick(single_results, lambda label, result: label == wanted))
+    return select
+
+
+def _select_timeline(dual_results, single_results):
+    """Both boards' full-log run of the same test, the default ping-pong if possible"""
+    dual, single = full_log_runs(dual_results), full_log_runs(single_results)
+    common = [label for label in dual if label in single]
+    if not common:
+        return ({},)
+    label = 'Ping-Pong (Default)' if 'Ping-Pong (Default)' in common else common[0]
+    return ({f'Dual {label}': dual[label], f'Single {label}': single[label]},)
+
+
+PANELS = (
+    Panel(_draw_latency, _select_ping_pong),
+    Panel(_draw_jitter, _select_ping_pong),
+    Panel(_draw_improvement, _select_ping_pong),
+    Panel(_draw_side_by_side, _select_ping_pong),
+    Panel(_draw_range, _select_ping_pong),
+    Panel(_draw_percentiles, _select_label('Ping-Pong (Default)')),
+    Panel(_draw_under_load, _select_label('Under Load')),
+    Panel(_draw_difference, _select_ping_pong),
+    Panel(_draw_summary_table, _select_ping_pong),
+)
+
+TIMESERIES_PANELS = (
+    Panel(draw_latency_over_time, _select_timeline),
+    Panel(draw_samples_over_time, _select_timeline),
+    Panel(draw_rate_over_time, _select_timeline),
+)
+
+
+def render_comparison(dual_results, single_results, output=DEFAULT_OUTPUT, dpi=300, fmt=None,
+                      jobs=None, cache_dir=None):
+    """Render the comparison dashboard for two {test label: result} dicts"""
+    if _select_timeline(dual_results, single_results)[0]:
+        panels, shape, figsize = PANELS + TIMESERIES_PANELS, (4, 3), (18, 16)
+    else:
+        panels, shape, figsize = PANELS, (3, 3), (18, 12)
+    drawn, reused = render_dashboard(panels, (dual_results, single_results), shape, figsize, TITLE,
+                                     output, dpi, fmt, jobs, cache_dir)
+    print(f"\n✓ Comparison visualization saved as {output} ({drawn} panels drawn, {reused} reused)")
+
+
+def print_comparison(dual_results, single_results):
+    """Print the dual- vs single-board console report"""
+    ping_pong_tests, _ = _ping_pong_tests(dual_results, single_results)
+
+    # Generate detailed comparison report
+    print("\n" + "="*80)
+    print("LAN9662 DUAL-BOARD vs SINGLE-BOARD COMPARISON SUMMARY")
+    print("="*80)
+
+    print("\n📊 LATENCY COMPARISON:")
+    print("-" * 80)
+    print(f"{'Test':<20} {'Dual (μs)':<15} {'Single (μs)':<15} {'Improvement':<15}")
+    print("-" * 80)
+
+    for test in ping_pong_tests:
+        if test in dual_results and test in single_results:
+            dual_lat = dual_results[test]['avg_latency_us']
+            single_lat = single_results[test]['avg_latency_us']
+            improvement = ((dual_lat - single_lat) / dual_lat) * 100
+            print(f"{test:<20} {dual_lat:<15.2f} {single_lat:<15.2f} {improvement:>13.1f}%")
+
+    from .jitter import jitter_metric, jitter_value
+
+    paired = [t for t in ping_pong_tests if t in dual_results and t in single_results]
+    metric = jitter_metric([dual_results[t] for t in paired] + [single_results[t] for t in paired])
+    print(f"\n📉 JITTER COMPARISON ({'IPDV p99' if metric == 'ipdv' else 'std-dev'}):")
+    print("-" * 80)
+    print(f"{'Test':<20} {'Dual (μs)':<15} {'Single (μs)':<15} {'Improvement':<15}")
+    print("-" * 80)
+
+    for test in ping_pong_tests:
+        if test in dual_results and test in single_results:
+            dual_jit = jitter_value(dual_results[test], metric)
+            single_jit = jitter_value(single_results[test], metric)
+            improvement = ((dual_jit - single_jit) / dual_jit) * 100
+            print(f"{test:<20} {dual_jit:<15.2f} {single_jit:<15.2f} {improvement:>13.1f}%")
+
+    print("\n🔍 KEY FINDINGS:")
+    print("-" * 80)
+
+    # Calculate average improvement
+    if 'Ping-Pong (Default)' in dual_results and 'Ping-Pong (Default)' in single_results:
+        dual_avg = dual_results['Ping-Pong (Default)']['avg_latency_us']
+        single_avg = single_results['Ping-Pong (Default)']['avg_latency_us']
+        avg_improvement = ((dual_avg - single_avg) / dual_avg) * 100
+
+        print(f"• Best Latency (Default Payload):")
+        print(f"  - Dual Board:   {dual_avg:.2f} μs")
+        print(f"  - Single Board: {single_avg:.2f} μs")
+        print(f"  - Improvement:  {avg_improvement:.1f}%")
+        print(f"  - Absolute Reduction: {dual_avg - single_avg:.2f} μs")
+
+    print("\n• Throughput Performance:")
+    if 'Throughput' in dual_results and 'Throughput' in single_results:
+        dual_bw = dual_results['Throughput'].get('bandwidth_mbps', 0)
+        single_bw = single_results['Throughput'].get('bandwidth_mbps', 0)
+        print(f"  - Dual Board:   {dual_bw:.2f} Mbps")
+        print(f"  - Single Board: {single_bw:.2f} Mbps")
+        print(f"  - Difference:   {single_bw - dual_bw:.2f} Mbps")
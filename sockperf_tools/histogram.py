@@ -0,0 +1,267 @@
+"""
+Mergeable log-bucketed latency histograms.
+
+Uses the HdrHistogram bucket layout: values are recorded as integer
+nanoseconds into buckets whose width doubles every power of two, with enough
+linear sub-buckets per power of two to keep ``significant_digits`` decimal
+digits of precision. Any two histograms with the same configuration merge by
+adding their count arrays, so a week of runs aggregates in O(buckets) time
+and constant memory, and percentiles of the merged histogram are accurate to
+the configured precision.
+
+Count, mean, variance, min and max are tracked exactly alongside the buckets
+(variance is merged with Chan's parallel formula).
+
+Note that no histogram can resolve a percentile finer than 1/n: with 2,953
+observations p99.99 and p99.999 are both the maximum. Merging runs is what
+makes those tails resolvable.
+"""
+
+import math
+import struct
+import zlib
+
+import numpy as np
+
+DEFAULT_SIGNIFICANT_DIGITS = 3
+DEFAULT_HIGHEST_US = 60 * 1_000_000  # one minute
+
+_HEADER = struct.Struct('<4sBxxxqqdddd')
+_MAGIC = b'SPH1'
+
+
+class LatencyHistogram:
+    """HDR-style histogram of latencies in microseconds"""
+
+    __slots__ = ('significant_digits', 'highest_us', 'counts', 'count', 'mean', 'm2',
+                 'min_us', 'max_us', '_half_magnitude', '_half_count', '_sub_mask')
+
+    def __init__(self, significant_digits=DEFAULT_SIGNIFICANT_DIGITS, highest_us=DEFAULT_HIGHEST_US):
+        if not 1 <= significant_digits <= 5:
+            raise ValueError("significant_digits must be between 1 and 5")
+        self.significant_digits = significant_digits
+        self.highest_us = int(highest_us)
+
+        sub_bucket_count = 1 << math.ceil(math.log2(2 * 10 ** significant_digits))
+        self._half_count = sub_bucket_count // 2
+        self._half_magnitude = self._half_count.bit_length() - 1
+        self._sub_mask = sub_bucket_count - 1
+
+        size = int(self._index(np.array([int(highest_us * 1000)]))[0]) + 1
+        self.counts = np.zeros(size, dtype=np.int64)
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min_us = math.inf
+        self.max_us = -math.inf
+
+    # bucket layout
+
+    def _index(self, ns):
+        """Counts-array index for integer nanosecond values (vectorised)"""
+        ns = np.asarray(ns, dtype=np.int64)
+        # bit_length via frexp; exact for values below 2**53 ns
+        bit_length = np.frexp((ns | self._sub_mask).astype(np.float64))[1]
+        bucket = bit_length - (self._half_magnitude + 1)
+        sub_bucket = ns >> bucket
+        return ((bucket + 1) << self._half_magnitude) + (sub_bucket - self._half_count)
+
+    def _lowest_ns(self, index):
+        """Lowest nanosecond value that maps to each index"""
+        index = np.asarray(index, dtype=np.int64)
+        bucket = (index >> self._half_magnitude) - 1
+        sub_bucket = (index & (self._half_count - 1)) + self._half_count
+        first = bucket < 0
+        sub_bucket = np.where(first, sub_bucket - self._half_count, sub_bucket)
+        bucket = np.where(first, 0, bucket)
+        return sub_bucket << bucket, 1 << bucket
+
+    def bucket_edges_us(self):
+        """(lowest, highest) value of every bucket, in microseconds"""
+        low, width = self._lowest_ns(np.arange(len(self.counts)))
+        return low / 1000.0, (low + width - 1) / 1000.0
+
+    # recording
+
+    def record(self, latencies_us):
+        """Record an array of latency samples (µs)"""
+        values = np.asarray(latencies_us, dtype=np.float64)
+        if values.size == 0:
+            return self
+        ns = np.clip(np.rint(values * 1000.0), 0, self.highest_us * 1000).astype(np.int64)
+        self.counts += np.bincount(self._index(ns), minlength=len(self.counts))[:len(self.counts)]
+        self._merge_moments(values.size, float(values.mean()), float(values.var()) * values.size,
+                            float(values.min()), float(values.max()))
+        return self
+
+    def _merge_moments(self, n, mean, m2, lo, hi):
+        total = self.count + n
+        delta = mean - self.mean
+        self.mean += delta * n / total
+        self.m2 += m2 + delta * delta * self.count * n / total
+        self.count = total
+        self.min_us = min(self.min_us, lo)
+        self.max_us = max(self.max_us, hi)
+
+    @classmethod
+    def from_samples(cls, latencies_us, significant_digits=DEFAULT_SIGNIFICANT_DIGITS,
+                     highest_us=DEFAULT_HIGHEST_US, chunk=1 << 22):
+        """Build from raw samples (e.g. a memory-mapped full log), chunk by chunk"""
+        hist = cls(significant_digits, highest_us)
+        for start in range(0, len(latencies_us), chunk):
+            hist.record(latencies_us[start:start + chunk])
+        return hist
+
+    @classmethod
+    def from_summary(cls, result, significant_digits=DEFAULT_SIGNIFICANT_DIGITS,
+                     highest_us=DEFAULT_HIGHEST_US):
+        """Approximate a histogram from sockperf's printed summary.
+
+        The CDF is taken as piecewise linear between <MIN>, each printed
+        percentile and <MAX>, and observations are spread over the buckets
+        accordingly. Mean and std-dev are the printed (exact) values.
+        """
+        hist = cls(significant_digits, highest_us)
+        n = result.get('total_observations')
+        if not n or result.get('min_latency_us') is None:
+            return hist
+
+        points = {0.0: result['min_latency_us'], 100.0: result['max_latency_us']}
+        points.update(result.get('percentiles', {}))
+        qs = np.array(sorted(points))
+        values = np.maximum.accumulate(np.array([points[q] for q in qs]))
+
+        low, high = hist.bucket_edges_us()
+        cumulative = np.rint(np.interp(high + 0.0005, values, qs) / 100.0 * n).astype(np.int64)
+        hist.counts = np.diff(cumulative, prepend=0)
+        hist.count = int(n)
+        hist.mean = float(result['avg_latency_us'])
+        hist.m2 = float(result.get('std_dev_us', 0.0)) ** 2 * n
+        hist.min_us = float(values[0])
+        hist.max_us = float(values[-1])
+        return hist
+
+    # merging
+
+    def compatible(self, other):
+        return (self.significant_digits == other.significant_digits
+                and len(self.counts) == len(other.counts))
+
+    def merge(self, other):
+        """Add another histogram's counts into this one (O(buckets))"""
+        if not self.compatible(other):
+            raise ValueError("cannot merge histograms with different precision or range")
+        if other.count == 0:
+            return self
+        self.counts += other.counts
+        self._merge_moments(other.count, other.mean, other.m2, other.min_us, other.max_us)
+        return self
+
+    def __iadd__(self, other):
+        return self.merge(other)
+
+    def copy(self):
+        hist = LatencyHistogram.__new__(LatencyHistogram)
+        for name in self.__slots__:
+            setattr(hist, name, getattr(self, name))
+        hist.counts = self.counts.copy()
+        return hist
+
+    @classmethod
+    def merged(cls, histograms):
+        """Merge an iterable of histograms into a new one"""
+        total = None
+        for hist in histograms:
+            total = hist.copy() if total is None else total.merge(hist)
+        return total if total is not None else cls()
+
+    # queries
+
+    @property
+    def std_dev_us(self):
+        return math.sqrt(self.m2 / self.count) if self.count else 0.0
+
+    def percentiles(self, percentiles):
+        """Values at the given percentiles (nearest rank, highest equivalent value)"""
+        if self.count == 0:
+            return {float(p): None for p in percentiles}
+        cumulative = np.cumsum(self.counts)
+        total = int(cumulative[-1])
+        ranks = np.clip(np.ceil(np.asarray(percentiles, dtype=np.float64) / 100.0 * total), 1, total)
+        index = np.searchsorted(cumulative, ranks)
+        low, width = self._lowest_ns(index)
+        values = np.clip((low + width - 1) / 1000.0, self.min_us, self.max_us)
+        return {float(p): float(v) for p, v in zip(percentiles, values)}
+
+    def percentile(self, p):
+        return self.percentiles([p])[float(p)]
+
+    def stats(self, percentiles=None):
+        """Summary dict with the same keys as the parser/full-log stats"""
+        from .fulllog import SOCKPERF_PERCENTILES
+
+        if self.count == 0:
+            return {}
+        return {
+            'avg_latency_us': self.mean,
+            'std_dev_us': self.std_dev_us,
+            'jitter_us': self.std_dev_us,
+            'min_latency_us': self.min_us,
+            'max_latency_us': self.max_us,
+            'total_observations': self.count,
+            'percentiles': self.percentiles(percentiles or SOCKPERF_PERCENTILES),
+        }
+
+    # serialisation
+
+    def to_bytes(self):
+        """Compact, zlib-compressed encoding of the non-empty buckets"""
+        nonzero = np.flatnonzero(self.counts).astype('<u4')
+        header = _HEADER.pack(_MAGIC, self.significant_digits, self.highest_us, self.count,
+                              self.mean, self.m2, self.min_us, self.max_us)
+        body = nonzero.tobytes() + self.counts[nonzero].astype('<i8').tobytes()
+        return header + zlib.compress(body)
+
+    @classmethod
+    def from_bytes(cls, data):
+        magic, digits, highest_us, count, mean, m2, lo, hi = _HEADER.unpack_from(data)
+        if magic != _MAGIC:
+            raise ValueError("not a serialised LatencyHistogram")
+        hist = cls(digits, highest_us)
+        body = zlib.decompress(data[_HEADER.size:])
+        n = len(body) // 12
+        index = np.frombuffer(body, dtype='<u4', count=n)
+        hist.counts[index] = np.frombuffer(body, dtype='<i8', offset=4 * n)
+        hist.count, hist.mean, hist.m2, hist.min_us, hist.max_us = count, mean, m2, lo, hi
+        return hist
+
+    def __repr__(self):
+        return (f"LatencyHistogram(count={self.count}, digits={self.significant_digits}, "
+                f"buckets={len(self.counts)})")
+
+
+def histogram_for(result, cache=None, significant_digits=DEFAULT_SIGNIFICANT_DIGITS):
+    """Histogram for a parsed run: exact from its full log when there is one,
+    otherwise approximated from the summary.
+
+    A .sps file is binned over its memory-mapped columns. A CSV goes through
+    the parse cache's sample copy when a cache is given, and is otherwise
+    binned chunk by chunk as it is read. Either way memory stays bounded.
+    """
+    log_file = None
+    if result.filename:
+        from .parser import full_log_path
+        log_file = full_log_path(result.filename)
+    if log_file is None:
+        return LatencyHistogram.from_summary(result, significant_digits)
+    if log_file.suffix == '.sps':
+        from .samples import SampleFile
+        return SampleFile(log_file).histogram(significant_digits)
+    if cache:
+        return LatencyHistogram.from_samples(cache.load_latencies(result.filename), significant_digits)
+
+    from .fulllog import iter_full_log
+    hist = LatencyHistogram(significant_digits)
+    for _, tx, rx in iter_full_log(log_file):
+        hist.record((rx - tx) * 0.5e-3)
+    return hist
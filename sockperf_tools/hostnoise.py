@@ -0,0 +1,586 @@
+"""
+Host-noise telemetry during a run, and its correlation with latency spikes.
+
+A tail spike can come from the boards or from the hosts at either end: an
+interrupt storm, softirq work, a frequency drop, a task that preempts
+sockperf. `record` samples the host's counters at a fixed interval while a
+run is in progress:
+
+    irq:<n> <device>   /proc/interrupts, summed over --cpus
+    softirq:<type>     /proc/softirqs, summed over --cpus
+    freq:cpu<n>        cpufreq scaling_cur_freq (kHz; a gauge, not a counter)
+    sched_run:cpu<n>   /proc/schedstat time on CPU and waiting to run (ns)
+    sched_wait:cpu<n>
+    net:<if>:<field>   /proc/net/dev packets, errors and drops
+
+Sources missing on the host (cpufreq in VMs, schedstat without
+CONFIG_SCHEDSTATS) are skipped. Every file is opened once and re-read with
+pread. Samples go into a binary ring log (.hnl), memory-mapped in place:
+a JSON header, one page of running state, then `capacity` fixed-size
+records (send time, sampler CPU cost, one uint64 per channel). A run longer
+than the ring keeps its last `capacity` samples.
+
+The sampler measures the CPU time of every sample. When the moving average
+exceeds --max-overhead of the interval, it doubles the interval (up to
+MAX_INTERVAL_MS), so its cost stays bounded on hosts with many IRQ lines.
+
+`correlate` aligns the log with a full log by send time. A spike is a sample
+above --spike-us, or above the run's --spike-pct percentile. For every
+channel it reports the correlation of its activity with the intervals that
+hold spikes, the lift (mean activity in spike intervals over quiet ones)
+and the coincidence: the share of spike intervals in which the channel is
+elevated, more than five median absolute deviations above its median
+activity. Activity is widened by --lag intervals either side, since a counter read at the end of
+one interval may hold the event behind a spike at the start of the next.
+
+Usage:
+    python -m sockperf_tools.hostnoise record noise.hnl [--interval-ms 10] [--cpus 2,3] -- sockperf pp ...
+    python -m sockperf_tools.hostnoise record noise.hnl --duration 30
+    python -m sockperf_tools.hostnoise info noise.hnl
+    python -m sockperf_tools.hostnoise correlate noise.hnl sockperf_pingpong_udp.csv [--spike-pct 99.9] [-o noise.png]
+"""
+
+import functools
+import json
+import os
+import struct
+import time
+
+MAGIC = b'HNOISE01'
+FORMAT_VERSION = 1
+SUFFIX = '.hnl'
+PAGE = 4096
+PROC_ROOT = '/proc'
+SYS_ROOT = '/sys'
+DEFAULT_INTERVAL_MS = 10.0
+MAX_INTERVAL_MS = 1000.0
+DEFAULT_CAPACITY = 1 << 16
+MAX_OVERHEAD = 0.01  # share of one CPU
+NET_FIELDS = {1: 'rx_packets', 2: 'rx_errs', 3: 'rx_drop', 9: 'tx_packets', 11: 'tx_drop'}
+STATE = ('count', 'interval_ns', 'cost_sum_ns', 'cost_max_ns', 'backoffs', 'stopped_ns')
+DEFAULT_SPIKE_PCT = 99.9
+DEFAULT_LAG = 1
+TOP = 10
+
+_PREAMBLE = struct.Struct('<8sI')
+
+
+def _per_cpu(data, cpus, prefix, labels):
+    """{row label: count summed over cpus} of /proc/interrupts or /proc/softirqs.
+
+    labels caches each row key's label across reads.
+    """
+    lines = data.split(b'\n')
+    ncpu = len(lines[0].split())
+    out = {}
+    for line in lines[1:]:
+        key, _, rest = line.partition(b':')
+        fields = rest.split(None, ncpu)
+        if not fields:
+            continue
+        label = labels.get(key)
+        if label is None:
+            label = key.strip().decode()
+            if label.isdigit() and len(fields) > ncpu:
+                label += ' ' + fields[-1].split()[-1].decode()  # the device
+            label = labels[key] = prefix + label
+        counts = [int(f) for f in fields[:ncpu] if f.isdigit()]
+        out[label] = sum(counts[i] for i in cpus if i < len(counts)) if cpus else sum(counts)
+    return out
+
+
+def _schedstat(data, cpus):
+    out = {}
+    for line in data.split(b'\n'):
+        fields = line.split()
+        if len(fields) >= 9 and fields[0].startswith(b'cpu'):
+            cpu = fields[0].decode()
+            if cpus and int(cpu[3:]) not in cpus:
+                continue
+            out[f'sched_run:{cpu}'] = int(fields[7])
+            out[f'sched_wait:{cpu}'] = int(fields[8])
+    return out
+
+
+def _net_dev(data, ifaces):
+    out = {}
+    for line in data.split(b'\n')[2:]:
+        name, _, rest = line.partition(b':')
+        name = name.strip().decode()
+        fields = rest.split()
+        if len(fields) < 16 or (ifaces and name not in ifaces) or (not ifaces and name == 'lo'):
+            continue
+        for index, field in NET_FIELDS.items():
+            out[f'net:{name}:{field}'] = int(fields[index])
+    return out
+
+
+class HostSampler:
+    """Open host counter files and read them into one value per channel.
+
+    The channel set is fixed by the first read; rows that appear later (a
+    newly registered IRQ) are ignored and rows that vanish read as 0.
+    """
+
+    def __init__(self, cpus=None, ifaces=None):
+        cpus = sorted(cpus) if cpus else None
+        self._sources = []  # (fd, parse, read size)
+        sources = [
+            ('interrupts', functools.partial(_per_cpu, cpus=cpus, prefix='irq:', labels={})),
+            ('softirqs', functools.partial(_per_cpu, cpus=cpus, prefix='softirq:', labels={})),
+            ('schedstat', lambda data: _schedstat(data, cpus)),
+            ('net/dev', lambda data: _net_dev(data, ifaces)),
+        ]
+        for name, parse in sources:
+            self._open(os.path.join(PROC_ROOT, name), parse)
+        cpu_dir = os.path.join(SYS_ROOT, 'devices/system/cpu')
+        online = sorted(int(d[3:]) for d in (os.listdir(cpu_dir) if os.path.isdir(cpu_dir) else [])
+                        if d.startswith('cpu') and d[3:].isdigit())
+        for cpu in online:
+            if not cpus or cpu in cpus:
+                self._open(os.path.join(cpu_dir, f'cpu{cpu}/cpufreq/scaling_cur_freq'),
+                           lambda data, cpu=cpu: {f'freq:cpu{cpu}': int(data)})
+        first = self._read()
+        self.channels = list(first)
+        self.kinds = ['gauge' if name.startswith('freq:') else 'counter' for name in self.channels]
+
+    def _open(self, path, parse):
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            return
+        size = len(os.pread(fd, 1 << 20, 0))
+        self._sources.append((fd, parse, 2 * size + PAGE))
+
+    def _read(self):
+        values = {}
+        for fd, parse, size in self._sources:
+            values.update(parse(os.pread(fd, size, 0)))
+        return values
+
+    def read(self):
+        """Current value of every channel, in channel order"""
+        values = self._read()
+        return [values.get(name, 0) for name in self.channels]
+
+    def close(self):
+        for fd, _, _ in self._sources:
+            os.close(fd)
+        self._sources = []
+
+
+def _record_dtype(channels):
+    import numpy as np
+
+    return np.dtype([('t_ns', '<i8'), ('cost_ns', '<u4'), ('values', '<u8', (channels,))])
+
+
+class NoiseWriter:
+    """Ring log of capacity samples, written through a memory map"""
+
+    def __init__(self, output, channels, kinds, capacity=DEFAULT_CAPACITY, interval_ns=None, meta=None):
+        import numpy as np
+
+        header = dict(meta or {}, version=FORMAT_VERSION, channels=list(channels), kinds=list(kinds),
+                      capacity=capacity, started_ns=time.time_ns(),
+                      clock_offset_ns=time.time_ns() - time.monotonic_ns())
+        header['state_offset'] = 0
+        # Room for the real offset's digits; the state page starts after the header
+        state_offset = -(-(_PREAMBLE.size + len(json.dumps(header)) + 16) // PAGE) * PAGE
+        header['state_offset'] = state_offset
+        body = json.dumps(header).encode()
+        dtype = _record_dtype(len(channels))
+        with open(output, 'wb') as f:
+            f.write(_PREAMBLE.pack(MAGIC, len(body)) + body)
+            f.truncate(state_offset + PAGE + capacity * dtype.itemsize)
+        self.capacity = capacity
+        self.state = np.memmap(output, dtype='<i8', mode='r+', offset=state_offset, shape=(len(STATE),))
+        self.state[STATE.index('interval_ns')] = interval_ns or 0
+        self.ring = np.memmap(output, dtype=dtype, mode='r+', offset=state_offset + PAGE, shape=(capacity,))
+
+    def append(self, t_ns, values, cost_ns=0):
+        """Store one sample; returns its slot"""
+        count = int(self.state[0])
+        slot = count % self.capacity
+        self.ring['t_ns'][slot] = t_ns
+        self.ring['values'][slot] = values
+        self.set_cost(slot, cost_ns)
+        self.state[0] = count + 1
+        return slot
+
+    def set_cost(self, slot, cost_ns):
+        cost_ns = min(int(cost_ns), 0xFFFFFFFF)
+        self.ring['cost_ns'][slot] = cost_ns
+        self.state[2] += cost_ns
+        self.state[3] = max(int(self.state[3]), cost_ns)
+
+    def close(self):
+        self.state[STATE.index('stopped_ns')] = time.time_ns()
+        self.ring.flush()
+        self.state.flush()
+
+
+class NoiseLog:
+    """A recorded .hnl ring log: meta (the JSON header), state and the samples in time order"""
+
+    def __init__(self, filename):
+        import numpy as np
+
+        self.filename = str(filename)
+        with open(filename, 'rb') as f:
+            magic, length = _PREAMBLE.unpack(f.read(_PREAMBLE.size))
+            if magic != MAGIC:
+                raise ValueError(f"{filename} is not a host-noise log")
+            self.meta = json.loads(f.read(length))
+        if self.meta['version'] > FORMAT_VERSION:
+            raise ValueError(f"{filename} uses host-noise format {self.meta['version']}; "
+                             f"this version reads up to {FORMAT_VERSION}")
+        self.channels, self.kinds = self.meta['channels'], self.meta['kinds']
+        offset = self.meta['state_offset']
+        state = np.fromfile(filename, dtype='<i8', count=len(STATE), offset=offset)
+        self.state = dict(zip(STATE, (int(v) for v in state)))
+        capacity = self.meta['capacity']
+        ring = np.memmap(filename, dtype=_record_dtype(len(self.channels)), mode='r', offset=offset + PAGE,
+                         shape=(capacity,))
+        count = self.state['count']
+        # Oldest first: after a wrap the oldest sample is at count % capacity
+        order = np.roll(np.arange(capacity), -(count % capacity))[:min(count, capacity)] if count > capacity \
+            else np.arange(count)
+        self.t_ns = np.asarray(ring['t_ns'][order])
+        self.cost_ns = np.asarray(ring['cost_ns'][order])
+        self.values = np.asarray(ring['values'][order])
+
+    def __len__(self):
+        return len(self.t_ns)
+
+    def activity(self):
+        """(interval start ns, interval end ns, intervals x channels activity): counters as
+        events per second, gauges as the value at the end of the interval"""
+        import numpy as np
+
+        dt = np.diff(self.t_ns).astype(np.float64)
+        values = self.values.astype(np.float64)
+        activity = np.maximum(np.diff(values, axis=0), 0.0) / np.maximum(dt, 1.0)[:, None] * 1e9
+        gauges = np.array([kind == 'gauge' for kind in self.kinds], dtype=bool)
+        activity[:, gauges] = values[1:, gauges]
+        return self.t_ns[:-1], self.t_ns[1:], activity
+
+
+def overhead(log):
+    """The sampler's cost: samples taken and kept, per-sample CPU time and its share of the run"""
+    import numpy as np
+
+    state = log.state
+    wall = (state['stopped_ns'] or int(log.t_ns[-1] if len(log) else 0)) - log.meta['started_ns']
+    cost = log.cost_ns.astype(np.float64) / 1e3
+    return {
+        'samples': state['count'],
+        'kept': len(log),
+        'overwritten': max(state['count'] - log.meta['capacity'], 0),
+        'channels': len(log.channels),
+        'interval_ms': log.meta['interval_ms'],
+        'final_interval_ms': state['interval_ns'] / 1e6,
+        'backoffs': state['backoffs'],
+        'cost_mean_us': float(cost.mean()) if len(cost) else 0.0,
+        'cost_p99_us': float(np.percentile(cost, 99)) if len(cost) else 0.0,
+        'cost_max_us': state['cost_max_ns'] / 1e3,
+        'overhead_pct': 100.0 * state['cost_sum_ns'] / wall if wall > 0 else 0.0,
+    }
+
+
+def record(output, duration_s=None, interval_ms=DEFAULT_INTERVAL_MS, capacity=DEFAULT_CAPACITY, cpus=None,
+           ifaces=None, max_overhead=MAX_OVERHEAD, stop=None):
+    """Sample the host into a ring log until duration_s passes or stop() is true; returns overhead()"""
+    sampler = HostSampler(cpus, ifaces)
+    interval_ns = int(interval_ms * 1e6)
+    writer = NoiseWriter(output, sampler.channels, sampler.kinds, capacity, interval_ns,
+                         meta={'interval_ms': interval_ms, 'cpus': sorted(cpus) if cpus else None,
+                               'host': os.uname().nodename, 'max_overhead': max_overhead})
+    deadline = time.monotonic_ns()
+    end = deadline + int(duration_s * 1e9) if duration_s else None
+    average = None
+    try:
+        while not (stop and stop()) and not (end and time.monotonic_ns() >= end):
+            start = time.thread_time_ns()
+            slot = writer.append(time.time_ns(), sampler.read())
+            cost = time.thread_time_ns() - start
+            writer.set_cost(slot, cost)
+            # The first sample faults in the ring's first page; it does not set the pace
+            average = 0.0 if average is None else cost if not average else 0.9 * average + 0.1 * cost
+            if average > max_overhead * interval_ns and interval_ns < MAX_INTERVAL_MS * 1e6:
+                interval_ns = min(2 * interval_ns, int(MAX_INTERVAL_MS * 1e6))
+                writer.state[STATE.index('interval_ns')] = interval_ns
+                writer.state[STATE.index('backoffs')] += 1
+            deadline += interval_ns
+            wait = deadline - time.monotonic_ns()
+            if wait > 0:
+                time.sleep(wait / 1e9)
+            else:
+                deadline = time.monotonic_ns()  # late: carry on from now rather than catch up in a burst
+    finally:
+        writer.close()
+        sampler.close()
+    return overhead(NoiseLog(output))
+
+
+def _clock_shift(log, first_tx_ns):
+    """Offset that puts full-log send times on the sampler's clock: 0 when the log is on
+    CLOCK_REALTIME, the recorded realtime - monotonic offset when it is on CLOCK_MONOTONIC"""
+    day = 86_400 * 10 ** 9
+    if log.t_ns[0] - day <= first_tx_ns <= log.t_ns[-1] + day:
+        return 0, 'realtime'
+    return log.meta['clock_offset_ns'], 'monotonic'
+
+
+def correlate(noise_file, log_file, spike_us=None, spike_pct=DEFAULT_SPIKE_PCT, lag=DEFAULT_LAG, top=TOP,
+              chunk_bytes=None):
+    """Which host channels are active when a full log's latency spikes.
+
+    Returns {'threshold_us', 'clock', 'samples', 'spikes', 'intervals'
+    (sampler intervals holding samples), 'spike_intervals', 'channels' (the
+    top channels by correlation: 'name', 'kind', 'corr', 'lift',
+    'coincidence_pct', 'baseline_pct', 'explains'), 'explained_pct' (spike
+    intervals in which an explaining channel was elevated), 'worst' (the
+    highest spike intervals and their elevated channels) and 'series' (for
+    the dashboard)}.
+    """
+    import numpy as np
+
+    from .fulllog import CHUNK_BYTES, iter_full_log
+    from .histogram import LatencyHistogram
+
+    log = NoiseLog(noise_file)
+    if len(log) < 2:
+        raise ValueError(f"{noise_file} holds fewer than two samples")
+    start_ns, _, activity = log.activity()
+
+    def chunks():
+        return iter_full_log(log_file, chunk_bytes or CHUNK_BYTES)
+
+    shift = clock = None
+    if spike_us is None:
+        hist = LatencyHistogram()
+        for _, tx, rx in chunks():
+            hist.record((rx - tx) * 0.5e-3)
+        spike_us = hist.percentiles([spike_pct])[spike_pct] if hist.count else 0.0
+
+    m = len(start_ns)
+    samples = np.zeros(m, dtype=np.int64)
+    spikes = np.zeros(m, dtype=np.int64)
+    peak = np.zeros(m)
+    for _, tx, rx in chunks():
+        if shift is None:
+            shift, clock = _clock_shift(log, int(tx[0]))
+        slot = np.searchsorted(log.t_ns, tx + shift, side='right') - 1
+        inside = (slot >= 0) & (slot < m)
+        slot, latency = slot[inside], (rx[inside] - tx[inside]) * 0.5e-3
+        samples += np.bincount(slot, minlength=m)
+        spikes += np.bincount(slot[latency > spike_us], minlength=m)
+        np.maximum.at(peak, slot, latency)
+
+    covered = samples > 0
+    # Elevated: well above the channel's typical level; median and MAD are not moved by the bursts themselves
+    median = np.median(activity[covered], axis=0) if covered.any() else np.zeros(activity.shape[1])
+    mad = np.median(np.abs(activity[covered] - median), axis=0) if covered.any() else median
+    raised = activity > median + 5 * 1.4826 * mad
+    widened = activity.copy()
+    for k in range(1, lag + 1):
+        widened[k:] = np.maximum(widened[k:], activity[:-k])
+        widened[:-k] = np.maximum(widened[:-k], activity[k:])
+        raised[k:] |= raised[:-k].copy()
+        raised[:-k] |= raised[k:].copy()
+    x, hit = widened[covered], spikes[covered] > 0
+    analysis = {
+        'threshold_us': float(spike_us),
+        'clock': clock,
+        'samples': int(samples.sum()),
+        'spikes': int(spikes.sum()),
+        'intervals': int(covered.sum()),
+        'spike_intervals': int(hit.sum()),
+        'channels': [],
+        'explained_pct': 0.0,
+        'worst': [],
+    }
+    times = (start_ns[covered] - start_ns[covered][0]) / 1e9 if covered.any() else np.empty(0)
+    analysis['series'] = {'time_s': times.tolist(), 'max_us': peak[covered].tolist(), 'channels': {}}
+    if not hit.any() or hit.all():
+        return analysis
+
+    # Point-biserial correlation of every channel with the spike indicator in one product
+    xc = x - x.mean(axis=0)
+    yc = hit - hit.mean()
+    with np.errstate(invalid='ignore', divide='ignore'):
+        corr = xc.T @ yc / (np.sqrt((xc * xc).sum(axis=0)) * np.sqrt((yc * yc).sum()))
+        lift = x[hit].mean(axis=0) / x[~hit].mean(axis=0)
+    elevated = raised[covered]
+    coincidence = elevated[hit].mean(axis=0) * 100
+    baseline = elevated[~hit].mean(axis=0) * 100
+    explains = (corr > 0) & (coincidence >= 2 * baseline) & (coincidence > 0)
+
+    order = [int(i) for i in np.argsort(np.nan_to_num(corr, nan=-np.inf))[::-1] if np.isfinite(corr[i])][:top]
+    analysis['channels'] = [{
+        'name': log.channels[i],
+        'kind': log.kinds[i],
+        'corr': float(corr[i]),
+        'lift': float(lift[i]),
+        'coincidence_pct': float(coincidence[i]),
+        'baseline_pct': float(baseline[i]),
+        'explains': bool(explains[i]),
+    } for i in order]
+    explaining = [i for i in order if explains[i]]
+    if explaining:
+        analysis['explained_pct'] = float(elevated[hit][:, explaining].any(axis=1).mean() * 100)
+    spike_rows = np.flatnonzero(hit)
+    for row in spike_rows[np.argsort(peak[covered][spike_rows])[::-1][:5]]:
+        analysis['worst'].append({
+            'time_s': float(times[row]),
+            'max_us': float(peak[covered][row]),
+            'spikes': int(spikes[covered][row]),
+            'channels': [log.channels[i] for i in order if elevated[row, i]][:3],
+        })
+    analysis['series']['channels'] = {log.channels[i]: x[:, i].tolist() for i in order[:3]}
+    return analysis
+
+
+def _draw_timeline(ax, analysis):
+    """Peak latency per sampler interval, with the three most correlated channels"""
+    series = analysis['series']
+    ax.plot(series['time_s'], series['max_us'], color='#2c3e50', linewidth=0.8, label='max latency')
+    ax.axhline(analysis['threshold_us'], color='#e74c3c', linestyle='--', linewidth=1,
+               label=f"spike threshold {analysis['threshold_us']:.1f} μs")
+    ax.set_xlabel('Time (s)', fontsize=11)
+    ax.set_ylabel('Latency (μs)', fontsize=11, fontweight='bold')
+    ax.legend(loc='upper left', fontsize=8)
+    if series['channels']:
+        twin = ax.twinx()
+        for i, (name, values) in enumerate(series['channels'].items()):
+            twin.plot(series['time_s'], values, color=f'C{i + 1}', linewidth=0.8, alpha=0.7, label=name)
+        twin.set_ylabel('Activity (/s or gauge)', fontsize=11)
+        twin.legend(loc='upper right', fontsize=8)
+    ax.set_title('Latency and Host Activity per Sampler Interval', fontsize=12, fontweight='bold')
+    ax.grid(alpha=0.3)
+
+
+def _draw_channels(ax, analysis):
+    """Correlation of the top channels with spike intervals, labelled with their coincidence"""
+    channels = analysis['channels'][::-1]
+    colors = ['#e74c3c' if c['explains'] else '#95a5a6' for c in channels]
+    bars = ax.barh([c['name'] for c in channels], [c['corr'] for c in channels], color=colors)
+    for bar, channel in zip(bars, channels):
+        ax.annotate(f" {channel['coincidence_pct']:.0f}% of spikes", (bar.get_width(), bar.get_y() + 0.4),
+                    va='center', fontsize=8)
+    ax.set_xlabel('Correlation with spike intervals', fontsize=11, fontweight='bold')
+    ax.set_title(f"Host Signals ({analysis['explained_pct']:.0f}% of spike intervals explained)",
+                 fontsize=12, fontweight='bold')
+    ax.grid(alpha=0.3, axis='x')
+
+
+def render_noise(analysis, output, title, dpi=300, fmt=None, jobs=None, cache_dir=None):
+    """Render the host-noise correlation dashboard"""
+    from .render import Panel, render_dashboard
+
+    drawn, reused = render_dashboard((Panel(_draw_timeline), Panel(_draw_channels)), (analysis,), (1, 2), (18, 6),
+                                     title, output, dpi, fmt, jobs, cache_dir)
+    print(f"\n✓ Host-noise visualization saved as {output} ({drawn} panels drawn, {reused} reused)")
+
+
+def print_overhead(stats):
+    print(f"  Samples: {stats['samples']:,} of {stats['channels']} channels "
+          f"({stats['kept']:,} kept, {stats['overwritten']:,} overwritten)")
+    interval = f"{stats['interval_ms']:g} ms"
+    if stats['backoffs']:
+        interval += f", backed off {stats['backoffs']}× to {stats['final_interval_ms']:g} ms"
+    print(f"  Interval: {interval}")
+    print(f"  Sampler cost: mean {stats['cost_mean_us']:.1f} μs, p99 {stats['cost_p99_us']:.1f} μs, "
+          f"max {stats['cost_max_us']:.1f} μs CPU per sample; {stats['overhead_pct']:.3f}% of one CPU")
+
+
+def print_correlation(analysis):
+    print(f"  Clock: {analysis['clock']}; {analysis['samples']:,} samples in {analysis['intervals']:,} intervals")
+    print(f"  Spikes above {analysis['threshold_us']:.2f} μs: {analysis['spikes']:,} in "
+          f"{analysis['spike_intervals']:,} intervals")
+    if not analysis['channels']:
+        print("  No spike intervals to correlate" if not analysis['spike_intervals']
+              else "  Every interval holds a spike; nothing to compare against")
+        return
+    print(f"\n  {'Channel':<36} {'corr':>7} {'lift':>8} {'in spikes':>10} {'quiet':>7}")
+    for channel in analysis['channels']:
+        mark = ' *' if channel['explains'] else ''
+        print(f"  {channel['name']:<36} {channel['corr']:>7.3f} {channel['lift']:>8.2f} "
+              f"{channel['coincidence_pct']:>9.1f}% {channel['baseline_pct']:>6.1f}%{mark}")
+    print(f"\n  * elevated in at least twice as many spike intervals as quiet ones; together they cover "
+          f"{analysis['explained_pct']:.1f}% of spike intervals")
+    if analysis['explained_pct'] < 50:
+        print("  Most spikes coincide with no host signal: look at the network path")
+    for worst in analysis['worst']:
+        print(f"    t={worst['time_s']:9.3f} s  max {worst['max_us']:8.1f} μs  {worst['spikes']:>4} spikes  "
+              f"{', '.join(worst['channels']) or '-'}")
+
+
+def main(argv=None):
+    import argparse
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    ap = argparse.ArgumentParser(description="Record host noise during a run and correlate it with latency spikes")
+    sub = ap.add_subparsers(dest='command', required=True)
+    p = sub.add_parser('record', help="sample host counters into a ring log, while the command after -- runs")
+    p.add_argument('output')
+    p.add_argument('--duration', type=float, help="seconds to sample (without a command)")
+    p.add_argument('--interval-ms', type=float, default=DEFAULT_INTERVAL_MS)
+    p.add_argument('--capacity', type=int, default=DEFAULT_CAPACITY, help="samples kept in the ring")
+    p.add_argument('--cpus', help="comma-separated CPUs whose IRQs, softirqs, schedstat and cpufreq count")
+    p.add_argument('--ifaces', help="comma-separated interfaces (default: all but lo)")
+    p.add_argument('--max-overhead', type=float, default=MAX_OVERHEAD, help="share of one CPU before backing off")
+    p = sub.add_parser('info', help="channels and sampler overhead of a ring log")
+    p.add_argument('log')
+    p = sub.add_parser('correlate', help="host signals behind a full log's latency spikes")
+    p.add_argument('log')
+    p.add_argument('full_log', help="the run's full log (.csv or .sps)")
+    p.add_argument('--spike-us', type=float, help="spike threshold (default: the --spike-pct percentile)")
+    p.add_argument('--spike-pct', type=float, default=DEFAULT_SPIKE_PCT)
+    p.add_argument('--lag', type=int, default=DEFAULT_LAG, help="sampler intervals of slack either side")
+    p.add_argument('--top', type=int, default=TOP)
+    p.add_argument('-o', '--output', help="dashboard image")
+    p.add_argument('--dpi', type=int, default=150)
+    argv = list(sys.argv[1:] if argv is None else argv)
+    run = argv[argv.index('--') + 1:] if '--' in argv else []
+    args = ap.parse_args(argv[:len(argv) - len(run) - 1] if '--' in argv else argv)
+
+    if args.command == 'record':
+        if not run and not args.duration:
+            ap.error("record needs --duration or a command after --")
+        cpus = {int(c) for c in args.cpus.split(',')} if args.cpus else None
+        ifaces = set(args.ifaces.split(',')) if args.ifaces else None
+        process = subprocess.Popen(run) if run else None
+        try:
+            stats = record(args.output, args.duration, args.interval_ms, args.capacity, cpus, ifaces,
+                           args.max_overhead, stop=(lambda: process.poll() is not None) if process else None)
+        finally:
+            if process and process.poll() is None:
+                process.terminate()
+        print(f"\n✓ Host noise written to {args.output}")
+        print_overhead(stats)
+        return process.wait() if process else None
+
+    if args.command == 'info':
+        log = NoiseLog(args.log)
+        print(f"\n{args.log} ({log.meta.get('host', '?')}, CPUs {log.meta.get('cpus') or 'all'}):")
+        print_overhead(overhead(log))
+        groups = {}
+        for name in log.channels:
+            groups.setdefault(name.split(':')[0], []).append(name)
+        for group, names in groups.items():
+            print(f"  {group}: {len(names)} channels")
+        return
+
+    analysis = correlate(args.log, args.full_log, args.spike_us, args.spike_pct, args.lag, args.top)
+    print(f"\n{args.full_log} against {args.log}:")
+    print_correlation(analysis)
+    if args.output:
+        render_noise(analysis, args.output, f'Host Noise vs Latency Spikes: {Path(args.full_log).name}', dpi=args.dpi)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,304 @@
+"""
+Per-stage instrumentation: wall time, CPU time and peak allocations.
+
+Pipeline code marks its stages with ``stage()``:
+
+    with stage('parse', file=filename):
+        ...
+
+Outside a profiling session stage() returns a shared no-op context, so the
+markers cost one global lookup. Inside ``profiling()`` every stage records
+its wall time (perf_counter), CPU time (process_time) and the peak of
+tracemalloc-traced memory above its starting point (NumPy reports its
+buffers to tracemalloc, so arrays count). Stages nest. Each record carries
+its path, e.g. ``render/panel/savefig``, and its labels, e.g. the input
+file or panel name.
+
+The report is a JSON document that dashboards can scrape:
+
+    {"command": [...], "environment": {...},
+     "total": {"wall_s", "cpu_s", "peak_alloc_bytes"},
+     "stages": [{"name", "path", "depth", "labels", "start_s", "wall_s", "cpu_s", "peak_alloc_bytes"}, ...],
+     "by_path": {path: {"count", "wall_s", "cpu_s", "peak_alloc_bytes"}},
+     "capture": {"kind", "stage", "file", "top": [...]}}
+
+With capture='cprofile' each top-level stage runs under its own cProfile,
+and the slowest one is kept (<report>.prof plus its top functions in the
+JSON). capture='sample' uses a 1 ms CPU-time sampling profiler instead
+(<report>.folded, in the folded-stack format of flamegraph.pl and
+speedscope), which distorts timings far less. tracemalloc itself slows
+allocation-heavy Python code by up to ~2x; pass memory=False to skip it.
+"""
+
+import os
+import time
+from contextlib import contextmanager
+
+TOP_FUNCTIONS = 25
+SAMPLE_INTERVAL = 0.001  # seconds of CPU time between samples
+
+_active = None
+
+
+class _NullStage:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+def stage(name, **labels):
+    """Context manager timing one pipeline stage (no-op unless profiling)"""
+    if _active is None:
+        return _NULL_STAGE
+    return _active.stage(name, labels)
+
+
+def active():
+    """The running Profiler, or None"""
+    return _active
+
+
+class _Frame:
+    __slots__ = ('name', 'labels', 'path', 'wall', 'cpu', 'base', 'peak_seen', 'capture')
+
+    def __init__(self, name, labels, path):
+        self.name = name
+        self.labels = labels
+        self.path = path
+        self.peak_seen = 0
+        self.capture = None
+
+
+class Profiler:
+    """Collects stage records; use through profiling()"""
+
+    def __init__(self, memory=True, capture=None):
+        if capture not in (None, 'cprofile', 'sample'):
+            raise ValueError(f"unknown capture {capture!r}")
+        self.memory = memory
+        self.capture = capture
+        self.records = []
+        self._stack = []
+        self._captures = {}  # index of a top-level record -> profile data
+        self._samples = None
+        self._start = None
+        self.result = None
+
+    # session
+
+    def start(self):
+        global _active
+        if _active is not None:
+            raise RuntimeError("a profiling session is already active")
+        if self.memory:
+            import tracemalloc
+            tracemalloc.start()
+        if self.capture == 'sample':
+            self._start_sampler()
+        _active = self
+        self._start = (time.perf_counter(), time.process_time())
+
+    def stop(self):
+        global _active
+        wall, cpu = time.perf_counter() - self._start[0], time.process_time() - self._start[1]
+        _active = None
+        if self.capture == 'sample':
+            self._stop_sampler()
+        peak = 0
+        if self.memory:
+            import tracemalloc
+            peak = max([tracemalloc.get_traced_memory()[1]] +
+                       [r['peak_alloc_bytes'] for r in self.records if r['depth'] == 0])
+            tracemalloc.stop()
+        self.total = {'wall_s': wall, 'cpu_s': cpu, 'peak_alloc_bytes': peak}
+
+    # stages
+
+    @contextmanager
+    def stage(self, name, labels):
+        parent = self._stack[-1] if self._stack else None
+        frame = _Frame(name, labels, f"{parent.path}/{name}" if parent else name)
+        self._enter(frame, parent)
+        try:
+            yield frame
+        finally:
+            self._exit(frame, parent)
+
+    def _enter(self, frame, parent):
+        self._stack.append(frame)
+        if self.memory:
+            import tracemalloc
+            current, peak = tracemalloc.get_traced_memory()
+            if parent is not None:
+                parent.peak_seen = max(parent.peak_seen, peak)
+            tracemalloc.reset_peak()
+            frame.base = current
+        if parent is None and self._samples is not None:
+            self._samples.pop(None, None)  # drop samples taken between stages
+        if parent is None and self.capture == 'cprofile':
+            import cProfile
+            frame.capture = cProfile.Profile()
+            frame.capture.enable()
+        frame.wall, frame.cpu = time.perf_counter(), time.process_time()
+
+    def _exit(self, frame, parent):
+        wall, cpu = time.perf_counter() - frame.wall, time.process_time() - frame.cpu
+        if frame.capture is not None:
+            frame.capture.disable()
+        peak = 0
+        if self.memory:
+            import tracemalloc
+            absolute = max(frame.peak_seen, tracemalloc.get_traced_memory()[1])
+            peak = absolute - frame.base
+            if parent is not None:
+                parent.peak_seen = max(parent.peak_seen, absolute)
+        self._stack.pop()
+        index = len(self.records)
+        self.records.append({
+            'name': frame.name,
+            'path': frame.path,
+            'depth': len(self._stack),
+            'labels': {k: str(v) for k, v in frame.labels.items()},
+            'start_s': frame.wall - self._start[0],
+            'wall_s': wall,
+            'cpu_s': cpu,
+            'peak_alloc_bytes': peak,
+        })
+        if frame.capture is not None:
+            self._captures[index] = frame.capture
+        elif parent is None and self._samples is not None:
+            self._captures[index] = self._samples.pop(None, {})
+
+    # sampling profiler
+
+    def _start_sampler(self):
+        import signal
+
+        self._samples = {}
+
+        def sample(signum, frame):
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+                frame = frame.f_back
+            folded = ';'.join(reversed(stack))
+            # Samples belong to the top-level stage running now; None until it ends
+            counts = self._samples.setdefault(None, {})
+            counts[folded] = counts.get(folded, 0) + 1
+
+        self._previous_handler = signal.signal(signal.SIGPROF, sample)
+        signal.setitimer(signal.ITIMER_PROF, SAMPLE_INTERVAL, SAMPLE_INTERVAL)
+
+    def _stop_sampler(self):
+        import signal
+
+        signal.setitimer(signal.ITIMER_PROF, 0, 0)
+        signal.signal(signal.SIGPROF, self._previous_handler)
+
+    # report
+
+    def report(self, output=None, command=None):
+        """The JSON-ready report; profile captures are written next to output"""
+        import platform
+
+        by_path = {}
+        for record in self.records:
+            row = by_path.setdefault(record['path'], {'count': 0, 'wall_s': 0.0, 'cpu_s': 0.0,
+                                                      'peak_alloc_bytes': 0})
+            row['count'] += 1
+            row['wall_s'] += record['wall_s']
+            row['cpu_s'] += record['cpu_s']
+            row['peak_alloc_bytes'] = max(row['peak_alloc_bytes'], record['peak_alloc_bytes'])
+        report = {
+            'command': command,
+            'environment': {'python': platform.python_version(), 'pid': os.getpid(),
+                            'cpus': os.cpu_count(), 'date': time.strftime('%Y-%m-%dT%H:%M:%S')},
+            'memory_traced': self.memory,
+            'total': getattr(self, 'total', None),
+            'stages': self.records,
+            'by_path': by_path,
+        }
+        if self._captures:
+            report['capture'] = self._capture_report(output)
+        return report
+
+    def _capture_report(self, output):
+        index = max(self._captures, key=lambda i: self.records[i]['wall_s'])
+        record = self.records[index]
+        data = self._captures[index]
+        capture = {'kind': self.capture, 'stage': record['path'], 'labels': record['labels'],
+                   'file': None, 'top': []}
+        if self.capture == 'cprofile':
+            import pstats
+
+            stats = pstats.Stats(data)
+            if output:
+                capture['file'] = os.fspath(output) + '.prof'
+                stats.dump_stats(capture['file'])
+            rows = sorted(stats.stats.items(), key=lambda kv: kv[1][3], reverse=True)[:TOP_FUNCTIONS]
+            capture['top'] = [{'function': f"{os.path.basename(file)}:{line}({func})", 'calls': nc,
+                               'tottime_s': tt, 'cumtime_s': ct}
+                              for (file, line, func), (_, nc, tt, ct, _) in rows]
+        else:
+            total = sum(data.values()) or 1
+            if output:
+                capture['file'] = os.fspath(output) + '.folded'
+                with open(capture['file'], 'w') as f:
+                    f.writelines(f"{stack} {count}\n" for stack, count in sorted(data.items()))
+            own = {}
+            for stack, count in data.items():
+                leaf = stack.rsplit(';', 1)[-1]
+                own[leaf] = own.get(leaf, 0) + count
+            capture['samples'] = sum(data.values())
+            capture['top'] = [{'function': func, 'samples': count, 'fraction': count / total}
+                              for func, count in sorted(own.items(), key=lambda kv: -kv[1])[:TOP_FUNCTIONS]]
+        return capture
+
+
+@contextmanager
+def profiling(output=None, memory=True, capture=None, command=None):
+    """Profile the enclosed code; writes the JSON report to output if given.
+
+    Yields the Profiler, whose .result holds the report after the block.
+    """
+    import json
+
+    profiler = Profiler(memory, capture)
+    profiler.start()
+    try:
+        yield profiler
+    finally:
+        profiler.stop()
+        profiler.result = profiler.report(output, command)
+        if output:
+            from pathlib import Path
+            Path(output).write_text(json.dumps(profiler.result, indent=2))
+
+
+def print_profile(report, limit=12):
+    """Console table of the stage paths with the most wall time"""
+    total = report['total']
+    print(f"\n⏱  PROFILE ({total['wall_s']:.3f} s wall, {total['cpu_s']:.3f} s CPU, "
+          f"peak {total['peak_alloc_bytes'] / 1e6:.1f} MB traced):")
+    print("-" * 80)
+    print(f"{'Stage':<40} {'Count':>6} {'Wall (s)':>10} {'CPU (s)':>10} {'Peak (MB)':>10}")
+    print("-" * 80)
+    rows = sorted(report['by_path'].items(), key=lambda kv: -kv[1]['wall_s'])[:limit]
+    for path, row in rows:
+        print(f"{path:<40} {row['count']:>6} {row['wall_s']:>10.3f} {row['cpu_s']:>10.3f} "
+              f"{row['peak_alloc_bytes'] / 1e6:>10.1f}")
+    capture = report.get('capture')
+    if capture:
+        where = f" → {capture['file']}" if capture['file'] else ''
+        print(f"\n{capture['kind']} capture of slowest stage '{capture['stage']}'{where}")
+        for row in capture['top'][:5]:
+            detail = f"{row['cumtime_s']:.3f} s cumulative" if 'cumtime_s' in row else f"{row['fraction']:.1%} of samples"
+            print(f"  {row['function']:<60} {detail}")
@@ -0,0 +1,254 @@
+"""
+Delay variation and spike analysis over raw full-log samples.
+
+sockperf's summary only gives a standard deviation, which the parser
+reports as jitter_us. With a full log the samples are in send order, and
+this module computes what TSN requirements are usually written against:
+
+    IPDV   inter-packet delay variation (RFC 3393): D(i) = L(i) - L(i-1)
+           for consecutive logged replies, summarised as |D|
+    PDV    packet delay variation (RFC 5481): L(i) - min(L)
+    spikes samples more than `threshold` standard deviations above the mean
+           of the preceding `window` samples; runs of spikes closer than
+           BURST_GAP samples count as one burst
+
+Everything is vectorised in O(n). IPDV needs one n-sized scratch array,
+which is reused for PDV (or skipped when latency_stats passes its sorted
+copy). Trailing-window means and variances come from cumulative sums over
+blocks of BLOCK samples, so spike detection adds a few MB regardless of n,
+and percentiles use np.partition rather than a sort. 10^7 samples take about
+a second on one core.
+
+Usage:
+    python -m sockperf_tools.jitter sockperf_pingpong_udp.csv [--window 1000] [--threshold 6]
+"""
+
+import math
+
+import numpy as np
+
+DEFAULT_WINDOW = 1000
+DEFAULT_THRESHOLD = 6.0
+BURST_GAP = 10  # samples
+PERCENTILES = (50.0, 99.0, 99.9)
+BLOCK = 1 << 18  # samples per spike-detection block
+
+# Dashboard jitter panels: IPDV when every plotted run has a full log,
+# otherwise the summary's std-dev (never both on one axis)
+METRIC_LABELS = {
+    'ipdv': 'Jitter, IPDV p99 (μs)',
+    'std-dev': 'Jitter, std-dev (μs)',
+}
+# Short forms for table columns and tick labels
+METRIC_NAMES = {'ipdv': 'IPDV p99', 'std-dev': 'Std-dev'}
+# Colour limits (green below the first, amber below the second, µs). For
+# Gaussian noise the p99 of |D| is about 3.6 std-devs, hence the IPDV limits.
+METRIC_LIMITS = {'ipdv': (70.0, 90.0), 'std-dev': (20.0, 25.0)}
+
+
+def _blocks(n, start=0, size=None):
+    """(lo, hi) bounds covering range(start, n) in blocks of BLOCK indices"""
+    size = size or BLOCK
+    for lo in range(start, n, size):
+        yield lo, min(lo + size, n)
+
+
+def _percentiles(values, percentiles=PERCENTILES, presorted=False):
+    """Nearest-rank percentiles (as latency_stats); values is reordered unless presorted"""
+    n = len(values)
+    ranks = np.clip(np.ceil(np.asarray(percentiles) / 100.0 * n).astype(np.int64) - 1, 0, n - 1)
+    if not presorted:
+        values.partition(np.unique(ranks))
+    return [float(values[r]) for r in ranks]
+
+
+def ipdv(latencies, seq=None, out=None):
+    """RFC 3393 delay variation of consecutive samples (µs).
+
+    With seq, only pairs whose sequence numbers are adjacent are used, so a
+    lost reply does not pair packets that were not sent back to back. The
+    differences are written to out (at least n - 1 floats) when given, and
+    the result is a view of it.
+    """
+    latencies = np.asarray(latencies, dtype=np.float64)
+    n = max(len(latencies) - 1, 0)
+    d = np.empty(n) if out is None else out[:n]
+    np.subtract(latencies[1:], latencies[:-1], out=d)
+    if seq is None:
+        return d
+    seq = np.asarray(seq)
+    # Compact the kept pairs to the front, one block at a time
+    kept = 0
+    for lo, hi in _blocks(n):
+        adjacent = np.diff(seq[lo:hi + 1]) == 1
+        if kept == lo and adjacent.all():
+            kept = hi
+            continue
+        part = d[lo:hi][adjacent]
+        d[kept:kept + len(part)] = part
+        kept += len(part)
+    return d[:kept]
+
+
+def pdv_stats(latencies, presorted=False):
+    """PDV percentiles relative to the minimum (µs); latencies is reordered unless presorted"""
+    floor = float(latencies[0] if presorted else latencies.min())
+    return {f'pdv_p{p:g}_us': value - floor
+            for p, value in zip(PERCENTILES, _percentiles(latencies, presorted=presorted))}
+
+
+def _trailing_moments(values, offset, window, lo, hi):
+    """Mean and variance of (values - offset) over the `window` samples before each index in [lo, hi)"""
+    span = values[lo - window:hi] - offset
+    sums = np.empty(len(span) + 1)
+    sums[0] = 0.0
+    np.cumsum(span, out=sums[1:])
+    m = hi - lo
+    mean = sums[window:window + m] - sums[:m]
+    mean /= window
+    np.square(span, out=span)
+    np.cumsum(span, out=sums[1:])
+    var = sums[window:window + m] - sums[:m]
+    var /= window
+    var -= np.square(mean, out=span[:m])
+    np.maximum(var, 0.0, out=var)
+    return mean, var
+
+
+def trailing_mean_std(values, window):
+    """Mean and std-dev of the `window` samples before each index (NaN for the first `window`)"""
+    values = np.asarray(values, dtype=np.float64)
+    n = len(values)
+    mean = np.full(n, np.nan)
+    std = np.full(n, np.nan)
+    # Centre first so the running sums do not lose precision
+    offset = values.mean() if n else 0.0
+    for lo, hi in _blocks(n, window):
+        m, var = _trailing_moments(values, offset, window, lo, hi)
+        mean[lo:hi] = m + offset
+        std[lo:hi] = np.sqrt(var)
+    return mean, std
+
+
+def detect_spikes(latencies, window=DEFAULT_WINDOW, threshold=DEFAULT_THRESHOLD):
+    """Indices of spike samples and their excess over the trailing mean (µs)"""
+    latencies = np.asarray(latencies, dtype=np.float64)
+    n = len(latencies)
+    if n <= window:
+        return np.empty(0, dtype=np.int64), np.empty(0)
+    offset = latencies.mean()
+    index, excess = [], []
+    for lo, hi in _blocks(n, window):
+        mean, var = _trailing_moments(latencies, offset, window, lo, hi)
+        over = latencies[lo:hi] - offset
+        over -= mean
+        np.sqrt(var, out=var)
+        var *= threshold
+        hits = np.flatnonzero(over > var)
+        index.append(hits + lo)
+        excess.append(over[hits])
+    return np.concatenate(index), np.concatenate(excess)
+
+
+def jitter_stats(latencies, seq=None, window=DEFAULT_WINDOW, threshold=DEFAULT_THRESHOLD, pdv=True):
+    """IPDV, PDV and spike summary of time-ordered latency samples (µs).
+
+    seq (the full log's packet column) keeps IPDV to adjacent packets. The
+    IPDV entries are NaN when no two logged packets are adjacent. With
+    pdv=False the PDV entries are left out, for callers that add them from
+    a sorted copy with pdv_stats. Returns a dict of plain floats/ints ({} for
+    fewer than two samples).
+    """
+    latencies = np.asarray(latencies, dtype=np.float64)
+    n = len(latencies)
+    if n < 2:
+        return {}
+
+    scratch = np.empty(n)
+    d = ipdv(latencies, seq, scratch)
+    stats = {'samples': n}
+    if len(d):
+        np.abs(d, out=d)
+        mean = float(d.mean())
+        stats.update({
+            'ipdv_mean_us': mean,
+            'ipdv_std_us': math.sqrt(max(float(np.dot(d, d)) / len(d) - mean * mean, 0.0)),
+            'ipdv_max_us': float(d.max()),
+        })
+        for p, value in zip(PERCENTILES, _percentiles(d)):
+            stats[f'ipdv_p{p:g}_us'] = value
+    else:
+        stats.update(dict.fromkeys(['ipdv_mean_us', 'ipdv_std_us', 'ipdv_max_us']
+                                   + [f'ipdv_p{p:g}_us' for p in PERCENTILES], math.nan))
+    if pdv:
+        scratch[:] = latencies
+        stats.update(pdv_stats(scratch))
+    del scratch, d
+
+    index, excess = detect_spikes(latencies, window, threshold)
+    stats.update({
+        'spike_window': window,
+        'spike_threshold': threshold,
+        'spike_count': int(len(index)),
+        'spike_rate': len(index) / n,
+        'spike_bursts': int(np.count_nonzero(np.diff(index) > BURST_GAP) + 1) if len(index) else 0,
+        'spike_max_excess_us': float(excess.max()) if len(index) else 0.0,
+    })
+    return stats
+
+
+def jitter_metric(results):
+    """'ipdv' if every result carries a finite full-log IPDV p99, else 'std-dev'.
+
+    A full log without adjacent sequence numbers has NaN IPDV fields, so the
+    delay_variation dict alone is not enough.
+    """
+    def finite(result):
+        value = (result.get('delay_variation') or {}).get('ipdv_p99_us')
+        return value is not None and math.isfinite(value)
+
+    results = list(results)
+    return 'ipdv' if results and all(finite(r) for r in results) else 'std-dev'
+
+
+def jitter_value(result, metric):
+    """A result's jitter in µs under the metric chosen by jitter_metric"""
+    if metric == 'ipdv':
+        return result['delay_variation']['ipdv_p99_us']
+    return result['jitter_us']
+
+
+def main(argv=None):
+    import argparse
+    import time
+
+    from .fulllog import read_latencies
+
+    ap = argparse.ArgumentParser(description="IPDV, PDV and spike analysis of full-log samples")
+    ap.add_argument('files', nargs='+', help="--full-log CSV or .sps sample files")
+    ap.add_argument('--window', type=int, default=DEFAULT_WINDOW, help="spike reference window (samples)")
+    ap.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD, help="spike threshold (std-devs)")
+    args = ap.parse_args(argv)
+
+    for filename in args.files:
+        latencies, seq = read_latencies(filename, with_seq=True)
+        start = time.perf_counter()
+        stats = jitter_stats(latencies, seq, window=args.window, threshold=args.threshold)
+        elapsed = time.perf_counter() - start
+        print(f"\n{filename}:")
+        if not stats:
+            print("  Not enough samples")
+            continue
+        print(f"  Samples: {stats['samples']:,} (analysed in {elapsed * 1000:.0f} ms)")
+        print(f"  IPDV |D|: mean {stats['ipdv_mean_us']:.3f}, p50 {stats['ipdv_p50_us']:.3f}, "
+              f"p99 {stats['ipdv_p99_us']:.3f}, p99.9 {stats['ipdv_p99.9_us']:.3f}, "
+              f"max {stats['ipdv_max_us']:.3f} μs")
+        print(f"  PDV (vs min): p50 {stats['pdv_p50_us']:.3f}, p99 {stats['pdv_p99_us']:.3f}, "
+              f"p99.9 {stats['pdv_p99.9_us']:.3f} μs")
+        print(f"  Spikes (>{args.threshold:g}σ over the last {args.window} samples): "
+              f"{stats['spike_count']:,} in {stats['spike_bursts']:,} bursts, "
+              f"max +{stats['spike_max_excess_us']:.1f} μs")
+
+
+if __name__ == '__main__':
+    main()
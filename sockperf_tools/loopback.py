@@ -0,0 +1,650 @@
+"""
+Host-only ping-pong / under-load / throughput generator that writes
+sockperf-compatible output.
+
+It stands in for sockperf when the LAN9662 rig is not available. Use it to
+regression-test the analysis pipeline, or to measure the host's own stack
+latency (loopback, or two network namespaces joined by a veth pair) as a
+baseline for the board measurements. The summary file has the same format as
+sockperf's, and a parameters line lets the parser classify the run.
+--full-log writes the CSV next to it, so every analyser ingests the output
+unchanged.
+
+I/O modes:
+    blocking  wait for readiness with poll(), then drain every ready message
+    busy      spin on non-blocking sockets (also sets SO_BUSY_POLL if allowed)
+    asyncio   asyncio event loop (server; ping-pong client)
+
+Python has no sendmmsg/recvmmsg, so "batched" means: the server drains
+all queued datagrams per wake-up with recv_into into one preallocated buffer,
+TCP replies for a batch go out in one send, and TCP throughput coalesces
+--batch messages per send.
+
+Usage:
+    python -m sockperf_tools.loopback run ping-pong --msg-size 64 -t 10 --full-log -o loopback/sockperf_pingpong_64B
+    python -m sockperf_tools.loopback server --proto tcp --port 11111          # e.g. inside "ip netns exec ns1"
+    python -m sockperf_tools.loopback client under-load -i 10.0.0.1 --mps 10000 --reply-every 100 -o ...
+"""
+
+import os
+import select
+import selectors
+import socket
+import struct
+import time
+from pathlib import Path
+
+VERSION = 'sockperf_tools-loopback'
+DEFAULT_PORT = 11111
+DEFAULT_MSG_SIZE = 14
+DEFAULT_DURATION = 30.0
+DEFAULT_WARMUP_MSEC = 400
+REPLY_TIMEOUT = 1.0  # seconds before a ping-pong reply counts as dropped
+
+TESTS = ('ping-pong', 'under-load', 'throughput')
+MODES = ('blocking', 'busy', 'asyncio')
+
+# length (u32), sequence number (u64), flags (u8); padded to the message size
+_HEADER = struct.Struct('<IQB')
+_REPLY = 0x01
+
+_SO_BUSY_POLL = getattr(socket, 'SO_BUSY_POLL', 46)
+
+
+def pin_cpu(cpu):
+    """Pin the calling process to one CPU (Linux); no-op for None"""
+    if cpu is not None:
+        os.sched_setaffinity(0, {cpu})
+
+
+def _socket(proto, busy):
+    kind = socket.SOCK_DGRAM if proto == 'udp' else socket.SOCK_STREAM
+    sock = socket.socket(socket.AF_INET, kind)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    if proto == 'tcp':
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    if busy:
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, _SO_BUSY_POLL, 50)
+        except OSError:
+            pass  # needs CAP_NET_ADMIN; spinning in user space still applies
+    return sock
+
+
+class _Receiver:
+    """Non-blocking message reader for both datagram and stream sockets"""
+
+    def __init__(self, sock, proto):
+        self.sock = sock
+        self.stream = proto == 'tcp'
+        self.buf = bytearray(1 << 20 if self.stream else 65536)
+        self.view = memoryview(self.buf)
+        self.fill = 0
+
+    def read(self):
+        """Drain whatever is ready; returns [(seq, flags, frame bytes)]"""
+        messages = []
+        while True:
+            try:
+                n = self.sock.recv_into(self.view[self.fill:] if self.stream else self.view)
+            except (BlockingIOError, InterruptedError):
+                return messages
+            if n == 0 and self.stream:
+                raise ConnectionError("peer closed the connection")
+            self.consume(n, messages)
+
+    def consume(self, n, messages):
+        if not self.stream:
+            length, seq, flags = _HEADER.unpack_from(self.buf)
+            messages.append((seq, flags, self.view[:n]))
+            return
+        self.fill += n
+        start = 0
+        while self.fill - start >= _HEADER.size:
+            length, seq, flags = _HEADER.unpack_from(self.buf, start)
+            if self.fill - start < length:
+                break
+            messages.append((seq, flags, bytes(self.view[start:start + length])))
+            start += length
+        if start:
+            self.buf[:self.fill - start] = self.buf[start:self.fill]
+            self.fill -= start
+
+
+# server
+
+def serve(proto='udp', host='0.0.0.0', port=DEFAULT_PORT, mode='blocking', cpu=None, ready=None):
+    """Echo every message that asks for a reply; runs until interrupted"""
+    pin_cpu(cpu)
+    if mode == 'asyncio':
+        import asyncio
+        return asyncio.run(_serve_asyncio(proto, host, port, ready))
+
+    busy = mode == 'busy'
+    listener = _socket(proto, busy)
+    listener.bind((host, port))
+    if proto == 'tcp':
+        listener.listen()
+    if ready is not None:
+        ready.set()
+    try:
+        if proto == 'udp':
+            _serve_udp(listener, busy)
+        else:
+            while True:
+                conn, _ = listener.accept()
+                with conn:
+                    conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                    _serve_tcp(conn, busy)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        listener.close()
+
+
+def _serve_udp(sock, busy):
+    sock.setblocking(False)
+    buf = bytearray(65536)
+    view = memoryview(buf)
+    poller = selectors.DefaultSelector()
+    poller.register(sock, selectors.EVENT_READ)
+    while True:
+        if not busy:
+            poller.select()
+        while True:  # drain everything queued before waiting again
+            try:
+                n, addr = sock.recvfrom_into(buf)
+            except (BlockingIOError, InterruptedError):
+                break
+            if n >= _HEADER.size and buf[12] & _REPLY:
+                sock.sendto(view[:n], addr)
+
+
+def _serve_tcp(conn, busy):
+    conn.setblocking(False)
+    receiver = _Receiver(conn, 'tcp')
+    poller = selectors.DefaultSelector()
+    poller.register(conn, selectors.EVENT_READ)
+    while True:
+        if not busy:
+            poller.select()
+        try:
+            messages = receiver.read()
+        except ConnectionError:
+            return
+        replies = b''.join(frame for _, flags, frame in messages if flags & _REPLY)
+        if replies:
+            conn.setblocking(True)
+            conn.sendall(replies)
+            conn.setblocking(False)
+
+
+async def _serve_asyncio(proto, host, port, ready):
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    if proto == 'udp':
+        class Echo(asyncio.DatagramProtocol):
+            def connection_made(self, transport):
+                self.transport = transport
+
+            def datagram_received(self, data, addr):
+                if len(data) >= _HEADER.size and data[12] & _REPLY:
+                    self.transport.sendto(data, addr)
+
+        await loop.create_datagram_endpoint(Echo, local_addr=(host, port), reuse_port=False)
+    else:
+        async def handle(reader, writer):
+            try:
+                while True:
+                    header = await reader.readexactly(_HEADER.size)
+                    length, _, flags = _HEADER.unpack(header)
+                    body = await reader.readexactly(length - _HEADER.size)
+                    if flags & _REPLY:
+                        writer.write(header + body)
+                        await writer.drain()
+            except (asyncio.IncompleteReadError, ConnectionError):
+                writer.close()
+
+        await asyncio.start_server(handle, host, port, reuse_address=True)
+    if ready is not None:
+        ready.set()
+    await asyncio.Event().wait()
+
+
+# client
+
+class _Clock:
+    """Monotonic nanosecond clock anchored to wall-clock time (as in sockperf's full log)"""
+
+    def __init__(self):
+        self.offset = time.time_ns() - time.perf_counter_ns()
+
+    def now(self):
+        return time.perf_counter_ns() + self.offset
+
+
+class Outcome:
+    """Counters and samples collected by one client run"""
+
+    __slots__ = ('sent', 'received', 'valid_sent', 'valid_received', 'dropped', 'out_of_order',
+                 'run_time_sec', 'valid_run_time_sec', 'seq', 'tx_ns', 'rx_ns')
+
+    def __init__(self):
+        self.sent = self.received = self.valid_sent = self.valid_received = 0
+        self.dropped = self.out_of_order = 0
+        self.run_time_sec = self.valid_run_time_sec = 0.0
+        self.seq, self.tx_ns, self.rx_ns = [], [], []
+
+
+def _connect(proto, host, port, busy):
+    sock = _socket(proto, busy)
+    sock.connect((host, port))
+    sock.setblocking(False)
+    return sock
+
+
+def _message(size, seq, flags):
+    buf = bytearray(size)
+    _HEADER.pack_into(buf, 0, size, seq, flags)
+    return buf
+
+
+def _wait_readable(poller, busy, timeout):
+    if not busy:
+        poller.select(timeout)
+
+
+def _send(sock, data):
+    """Send a whole message on a non-blocking socket"""
+    view = memoryview(data)
+    while view:
+        try:
+            view = view[sock.send(view):]
+        except (BlockingIOError, InterruptedError):
+            select.select([], [sock], [])
+
+
+def run_ping_pong(sock, proto, msg_size, duration, warmup, busy):
+    clock = _Clock()
+    receiver = _Receiver(sock, proto)
+    poller = selectors.DefaultSelector()
+    poller.register(sock, selectors.EVENT_READ)
+    out = Outcome()
+    start = time.perf_counter()
+    valid_from = start + warmup
+    end = start + duration
+    seq = 0
+    buf = _message(msg_size, 0, _REPLY)
+
+    while True:
+        now = time.perf_counter()
+        if now >= end:
+            break
+        _HEADER.pack_into(buf, 0, msg_size, seq, _REPLY)
+        valid = now >= valid_from
+        tx = clock.now()
+        _send(sock, buf)
+        out.sent += 1
+        out.valid_sent += valid
+        deadline = time.perf_counter() + REPLY_TIMEOUT
+        answered = False
+        while not answered and time.perf_counter() < deadline:
+            _wait_readable(poller, busy, REPLY_TIMEOUT)
+            for got, _, _ in receiver.read():
+                if got == seq:
+                    answered = True
+                    rx = clock.now()
+                else:
+                    out.out_of_order += valid
+        if answered:
+            out.received += 1
+            if valid:
+                out.valid_received += 1
+                out.seq.append(seq)
+                out.tx_ns.append(tx)
+                out.rx_ns.append(rx)
+        else:
+            out.dropped += valid
+        seq += 1
+
+    out.run_time_sec = time.perf_counter() - start
+    out.valid_run_time_sec = out.run_time_sec - warmup
+    return out
+
+
+def run_under_load(sock, proto, msg_size, duration, warmup, busy, mps, reply_every):
+    clock = _Clock()
+    receiver = _Receiver(sock, proto)
+    poller = selectors.DefaultSelector()
+    poller.register(sock, selectors.EVENT_READ)
+    out = Outcome()
+    pending = {}  # seq -> (tx_ns, valid) for messages that asked for a reply
+    period = 1.0 / mps
+    start = time.perf_counter()
+    valid_from = start + warmup
+    end = start + duration
+    buf = _message(msg_size, 0, 0)
+
+    def collect(messages):
+        rx = clock.now()
+        for got, _, _ in messages:
+            sent = pending.pop(got, None)
+            if sent is None:
+                continue
+            out.received += 1
+            tx, valid = sent
+            if valid:
+                out.valid_received += 1
+                out.seq.append(got)
+                out.tx_ns.append(tx)
+                out.rx_ns.append(rx)
+
+    seq = 0
+    while True:
+        target = start + seq * period
+        if target >= end:
+            break
+        while True:
+            remaining = target - time.perf_counter()
+            if remaining <= 0:
+                break
+            if not busy:
+                poller.select(remaining)
+            collect(receiver.read())
+        flags = _REPLY if seq % reply_every == 0 else 0
+        _HEADER.pack_into(buf, 0, msg_size, seq, flags)
+        valid = target >= valid_from
+        tx = clock.now()
+        _send(sock, buf)
+        if flags:
+            pending[seq] = (tx, valid)
+        out.sent += 1
+        out.valid_sent += valid
+        seq += 1
+
+    drain_end = time.perf_counter() + 0.1
+    while pending and time.perf_counter() < drain_end:
+        _wait_readable(poller, busy, 0.01)
+        collect(receiver.read())
+    out.dropped = sum(valid for _, valid in pending.values())
+    out.run_time_sec = time.perf_counter() - start
+    out.valid_run_time_sec = out.run_time_sec - warmup
+    return out
+
+
+def run_throughput(sock, proto, msg_size, duration, batch):
+    out = Outcome()
+    count = batch if proto == 'tcp' else 1
+    payload = b''.join(bytes(_message(msg_size, i, 0)) for i in range(count))
+    start = time.perf_counter()
+    end = start + duration
+    while time.perf_counter() < end:
+        if proto == 'udp':
+            try:
+                sock.send(payload)
+            except (BlockingIOError, InterruptedError):
+                continue
+        else:
+            _send(sock, payload)
+        out.sent += count
+    out.run_time_sec = time.perf_counter() - start
+    return out
+
+
+async def _ping_pong_asyncio(sock, proto, msg_size, duration, warmup):
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    clock = _Clock()
+    receiver = _Receiver(sock, proto)
+    out = Outcome()
+    start = time.perf_counter()
+    valid_from = start + warmup
+    end = start + duration
+    seq = 0
+    buf = _message(msg_size, 0, _REPLY)
+
+    while time.perf_counter() < end:
+        _HEADER.pack_into(buf, 0, msg_size, seq, _REPLY)
+        valid = time.perf_counter() >= valid_from
+        tx = clock.now()
+        await loop.sock_sendall(sock, buf)
+        out.sent += 1
+        out.valid_sent += valid
+        answered = False
+        try:
+            while not answered:
+                messages = []
+                view = receiver.view[receiver.fill:] if receiver.stream else receiver.view
+                n = await asyncio.wait_for(loop.sock_recv_into(sock, view), REPLY_TIMEOUT)
+                receiver.consume(n, messages)
+                for got, _, _ in messages:
+                    if got == seq:
+                        answered, rx = True, clock.now()
+                    else:
+                        out.out_of_order += valid
+        except asyncio.TimeoutError:
+            pass
+        if answered:
+            out.received += 1
+            if valid:
+                out.valid_received += 1
+                out.seq.append(seq)
+                out.tx_ns.append(tx)
+                out.rx_ns.append(rx)
+        else:
+            out.dropped += valid
+        seq += 1
+
+    out.run_time_sec = time.perf_counter() - start
+    out.valid_run_time_sec = out.run_time_sec - warmup
+    return out
+
+
+def run_client(test='ping-pong', proto='udp', host='127.0.0.1', port=DEFAULT_PORT,
+               msg_size=DEFAULT_MSG_SIZE, duration=DEFAULT_DURATION, warmup_msec=DEFAULT_WARMUP_MSEC,
+               mps=10_000, reply_every=100, mode='blocking', batch=64, cpu=None):
+    """Run one test against a server and return its Outcome"""
+    if test not in TESTS:
+        raise ValueError(f"unknown test {test!r}")
+    if msg_size < _HEADER.size:
+        raise ValueError(f"message size must be at least {_HEADER.size} bytes")
+    if mode == 'asyncio' and test != 'ping-pong':
+        raise ValueError("the asyncio client only runs ping-pong; use blocking or busy")
+    pin_cpu(cpu)
+    busy = mode == 'busy'
+    if busy and len(os.sched_getaffinity(0)) < 2:
+        import sys
+        print("warning: busy mode on a single CPU makes client and server fight for it; "
+              "latencies will be scheduler time slices", file=sys.stderr)
+    warmup = warmup_msec / 1000.0
+    sock = _connect(proto, host, port, busy)
+    try:
+        if mode == 'asyncio':
+            import asyncio
+            return asyncio.run(_ping_pong_asyncio(sock, proto, msg_size, duration, warmup))
+        if test == 'ping-pong':
+            return run_ping_pong(sock, proto, msg_size, duration, warmup, busy)
+        if test == 'under-load':
+            return run_under_load(sock, proto, msg_size, duration, warmup, busy, mps, reply_every)
+        return run_throughput(sock, proto, msg_size, duration, batch)
+    finally:
+        sock.close()
+
+
+# sockperf-format output
+
+def _ns_text(ns):
+    return f"{ns // 1_000_000_000}.{ns % 1_000_000_000:09d}"
+
+
+def write_full_log(filename, parameters, outcome):
+    """Write the samples in sockperf's --full-log CSV layout"""
+    with open(filename, 'w') as f:
+        f.write("------------------------------\n")
+        f.write(f"test was performed using the following parameters: {parameters}\n")
+        f.write("------------------------------\n")
+        f.write("packet, txTime(sec), rxTime(sec)\n")
+        f.writelines(f"{seq}, {_ns_text(tx)}, {_ns_text(rx)}\n"
+                     for seq, tx, rx in zip(outcome.seq, outcome.tx_ns, outcome.rx_ns))
+
+
+def format_summary(test, proto, host, port, parameters, outcome, warmup_msec, mode, msg_size, stats=None,
+                   version=VERSION):
+    """sockperf's console summary for an Outcome.
+
+    Latency statistics come from the Outcome's samples unless precomputed
+    stats (as from latency_stats) are passed.
+    """
+    lines = [
+        f"sockperf: == version #{version} == ",
+        f"sockperf[CLIENT] send on:sockperf: using {'poll()' if mode == 'blocking' else mode} to block on socket(s)",
+        "",
+        f"[ 0] IP = {host:<15} PORT = {port:5} # {proto.upper()}",
+        f"sockperf: test was performed using the following parameters: {parameters}",
+        "sockperf: Warmup stage (sending a few dummy messages)...",
+        "sockperf: Starting test...",
+        "sockperf: Test end (interrupted by timer)",
+        "sockperf: Test ended",
+    ]
+    if test == 'throughput':
+        rate = outcome.sent / outcome.run_time_sec if outcome.run_time_sec else 0.0
+        mbytes = rate * msg_size / 1024 / 1024
+        lines += [
+            f"sockperf: Total of {outcome.sent} messages sent in {outcome.run_time_sec:.3f} sec",
+            "",
+            f"sockperf: Summary: Message Rate is {round(rate)} [msg/sec]",
+            f"sockperf: Summary: BandWidth is {mbytes:.3f} MBps ({mbytes * 8:.3f} Mbps)",
+        ]
+        return '\n'.join(lines) + '\n'
+
+    import numpy as np
+
+    from .fulllog import SOCKPERF_PERCENTILES, latency_stats
+
+    if stats is None:
+        latencies = (np.asarray(outcome.rx_ns, dtype=np.int64) - np.asarray(outcome.tx_ns, dtype=np.int64)) / 2000.0
+        stats = latency_stats(latencies)
+    lines += [
+        f"sockperf: [Total Run] RunTime={outcome.run_time_sec:.3f} sec; Warm up time={warmup_msec} msec; "
+        f"SentMessages={outcome.sent}; ReceivedMessages={outcome.received}",
+        "sockperf: ========= Printing statistics for Server No: 0",
+        f"sockperf: [Valid Duration] RunTime={outcome.valid_run_time_sec:.3f} sec; "
+        f"SentMessages={outcome.valid_sent}; ReceivedMessages={outcome.valid_received}",
+    ]
+    if not stats:
+        lines.append("sockperf: ERROR: no replies received")
+        return '\n'.join(lines) + '\n'
+    n = stats['total_observations']
+    lines += [
+        f"sockperf: ====> avg-latency={stats['avg_latency_us']:.3f} (std-dev={stats['std_dev_us']:.3f})",
+        f"sockperf: # dropped messages = {outcome.dropped}; # duplicated messages = 0; "
+        f"# out-of-order messages = {outcome.out_of_order}",
+        f"sockperf: Summary: Latency is {stats['avg_latency_us']:.3f} usec",
+        f"sockperf: Total {n} observations; each percentile contains {n / 100:.2f} observations",
+        f"sockperf: ---> <MAX> observation = {stats['max_latency_us']:8.3f}",
+    ]
+    lines += [f"sockperf: ---> percentile {p:6.3f} = {stats['percentiles'][p]:8.3f}" for p in SOCKPERF_PERCENTILES]
+    lines.append(f"sockperf: ---> <MIN> observation = {stats['min_latency_us']:8.3f}")
+    return '\n'.join(lines) + '\n'
+
+
+def parameters_text(test, proto, host, port, msg_size, duration, mps, reply_every, mode):
+    words = [test, '-i', host, '-p', str(port), f'--msg-size={msg_size}', '-t', f'{duration:g}']
+    if proto == 'tcp':
+        words.append('--tcp')
+    if test == 'under-load':
+        words += [f'--mps={mps}', f'--reply-every={reply_every}']
+    else:
+        words.append('--mps=max')
+    words.append(f'--mode={mode}')
+    return ' '.join(words)
+
+
+def write_results(output, test, proto, host, port, outcome, msg_size, duration, warmup_msec,
+                  mps, reply_every, mode, full_log=False):
+    """Write <output>.txt (and <output>.csv with full_log); returns the summary path"""
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    parameters = parameters_text(test, proto, host, port, msg_size, duration, mps, reply_every, mode)
+    summary = output.with_suffix('.txt')
+    summary.write_text(format_summary(test, proto, host, port, parameters, outcome, warmup_msec, mode, msg_size))
+    if full_log and test != 'throughput':
+        write_full_log(output.with_suffix('.csv'), parameters, outcome)
+    return summary
+
+
+def _start_server(proto, host, port, mode, cpu):
+    import multiprocessing
+
+    ctx = multiprocessing.get_context('spawn')
+    ready = ctx.Event()
+    process = ctx.Process(target=serve, args=(proto, host, port, mode, cpu, ready), daemon=True)
+    process.start()
+    if not ready.wait(10):
+        process.terminate()
+        raise RuntimeError("loopback server did not start")
+    return process
+
+
+def main(argv=None):
+    import argparse
+
+    ap = argparse.ArgumentParser(description="sockperf-compatible loopback/namespace latency generator")
+    sub = ap.add_subparsers(dest='command', required=True)
+
+    srv = sub.add_parser('server', help="run an echo server until interrupted")
+    srv.add_argument('--proto', choices=['udp', 'tcp'], default='udp')
+    srv.add_argument('--bind', default='0.0.0.0')
+    srv.add_argument('-p', '--port', type=int, default=DEFAULT_PORT)
+    srv.add_argument('--mode', choices=MODES, default='blocking')
+    srv.add_argument('--cpu', type=int, help="pin the server to this CPU")
+
+    for name, help_text in (('client', "run a test against a running server"),
+                            ('run', "start a local server and run a test against it")):
+        p = sub.add_parser(name, help=help_text)
+        p.add_argument('test', choices=TESTS)
+        p.add_argument('--proto', choices=['udp', 'tcp'], default='udp')
+        p.add_argument('-i', '--ip', default='127.0.0.1')
+        p.add_argument('-p', '--port', type=int, default=DEFAULT_PORT)
+        p.add_argument('-m', '--msg-size', type=int, default=DEFAULT_MSG_SIZE)
+        p.add_argument('-t', '--time', type=float, default=DEFAULT_DURATION, help="seconds")
+        p.add_argument('--warmup-msec', type=int, default=DEFAULT_WARMUP_MSEC)
+        p.add_argument('--mps', type=int, default=10_000, help="messages/sec for under-load")
+        p.add_argument('--reply-every', type=int, default=100)
+        p.add_argument('--mode', choices=MODES, default='blocking')
+        p.add_argument('--batch', type=int, default=64, help="messages per send for TCP throughput")
+        p.add_argument('--cpu', type=int, help="pin the client to this CPU")
+        p.add_argument('--full-log', action='store_true', help="also write the per-message CSV")
+        p.add_argument('-o', '--output', help="output path without suffix "
+                       "(default loopback/sockperf_<test>_<proto>_<size>B)")
+        if name == 'run':
+            p.add_argument('--server-cpu', type=int, help="pin the server to this CPU")
+            p.add_argument('--server-mode', choices=MODES, help="server I/O mode (default: --mode)")
+
+    args = ap.parse_args(argv)
+    if args.command == 'server':
+        serve(args.proto, args.bind, args.port, args.mode, args.cpu)
+        return
+
+    server = None
+    if args.command == 'run':
+        server = _start_server(args.proto, args.ip, args.port, args.server_mode or args.mode, args.server_cpu)
+    try:
+        outcome = run_client(args.test, args.proto, args.ip, args.port, args.msg_size, args.time,
+                             args.warmup_msec, args.mps, args.reply_every, args.mode, args.batch, args.cpu)
+    finally:
+        if server is not None:
+            server.terminate()
+            server.join()
+
+    output = args.output or f"loopback/sockperf_{args.test.replace('-', '')}_{args.proto}_{args.msg_size}B"
+    summary = write_results(output, args.test, args.proto, args.ip, args.port, outcome, args.msg_size,
+                            args.time, args.warmup_msec, args.mps, args.reply_every, args.mode, args.full_log)
+    print(summary.read_text(), end='')
+    print(f"\n✓ Results written to {summary}")
+
+
+if __name__ == '__main__':
+    main()
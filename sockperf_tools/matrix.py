@@ -0,0 +1,369 @@
+"""
+Declarative test-matrix runner.
+
+A matrix file (JSON) lists payload sizes, tests, rates and topologies. The
+runner expands it into individual runs and executes them one after another,
+since runs share the link under test. Each finished run goes straight to a
+worker process for parsing. When a topology's last run is parsed, the
+worker also renders that topology's dashboard. All of this overlaps with the
+next measurement, so a full sweep takes little longer than its measurements.
+
+    {
+      "backend": "sockperf",              # or "loopback" (sockperf_tools.loopback)
+      "server": null,                     # "local" starts a server per protocol
+      "ip": "192.168.1.3", "port": 11111,
+      "duration": 30, "full_log": true, "repeat": 1,
+      "output_dir": "results",
+      "protocols": ["udp"],
+      "sizes": [null, 64, 512, 1472],     # null = the tool's default payload
+      "tests": ["ping-pong",
+                {"test": "under-load", "sizes": [null], "mps": [10000], "reply_every": 100},
+                {"test": "throughput", "sizes": [null]},
+                {"test": "playback", "data_file": "playback.csv"}],
+      "topologies": {"dual": {}, "single": {"before": "./switch-to-single.sh"}}
+    }
+
+Top-level keys are defaults; a test entry or a topology may override any of
+them. An under-load entry without "mps" or "reply_every" runs at 10000 msg/s
+with a reply every 100 messages. "before" is a shell command run before a topology's first run.
+Results go to <output_dir>/<topology>/sockperf_<test>_<proto>[_<size>B].txt,
+so batch, summary and compare can read the whole tree afterwards.
+
+Usage:
+    python -m sockperf_tools.matrix matrix.json [--dry-run] [--store sockperf_results.db]
+    python -m sockperf_tools.matrix --backend loopback --duration 5    # built-in matrix
+"""
+
+import json
+import os
+import shlex
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# Under-load rate and reply ratio when a test entry does not give them
+DEFAULT_MPS = 10000
+DEFAULT_REPLY_EVERY = 100
+
+# The hand-run LAN9662 campaign, with one duration for every run
+DEFAULT_MATRIX = {
+    'backend': 'sockperf',
+    'server': None,
+    'ip': '192.168.1.3',
+    'port': 11111,
+    'duration': 30,
+    'full_log': True,
+    'repeat': 1,
+    'output_dir': 'results',
+    'protocols': ['udp'],
+    'sizes': [None, 64, 512, 1472],
+    'tests': [
+        'ping-pong',
+        {'test': 'under-load', 'sizes': [None], 'mps': [DEFAULT_MPS], 'reply_every': DEFAULT_REPLY_EVERY},
+        {'test': 'throughput', 'sizes': [None]},
+    ],
+    'topologies': {'dual': {}, 'single': {}},
+}
+
+BACKENDS = ('sockperf', 'loopback')
+SERVER_STARTUP = 1.0  # seconds to let a local server bind before the first run
+
+
+def load_matrix(filename=None):
+    """DEFAULT_MATRIX updated with the keys of a JSON matrix file"""
+    matrix = dict(DEFAULT_MATRIX)
+    if filename:
+        with open(filename) as f:
+            matrix.update(json.load(f))
+    return matrix
+
+
+def _output_name(test, proto, size, mps, repeat):
+    name = f"sockperf_{test.replace('-', '')}_{proto}"
+    if size:
+        name += f"_{size}B"
+    if mps is not None:
+        name += f"_{mps}mps"
+    if repeat:
+        name += f"_r{repeat + 1}"
+    return name
+
+
+def expand(matrix):
+    """List of run dicts in execution order (topology, protocol, test, size, rate, repeat)"""
+    runs = []
+    for topology, overrides in matrix['topologies'].items():
+        for proto in matrix['protocols']:
+            for entry in matrix['tests']:
+                spec = dict(matrix, **(overrides or {}))
+                spec.update({'test': entry} if isinstance(entry, str) else entry)
+                test = spec['test']
+                sizes = [None] if test == 'playback' else spec['sizes']
+                rates, reply_every = None, spec.get('reply_every')
+                if test == 'under-load':
+                    rates = spec.get('mps') or DEFAULT_MPS
+                    reply_every = reply_every or DEFAULT_REPLY_EVERY
+                rates = rates if isinstance(rates, list) else [rates]
+                for size in sizes:
+                    for mps in rates:
+                        for repeat in range(spec['repeat']):
+                            name = _output_name(test, proto, size, mps if len(rates) > 1 else None, repeat)
+                            runs.append({
+                                'topology': topology,
+                                'test': test,
+                                'proto': proto,
+                                'size': size,
+                                'mps': mps,
+                                'reply_every': reply_every,
+                                'duration': spec['duration'],
+                                'full_log': spec['full_log'] and test != 'throughput',
+                                'data_file': spec.get('data_file'),
+                                'backend': spec['backend'],
+                                'ip': spec['ip'],
+                                'port': spec['port'],
+                                'before': (overrides or {}).get('before'),
+                                'output': str(Path(spec['output_dir']) / topology / name),
+                            })
+    return runs
+
+
+def command_for(run):
+    """argv for one run; sockperf writes to stdout, loopback writes its own files"""
+    test, output = run['test'], run['output']
+    if run['backend'] == 'loopback':
+        if test == 'playback':
+            raise ValueError("the loopback backend has no playback mode")
+        argv = [sys.executable, '-m', 'sockperf_tools.loopback', 'client', test, '--proto', run['proto'],
+                '-i', run['ip'], '-p', str(run['port']), '-t', str(run['duration']), '-o', output]
+        if run['size']:
+            argv += ['-m', str(run['size'])]
+        if test == 'under-load':
+            argv += ['--mps', str(run['mps']), '--reply-every', str(run['reply_every'])]
+        if run['full_log']:
+            argv.append('--full-log')
+        return argv
+
+    argv = ['sockperf', test, '-i', run['ip'], '-p', str(run['port'])]
+    if run['proto'] == 'tcp':
+        argv.append('--tcp')
+    if test == 'playback':
+        argv += ['--data-file', run['data_file']]
+    else:
+        argv += ['-t', str(run['duration'])]
+        if run['size']:
+            argv += ['-m', str(run['size'])]
+    if test == 'under-load':
+        argv += ['--mps', str(run['mps']), '--reply-every', str(run['reply_every'])]
+    if run['full_log']:
+        argv += ['--full-log', output + '.csv']
+    return argv
+
+
+def _server_command(backend, proto, port):
+    if backend == 'loopback':
+        return [sys.executable, '-m', 'sockperf_tools.loopback', 'server', '--proto', proto, '-p', str(port)]
+    return ['sockperf', 'server', '-i', '0.0.0.0', '-p', str(port)] + (['--tcp'] if proto == 'tcp' else [])
+
+
+def _pin(cpus):
+    if cpus:
+        os.sched_setaffinity(0, cpus)
+
+
+def _analyze(filename, topology, cache_dir):
+    """Parse one finished run (runs in a worker process)"""
+    from .batch import _parse_one, _worker_cache
+
+    key = _worker_cache(cache_dir).key(filename) if cache_dir else None
+    return _parse_one((filename, {'topology': topology}, cache_dir, key))
+
+
+def _render(topology, results, output_dir, cache_dir):
+    """Render one topology's dashboard (runs in a worker process)"""
+    from .overview import render_overview, title_for
+
+    render_overview(results, str(Path(output_dir) / topology / 'test_results_visualization.png'),
+                    jobs=1, cache_dir=cache_dir, title=title_for(topology))
+
+
+def _render_comparison(dual, single, output_dir, cache_dir):
+    from .comparison import render_comparison
+
+    render_comparison(dual, single, str(Path(output_dir) / 'comparison_dual_vs_single.png'),
+                      jobs=1, cache_dir=cache_dir)
+
+
+def _measure(run):
+    """Execute one run; returns the summary path, or None if it failed"""
+    summary = Path(run['output'] + '.txt')
+    summary.parent.mkdir(parents=True, exist_ok=True)
+    argv = command_for(run)
+    if run['backend'] == 'loopback':
+        proc = subprocess.run(argv, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    else:
+        with open(summary, 'w') as out:
+            proc = subprocess.run(argv, stdout=out, stderr=subprocess.STDOUT, text=True)
+    if proc.returncode != 0:
+        detail = (proc.stderr or '').strip().splitlines()
+        print(f"  ✗ {shlex.join(argv)} exited with {proc.returncode}" + (f": {detail[-1]}" if detail else ''))
+        return None
+    return summary
+
+
+def _report(result):
+    from .batch import test_label
+
+    if result.avg_latency_us is not None:
+        p99 = result.percentiles.get(99.0)
+        detail = f"avg {result.avg_latency_us:.2f} μs" + (f", p99 {p99:.2f} μs" if p99 is not None else '')
+    elif result.bandwidth_mbps is not None:
+        detail = f"{result.bandwidth_mbps:.2f} Mbps, {result.msg_rate:,.0f} msg/s"
+    else:
+        detail = result.test_type
+    print(f"  ✓ {result.topology} {test_label(result)}: {detail}")
+
+
+def run_matrix(matrix, jobs=1, analysis_cpus=None, plot=True, store=None, dry_run=False):
+    """Run every expanded run in order, analysing each one in the background.
+
+    jobs worker processes parse and render; pin them away from the
+    measurement with analysis_cpus. Returns the parsed results.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    from .batch import TEST_TYPE_ORDER, test_label
+    from .cache import cache_enabled, default_cache_dir
+
+    runs = expand(matrix)
+    if dry_run:
+        for run in runs:
+            try:
+                argv = command_for(run)
+            except ValueError as exc:
+                print(f"# skipped {run['output']}: {exc}")
+                continue
+            redirect = '' if run['backend'] == 'loopback' else f" > {shlex.quote(run['output'] + '.txt')}"
+            print(shlex.join(argv) + redirect)
+        return []
+
+    cache_dir = str(default_cache_dir()) if cache_enabled() else None
+    remaining = {}
+    for run in runs:
+        remaining[run['topology']] = remaining.get(run['topology'], 0) + 1
+
+    servers = []
+    if matrix.get('server') == 'local':
+        for proto in matrix['protocols']:
+            servers.append(subprocess.Popen(_server_command(matrix['backend'], proto, matrix['port']),
+                                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL))
+        time.sleep(SERVER_STARTUP)
+
+    results = []
+    by_topology = {}
+    parsing = []
+    rendering = []
+    start = time.perf_counter()
+    pool = ProcessPoolExecutor(max_workers=jobs, initializer=_pin, initargs=(analysis_cpus,))
+
+    def collect(wait=False):
+        # Hand finished parses to the store and start dashboards whose runs are all in
+        for future in [f for f in parsing if wait or f.done()]:
+            parsing.remove(future)
+            topology = future.topology
+            result = future.result()
+            remaining[topology] -= 1
+            if result is not None:
+                _report(result)
+                results.append(result)
+                if store is not None:
+                    store.ingest([result])
+                if result.test_type in TEST_TYPE_ORDER:
+                    by_topology.setdefault(topology, {})[test_label(result)] = result
+            if plot and remaining[topology] == 0 and by_topology.get(topology):
+                rendering.append(pool.submit(_render, topology, by_topology[topology],
+                                             matrix['output_dir'], cache_dir))
+
+    try:
+        current = None
+        for i, run in enumerate(runs, 1):
+            if run['topology'] != current:
+                current = run['topology']
+                print(f"\n▶ {current}")
+                if run['before']:
+                    subprocess.run(run['before'], shell=True, check=True)
+            print(f"[{i}/{len(runs)}] {run['output']}")
+            try:
+                summary = _measure(run)
+            except ValueError as exc:
+                print(f"  - skipped: {exc}")
+                summary = None
+            future = pool.submit(_analyze, str(summary), run['topology'], cache_dir) if summary else None
+            if future is None:
+                remaining[run['topology']] -= 1
+            else:
+                future.topology = run['topology']
+                parsing.append(future)
+            collect()
+        collect(wait=True)
+        if plot and by_topology.get('dual') and by_topology.get('single'):
+            rendering.append(pool.submit(_render_comparison, by_topology['dual'], by_topology['single'],
+                                         matrix['output_dir'], cache_dir))
+        for future in rendering:
+            future.result()
+    finally:
+        pool.shutdown()
+        for server in servers:
+            server.terminate()
+            server.wait()
+
+    print(f"\n{len(results)} of {len(runs)} runs analysed in {time.perf_counter() - start:.1f} s")
+    return results
+
+
+def main(argv=None):
+    import argparse
+
+    ap = argparse.ArgumentParser(description="Run a declarative sockperf test matrix")
+    ap.add_argument('matrix', nargs='?', help="JSON matrix file (default: the built-in LAN9662 campaign)")
+    ap.add_argument('--backend', choices=BACKENDS, help="override the matrix backend")
+    ap.add_argument('--duration', type=float, help="override every run's duration (seconds)")
+    ap.add_argument('--output-dir', help="override the matrix output directory")
+    ap.add_argument('--local-server', action='store_true', help="start a server on this host for each protocol")
+    ap.add_argument('--dry-run', action='store_true', help="print the commands without running them")
+    ap.add_argument('--store', metavar='DB', help="ingest every parsed run into this results store")
+    ap.add_argument('-j', '--jobs', type=int, default=1, help="analysis/render worker processes")
+    ap.add_argument('--analysis-cpus', help="comma-separated CPUs for the workers, e.g. 2,3")
+    ap.add_argument('--no-plot', action='store_true', help="skip the dashboards")
+    args = ap.parse_args(argv)
+
+    matrix = load_matrix(args.matrix)
+    if args.backend:
+        matrix['backend'] = args.backend
+        if args.backend == 'loopback' and not args.matrix:
+            matrix.update(ip='127.0.0.1', server='local', output_dir='.', topologies={'loopback': {}})
+    if args.duration is not None:
+        matrix['duration'] = args.duration
+    if args.output_dir:
+        matrix['output_dir'] = args.output_dir
+    if args.local_server:
+        matrix['server'] = 'local'
+    cpus = {int(c) for c in args.analysis_cpus.split(',')} if args.analysis_cpus else None
+
+    store = None
+    if args.store:
+        from .store import ResultStore
+        store = ResultStore(args.store)
+    try:
+        results = run_matrix(matrix, args.jobs, cpus, not args.no_plot, store, args.dry_run)
+    finally:
+        if store is not None:
+            store.close()
+    if results:
+        from .batch import aggregate, print_summary
+        print()
+        print_summary(aggregate(results))
+
+
+if __name__ == '__main__':
+    main()
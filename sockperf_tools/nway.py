@@ -0,0 +1,368 @@
+"""
+N-way comparison of any number of configurations.
+
+compare_dual_vs_single.py compares exactly two topologies. Here the runs are
+grouped into configurations by any mix of topology, firmware, board and
+protocol (from the directory layout or a manifest), and held as one metrics
+tensor:
+
+    values[configuration, payload, metric]
+
+Repeated runs of a configuration and payload are averaged, and missing
+combinations are NaN. Every pairwise delta is a broadcast subtraction over
+the configuration axis. Rankings are computed for every payload at once with
+argsort, so hundreds of configurations cost milliseconds. A configuration's
+score is its mean rank over the payloads it has. Wins count the payloads on
+which one configuration beats another.
+
+Usage:
+    python -m sockperf_tools.nway results/ [--by topology,firmware] [--metric p99] [--baseline dual]
+    python -m sockperf_tools.nway --manifest runs.csv --test under-load --top 20 -o nway.png
+"""
+
+import math
+
+from .render import Panel, render_dashboard
+
+DEFAULT_OUTPUT = 'comparison_nway.png'
+DEFAULT_BY = ('topology',)
+CONFIG_FIELDS = ('topology', 'firmware', 'board', 'protocol')
+# Summary fields, then percentiles as 'p<percentile>'
+METRICS = ('avg_latency_us', 'std_dev_us', 'min_latency_us', 'max_latency_us', 'p50', 'p99', 'p99.9', 'p99.99')
+METRIC_LABELS = {'avg_latency_us': 'Avg', 'std_dev_us': 'Std-dev', 'min_latency_us': 'Min', 'max_latency_us': 'Max'}
+TOP = 8          # configurations drawn in colour and listed by default
+MAX_TICKS = 40   # more configurations than this are drawn without tick labels
+TITLE = 'LAN9662 N-Way Configuration Comparison'
+
+
+def config_name(result, by=DEFAULT_BY):
+    """Configuration of a run: its values of the `by` fields joined with '/'"""
+    return '/'.join(str(getattr(result, field) or '-') for field in by)
+
+
+def metric_label(metric):
+    return METRIC_LABELS.get(metric, metric)
+
+
+def _metric_value(result, metric):
+    if metric.startswith('p'):
+        return (result.percentiles or {}).get(float(metric[1:]), math.nan)
+    value = getattr(result, metric)
+    return math.nan if value is None else value
+
+
+def build_tensor(results, by=DEFAULT_BY, test_type='ping-pong', metrics=METRICS):
+    """Metrics tensor of the test_type runs among results.
+
+    Returns {'configs' (names, in first-seen order), 'payloads' (sizes,
+    ascending; the default payload as DEFAULT_MSG_SIZE), 'metrics',
+    'values' (configs x payloads x metrics, NaN where missing) and 'runs'
+    (configs x payloads run counts)}.
+    """
+    import numpy as np
+
+    from .batch import DEFAULT_MSG_SIZE
+
+    runs = [r for r in results if r.test_type == test_type]
+    configs = {}
+    config_of = np.array([configs.setdefault(config_name(r, by), len(configs)) for r in runs], dtype=np.intp)
+    payloads, payload_of = np.unique(np.array([r.msg_size or DEFAULT_MSG_SIZE for r in runs], dtype=np.int64),
+                                     return_inverse=True)
+    rows = np.array([[_metric_value(r, m) for m in metrics] for r in runs], dtype=np.float64)
+    rows = rows.reshape(len(runs), len(metrics))
+
+    shape = (len(configs), len(payloads), len(metrics))
+    sums, counts = np.zeros(shape), np.zeros(shape)
+    present = np.isfinite(rows)
+    np.add.at(sums, (config_of, payload_of), np.where(present, rows, 0.0))
+    np.add.at(counts, (config_of, payload_of), present)
+    run_counts = np.zeros(shape[:2], dtype=np.int64)
+    np.add.at(run_counts, (config_of, payload_of), 1)
+    with np.errstate(invalid='ignore'):
+        values = sums / counts
+    return {
+        'configs': list(configs),
+        'payloads': payloads,
+        'metrics': tuple(metrics),
+        'values': values,
+        'runs': run_counts,
+    }
+
+
+def metric_values(tensor, metric):
+    """The configs x payloads slice of one metric"""
+    return tensor['values'][:, :, tensor['metrics'].index(metric)]
+
+
+def pairwise(values):
+    """All pairwise deltas of a configs x ... array.
+
+    Returns {'delta', 'relative_pct'} shaped (configs, configs, ...):
+    delta[i, j] = values[i] - values[j], relative to values[j]. Lower is
+    better for every metric, so a negative delta means i beats j.
+    """
+    import numpy as np
+
+    values = np.asarray(values, dtype=np.float64)
+    delta = values[:, None] - values[None, :]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        relative = delta / values[None, :] * 100.0
+    return {'delta': delta, 'relative_pct': relative}
+
+
+def mean_relative(values):
+    """configs x configs mean relative delta (%) over the payloads both configurations have"""
+    import numpy as np
+
+    relative = pairwise(values)['relative_pct']
+    both = np.isfinite(relative)
+    shared = both.sum(axis=2)
+    with np.errstate(invalid='ignore'):
+        return np.where(both, relative, 0.0).sum(axis=2) / shared
+
+
+def rank_configs(values):
+    """Rank configurations on a configs x payloads array (lower is better).
+
+    Returns {'rank' (1 = best per payload, NaN where missing), 'mean_rank',
+    'coverage' (payloads present), 'order' (configs best first, those with
+    no data last) and 'wins' (configs x configs: payloads on which i beats j)}.
+    """
+    import numpy as np
+
+    values = np.asarray(values, dtype=np.float64)
+    present = np.isfinite(values)
+    order = np.argsort(np.where(present, values, np.inf), axis=0, kind='stable')
+    rank = np.empty(values.shape)
+    np.put_along_axis(rank, order, np.arange(1, len(values) + 1, dtype=np.float64)[:, None], axis=0)
+    rank[~present] = np.nan
+    coverage = present.sum(axis=1)
+    with np.errstate(invalid='ignore'):
+        mean_rank = np.where(present, rank, 0.0).sum(axis=1) / coverage
+    wins = (values[:, None] < values[None, :]).sum(axis=2)
+    return {
+        'rank': rank,
+        'mean_rank': mean_rank,
+        'coverage': coverage,
+        'order': np.lexsort((np.nan_to_num(mean_rank, nan=np.inf), coverage == 0)),
+        'wins': wins,
+    }
+
+
+def _view(tensor, metric, baseline):
+    """Plain-list inputs of the panels, so every value is part of their fingerprints"""
+    return {
+        'configs': tensor['configs'],
+        'payloads': tensor['payloads'].tolist(),
+        'metric': metric,
+        'values': metric_values(tensor, metric).tolist(),
+        'baseline': baseline,
+    }
+
+
+def _ordered(view):
+    """(values, names, ranking) with configurations in rank order"""
+    import numpy as np
+
+    values = np.array(view['values'], dtype=np.float64)
+    ranking = rank_configs(values)
+    order = ranking['order']
+    return values[order], [view['configs'][i] for i in order], ranking
+
+
+def _ticks(ax, axis, names):
+    if len(names) <= MAX_TICKS:
+        getattr(ax, f'set_{axis}ticks')(range(len(names)))
+        rotation = {'rotation': 45, 'ha': 'right'} if axis == 'x' else {}
+        getattr(ax, f'set_{axis}ticklabels')(names, fontsize=8, **rotation)
+    else:
+        getattr(ax, f'set_{axis}ticks')([])
+        getattr(ax, f'set_{axis}label')(f'{len(names)} configurations, best first', fontsize=10)
+
+
+def _draw_by_payload(ax, view):
+    """Metric against payload: the TOP best configurations in colour, the rest grey"""
+    values, names, _ = _ordered(view)
+    payloads = view['payloads']
+    for i in range(len(names) - 1, -1, -1):
+        if i < TOP:
+            ax.plot(payloads, values[i], 'o-', linewidth=2, markersize=6, color=f'C{i}', label=names[i], zorder=3)
+        else:
+            ax.plot(payloads, values[i], '-', linewidth=0.8, color='#bdc3c7', alpha=0.6, zorder=1)
+    if view['baseline'] in names and names.index(view['baseline']) >= TOP:
+        ax.plot(payloads, values[names.index(view['baseline'])], 'k--', linewidth=1.5, label=view['baseline'])
+    ax.set_xscale('log')
+    ax.set_xlabel('Message Size (Bytes)', fontsize=11, fontweight='bold')
+    ax.set_ylabel(f"{metric_label(view['metric'])} latency (μs)", fontsize=11, fontweight='bold')
+    title = f'Best {TOP} of {len(names)}' if len(names) > TOP else 'All Configurations'
+    ax.set_title(f'{title} by Message Size', fontsize=12, fontweight='bold')
+    handles, labels = ax.get_legend_handles_labels()
+    ax.legend(handles[::-1], labels[::-1], fontsize=8)
+    ax.grid(True, alpha=0.3)
+
+
+def _draw_heatmap(ax, view):
+    """Metric per configuration (rank order) and payload"""
+    import numpy as np
+
+    values, names, _ = _ordered(view)
+    image = ax.imshow(np.ma.masked_invalid(values), aspect='auto', cmap='viridis_r', interpolation='nearest')
+    ax.figure.colorbar(image, ax=ax, label='μs')
+    ax.set_xticks(range(len(view['payloads'])))
+    ax.set_xticklabels([f'{p}B' for p in view['payloads']])
+    _ticks(ax, 'y', names)
+    if values.size <= 200:
+        middle = np.nanmean(image.get_clim())
+        for (i, j), value in np.ndenumerate(values):
+            if np.isfinite(value):
+                ax.text(j, i, f'{value:.1f}', ha='center', va='center', fontsize=7,
+                        color='black' if value < middle else 'white')
+    ax.set_title(f"{metric_label(view['metric'])} Latency by Configuration", fontsize=12, fontweight='bold')
+
+
+def _draw_pairwise(ax, view):
+    """Mean relative delta of every pair: row configuration against column configuration"""
+    import numpy as np
+
+    values, names, _ = _ordered(view)
+    matrix = mean_relative(values)
+    limit = np.nanmax(np.abs(matrix)) if np.isfinite(matrix).any() else 1.0
+    image = ax.imshow(np.ma.masked_invalid(matrix), cmap='RdYlGn_r', vmin=-limit, vmax=limit,
+                      interpolation='nearest')
+    ax.figure.colorbar(image, ax=ax, label='row vs column (%)')
+    _ticks(ax, 'x', names)
+    _ticks(ax, 'y', names)
+    ax.set_title('Pairwise Delta (green: row is faster)', fontsize=12, fontweight='bold')
+
+
+def _draw_baseline(ax, view):
+    """Relative delta of the TOP best configurations against the baseline, per payload"""
+    import numpy as np
+
+    values, names, _ = _ordered(view)
+    baseline = names.index(view['baseline']) if view['baseline'] in names else 0
+    shown = [i for i in range(len(names)) if i != baseline][:TOP]
+    relative = pairwise(values)['relative_pct'][shown, baseline]
+    x = np.arange(len(view['payloads']))
+    width = 0.8 / max(len(shown), 1)
+    for k, i in enumerate(shown):
+        ax.bar(x + (k - (len(shown) - 1) / 2) * width, np.nan_to_num(relative[k]), width,
+               color=f'C{i}', label=names[i])
+    ax.axhline(0, color='black', linewidth=0.5)
+    ax.set_xticks(x)
+    ax.set_xticklabels([f'{p}B' for p in view['payloads']])
+    ax.set_ylabel(f'Δ vs {names[baseline]} (%)', fontsize=11, fontweight='bold')
+    ax.set_title(f'{metric_label(view["metric"])} Latency vs Baseline (below 0: faster)', fontsize=12,
+                 fontweight='bold')
+    ax.legend(fontsize=8)
+    ax.grid(True, alpha=0.3, axis='y')
+
+
+PANELS = (
+    Panel(_draw_by_payload),
+    Panel(_draw_heatmap),
+    Panel(_draw_pairwise),
+    Panel(_draw_baseline),
+)
+
+
+def render_nway(tensor, metric, baseline, output=DEFAULT_OUTPUT, dpi=300, fmt=None, jobs=None, cache_dir=None):
+    """Render the N-way dashboard of one metric"""
+    view = _view(tensor, metric, baseline)
+    title = f"{TITLE}\n{len(tensor['configs'])} configurations, {metric_label(metric)} latency"
+    drawn, reused = render_dashboard(PANELS, (view,), (2, 2), (18, 14), title, output, dpi, fmt, jobs, cache_dir)
+    print(f"\n✓ N-way comparison saved as {output} ({drawn} panels drawn, {reused} reused)")
+
+
+def print_nway(tensor, metric, baseline, top=None):
+    """Ranking table with the metric per payload and the mean delta against the baseline"""
+    values = metric_values(tensor, metric)
+    ranking = rank_configs(values)
+    configs = tensor['configs']
+    b = configs.index(baseline)
+    against = mean_relative(values)[:, b]
+    wins = ranking['wins']
+    payloads = tensor['payloads']
+
+    print(f"\n{len(configs)} configurations, {len(payloads)} payloads, ranked by "
+          f"{metric_label(metric)} latency (baseline {baseline}):")
+    sizes = ''.join(f"{f'{p}B':>10}" for p in payloads)
+    print(f"  {'#':>4} {'Configuration':<28} {'Mean rank':>9}{sizes} {'vs base':>9} {'W-L vs base':>12}")
+    order = ranking['order'] if top is None else ranking['order'][:top]
+    for position, i in enumerate(order, 1):
+        cells = ''.join('         -' if math.isnan(v) else f"{v:>10.2f}" for v in values[i])
+        delta = '-' if i == b or math.isnan(against[i]) else f"{against[i]:+.1f}%"
+        record = '-' if i == b else f"{wins[i, b]}-{wins[b, i]}"
+        print(f"  {position:>4} {configs[i]:<28} {ranking['mean_rank'][i]:>9.2f}{cells} {delta:>9} {record:>12}")
+    if top is not None and len(configs) > top:
+        print(f"  ... {len(configs) - top} more")
+
+
+def main(argv=None):
+    import argparse
+    import json
+    import time
+
+    from .batch import DEFAULT_PATTERN, TEST_TYPE_ORDER, default_cache, discover, parse_files, read_manifest
+    from .cache import cache_enabled, default_cache_dir
+
+    ap = argparse.ArgumentParser(description="Rank and compare any number of configurations")
+    ap.add_argument('paths', nargs='*', help="result files, directories or globs")
+    ap.add_argument('--manifest', help="CSV with 'path' and topology/firmware/board columns")
+    ap.add_argument('--by', default=','.join(DEFAULT_BY),
+                    help=f"fields that make a configuration, from {','.join(CONFIG_FIELDS)}")
+    ap.add_argument('--test', default='ping-pong', choices=[t for t in TEST_TYPE_ORDER if t != 'throughput'])
+    ap.add_argument('--metric', default='avg_latency_us', help=f"one of {', '.join(METRICS)}")
+    ap.add_argument('--baseline', help="configuration the others are compared with (default: the first found)")
+    ap.add_argument('--top', type=int, help="list only the best N configurations")
+    ap.add_argument('--json', action='store_true', help="print the tensor and ranking as JSON")
+    ap.add_argument('-o', '--output', default=DEFAULT_OUTPUT, help=f"image file (default {DEFAULT_OUTPUT})")
+    ap.add_argument('--dpi', type=int, default=300)
+    ap.add_argument('-j', '--jobs', type=int, help="parsing and rendering processes (default: all cores)")
+    ap.add_argument('--no-plot', action='store_true')
+    args = ap.parse_args(argv)
+
+    by = tuple(args.by.split(','))
+    if not set(by) <= set(CONFIG_FIELDS):
+        ap.error(f"--by takes {', '.join(CONFIG_FIELDS)}")
+    if args.metric not in METRICS:
+        ap.error(f"--metric takes {', '.join(METRICS)}")
+    entries = read_manifest(args.manifest) if args.manifest else []
+    if args.paths or not args.manifest:
+        entries += [(path, {}) for path in discover(args.paths or [DEFAULT_PATTERN])]
+
+    cache = default_cache()
+    start = time.perf_counter()
+    tensor = build_tensor(parse_files(entries, args.jobs, cache), by, args.test)
+    if cache:
+        cache.close()
+    if not tensor['configs']:
+        print(f"No {args.test} runs found")
+        return
+    baseline = args.baseline or tensor['configs'][0]
+    if baseline not in tensor['configs']:
+        ap.error(f"no configuration {baseline!r} (have {', '.join(tensor['configs'])})")
+
+    if args.json:
+        ranking = rank_configs(metric_values(tensor, args.metric))
+        print(json.dumps({
+            'configs': tensor['configs'],
+            'payloads': tensor['payloads'].tolist(),
+            'metrics': tensor['metrics'],
+            'values': [[[None if math.isnan(v) else v for v in row] for row in config]
+                       for config in tensor['values'].tolist()],
+            'runs': tensor['runs'].tolist(),
+            'order': [tensor['configs'][i] for i in ranking['order']],
+            'mean_rank': [None if math.isnan(v) else v for v in ranking['mean_rank'].tolist()],
+        }, indent=2))
+        return
+
+    print(f"Loaded {int(tensor['runs'].sum())} {args.test} runs in {(time.perf_counter() - start) * 1000:.1f} ms")
+    print_nway(tensor, args.metric, baseline, args.top)
+    if not args.no_plot:
+        render_nway(tensor, args.metric, baseline, args.output, args.dpi, jobs=args.jobs,
+                    cache_dir=default_cache_dir() if cache_enabled() else None)
+
+
+if __name__ == '__main__':
+    main()
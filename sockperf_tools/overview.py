@@ -0,0 +1,258 @@
+"""
+Per-topology overview dashboard and console summary.
+
+The 2x3 figure and the text report produced by analyze_results.py; runs
+with a full log add a third row of latency-over-time panels. Each
+panel is a separate function so render.py can redraw only the panels whose
+results changed; plotting libraries are only imported when a panel is drawn,
+so the text summary runs without matplotlib.
+"""
+
+from .batch import DEFAULT_MSG_SIZE
+from .render import Panel, pick, render_dashboard
+from .timeseries import draw_latency_over_time, draw_rate_over_time, draw_samples_over_time, full_log_runs
+
+DEFAULT_OUTPUT = 'test_results_visualization.png'
+
+# Board topology: (name, data path)
+TOPOLOGIES = {
+    'dual': ('Dual-Board', '192.168.1.2 → LAN9662-1 → LAN9662-2 → 192.168.1.3'),
+    'single': ('Single-Board', '192.168.1.2 → LAN9662 → 192.168.1.3'),
+    'loopback': ('Loopback', 'host only (loopback or network namespaces)'),
+}
+
+
+def title_for(topology):
+    """Dashboard title for a board topology"""
+    name, path = TOPOLOGIES.get(topology, (topology.title(), 'unknown path'))
+    return f'LAN9662 {name} Network Performance Test Results\n{path}'
+
+
+TITLE = title_for('dual')
+
+
+def _draw_latency_vs_size(ax, results):
+    """Latency by Message Size"""
+    ping_pong_tests = [t for t in results if results[t].test_type == 'ping-pong']
+    msg_sizes = [results[t].msg_size or DEFAULT_MSG_SIZE for t in ping_pong_tests]
+    latencies = [results[t]['avg_latency_us'] for t in ping_pong_tests]
+    jitters = [results[t]['jitter_us'] for t in ping_pong_tests]
+
+    ax.errorbar(msg_sizes[:len(latencies)], latencies, yerr=jitters,
+                 marker='o', linewidth=2, markersize=8, capsize=5)
+    ax.set_xlabel('Message Size (Bytes)', fontsize=11, fontweight='bold')
+    ax.set_ylabel('Latency (μs)', fontsize=11, fontweight='bold')
+    ax.set_title('Latency vs Message Size', fontsize=12, fontweight='bold')
+    ax.grid(True, alpha=0.3)
+    ax.set_xscale('log')
+
+
+def _draw_percentiles(ax, results):
+    """Latency Distribution (Percentiles)"""
+    for test_name in ['Ping-Pong (Default)', 'Ping-Pong (1472B)']:
+        if test_name in results and 'percentiles' in results[test_name]:
+            pcts = sorted(results[test_name]['percentiles'].keys())
+            vals = [results[test_name]['percentiles'][p] for p in pcts]
+            label = test_name.replace('Ping-Pong ', '')
+            ax.plot(pcts, vals, marker='o', label=label, linewidth=2)
+
+    ax.set_xlabel('Percentile', fontsize=11, fontweight='bold')
+    ax.set_ylabel('Latency (μs)', fontsize=11, fontweight='bold')
+    ax.set_title('Latency Percentile Distribution', fontsize=12, fontweight='bold')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+
+
+def _draw_jitter(ax, results):
+    """Jitter Comparison"""
+    from .jitter import METRIC_LABELS, METRIC_LIMITS, jitter_metric, jitter_value
+
+    test_names = [t for t in results if 'jitter_us' in results[t]]
+    metric = jitter_metric(results[t] for t in test_names)
+    jitter_vals = [jitter_value(results[t], metric) for t in test_names]
+    good, fair = METRIC_LIMITS[metric]
+    colors = ['#2ecc71' if j < good else '#f39c12' if j < fair else '#e74c3c' for j in jitter_vals]
+
+    bars = ax.barh(test_names, jitter_vals, color=colors)
+    if metric == 'ipdv':
+        for bar, t in zip(bars, test_names):
+            spikes = results[t]['delay_variation']['spike_count']
+            if spikes:
+                ax.annotate(f' {spikes:,} spikes', (bar.get_width(), bar.get_y() + bar.get_height() / 2),
+                            va='center', fontsize=8)
+    ax.set_xlabel(METRIC_LABELS[metric], fontsize=11, fontweight='bold')
+    ax.set_title('Jitter by Test Type', fontsize=12, fontweight='bold')
+    ax.grid(True, alpha=0.3, axis='x')
+
+
+def _draw_min_avg_max(ax, results):
+    """Min/Avg/Max Latency"""
+    import numpy as np
+
+    ping_tests = [t for t in results if 'Ping-Pong' in t]
+    x_pos = np.arange(len(ping_tests))
+
+    mins = [results[t].get('min_latency_us', 0) for t in ping_tests]
+    avgs = [results[t].get('avg_latency_us', 0) for t in ping_tests]
+    maxs = [results[t].get('max_latency_us', 0) for t in ping_tests]
+
+    width = 0.25
+    ax.bar(x_pos - width, mins, width, label='Min', color='#2ecc71')
+    ax.bar(x_pos, avgs, width, label='Avg', color='#3498db')
+    ax.bar(x_pos + width, maxs, width, label='Max', color='#e74c3c')
+
+    ax.set_ylabel('Latency (μs)', fontsize=11, fontweight='bold')
+    ax.set_title('Min/Avg/Max Latency Comparison', fontsize=12, fontweight='bold')
+    ax.set_xticks(x_pos)
+    ax.set_xticklabels([t.replace('Ping-Pong ', '') for t in ping_tests], rotation=15, ha='right')
+    ax.legend()
+    ax.grid(True, alpha=0.3, axis='y')
+
+
+def _draw_throughput(ax, results):
+    """Throughput Metrics"""
+    throughput_data = []
+    if 'Throughput' in results:
+        t_res = results['Throughput']
+        throughput_data.append({
+            'label': 'Bandwidth\n(Mbps)',
+            'value': t_res.get('bandwidth_mbps', 0),
+            'color': '#9b59b6'
+        })
+        throughput_data.append({
+            'label': 'Msg Rate\n(msg/sec)',
+            'value': t_res.get('msg_rate', 0) / 1000,  # Convert to thousands
+            'color': '#1abc9c'
+        })
+
+    if throughput_data:
+        labels = [d['label'] for d in throughput_data]
+        values = [d['value'] for d in throughput_data]
+        colors = [d['color'] for d in throughput_data]
+
+        bars = ax.bar(labels, values, color=colors)
+        ax.set_ylabel('Value', fontsize=11, fontweight='bold')
+        ax.set_title('Throughput Test Results', fontsize=12, fontweight='bold')
+
+        # Add value labels on bars
+        for bar, val in zip(bars, values):
+            height = bar.get_height()
+            ax.text(bar.get_x() + bar.get_width()/2., height,
+                    f'{val:.1f}',
+                    ha='center', va='bottom', fontweight='bold')
+
+        # Add units as text
+        ax.text(0, values[0]*0.5, 'Mbps', ha='center', va='center', fontsize=10, color='white', fontweight='bold')
+        ax.text(1, values[1]*0.5, 'k msg/s', ha='center', va='center', fontsize=10, color='white', fontweight='bold')
+
+
+def _draw_summary_table(ax, results):
+    """Summary Statistics Table"""
+    from .jitter import METRIC_NAMES, jitter_metric, jitter_value
+
+    ax.axis('off')
+
+    latency_runs = {t: r for t, r in results.items() if 'avg_latency_us' in r}
+    metric = jitter_metric(latency_runs.values())
+    summary_data = []
+    for test_name, result in latency_runs.items():
+        summary_data.append([
+            test_name.replace('Ping-Pong ', 'PP '),
+            f"{result['avg_latency_us']:.2f}",
+            f"{jitter_value(result, metric):.2f}",
+            f"{result.get('min_latency_us', 0):.2f}",
+            f"{result.get('max_latency_us', 0):.2f}",
+        ])
+
+    table = ax.table(cellText=summary_data,
+                     colLabels=['Test', 'Avg (μs)', f'{METRIC_NAMES[metric]} (μs)', 'Min (μs)', 'Max (μs)'],
+                     cellLoc='center',
+                     loc='center',
+                     colWidths=[0.3, 0.175, 0.175, 0.175, 0.175])
+
+    table.auto_set_font_size(False)
+    table.set_fontsize(9)
+    table.scale(1, 2)
+
+    # Style header row
+    for i in range(5):
+        table[(0, i)].set_facecolor('#3498db')
+        table[(0, i)].set_text_props(weight='bold', color='white')
+
+    # Alternate row colors
+    for i in range(1, len(summary_data) + 1):
+        for j in range(5):
+            if i % 2 == 0:
+                table[(i, j)].set_facecolor('#ecf0f1')
+
+    ax.set_title('Summary Statistics', fontsize=12, fontweight='bold', pad=20)
+
+
+def _ping_pong(results):
+    return (pick(results, lambda label, result: result.test_type == 'ping-pong'),)
+
+
+def _latency_runs(results):
+    return (pick(results, lambda label, result: 'avg_latency_us' in result),)
+
+
+PANELS = (
+    Panel(_draw_latency_vs_size, _ping_pong),
+    Panel(_draw_percentiles, lambda results: (
+        pick(results, lambda label, result: label in ('Ping-Pong (Default)', 'Ping-Pong (1472B)')),)),
+    Panel(_draw_jitter, _latency_runs),
+    Panel(_draw_min_avg_max, lambda results: (pick(results, lambda label, result: 'Ping-Pong' in label),)),
+    Panel(_draw_throughput, lambda results: (pick(results, lambda label, result: label == 'Throughput'),)),
+    Panel(_draw_summary_table, _latency_runs),
+)
+
+TIMESERIES_PANELS = (
+    Panel(draw_latency_over_time, lambda results: (full_log_runs(results),)),
+    Panel(draw_samples_over_time, lambda results: (full_log_runs(results, limit=1),)),
+    Panel(draw_rate_over_time, lambda results: (full_log_runs(results),)),
+)
+
+
+def render_overview(results, output=DEFAULT_OUTPUT, dpi=300, fmt=None, jobs=None, cache_dir=None, title=TITLE):
+    """Render the overview dashboard for {test label: result} (dual-board title by default)"""
+    if full_log_runs(results):
+        panels, shape, figsize = PANELS + TIMESERIES_PANELS, (3, 3), (16, 15)
+    else:
+        panels, shape, figsize = PANELS, (2, 3), (16, 10)
+    drawn, reused = render_dashboard(panels, (results,), shape, figsize, title, output,
+                                     dpi, fmt, jobs, cache_dir)
+    print(f"\n✓ Visualization saved as {output} ({drawn} panels drawn, {reused} reused)")
+
+
+def print_overview(results, topology='dual'):
+    """Print the console summary for one topology's {test label: result}"""
+    name, path = TOPOLOGIES.get(topology, (topology.title(), 'unknown path'))
+    protocols = sorted({result.protocol for result in results.values() if result.get('protocol')})
+    # Generate summary report
+    print("\n" + "="*80)
+    print(f"LAN9662 {name.upper()} NETWORK PERFORMANCE TEST SUMMARY")
+    print("="*80)
+    print(f"Test Configuration: {path}")
+    print(f"Protocol: {', '.join(protocols) or '-'}")
+    print("="*80)
+
+    for test_name, result in results.items():
+        print(f"\n{test_name}:")
+        if 'avg_latency_us' in result:
+            print(f"  Average Latency: {result['avg_latency_us']:.2f} μs")
+            print(f"  Jitter (Std Dev): {result['jitter_us']:.2f} μs")
+            dv = result.get('delay_variation')
+            if dv:
+                print(f"  IPDV (RFC 3393): mean {dv['ipdv_mean_us']:.2f} μs, p99 {dv['ipdv_p99_us']:.2f} μs")
+                print(f"  PDV p99 (vs min): {dv['pdv_p99_us']:.2f} μs, "
+                      f"spikes: {dv['spike_count']:,} in {dv['spike_bursts']:,} bursts")
+            print(f"  Min Latency: {result.get('min_latency_us', 0):.2f} μs")
+            print(f"  Max Latency: {result.get('max_latency_us', 0):.2f} μs")
+        if 'bandwidth_mbps' in result:
+            print(f"  Bandwidth: {result['bandwidth_mbps']:.2f} Mbps")
+        if 'msg_rate' in result:
+            print(f"  Message Rate: {result['msg_rate']:,} msg/sec")
+        if 'packet_loss_pct' in result:
+            print(f"  Packet Loss: {result['packet_loss_pct']:.3f}%")
+        if 'total_observations' in result:
+            print(f"  Total Observations: {result['total_observations']:,}")
@@ -0,0 +1,374 @@
+"""
+Single-pass parser for sockperf summary output.
+
+Each file is read once and walked line by line. Lines are dispatched on their
+first few characters through a dict, so only the handful of lines that carry
+numbers are ever split or converted. ANSI colour codes that sockperf wraps
+around the headline numbers are stripped from the whole text up front.
+
+The result is a compact __slots__ record. It also supports the dict-style
+access (result['avg_latency_us'], result.get(...), 'key' in result) that the
+analysis scripts were written against, where a missing metric behaves like a
+missing key.
+"""
+
+import re
+from pathlib import Path
+
+from .instrument import stage
+
+PARSER_VERSION = 3
+
+_ANSI = re.compile(r'\x1b\[[0-9;]*m')
+_TARGET = re.compile(r'IP\s*=\s*([\d.]+)\s+PORT\s*=\s*(\d+)\s*#\s*(\w+)')
+_OPTION = re.compile(r'(?:--(msg-size|mps|reply-every)|-(m))[= ](\w+)')
+_SIZE_IN_NAME = re.compile(r'(?:^|[_-])(\d+)B(?:[_.-]|$)')
+
+# sockperf subcommands as they appear in a parameters header
+_MODES = {
+    'pp': 'ping-pong', 'ping-pong': 'ping-pong',
+    'ul': 'under-load', 'under-load': 'under-load',
+    'tp': 'throughput', 'throughput': 'throughput',
+    'pb': 'playback', 'playback': 'playback',
+}
+
+
+def _kv(text):
+    """Split 'A=1; B=2 sec; C=3' into {'A': '1', 'B': '2', 'C': '3'}"""
+    fields = {}
+    for part in text.split(';'):
+        key, sep, value = part.partition('=')
+        if sep:
+            fields[key.strip()] = value.split()[0] if value.split() else ''
+    return fields
+
+
+class ServerStats:
+    """Latency statistics printed for one "Server No" section"""
+
+    __slots__ = (
+        'server_no', 'valid_run_time_sec', 'valid_sent', 'valid_received',
+        'avg_latency_us', 'std_dev_us', 'dropped_messages', 'duplicated_messages',
+        'out_of_order_messages', 'total_observations', 'min_latency_us',
+        'max_latency_us', 'percentiles',
+    )
+
+    def __init__(self, server_no=0):
+        self.server_no = server_no
+        self.valid_run_time_sec = None
+        self.valid_sent = None
+        self.valid_received = None
+        self.avg_latency_us = None
+        self.std_dev_us = None
+        self.dropped_messages = None
+        self.duplicated_messages = None
+        self.out_of_order_messages = None
+        self.total_observations = None
+        self.min_latency_us = None
+        self.max_latency_us = None
+        self.percentiles = {}
+
+
+class SockperfResult:
+    """Metrics parsed from one sockperf output file.
+
+    Latency fields describe the first server section; every section is kept in
+    ``servers`` for multi-server runs.
+    """
+
+    __slots__ = (
+        'filename', 'version', 'protocol', 'target_ip', 'target_port',
+        'run_time_sec', 'warmup_msec', 'sent_messages', 'received_messages',
+        'packet_loss_pct', 'servers', 'avg_latency_us', 'std_dev_us', 'jitter_us',
+        'min_latency_us', 'max_latency_us', 'total_observations', 'percentiles', 'delay_variation',
+        'valid_sent', 'valid_received', 'bandwidth_mbps', 'bandwidth_MBps',
+        'msg_rate', 'throughput_messages', 'errors', 'parameters', 'test_type',
+        'msg_size', 'reply_every', 'mps',
+        # run metadata supplied by the caller (manifest, directory layout)
+        'topology', 'firmware', 'board', 'run_date',
+    )
+
+    def __init__(self, filename=None):
+        for name in self.__slots__:
+            setattr(self, name, None)
+        self.filename = filename
+        self.servers = []
+        self.percentiles = {}
+        self.errors = []
+
+    # dict-style access used by the plotting/report code
+    def __getitem__(self, key):
+        value = getattr(self, key, None) if key in self.__slots__ else None
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        setattr(self, key, value)
+
+    def __contains__(self, key):
+        return key in self.__slots__ and getattr(self, key) is not None
+
+    def get(self, key, default=None):
+        value = getattr(self, key, None) if key in self.__slots__ else None
+        return default if value is None else value
+
+    def keys(self):
+        return [name for name in self.__slots__ if getattr(self, name) is not None]
+
+    def update(self, values):
+        for key, value in values.items():
+            setattr(self, key, value)
+
+    def as_dict(self):
+        """Plain dict of the populated top-level metrics"""
+        return {name: getattr(self, name) for name in self.keys() if name != 'servers'}
+
+    def __repr__(self):
+        return f"SockperfResult({self.filename!r}, avg_latency_us={self.avg_latency_us})"
+
+
+def _current_server(result):
+    """Return the server section being parsed, opening one if none is open"""
+    if not result.servers:
+        result.servers.append(ServerStats())
+    return result.servers[-1]
+
+
+def _promote_server(result, server):
+    """Copy one server's stats to the top level of the result"""
+    result.avg_latency_us = server.avg_latency_us
+    result.std_dev_us = server.std_dev_us
+    result.jitter_us = server.std_dev_us  # Jitter approximated as std-dev
+    result.min_latency_us = server.min_latency_us
+    result.max_latency_us = server.max_latency_us
+    result.total_observations = server.total_observations
+    result.percentiles = server.percentiles
+    result.valid_sent = server.valid_sent
+    result.valid_received = server.valid_received
+
+
+def _on_observation(result, line):
+    server = _current_server(result)
+    name, _, value = line[4:].partition('=')
+    name = name.strip()
+    if name.startswith('percentile'):
+        server.percentiles[float(name[10:])] = float(value)
+    elif name == '<MAX> observation':
+        server.max_latency_us = float(value)
+    elif name == '<MIN> observation':
+        server.min_latency_us = float(value)
+
+
+def _on_avg_latency(result, line):
+    if line.startswith('====> avg-latency='):
+        server = _current_server(result)
+        avg, _, std = line[18:].partition('(std-dev=')
+        server.avg_latency_us = float(avg)
+        server.std_dev_us = float(std.rstrip(')'))
+
+
+def _on_total(result, line):
+    words = line.split()
+    if len(words) > 2 and words[2].startswith('observations'):
+        _current_server(result).total_observations = int(words[1])
+    elif len(words) > 6 and words[1] == 'of' and words[4] == 'sent':
+        result.throughput_messages = int(words[2])
+        result.run_time_sec = float(words[6])
+
+
+def _on_dropped(result, line):
+    server = _current_server(result)
+    fields = _kv(line.replace('#', ''))
+    server.dropped_messages = int(fields.get('dropped messages', 0))
+    server.duplicated_messages = int(fields.get('duplicated messages', 0))
+    server.out_of_order_messages = int(fields.get('out-of-order messages', 0))
+
+
+def _on_valid_duration(result, line):
+    server = _current_server(result)
+    fields = _kv(line[16:])
+    server.valid_run_time_sec = float(fields['RunTime'])
+    server.valid_sent = int(fields['SentMessages'])
+    server.valid_received = int(fields['ReceivedMessages'])
+
+
+def _on_server_header(result, line):
+    if 'Server No:' in line:
+        result.servers.append(ServerStats(int(line.rsplit(':', 1)[1])))
+
+
+def _on_total_run(result, line):
+    fields = _kv(line[11:])
+    result.run_time_sec = float(fields['RunTime'])
+    result.warmup_msec = float(fields.get('Warm up time', 0))
+    result.sent_messages = int(fields['SentMessages'])
+    result.received_messages = int(fields['ReceivedMessages'])
+
+
+def _on_summary(result, line):
+    words = line.split()
+    if len(words) < 6:
+        return
+    if words[1] == 'Message':
+        result.msg_rate = int(words[4])
+    elif words[1] == 'BandWidth':
+        result.bandwidth_MBps = float(words[3])
+        result.bandwidth_mbps = float(words[5].lstrip('('))
+
+
+def _on_version(result, line):
+    if line.startswith('== version #'):
+        result.version = line[12:].strip(' =')
+
+
+def _on_error(result, line):
+    result.errors.append(line[6:].strip())
+
+
+def _on_parameters(result, line):
+    if line.startswith('test was performed using the following parameters:'):
+        result.parameters = line.partition(':')[2].strip()
+
+
+def _on_target(result, line):
+    match = _TARGET.search(line)
+    if match:
+        result.target_ip = match.group(1)
+        result.target_port = int(match.group(2))
+        result.protocol = match.group(3)
+
+
+# Handlers keyed on the first five characters of a line (after the
+# "sockperf: " prefix); every other line is skipped with one dict lookup
+_HANDLERS = {
+    '---> ': _on_observation,
+    '====>': _on_avg_latency,
+    'Total': _on_total,
+    '# dro': _on_dropped,
+    '[Vali': _on_valid_duration,
+    '=====': _on_server_header,
+    '[Tota': _on_total_run,
+    'Summa': _on_summary,
+    '== ve': _on_version,
+    'ERROR': _on_error,
+    'test ': _on_parameters,
+}
+
+
+def _parse(lines, result):
+    handlers = _HANDLERS
+    for line in lines:
+        if line.startswith('sockperf: '):
+            line = line[10:]
+        handler = handlers.get(line[:5])
+        if handler is not None:
+            handler(result, line.rstrip())
+        elif line.startswith('[ ') and 'IP =' in line:
+            _on_target(result, line)
+
+    if result.servers:
+        _promote_server(result, result.servers[0])
+    _classify(result)
+    _packet_loss(result)
+    return result
+
+
+def _packet_loss(result):
+    """Share of expected replies that never came back.
+
+    Under-load only replies to every Nth message, so the expected count is
+    sent // reply_every rather than every message sent.
+    """
+    expected = (result.sent_messages or 0) // (result.reply_every or 1)
+    if expected and result.received_messages is not None:
+        result.packet_loss_pct = max(0.0, (1 - result.received_messages / expected) * 100)
+
+
+def _classify(result):
+    """Work out test type, payload size and reply-every from the file itself.
+
+    A parameters header (when present) is authoritative. Otherwise throughput
+    runs give the payload as bandwidth / message rate, and latency runs are
+    told apart by the received/sent ratio: under-load only replies to every
+    Nth message. The filename is only consulted for a ping-pong payload,
+    which the summary never prints.
+    """
+    if result.parameters:
+        words = result.parameters.split()
+        if words and words[0] in _MODES:
+            result.test_type = _MODES[words[0]]
+        for long_name, short_name, value in _OPTION.findall(result.parameters):
+            name = long_name or short_name
+            if name in ('msg-size', 'm') and value.isdigit():
+                result.msg_size = int(value)
+            elif name == 'mps':
+                result.mps = int(value) if value.isdigit() else value
+            elif name == 'reply-every' and value.isdigit():
+                result.reply_every = int(value)
+
+    if result.msg_rate is not None:
+        result.test_type = result.test_type or 'throughput'
+        if result.msg_size is None and result.msg_rate and result.bandwidth_MBps:
+            result.msg_size = round(result.bandwidth_MBps * 1024 * 1024 / result.msg_rate)
+    elif result.avg_latency_us is not None:
+        sent, received = result.valid_sent, result.valid_received
+        if result.reply_every is None and sent and received and received * 2 < sent:
+            result.reply_every = round(sent / received)
+        if result.test_type is None:
+            result.test_type = 'under-load' if (result.reply_every or 1) > 1 else 'ping-pong'
+    elif result.test_type is None:
+        result.test_type = 'error' if result.errors else 'unknown'
+
+    if result.msg_size is None and result.filename and result.test_type != 'throughput':
+        match = _SIZE_IN_NAME.search(Path(result.filename).stem)
+        if match:
+            result.msg_size = int(match.group(1))
+
+
+def parse_text(text, filename=None):
+    """Parse the full text of a sockperf output file"""
+    if '\x1b' in text:
+        text = _ANSI.sub('', text)
+    return _parse(text.splitlines(), SockperfResult(filename))
+
+
+def parse_lines(lines, filename=None):
+    """Parse an iterable of sockperf output lines (e.g. a growing file)"""
+    return _parse((_ANSI.sub('', line) for line in lines), SockperfResult(filename))
+
+
+def full_log_path(filename):
+    """Return the full log recorded alongside a summary file, if any.
+
+    A converted binary sample file (.sps) is preferred unless the CSV is newer.
+    """
+    csv = Path(filename).with_suffix('.csv')
+    binary = csv.with_suffix('.sps')
+    try:
+        binary_mtime = binary.stat().st_mtime_ns
+    except OSError:
+        return csv if csv.exists() else None
+    try:
+        return csv if csv.stat().st_mtime_ns > binary_mtime else binary
+    except OSError:
+        return binary
+
+
+def parse_sockperf_file(filename, use_full_log=True):
+    """Parse sockperf output file and extract key metrics.
+
+    If a --full-log CSV with the same name sits next to the file, its exact
+    statistics replace the printed summary.
+    """
+    with stage('parse-text', file=filename):
+        with open(filename, 'r', errors='replace') as f:
+            result = parse_text(f.read(), str(filename))
+
+    log_file = full_log_path(filename) if use_full_log else None
+    if log_file:
+        from .fulllog import full_log_stats
+        with stage('full-log', file=log_file):
+            result.update(full_log_stats(log_file))
+
+    return result
@@ -0,0 +1,507 @@
+"""
+Per-hop latency from packet captures taken at several taps.
+
+sockperf only measures 192.168.1.2 → 192.168.1.3 end to end, so the cost of
+one board has to be inferred by subtracting averages. With a capture at
+each tap along the path, the same datagram is timed at every tap:
+
+    tap 0 ──LAN9662-1──▶ tap 1 ──LAN9662-2──▶ tap 2
+
+Captures (pcap or pcapng, µs or ns timestamps) are memory-mapped and read
+as NumPy views of the file, without copying packets. Record boundaries are
+found in runs: the next records are assumed to have the size of the current
+one and all of them are checked at once. In a sockperf capture that holds
+for long stretches; a record of another size ends the run and the walk
+carries on from there. Ethernet (with VLAN tags), Linux cooked and raw IP
+frames are decoded for IPv4/IPv6 UDP to or from the sockperf port. The
+sequence number is read from the payload, by default in
+sockperf_tools.loopback's layout (u64 at byte 4, little-endian).
+
+Datagrams are matched across taps by (direction, sequence number); replies
+cross the hops in reverse. The taps must share a clock: one capture host,
+or PTP-synchronised capture cards.
+
+Each hop can be written out as a sockperf summary with a .sps full log, so
+the percentile, jitter, histogram, time-series and significance tools read
+it like any other run. A manifest names each hop as its own topology.
+
+Usage:
+    python -m sockperf_tools.pcap TAP0.pcapng TAP1.pcapng [TAP2 ...] [--names A,B,C] [-o hops] [--plot hops.png]
+"""
+
+import re
+from pathlib import Path
+
+from .overview import _draw_jitter
+from .render import Panel, render_dashboard
+from .timeseries import draw_latency_over_time
+
+DEFAULT_PORT = 11111  # loopback.DEFAULT_PORT, sockperf's default
+SEQ_OFFSET = 4
+SEQ_BYTES = 8
+# Records per decode batch and the longest run checked in one step
+BATCH = 1 << 16
+MANIFEST = 'hops.csv'
+VERSION = 'sockperf_tools-pcap'
+
+_PCAP_UNITS = {0xA1B2C3D4: 1000, 0xA1B23C4D: 1}  # ns per timestamp fraction: µs, ns
+_PCAPNG_SHB = 0x0A0D0D0A
+_PCAPNG_IDB = 0x00000001
+_PCAPNG_EPB = 0x00000006
+_BYTE_ORDER_MAGIC = 0x1A2B3C4D
+
+_ETHERNET, _RAW, _LINUX_SLL, _LINUX_SLL2 = 1, 101, 113, 276
+_RAW_LINKTYPES = (_RAW, 228, 229)  # raw IP, raw IPv4, raw IPv6
+_VLAN = (0x8100, 0x88A8)
+_IPV4, _IPV6 = 0x0800, 0x86DD
+_UDP = 17
+
+
+def _read(buf, pos, dtype):
+    """Values of dtype at byte offsets pos (clamped to the buffer; callers check frame lengths)"""
+    import numpy as np
+
+    dtype = np.dtype(dtype)
+    pos = np.minimum(pos, len(buf) - dtype.itemsize)
+    return buf[pos[:, None] + np.arange(dtype.itemsize)].view(dtype)[:, 0]
+
+
+def _scalar(buf, pos, dtype):
+    import numpy as np
+
+    return int(np.frombuffer(buf, dtype, 1, pos)[0])
+
+
+def _runs(buf, pos, end, stride, dtype, fields):
+    """Number of records of this stride from pos whose (offset, value) fields all hold"""
+    import numpy as np
+
+    count = min(BATCH, (end - pos) // stride)
+    same = np.ones(count, dtype=bool)
+    for offset, value in fields:
+        same &= np.ndarray((count,), dtype, buffer=buf, offset=pos + offset, strides=(stride,)) == value
+    return count if same.all() else max(int(same.argmin()), 1)
+
+
+def _pcap_records(buf, order, linktype, unit):
+    """Yield (data offset, captured length, timestamp ns, linktype) batches of a pcap file"""
+    import numpy as np
+
+    u32 = np.dtype(order + 'u4')
+    pos, end, pending = 24, len(buf), []
+    while pos + 16 <= end:
+        stride = 16 + _scalar(buf, pos + 8, u32)
+        if pos + stride > end:
+            break
+        count = _runs(buf, pos, end, stride, u32, [(8, stride - 16)])
+        pending.append(pos + stride * np.arange(count, dtype=np.int64))
+        pos += count * stride
+        if sum(map(len, pending)) >= BATCH:
+            yield _pcap_batch(buf, np.concatenate(pending), u32, linktype, unit)
+            pending = []
+    if pending:
+        yield _pcap_batch(buf, np.concatenate(pending), u32, linktype, unit)
+
+
+def _pcap_batch(buf, records, u32, linktype, unit):
+    import numpy as np
+
+    ts = _read(buf, records, u32).astype(np.int64) * 10 ** 9 + _read(buf, records + 4, u32).astype(np.int64) * unit
+    return records + 16, _read(buf, records + 8, u32).astype(np.int64), ts, np.full(len(records), linktype)
+
+
+def _ts_resolution(buf, pos, end, order):
+    """(linktype, if_tsresol byte) of an Interface Description Block"""
+    u16 = order + 'u2'
+    linktype, resolution = _scalar(buf, pos + 8, u16), 6
+    option = pos + 16
+    while option + 4 <= end:
+        code, length = _scalar(buf, option, u16), _scalar(buf, option + 2, u16)
+        if code == 0:
+            break
+        if code == 9 and length == 1:
+            resolution = buf[option + 4]
+        option += 4 + (length + 3) // 4 * 4
+    return linktype, int(resolution)
+
+
+def _to_ns(raw, resolution):
+    """Timestamps in units of an if_tsresol (10^-n, or 2^-n with the top bit set) as ns"""
+    if resolution & 0x80:
+        shift = resolution & 0x7F
+        return (raw >> shift) * 10 ** 9 + (((raw & ((1 << shift) - 1)) * 10 ** 9) >> shift)
+    if resolution <= 9:
+        return raw * 10 ** (9 - resolution)
+    return raw // 10 ** (resolution - 9)
+
+
+def _pcapng_records(buf):
+    """Yield (data offset, captured length, timestamp ns, linktype) batches of a pcapng file"""
+    import numpy as np
+
+    pos, end = 0, len(buf)
+    order, interfaces, base = '<', [], 0
+    pending = []
+    while pos + 12 <= end:
+        u32 = np.dtype(order + 'u4')
+        kind = _scalar(buf, pos, u32)
+        if kind == _PCAPNG_SHB:
+            if pending:
+                yield from _pcapng_batches(buf, np.concatenate(pending), u32, interfaces, base)
+                pending = []
+            order = '<' if _scalar(buf, pos + 8, '<u4') == _BYTE_ORDER_MAGIC else '>'
+            u32 = np.dtype(order + 'u4')
+            base = len(interfaces)  # interface ids restart in each section
+        length = _scalar(buf, pos + 4, u32)
+        if length < 12 or length % 4 or pos + length > end:
+            break
+        if kind == _PCAPNG_IDB:
+            interfaces.append(_ts_resolution(buf, pos, pos + length - 4, order))
+            count = 1
+        elif kind == _PCAPNG_EPB:
+            count = _runs(buf, pos, end, length, u32, [(0, _PCAPNG_EPB), (4, length)])
+            pending.append(pos + length * np.arange(count, dtype=np.int64))
+            if sum(map(len, pending)) >= BATCH:
+                yield from _pcapng_batches(buf, np.concatenate(pending), u32, interfaces, base)
+                pending = []
+        else:
+            count = 1
+        pos += count * length
+    if pending:
+        yield from _pcapng_batches(buf, np.concatenate(pending), u32, interfaces, base)
+
+
+def _pcapng_batches(buf, blocks, u32, interfaces, base):
+    import numpy as np
+
+    interface = _read(buf, blocks + 8, u32).astype(np.int64) + base
+    raw = (_read(buf, blocks + 12, u32).astype(np.int64) << 32) | _read(buf, blocks + 16, u32).astype(np.int64)
+    caplen = _read(buf, blocks + 20, u32).astype(np.int64)
+    for number in np.unique(interface):
+        linktype, resolution = interfaces[number] if number < len(interfaces) else (_ETHERNET, 6)
+        mask = interface == number
+        yield blocks[mask] + 28, caplen[mask], _to_ns(raw[mask], resolution), np.full(int(mask.sum()), linktype)
+
+
+def _records(buf):
+    """(data offset, captured length, timestamp ns, linktype) batches of a pcap or pcapng capture"""
+    magic = _scalar(buf, 0, '<u4')
+    if magic == _PCAPNG_SHB:
+        return _pcapng_records(buf)
+    for order in ('<', '>'):
+        magic = _scalar(buf, 0, order + 'u4')
+        if magic in _PCAP_UNITS:
+            return _pcap_records(buf, order, _scalar(buf, 20, order + 'u4') & 0xFFFF, _PCAP_UNITS[magic])
+    raise ValueError("not a pcap or pcapng capture")
+
+
+def _ip_header(buf, data, linktype):
+    """Offset of the IP header and its ethertype for a batch of frames of one link type"""
+    import numpy as np
+
+    if linktype == _ETHERNET:
+        ethertype = _read(buf, data + 12, '>u2').astype(np.int64)
+        l3 = data + 14
+        for _ in range(2):  # 802.1Q, or an 802.1ad outer tag and an inner one
+            tagged = np.isin(ethertype, _VLAN)
+            if not tagged.any():
+                break
+            ethertype = np.where(tagged, _read(buf, l3 + 2, '>u2'), ethertype)
+            l3 = np.where(tagged, l3 + 4, l3)
+        return l3, ethertype
+    if linktype == _LINUX_SLL:
+        return data + 16, _read(buf, data + 14, '>u2').astype(np.int64)
+    if linktype == _LINUX_SLL2:
+        return data + 20, _read(buf, data, '>u2').astype(np.int64)
+    if linktype in _RAW_LINKTYPES:
+        version = buf[np.minimum(data, len(buf) - 1)] >> 4
+        return data, np.where(version == 6, _IPV6, np.where(version == 4, _IPV4, 0))
+    return data, np.zeros(len(data), dtype=np.int64)
+
+
+def _decode(buf, data, caplen, ts, linktype, port, seq_offset, seq_bytes):
+    """(ts_ns, seq, direction, payload length, server IPv4) of the sockperf datagrams in a batch"""
+    import numpy as np
+
+    l3, ethertype = _ip_header(buf, data, linktype)
+    v4, v6 = ethertype == _IPV4, ethertype == _IPV6
+    first = buf[np.minimum(l3, len(buf) - 1)]
+    ihl = (first & 0x0F).astype(np.int64) * 4
+    protocol = np.where(v4, buf[np.minimum(l3 + 9, len(buf) - 1)], buf[np.minimum(l3 + 6, len(buf) - 1)])
+    unfragmented = (_read(buf, l3 + 6, '>u2') & 0x1FFF) == 0
+    l4 = np.where(v4, l3 + ihl, l3 + 40)
+    ok = (protocol == _UDP) & ((v4 & (ihl >= 20) & unfragmented) | v6)
+    seq_at = l4 + 8 + seq_offset
+    ok &= seq_at + seq_bytes <= data + caplen
+
+    source, destination = _read(buf, l4, '>u2'), _read(buf, l4 + 2, '>u2')
+    direction = np.where(destination == port, 0, np.where(source == port, 1, -1))
+    ok &= direction >= 0
+    seq = _read(buf, seq_at[ok], f'<u{seq_bytes}').astype(np.int64)
+    length = _read(buf, l4[ok] + 4, '>u2').astype(np.int64) - 8
+    forward = np.flatnonzero(v4[ok] & (direction[ok] == 0))
+    server = None
+    if len(forward):
+        server = '.'.join(str(b) for b in buf[l3[ok][forward[0]] + 16:l3[ok][forward[0]] + 20])
+    return ts[ok], seq, direction[ok].astype(np.int8), length, server
+
+
+def read_capture(filename, port=DEFAULT_PORT, seq_offset=SEQ_OFFSET, seq_bytes=SEQ_BYTES):
+    """sockperf datagrams of one capture.
+
+    Returns a dict with the per-datagram arrays 'ts_ns', 'seq', 'direction'
+    (0 towards the sockperf port, 1 back from it) and 'length' (UDP payload
+    bytes), plus 'packets' (records in the capture) and 'server' (the
+    IPv4 address the requests went to).
+    """
+    import mmap
+
+    import numpy as np
+
+    parts, packets, server = [], 0, None
+    with open(filename, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        buf = np.frombuffer(mapped, dtype=np.uint8)
+        for data, caplen, ts, linktypes in _records(buf):
+            packets += len(data)
+            decoded = _decode(buf, data, caplen, ts, int(linktypes[0]), port, seq_offset, seq_bytes)
+            server = server or decoded[4]
+            parts.append(decoded[:4])
+        del buf
+    columns = [np.concatenate(column) for column in zip(*parts)] or [np.empty(0, dtype=np.int64)] * 4
+    capture = dict(zip(('ts_ns', 'seq', 'direction', 'length'), columns))
+    capture.update(filename=str(filename), packets=packets, server=server)
+    return capture
+
+
+def _keyed(capture):
+    """Sorted unique (seq, direction) keys of a capture with the first time each was seen"""
+    import numpy as np
+
+    keys = capture['seq'] * 2 + capture['direction']
+    order = np.argsort(keys, kind='stable')
+    keys = keys[order]
+    first = np.r_[True, keys[1:] != keys[:-1]] if len(keys) else np.empty(0, dtype=bool)
+    return keys[first], capture['ts_ns'][order][first]
+
+
+def match_taps(captures, names=None):
+    """Per-hop latency between consecutive taps, and end to end with more than two.
+
+    captures are read_capture() dicts in path order. Each hop is a dict
+    with 'name', the matched datagrams' 'seq', 'direction' and 'ingress_ns'
+    (time it entered the hop) in ingress order, 'latency_ns', and 'entered'
+    and 'lost': datagrams seen entering the hop, and those never seen
+    leaving it.
+    """
+    import numpy as np
+
+    names = names or [f'tap {i}' for i in range(len(captures))]
+    keyed = [_keyed(capture) for capture in captures]
+    pairs = [(i, i + 1) for i in range(len(captures) - 1)]
+    if len(captures) > 2:
+        pairs.append((0, len(captures) - 1))
+    hops = []
+    for a, b in pairs:
+        (keys_a, ts_a), (keys_b, ts_b) = keyed[a], keyed[b]
+        where = np.minimum(np.searchsorted(keys_b, keys_a), max(len(keys_b) - 1, 0))
+        hit = keys_b[where] == keys_a if len(keys_b) else np.zeros(len(keys_a), dtype=bool)
+        keys, at_a, at_b = keys_a[hit], ts_a[hit], ts_b[where[hit]]
+        forward = (keys & 1) == 0
+        ingress = np.where(forward, at_a, at_b)
+        order = np.argsort(ingress, kind='stable')
+        # Forward datagrams enter at tap a, replies at tap b
+        entered = int(np.count_nonzero((keys_a & 1) == 0) + np.count_nonzero(keys_b & 1))
+        hops.append({
+            'name': f'{names[a]} → {names[b]}',
+            'taps': (a, b),
+            'seq': (keys >> 1)[order],
+            'direction': (keys & 1)[order].astype(np.int8),
+            'ingress_ns': ingress[order],
+            'latency_ns': np.where(forward, at_b - at_a, at_a - at_b)[order],
+            'entered': entered,
+            'lost': entered - len(keys),
+        })
+    return hops
+
+
+def hop_latencies(hop, direction=0):
+    """(seq, ingress_ns, latency_us) of one direction of a hop (0 requests, 1 replies)"""
+    mask = hop['direction'] == direction
+    return hop['seq'][mask], hop['ingress_ns'][mask], hop['latency_ns'][mask] * 1e-3
+
+
+def hop_stats(hop, direction=0):
+    """latency_stats() of one direction of a hop, with delay variation"""
+    from .fulllog import latency_stats
+
+    seq, _, latency = hop_latencies(hop, direction)
+    return latency_stats(latency, jitter=True, seq=seq)
+
+
+def _slug(name):
+    return re.sub(r'[^A-Za-z0-9]+', '-', name).strip('-').lower() or 'hop'
+
+
+def export_hops(hops, directory, direction=0, port=DEFAULT_PORT, server=None, msg_size=None):
+    """Write each hop as a sockperf summary and .sps full log; returns the manifest path.
+
+    The .sps rows hold the hop latency as a round trip of twice its length,
+    since every full-log reader halves rx - tx. The manifest (hops.csv)
+    gives each hop its own topology, so batch.parse_files() keeps them apart.
+    """
+    import csv
+
+    import numpy as np
+
+    from .fulllog import latency_stats
+    from .loopback import Outcome, format_summary
+    from .samples import SUFFIX, write_samples
+
+    directory = Path(directory)
+    rows = []
+    for hop in hops:
+        seq, ingress, latency = hop_latencies(hop, direction)
+        name = hop['name'] + (' (replies)' if direction else '')
+        stem = directory / _slug(name) / 'sockperf_pingpong_udp'
+        stem.parent.mkdir(parents=True, exist_ok=True)
+        span = (ingress[-1] - ingress[0]) / 1e9 if len(ingress) else 0.0
+        size = f' --msg-size={msg_size}' if msg_size else ''
+        parameters = f'pp -i {server or "0.0.0.0"} -p {port}{size} -t {span:g}'
+
+        outcome = Outcome()
+        outcome.sent = outcome.valid_sent = len(seq) + hop['lost']
+        outcome.received = outcome.valid_received = len(seq)
+        outcome.dropped = hop['lost']
+        outcome.run_time_sec = outcome.valid_run_time_sec = span
+        stats = latency_stats(latency.copy())
+        stem.with_suffix('.txt').write_text(format_summary(
+            'ping-pong', 'udp', server or '0.0.0.0', port, parameters, outcome, 0, 'pcap', msg_size,
+            stats=stats, version=VERSION))
+        rtt_ns = np.round(latency * 2e3).astype(np.int64)
+        write_samples(stem.with_suffix(SUFFIX), seq, ingress, ingress + rtt_ns, parameters, source=name)
+        rows.append({'path': str(stem.with_suffix('.txt').relative_to(directory)), 'topology': name})
+
+    manifest = directory / MANIFEST
+    with open(manifest, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=['path', 'topology'])
+        writer.writeheader()
+        writer.writerows(rows)
+    return manifest
+
+
+def load_hops(manifest, jobs=1, cache=None):
+    """{hop name: parsed run} of an export_hops() manifest, in hop order"""
+    from .batch import parse_files, read_manifest
+
+    return {result.topology: result for result in parse_files(read_manifest(manifest), jobs, cache)}
+
+
+def _draw_hop_percentiles(ax, runs):
+    """Latency percentiles of each hop"""
+    for label, result in runs.items():
+        pcts = sorted(result['percentiles'])
+        ax.plot(pcts, [result['percentiles'][p] for p in pcts], marker='o', linewidth=2, label=label)
+    ax.set_xlabel('Percentile', fontsize=11, fontweight='bold')
+    ax.set_ylabel('Latency (μs)', fontsize=11, fontweight='bold')
+    ax.set_title('Per-Hop Percentile Distribution', fontsize=12, fontweight='bold')
+    ax.legend(fontsize=8)
+    ax.grid(True, alpha=0.3)
+
+
+def _draw_hop_budget(ax, runs):
+    """Average, p99 and p99.9 latency of each hop side by side"""
+    import numpy as np
+
+    labels = list(runs)
+    x = np.arange(len(labels))
+    width = 0.27
+    for i, (name, value) in enumerate((('avg', lambda r: r['avg_latency_us']),
+                                       ('p99', lambda r: r['percentiles'][99.0]),
+                                       ('p99.9', lambda r: r['percentiles'][99.9]))):
+        ax.bar(x + (i - 1) * width, [value(runs[label]) for label in labels], width, label=name)
+    ax.set_xticks(x)
+    ax.set_xticklabels(labels, rotation=15, ha='right', fontsize=9)
+    ax.set_ylabel('Latency (μs)', fontsize=11, fontweight='bold')
+    ax.set_title('Latency Budget by Hop', fontsize=12, fontweight='bold')
+    ax.legend()
+    ax.grid(True, alpha=0.3, axis='y')
+
+
+PANELS = (
+    Panel(_draw_hop_percentiles),
+    Panel(_draw_jitter),
+    Panel(_draw_hop_budget),
+    Panel(draw_latency_over_time),
+)
+
+
+def render_hops(runs, output, dpi=300, fmt=None, jobs=None, cache_dir=None):
+    """Render the per-hop dashboard for {hop name: parsed run}"""
+    title = 'LAN9662 Per-Hop Latency (packet captures)\n' + ' | '.join(runs)
+    drawn, reused = render_dashboard(PANELS, (runs,), (2, 2), (16, 11), title, output, dpi, fmt, jobs, cache_dir)
+    print(f"\n✓ Per-hop visualization saved as {output} ({drawn} panels drawn, {reused} reused)")
+
+
+def print_hops(captures, hops, direction=0):
+    """Console report: packets per capture, then each hop's loss and latency"""
+    for capture in captures:
+        print(f"  {capture['filename']}: {capture['packets']:,} packets, {len(capture['seq']):,} sockperf datagrams")
+    print(f"\n{'Hop':<28} {'matched':>10} {'lost':>8} {'avg':>9} {'p50':>9} {'p99':>9} {'p99.9':>9} "
+          f"{'max':>9} {'IPDV p99':>9}  (μs)")
+    for hop in hops:
+        stats = hop_stats(hop, direction)
+        if not stats:
+            print(f"{hop['name']:<28} {0:>10} {hop['lost']:>8,}")
+            continue
+        pct = stats['percentiles']
+        ipdv = stats.get('delay_variation', {}).get('ipdv_p99_us', float('nan'))
+        print(f"{hop['name']:<28} {stats['total_observations']:>10,} {hop['lost']:>8,} "
+              f"{stats['avg_latency_us']:>9.3f} {pct[50.0]:>9.3f} {pct[99.0]:>9.3f} {pct[99.9]:>9.3f} "
+              f"{stats['max_latency_us']:>9.3f} {ipdv:>9.3f}")
+
+
+def main(argv=None):
+    import argparse
+    import time
+
+    import numpy as np
+
+    ap = argparse.ArgumentParser(description="Per-hop latency from captures taken at several taps")
+    ap.add_argument('captures', nargs='+', help="pcap/pcapng files in path order (at least two)")
+    ap.add_argument('--names', help="comma-separated tap names (default: tap 0, tap 1, ...)")
+    ap.add_argument('-p', '--port', type=int, default=DEFAULT_PORT, help="sockperf server port")
+    ap.add_argument('--seq-offset', type=int, default=SEQ_OFFSET, help="byte offset of the sequence number")
+    ap.add_argument('--seq-bytes', type=int, choices=[2, 4, 8], default=SEQ_BYTES)
+    ap.add_argument('--replies', action='store_true', help="report the reply direction instead of requests")
+    ap.add_argument('-o', '--output', help="write each hop as a sockperf run under this directory")
+    ap.add_argument('--plot', help="per-hop dashboard image (needs --output)")
+    ap.add_argument('--dpi', type=int, default=150)
+    args = ap.parse_args(argv)
+    if len(args.captures) < 2:
+        ap.error("need captures from at least two taps")
+    names = args.names.split(',') if args.names else None
+    if names and len(names) != len(args.captures):
+        ap.error("--names needs one name per capture")
+
+    captures = []
+    for filename in args.captures:
+        start = time.perf_counter()
+        captures.append(read_capture(filename, args.port, args.seq_offset, args.seq_bytes))
+        elapsed = time.perf_counter() - start
+        print(f"✓ Read {filename} ({captures[-1]['packets'] / max(elapsed, 1e-9) / 1e6:.1f} M packets/s)")
+    hops = match_taps(captures, names)
+    direction = 1 if args.replies else 0
+    print_hops(captures, hops, direction)
+
+    if args.output:
+        lengths = np.concatenate([capture['length'] for capture in captures])
+        msg_size = int(np.bincount(lengths).argmax()) if len(lengths) else None
+        server = next((capture['server'] for capture in captures if capture['server']), None)
+        manifest = export_hops(hops, args.output, direction, args.port, server, msg_size)
+        print(f"\n✓ Hops written as sockperf runs, listed in {manifest}")
+        if args.plot:
+            render_hops(load_hops(manifest), args.plot, dpi=args.dpi)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,429 @@
+"""
+Playback schedules for ``sockperf playback --data-file`` and their analysis.
+
+sockperf's playback test sends the messages listed in a CSV data file, one
+"<seconds>, <message size>" row per message, at the listed times. This
+module writes such timelines and splits the results by time slice and by
+message size.
+
+Schedules are generated as whole arrays and formatted by digit arithmetic
+into one byte buffer per million rows, so a 10^7-row file takes seconds:
+
+    periodic  TSN-like: a fixed set of streams sent back to back at the start
+              of every cycle (--cycle-us), each stream with its own size
+    bursty    bursts of --burst back-to-back messages, spaced for --rate (a
+              burst of large messages that overruns delays the next one)
+    poisson   exponential gaps with mean 1 / --rate
+    mixed     half the rate as periodic streams, half as Poisson traffic,
+              queued on the wire where the two overlap
+
+Sizes are drawn from --sizes (with --weights) for every shape. Back-to-back
+means spaced by the message's wire time at 1 Gbit/s.
+
+The analysis reads a playback run's full log against its data file: row n
+of the file is sequence number n (plus --seq-base). Per time slice it gives
+the scheduled load next to the replied rate and the latency (through
+timeseries.bin_series); per message size, merged latency histograms.
+
+Usage:
+    python -m sockperf_tools.playback generate playback.csv --shape bursty --rows 10000000 --rate 50000 \\
+        --sizes 64,512,1472 --weights 6,3,1
+    python -m sockperf_tools.playback analyze sockperf_playback_udp.csv --data-file playback.csv [--slice 0.1]
+"""
+
+SHAPES = ('periodic', 'bursty', 'poisson', 'mixed')
+DEFAULT_RATE = 10_000
+DEFAULT_SIZES = (64,)
+DEFAULT_BURST = 32
+DEFAULT_CYCLE_US = 1000
+MIN_SIZE, MAX_SIZE = 14, 65507  # sockperf's header, largest UDP payload
+LINE_RATE_BPS = 1e9
+# UDP, IPv4 and Ethernet headers, FCS, preamble and inter-frame gap
+FRAME_OVERHEAD = 8 + 20 + 14 + 4 + 8 + 12
+ROWS_PER_WRITE = 1 << 20
+# More distinct sizes than this are grouped into SIZE_BINS ranges
+MAX_SIZE_GROUPS = 16
+SIZE_BINS = (MIN_SIZE, 128, 256, 512, 1024, 1473, 9000)
+
+
+def wire_ns(sizes):
+    """Time a message of each size occupies the wire at LINE_RATE_BPS, in ns"""
+    import numpy as np
+
+    return np.ceil((np.asarray(sizes, dtype=np.int64) + FRAME_OVERHEAD) * 8e9 / LINE_RATE_BPS).astype(np.int64)
+
+
+def _draw_sizes(rng, n, sizes, weights):
+    import numpy as np
+
+    sizes = np.asarray(sizes, dtype=np.int32)
+    if len(sizes) == 1:
+        return np.full(n, sizes[0], dtype=np.int32)
+    p = None if weights is None else np.asarray(weights, dtype=np.float64) / np.sum(weights)
+    return rng.choice(sizes, n, p=p)
+
+
+def _periodic(rng, rows, rate, sizes, weights, cycle_us):
+    import numpy as np
+
+    cycle_ns = int(cycle_us * 1000)
+    streams = max(int(round(rate * cycle_us * 1e-6)), 1)
+    stream_sizes = _draw_sizes(rng, streams, sizes, weights)
+    offsets = np.r_[0, np.cumsum(wire_ns(stream_sizes))[:-1]]
+    if offsets[-1] + wire_ns(stream_sizes[-1:])[0] > cycle_ns:
+        raise ValueError(f"{streams} streams do not fit in a {cycle_us:g} µs cycle at line rate")
+    cycles = -(-rows // streams)
+    times = (np.arange(cycles, dtype=np.int64)[:, None] * cycle_ns + offsets).ravel()[:rows]
+    return times, np.tile(stream_sizes, cycles)[:rows]
+
+
+def _on_wire(release, message_sizes):
+    """Send times of messages released in order: each leaves at its release or once the one before is on the wire"""
+    import numpy as np
+
+    gaps = wire_ns(message_sizes)
+    sent = np.cumsum(gaps) - gaps
+    return sent + np.maximum.accumulate(release - sent)
+
+
+def _bursty(rng, rows, rate, sizes, weights, burst):
+    import numpy as np
+
+    message_sizes = _draw_sizes(rng, rows, sizes, weights)
+    if wire_ns(message_sizes).mean() * rate > 1e9:
+        raise ValueError(f"{rate:g} msg/s of these sizes exceeds line rate")
+    release = np.arange(rows, dtype=np.int64) // burst * int(round(burst * 1e9 / rate))
+    return _on_wire(release, message_sizes), message_sizes
+
+
+def _poisson(rng, rows, rate, sizes, weights):
+    import numpy as np
+
+    gaps = rng.exponential(1e9 / rate, rows)
+    gaps[0] = 0.0
+    return np.cumsum(gaps).astype(np.int64), _draw_sizes(rng, rows, sizes, weights)
+
+
+def generate(shape, rows, rate=DEFAULT_RATE, sizes=DEFAULT_SIZES, weights=None, burst=DEFAULT_BURST,
+             cycle_us=DEFAULT_CYCLE_US, seed=None):
+    """(times_ns from 0, sizes) of a playback schedule of rows messages at about rate msg/s"""
+    import numpy as np
+
+    if shape not in SHAPES:
+        raise ValueError(f"unknown shape {shape!r} (one of {', '.join(SHAPES)})")
+    if min(sizes) < MIN_SIZE or max(sizes) > MAX_SIZE:
+        raise ValueError(f"message sizes must be between {MIN_SIZE} and {MAX_SIZE} bytes")
+    rng = np.random.default_rng(seed)
+    if shape == 'periodic':
+        return _periodic(rng, rows, rate, sizes, weights, cycle_us)
+    if shape == 'bursty':
+        return _bursty(rng, rows, rate, sizes, weights, burst)
+    if shape == 'poisson':
+        return _poisson(rng, rows, rate, sizes, weights)
+
+    periodic = _periodic(rng, rows, rate / 2, sizes, weights, cycle_us)
+    background = _poisson(rng, rows, rate / 2, sizes, weights)
+    times = np.concatenate([periodic[0], background[0]])
+    order = np.argsort(times, kind='stable')[:rows]
+    message_sizes = np.concatenate([periodic[1], background[1]])[order]
+    # Both streams start at 0 and Poisson gaps can be shorter than a frame: queue the merge on the wire
+    return _on_wire(times[order], message_sizes), message_sizes
+
+
+def _digits(out, values, start, width, pad):
+    """Write values right-aligned into columns start..start+width of a byte matrix"""
+    import numpy as np
+
+    values = values.copy()
+    for column in range(start + width - 1, start - 1, -1):
+        digit = (values % 10).astype(np.uint8) + ord('0')
+        if pad != ord('0') and column != start + width - 1:
+            digit[values == 0] = pad
+        out[:, column] = digit
+        values //= 10
+
+
+def format_rows(times_ns, sizes, sec_width=None, size_width=None):
+    """Schedule rows as "<sec>.<9 decimals>, <size>" lines of one fixed width.
+
+    Seconds are zero-padded and sizes space-padded to sec_width and
+    size_width digits (default: the widest value).
+    """
+    import numpy as np
+
+    n = len(times_ns)
+    seconds, nanoseconds = np.divmod(times_ns, 10 ** 9)
+    sec_width = sec_width or (len(str(int(seconds.max()))) if n else 1)
+    size_width = size_width or (len(str(int(np.max(sizes)))) if n else 1)
+    out = np.empty((n, sec_width + 13 + size_width), dtype=np.uint8)
+    _digits(out, seconds, 0, sec_width, ord('0'))
+    out[:, sec_width] = ord('.')
+    _digits(out, nanoseconds, sec_width + 1, 9, ord('0'))
+    out[:, sec_width + 10] = ord(',')
+    out[:, sec_width + 11] = ord(' ')
+    _digits(out, np.asarray(sizes), sec_width + 12, size_width, ord(' '))
+    out[:, -1] = ord('\n')
+    return out.tobytes()
+
+
+def write_schedule(path, times_ns, sizes):
+    """Write a playback data file; returns its size in bytes"""
+    import numpy as np
+
+    sec_width = len(str(int(times_ns[-1] // 10 ** 9))) if len(times_ns) else 1
+    size_width = len(str(int(np.max(sizes)))) if len(sizes) else 1
+    written = 0
+    with open(path, 'wb') as f:
+        for lo in range(0, len(times_ns), ROWS_PER_WRITE):
+            hi = lo + ROWS_PER_WRITE
+            written += f.write(format_rows(times_ns[lo:hi], sizes[lo:hi], sec_width, size_width))
+    return written
+
+
+def read_schedule(path, chunk_bytes=None):
+    """(times_ns, sizes) of a playback data file; comment and header lines are skipped"""
+    import numpy as np
+
+    from .fulllog import CHUNK_BYTES, _data_lines
+
+    times, sizes = [], []
+    with open(path, 'rb') as f:
+        tail = b''
+        while True:
+            data = f.read(chunk_bytes or CHUNK_BYTES)
+            block = tail + data
+            cut = len(block) if not data else block.rfind(b'\n') + 1
+            block, tail = block[:cut], block[cut:]
+            block = _data_lines(block)
+            values = np.fromstring(block.replace(b',', b' '), dtype=np.float64, sep=' ') if block.strip() \
+                else np.empty(0)
+            rows = values.reshape(-1, 2)
+            times.append(np.round(rows[:, 0] * 1e9).astype(np.int64))
+            sizes.append(rows[:, 1].astype(np.int32))
+            if not data:
+                break
+    return np.concatenate(times), np.concatenate(sizes)
+
+
+def size_groups(sizes):
+    """(group index of every row, group labels): each size on its own, or SIZE_BINS ranges"""
+    import numpy as np
+
+    distinct = np.unique(sizes)
+    if len(distinct) <= MAX_SIZE_GROUPS:
+        return np.searchsorted(distinct, sizes).astype(np.uint8), [f'{size}B' for size in distinct]
+    bounds = np.asarray(SIZE_BINS)
+    group = np.clip(np.searchsorted(bounds, sizes, side='right') - 1, 0, len(bounds) - 1)
+    labels = [f'{lo}-{hi - 1}B' for lo, hi in zip(bounds, bounds[1:])] + [f'{bounds[-1]}B+']
+    used = np.unique(group)
+    return np.searchsorted(used, group).astype(np.uint8), [labels[i] for i in used]
+
+
+def analyze_playback(log_file, schedule_file, slice_s=None, seq_base=0, chunk_bytes=None):
+    """Per-slice load and latency and per-size latency of a playback run.
+
+    Returns {'rows', 'duration_s', 'offered_rate', 'offered_mbps' (whole
+    schedule), 'records', 'unmatched' (log rows outside the schedule),
+    'slices': {'window_s', 'time_s', 'offered_rate', 'offered_mbps',
+    'replied_rate', 'p50_us', 'p99_us', 'max_us'}, 'sizes': {'label',
+    'scheduled', 'count', 'avg_us', 'p50_us', 'p99_us', 'max_us'}}.
+    """
+    import numpy as np
+
+    from .fulllog import CHUNK_BYTES, iter_full_log
+    from .histogram import LatencyHistogram
+    from .timeseries import bin_series
+
+    times, sizes = read_schedule(schedule_file)
+    group_of, labels = size_groups(sizes)
+    histograms = [LatencyHistogram() for _ in labels]
+    records = unmatched = 0
+    anchor = None
+    for seq, tx, rx in iter_full_log(log_file, chunk_bytes or CHUNK_BYTES):
+        records += len(seq)
+        row = seq - seq_base
+        matched = (row >= 0) & (row < len(times))
+        unmatched += len(seq) - int(np.count_nonzero(matched))
+        row, latencies = row[matched], (rx[matched] - tx[matched]) * 0.5e-3
+        if anchor is None and len(row):
+            anchor = int(tx[matched][0]) - int(times[row[0]])  # schedule time 0 on the log's clock
+        groups = group_of[row]
+        order = np.argsort(groups, kind='stable')
+        bounds = np.searchsorted(groups[order], np.arange(len(labels) + 1))
+        for g, histogram in enumerate(histograms):
+            histogram.record(latencies[order[bounds[g]:bounds[g + 1]]])
+
+    duration = (times[-1] - times[0]) / 1e9 if len(times) > 1 else 0.0
+    analysis = {
+        'rows': len(times),
+        'duration_s': duration,
+        'offered_rate': len(times) / duration if duration else 0.0,
+        'offered_mbps': sizes.sum() * 8 / duration / 1e6 if duration else 0.0,
+        'records': records,
+        'unmatched': unmatched,
+    }
+    stats = [histogram.stats([50.0, 99.0]) for histogram in histograms]
+    analysis['sizes'] = {
+        'label': labels,
+        'scheduled': np.bincount(group_of, minlength=len(labels)),
+        'count': np.array([histogram.count for histogram in histograms]),
+        'avg_us': np.array([s.get('avg_latency_us', np.nan) for s in stats]),
+        'p50_us': np.array([s['percentiles'][50.0] if s else np.nan for s in stats]),
+        'p99_us': np.array([s['percentiles'][99.0] if s else np.nan for s in stats]),
+        'max_us': np.array([s.get('max_latency_us', np.nan) for s in stats]),
+    }
+
+    series = bin_series(log_file, slice_s, chunk_bytes=chunk_bytes)
+    if series is None or anchor is None:
+        analysis['slices'] = None
+        return analysis
+    window_ns = int(round(series['window_s'] * 1e9))
+    slot = (times + anchor - series['start_ns']) // window_ns
+    inside = (slot >= 0) & (slot < len(series['count']))
+    offered = np.bincount(slot[inside], minlength=len(series['count']))
+    offered_bytes = np.bincount(slot[inside], weights=sizes[inside], minlength=len(series['count']))
+    analysis['slices'] = {
+        'window_s': series['window_s'],
+        'time_s': series['time_s'],
+        'offered_rate': offered / series['window_s'],
+        'offered_mbps': offered_bytes * 8 / series['window_s'] / 1e6,
+        'replied_rate': series['msg_rate'],
+        'p50_us': series['p50_us'],
+        'p99_us': series['p99_us'],
+        'max_us': series['max_us'],
+    }
+    return analysis
+
+
+def _plain(analysis):
+    """The analysis with arrays as lists, so dashboard tiles fingerprint every value"""
+    if isinstance(analysis, dict):
+        return {key: _plain(value) for key, value in analysis.items()}
+    return analysis.tolist() if hasattr(analysis, 'tolist') else analysis
+
+
+def _draw_load(ax, analysis):
+    """Scheduled load against replied rate per time slice"""
+    slices = analysis['slices']
+    ax.plot(slices['time_s'], slices['offered_rate'], color='#3498db', linewidth=1.2, label='scheduled msgs/s')
+    ax.plot(slices['time_s'], slices['replied_rate'], color='#e74c3c', linewidth=1.2, label='replies/s')
+    ax.set_xlabel('Time (s)', fontsize=11)
+    ax.set_ylabel('Messages/s', fontsize=11, fontweight='bold')
+    twin = ax.twinx()
+    twin.plot(slices['time_s'], slices['offered_mbps'], color='#95a5a6', linewidth=0.8, label='scheduled Mbit/s')
+    twin.set_ylabel('Mbit/s', fontsize=11)
+    ax.set_title(f"Scheduled and Replied Load, {slices['window_s'] * 1000:g} ms slices", fontsize=12, fontweight='bold')
+    ax.legend(loc='upper left', fontsize=8)
+    twin.legend(loc='upper right', fontsize=8)
+    ax.grid(alpha=0.3)
+
+
+def _draw_slice_latency(ax, analysis):
+    """p50, p99 and max latency of the replies in each time slice"""
+    slices = analysis['slices']
+    for key, style in (('p50_us', '-'), ('p99_us', '-'), ('max_us', ':')):
+        ax.plot(slices['time_s'], slices[key], linestyle=style, linewidth=1.2, label=key[:-3])
+    ax.set_xlabel('Time (s)', fontsize=11)
+    ax.set_ylabel('Latency (μs)', fontsize=11, fontweight='bold')
+    ax.set_title('Latency per Time Slice', fontsize=12, fontweight='bold')
+    ax.legend(fontsize=8)
+    ax.grid(alpha=0.3)
+
+
+def _draw_size_latency(ax, analysis):
+    """p50, p99 and max latency by message size"""
+    import numpy as np
+
+    sizes = analysis['sizes']
+    x = np.arange(len(sizes['label']))
+    width = 0.27
+    for i, key in enumerate(('p50_us', 'p99_us', 'max_us')):
+        ax.bar(x + (i - 1) * width, sizes[key], width, label=key[:-3])
+    ax.set_xticks(x)
+    ax.set_xticklabels([f"{label}\n{count:,}" for label, count in zip(sizes['label'], sizes['count'])], fontsize=9)
+    ax.set_ylabel('Latency (μs)', fontsize=11, fontweight='bold')
+    ax.set_title('Latency by Message Size (replies)', fontsize=12, fontweight='bold')
+    ax.legend(fontsize=8)
+    ax.grid(alpha=0.3, axis='y')
+
+
+def render_playback(analysis, output, title, dpi=300, fmt=None, jobs=None, cache_dir=None):
+    """Render the per-slice and per-size playback dashboard"""
+    from .render import Panel, render_dashboard
+
+    panels = [Panel(_draw_size_latency)]
+    if analysis['slices']:
+        panels = [Panel(_draw_load), Panel(_draw_slice_latency)] + panels
+    drawn, reused = render_dashboard(panels, (_plain(analysis),), (1, len(panels)), (6 * len(panels), 6), title,
+                                     output, dpi, fmt, jobs, cache_dir)
+    print(f"\n✓ Playback visualization saved as {output} ({drawn} panels drawn, {reused} reused)")
+
+
+def print_playback(analysis):
+    print(f"  Schedule: {analysis['rows']:,} messages over {analysis['duration_s']:.3f} s "
+          f"({analysis['offered_rate']:,.0f} msg/s, {analysis['offered_mbps']:,.1f} Mbit/s)")
+    print(f"  Logged replies: {analysis['records']:,}"
+          + (f" ({analysis['unmatched']:,} outside the schedule)" if analysis['unmatched'] else ''))
+    sizes = analysis['sizes']
+    print(f"\n  {'Size':<12} {'scheduled':>11} {'replies':>9} {'avg':>9} {'p50':>9} {'p99':>9} {'max':>9}  (μs)")
+    for i, label in enumerate(sizes['label']):
+        print(f"  {label:<12} {sizes['scheduled'][i]:>11,} {sizes['count'][i]:>9,} {sizes['avg_us'][i]:>9.3f} "
+              f"{sizes['p50_us'][i]:>9.3f} {sizes['p99_us'][i]:>9.3f} {sizes['max_us'][i]:>9.3f}")
+    slices = analysis['slices']
+    if slices:
+        import numpy as np
+
+        worst = np.argsort(np.nan_to_num(slices['p99_us'], nan=-1.0))[::-1][:5]
+        print(f"\n  Worst {slices['window_s'] * 1000:g} ms slices by p99:")
+        for i in sorted(worst):
+            print(f"    t={slices['time_s'][i]:9.3f} s  scheduled {slices['offered_rate'][i]:>10,.0f} msg/s  "
+                  f"replies {slices['replied_rate'][i]:>8,.0f} msg/s  p99 {slices['p99_us'][i]:8.3f}  "
+                  f"max {slices['max_us'][i]:8.3f} μs")
+
+
+def main(argv=None):
+    import argparse
+    import time
+    from pathlib import Path
+
+    ap = argparse.ArgumentParser(description="Generate and analyse sockperf playback schedules")
+    sub = ap.add_subparsers(dest='command', required=True)
+    p = sub.add_parser('generate', help="write a playback data file")
+    p.add_argument('output')
+    p.add_argument('--shape', choices=SHAPES, default='periodic')
+    p.add_argument('--rows', type=int, default=100_000)
+    p.add_argument('--rate', type=float, default=DEFAULT_RATE, help="average messages/s")
+    p.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)), help="comma-separated message sizes")
+    p.add_argument('--weights', help="comma-separated relative frequency of each size")
+    p.add_argument('--burst', type=int, default=DEFAULT_BURST, help="messages per burst (bursty)")
+    p.add_argument('--cycle-us', type=float, default=DEFAULT_CYCLE_US, help="cycle time (periodic, mixed)")
+    p.add_argument('--seed', type=int)
+    p = sub.add_parser('analyze', help="per-slice and per-size results of a playback run")
+    p.add_argument('log', help="the run's full log (.csv or .sps)")
+    p.add_argument('--data-file', required=True, help="the playback data file the run sent")
+    p.add_argument('--slice', type=float, help="time slice in seconds (default: about 300 slices)")
+    p.add_argument('--seq-base', type=int, default=0, help="sequence number of the file's first row")
+    p.add_argument('-o', '--output', help="dashboard image")
+    p.add_argument('--dpi', type=int, default=150)
+    args = ap.parse_args(argv)
+
+    if args.command == 'generate':
+        sizes = [int(size) for size in args.sizes.split(',')]
+        weights = [float(w) for w in args.weights.split(',')] if args.weights else None
+        start = time.perf_counter()
+        times, message_sizes = generate(args.shape, args.rows, args.rate, sizes, weights, args.burst,
+                                        args.cycle_us, args.seed)
+        size = write_schedule(args.output, times, message_sizes)
+        print(f"✓ {args.shape} schedule of {len(times):,} messages over {times[-1] / 1e9:.3f} s written to "
+              f"{args.output} ({size / 1e6:,.1f} MB, {time.perf_counter() - start:.1f} s)")
+        return
+
+    analysis = analyze_playback(args.log, args.data_file, args.slice, args.seq_base)
+    print(f"\n{args.log} against {args.data_file}:")
+    print_playback(analysis)
+    if args.output:
+        render_playback(analysis, args.output, f'sockperf Playback: {Path(args.data_file).name}', dpi=args.dpi)
+
+
+if __name__ == '__main__':
+    main()
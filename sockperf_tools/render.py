@@ -0,0 +1,195 @@
+"""
+Incremental, parallel rendering of the dashboard figures.
+
+A dashboard is a grid of panels. Every panel is drawn on its own tile and
+cached under a fingerprint of the module defining its drawing code, the
+results it reads, the tile size and dpi, and RENDER_VERSION. Re-rendering a dashboard only redraws panels whose inputs
+changed, and stale panels are drawn on a process pool. The tiles are then
+stitched into the final image. Adding one new run costs only the panels
+that show that run, plus the stitch.
+
+Tiles live in the parse cache directory (``panels/``), so they share its size
+limit and LRU eviction. Set SOCKPERF_CACHE=0 to redraw every panel.
+"""
+
+import functools
+import hashlib
+import io
+import json
+import os
+from pathlib import Path
+
+from .instrument import stage
+
+TITLE_HEIGHT = 0.9  # inches
+
+# Bump when tiles change in ways the panel module sources do not show
+# (e.g. shared styling or how tiles are encoded)
+RENDER_VERSION = 1
+
+
+def pyplot():
+    """Import pyplot on first use, defaulting to the non-interactive Agg backend"""
+    import matplotlib
+    if 'MPLBACKEND' not in os.environ:
+        matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    return plt
+
+
+class Panel:
+    """One tile of a dashboard.
+
+    draw(ax, *inputs) draws it. select(*groups) returns the inputs it
+    needs, as a tuple with one entry per group. Only the selected inputs are
+    fingerprinted and sent to workers, so a panel that shows only the
+    throughput run is not redrawn when a ping-pong run changes.
+    """
+
+    __slots__ = ('draw', 'select')
+
+    def __init__(self, draw, select=None):
+        self.draw = draw
+        self.select = select or (lambda *groups: groups)
+
+
+def pick(results, wanted):
+    """Sub-dict of {label: result} with the labels for which wanted(label, result) is true"""
+    return {label: result for label, result in results.items() if wanted(label, result)}
+
+
+def _jsonable(value):
+    """JSON form of a result for fingerprinting; where the file lives does not affect the plot"""
+    if hasattr(value, 'as_dict'):
+        return {k: v for k, v in value.as_dict().items() if k not in ('filename', 'run_date')}
+    return str(value)
+
+
+@functools.lru_cache(maxsize=None)
+def _module_source(name):
+    """Source of a panel module: helpers and constants a draw function uses live there too"""
+    import inspect
+    import sys
+
+    return inspect.getsource(sys.modules[name])
+
+
+def _fingerprint(draw, inputs, size, dpi):
+    import matplotlib
+
+    hasher = hashlib.sha256(f"{RENDER_VERSION}:{matplotlib.__version__}:{size}:{dpi}".encode())
+    hasher.update(f"{draw.__module__}.{draw.__qualname__}".encode())
+    hasher.update(_module_source(draw.__module__).encode())
+    hasher.update(json.dumps(inputs, default=_jsonable).encode())
+    return hasher.hexdigest()
+
+
+def _draw_title(ax, title):
+    ax.axis('off')
+    ax.text(0.5, 0.5, title, ha='center', va='center', fontsize=14, fontweight='bold')
+
+
+def _render_tile(args):
+    """Draw one panel and return it as PNG bytes (runs in a worker process)"""
+    draw, inputs, size, dpi = args
+    with stage('panel', panel=draw.__name__.lstrip('_')):
+        plt = pyplot()
+        fig = plt.figure(figsize=size)
+        with stage('draw'):
+            draw(fig.add_subplot(), *inputs)
+        if draw is not _draw_title:
+            with stage('tight_layout'):
+                fig.tight_layout()
+        buf = io.BytesIO()
+        with stage('savefig', dpi=dpi):
+            fig.savefig(buf, format='png', dpi=dpi)
+        plt.close(fig)
+        return buf.getvalue()
+
+
+def _stitch(tiles, shape):
+    """Join decoded tiles (title first) into one uint8 RGBA array"""
+    import numpy as np
+    from PIL import Image
+
+    images = [np.asarray(Image.open(io.BytesIO(png)).convert('RGBA')) for png in tiles]
+    title, panels = images[0], images[1:]
+    rows, cols = shape
+    height = max(image.shape[0] for image in panels)
+    width = max(image.shape[1] for image in panels)
+
+    canvas = np.full((title.shape[0] + rows * height, cols * width, 4), 255, dtype=np.uint8)
+    canvas[:title.shape[0], :min(title.shape[1], canvas.shape[1])] = title[:, :canvas.shape[1]]
+    for i, image in enumerate(panels):
+        top = title.shape[0] + (i // cols) * height
+        left = (i % cols) * width
+        canvas[top:top + image.shape[0], left:left + image.shape[1]] = image
+    return canvas
+
+
+def render_dashboard(panels, groups, shape, figsize, title, output, dpi=300, fmt=None,
+                     jobs=None, cache_dir=None):
+    """Render a grid of panels into output.
+
+    groups is the tuple of result dicts the panels select from. With a
+    cache_dir, unchanged tiles are reused and an unchanged output file is not
+    rewritten. Returns (panels drawn, panels reused).
+    """
+    rows, cols = shape
+    tile_size = (figsize[0] / cols, figsize[1] / rows)
+    jobs_args = [(_draw_title, (title,), (figsize[0], TITLE_HEIGHT), dpi)]
+    jobs_args += [(panel.draw, panel.select(*groups), tile_size, dpi) for panel in panels]
+
+    tile_dir = Path(cache_dir) / 'panels' if cache_dir else None
+    with stage('fingerprint', panels=len(jobs_args)):
+        keys = [_fingerprint(draw, inputs, size, dpi) for draw, inputs, size, dpi in jobs_args]
+    tiles = [None] * len(jobs_args)
+    if tile_dir:
+        for i, key in enumerate(keys):
+            path = tile_dir / f'{key}.png'
+            if path.exists():
+                tiles[i] = path.read_bytes()
+                os.utime(path)
+
+    stale = [i for i, tile in enumerate(tiles) if tile is None]
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    if jobs > 1 and len(stale) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=min(jobs, len(stale))) as pool:
+            drawn = list(pool.map(_render_tile, [jobs_args[i] for i in stale]))
+    else:
+        drawn = [_render_tile(jobs_args[i]) for i in stale]
+
+    for i, png in zip(stale, drawn):
+        tiles[i] = png
+        if tile_dir:
+            from .cache import _atomic_write
+            tile_dir.mkdir(parents=True, exist_ok=True)
+            _atomic_write(tile_dir / f'{keys[i]}.png', lambda f, png=png: f.write(png))
+
+    output = Path(output)
+    fmt = fmt or output.suffix.lstrip('.') or 'png'
+    image_key = hashlib.sha256(f"{fmt}:{dpi}:{':'.join(keys)}".encode()).hexdigest()
+    state_file = tile_dir / 'outputs.json' if tile_dir else None
+    state = {}
+    if state_file:
+        try:
+            state = json.loads(state_file.read_text())
+        except (OSError, ValueError):
+            state = {}
+    previous = state.get(str(output.resolve()))
+    if stale or not output.exists() or previous != [image_key, output.stat().st_mtime_ns]:
+        import matplotlib.image as mpimg
+
+        with stage('stitch', tiles=len(tiles)):
+            image = _stitch(tiles, shape)
+        if fmt.lower() in ('jpg', 'jpeg'):
+            image = image[:, :, :3]
+        with stage('save', format=fmt):
+            mpimg.imsave(output, image, format=fmt, dpi=dpi)
+        if state_file:
+            from .cache import _atomic_write
+            state[str(output.resolve())] = [image_key, output.stat().st_mtime_ns]
+            _atomic_write(state_file, lambda f: f.write(json.dumps(state).encode()))
+    return len(stale), len(tiles) - len(stale)
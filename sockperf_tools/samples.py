@@ -0,0 +1,288 @@
+"""
+Memory-mapped binary sample files (.sps) converted from --full-log CSVs.
+
+Layout: an 8-byte magic, a u32 header length and a JSON header, padded to
+a 4 KiB page. Then come three contiguous little-endian int64 columns (seq,
+tx_ns, rx_ns), each starting on a page boundary. Timestamps stay integer
+nanoseconds because float64 seconds lose precision at Unix-epoch magnitudes.
+The header also holds the exact latency statistics of the whole run, so
+summaries never touch the columns.
+
+Opening a file maps the columns with numpy.memmap without reading them.
+Slices are views, and a time window found with searchsorted on tx_ns pages
+in only that window. Once converted, the .sps file takes the CSV's place.
+full_log_path() returns it, and every reader in fulllog (and through it
+the cache, histograms, the store and significance tests) accepts both
+formats. A CSV newer than its .sps wins, so re-recorded runs are not
+shadowed by a stale conversion.
+
+Usage:
+    python -m sockperf_tools.samples convert sockperf_pingpong_udp.csv [...] [--remove-csv]
+    python -m sockperf_tools.samples info sockperf_pingpong_udp.sps
+    python -m sockperf_tools.samples window sockperf_pingpong_udp.sps --start 10 --stop 20
+"""
+
+import json
+import os
+import struct
+from pathlib import Path
+
+import numpy as np
+
+SUFFIX = '.sps'
+MAGIC = b'SPSMPL01'
+FORMAT_VERSION = 1
+PAGE = 4096
+COLUMNS = ('seq', 'tx_ns', 'rx_ns')
+DTYPE = np.dtype('<i8')
+
+_PREAMBLE = struct.Struct('<8sI')
+
+
+def is_sample_file(filename):
+    """True if filename is a binary sample file (checked by magic, not suffix)"""
+    try:
+        with open(filename, 'rb') as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def _aligned(offset):
+    return -(-offset // PAGE) * PAGE
+
+
+class SampleFile:
+    """A memory-mapped .sps file.
+
+    seq, tx_ns and rx_ns are read-only int64 memmaps; meta is the JSON
+    header (source CSV, parameters line and 'stats' of the whole run).
+    """
+
+    def __init__(self, filename):
+        self.filename = str(filename)
+        with open(filename, 'rb') as f:
+            magic, length = _PREAMBLE.unpack(f.read(_PREAMBLE.size))
+            if magic != MAGIC:
+                raise ValueError(f"{filename} is not a sockperf sample file")
+            self.meta = json.loads(f.read(length))
+        if self.meta['version'] > FORMAT_VERSION:
+            raise ValueError(f"{filename} uses sample format {self.meta['version']}; "
+                             f"this version reads up to {FORMAT_VERSION}")
+        self.rows = self.meta['rows']
+        for name in COLUMNS:
+            offset = self.meta['columns'][name]
+            column = (np.memmap(self.filename, dtype=DTYPE, mode='r', offset=offset, shape=(self.rows,))
+                      if self.rows else np.empty(0, dtype=DTYPE))
+            setattr(self, name, column)
+
+    def __len__(self):
+        return self.rows
+
+    @property
+    def stats(self):
+        """Exact latency statistics of the whole run (round trip halved), as in latency_stats"""
+        stats = dict(self.meta.get('stats') or {})
+        if 'percentiles' in stats:
+            stats['percentiles'] = {float(p): v for p, v in stats['percentiles'].items()}
+        return stats
+
+    def window(self, start_s=None, stop_s=None):
+        """slice of the rows sent between start_s and stop_s seconds into the run"""
+        if not self.rows:
+            return slice(0, 0)
+        first = int(self.tx_ns[0])
+        lo = 0 if start_s is None else int(np.searchsorted(self.tx_ns, first + int(start_s * 1e9)))
+        hi = self.rows if stop_s is None else int(np.searchsorted(self.tx_ns, first + int(stop_s * 1e9)))
+        return slice(lo, hi)
+
+    def latencies(self, rows=slice(None), round_trip=True):
+        """Latency in µs for a slice of rows; only that slice is paged in"""
+        scale = 0.5e-3 if round_trip else 1e-3
+        return (self.rx_ns[rows] - self.tx_ns[rows]) * scale
+
+    def chunks(self, rows, chunk_rows=1 << 22):
+        """(seq, tx_ns, rx_ns) views over a row range, chunk_rows at a time"""
+        start, stop, _ = (rows or slice(None)).indices(self.rows)
+        for lo in range(start, stop, chunk_rows):
+            hi = min(lo + chunk_rows, stop)
+            yield self.seq[lo:hi], self.tx_ns[lo:hi], self.rx_ns[lo:hi]
+
+    def histogram(self, significant_digits=None, rows=None, round_trip=True):
+        """LatencyHistogram of a row range, built chunk by chunk in constant memory"""
+        from .histogram import DEFAULT_SIGNIFICANT_DIGITS, LatencyHistogram
+
+        hist = LatencyHistogram(significant_digits or DEFAULT_SIGNIFICANT_DIGITS)
+        scale = 0.5e-3 if round_trip else 1e-3
+        for _, tx, rx in self.chunks(rows):
+            hist.record((rx - tx) * scale)
+        return hist
+
+
+def _parameters(filename):
+    """The 'test was performed using ...' line at the top of a full-log CSV, if any"""
+    with open(filename, 'rb') as f:
+        head = f.read(4096).decode('ascii', 'replace')
+    for line in head.splitlines():
+        if 'following parameters:' in line:
+            return line.split('following parameters:', 1)[1].strip()
+    return None
+
+
+def _write(output, meta, capacity, fill):
+    """Lay out a sample file for capacity rows, let fill(columns) write them
+    and return the row count, then store the header with the run's statistics"""
+    from .fulllog import latency_stats
+
+    meta.update(version=FORMAT_VERSION, rows=0, capacity=capacity, dtype=DTYPE.str, columns={}, stats=None)
+
+    def header():
+        # Reserve room for the final row count and statistics
+        text = json.dumps(meta).encode()
+        return text + b' ' * (_aligned(_PREAMBLE.size + len(text) + 2048) - _PREAMBLE.size - len(text))
+
+    start = _aligned(_PREAMBLE.size + len(header()))
+    for i, name in enumerate(COLUMNS):
+        meta['columns'][name] = start + i * _aligned(capacity * DTYPE.itemsize)
+    size = start + len(COLUMNS) * _aligned(capacity * DTYPE.itemsize)
+
+    tmp = output.with_name(f'.tmp-{output.name}')
+    try:
+        with open(tmp, 'wb') as f:
+            f.truncate(size)
+        mapped = [np.memmap(tmp, dtype=DTYPE, mode='r+', offset=meta['columns'][name], shape=(capacity,))
+                  for name in COLUMNS]
+        rows = fill(mapped)
+        for column in mapped:
+            column.flush()
+
+        meta['rows'] = rows
+        if rows:
+            latencies = (mapped[2][:rows] - mapped[1][:rows]) * 0.5e-3
+            stats = latency_stats(latencies, jitter=True, seq=mapped[0][:rows])
+            stats['percentiles'] = {str(p): v for p, v in stats['percentiles'].items()}
+            meta['stats'] = stats
+        del mapped
+
+        text = json.dumps(meta).encode()
+        if _PREAMBLE.size + len(text) > start:
+            raise RuntimeError("sample file header outgrew its reserved space")
+        with open(tmp, 'r+b') as f:
+            f.write(_PREAMBLE.pack(MAGIC, len(text)) + text)
+        os.replace(tmp, output)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return output
+
+
+def convert(csv_file, output=None, chunk_bytes=None):
+    """Convert a --full-log CSV to a .sps file (default: same name, .sps suffix).
+
+    The CSV is read twice: a newline count sizes the columns, then the rows
+    are parsed straight into the mapped output. Returns the output path.
+    """
+    from .fulllog import CHUNK_BYTES, iter_full_log
+
+    chunk_bytes = chunk_bytes or CHUNK_BYTES
+    csv_file = Path(csv_file)
+    output = Path(output) if output else csv_file.with_suffix(SUFFIX)
+
+    capacity = 0
+    with open(csv_file, 'rb') as f:
+        while True:
+            block = f.read(chunk_bytes)
+            if not block:
+                break
+            capacity += block.count(b'\n')
+    capacity += 1
+
+    def fill(mapped):
+        rows = 0
+        for chunk in iter_full_log(csv_file, chunk_bytes):
+            n = len(chunk[0])
+            for column, values in zip(mapped, chunk):
+                column[rows:rows + n] = values
+            rows += n
+        return rows
+
+    st = csv_file.stat()
+    meta = {'source': {'name': csv_file.name, 'size': st.st_size, 'mtime_ns': st.st_mtime_ns},
+            'parameters': _parameters(csv_file)}
+    return _write(output, meta, capacity, fill)
+
+
+def write_samples(output, seq, tx_ns, rx_ns, parameters=None, source=None):
+    """Write (seq, tx_ns, rx_ns) arrays straight to a .sps file; returns its path.
+
+    source names where the samples came from (the 'name' shown by info).
+    """
+    output = Path(output)
+
+    def fill(mapped):
+        for column, values in zip(mapped, (seq, tx_ns, rx_ns)):
+            column[:len(seq)] = values
+        return len(seq)
+
+    meta = {'source': {'name': source or output.name, 'size': None, 'mtime_ns': None}, 'parameters': parameters}
+    return _write(output, meta, max(len(seq), 1), fill)
+
+
+def main(argv=None):
+    import argparse
+    import time
+
+    ap = argparse.ArgumentParser(description="Convert and inspect binary full-log sample files")
+    sub = ap.add_subparsers(dest='command', required=True)
+    p = sub.add_parser('convert', help="convert --full-log CSVs to .sps files")
+    p.add_argument('files', nargs='+')
+    p.add_argument('--remove-csv', action='store_true', help="delete each CSV after converting it")
+    p = sub.add_parser('info', help="show the header of .sps files")
+    p.add_argument('files', nargs='+')
+    p = sub.add_parser('window', help="latency statistics for a time window of a run")
+    p.add_argument('file')
+    p.add_argument('--start', type=float, help="seconds into the run")
+    p.add_argument('--stop', type=float, help="seconds into the run")
+    args = ap.parse_args(argv)
+
+    if args.command == 'convert':
+        for filename in args.files:
+            start = time.perf_counter()
+            output = convert(filename)
+            before, after = os.path.getsize(filename), os.path.getsize(output)
+            print(f"✓ {filename} → {output} ({len(SampleFile(output)):,} samples, "
+                  f"{before / 1e6:,.1f} → {after / 1e6:,.1f} MB, {time.perf_counter() - start:.1f} s)")
+            if args.remove_csv:
+                os.unlink(filename)
+    elif args.command == 'info':
+        for filename in args.files:
+            samples = SampleFile(filename)
+            stats = samples.stats
+            print(f"\n{filename}:")
+            print(f"  Samples: {len(samples):,} (format {samples.meta['version']}, "
+                  f"from {samples.meta['source']['name']})")
+            print(f"  Parameters: {samples.meta.get('parameters') or '-'}")
+            if stats:
+                print(f"  Average Latency: {stats['avg_latency_us']:.3f} μs (std-dev {stats['std_dev_us']:.3f})")
+                print(f"  p99 / p99.9: {stats['percentiles'][99.0]:.3f} / {stats['percentiles'][99.9]:.3f} μs")
+    else:
+        from .fulllog import latency_stats
+
+        samples = SampleFile(args.file)
+        rows = samples.window(args.start, args.stop)
+        stats = latency_stats(samples.latencies(rows), jitter=True, seq=samples.seq[rows])
+        print(f"{args.file} [{args.start or 0:g} s, {'end' if args.stop is None else f'{args.stop:g} s'}): "
+              f"{rows.stop - rows.start:,} samples")
+        if stats:
+            print(f"  Average Latency: {stats['avg_latency_us']:.3f} μs (std-dev {stats['std_dev_us']:.3f})")
+            print(f"  Min/Max Latency: {stats['min_latency_us']:.3f} / {stats['max_latency_us']:.3f} μs")
+            for pct, val in stats['percentiles'].items():
+                print(f"  percentile {pct:>7.3f} = {val:9.3f}")
+            jitter = stats.get('delay_variation')
+            if jitter:
+                print(f"  IPDV |D| mean / p99: {jitter['ipdv_mean_us']:.3f} / {jitter['ipdv_p99_us']:.3f} μs, "
+                      f"spikes: {jitter['spike_count']:,}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,270 @@
+"""
+Sequence-aware loss, reorder and duplicate analysis of full-log samples.
+
+sockperf's summary counts sent and received messages. That count cannot tell
+one long outage from scattered drops, and under-load only replies to every
+Nth message (--reply-every). Here every full-log record is indexed by its
+sequence number instead:
+
+    step        distance between consecutive sequence numbers (the
+                reply-every of an under-load log; inferred when not given)
+    lost        sequence numbers between the first and last record that
+                never arrived, and loss bursts: runs of consecutive ones
+    reordered   records that arrived after a higher sequence number; the
+                distance is how many steps behind the highest one they were
+    duplicates  records whose sequence number had already arrived
+
+Records are marked in a bitmap of one bit per step (12.5 MB for 10^8
+messages) and the log is streamed chunk by chunk, so memory is bounded by
+the bitmap plus one chunk. Burst and reorder lengths are kept as histograms
+whose last bucket collects everything at or above HIST_LIMIT.
+
+Usage:
+    python -m sockperf_tools.sequence FILE [...] [--reply-every N] [--expected N]
+
+FILE is a full log (.csv/.sps) or a sockperf summary with a full log next to
+it; a summary also supplies the expected reply count.
+"""
+
+from .fulllog import CHUNK_BYTES
+
+HIST_LIMIT = 1024
+# Records up to this many steps before the first one still get a bit
+ORIGIN_SLACK = 1 << 16
+_SCAN_BYTES = 1 << 14
+
+
+def infer_step(seq):
+    """Most common positive difference between consecutive sequence numbers (1 if none)"""
+    import numpy as np
+
+    diffs = np.diff(seq)
+    diffs = diffs[diffs > 0]
+    if not len(diffs):
+        return 1
+    values, counts = np.unique(diffs, return_counts=True)
+    return int(values[counts.argmax()])
+
+
+class _Bitmap:
+    """Growable packed bitmap of received sequence indexes"""
+
+    def __init__(self, bits=1 << 16):
+        import numpy as np
+
+        self.bytes = np.zeros((bits + 7) // 8, dtype=np.uint8)
+
+    def reserve(self, top):
+        import numpy as np
+
+        if top >= len(self.bytes) * 8:
+            grown = np.zeros(max(2 * len(self.bytes), top // 8 + 1), dtype=np.uint8)
+            grown[:len(self.bytes)] = self.bytes
+            self.bytes = grown
+
+    def test(self, idx):
+        return (self.bytes[idx >> 3] >> (idx & 7).astype(self.bytes.dtype)) & 1
+
+    def set_sorted(self, idx):
+        """Set the bits of ascending, unique indexes"""
+        import numpy as np
+
+        if not len(idx):
+            return
+        byte = idx >> 3
+        starts = np.flatnonzero(np.r_[True, byte[1:] != byte[:-1]])
+        bits = np.left_shift(1, idx & 7).astype(np.uint8)
+        self.bytes[byte[starts]] |= np.bitwise_or.reduceat(bits, starts)
+
+    def gaps(self, lo, hi):
+        """Lengths of the runs of clear bits between set bits lo and hi, block by block"""
+        import numpy as np
+
+        previous = lo
+        for start in range(lo >> 3 << 3, hi + 1, _SCAN_BYTES * 8):
+            block = np.unpackbits(self.bytes[start >> 3:(start >> 3) + _SCAN_BYTES], bitorder='little')
+            ones = np.flatnonzero(block) + start
+            ones = ones[(ones > previous) & (ones <= hi)]
+            if len(ones):
+                gaps = np.diff(ones, prepend=previous) - 1
+                previous = int(ones[-1])
+                if gaps.any():
+                    yield gaps[gaps > 0]
+
+
+def _histogram(lengths, hist):
+    """Add lengths to a bincount whose last bucket is HIST_LIMIT and above"""
+    import numpy as np
+
+    counts = np.bincount(np.minimum(lengths, HIST_LIMIT), minlength=HIST_LIMIT + 1)
+    return counts if hist is None else hist + counts
+
+
+def sequence_stats(filename, step=None, expected=None, chunk_bytes=None):
+    """Loss, loss bursts, reordering and duplicates of a full log.
+
+    step is the sequence distance between consecutive records (inferred
+    from the first chunk when None). With expected (the number of records
+    the run should have logged, e.g. sent // reply_every) the loss rate is
+    taken against it, so messages lost before the first or after the last
+    logged record count too; bursts are always within the logged span.
+    """
+    import numpy as np
+
+    from .fulllog import iter_full_log
+
+    bitmap = _Bitmap()
+    origin = None
+    records = duplicates = misaligned = reordered = 0
+    reorder_max = reorder_sum = 0
+    reorder_hist = None
+    lo, hi = None, -1
+
+    for seq, _, _ in iter_full_log(filename, chunk_bytes or CHUNK_BYTES):
+        records += len(seq)
+        if origin is None:
+            step = step or infer_step(seq)
+            first = int(seq[0])
+            origin = first - step * min(ORIGIN_SLACK, max(first, 0) // step)
+        offset = seq - origin
+        aligned = (offset >= 0) & (offset % step == 0)
+        misaligned += len(seq) - int(np.count_nonzero(aligned))
+        idx = offset[aligned] // step
+        if not len(idx):
+            continue
+
+        # First arrivals: a stable sort keeps the earliest of repeats first
+        order = np.argsort(idx, kind='stable')
+        ordered = idx[order]
+        first_of = np.r_[True, ordered[1:] != ordered[:-1]]
+        bitmap.reserve(int(ordered[-1]))
+        unseen = bitmap.test(ordered[first_of]) == 0
+        new_sorted = first_of.copy()
+        new_sorted[first_of] = unseen
+        is_new = np.empty(len(idx), dtype=bool)
+        is_new[order] = new_sorted
+        duplicates += len(idx) - int(np.count_nonzero(is_new))
+
+        # Late arrivals: below the highest index that arrived before them
+        arrived = idx[is_new]
+        if len(arrived):
+            highest = np.maximum.accumulate(np.r_[hi, arrived[:-1]])
+            late = arrived < highest
+            distance = (highest - arrived)[late]
+            if len(distance):
+                reordered += len(distance)
+                reorder_max = max(reorder_max, int(distance.max()))
+                reorder_sum += int(distance.sum())
+                reorder_hist = _histogram(distance, reorder_hist)
+            hi = max(hi, int(arrived.max()))
+            lo = int(arrived.min()) if lo is None else min(lo, int(arrived.min()))
+        bitmap.set_sorted(ordered[new_sorted])
+
+    received = records - duplicates - misaligned
+    span = hi - lo + 1 if lo is not None else 0
+    burst_hist, bursts, burst_max, burst_sum = None, 0, 0, 0
+    if span:
+        for gaps in bitmap.gaps(lo, hi):
+            bursts += len(gaps)
+            burst_max = max(burst_max, int(gaps.max()))
+            burst_sum += int(gaps.sum())
+            burst_hist = _histogram(gaps, burst_hist)
+    lost = span - received
+    stats = {
+        'records': records,
+        'step': step or 1,
+        'first_seq': origin + lo * step if span else None,
+        'last_seq': origin + hi * step if span else None,
+        'span': span,
+        'received': received,
+        'lost': lost,
+        'loss_pct': 100.0 * lost / span if span else 0.0,
+        'duplicates': duplicates,
+        'misaligned': misaligned,
+        'reordered': reordered,
+        'reorder_pct': 100.0 * reordered / received if received else 0.0,
+        'reorder_max': reorder_max,
+        'reorder_mean': reorder_sum / reordered if reordered else 0.0,
+        'reorder_hist': reorder_hist if reorder_hist is not None else np.zeros(HIST_LIMIT + 1, dtype=np.int64),
+        'bursts': bursts,
+        'burst_max': burst_max,
+        'burst_mean': burst_sum / bursts if bursts else 0.0,
+        'burst_hist': burst_hist if burst_hist is not None else np.zeros(HIST_LIMIT + 1, dtype=np.int64),
+    }
+    if expected:
+        stats['expected'] = expected
+        stats['lost'] = max(expected - received, 0)
+        stats['loss_pct'] = 100.0 * stats['lost'] / expected
+    return stats
+
+
+def expected_records(result):
+    """Replies a summary says should have been logged: valid sent // reply-every"""
+    sent = result.valid_sent or result.sent_messages
+    return sent // (result.reply_every or 1) if sent else None
+
+
+def sequence_stats_for(result, chunk_bytes=None):
+    """sequence_stats() of a parsed run's full log, against its expected reply count (None without a log)"""
+    from .parser import full_log_path
+
+    log_file = full_log_path(result.filename)
+    if log_file is None:
+        return None
+    return sequence_stats(log_file, expected=expected_records(result), chunk_bytes=chunk_bytes)
+
+
+def _lengths(hist):
+    """'length×count' of the non-empty histogram buckets"""
+    import numpy as np
+
+    return ', '.join(f"{length}{'+' if length == HIST_LIMIT else ''}×{hist[length]:,}"
+                     for length in np.flatnonzero(hist))
+
+
+def print_sequence(filename, stats):
+    print(f"\n{filename}:")
+    if not stats['span']:
+        print("  No sequence numbers found")
+        return
+    print(f"  Records: {stats['records']:,} (seq {stats['first_seq']:,}..{stats['last_seq']:,}, step {stats['step']})")
+    expected = f" of {stats['expected']:,} expected" if 'expected' in stats else f" of {stats['span']:,} in span"
+    print(f"  Received: {stats['received']:,}{expected}; lost {stats['lost']:,} ({stats['loss_pct']:.4f}%)")
+    if stats['bursts']:
+        print(f"  Loss bursts: {stats['bursts']:,}, mean {stats['burst_mean']:.2f}, longest {stats['burst_max']:,}")
+        print(f"    lengths: {_lengths(stats['burst_hist'])}")
+    if stats['reordered']:
+        print(f"  Reordered: {stats['reordered']:,} ({stats['reorder_pct']:.4f}%), mean distance "
+              f"{stats['reorder_mean']:.2f}, max {stats['reorder_max']:,}")
+        print(f"    distances: {_lengths(stats['reorder_hist'])}")
+    print(f"  Duplicates: {stats['duplicates']:,}")
+    if stats['misaligned']:
+        print(f"  Off the step grid: {stats['misaligned']:,}")
+
+
+def main(argv=None):
+    import argparse
+    from pathlib import Path
+
+    from .parser import full_log_path, parse_sockperf_file
+    from .samples import SUFFIX
+
+    ap = argparse.ArgumentParser(description="Loss bursts, reordering and duplicates from full-log sequence numbers")
+    ap.add_argument('files', nargs='+', help="full logs (.csv/.sps) or summaries with a full log alongside")
+    ap.add_argument('--reply-every', type=int, help="sequence step of the log (default: inferred)")
+    ap.add_argument('--expected', type=int, help="records the run should have logged (default: from the summary)")
+    args = ap.parse_args(argv)
+
+    for filename in args.files:
+        log_file, expected = filename, args.expected
+        if Path(filename).suffix not in ('.csv', SUFFIX):
+            log_file = full_log_path(filename)
+            if log_file is None:
+                print(f"\n{filename}:\n  No full log alongside")
+                continue
+            expected = expected or expected_records(parse_sockperf_file(filename, use_full_log=False))
+        print_sequence(log_file, sequence_stats(log_file, args.reply_every, expected))
+
+
+if __name__ == '__main__':
+    main()
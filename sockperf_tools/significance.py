@@ -0,0 +1,249 @@
+"""
+Significance testing for latency differences between two configurations.
+
+Resampling 300k raw samples 10,000 times would mean drawing billions of
+values. Instead each run is reduced to its LatencyHistogram: samples in one
+bucket (0.1% wide at 3 significant digits) are interchangeable, so a
+bootstrap resample is a multinomial draw of bucket counts. A batch of
+resamples is a (batch x buckets) count matrix, and means and percentiles of
+every resample come from one matrix product or cumulative sum. The cost
+depends on the number of occupied buckets, not the number of samples.
+
+Full-log runs (CSV or .sps) give exact histograms. A summary-only run has
+no samples: its histogram is rebuilt from the printed percentiles (see
+LatencyHistogram.from_summary), which a bootstrap or rank test would treat
+as data. When either side is summary-only, only the point differences and
+Cohen's d (from the printed mean and std-dev) are reported; confidence
+intervals, p-values and significance are left out. Each result records
+which source was used.
+
+Alongside the bootstrap intervals, a Mann-Whitney U test on the bucketed
+samples gives a p-value and Cliff's delta. Cohen's d comes from the exact
+means and standard deviations.
+
+Usage:
+    python -m sockperf_tools.significance dual/sockperf_pingpong_udp.txt single/sockperf_pingpong_udp.txt
+"""
+
+import math
+
+import numpy as np
+
+from .histogram import histogram_for
+from .instrument import stage
+from .parser import full_log_path
+
+DEFAULT_RESAMPLES = 10_000
+DEFAULT_CONFIDENCE = 0.95
+DEFAULT_STATISTICS = ('mean', 50.0, 99.0, 99.9)
+
+# Resamples drawn per batch; bounds the count matrices to a few tens of MB
+BATCH = 512
+
+
+def _support(hist):
+    """(bucket midpoints in µs, counts) of a histogram's occupied buckets"""
+    index = np.flatnonzero(hist.counts)
+    low, width = hist._lowest_ns(index)
+    values = np.clip((low + width / 2) / 1000.0, hist.min_us, hist.max_us)
+    return values, hist.counts[index]
+
+
+def _statistics(values, counts, statistics):
+    """Each statistic for every row of a (resamples x buckets) count matrix"""
+    counts = np.atleast_2d(counts)
+    n = counts.sum(axis=1)
+    cumulative = None
+    out = []
+    for stat in statistics:
+        if stat == 'mean':
+            out.append(counts @ values / n)
+        else:
+            if cumulative is None:
+                cumulative = np.cumsum(counts, axis=1)
+            rank = np.maximum(np.ceil(float(stat) / 100.0 * n), 1)
+            out.append(values[(cumulative < rank[:, None]).sum(axis=1)])
+    return np.array(out)
+
+
+def bootstrap(values, counts, statistics=DEFAULT_STATISTICS, resamples=DEFAULT_RESAMPLES, rng=None):
+    """Bootstrap distribution of each statistic: array (len(statistics), resamples)"""
+    rng = np.random.default_rng(rng)
+    n = int(counts.sum())
+    p = counts / n
+    out = np.empty((len(statistics), resamples))
+    for start in range(0, resamples, BATCH):
+        size = min(BATCH, resamples - start)
+        out[:, start:start + size] = _statistics(values, rng.multinomial(n, p, size=size), statistics)
+    return out
+
+
+def mann_whitney(values_a, counts_a, values_b, counts_b):
+    """Mann-Whitney U on bucketed samples (ties within a bucket).
+
+    Returns (U for a > b, two-sided p-value from the normal approximation
+    with tie correction, Cliff's delta). Positive delta means a tends to be
+    larger than b.
+    """
+    grid = np.union1d(values_a, values_b)
+    a = np.zeros(len(grid))
+    b = np.zeros(len(grid))
+    a[np.searchsorted(grid, values_a)] = counts_a
+    b[np.searchsorted(grid, values_b)] = counts_b
+    n1, n2 = a.sum(), b.sum()
+
+    below_b = np.cumsum(b) - b
+    u = float(np.sum(a * (below_b + 0.5 * b)))
+    n = n1 + n2
+    ties = a + b
+    variance = n1 * n2 / 12.0 * ((n + 1) - np.sum(ties ** 3 - ties) / (n * (n - 1)))
+    z = (u - n1 * n2 / 2.0) / math.sqrt(variance) if variance > 0 else 0.0
+    return u, math.erfc(abs(z) / math.sqrt(2)), 2.0 * u / (n1 * n2) - 1.0
+
+
+def _label(stat):
+    return 'mean' if stat == 'mean' else f"p{float(stat):g}"
+
+
+def compare_runs(result_a, result_b, statistics=DEFAULT_STATISTICS, resamples=DEFAULT_RESAMPLES,
+                 confidence=DEFAULT_CONFIDENCE, cache=None, seed=None):
+    """Compare two parsed runs (a = baseline, e.g. dual-board; b = candidate).
+
+    Returns a dict with 'source' ('full-log' or 'summary' for each side),
+    'tested' (both sides have samples), 'p_value' and 'cliffs_delta' from
+    the Mann-Whitney test, 'cohens_d' and, per statistic label ('mean',
+    'p50', 'p99', ...), the baseline and candidate values, 'reduction'
+    (a - b, µs), 'reduction_pct' (as in the "improvement" column of the
+    reports), their percentile-bootstrap confidence intervals, and
+    'significant' when the reduction interval excludes zero. Unless
+    'tested', the p-value and delta are None and rows have no intervals.
+    """
+    def source(result):
+        return 'full-log' if full_log_path(result.filename) else 'summary'
+
+    # A reconstructed summary histogram occupies every bucket between <MIN>
+    # and <MAX>; 1% buckets are as precise as that reconstruction anyway and
+    # keep the bootstrap cheap
+    sources = (source(result_a), source(result_b))
+    with stage('histograms'):
+        hist_a, hist_b = (histogram_for(result, cache, 3 if src == 'full-log' else 2)
+                          for result, src in zip((result_a, result_b), sources))
+    if not hist_a.count or not hist_b.count:
+        return None
+    values_a, counts_a = _support(hist_a)
+    values_b, counts_b = _support(hist_b)
+    tested = 'summary' not in sources
+    resamples = resamples if tested else 0
+
+    rng = np.random.default_rng(seed)
+    with stage('bootstrap', resamples=resamples):
+        boot_a = bootstrap(values_a, counts_a, statistics, resamples, rng) if resamples else None
+        boot_b = bootstrap(values_b, counts_b, statistics, resamples, rng) if resamples else None
+    point_a = _statistics(values_a, counts_a, statistics)[:, 0]
+    point_b = _statistics(values_b, counts_b, statistics)[:, 0]
+    if 'mean' in statistics:
+        # Bucketing shifts the mean slightly; recentre on the exact means
+        i = statistics.index('mean')
+        for point, boot, hist in ((point_a, boot_a, hist_a), (point_b, boot_b, hist_b)):
+            if boot is not None:
+                boot[i] += hist.mean - point[i]
+            point[i] = hist.mean
+    tail = (1.0 - confidence) / 2.0 * 100.0
+
+    def interval(samples):
+        low, high = np.percentile(samples, [tail, 100.0 - tail])
+        return float(low), float(high)
+
+    p_value = delta = None
+    if tested:
+        _, p_value, delta = mann_whitney(values_a, counts_a, values_b, counts_b)
+    pooled = math.sqrt((hist_a.m2 + hist_b.m2) / max(hist_a.count + hist_b.count - 2, 1))
+    comparison = {
+        'source': sources,
+        'tested': tested,
+        'observations': (hist_a.count, hist_b.count),
+        'resamples': resamples,
+        'confidence': confidence,
+        'p_value': p_value,
+        'cliffs_delta': delta,
+        'cohens_d': (hist_a.mean - hist_b.mean) / pooled if pooled else 0.0,
+        'statistics': {},
+    }
+    for i, stat in enumerate(statistics):
+        a, b = float(point_a[i]), float(point_b[i])
+        row = {'a': a, 'b': b, 'reduction': a - b, 'reduction_pct': (a - b) / a * 100.0 if a else None}
+        if resamples:
+            row['reduction_ci'] = interval(boot_a[i] - boot_b[i])
+            row['reduction_pct_ci'] = interval((boot_a[i] - boot_b[i]) / boot_a[i] * 100.0)
+            low, high = row['reduction_ci']
+            row['significant'] = low > 0 or high < 0
+        comparison['statistics'][_label(stat)] = row
+    return comparison
+
+
+def print_significance(comparisons, baseline='Dual', candidate='Single'):
+    """Print {test label: compare_runs(...)} as a table"""
+    first = next((c for c in comparisons.values() if c), None)
+    if first is None:
+        return
+    level = f"{first['confidence'] * 100:g}%"
+    resamples = next((c['resamples'] for c in comparisons.values() if c and c['tested']), 0)
+    print(f"\n📐 STATISTICAL SIGNIFICANCE ({baseline} - {candidate}, {level} bootstrap CI, "
+          f"{resamples:,} resamples):")
+    print("-" * 80)
+    print(f"{'Test':<20} {'Stat':<7} {'Reduction (μs)':>15} {'CI (μs)':>20} {'Reduction %':>12}  Sig")
+    print("-" * 80)
+    for test, comparison in comparisons.items():
+        if not comparison:
+            continue
+        for stat, row in comparison['statistics'].items():
+            ci = row.get('reduction_ci')
+            ci_text = f"[{ci[0]:.2f}, {ci[1]:.2f}]" if ci else '-' if comparison['tested'] else 'n/a'
+            pct = '-' if row['reduction_pct'] is None else f"{row['reduction_pct']:.1f}%"
+            sig = ('yes' if row['significant'] else 'no') if 'significant' in row else '-'
+            sig = sig if comparison['tested'] else 'n/a'
+            print(f"{test:<20} {stat:<7} {row['reduction']:>15.2f} {ci_text:>20} {pct:>12}  {sig}")
+        sources = '/'.join(comparison['source'])
+        if comparison['tested']:
+            p_value = comparison['p_value']
+            p_text = '<1e-16' if p_value < 1e-16 else f"={p_value:.3g}"
+            print(f"{'':<20} Mann-Whitney p{p_text}, Cliff's delta={comparison['cliffs_delta']:+.3f}, "
+                  f"Cohen's d={comparison['cohens_d']:+.3f} ({sources})")
+        else:
+            print(f"{'':<20} Mann-Whitney n/a, Cohen's d={comparison['cohens_d']:+.3f} ({sources}: "
+                  f"needs full-log or .sps samples on both sides)")
+
+
+def main(argv=None):
+    import argparse
+    import time
+
+    from .batch import default_cache
+    from .parser import parse_sockperf_file
+
+    ap = argparse.ArgumentParser(description="Bootstrap comparison of two sockperf runs (baseline first)")
+    ap.add_argument('baseline')
+    ap.add_argument('candidate')
+    ap.add_argument('--resamples', type=int, default=DEFAULT_RESAMPLES)
+    ap.add_argument('--confidence', type=float, default=DEFAULT_CONFIDENCE)
+    ap.add_argument('--seed', type=int)
+    args = ap.parse_args(argv)
+
+    cache = default_cache()
+    parse = cache.parse if cache else parse_sockperf_file
+    a, b = parse(args.baseline), parse(args.candidate)
+    start = time.perf_counter()
+    comparison = compare_runs(a, b, resamples=args.resamples, confidence=args.confidence,
+                              cache=cache, seed=args.seed)
+    elapsed = time.perf_counter() - start
+    if comparison is None:
+        print("No latency observations to compare")
+        return
+    print_significance({'Latency': comparison}, 'Baseline', 'Candidate')
+    print(f"\n{elapsed:.2f} s")
+    if cache:
+        cache.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,258 @@
+"""
+Historical results store backed by SQLite.
+
+Every parsed run becomes one row in ``runs``, with the headline metrics and
+the sockperf percentiles as real columns so they can be filtered, sorted and
+aggregated in SQL. Runs are indexed by topology, payload, test type, date
+and firmware, so a question such as "p99.9 at 1472B for dual-board over the
+last 90 days" is an index range scan rather than a re-parse of the archive.
+Each run also gets a serialised LatencyHistogram in ``histograms`` so
+percentiles over any selection of runs come from a merged histogram. Raw
+full-log latency samples, when present, go into ``samples`` as float64 blobs
+and are only read when asked for.
+
+Usage:
+    python -m sockperf_tools.store ingest results/ [--manifest nightly.csv] [--db results.db]
+    python -m sockperf_tools.store query --topology dual --size 1472 --metric p99.9 --days 90
+"""
+
+import sqlite3
+from datetime import date, timedelta
+
+DEFAULT_DB = 'sockperf_results.db'
+
+# sockperf percentile -> column name
+PERCENTILE_COLUMNS = {
+    25.0: 'p25', 50.0: 'p50', 75.0: 'p75', 90.0: 'p90',
+    99.0: 'p99', 99.9: 'p99_9', 99.99: 'p99_99', 99.999: 'p99_999',
+}
+
+METRIC_COLUMNS = (
+    'avg_latency_us', 'std_dev_us', 'min_latency_us', 'max_latency_us',
+    'total_observations', 'sent_messages', 'received_messages', 'packet_loss_pct',
+    'bandwidth_mbps', 'msg_rate',
+) + tuple(PERCENTILE_COLUMNS.values())
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    content_key TEXT NOT NULL,
+    path TEXT NOT NULL,
+    run_date TEXT,
+    topology TEXT,
+    test_type TEXT,
+    msg_size INTEGER,
+    reply_every INTEGER,
+    firmware TEXT,
+    board TEXT,
+    {', '.join(f'{c} REAL' for c in METRIC_COLUMNS)},
+    UNIQUE (content_key, topology)
+);
+CREATE INDEX IF NOT EXISTS runs_config ON runs (topology, msg_size, test_type, run_date);
+CREATE INDEX IF NOT EXISTS runs_firmware ON runs (firmware, run_date);
+CREATE INDEX IF NOT EXISTS runs_date ON runs (run_date);
+CREATE TABLE IF NOT EXISTS histograms (
+    run_id INTEGER PRIMARY KEY REFERENCES runs (id) ON DELETE CASCADE,
+    data BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS samples (
+    run_id INTEGER PRIMARY KEY REFERENCES runs (id) ON DELETE CASCADE,
+    count INTEGER NOT NULL,
+    data BLOB NOT NULL
+);
+"""
+
+
+def metric_column(name):
+    """Map 'p99.9', '99.9', 'avg' etc. to a column name"""
+    aliases = {'avg': 'avg_latency_us', 'std': 'std_dev_us', 'min': 'min_latency_us',
+               'max': 'max_latency_us', 'mbps': 'bandwidth_mbps'}
+    if name in METRIC_COLUMNS:
+        return name
+    if name in aliases:
+        return aliases[name]
+    try:
+        return PERCENTILE_COLUMNS[float(name.lstrip('p'))]
+    except (ValueError, KeyError):
+        raise ValueError(f"unknown metric {name!r}")
+
+
+class ResultStore:
+    """SQLite store of parsed sockperf runs"""
+
+    def __init__(self, filename=DEFAULT_DB):
+        self.filename = filename
+        self.db = sqlite3.connect(filename)
+        self.db.row_factory = sqlite3.Row
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.execute('PRAGMA foreign_keys=ON')
+        self.db.executescript(_SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def ingest(self, results, cache=None):
+        """Insert or refresh runs. Returns the number of rows written.
+
+        With a ParseCache, content keys and full-log samples come from it;
+        otherwise files are hashed here and samples read from the CSV.
+        """
+        from .cache import content_key
+        from .histogram import histogram_for
+        from .parser import full_log_path
+
+        columns = ('content_key', 'path', 'run_date', 'topology', 'test_type', 'msg_size',
+                   'reply_every', 'firmware', 'board') + METRIC_COLUMNS
+        sql = (f"INSERT INTO runs ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))}) "
+               f"ON CONFLICT (content_key, topology) DO UPDATE SET "
+               f"{', '.join(f'{c}=excluded.{c}' for c in columns[1:])} RETURNING id")
+
+        written = 0
+        with self.db:
+            for result in results:
+                key = cache.key(result.filename) if cache else content_key(result.filename)
+                row = [key, result.filename, result.run_date, result.topology, result.test_type,
+                       result.msg_size, result.reply_every, result.firmware, result.board]
+                row += [result.get(c) for c in METRIC_COLUMNS[:-len(PERCENTILE_COLUMNS)]]
+                row += [result.percentiles.get(p) for p in PERCENTILE_COLUMNS]
+                run_id = self.db.execute(sql, row).fetchone()[0]
+                written += 1
+
+                if result.total_observations:
+                    hist = histogram_for(result, cache)
+                    self.db.execute('INSERT OR REPLACE INTO histograms VALUES (?, ?)',
+                                    (run_id, hist.to_bytes()))
+
+                log_file = full_log_path(result.filename)
+                if log_file:
+                    if cache:
+                        samples = cache.load_latencies(result.filename)
+                    else:
+                        from .fulllog import read_latencies
+                        samples = read_latencies(log_file)
+                    self.db.execute('INSERT OR REPLACE INTO samples VALUES (?, ?, ?)',
+                                    (run_id, len(samples), memoryview(samples.astype('<f8', copy=False))))
+        return written
+
+    def query(self, topology=None, msg_size=None, test_type=None, firmware=None,
+              since=None, until=None, days=None, columns=None):
+        """Return matching runs as sqlite3.Row objects, oldest first.
+
+        since/until are ISO dates (inclusive); days=N means the last N days.
+        """
+        clauses, params = [], []
+        for column, value in (('topology', topology), ('msg_size', msg_size),
+                              ('test_type', test_type), ('firmware', firmware)):
+            if value is not None:
+                clauses.append(f'{column} = ?')
+                params.append(value)
+        if days is not None:
+            since = (date.today() - timedelta(days=days)).isoformat()
+        if since:
+            clauses.append('run_date >= ?')
+            params.append(str(since))
+        if until:
+            clauses.append('run_date <= ?')
+            params.append(str(until))
+
+        select = ', '.join(['id', 'run_date', 'topology', 'test_type', 'msg_size', 'firmware', 'path']
+                           + [metric_column(c) for c in (METRIC_COLUMNS if columns is None else columns)])
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+        return self.db.execute(f'SELECT {select} FROM runs {where} ORDER BY run_date, id', params).fetchall()
+
+    def merged_histogram(self, **filters):
+        """Merge the stored histograms of all runs matching query(**filters)"""
+        from .histogram import LatencyHistogram
+
+        ids = [row['id'] for row in self.query(columns=[], **filters)]
+        merged = LatencyHistogram()
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            rows = self.db.execute(f"SELECT data FROM histograms WHERE run_id IN ({', '.join('?' * len(chunk))})",
+                                   chunk)
+            for (data,) in rows:
+                merged.merge(LatencyHistogram.from_bytes(data))
+        return merged
+
+    def samples(self, run_id):
+        """Raw latency samples (µs) stored for a run, or None"""
+        import numpy as np
+
+        row = self.db.execute('SELECT data FROM samples WHERE run_id = ?', (run_id,)).fetchone()
+        return None if row is None else np.frombuffer(row[0], dtype='<f8')
+
+
+def main(argv=None):
+    import argparse
+
+    ap = argparse.ArgumentParser(description="Ingest into / query the sockperf results store")
+    ap.add_argument('--db', default=DEFAULT_DB, help=f"SQLite file (default {DEFAULT_DB})")
+    sub = ap.add_subparsers(dest='command', required=True)
+
+    ing = sub.add_parser('ingest', help="parse result files and add them to the store")
+    ing.add_argument('paths', nargs='*')
+    ing.add_argument('--manifest')
+    ing.add_argument('-j', '--jobs', type=int)
+
+    q = sub.add_parser('query', help="list stored runs")
+    q.add_argument('--topology')
+    q.add_argument('--size', type=int, dest='msg_size')
+    q.add_argument('--test-type')
+    q.add_argument('--firmware')
+    q.add_argument('--since')
+    q.add_argument('--until')
+    q.add_argument('--days', type=int)
+    q.add_argument('--metric', action='append', help="column(s) to show, e.g. p99.9, avg (repeatable)")
+    q.add_argument('--merge', action='store_true', help="also print percentiles of the merged histogram")
+
+    args = ap.parse_args(argv)
+    store = ResultStore(args.db)
+
+    if args.command == 'ingest':
+        from .batch import default_cache, discover, parse_files, read_manifest
+        entries = read_manifest(args.manifest) if args.manifest else []
+        if args.paths or not args.manifest:
+            entries += [(p, {}) for p in discover(args.paths or ['.'])]
+        cache = default_cache()
+        results = [r for r in parse_files(entries, args.jobs, cache)
+                   if r.test_type not in ('error', 'unknown')]
+        print(f"Ingested {store.ingest(results, cache)} runs into {args.db}")
+        if cache:
+            cache.save_index()
+    else:
+        import time
+
+        metrics = args.metric or ['avg', 'p50', 'p99', 'p99.9', 'max']
+        start = time.perf_counter()
+        rows = store.query(args.topology, args.msg_size, args.test_type, args.firmware,
+                           args.since, args.until, args.days, metrics)
+        elapsed = time.perf_counter() - start
+        headers = [metric_column(m) for m in metrics]
+        print(f"{'Date':<11} {'Topology':<9} {'Test':<11} {'Size':>5} {'Firmware':<12} "
+              + ' '.join(f'{h:>14}' for h in headers))
+        for row in rows:
+            values = ' '.join(f"{row[h]:>14.3f}" if row[h] is not None else f"{'-':>14}" for h in headers)
+            print(f"{row['run_date'] or '-':<11} {row['topology'] or '-':<9} {row['test_type'] or '-':<11} "
+                  f"{row['msg_size'] or '-':>5} {row['firmware'] or '-':<12} {values}")
+        print(f"\n{len(rows)} runs in {elapsed * 1000:.2f} ms")
+
+        if args.merge:
+            from .fulllog import SOCKPERF_PERCENTILES
+            merged = store.merged_histogram(topology=args.topology, msg_size=args.msg_size,
+                                            test_type=args.test_type, firmware=args.firmware,
+                                            since=args.since, until=args.until, days=args.days)
+            print(f"\nMerged histogram: {merged.count:,} observations, "
+                  f"avg {merged.mean:.3f} μs, std-dev {merged.std_dev_us:.3f} μs")
+            for p, v in merged.percentiles(SOCKPERF_PERCENTILES).items():
+                print(f"  percentile {p:>7.3f} = {v:9.3f}" if v is not None else f"  percentile {p:>7.3f} = -")
+    store.close()
+
+
+if __name__ == '__main__':
+    main()
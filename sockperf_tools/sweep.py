@@ -0,0 +1,343 @@
+"""
+Load-sweep analysis: latency against offered load, and where it bends.
+
+A sweep is a set of under-load runs of one configuration at increasing
+--mps rates (a matrix entry with an "mps" list produces one). The runs are
+grouped by (topology, protocol, payload) into a curve: offered and achieved
+message rate, and latency at each of SWEEP_PERCENTILES. Repeated runs at one
+rate are averaged.
+
+The knee is found by fitting the continuous two-segment model
+
+    latency = a + b * rate + c * max(rate - k, 0)
+
+for every candidate knot k on a grid between the second and second-to-last
+rate. The normal equations of every candidate and every percentile are
+solved in one batched np.linalg.solve. The knot with the smallest squared
+error wins. The fit reports the knee rate, the fitted latency there, the
+slopes before and after (μs per 1000 msg/s), and the share of the
+single-line error it removes. A knee only counts when that share is at
+least MIN_GAIN and the slope after it is positive and at least
+MIN_SLOPE_RATIO times the magnitude of the slope before.
+
+A throughput run of the same configuration and payload gives the ceiling:
+the highest rate the path sustains.
+
+Usage:
+    python -m sockperf_tools.sweep results/ [--percentiles 50,99,99.9] [-o load_sweep.png]
+"""
+
+import math
+
+from .render import Panel, pick, render_dashboard
+
+DEFAULT_OUTPUT = 'load_sweep.png'
+SWEEP_PERCENTILES = (50.0, 99.0, 99.9)
+KNEE_GRID = 128
+MIN_POINTS = 4     # a two-segment fit needs two rates on each side
+MIN_GAIN = 0.5     # share of the straight-line error the knee must explain
+MIN_SLOPE_RATIO = 3.0
+TITLE = 'LAN9662 Load Sweep: Latency vs Offered Load'
+
+
+def achieved_rate(result):
+    """Messages per second the client actually sent (over the valid duration when printed)"""
+    server = result.servers[0] if result.servers else None
+    if server and server.valid_sent and server.valid_run_time_sec:
+        return server.valid_sent / server.valid_run_time_sec
+    if result.sent_messages and result.run_time_sec:
+        return result.sent_messages / result.run_time_sec
+    return math.nan
+
+
+def offered_rate(result):
+    """Offered load in msg/s: --mps when given, otherwise the achieved rate"""
+    if isinstance(result.mps, int) and result.mps > 0:
+        return float(result.mps)
+    return achieved_rate(result)
+
+
+def sweep_key(result):
+    return result.topology or 'dual', result.protocol or '-', result.msg_size
+
+
+def sweep_curves(results, percentiles=SWEEP_PERCENTILES):
+    """{(topology, protocol, msg_size): curve} for under-load runs.
+
+    A curve holds 'offered' and 'achieved' rates (ascending), 'latency'
+    (rates x percentiles), 'avg' and 'runs' per rate, 'percentiles', and
+    'ceiling': the msg/s of a throughput run of the same configuration and
+    payload.
+    """
+    import numpy as np
+
+    groups, ceilings = {}, {}
+    for result in results:
+        if result.test_type == 'under-load' and 'avg_latency_us' in result:
+            groups.setdefault(sweep_key(result), []).append(result)
+        elif result.test_type == 'throughput' and result.msg_rate:
+            key = sweep_key(result)
+            ceilings[key] = max(ceilings.get(key, 0.0), result.msg_rate)
+
+    curves = {}
+    for key, runs in groups.items():
+        rows = np.array([[offered_rate(r), achieved_rate(r), r.avg_latency_us]
+                         + [(r.percentiles or {}).get(float(p), math.nan) for p in percentiles] for r in runs])
+        rates, index = np.unique(rows[:, 0], return_inverse=True)
+        counts = np.bincount(index)
+        # Average repeats: sort rows by rate and sum each rate's block
+        order = np.argsort(index, kind='stable')
+        means = np.add.reduceat(rows[order], np.r_[0, np.cumsum(counts)[:-1]], axis=0) / counts[:, None]
+        curves[key] = {
+            'offered': rates,
+            'achieved': means[:, 1],
+            'avg': means[:, 2],
+            'latency': means[:, 3:],
+            'runs': counts,
+            'percentiles': tuple(float(p) for p in percentiles),
+            'ceiling': ceilings.get(key),
+        }
+    return curves
+
+
+def find_knee(x, y, grid=KNEE_GRID):
+    """Two-segment fit of every column of y (points x columns) against x.
+
+    Returns a dict of arrays with one entry per column: 'knee' (rate),
+    'latency' (fitted value at the knee), 'slope_before', 'slope_after',
+    'gain' (share of the straight-line squared error removed) and
+    'significant'. All NaN when there are fewer than MIN_POINTS rates.
+    """
+    import numpy as np
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    y = y[:, None] if y.ndim == 1 else y
+    columns = y.shape[1]
+    valid = np.isfinite(y).all(axis=1) & np.isfinite(x)
+    x, y = x[valid], y[valid]
+    if len(x) < MIN_POINTS:
+        nan = np.full(columns, np.nan)
+        return {'knee': nan, 'latency': nan.copy(), 'slope_before': nan.copy(), 'slope_after': nan.copy(),
+                'gain': nan.copy(), 'significant': np.zeros(columns, dtype=bool)}
+
+    # Rates in thousands of msg/s keep the normal equations well conditioned
+    scale = 1000.0
+    xs = x / scale
+    knots = np.linspace(xs[1], xs[-2], grid)
+    design = np.empty((grid, len(xs), 3))
+    design[:, :, 0] = 1.0
+    design[:, :, 1] = xs
+    design[:, :, 2] = np.maximum(xs[None, :] - knots[:, None], 0.0)
+    gram = np.einsum('kni,knj->kij', design, design)
+    moments = np.einsum('kni,nc->kic', design, y)
+    beta = np.linalg.solve(gram, moments)                              # (grid, 3, columns)
+    residual = np.einsum('kni,kic->knc', design, beta) - y[None]
+    errors = np.einsum('knc,knc->kc', residual, residual)               # (grid, columns)
+    best = errors.argmin(axis=0)
+    cols = np.arange(columns)
+    a, b, c = (beta[best, i, cols] for i in range(3))
+
+    line = np.polynomial.polynomial.polyfit(xs, y, 1)                  # (2, columns)
+    line_error = ((line[0] + np.outer(xs, line[1]) - y) ** 2).sum(axis=0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        gain = np.where(line_error > 0, 1 - errors[best, cols] / line_error, 0.0)
+    knee = knots[best]
+    return {
+        'knee': knee * scale,
+        'latency': a + b * knee,
+        'slope_before': b,
+        'slope_after': b + c,
+        'gain': gain,
+        'significant': (gain >= MIN_GAIN) & (b + c > 0) & (b + c >= MIN_SLOPE_RATIO * np.abs(b)),
+    }
+
+
+def knees(curves):
+    """find_knee of every curve: {key: fit}"""
+    return {key: find_knee(curve['offered'], curve['latency']) for key, curve in curves.items()}
+
+
+def compare_topologies(curves, baseline='dual', candidate='single'):
+    """Latency difference (baseline - candidate) on the rates both sweeps cover.
+
+    Returns {(protocol, msg_size): {'rates', 'percentiles', 'delta' (rates x
+    percentiles), 'knee_delta' (per percentile, NaN unless both knees are
+    significant)}}.
+    """
+    import numpy as np
+
+    fits = knees(curves)
+    out = {}
+    for (topology, protocol, size), base in curves.items():
+        other = curves.get((candidate, protocol, size))
+        if topology != baseline or other is None:
+            continue
+        lo = max(base['offered'][0], other['offered'][0])
+        hi = min(base['offered'][-1], other['offered'][-1])
+        rates = np.union1d(base['offered'], other['offered'])
+        rates = rates[(rates >= lo) & (rates <= hi)]
+        delta = np.column_stack([
+            np.interp(rates, base['offered'], base['latency'][:, i])
+            - np.interp(rates, other['offered'], other['latency'][:, i])
+            for i in range(len(base['percentiles']))])
+        a, b = fits[topology, protocol, size], fits[candidate, protocol, size]
+        both = a['significant'] & b['significant']
+        out[protocol, size] = {'rates': rates, 'percentiles': base['percentiles'], 'delta': delta,
+                               'knee_delta': np.where(both, a['knee'] - b['knee'], np.nan)}
+    return out
+
+
+def _curve_name(key):
+    topology, protocol, size = key
+    return f"{topology.title()} {protocol} {f'{size}B' if size else 'default'}"
+
+
+def _draw_latency_vs_load(ax, runs):
+    """Latency per percentile against offered load, knees marked"""
+    curves = sweep_curves(runs.values())
+    fits = knees(curves)
+    for i, (key, curve) in enumerate(sorted(curves.items(), key=lambda item: str(item[0]))):
+        for j, p in enumerate(curve['percentiles']):
+            style = ('-', '--', ':', '-.')[j % 4]
+            ax.plot(curve['offered'], curve['latency'][:, j], style, marker='o', markersize=4, color=f'C{i}',
+                    label=f"{_curve_name(key)} p{p:g}")
+            fit = fits[key]
+            if fit['significant'][j]:
+                ax.plot(fit['knee'][j], fit['latency'][j], 'x', color=f'C{i}', markersize=10, mew=2)
+    ax.set_xlabel('Offered Load (msg/s)', fontsize=11)
+    ax.set_ylabel('Latency (μs)', fontsize=11)
+    ax.set_title('Latency vs Offered Load (× = knee)', fontsize=12, fontweight='bold')
+    ax.legend(fontsize=7)
+    ax.grid(alpha=0.3)
+
+
+def _draw_achieved(ax, runs):
+    """Achieved against offered rate, with each configuration's throughput ceiling"""
+    curves = sweep_curves(runs.values())
+    top = 0.0
+    for i, (key, curve) in enumerate(sorted(curves.items(), key=lambda item: str(item[0]))):
+        ax.plot(curve['offered'], curve['achieved'], 'o-', color=f'C{i}', markersize=4, label=_curve_name(key))
+        if curve['ceiling']:
+            ax.axhline(curve['ceiling'], color=f'C{i}', linestyle=':', linewidth=1)
+        top = max(top, curve['offered'].max())
+    if top:
+        ax.plot([0, top], [0, top], color='gray', linewidth=0.8, alpha=0.6, label='offered = achieved')
+    ax.set_xlabel('Offered Load (msg/s)', fontsize=11)
+    ax.set_ylabel('Achieved (msg/s)', fontsize=11)
+    ax.set_title('Achieved Rate (dotted: throughput ceiling)', fontsize=12, fontweight='bold')
+    ax.legend(fontsize=8)
+    ax.grid(alpha=0.3)
+
+
+def _draw_knees(ax, runs):
+    """Knee rate per percentile for each configuration"""
+    import numpy as np
+
+    curves = sweep_curves(runs.values())
+    fits = knees(curves)
+    keys = sorted(curves, key=str)
+    if not keys:
+        ax.set_title('Knee Rate per Percentile', fontsize=12, fontweight='bold')
+        return
+    percentiles = curves[keys[0]]['percentiles']
+    x = np.arange(len(percentiles))
+    width = 0.8 / len(keys)
+    for i, key in enumerate(keys):
+        fit = fits[key]
+        heights = np.where(fit['significant'], fit['knee'], 0.0)
+        bars = ax.bar(x + (i - (len(keys) - 1) / 2) * width, heights, width, color=f'C{i}', label=_curve_name(key))
+        for bar, significant in zip(bars, fit['significant']):
+            if not significant:
+                ax.text(bar.get_x() + bar.get_width() / 2, 0, 'no knee', ha='center', va='bottom',
+                        rotation=90, fontsize=8)
+    ax.set_xticks(x)
+    ax.set_xticklabels([f'p{p:g}' for p in percentiles])
+    ax.set_ylabel('Knee (msg/s)', fontsize=11)
+    ax.set_title('Knee Rate per Percentile', fontsize=12, fontweight='bold')
+    ax.legend(fontsize=8)
+    ax.grid(axis='y', alpha=0.3)
+
+
+PANELS = (
+    Panel(_draw_latency_vs_load, lambda runs: (pick(runs, lambda label, result: result.test_type == 'under-load'),)),
+    Panel(_draw_achieved, lambda runs: (runs,)),
+    Panel(_draw_knees, lambda runs: (pick(runs, lambda label, result: result.test_type == 'under-load'),)),
+)
+
+
+def load_sweep(paths, jobs=None, cache=None):
+    """{filename: result} of the under-load and throughput runs under paths (every run kept, repeats too)"""
+    from .batch import discover, parse_files
+
+    return {result.filename: result for result in parse_files(discover(paths), jobs, cache)
+            if result.test_type in ('under-load', 'throughput')}
+
+
+def render_sweep(runs, output=DEFAULT_OUTPUT, dpi=300, fmt=None, jobs=None, cache_dir=None):
+    """Render the load-sweep dashboard for {filename: result}"""
+    drawn, reused = render_dashboard(PANELS, (runs,), (1, 3), (18, 6), TITLE, output, dpi, fmt, jobs, cache_dir)
+    print(f"\n✓ Load sweep saved as {output} ({drawn} panels drawn, {reused} reused)")
+
+
+def print_sweep(curves, fits, comparison):
+    """Console report of sweep curves, knees and the dual/single comparison"""
+    for key in sorted(curves, key=str):
+        curve, fit = curves[key], fits[key]
+        print(f"\n{_curve_name(key)}: {len(curve['offered'])} rates, {int(curve['runs'].sum())} runs"
+              + (f", throughput ceiling {curve['ceiling']:,.0f} msg/s" if curve['ceiling'] else ''))
+        header = ''.join(f"{f'p{p:g} (μs)':>12}" for p in curve['percentiles'])
+        print(f"  {'Offered':>10} {'Achieved':>10}{header}")
+        for i, rate in enumerate(curve['offered']):
+            values = ''.join(f"{v:>12.2f}" for v in curve['latency'][i])
+            print(f"  {rate:>10,.0f} {curve['achieved'][i]:>10,.0f}{values}")
+        for j, p in enumerate(curve['percentiles']):
+            if fit['significant'][j]:
+                print(f"  p{p:g} knee at {fit['knee'][j]:,.0f} msg/s ({fit['latency'][j]:.1f} μs): "
+                      f"{fit['slope_before'][j]:.2f} → {fit['slope_after'][j]:.2f} μs per 1000 msg/s")
+            else:
+                print(f"  p{p:g}: no knee in the swept range")
+    for (protocol, size), diff in comparison.items():
+        print(f"\nDual - single, {protocol} {f'{size}B' if size else 'default'} "
+              f"({len(diff['rates'])} common rates):")
+        if len(diff['rates']):
+            mean = diff['delta'].mean(axis=0)
+            print("  mean latency delta: " + ', '.join(f"p{p:g} {d:+.2f} μs"
+                                                        for p, d in zip(diff['percentiles'], mean)))
+        print("  knee delta: " + ', '.join(f"p{p:g} " + ('-' if math.isnan(d) else f"{d:+,.0f} msg/s")
+                                           for p, d in zip(diff['percentiles'], diff['knee_delta'])))
+
+
+def main(argv=None):
+    import argparse
+
+    from .batch import DEFAULT_PATTERN, default_cache
+    from .cache import cache_enabled, default_cache_dir
+
+    ap = argparse.ArgumentParser(description="Latency-vs-load curves and knee detection over under-load sweeps")
+    ap.add_argument('paths', nargs='*', default=[DEFAULT_PATTERN], help="result files, directories or globs")
+    ap.add_argument('--percentiles', default=','.join(f'{p:g}' for p in SWEEP_PERCENTILES),
+                    help="percentiles of the console report")
+    ap.add_argument('-o', '--output', default=DEFAULT_OUTPUT, help=f"image file (default {DEFAULT_OUTPUT})")
+    ap.add_argument('--dpi', type=int, default=300)
+    ap.add_argument('-j', '--jobs', type=int, help="parsing and rendering processes (default: all cores)")
+    ap.add_argument('--no-plot', action='store_true')
+    args = ap.parse_args(argv)
+
+    percentiles = tuple(float(p) for p in args.percentiles.split(','))
+    cache = default_cache()
+    runs = load_sweep(args.paths, args.jobs, cache)
+    curves = sweep_curves(runs.values(), percentiles)
+    if not curves:
+        print("No under-load runs found")
+        return
+    print_sweep(curves, knees(curves), compare_topologies(curves))
+    if not args.no_plot:
+        render_sweep(runs, args.output, args.dpi, jobs=args.jobs,
+                     cache_dir=default_cache_dir() if cache_enabled() else None)
+    if cache:
+        cache.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,420 @@
+"""
+Latency over time from full-log samples.
+
+The dashboards summarise a run as bars and percentile curves, so a transient
+such as the 551 μs maximum of a 47 μs run cannot be placed in time. This
+module streams a full log (CSV or .sps) chunk by chunk and
+
+    bin_series       bins samples into fixed windows of send time: per-window
+                     count, msgs/s, mean, p50, p99 and max (nearest rank,
+                     exact); empty windows are kept as NaN gaps
+    lttb / minmax    pick the indices of a series worth plotting: Largest
+                     Triangle Three Buckets keeps the visual shape, min/max
+                     decimation keeps every bucket's extremes (so no spike
+                     is ever dropped)
+    downsample_log   streams a whole log down to a few thousand points in
+                     O(chunk + points) memory: per-time-bucket min/max, then
+                     LTTB over those candidates when method is 'lttb'
+
+Each window's samples are sorted once, so memory is bounded by the chunk
+size plus the largest window, not by the run. The default window splits the
+run into about DEFAULT_BINS windows on a 1-2-5 scale.
+
+The draw_* functions are dashboard panels over {label: result} runs that
+have a full log; overview and comparison add them as an extra row. NumPy is
+imported on first use, as in the other panel modules, so the text summary
+stays light.
+
+Usage:
+    python -m sockperf_tools.timeseries sockperf_pingpong_udp.csv [--window 0.01] [--csv series.csv]
+"""
+
+import functools
+import math
+
+DEFAULT_BINS = 300
+DEFAULT_POINTS = 2000
+LTTB_CANDIDATES = 4  # min/max candidates per LTTB output point
+SERIES_PERCENTILES = (50.0, 99.0)
+_TAIL_BYTES = 1 << 16
+
+
+def window_for(span_s, bins=DEFAULT_BINS):
+    """Smallest 1-2-5 window (seconds, at least 1 μs) that splits span_s into at most `bins` windows"""
+    raw = max(span_s / bins, 1e-6)
+    scale = 10.0 ** math.floor(math.log10(raw))
+    for step in (1, 2, 5, 10):
+        if step * scale >= raw * (1 - 1e-9):
+            return step * scale
+    return 10 * scale
+
+
+def log_span(filename):
+    """(first, last) send time of a full log in ns, without reading it all"""
+    from .fulllog import _data_lines, _is_fixed_ns, _parse_block, iter_full_log
+    from .samples import SampleFile, is_sample_file
+
+    if is_sample_file(filename):
+        samples = SampleFile(filename)
+        if not len(samples):
+            return None
+        return int(samples.tx_ns[0]), int(samples.tx_ns[-1])
+    first = next(iter_full_log(filename, _TAIL_BYTES), None)
+    if first is None:
+        return None
+    with open(filename, 'rb') as f:
+        size = f.seek(0, 2)
+        f.seek(max(size - _TAIL_BYTES, 0))
+        tail = f.read()
+    if size > _TAIL_BYTES:
+        tail = tail[tail.find(b'\n') + 1:]  # drop the partial first line
+    block = _data_lines(tail).strip() + b'\n'
+    _, tx, _ = _parse_block(block, _is_fixed_ns(block))
+    return int(first[1][0]), int(tx[-1]) if len(tx) else int(first[1][-1])
+
+
+def _window_stats(windows, latencies, percentiles):
+    """Per-window statistics of nondecreasing window ids"""
+    import numpy as np
+
+    order = np.lexsort((latencies, windows))
+    latencies = latencies[order]
+    windows = windows[order]
+    starts = np.flatnonzero(np.r_[True, windows[1:] != windows[:-1]])
+    counts = np.diff(np.r_[starts, len(windows)])
+    stats = {
+        'window': windows[starts],
+        'count': counts,
+        'mean_us': np.add.reduceat(latencies, starts) / counts,
+        'max_us': latencies[starts + counts - 1],
+    }
+    for p in percentiles:
+        rank = np.clip(np.ceil(p / 100.0 * counts).astype(np.int64) - 1, 0, counts - 1)
+        stats[f'p{p:g}_us'] = latencies[starts + rank]
+    return stats
+
+
+def bin_series(filename, window_s=None, percentiles=SERIES_PERCENTILES, round_trip=True, chunk_bytes=None):
+    """Bin a full log into windows of send time.
+
+    Returns {'window_s', 'start_ns', 'time_s' (window starts from the first
+    send), 'count', 'msg_rate', 'mean_us', 'max_us', 'p50_us', 'p99_us'}
+    as arrays with one entry per window, or None for an empty log. The last
+    window may be partial.
+    """
+    import numpy as np
+
+    from .fulllog import CHUNK_BYTES, iter_full_log
+
+    if window_s is None:
+        span = log_span(filename)
+        if span is None:
+            return None
+        window_s = window_for((span[1] - span[0]) / 1e9)
+    window_ns = max(int(round(window_s * 1e9)), 1)
+    scale = 0.5e-3 if round_trip else 1e-3
+
+    parts = []
+    start = None
+    floor = 0
+    carry = None
+    for _, tx, rx in iter_full_log(filename, chunk_bytes or CHUNK_BYTES):
+        if start is None:
+            start = int(tx[0])
+        windows = (tx - start) // window_ns
+        # Send times should not go backwards, but a window already emitted is final
+        np.maximum.accumulate(windows, out=windows)
+        np.maximum(windows, floor, out=windows)
+        latencies = (rx - tx) * scale
+        if carry is not None:
+            windows = np.concatenate([carry[0], windows])
+            latencies = np.concatenate([carry[1], latencies])
+        floor = int(windows[-1])
+        done = int(np.searchsorted(windows, floor))
+        if done:
+            parts.append(_window_stats(windows[:done], latencies[:done], percentiles))
+        carry = windows[done:], latencies[done:]
+    if start is None:
+        return None
+    parts.append(_window_stats(carry[0], carry[1], percentiles))
+
+    ids = np.concatenate([part['window'] for part in parts])
+    n = int(ids[-1]) + 1
+    series = {'window_s': window_ns / 1e9, 'start_ns': start, 'time_s': np.arange(n) * (window_ns / 1e9)}
+    count = np.zeros(n, dtype=np.int64)
+    count[ids] = np.concatenate([part['count'] for part in parts])
+    series['count'] = count
+    series['msg_rate'] = count / (window_ns / 1e9)
+    for key in parts[0]:
+        if key not in ('window', 'count'):
+            values = np.full(n, np.nan)
+            values[ids] = np.concatenate([part[key] for part in parts])
+            series[key] = values
+    return series
+
+
+def minmax(y, buckets):
+    """Indices of the minimum and maximum of each of `buckets` equal-count buckets of y, plus both ends"""
+    import numpy as np
+
+    y = np.asarray(y)
+    n = len(y)
+    if n <= 2 * buckets + 2:
+        return np.arange(n)
+    size = -(-n // buckets)
+    full = n // size * size
+    view = y[:full].reshape(-1, size)
+    offsets = np.arange(0, full, size)
+    picks = [offsets + view.argmin(axis=1), offsets + view.argmax(axis=1), [0, n - 1]]
+    if full < n:
+        picks.append([full + int(y[full:].argmin()), full + int(y[full:].argmax())])
+    return np.unique(np.concatenate(picks))
+
+
+def lttb(x, y, points):
+    """Indices of the `points` samples that Largest Triangle Three Buckets keeps (first and last included)"""
+    import numpy as np
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    if points >= n or points < 3:
+        return np.arange(n)
+    edges = (np.arange(points - 1) * ((n - 2) / (points - 2))).astype(np.int64) + 1
+    edges[-1] = n - 1
+    picked = np.empty(points, dtype=np.int64)
+    picked[0], picked[-1] = 0, n - 1
+    a = 0
+    for i in range(points - 2):
+        lo, hi = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            cx, cy = x[hi:edges[i + 2]].mean(), y[hi:edges[i + 2]].mean()
+        else:
+            cx, cy = x[-1], y[-1]
+        # Twice the area of the triangle (previous pick, candidate, next bucket's mean)
+        area = np.abs((x[a] - cx) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (cy - y[a]))
+        a = lo + int(area.argmax())
+        picked[i + 1] = a
+    return picked
+
+
+def downsample(x, y, points=DEFAULT_POINTS, method='minmax'):
+    """(x, y) reduced to about `points` samples with 'minmax' or 'lttb' (min/max preselection, then LTTB)"""
+    import numpy as np
+
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if method == 'lttb':
+        candidates = minmax(y, points * LTTB_CANDIDATES // 2)
+        keep = candidates[lttb(x[candidates], y[candidates], points)]
+    elif method == 'minmax':
+        keep = minmax(y, max((points - 2) // 2, 1))
+    else:
+        raise ValueError(f"unknown downsampling method {method!r}")
+    return x[keep], y[keep]
+
+
+def downsample_log(filename, points=DEFAULT_POINTS, method='minmax', round_trip=True, chunk_bytes=None):
+    """(time_s, latency_us) of about `points` samples of a whole full log, streamed.
+
+    Each of the time buckets keeps its minimum and maximum sample; 'lttb'
+    uses LTTB_CANDIDATES times as many buckets and then LTTB.
+    """
+    import numpy as np
+
+    from .fulllog import CHUNK_BYTES, iter_full_log
+
+    if method not in ('minmax', 'lttb'):
+        raise ValueError(f"unknown downsampling method {method!r}")
+    span = log_span(filename)
+    if span is None:
+        return np.empty(0), np.empty(0)
+    buckets = max(points * (LTTB_CANDIDATES if method == 'lttb' else 1) // 2, 1)
+    first, last = span
+    width = (last - first) / buckets or 1.0
+    scale = 0.5e-3 if round_trip else 1e-3
+    low = np.full(buckets, np.inf)
+    high = np.full(buckets, -np.inf)
+    low_t = np.zeros(buckets, dtype=np.int64)
+    high_t = np.zeros(buckets, dtype=np.int64)
+    for _, tx, rx in iter_full_log(filename, chunk_bytes or CHUNK_BYTES):
+        bucket = np.clip(((tx - first) / width).astype(np.int64), 0, buckets - 1)
+        latencies = (rx - tx) * scale
+        order = np.lexsort((latencies, bucket))
+        bucket = bucket[order]
+        starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+        ends = np.r_[starts[1:], len(bucket)] - 1
+        ids = bucket[starts]
+        for pos, values, times, better in ((starts, low, low_t, np.less), (ends, high, high_t, np.greater)):
+            candidate = latencies[order[pos]]
+            update = better(candidate, values[ids])
+            values[ids[update]] = candidate[update]
+            times[ids[update]] = tx[order[pos[update]]]
+    filled = np.isfinite(low)
+    times = np.concatenate([low_t[filled], high_t[filled]])
+    values = np.concatenate([low[filled], high[filled]])
+    order = np.lexsort((values, times))
+    times, values = (times[order] - first) / 1e9, values[order]
+    if method == 'lttb':
+        keep = lttb(times, values, points)
+        times, values = times[keep], values[keep]
+    return times, values
+
+
+@functools.lru_cache(maxsize=32)
+def _cached(kind, filename, stamp, argument):
+    if kind == 'series':
+        return bin_series(filename, argument)
+    return downsample_log(filename, argument)
+
+
+def _stamp(filename):
+    stat = filename.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def series_for(result, window_s=None):
+    """bin_series of a result's full log (memoised per file version), or None"""
+    from .parser import full_log_path
+
+    log_file = full_log_path(result.filename)
+    return _cached('series', str(log_file), _stamp(log_file), window_s) if log_file else None
+
+
+def samples_for(result, points=DEFAULT_POINTS):
+    """downsample_log of a result's full log (min/max, memoised per file version), or None"""
+    from .parser import full_log_path
+
+    log_file = full_log_path(result.filename)
+    return _cached('samples', str(log_file), _stamp(log_file), points) if log_file else None
+
+
+def full_log_runs(results, prefix='', limit=None):
+    """{prefix + label: result} of the latency runs that have a full log"""
+    from .parser import full_log_path
+
+    runs = {prefix + label: result for label, result in results.items()
+            if 'avg_latency_us' in result and full_log_path(result.filename)}
+    return dict(list(runs.items())[:limit])
+
+
+def has_full_log(*groups):
+    """True if any latency run in the {label: result} groups has a full log"""
+    return any(full_log_runs(results) for results in groups)
+
+
+def _no_runs(ax, title):
+    ax.text(0.5, 0.5, 'No full-log runs', ha='center', va='center', transform=ax.transAxes)
+    ax.set_title(title, fontsize=12, fontweight='bold')
+
+
+def draw_latency_over_time(ax, runs):
+    """Windowed p99 (solid) and max (dotted) latency of each run"""
+    title = 'Latency over Time (p99 / max)'
+    if not runs:
+        return _no_runs(ax, title)
+    for i, (label, result) in enumerate(runs.items()):
+        series = series_for(result)
+        ax.plot(series['time_s'], series['p99_us'], color=f'C{i}', linewidth=1.2, label=f'{label} p99')
+        ax.plot(series['time_s'], series['max_us'], color=f'C{i}', linewidth=0.8, linestyle=':',
+                label=f'{label} max')
+    ax.set_xlabel('Time (s)', fontsize=11)
+    ax.set_ylabel('Latency (μs)', fontsize=11)
+    ax.set_title(f'{title}, {series["window_s"] * 1000:g} ms windows', fontsize=12, fontweight='bold')
+    ax.legend(fontsize=8)
+    ax.grid(alpha=0.3)
+
+
+def draw_samples_over_time(ax, runs):
+    """Min/max-decimated raw samples of each run, with the largest one marked"""
+    title = 'Every Sample over Time (min/max decimated)'
+    if not runs:
+        return _no_runs(ax, title)
+    for i, (label, result) in enumerate(runs.items()):
+        times, values = samples_for(result)
+        if not len(values):
+            continue
+        ax.plot(times, values, color=f'C{i}', linewidth=0.5, alpha=0.8, label=label)
+        peak = int(values.argmax())
+        ax.annotate(f'{values[peak]:.0f} μs @ {times[peak]:.2f} s', (times[peak], values[peak]),
+                    xytext=(5, -12), textcoords='offset points', fontsize=8, color=f'C{i}')
+    ax.set_xlabel('Time (s)', fontsize=11)
+    ax.set_ylabel('Latency (μs)', fontsize=11)
+    ax.set_title(title, fontsize=12, fontweight='bold')
+    ax.legend(fontsize=8)
+    ax.grid(alpha=0.3)
+
+
+def draw_rate_over_time(ax, runs):
+    """Logged messages per second in each window"""
+    title = 'Message Rate over Time'
+    if not runs:
+        return _no_runs(ax, title)
+    for i, (label, result) in enumerate(runs.items()):
+        series = series_for(result)
+        ax.step(series['time_s'], series['msg_rate'], where='post', color=f'C{i}', linewidth=1, label=label)
+    ax.set_xlabel('Time (s)', fontsize=11)
+    ax.set_ylabel('Logged msgs/s', fontsize=11)
+    ax.set_title(title, fontsize=12, fontweight='bold')
+    ax.legend(fontsize=8)
+    ax.grid(alpha=0.3)
+
+
+def write_csv(series, filename):
+    """Write a bin_series result as CSV, one row per window"""
+    import numpy as np
+
+    columns = [key for key in series if isinstance(series[key], np.ndarray)]
+    with open(filename, 'w') as f:
+        f.write(','.join(columns) + '\n')
+        np.savetxt(f, np.column_stack([series[key] for key in columns]), delimiter=',', fmt='%.6g')
+
+
+def main(argv=None):
+    import argparse
+    import time
+
+    import numpy as np
+
+    ap = argparse.ArgumentParser(description="Latency over time from full-log samples")
+    ap.add_argument('files', nargs='+', help="--full-log CSV or .sps sample files")
+    ap.add_argument('--window', type=float, help=f"window in seconds (default: about {DEFAULT_BINS} per run)")
+    ap.add_argument('--top', type=int, default=5, help="windows to list, worst max first")
+    ap.add_argument('--csv', metavar='FILE', help="write the series of the (last) file as CSV")
+    ap.add_argument('--points', type=int, default=DEFAULT_POINTS, help="samples kept by --samples")
+    ap.add_argument('--method', choices=['minmax', 'lttb'], default='minmax', help="downsampling for --samples")
+    ap.add_argument('--samples', metavar='FILE', help="write the downsampled raw samples of the (last) file as CSV")
+    args = ap.parse_args(argv)
+
+    for filename in args.files:
+        start = time.perf_counter()
+        series = bin_series(filename, args.window)
+        elapsed = time.perf_counter() - start
+        print(f"\n{filename}:")
+        if series is None:
+            print("  No samples")
+            continue
+        logged = series['count'] > 0
+        print(f"  {len(series['count']):,} windows of {series['window_s'] * 1000:g} ms, "
+              f"{int(series['count'].sum()):,} samples (binned in {elapsed * 1000:.0f} ms)")
+        print(f"  Logged rate: {series['msg_rate'][logged].min():,.0f} - {series['msg_rate'][logged].max():,.0f} msgs/s, "
+              f"{int((~logged).sum())} empty windows")
+        print(f"  {'Start (s)':>10} {'Count':>8} {'p50 (μs)':>10} {'p99 (μs)':>10} {'Max (μs)':>10}")
+        for i in np.argsort(np.where(logged, series['max_us'], -np.inf))[::-1][:args.top]:
+            print(f"  {series['time_s'][i]:>10.3f} {series['count'][i]:>8,} {series['p50_us'][i]:>10.3f} "
+                  f"{series['p99_us'][i]:>10.3f} {series['max_us'][i]:>10.3f}")
+        if args.csv:
+            write_csv(series, args.csv)
+        if args.samples:
+            times, values = downsample_log(filename, args.points, args.method)
+            with open(args.samples, 'w') as f:
+                f.write('time_s,latency_us\n')
+                np.savetxt(f, np.column_stack([times, values]), delimiter=',', fmt='%.9g')
+    if args.csv:
+        print(f"\n✓ Series written to {args.csv}")
+    if args.samples:
+        print(f"✓ Downsampled samples written to {args.samples}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,332 @@
+"""
+Live view of a sockperf run while it is still going.
+
+Tails a growing --full-log CSV (or a summary file whose sibling .csv is
+growing) and keeps:
+
+* running count / mean / variance / min / max (Welford, merged per chunk),
+* whole-run quantiles from a LatencyHistogram (constant memory),
+* a sliding window of the last N seconds of tx time, one small histogram
+  and Welford accumulator per second, for drift, windowed percentiles,
+  spike counts and message rate.
+
+Each refresh only parses the bytes appended since the last one, and the cost
+of a refresh is bounded by the window size, never by the number of samples
+seen so far. A summary file without a full log is tailed as text and shown
+once sockperf prints its statistics.
+
+Usage:
+    python -m sockperf_tools.watch sockperf_soak.csv [--window 10] [--html live.html]
+"""
+
+import math
+import os
+import sys
+import time
+from collections import deque
+from pathlib import Path
+
+import numpy as np
+
+from .fulllog import FullLogTail
+from .histogram import LatencyHistogram
+
+DEFAULT_INTERVAL = 1.0
+DEFAULT_WINDOW = 10  # seconds
+HISTORY = 600  # per-second points kept for the HTML sparkline
+
+# A sample is a spike when it exceeds the running mean by this many std-devs
+SPIKE_SIGMA = 6.0
+
+_WINDOW_HIGHEST_US = 1_000_000
+
+
+class RunningStats:
+    """Welford accumulator for count, mean and variance, plus min/max"""
+
+    __slots__ = ('count', 'mean', 'm2', 'min', 'max')
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def push(self, value):
+        """Add one sample (Welford's update)"""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def update(self, values):
+        """Add a chunk of samples: the chunk's own moments merged in one step"""
+        if len(values) == 0:
+            return
+        n = len(values)
+        mean = float(values.mean())
+        total = self.count + n
+        delta = mean - self.mean
+        self.m2 += float(((values - mean) ** 2).sum()) + delta * delta * self.count * n / total
+        self.mean += delta * n / total
+        self.count = total
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+
+    @property
+    def std_dev(self):
+        return math.sqrt(self.m2 / self.count) if self.count else 0.0
+
+
+class LiveStats:
+    """Online statistics over a stream of (tx_ns, rx_ns) samples"""
+
+    def __init__(self, window=DEFAULT_WINDOW, round_trip=True):
+        self.window = window
+        self.scale = 0.5e-3 if round_trip else 1e-3
+        self.total = RunningStats()
+        self.histogram = LatencyHistogram()
+        self.spikes = 0
+        # second of tx time -> (RunningStats, LatencyHistogram, spikes), oldest first
+        self.seconds = {}
+        self.history = deque(maxlen=HISTORY)
+        self.first_tx_ns = None
+        self.last_tx_ns = None
+
+    def add(self, tx_ns, rx_ns):
+        if len(tx_ns) == 0:
+            return
+        latencies = (rx_ns - tx_ns) * self.scale
+        threshold = (self.total.mean + SPIKE_SIGMA * self.total.std_dev
+                     if self.total.count > 1000 else math.inf)
+        if self.first_tx_ns is None:
+            self.first_tx_ns = int(tx_ns[0])
+        self.last_tx_ns = max(self.last_tx_ns or 0, int(tx_ns[-1]))
+        self.total.update(latencies)
+        self.histogram.record(latencies)
+
+        second = tx_ns // 1_000_000_000
+        edges = np.flatnonzero(np.diff(second)) + 1
+        for chunk, sec in zip(np.split(latencies, edges), second[np.r_[0, edges]]):
+            sec = int(sec)
+            if sec not in self.seconds:
+                self.seconds[sec] = (RunningStats(), LatencyHistogram(2, _WINDOW_HIGHEST_US), [0])
+            stats, hist, spikes = self.seconds[sec]
+            stats.update(chunk)
+            hist.record(chunk)
+            over = int((chunk > threshold).sum())
+            spikes[0] += over
+            self.spikes += over
+
+        # Retire seconds that fell out of the window into the sparkline history
+        newest = max(self.seconds)
+        for sec in [s for s in self.seconds if s <= newest - self.window]:
+            stats, _, spikes = self.seconds.pop(sec)
+            self.history.append((sec, stats.mean, stats.max, spikes[0]))
+
+    def snapshot(self):
+        """Current statistics as a plain dict"""
+        window_stats = RunningStats()
+        window_hist = LatencyHistogram(2, _WINDOW_HIGHEST_US)
+        spikes = 0
+        for stats, hist, sec_spikes in self.seconds.values():
+            window_stats.count, window_stats.mean, window_stats.m2 = _merge(window_stats, stats)
+            window_stats.min = min(window_stats.min, stats.min)
+            window_stats.max = max(window_stats.max, stats.max)
+            window_hist.merge(hist)
+            spikes += sec_spikes[0]
+
+        span = len(self.seconds)
+        elapsed = (self.last_tx_ns - self.first_tx_ns) / 1e9 if self.first_tx_ns is not None else 0.0
+        percentiles = (50.0, 99.0, 99.9)
+        return {
+            'observations': self.total.count,
+            'elapsed_sec': elapsed,
+            'avg_latency_us': self.total.mean,
+            'std_dev_us': self.total.std_dev,
+            'min_latency_us': self.total.min if self.total.count else None,
+            'max_latency_us': self.total.max if self.total.count else None,
+            'percentiles': self.histogram.percentiles(percentiles),
+            'spikes': self.spikes,
+            'window_sec': span,
+            'window': {
+                'observations': window_stats.count,
+                'msg_rate': window_stats.count / span if span else 0.0,
+                'avg_latency_us': window_stats.mean,
+                'std_dev_us': window_stats.std_dev,
+                'max_latency_us': window_stats.max if window_stats.count else None,
+                'percentiles': window_hist.percentiles(percentiles),
+                'spikes': spikes,
+            },
+            'history': list(self.history) + [(sec, stats.mean, stats.max, s[0])
+                                             for sec, (stats, _, s) in sorted(self.seconds.items())],
+        }
+
+
+def _merge(a, b):
+    """Chan's combination of two Welford accumulators -> (count, mean, m2)"""
+    total = a.count + b.count
+    if total == 0:
+        return 0, 0.0, 0.0
+    delta = b.mean - a.mean
+    return total, a.mean + delta * b.count / total, a.m2 + b.m2 + delta * delta * a.count * b.count / total
+
+
+def _fmt(value, spec='.2f'):
+    return '-' if value is None else format(value, spec)
+
+
+def render_text(name, snap):
+    """Terminal view of a snapshot"""
+    w = snap['window']
+    pct, wpct = snap['percentiles'], w['percentiles']
+    return '\n'.join([
+        f"sockperf watch: {name}   {snap['elapsed_sec']:.1f} s, {snap['observations']:,} observations",
+        "",
+        f"{'':<16} {'Avg (μs)':>10} {'Std (μs)':>10} {'P50':>10} {'P99':>10} {'P99.9':>10} {'Max (μs)':>10} {'Spikes':>7}",
+        f"{'Whole run':<16} {_fmt(snap['avg_latency_us']):>10} {_fmt(snap['std_dev_us']):>10} "
+        f"{_fmt(pct[50.0]):>10} {_fmt(pct[99.0]):>10} {_fmt(pct[99.9]):>10} "
+        f"{_fmt(snap['max_latency_us']):>10} {snap['spikes']:>7}",
+        f"{'Last ' + str(snap['window_sec']) + ' s':<16} {_fmt(w['avg_latency_us']):>10} {_fmt(w['std_dev_us']):>10} "
+        f"{_fmt(wpct[50.0]):>10} {_fmt(wpct[99.0]):>10} {_fmt(wpct[99.9]):>10} "
+        f"{_fmt(w['max_latency_us']):>10} {w['spikes']:>7}",
+        "",
+        f"Message rate (window): {w['msg_rate']:,.0f} msg/sec",
+    ])
+
+
+def _sparkline(points, width=600, height=80):
+    """Inline SVG polyline of (x, y) points"""
+    if len(points) < 2:
+        return ''
+    xs = [p[0] for p in points]
+    ys = [p[1] for p in points]
+    x0, x1 = min(xs), max(xs) or 1
+    y0, y1 = min(ys), max(ys)
+    sx = width / ((x1 - x0) or 1)
+    sy = height / ((y1 - y0) or 1)
+    coords = ' '.join(f"{(x - x0) * sx:.1f},{height - (y - y0) * sy:.1f}" for x, y in points)
+    return (f'<svg width="{width}" height="{height}"><polyline fill="none" stroke="#e74c3c" '
+            f'stroke-width="1.5" points="{coords}"/></svg>')
+
+
+def render_html(name, snap, interval):
+    """Self-refreshing HTML view of a snapshot"""
+    import html
+
+    history = snap['history']
+    return f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><meta http-equiv="refresh" content="{max(1, round(interval))}">
+<title>sockperf watch: {html.escape(name)}</title>
+<style>body{{font-family:monospace}} td,th{{padding:2px 10px;text-align:right}}</style></head>
+<body><pre>{html.escape(render_text(name, snap))}</pre>
+<h4>Per-second mean latency (μs)</h4>{_sparkline([(s, mean) for s, mean, _, _ in history])}
+<h4>Per-second max latency (μs)</h4>{_sparkline([(s, peak) for s, _, peak, _ in history])}
+</body></html>
+"""
+
+
+def _write_atomic(path, text):
+    tmp = f"{path}.tmp"
+    with open(tmp, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp, path)
+
+
+def _watch_summary(filename, interval, idle_exit, out):
+    """Tail a summary file without a full log until sockperf prints its statistics"""
+    from .parser import parse_text
+
+    offset, text, last_growth = 0, '', time.monotonic()
+    while True:
+        try:
+            with open(filename, 'r', errors='replace') as f:
+                f.seek(offset)
+                new = f.read()
+                offset = f.tell()
+        except FileNotFoundError:
+            new = ''
+        if new:
+            text += new
+            last_growth = time.monotonic()
+        result = parse_text(text, str(filename))
+        if result.avg_latency_us is not None or result.msg_rate is not None:
+            print(f"sockperf watch: {filename} finished ({result.test_type})", file=out)
+            for key in ('avg_latency_us', 'std_dev_us', 'max_latency_us', 'msg_rate', 'bandwidth_mbps'):
+                if key in result:
+                    print(f"  {key}: {result[key]}", file=out)
+            return result
+        print(f"sockperf watch: {filename} running, {len(text.splitlines())} lines "
+              f"(no --full-log, statistics appear when the run ends)", file=out)
+        if idle_exit and time.monotonic() - last_growth > idle_exit:
+            return None
+        time.sleep(interval)
+
+
+def watch(filename, interval=DEFAULT_INTERVAL, window=DEFAULT_WINDOW, html=None,
+          idle_exit=None, once=False, round_trip=True, out=sys.stdout):
+    """Follow a growing full log (or summary file) and refresh the views.
+
+    Returns the final snapshot. Stops after one pass with once=True, after
+    idle_exit seconds without growth, or on Ctrl-C.
+    """
+    path = Path(filename)
+    if path.suffix != '.csv':
+        sibling = path.with_suffix('.csv')
+        if not sibling.exists():
+            return _watch_summary(path, interval, idle_exit, out)
+        path = sibling
+
+    tail = FullLogTail(path)
+    live = LiveStats(window, round_trip)
+    clear = '\x1b[H\x1b[2J' if out.isatty() else ''
+    last_growth = time.monotonic()
+    snap = None
+    try:
+        while True:
+            # Drain everything appended since the last refresh
+            start = tail.offset
+            while True:
+                before = tail.offset
+                _, tx, rx = tail.read_new()
+                live.add(tx, rx)
+                if tail.offset - before < tail.chunk_bytes:
+                    break
+            if tail.offset != start:
+                last_growth = time.monotonic()
+
+            snap = live.snapshot()
+            print(clear + render_text(path.name, snap), file=out, flush=True)
+            if html:
+                _write_atomic(html, render_html(path.name, snap, interval))
+            if once or (idle_exit and time.monotonic() - last_growth > idle_exit):
+                break
+            time.sleep(interval)
+            if not clear:
+                print(file=out)
+    except KeyboardInterrupt:
+        pass
+    return snap
+
+
+def main(argv=None):
+    import argparse
+
+    ap = argparse.ArgumentParser(description="Live statistics for a running sockperf test")
+    ap.add_argument('file', help="full-log CSV, or summary file (its .csv sibling is used if present)")
+    ap.add_argument('--interval', type=float, default=DEFAULT_INTERVAL, help="refresh period in seconds")
+    ap.add_argument('--window', type=int, default=DEFAULT_WINDOW, help="sliding window in seconds")
+    ap.add_argument('--html', help="also write a self-refreshing HTML view to this file")
+    ap.add_argument('--idle-exit', type=float, help="stop after this many seconds without new data")
+    ap.add_argument('--once', action='store_true', help="process what is there, print once and exit")
+    ap.add_argument('--one-way', action='store_true', help="timestamps are one-way (do not halve rx - tx)")
+    args = ap.parse_args(argv)
+
+    watch(args.file, args.interval, args.window, args.html, args.idle_exit, args.once, not args.one_way)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""Shared fixtures: an isolated parse cache, the checked-in results and a --full-log writer"""
+
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+REPO = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache(tmp_path_factory, monkeypatch):
+    monkeypatch.setenv('SOCKPERF_CACHE_DIR', str(tmp_path_factory.mktemp('cache')))
+    monkeypatch.delenv('SOCKPERF_CACHE', raising=False)
+
+
+@pytest.fixture
+def repo_result(tmp_path):
+    """Copy one of the checked-in sockperf outputs into tmp_path (optionally renamed)"""
+    def copy(name, as_name=None, directory=None):
+        target = Path(directory or tmp_path) / (as_name or name)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy(REPO / name, target)
+        return target
+    return copy
+
+
+def _timestamp(ns, decimals):
+    if decimals == 9:
+        return f"{ns // 10 ** 9}.{ns % 10 ** 9:09d}"
+    return f"{ns / 1e9:.{decimals}f}"
+
+
+@pytest.fixture
+def write_full_log():
+    """Write (seq, tx_ns, rx_ns) rows in sockperf's --full-log CSV layout"""
+    def write(path, seq, tx_ns, rx_ns, decimals=9, parameters='pp -i 192.168.1.3 -t 30'):
+        lines = [
+            '------------------------------',
+            f'test was performed using the following parameters: {parameters}',
+            '------------------------------',
+            'packet, txTime(sec), rxTime(sec)',
+        ]
+        lines += [f"{s}, {_timestamp(int(t), decimals)}, {_timestamp(int(r), decimals)}"
+                  for s, t, r in zip(seq, tx_ns, rx_ns)]
+        Path(path).write_text('\n'.join(lines) + '\n')
+        return Path(path)
+    return write
+
+
+@pytest.fixture
+def ping_pong_samples():
+    """(seq, tx_ns, rx_ns) of a 5000-message run: ~45 µs one-way latency, a few spikes"""
+    rng = np.random.default_rng(7)
+    n = 5000
+    seq = np.arange(n, dtype=np.int64)
+    tx = 1_730_790_000 * 10 ** 9 + np.cumsum(rng.integers(90_000, 110_000, n))
+    rtt = (90_000 + rng.gamma(4.0, 2_000.0, n)).astype(np.int64)
+    rtt[[1500, 3100, 4200]] += 600_000
+    return seq, tx, tx + rtt
+
+
+@pytest.fixture
+def write_under_load():
+    """Write an under-load summary at `mps` msg/s with the given percentiles (µs)"""
+    def write(path, mps, percentiles, reply_every=100, duration=29.52, sent=None):
+        sent = sent if sent is not None else int(mps * duration)
+        received = sent // reply_every
+        ordered = sorted(percentiles.items())
+        lines = [
+            'sockperf: == version #3.7-no.git ==',
+            f'sockperf: test was performed using the following parameters: ul -i 192.168.1.3 --mps={mps} '
+            f'--reply-every={reply_every}',
+            '[ 0] IP = 192.168.1.3     PORT = 11111 # UDP',
+            f'sockperf: [Total Run] RunTime=30.000 sec; Warm up time=400 msec; SentMessages={sent}; '
+            f'ReceivedMessages={received}',
+            'sockperf: ========= Printing statistics for Server No: 0',
+            f'sockperf: [Valid Duration] RunTime={duration:.3f} sec; SentMessages={sent}; '
+            f'ReceivedMessages={received}',
+            f'sockperf: ====> avg-latency={ordered[0][1]:.3f} (std-dev=10.000)',
+            'sockperf: # dropped messages = 0; # duplicated messages = 0; # out-of-order messages = 0',
+            f'sockperf: Total {received} observations; each percentile contains {received / 100:.2f} observations',
+            f'sockperf: ---> <MAX> observation = {ordered[-1][1] * 1.2:8.3f}',
+        ]
+        lines += [f'sockperf: ---> percentile {p:6.3f} = {v:8.3f}' for p, v in reversed(ordered)]
+        lines.append(f'sockperf: ---> <MIN> observation = {ordered[0][1] * 0.8:8.3f}')
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        Path(path).write_text('\n'.join(lines) + '\n')
+        return Path(path)
+    return write
@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+from sockperf_tools import batch
+from sockperf_tools.cache import ParseCache
+
+
+@pytest.fixture
+def result_tree(tmp_path, repo_result):
+    for name in ('sockperf_pingpong_udp.txt', 'sockperf_pingpong_1472B.txt', 'sockperf_underload_udp.txt',
+                 'sockperf_throughput_udp.txt', 'sockperf_pingpong_tcp.txt'):
+        repo_result(name, directory=tmp_path / 'dual' / 'run1')
+    repo_result('sockperf_single_pingpong_udp.txt', 'sockperf_pingpong_udp.txt', tmp_path / 'single')
+    return tmp_path
+
+
+def test_discover_directories_globs_and_files(result_tree):
+    everything = batch.discover([result_tree])
+    assert len(everything) == 6
+    assert batch.discover([result_tree / 'dual' / '*' / '*1472B*']) == [
+        str(result_tree / 'dual' / 'run1' / 'sockperf_pingpong_1472B.txt')]
+    assert batch.discover([result_tree / 'missing.txt', everything[0]]) == everything[:1]
+    assert batch.discover([result_tree], pattern='*underload*') == [
+        str(result_tree / 'dual' / 'run1' / 'sockperf_underload_udp.txt')]
+
+
+def test_manifest_formats(tmp_path):
+    plain = tmp_path / 'plain.txt'
+    plain.write_text('# nightly\nsub/a.txt\n\nb.txt\n')
+    assert batch.read_manifest(plain) == [(str(tmp_path / 'sub/a.txt'), {}), (str(tmp_path / 'b.txt'), {})]
+    rich = tmp_path / 'rich.csv'
+    rich.write_text('path,topology,firmware,date\na.txt,single,v2.1,2025-11-05\nb.txt,dual,,\n')
+    assert batch.read_manifest(rich) == [
+        (str(tmp_path / 'a.txt'), {'topology': 'single', 'firmware': 'v2.1', 'date': '2025-11-05'}),
+        (str(tmp_path / 'b.txt'), {'topology': 'dual'}),
+    ]
+
+
+def test_topology_from_path():
+    assert batch.topology_from_path('results/single_board/sockperf_pingpong_udp.txt') == 'single'
+    assert batch.topology_from_path('results/sockperf_single_pingpong_udp.txt') == 'single'
+    assert batch.topology_from_path('loopback/sockperf_pingpong_udp.txt') == 'loopback'
+    assert batch.topology_from_path('sockperf_pingpong_udp.txt') == 'dual'
+
+
+def test_pool_cache_and_serial_parses_agree(result_tree):
+    files = batch.discover([result_tree])
+    serial = [r.as_dict() for r in batch.parse_files(files, jobs=1)]
+    pooled = [r.as_dict() for r in batch.parse_files(files, jobs=2)]
+    cache = ParseCache()
+    cold = [r.as_dict() for r in batch.parse_files(files, jobs=1, cache=cache)]
+    warm = [r.as_dict() for r in batch.parse_files(files, jobs=1, cache=cache)]
+    assert serial == pooled == cold == warm
+    assert all(cache.get(cache.key(f)) is not None for f in files)
+
+
+def test_load_by_topology_labels_and_skips_errors(result_tree):
+    by_topology = batch.load_by_topology([result_tree], jobs=1)
+    assert list(by_topology['dual']) == ['Ping-Pong (Default)', 'Ping-Pong (1472B)', 'Under Load', 'Throughput']
+    assert list(by_topology['single']) == ['Ping-Pong (Default)']
+    assert by_topology['single']['Ping-Pong (Default)'].run_date
+
+
+def test_aggregate_pools_runs_exactly(tmp_path, repo_result, write_full_log, ping_pong_samples):
+    seq, tx, rx = ping_pong_samples
+    halves = []
+    for i, rows in enumerate((slice(0, 2000), slice(2000, None))):
+        summary = repo_result('sockperf_pingpong_udp.txt', directory=tmp_path / f'run{i}')
+        write_full_log(summary.with_suffix('.csv'), seq[rows], tx[rows], rx[rows])
+        halves.append(summary)
+    cache = ParseCache()
+    [row] = batch.aggregate(batch.parse_files(halves, jobs=1, cache=cache), cache)
+    latencies = np.sort((rx - tx) / 2000.0)
+    assert row['runs'] == 2 and row['total_observations'] == len(latencies)
+    assert row['avg_latency_us'] == pytest.approx(latencies.mean())
+    assert row['std_dev_us'] == pytest.approx(latencies.std())
+    assert row['max_latency_us'] == latencies[-1]
+    # Merged-histogram percentiles are within the histogram's relative precision
+    assert row['percentiles'][99.0] == pytest.approx(latencies[int(np.ceil(0.99 * len(latencies))) - 1], rel=1e-3)
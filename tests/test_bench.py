@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from sockperf_tools import bench
+from sockperf_tools.batch import load_by_topology
+from sockperf_tools.fulllog import read_latencies
+from sockperf_tools.parser import parse_sockperf_file
+
+
+def test_csv_rows_match_formatted_text():
+    seq = np.array([0, 9, 10, 99, 100, 123456789], dtype=np.int64)
+    tx = 1_730_790_000 * 10 ** 9 + seq * 1_000_003
+    rx = tx + 90_001
+    expected = ''.join(f"{s}, {t // 10 ** 9}.{t % 10 ** 9:09d}, {r // 10 ** 9}.{r % 10 ** 9:09d}\n"
+                       for s, t, r in zip(seq, tx, rx))
+    assert bench._csv_rows(seq, tx, rx).decode() == expected
+
+
+def test_synthetic_run_summary_agrees_with_its_full_log(tmp_path, monkeypatch):
+    monkeypatch.setattr(bench, 'CHUNK', 3000)  # several generator blocks
+    summary = bench.write_synthetic_run(tmp_path / 'sockperf_pingpong_64B', 10_000, msg_size=64,
+                                        full_log=True, seed=4)
+    printed = parse_sockperf_file(summary, use_full_log=False)
+    exact = parse_sockperf_file(summary)
+    latencies = read_latencies(summary.with_suffix('.csv'))
+    assert printed.test_type == exact.test_type == 'ping-pong'
+    assert printed.total_observations == exact.total_observations == len(latencies) == 10_000
+    assert printed.avg_latency_us == pytest.approx(latencies.mean(), abs=1e-3)
+    assert printed.max_latency_us == pytest.approx(latencies.max(), abs=1e-3)
+    assert printed.percentiles[99.0] == pytest.approx(exact.percentiles[99.0], rel=2e-3)
+
+
+def test_generated_runs_are_reproducible(tmp_path):
+    a = bench.write_synthetic_run(tmp_path / 'a', 2000, seed=1).read_text()
+    b = bench.write_synthetic_run(tmp_path / 'b', 2000, seed=1).read_text()
+    assert a == b
+
+
+def test_corpus_covers_the_test_mix(tmp_path):
+    bench.generate_corpus(tmp_path, 12, samples=500)
+    by_topology = load_by_topology([tmp_path], jobs=1)
+    assert set(by_topology) == {'dual', 'single'}
+    assert len(by_topology['dual']) == len(bench.TEST_MIX)
+    assert {'Ping-Pong (64B)', 'Ping-Pong (512B)', 'Ping-Pong (1472B)', 'Under Load',
+            'Throughput'} <= set(by_topology['dual'])
+    # The single-board model is faster
+    assert by_topology['single']['Ping-Pong (64B)'].avg_latency_us < by_topology['dual']['Ping-Pong (64B)'].avg_latency_us
+
+
+def _row(scenario, size, seconds):
+    return {'scenario': scenario, 'size': size, 'unit': 'files', 'seconds': seconds, 'items': size,
+            'bytes': 0, 'peak_rss_mb': 50.0}
+
+
+def test_compare_flags_only_real_regressions(capsys):
+    baseline = {'environment': {'revision': 'abc'}, 'results': [
+        _row('parse-summaries', 100, 1.0), _row('aggregate', 100, 0.001), _row('aggregate', 1000, 0.5)]}
+    results = [
+        _row('parse-summaries', 100, 1.2),   # 20% slower
+        _row('aggregate', 100, 0.002),       # 100% slower but within timer noise
+        _row('aggregate', 1000, 0.52),       # within the threshold
+        _row('parse-cached', 100, 9.0),      # no baseline
+    ]
+    assert bench.compare(results, baseline, threshold=0.10) == [results[0]]
+    assert '⚠ slower' in capsys.readouterr().out
+
+
+def test_scenario_runs_in_a_child_interpreter(tmp_path):
+    corpus = tmp_path / 'corpus'
+    bench.generate_corpus(corpus, 4, samples=200)
+    row = bench.run_scenario('parse-summaries', corpus)
+    assert row['items'] == 4 and row['seconds'] > 0 and row['peak_rss_mb'] > 0
@@ -0,0 +1,130 @@
+import gzip
+import json
+import shutil
+import subprocess
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from sockperf_tools import bundle
+from sockperf_tools.batch import DEFAULT_PATTERN, load_by_topology
+from sockperf_tools.histogram import LatencyHistogram
+
+DASHBOARD_JS = Path(__file__).resolve().parent.parent / 'dashboard.js'
+
+
+@pytest.fixture
+def by_topology(tmp_path, repo_result, write_full_log, ping_pong_samples):
+    for name in ('sockperf_pingpong_udp.txt', 'sockperf_throughput_udp.txt'):
+        repo_result(name, directory=tmp_path / 'dual')
+    repo_result('sockperf_single_pingpong_udp.txt', 'sockperf_pingpong_udp.txt', tmp_path / 'single')
+    write_full_log(tmp_path / 'dual' / 'sockperf_pingpong_udp.csv', *ping_pong_samples)
+    return load_by_topology([tmp_path], jobs=1)
+
+
+def _run(data, topology, label):
+    return next(run for run in data['topologies'][topology]['runs'] if run['label'] == label)
+
+
+def test_encode_round_trip():
+    values = np.array([1.5, np.nan, 3e6])
+    for dtype in ('<f4', '<f8'):
+        np.testing.assert_array_equal(bundle.decode(bundle.encode(values, dtype)), values.astype(dtype))
+    assert bundle.decode(bundle.encode([1, 2 ** 31], '<u4')).tolist() == [1, 2 ** 31]
+
+
+def test_histogram_keeps_only_non_empty_buckets(ping_pong_samples):
+    _, tx, rx = ping_pong_samples
+    hist = LatencyHistogram.from_samples((rx - tx) * 0.5e-3)
+    data = bundle.histogram_data(hist)
+    counts, upper = bundle.decode(data['counts']), bundle.decode(data['upper_us'])
+    assert counts.sum() == hist.count and len(counts) == np.count_nonzero(hist.counts)
+    # Percentiles read off the bundled buckets match the histogram's own
+    cumulative = np.cumsum(counts)
+    for p, value in hist.percentiles([50, 99, 99.9]).items():
+        bucket = np.searchsorted(cumulative, np.ceil(p / 100 * hist.count))
+        assert min(upper[bucket], hist.max_us) == pytest.approx(value, rel=1e-6)
+
+
+def test_bundle_contents(by_topology):
+    data = bundle.build_bundle(by_topology, levels=(100, 1000))
+    assert data['version'] == bundle.BUNDLE_VERSION
+    assert list(data['topologies']) == ['dual', 'single']
+    assert data['topologies']['single']['name'] == 'Single-Board'
+
+    logged = _run(data, 'dual', 'Ping-Pong (Default)')
+    assert logged['source'] == 'full-log' and logged['metrics']['filename'] == 'sockperf_pingpong_udp.txt'
+    points = [level['points'] for level in logged['samples']]
+    assert 90 <= points[0] <= 100 and 900 <= points[1] <= 1000
+    finest = bundle.decode(logged['samples'][-1]['latency_us'])
+    assert finest.max() == pytest.approx(logged['metrics']['max_latency_us'], rel=1e-6)
+    assert len(bundle.decode(logged['series']['time_s'])) == len(bundle.decode(logged['series']['p99_us']))
+
+    summary_only = _run(data, 'single', 'Ping-Pong (Default)')
+    assert summary_only['source'] == 'summary' and 'samples' not in summary_only
+    assert bundle.decode(summary_only['histogram']['counts']).sum() == summary_only['metrics']['total_observations']
+    throughput = _run(data, 'dual', 'Throughput')
+    assert 'histogram' not in throughput and throughput['metrics']['bandwidth_mbps'] == 912.723
+
+
+@pytest.mark.parametrize('suffix', ['.js', '.json', '.json.gz'])
+def test_write_formats(tmp_path, by_topology, suffix):
+    data = bundle.build_bundle(by_topology, levels=(50,))
+    output = tmp_path / ('bundle' + suffix)
+    assert bundle.write_bundle(data, output) == output.stat().st_size
+    raw = output.read_bytes()
+    if suffix == '.json.gz':
+        raw = gzip.decompress(raw)
+    text = raw.decode()
+    if suffix == '.js':
+        prefix = f'window.{bundle.JS_GLOBAL} = '
+        assert text.startswith(prefix) and text.endswith(';\n')
+        text = text[len(prefix):-2]
+    assert json.loads(text) == data
+
+
+@pytest.mark.skipif(not shutil.which('node'), reason="node is not installed")
+def test_page_renderer_decodes_the_bundle(tmp_path, by_topology):
+    data = bundle.build_bundle(by_topology, levels=(100, 1000))
+    bundle.write_bundle(data, tmp_path / 'bundle.json')
+    script = f"""
+        const dashboard = require({json.dumps(str(DASHBOARD_JS))});
+        const data = JSON.parse(require('fs').readFileSync({json.dumps(str(tmp_path / 'bundle.json'))}));
+        const run = data.topologies.dual.runs[0];
+        const levels = run.samples.map(l => ({{time: dashboard.decode(l.time_s), points: l.points}}));
+        const curve = dashboard.percentileCurve(run.histogram);
+        const last = levels[1].time[levels[1].time.length - 1];
+        console.log(JSON.stringify({{
+            counts: Array.from(dashboard.decode(run.histogram.counts)).reduce((a, b) => a + b, 0),
+            whole: dashboard.levelFor(levels, 0, last, 500).points,
+            zoomed: dashboard.levelFor(levels, 0, last / 10, 500).points,
+            top: curve.y[curve.y.length - 1],
+            ticks: dashboard.niceTicks(0, 10, 5).map(t => t[0]),
+        }}));
+    """
+    out = json.loads(subprocess.run(['node', '-e', script], capture_output=True, text=True, check=True).stdout)
+    logged = _run(data, 'dual', 'Ping-Pong (Default)')
+    assert out['counts'] == logged['histogram']['count']
+    # The whole run fits the budget only at the coarse level, a tenth of it at the fine one
+    assert (out['whole'], out['zoomed']) == tuple(level['points'] for level in logged['samples'])
+    assert out['top'] == pytest.approx(logged['histogram']['max_us'])
+    assert out['ticks'] == [0, 2, 4, 6, 8, 10]
+
+
+def test_main(tmp_path, by_topology, capsys, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    bundle.main([str(tmp_path / 'dual'), str(tmp_path / 'single'), '--levels', '50,200', '-j', '1'])
+    assert 'Bundle of 3 runs in 2 topologies written to dashboard_data.js' in capsys.readouterr().out
+    assert (tmp_path / 'dashboard_data.js').exists()
+
+
+def test_checked_in_bundle_is_current(monkeypatch):
+    repo = DASHBOARD_JS.parent
+    monkeypatch.chdir(repo)
+    fresh = bundle.build_bundle(load_by_topology([DEFAULT_PATTERN], jobs=1))
+    text = (repo / bundle.DEFAULT_OUTPUT).read_text()
+    prefix = f'window.{bundle.JS_GLOBAL} = '
+    assert text.startswith(prefix), "dashboard_data.js is not a bundle script"
+    assert json.loads(text[len(prefix):].rstrip().rstrip(';')) == json.loads(json.dumps(fresh)), \
+        "dashboard_data.js is stale: run `python -m sockperf_tools bundle`"
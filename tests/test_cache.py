@@ -0,0 +1,135 @@
+import json
+import os
+import pathlib
+
+import numpy as np
+
+from sockperf_tools import cache as cache_module
+from sockperf_tools.batch import default_cache, parse_files
+from sockperf_tools.cache import ParseCache, content_key
+from sockperf_tools.parser import parse_sockperf_file
+
+
+def test_key_follows_content_not_path(tmp_path, repo_result):
+    original = repo_result('sockperf_pingpong_udp.txt')
+    copy = repo_result('sockperf_pingpong_udp.txt', 'elsewhere/renamed.txt')
+    assert content_key(original) == content_key(copy)
+
+    copy.write_text(copy.read_text().replace('52.688', '52.689'))
+    assert content_key(original) != content_key(copy)
+
+
+def test_full_log_and_parser_version_invalidate(tmp_path, repo_result, write_full_log, ping_pong_samples,
+                                                monkeypatch):
+    summary = repo_result('sockperf_pingpong_udp.txt')
+    bare = content_key(summary)
+    write_full_log(summary.with_suffix('.csv'), *ping_pong_samples)
+    with_log = content_key(summary)
+    assert with_log != bare
+    monkeypatch.setattr(cache_module, 'PARSER_VERSION', cache_module.PARSER_VERSION + 1)
+    assert content_key(summary) not in (bare, with_log)
+
+
+def test_parse_hits_after_the_first_miss(tmp_path, repo_result, monkeypatch):
+    summary = repo_result('sockperf_underload_udp.txt')
+    cache = ParseCache()
+    first = cache.parse(summary)
+    assert first.as_dict() == parse_sockperf_file(summary).as_dict()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("cache hit expected")
+    monkeypatch.setattr(cache_module, 'parse_sockperf_file', fail)
+    moved = summary.rename(tmp_path / 'moved.txt')
+    again = ParseCache().parse(moved)
+    assert again.filename == str(moved)
+    assert again.avg_latency_us == first.avg_latency_us
+
+
+def test_samples_stay_in_message_order(tmp_path, repo_result, write_full_log, ping_pong_samples):
+    summary = repo_result('sockperf_pingpong_udp.txt')
+    seq, tx, rx = ping_pong_samples
+    write_full_log(summary.with_suffix('.csv'), seq, tx, rx)
+    cache = ParseCache()
+    result = cache.parse(summary)
+    assert result.total_observations == len(seq)
+    np.testing.assert_allclose(cache.load_latencies(summary), (rx - tx) / 2000.0)
+
+
+def test_memo_keeps_one_stamp_per_file(tmp_path, repo_result):
+    summary = repo_result('sockperf_pingpong_udp.txt')
+    cache = ParseCache()
+    for edit in range(3):
+        summary.write_text(summary.read_text() + f'\n# edit {edit}\n')
+        os.utime(summary, ns=(edit * 10 ** 9, edit * 10 ** 9))
+        cache.parse(summary)
+    cache.close()
+    index = json.loads((cache.directory / 'index.json').read_text())
+    assert list(index['memo']) == [str(summary.resolve())]
+    assert index['memo'][str(summary.resolve())][1] == cache_module.content_key(summary)
+
+
+def test_eviction_is_lru_and_prunes_the_memo(tmp_path, repo_result):
+    names = ['sockperf_pingpong_udp.txt', 'sockperf_pingpong_64B.txt', 'sockperf_pingpong_512B.txt']
+    cache = ParseCache()
+    keys = []
+    for age, name in enumerate(names):
+        path = repo_result(name)
+        keys.append(cache.key(path))
+        cache.parse(path, keys[-1])
+        entry = cache._entry(keys[-1], '.pkl')
+        os.utime(entry, (age, age))
+    one_entry = cache._entry(keys[0], '.pkl').stat().st_size
+    cache.max_bytes = 2 * one_entry + one_entry // 2
+    cache.close()
+
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[1]) is not None and cache.get(keys[2]) is not None
+    memo = json.loads((cache.directory / 'index.json').read_text())['memo']
+    assert sorted(m[1] for m in memo.values()) == sorted(keys[1:])
+
+
+def _close_without_scanning(cache, monkeypatch):
+    def no_scan(self, pattern):
+        raise AssertionError(f"unexpected scan of {self}")
+    with monkeypatch.context() as m:
+        m.setattr(pathlib.Path, 'glob', no_scan)
+        cache.close()
+    tracked = json.loads((cache.directory / 'index.json').read_text())['bytes']
+    return tracked, sum(p.stat().st_size for p in cache.directory.glob('*/*'))
+
+
+def test_close_does_not_scan_under_the_limit(tmp_path, repo_result, monkeypatch):
+    cache = ParseCache()
+    cache.parse(repo_result('sockperf_pingpong_udp.txt'))
+    cache.close()  # first close scans: the size was unknown
+
+    reopened = ParseCache()
+    reopened.parse(repo_result('sockperf_pingpong_64B.txt'))
+    tracked, actual = _close_without_scanning(reopened, monkeypatch)
+    assert tracked == actual
+
+
+def test_entries_written_by_pool_workers_are_tracked(tmp_path, repo_result, monkeypatch):
+    ParseCache().close()
+    files = [repo_result(name) for name in ('sockperf_pingpong_udp.txt', 'sockperf_pingpong_64B.txt',
+                                            'sockperf_underload_udp.txt')]
+    cache = ParseCache()
+    parse_files(files, jobs=2, cache=ParseCache())  # closes its own cache object
+    parse_files(files, jobs=2, cache=cache)
+    tracked, actual = _close_without_scanning(cache, monkeypatch)
+    assert tracked == actual > 0
+
+
+def test_cache_can_be_disabled(monkeypatch):
+    assert default_cache() is not None
+    monkeypatch.setenv('SOCKPERF_CACHE', '0')
+    assert default_cache() is None
+
+
+def test_clear(tmp_path, repo_result):
+    cache = ParseCache()
+    cache.parse(repo_result('sockperf_pingpong_udp.txt'))
+    cache.close()
+    cache_module.main(['clear'])
+    assert not [p for p in cache.directory.glob('*/*')]
+    assert json.loads((cache.directory / 'index.json').read_text())['memo'] == {}
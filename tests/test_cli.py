@@ -0,0 +1,43 @@
+import json
+
+import pytest
+
+from sockperf_tools import cli
+
+
+@pytest.fixture
+def result_tree(tmp_path, repo_result):
+    for name in ('sockperf_pingpong_udp.txt', 'sockperf_throughput_udp.txt'):
+        repo_result(name, directory=tmp_path / 'dual')
+    repo_result('sockperf_single_pingpong_udp.txt', 'sockperf_pingpong_udp.txt', tmp_path / 'single')
+    return tmp_path
+
+
+def test_summary_header_follows_the_topology(result_tree, capsys):
+    cli.main(['summary', str(result_tree), '--topology', 'single'])
+    out = capsys.readouterr().out
+    assert 'LAN9662 SINGLE-BOARD NETWORK PERFORMANCE TEST SUMMARY' in out
+    assert '192.168.1.2 → LAN9662 → 192.168.1.3' in out
+    assert 'Protocol: UDP' in out
+    assert 'DUAL-BOARD' not in out and 'Throughput' not in out
+
+
+def test_summary_of_all_topologies(result_tree, capsys):
+    cli.main(['summary', str(result_tree), '--topology', 'all'])
+    out = capsys.readouterr().out
+    assert out.index('DUAL-BOARD') < out.index('SINGLE-BOARD')
+    assert out.count('Protocol: UDP') == 2
+
+
+def test_summary_without_runs_has_no_protocol(tmp_path, capsys):
+    cli.main(['summary', str(tmp_path), '--topology', 'loopback'])
+    out = capsys.readouterr().out
+    assert 'LAN9662 LOOPBACK' in out and 'Protocol: -' in out
+
+
+def test_summary_json(result_tree, capsys):
+    cli.main(['summary', str(result_tree), '--topology', 'all', '--json'])
+    data = json.loads(capsys.readouterr().out)
+    assert set(data) == {'dual', 'single'}
+    assert data['dual']['Throughput']['bandwidth_mbps'] == 912.723
+    assert data['single']['Ping-Pong (Default)']['protocol'] == 'UDP'
@@ -0,0 +1,84 @@
+import math
+
+import numpy as np
+import pytest
+
+from sockperf_tools.fulllog import (SOCKPERF_PERCENTILES, FullLogTail, full_log_stats, iter_full_log,
+                                    latency_stats, read_latencies)
+from sockperf_tools.parser import parse_sockperf_file
+
+
+def _columns(filename, **kwargs):
+    chunks = list(iter_full_log(filename, **kwargs))
+    return tuple(np.concatenate([c[i] for c in chunks]) for i in range(3))
+
+
+def test_iter_full_log_reads_exact_nanoseconds(tmp_path, write_full_log, ping_pong_samples):
+    log = write_full_log(tmp_path / 'run.csv', *ping_pong_samples)
+    for got, want in zip(_columns(log), ping_pong_samples):
+        np.testing.assert_array_equal(got, want)
+
+
+def test_small_chunks_give_the_same_rows(tmp_path, write_full_log, ping_pong_samples):
+    log = write_full_log(tmp_path / 'run.csv', *ping_pong_samples)
+    for got, want in zip(_columns(log, chunk_bytes=1000), ping_pong_samples):
+        np.testing.assert_array_equal(got, want)
+
+
+def test_microsecond_timestamps_use_the_float_path(tmp_path, write_full_log, ping_pong_samples):
+    seq, tx, rx = ping_pong_samples
+    tx, rx = tx // 1000 * 1000, rx // 1000 * 1000
+    log = write_full_log(tmp_path / 'run.csv', seq, tx, rx, decimals=6)
+    _, got_tx, got_rx = _columns(log)
+    # float64 resolves epoch seconds to ~240 ns
+    np.testing.assert_allclose(got_rx - got_tx, rx - tx, rtol=0, atol=500)
+
+
+def test_read_latencies_halves_the_round_trip(tmp_path, write_full_log, ping_pong_samples):
+    seq, tx, rx = ping_pong_samples
+    log = write_full_log(tmp_path / 'run.csv', seq, tx, rx)
+    np.testing.assert_allclose(read_latencies(log), (rx - tx) / 2000.0)
+    np.testing.assert_allclose(read_latencies(log, round_trip=False, chunk_bytes=4096), (rx - tx) / 1000.0)
+
+
+def test_latency_stats_match_numpy(ping_pong_samples):
+    _, tx, rx = ping_pong_samples
+    expected = np.sort((rx - tx) / 2000.0)
+    stats = latency_stats(((rx - tx) / 2000.0))
+    n = len(expected)
+    assert stats['total_observations'] == n
+    assert stats['avg_latency_us'] == pytest.approx(expected.mean())
+    assert stats['std_dev_us'] == pytest.approx(expected.std())
+    assert stats['min_latency_us'] == expected[0]
+    assert stats['max_latency_us'] == expected[-1]
+    for p in SOCKPERF_PERCENTILES:
+        assert stats['percentiles'][p] == expected[min(math.ceil(p / 100 * n), n) - 1]
+
+
+def test_empty_log(tmp_path, write_full_log):
+    log = write_full_log(tmp_path / 'empty.csv', [], [], [])
+    assert len(read_latencies(log)) == 0
+    assert latency_stats(read_latencies(log)) == {}
+
+
+def test_tail_waits_for_complete_lines(tmp_path, write_full_log, ping_pong_samples):
+    full = write_full_log(tmp_path / 'full.csv', *ping_pong_samples).read_bytes()
+    growing = tmp_path / 'growing.csv'
+    growing.write_bytes(b'')
+    tail = FullLogTail(growing, chunk_bytes=1 << 20)
+    seen = []
+    for cut in (100, 7001, 55555, len(full)):
+        growing.write_bytes(full[:cut])
+        seen.append(tail.read_new()[0])
+    np.testing.assert_array_equal(np.concatenate(seen), ping_pong_samples[0])
+
+
+def test_summary_uses_the_full_log_next_to_it(tmp_path, repo_result, write_full_log, ping_pong_samples):
+    summary = repo_result('sockperf_pingpong_udp.txt')
+    seq, tx, rx = ping_pong_samples
+    write_full_log(summary.with_suffix('.csv'), seq, tx, rx)
+    result = parse_sockperf_file(summary)
+    assert result.total_observations == len(seq)
+    assert result.avg_latency_us == pytest.approx(((rx - tx) / 2000.0).mean())
+    assert result.percentiles == full_log_stats(summary.with_suffix('.csv'))['percentiles']
+    assert parse_sockperf_file(summary, use_full_log=False).total_observations == 280219
@@ -0,0 +1,91 @@
+import math
+
+import numpy as np
+import pytest
+
+from sockperf_tools.cache import ParseCache
+from sockperf_tools.fulllog import SOCKPERF_PERCENTILES
+from sockperf_tools.histogram import LatencyHistogram, histogram_for
+from sockperf_tools.parser import parse_sockperf_file
+
+
+@pytest.fixture
+def latencies():
+    rng = np.random.default_rng(3)
+    return np.concatenate([45 + rng.gamma(3.0, 2.0, 200_000), rng.uniform(100, 5000, 300)])
+
+
+def _exact(values, p):
+    ordered = np.sort(values)
+    return ordered[min(math.ceil(p / 100 * len(ordered)), len(ordered)) - 1]
+
+
+@pytest.mark.parametrize('digits', [2, 3, 4])
+def test_percentiles_within_the_configured_precision(latencies, digits):
+    hist = LatencyHistogram.from_samples(latencies, digits, chunk=50_000)
+    assert hist.count == len(latencies)
+    assert hist.mean == pytest.approx(latencies.mean())
+    assert hist.std_dev_us == pytest.approx(latencies.std())
+    for p, value in hist.percentiles(SOCKPERF_PERCENTILES).items():
+        exact = _exact(latencies, p)
+        # Highest equivalent value of the bucket: never below, at most one bucket above
+        assert exact - 0.0005 <= value <= exact * (1 + 10.0 ** -digits) + 0.001
+
+
+def test_merge_equals_recording_everything(latencies):
+    whole = LatencyHistogram().record(latencies)
+    parts = [LatencyHistogram().record(part) for part in np.array_split(latencies, 7)]
+    merged = LatencyHistogram.merged(parts)
+    np.testing.assert_array_equal(merged.counts, whole.counts)
+    assert merged.count == whole.count
+    assert merged.mean == pytest.approx(whole.mean)
+    assert merged.std_dev_us == pytest.approx(whole.std_dev_us)
+    assert (merged.min_us, merged.max_us) == (whole.min_us, whole.max_us)
+    assert parts[0].count == len(np.array_split(latencies, 7)[0])  # merged() copies
+
+
+def test_incompatible_histograms_do_not_merge():
+    with pytest.raises(ValueError):
+        LatencyHistogram(2).merge(LatencyHistogram(3))
+
+
+def test_serialisation_round_trip(latencies):
+    hist = LatencyHistogram().record(latencies)
+    data = hist.to_bytes()
+    assert len(data) < hist.counts.nbytes / 10
+    back = LatencyHistogram.from_bytes(data)
+    np.testing.assert_array_equal(back.counts, hist.counts)
+    assert back.stats() == hist.stats()
+    with pytest.raises(ValueError):
+        LatencyHistogram.from_bytes(b'XXXX' + data[4:])
+
+
+def test_from_summary_reproduces_the_printed_percentiles(repo_result):
+    result = parse_sockperf_file(repo_result('sockperf_pingpong_udp.txt'))
+    hist = LatencyHistogram.from_summary(result)
+    assert hist.count == result.total_observations
+    assert (hist.mean, hist.std_dev_us) == (result.avg_latency_us, pytest.approx(result.std_dev_us))
+    reconstructed = hist.percentiles(list(result.percentiles))
+    for p, value in reconstructed.items():
+        if p <= 99.9:
+            assert value == pytest.approx(result.percentiles[p], rel=2e-3)
+    # p99.999 of 280k observations is within 3 samples of the max: only bracketed
+    assert result.percentiles[99.99] <= reconstructed[99.999] <= result.max_latency_us
+
+
+def test_histogram_for_uses_the_full_log_without_a_cache(repo_result, write_full_log, ping_pong_samples):
+    summary = repo_result('sockperf_pingpong_udp.txt')
+    seq, tx, rx = ping_pong_samples
+    write_full_log(summary.with_suffix('.csv'), seq, tx, rx)
+    result = parse_sockperf_file(summary)
+    exact = LatencyHistogram.from_samples((rx - tx) / 2000.0)
+
+    uncached = histogram_for(result)
+    cached = histogram_for(result, ParseCache())
+    for hist in (uncached, cached):
+        np.testing.assert_array_equal(hist.counts, exact.counts)
+        assert hist.max_us == exact.max_us
+
+    summary.with_suffix('.csv').unlink()
+    approximate = histogram_for(parse_sockperf_file(summary))
+    assert approximate.count == 280219
@@ -0,0 +1,163 @@
+import sys
+import time
+
+import numpy as np
+import pytest
+
+from sockperf_tools import hostnoise
+
+START_NS = time.time_ns() // 10 ** 9 * 10 ** 9
+INTERVAL_NS = 10_000_000
+
+INTERRUPTS = """\
+           CPU0       CPU1       CPU2       CPU3
+  0:         {a}          0          0          0   IO-APIC   2-edge      timer
+ 42:          1          2        {b}          4   PCI-MSI 524288-edge      eth0-rx-0
+NMI:          0          0          1          1   Non-maskable interrupts
+ERR:          7
+"""
+SOFTIRQS = """\
+                    CPU0       CPU1       CPU2       CPU3
+          HI:          0          0          0          0
+      NET_RX:         10         20         30         {c}
+"""
+SCHEDSTAT = """\
+version 15
+timestamp 4295
+cpu2 0 0 0 0 0 0 111 222 3
+domain0 3 0 0 0 0 0 0 0 0
+cpu3 0 0 0 0 0 0 444 555 6
+"""
+NET_DEV = """\
+Inter-|   Receive                                                |  Transmit
+ face |bytes    packets errs drop fifo frame compressed multicast|bytes    packets errs drop fifo colls carrier compressed
+    lo: 100 1 0 0 0 0 0 0 100 1 0 0 0 0 0 0
+  eth1: 5000 {d} 1 2 0 0 0 0 3000 30 0 4 0 0 0 0
+"""
+
+
+@pytest.fixture
+def fake_host(tmp_path, monkeypatch):
+    proc, sys_root = tmp_path / 'proc', tmp_path / 'sys'
+    (proc / 'net').mkdir(parents=True)
+    for cpu, khz in ((2, 1_800_000), (3, 2_400_000)):
+        (sys_root / f'devices/system/cpu/cpu{cpu}/cpufreq').mkdir(parents=True)
+        (sys_root / f'devices/system/cpu/cpu{cpu}/cpufreq/scaling_cur_freq').write_text(f'{khz}\n')
+
+    def write(a=5, b=3, c=40, d=50):
+        (proc / 'interrupts').write_text(INTERRUPTS.format(a=a, b=b))
+        (proc / 'softirqs').write_text(SOFTIRQS.format(c=c))
+        (proc / 'schedstat').write_text(SCHEDSTAT)
+        (proc / 'net/dev').write_text(NET_DEV.format(d=d))
+
+    write()
+    monkeypatch.setattr(hostnoise, 'PROC_ROOT', str(proc))
+    monkeypatch.setattr(hostnoise, 'SYS_ROOT', str(sys_root))
+    return write
+
+
+def test_sources_summed_over_cpus(fake_host):
+    sampler = hostnoise.HostSampler(cpus={2, 3})
+    try:
+        values = dict(zip(sampler.channels, sampler.read()))
+        assert values == {
+            'irq:0 timer': 0, 'irq:42 eth0-rx-0': 7, 'irq:NMI': 2, 'irq:ERR': 0,
+            'softirq:HI': 0, 'softirq:NET_RX': 70,
+            'sched_run:cpu2': 111, 'sched_wait:cpu2': 222, 'sched_run:cpu3': 444, 'sched_wait:cpu3': 555,
+            'net:eth1:rx_packets': 50, 'net:eth1:rx_errs': 1, 'net:eth1:rx_drop': 2,
+            'net:eth1:tx_packets': 30, 'net:eth1:tx_drop': 4,
+            'freq:cpu2': 1_800_000, 'freq:cpu3': 2_400_000,
+        }
+        assert sampler.kinds[sampler.channels.index('freq:cpu3')] == 'gauge'
+        fake_host(b=1003, c=140, d=51)
+        values = dict(zip(sampler.channels, sampler.read()))
+        assert values['irq:42 eth0-rx-0'] == 1007 and values['softirq:NET_RX'] == 170
+        assert values['net:eth1:rx_packets'] == 51
+    finally:
+        sampler.close()
+    everything = hostnoise.HostSampler()
+    assert dict(zip(everything.channels, everything.read()))['irq:0 timer'] == 5
+    everything.close()
+
+
+def test_ring_keeps_the_last_samples(tmp_path):
+    log_file = tmp_path / 'noise.hnl'
+    stats = hostnoise.record(log_file, duration_s=0.3, interval_ms=5, capacity=8, max_overhead=1.0)
+    log = hostnoise.NoiseLog(log_file)
+    assert stats['samples'] > 8 and stats['kept'] == len(log) == 8
+    assert stats['overwritten'] == stats['samples'] - 8 and stats['backoffs'] == 0
+    assert np.all(np.diff(log.t_ns) > 0) and any(name.startswith('irq:') for name in log.channels)
+    assert stats['cost_mean_us'] > 0 and 0 < stats['overhead_pct'] < 100
+
+
+def test_overhead_is_bounded_by_backing_off(tmp_path):
+    stats = hostnoise.record(tmp_path / 'noise.hnl', duration_s=0.3, interval_ms=1, max_overhead=1e-6)
+    assert stats['backoffs'] >= 3 and stats['final_interval_ms'] == 2 ** stats['backoffs']
+    assert stats['samples'] < 20
+
+
+def _noisy_run(tmp_path, write_full_log, clock_shift=0):
+    """100 s of sampler intervals; eth0 interrupts storm in 20 of them, and latency spikes there"""
+    rng = np.random.default_rng(5)
+    n = 1000
+    storms = rng.choice(np.arange(5, n - 5), 20, replace=False)
+    irq = np.full(n, 10)
+    irq[storms] = 500
+    timer = rng.integers(200, 300, n)
+    writer = hostnoise.NoiseWriter(tmp_path / 'noise.hnl', ['irq:42 eth0', 'softirq:TIMER', 'freq:cpu0'],
+                                   ['counter', 'counter', 'gauge'], capacity=n, interval_ns=INTERVAL_NS,
+                                   meta={'interval_ms': 10})
+    t = START_NS + np.arange(n, dtype=np.int64) * INTERVAL_NS
+    counters = np.column_stack([np.cumsum(irq), np.cumsum(timer), np.full(n, 2_000_000)])
+    for i in range(n):
+        writer.append(int(t[i]), counters[i].tolist(), cost_ns=50_000)
+    writer.close()
+
+    tx = START_NS + np.arange(0, (n - 1) * INTERVAL_NS, 1_000_000, dtype=np.int64) + 300_000
+    rtt = np.full(len(tx), 90_000)
+    # A storm counted in interval i - 1; half the spikes it causes land at the start of interval i
+    for k, storm in enumerate(storms):
+        rtt[(storm - k % 2) * 10 + 3] = 700_000
+    write_full_log(tmp_path / 'run.csv', np.arange(len(tx)), tx - clock_shift, tx + rtt - clock_shift)
+    return tmp_path / 'noise.hnl', tmp_path / 'run.csv'
+
+
+def test_correlation_finds_the_interrupt_storm(tmp_path, write_full_log):
+    noise, run = _noisy_run(tmp_path, write_full_log)
+    analysis = hostnoise.correlate(noise, run, spike_us=100)
+    assert analysis['clock'] == 'realtime' and analysis['spikes'] == 20 and analysis['spike_intervals'] == 20
+    top = analysis['channels'][0]
+    assert top['name'] == 'irq:42 eth0' and top['explains'] and top['corr'] > 0.5
+    assert top['coincidence_pct'] == 100.0 and top['baseline_pct'] < 5
+    assert not analysis['channels'][1]['explains'] and analysis['explained_pct'] == 100.0
+    assert len(analysis['channels']) == 2  # the constant frequency gauge has nothing to say
+    assert analysis['worst'][0]['max_us'] == pytest.approx(350.0) and 'irq:42 eth0' in analysis['worst'][0]['channels']
+
+    without_lag = hostnoise.correlate(noise, run, spike_us=100, lag=0)
+    assert without_lag['explained_pct'] == 50.0
+
+
+def test_monotonic_full_log_and_percentile_threshold(tmp_path, write_full_log):
+    offset = hostnoise.NoiseLog(_noisy_run(tmp_path, write_full_log)[0]).meta['clock_offset_ns']
+    noise, run = _noisy_run(tmp_path, write_full_log, clock_shift=offset)
+    analysis = hostnoise.correlate(noise, run, spike_pct=99)
+    assert analysis['clock'] == 'monotonic' and analysis['threshold_us'] == pytest.approx(45.0, rel=0.01)
+    assert analysis['channels'][0]['name'] == 'irq:42 eth0' and analysis['spike_intervals'] == 20
+
+
+def test_main(tmp_path, write_full_log, capsys):
+    noise, run = _noisy_run(tmp_path, write_full_log)
+    hostnoise.main(['correlate', str(noise), str(run), '--spike-us', '100', '-o', str(tmp_path / 'noise.png'),
+                    '--dpi', '30'])
+    out = capsys.readouterr().out
+    assert 'Spikes above 100.00 μs: 20 in 20 intervals' in out and '100.0% of spike intervals' in out
+    assert '(3 panels drawn' in out and (tmp_path / 'noise.png').exists()
+
+    hostnoise.main(['info', str(noise)])
+    assert 'irq: 1 channels' in capsys.readouterr().out
+
+    code = hostnoise.main(['record', str(tmp_path / 'live.hnl'), '--interval-ms', '5', '--',
+                           sys.executable, '-c', 'import time, sys; time.sleep(0.2); sys.exit(3)'])
+    assert code == 3 and hostnoise.NoiseLog(tmp_path / 'live.hnl').state['count'] > 2
+    with pytest.raises(SystemExit):
+        hostnoise.main(['record', str(tmp_path / 'none.hnl')])
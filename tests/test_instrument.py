@@ -0,0 +1,73 @@
+import json
+import time
+
+import numpy as np
+import pytest
+
+from sockperf_tools import cli, instrument
+from sockperf_tools.instrument import Profiler, profiling, stage
+
+
+def test_stage_is_a_no_op_outside_a_session():
+    assert instrument.active() is None
+    assert stage('parse', file='x') is stage('other')
+
+
+def test_nested_stages_record_paths_time_and_memory(tmp_path):
+    report_file = tmp_path / 'profile.json'
+    with profiling(report_file) as profiler:
+        with stage('load', file='a.txt'):
+            for _ in range(2):
+                with stage('parse'):
+                    np.ones(1_000_000)  # 8 MB, freed at once
+        with stage('report'):
+            time.sleep(0.01)
+    assert instrument.active() is None
+
+    report = profiler.result
+    assert json.loads(report_file.read_text())['by_path'] == report['by_path']
+    assert [(r['path'], r['depth']) for r in report['stages']] == [
+        ('load/parse', 1), ('load/parse', 1), ('load', 0), ('report', 0)]
+    assert report['stages'][2]['labels'] == {'file': 'a.txt'}
+    assert report['by_path']['load/parse']['count'] == 2
+    # The child's peak propagates to its parent and the session total
+    assert report['by_path']['load/parse']['peak_alloc_bytes'] >= 8_000_000
+    assert report['by_path']['load']['peak_alloc_bytes'] >= 8_000_000
+    assert report['total']['peak_alloc_bytes'] >= 8_000_000
+    assert report['by_path']['report']['wall_s'] >= 0.01
+    assert report['by_path']['report']['peak_alloc_bytes'] < 1_000_000
+
+
+def test_only_one_session_at_a_time():
+    with profiling(memory=False):
+        with pytest.raises(RuntimeError):
+            Profiler(memory=False).start()
+    with pytest.raises(ValueError):
+        Profiler(capture='perf')
+
+
+def _busy(seconds):
+    end = time.process_time() + seconds
+    while time.process_time() < end:
+        sum(range(1000))
+
+
+@pytest.mark.parametrize('capture, suffix', [('cprofile', '.prof'), ('sample', '.folded')])
+def test_capture_keeps_the_slowest_stage(tmp_path, capture, suffix):
+    with profiling(tmp_path / 'p.json', memory=False, capture=capture) as profiler:
+        with stage('fast'):
+            _busy(0.01)
+        with stage('slow'):
+            _busy(0.1)
+    captured = profiler.result['capture']
+    assert captured['stage'] == 'slow'
+    assert captured['file'] == str(tmp_path / 'p.json') + suffix
+    assert any('_busy' in row['function'] for row in captured['top'])
+
+
+def test_cli_profile_report(tmp_path, repo_result, capsys):
+    report = tmp_path / 'profile.json'
+    cli.main(['summary', str(repo_result('sockperf_pingpong_udp.txt')), '--profile', str(report)])
+    paths = json.loads(report.read_text())['by_path']
+    assert {'load', 'report'} <= set(paths)
+    assert 'PROFILE' in capsys.readouterr().out
@@ -0,0 +1,126 @@
+import math
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from sockperf_tools import jitter
+from sockperf_tools.fulllog import full_log_stats, latency_stats
+from sockperf_tools.jitter import (detect_spikes, ipdv, jitter_metric, jitter_stats, jitter_value,
+                                   trailing_mean_std)
+
+
+@pytest.fixture
+def latencies():
+    rng = np.random.default_rng(11)
+    values = 50 + rng.gamma(3.0, 2.0, 20_000)
+    values[[3000, 3001, 9000, 15000]] += 400
+    return values
+
+
+@pytest.fixture(params=[jitter.BLOCK, 777], ids=['one-block', 'many-blocks'])
+def block(request, monkeypatch):
+    monkeypatch.setattr(jitter, 'BLOCK', request.param)
+
+
+def test_trailing_window_matches_a_loop(latencies, block):
+    mean, std = trailing_mean_std(latencies, 100)
+    assert np.isnan(mean[:100]).all()
+    for i in (100, 101, 5000, 19_999):
+        assert mean[i] == pytest.approx(latencies[i - 100:i].mean())
+        assert std[i] == pytest.approx(latencies[i - 100:i].std())
+
+
+def test_spikes_match_a_loop(latencies, block):
+    index, excess = detect_spikes(latencies, window=1000, threshold=6.0)
+    expected = [i for i in range(1000, len(latencies))
+                if latencies[i] - latencies[i - 1000:i].mean() > 6.0 * latencies[i - 1000:i].std()]
+    assert index.tolist() == expected
+    assert {3000, 3001, 9000, 15000} <= set(expected)
+    np.testing.assert_allclose(excess, [latencies[i] - latencies[i - 1000:i].mean() for i in expected])
+
+
+def test_ipdv_pairs_only_adjacent_packets(block):
+    values = np.array([10.0, 12.0, 11.0, 30.0, 31.0, 29.0])
+    np.testing.assert_array_equal(ipdv(values), [2, -1, 19, 1, -2])
+    # Packet 3 was lost: 11 -> 30 spans a gap and is dropped
+    np.testing.assert_array_equal(ipdv(values, seq=[0, 1, 2, 4, 5, 6]), [2, -1, 1, -2])
+
+
+def test_ipdv_compaction_across_blocks(latencies, monkeypatch):
+    monkeypatch.setattr(jitter, 'BLOCK', 1000)
+    seq = np.arange(len(latencies))
+    seq[::7] += 10 ** 6  # every 7th packet renumbered: pairs around it are not adjacent
+    d = np.diff(latencies)
+    np.testing.assert_array_equal(ipdv(latencies, seq), d[np.diff(seq) == 1])
+
+
+def test_stats(latencies):
+    stats = jitter_stats(latencies)
+    d = np.abs(np.diff(latencies))
+    assert stats['samples'] == len(latencies)
+    assert stats['ipdv_mean_us'] == pytest.approx(d.mean())
+    assert stats['ipdv_std_us'] == pytest.approx(d.std())
+    assert stats['ipdv_p99_us'] == np.sort(d)[math.ceil(0.99 * len(d)) - 1]
+    assert stats['pdv_p50_us'] == np.sort(latencies)[len(latencies) // 2 - 1] - latencies.min()
+    index, _ = detect_spikes(latencies)
+    assert stats['spike_count'] == len(index)
+    # 3000 and 3001 are one burst
+    assert stats['spike_bursts'] == len(index) - np.count_nonzero(np.diff(index) <= jitter.BURST_GAP)
+    assert stats['spike_bursts'] < stats['spike_count']
+
+
+def test_no_adjacent_packets_gives_nan():
+    stats = jitter_stats(np.array([1.0, 2.0, 3.0]), seq=np.array([0, 2, 4]))
+    assert math.isnan(stats['ipdv_mean_us']) and math.isnan(stats['ipdv_p99_us'])
+    assert stats['pdv_p99_us'] == 2.0 and stats['spike_count'] == 0
+    assert jitter_stats(np.array([5.0])) == {}
+
+
+def test_latency_stats_takes_pdv_from_the_sorted_samples(latencies):
+    seq = np.arange(len(latencies))
+    seq[5000:] += 1
+    expected = jitter_stats(latencies, seq)
+    stats = latency_stats(latencies.copy(), jitter=True, seq=seq)
+    assert stats['delay_variation'] == expected
+
+
+def test_full_log_passes_the_packet_column(tmp_path, write_full_log, ping_pong_samples):
+    seq, tx, rx = ping_pong_samples
+    keep = np.ones(len(seq), bool)
+    keep[[100, 2500]] = False  # two lost replies
+    log = write_full_log(tmp_path / 'run.csv', seq[keep], tx[keep], rx[keep])
+    dv = full_log_stats(log, chunk_bytes=20_000)['delay_variation']
+    latencies = (rx - tx)[keep] * 0.5e-3
+    assert dv == jitter_stats(latencies, seq[keep])
+    assert dv != jitter_stats(latencies)
+
+
+def test_memory_stays_near_one_copy():
+    n = 1_000_000
+    latencies = 50 + np.random.default_rng(0).gamma(3.0, 2.0, n)
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        jitter_stats(latencies, np.arange(n))
+        peak = tracemalloc.get_traced_memory()[1] - base
+    finally:
+        tracemalloc.stop()
+    # One n-sized scratch array plus block-sized temporaries
+    assert peak < 8 * n + 16 * 2 ** 20
+
+
+def test_metric_choice(repo_result):
+    from sockperf_tools.parser import parse_sockperf_file
+
+    summary_only = parse_sockperf_file(repo_result('sockperf_pingpong_udp.txt'))
+    assert jitter_metric([summary_only]) == 'std-dev' and jitter_metric([]) == 'std-dev'
+    assert jitter_value(summary_only, 'std-dev') == 15.909
+    summary_only.delay_variation = {'ipdv_p99_us': 7.5}
+    assert jitter_metric([summary_only]) == 'ipdv'
+    assert jitter_value(summary_only, 'ipdv') == 7.5
+    unpaired = parse_sockperf_file(repo_result('sockperf_pingpong_64B.txt'))
+    unpaired.delay_variation = jitter_stats(50 + np.arange(10.0), np.arange(0, 20, 2))
+    assert math.isnan(unpaired.delay_variation['ipdv_p99_us'])
+    assert jitter_metric([summary_only, unpaired]) == 'std-dev'
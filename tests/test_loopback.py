@@ -0,0 +1,83 @@
+import socket
+
+import numpy as np
+import pytest
+
+from sockperf_tools import loopback
+from sockperf_tools.fulllog import full_log_stats
+from sockperf_tools.parser import parse_sockperf_file
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def _outcome(samples):
+    seq, tx, rx = samples
+    out = loopback.Outcome()
+    out.sent = out.valid_sent = len(seq) + 2
+    out.received = out.valid_received = len(seq)
+    out.dropped = 2
+    out.run_time_sec = out.valid_run_time_sec = 0.5
+    out.seq, out.tx_ns, out.rx_ns = list(seq), list(tx), list(rx)
+    return out
+
+
+def test_written_results_parse_like_sockperf(tmp_path, ping_pong_samples):
+    out = _outcome(ping_pong_samples)
+    summary = loopback.write_results(tmp_path / 'sockperf_pingpong_udp_64B', 'ping-pong', 'udp', '127.0.0.1',
+                                     11111, out, 64, 0.5, 400, 10_000, 100, 'blocking', full_log=True)
+    result = parse_sockperf_file(summary, use_full_log=False)
+    assert (result.test_type, result.protocol, result.msg_size) == ('ping-pong', 'UDP', 64)
+    assert result.total_observations == len(out.seq)
+    latencies = (np.array(out.rx_ns) - np.array(out.tx_ns)) / 2000.0
+    assert result.avg_latency_us == pytest.approx(latencies.mean(), abs=5e-4)
+    assert result.max_latency_us == pytest.approx(latencies.max(), abs=5e-4)
+    # The full log reproduces the samples exactly
+    assert full_log_stats(summary.with_suffix('.csv'))['avg_latency_us'] == pytest.approx(latencies.mean())
+
+
+def test_under_load_parameters_classify_the_run():
+    text = loopback.parameters_text('under-load', 'tcp', '10.0.0.1', 11111, 64, 10, 5000, 50, 'busy')
+    assert '--mps=5000' in text and '--reply-every=50' in text and '--tcp' in text
+
+
+def test_tcp_frames_split_across_reads():
+    a, b = socket.socketpair()
+    with a, b:
+        receiver = loopback._Receiver(b, 'tcp')
+        frames = b''.join(bytes(loopback._message(40, seq, loopback._REPLY)) for seq in range(5))
+        a.sendall(frames[:57])
+        messages = []
+        receiver.consume(b.recv_into(receiver.view), messages)
+        assert [m[0] for m in messages] == [0]
+        a.sendall(frames[57:])
+        receiver.consume(b.recv_into(receiver.view[receiver.fill:]), messages)
+        assert [(seq, flags) for seq, flags, _ in messages] == [(i, loopback._REPLY) for i in range(5)]
+        assert all(len(frame) == 40 for _, _, frame in messages)
+
+
+def test_client_rejects_bad_arguments():
+    with pytest.raises(ValueError):
+        loopback.run_client('playback')
+    with pytest.raises(ValueError):
+        loopback.run_client(msg_size=4)
+    with pytest.raises(ValueError):
+        loopback.run_client('throughput', mode='asyncio')
+
+
+@pytest.mark.parametrize('test, proto', [('ping-pong', 'udp'), ('under-load', 'tcp'), ('throughput', 'udp')])
+def test_run_end_to_end(tmp_path, capsys, test, proto):
+    output = tmp_path / f'sockperf_{test}_{proto}'
+    loopback.main(['run', test, '--proto', proto, '-p', str(_free_port()), '-t', '0.3', '--warmup-msec', '50',
+                   '--mps', '2000', '--reply-every', '10', '--full-log', '-o', str(output)])
+    result = parse_sockperf_file(output.with_suffix('.txt'))
+    assert result.test_type == test
+    if test == 'throughput':
+        assert result.msg_rate > 0
+    else:
+        assert result.total_observations > 0 and result.avg_latency_us > 0
+        assert output.with_suffix('.csv').exists()
+    assert 'Results written to' in capsys.readouterr().out
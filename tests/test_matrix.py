@@ -0,0 +1,65 @@
+import sys
+
+from sockperf_tools import matrix as matrix_module
+from sockperf_tools.matrix import DEFAULT_MATRIX, command_for, expand, load_matrix, run_matrix
+
+
+def _matrix(**overrides):
+    return dict(DEFAULT_MATRIX, **overrides)
+
+
+def test_default_campaign_expands_in_order():
+    runs = expand(load_matrix())
+    assert len(runs) == 2 * (4 + 1 + 1)
+    assert [r['topology'] for r in runs] == ['dual'] * 6 + ['single'] * 6
+    under_load = [r for r in runs if r['test'] == 'under-load']
+    assert all((r['mps'], r['reply_every']) == (10000, 100) for r in under_load)
+    assert runs[1]['output'] == 'results/dual/sockperf_pingpong_udp_64B'
+    assert not [r for r in runs if r['test'] == 'throughput' and r['full_log']]
+
+
+def test_bare_under_load_uses_the_default_rate():
+    [run] = expand(_matrix(sizes=[None], tests=[{'test': 'under-load'}], topologies={'dual': {}}))
+    assert (run['mps'], run['reply_every']) == (10000, 100)
+    argv = command_for(run)
+    assert argv[argv.index('--mps') + 1] == '10000'
+    assert argv[argv.index('--reply-every') + 1] == '100'
+    assert 'None' not in argv
+
+
+def test_rates_repeats_and_topology_overrides():
+    runs = expand(_matrix(sizes=[64], repeat=2, tests=[{'test': 'under-load', 'mps': [1000, 5000]}],
+                          topologies={'dual': {}, 'single': {'before': 'switch.sh', 'duration': 5}}))
+    assert len(runs) == 8
+    assert runs[0]['output'].endswith('sockperf_underload_udp_64B_1000mps')
+    assert runs[1]['output'].endswith('sockperf_underload_udp_64B_1000mps_r2')
+    assert {r['duration'] for r in runs if r['topology'] == 'single'} == {5}
+    assert {r['before'] for r in runs if r['topology'] == 'single'} == {'switch.sh'}
+
+
+def test_commands_for_each_backend():
+    run = expand(_matrix(sizes=[512], tests=['ping-pong'], topologies={'dual': {}}))[0]
+    assert command_for(run) == ['sockperf', 'ping-pong', '-i', '192.168.1.3', '-p', '11111', '-t', '30',
+                                '-m', '512', '--full-log', 'results/dual/sockperf_pingpong_udp_512B.csv']
+    run['backend'] = 'loopback'
+    assert command_for(run)[:4] == [sys.executable, '-m', 'sockperf_tools.loopback', 'client']
+    assert command_for(run)[-1] == '--full-log'
+
+
+def test_dry_run_prints_commands(capsys):
+    matrix = _matrix(backend='loopback', tests=['ping-pong', {'test': 'playback', 'data_file': 'p.csv'}],
+                     sizes=[None], topologies={'loopback': {}})
+    assert run_matrix(matrix, dry_run=True) == []
+    out = capsys.readouterr().out.splitlines()
+    assert 'sockperf_tools.loopback client ping-pong' in out[0]
+    assert out[1].startswith('# skipped') and 'playback' in out[1]
+
+
+def test_each_topology_gets_its_own_title(monkeypatch, tmp_path):
+    titles = []
+    monkeypatch.setattr('sockperf_tools.overview.render_dashboard',
+                        lambda panels, groups, shape, figsize, title, *args: titles.append(title) or (0, 0))
+    for topology in ('single', 'loopback'):
+        matrix_module._render(topology, {}, str(tmp_path), None)
+    assert 'Single-Board' in titles[0] and 'LAN9662 → 192.168.1.3' in titles[0]
+    assert 'Loopback' in titles[1] and 'LAN9662-2' not in ''.join(titles)
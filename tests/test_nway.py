@@ -0,0 +1,103 @@
+import math
+
+import numpy as np
+import pytest
+
+from sockperf_tools import nway
+from sockperf_tools.batch import discover, load_by_topology, parse_files
+from sockperf_tools.parser import SockperfResult
+
+REPO_RUNS = ['sockperf_pingpong_udp.txt', 'sockperf_pingpong_64B.txt', 'sockperf_pingpong_512B.txt',
+             'sockperf_pingpong_1472B.txt', 'sockperf_pingpong_tcp.txt', 'sockperf_single_pingpong_udp.txt',
+             'sockperf_single_pingpong_64B.txt', 'sockperf_single_pingpong_512B.txt',
+             'sockperf_single_pingpong_1472B.txt', 'sockperf_underload_udp.txt']
+
+
+def _run(firmware, size, avg, p99=None, topology='dual'):
+    result = SockperfResult(f'{firmware}_{size}.txt')
+    result.test_type, result.msg_size, result.topology, result.firmware = 'ping-pong', size, topology, firmware
+    result.avg_latency_us = avg
+    result.percentiles = {99.0: p99 if p99 is not None else 2 * avg}
+    return result
+
+
+def test_tensor_averages_repeats_and_leaves_gaps():
+    results = [_run('a', None, 40.0), _run('a', None, 44.0), _run('a', 512, 60.0),
+               _run('b', 64, 50.0), _run('b', 512, 55.0, p99=math.nan)]
+    results[0].test_type = 'under-load'
+    results.append(_run('a', None, 10.0))
+    results[-1].test_type = 'under-load'
+    tensor = nway.build_tensor(results, by=('topology', 'firmware'))
+    assert tensor['configs'] == ['dual/a', 'dual/b']
+    np.testing.assert_array_equal(tensor['payloads'], [14, 64, 512])
+    avg = nway.metric_values(tensor, 'avg_latency_us')
+    np.testing.assert_array_equal(avg, [[44.0, np.nan, 60.0], [np.nan, 50.0, 55.0]])
+    assert math.isnan(nway.metric_values(tensor, 'p99')[1, 2]) and tensor['runs'][1, 2] == 1
+    assert np.isnan(nway.metric_values(tensor, 'p50')).all()
+    assert nway.build_tensor(results, test_type='under-load')['values'][0, 0, 0] == pytest.approx(25.0)
+
+
+def test_pairwise_and_ranking_match_a_loop():
+    rng = np.random.default_rng(1)
+    values = rng.uniform(40, 140, (60, 4))
+    values[rng.random(values.shape) < 0.1] = np.nan
+    values[7] = np.nan
+    deltas = nway.pairwise(values)
+    ranking = nway.rank_configs(values)
+    for i in range(0, 60, 7):
+        for j in range(0, 60, 5):
+            np.testing.assert_array_equal(deltas['delta'][i, j], values[i] - values[j])
+            assert ranking['wins'][i, j] == sum(values[i, p] < values[j, p] for p in range(4))
+    for p in range(4):
+        column = values[:, p]
+        present = np.flatnonzero(np.isfinite(column))
+        expected = np.argsort(np.argsort(column[present])) + 1
+        np.testing.assert_array_equal(ranking['rank'][present, p], expected)
+    assert ranking['order'][-1] == 7 and ranking['coverage'][7] == 0
+    mean_rank = ranking['mean_rank'][ranking['order'][:-1]]
+    assert np.all(np.diff(mean_rank) >= 0)
+
+
+def test_hundreds_of_configurations():
+    sizes = (None, 64, 512, 1472)
+    results = [_run(f'fw{c:03d}', size, 40.0 + c * 0.1 + (size or 14) * 0.05) for c in range(400) for size in sizes]
+    tensor = nway.build_tensor(results, by=('firmware',))
+    assert tensor['values'].shape == (400, 4, len(nway.METRICS))
+    ranking = nway.rank_configs(nway.metric_values(tensor, 'avg_latency_us'))
+    np.testing.assert_array_equal(ranking['order'], np.arange(400))
+    assert ranking['wins'][0, 399] == 4 and ranking['wins'][399, 0] == 0
+    relative = nway.mean_relative(nway.metric_values(tensor, 'avg_latency_us'))
+    assert relative.shape == (400, 400) and np.all(np.diag(relative) == 0)
+
+
+def test_two_topologies_agree_with_the_dual_single_comparison(tmp_path, repo_result):
+    for name in REPO_RUNS:
+        repo_result(name)
+    results = parse_files(discover([tmp_path]), jobs=1)
+    tensor = nway.build_tensor(results, by=('topology', 'protocol'))
+    assert set(tensor['configs']) == {'dual/UDP', 'single/UDP'}  # the TCP run failed to connect
+    dual, single = tensor['configs'].index('dual/UDP'), tensor['configs'].index('single/UDP')
+    relative = nway.pairwise(nway.metric_values(tensor, 'avg_latency_us'))['relative_pct'][single, dual]
+
+    by_topology = load_by_topology([tmp_path], jobs=1)
+    for payload, label in zip(tensor['payloads'], ['Ping-Pong (Default)', 'Ping-Pong (64B)', 'Ping-Pong (512B)',
+                                                   'Ping-Pong (1472B)']):
+        d, s = by_topology['dual'][label]['avg_latency_us'], by_topology['single'][label]['avg_latency_us']
+        assert relative[list(tensor['payloads']).index(payload)] == pytest.approx(-(d - s) / d * 100)
+
+
+def test_main(tmp_path, repo_result, capsys):
+    for name in REPO_RUNS:
+        repo_result(name)
+    nway.main([str(tmp_path), '--by', 'topology,protocol', '--baseline', 'dual/UDP', '--metric', 'p99',
+               '-o', str(tmp_path / 'nway.png'), '--dpi', '30'])
+    out = capsys.readouterr().out
+    assert '2 configurations, 4 payloads, ranked by p99 latency (baseline dual/UDP)' in out
+    assert '1 single/UDP' in out and '4-0' in out and '(5 panels drawn' in out
+    assert (tmp_path / 'nway.png').exists()
+
+    nway.main([str(tmp_path), '--json'])
+    assert '"order": [\n    "single",\n    "dual"\n  ]' in capsys.readouterr().out
+
+    with pytest.raises(SystemExit):
+        nway.main([str(tmp_path), '--by', 'colour'])
@@ -0,0 +1,83 @@
+from pathlib import Path
+
+import pytest
+
+from sockperf_tools.parser import parse_lines, parse_sockperf_file, parse_text
+
+REPO = Path(__file__).resolve().parent.parent
+
+
+def _parse(name):
+    return parse_sockperf_file(REPO / name, use_full_log=False)
+
+
+def test_ping_pong_summary():
+    result = _parse('sockperf_pingpong_udp.txt')
+    assert result.test_type == 'ping-pong'
+    assert result.version == '3.7-no.git'
+    assert (result.target_ip, result.target_port, result.protocol) == ('192.168.1.3', 11111, 'UDP')
+    assert result.avg_latency_us == 52.688
+    assert result.jitter_us == result.std_dev_us == 15.909
+    assert (result.min_latency_us, result.max_latency_us) == (38.754, 551.355)
+    assert result.total_observations == 280219
+    assert result.percentiles[99.999] == 432.270
+    assert result.percentiles[50.0] == 47.320
+    assert result.packet_loss_pct == pytest.approx(100 / 284434)
+    assert result.msg_size is None
+
+
+def test_payload_comes_from_the_filename_for_ping_pong():
+    assert _parse('sockperf_pingpong_1472B.txt').msg_size == 1472
+    assert _parse('sockperf_single_pingpong_64B.txt').msg_size == 64
+
+
+def test_under_load_is_told_apart_by_the_reply_ratio():
+    result = _parse('sockperf_underload_udp.txt')
+    assert result.test_type == 'under-load'
+    assert result.reply_every == 100
+    # 300004 sent at one reply per 100 -> 3000 replies expected, all received
+    assert result.packet_loss_pct == 0.0
+
+
+def test_under_load_loss_counts_only_expected_replies():
+    text = (REPO / 'sockperf_underload_udp.txt').read_text().replace('ReceivedMessages=3000', 'ReceivedMessages=2970')
+    assert parse_text(text).packet_loss_pct == pytest.approx(1.0)
+
+
+def test_throughput_payload_from_bandwidth_and_rate():
+    result = _parse('sockperf_throughput_udp.txt')
+    assert result.test_type == 'throughput'
+    assert result.msg_rate == 81272
+    assert result.bandwidth_mbps == 912.723
+    assert result.throughput_messages == 2438169
+    assert result.msg_size == 1472
+
+
+def test_errors_and_usage_text():
+    failed = _parse('sockperf_pingpong_tcp.txt')
+    assert failed.test_type == 'error'
+    assert 'Connection refused' in failed.errors[0]
+    assert _parse('sockperf_playback_udp.txt').test_type == 'unknown'
+
+
+def test_parameters_header_is_authoritative():
+    text = (REPO / 'sockperf_pingpong_udp.txt').read_text()
+    text = text.replace('[ 0] IP', 'sockperf: test was performed using the following parameters: '
+                        'ul -i 192.168.1.3 --mps=5000 --reply-every=50 -m 256\n[ 0] IP', 1)
+    result = parse_text(text, 'sockperf_pingpong_1472B.txt')
+    assert result.test_type == 'under-load'
+    assert (result.mps, result.reply_every, result.msg_size) == (5000, 50, 256)
+
+
+def test_parse_lines_matches_parse_text():
+    text = (REPO / 'sockperf_underload_udp.txt').read_text()
+    assert parse_lines(text.splitlines()).as_dict() == parse_text(text).as_dict()
+
+
+def test_dict_style_access():
+    result = _parse('sockperf_throughput_udp.txt')
+    assert 'msg_rate' in result and 'avg_latency_us' not in result
+    assert result.get('avg_latency_us', 0) == 0
+    with pytest.raises(KeyError):
+        result['avg_latency_us']
+    assert 'servers' not in result.as_dict()
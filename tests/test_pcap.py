@@ -0,0 +1,150 @@
+import struct
+
+import numpy as np
+import pytest
+
+from sockperf_tools import pcap
+from sockperf_tools.fulllog import full_log_stats
+from sockperf_tools.parser import parse_sockperf_file
+
+CLIENT, SERVER = bytes([192, 168, 1, 2]), bytes([192, 168, 1, 3])
+START_NS = 1_730_790_000 * 10 ** 9
+
+
+def _frame(seq, reply, size=64, vlan=False):
+    """Ethernet/IPv4/UDP frame carrying a loopback-layout sockperf message"""
+    payload = struct.pack('<IQB', size, seq, 1).ljust(size, b'\0')
+    sport, dport = (pcap.DEFAULT_PORT, 40000) if reply else (40000, pcap.DEFAULT_PORT)
+    udp = struct.pack('>HHHH', sport, dport, 8 + len(payload), 0) + payload
+    src, dst = (SERVER, CLIENT) if reply else (CLIENT, SERVER)
+    ip = struct.pack('>BBHHHBBH4s4s', 0x45, 0, 20 + len(udp), 0, 0, 64, 17, 0, src, dst) + udp
+    tag = struct.pack('>HH', 0x8100, 5) if vlan else b''
+    return b'\x02' * 6 + b'\x04' * 6 + tag + b'\x08\x00' + ip
+
+
+def _write_pcap(path, packets, nanoseconds=False, order='<'):
+    magic = 0xA1B23C4D if nanoseconds else 0xA1B2C3D4
+    chunks = [struct.pack(order + 'IHHiIII', magic, 2, 4, 0, 0, 65535, 1)]
+    for ts, frame in packets:
+        frac = ts % 10 ** 9 if nanoseconds else ts % 10 ** 9 // 1000
+        chunks.append(struct.pack(order + 'IIII', ts // 10 ** 9, frac, len(frame), len(frame)) + frame)
+    path.write_bytes(b''.join(chunks))
+    return path
+
+
+def _write_pcapng(path, packets, tsresol=9):
+    def block(kind, body):
+        body += b'\0' * (-len(body) % 4)
+        return struct.pack('<II', kind, len(body) + 12) + body + struct.pack('<I', len(body) + 12)
+
+    chunks = [block(0x0A0D0D0A, struct.pack('<IHHq', 0x1A2B3C4D, 1, 0, -1)),
+              block(1, struct.pack('<HHI', 1, 0, 65535) + struct.pack('<HHB3x', 9, 1, tsresol) + b'\0' * 4),
+              block(0x00000005, b'statistics block the reader skips')]
+    for ts, frame in packets:
+        units = ts // 10 ** (9 - tsresol)
+        chunks.append(block(6, struct.pack('<IIIII', 0, units >> 32, units & 0xFFFFFFFF, len(frame), len(frame))
+                            + frame))
+    path.write_bytes(b''.join(chunks))
+    return path
+
+
+@pytest.fixture
+def three_taps(tmp_path):
+    """Taps in front of, between and behind two boards; board 2 drops request 700"""
+    rng = np.random.default_rng(11)
+    n = 2000
+    sent = START_NS + np.arange(n, dtype=np.int64) * 100_000
+    hop1 = 3_000 + rng.integers(0, 500, n)
+    hop2 = 4_000 + rng.integers(0, 800, n)
+    back2, back1 = 4_100 + rng.integers(0, 300, n), 3_100 + rng.integers(0, 300, n)
+    echo = sent + hop1 + hop2 + 20_000
+    taps = [[], [], []]
+    for i in range(n):
+        size = 64 if i % 3 else 1472  # a mix of sizes breaks the equal-size runs
+        taps[0].append((sent[i], _frame(i, False, size)))
+        taps[1].append((sent[i] + hop1[i], _frame(i, False, size, vlan=True)))
+        if i == 700:
+            continue
+        taps[2].append((sent[i] + hop1[i] + hop2[i], _frame(i, False, size)))
+        taps[2].append((echo[i], _frame(i, True, size)))
+        taps[1].append((echo[i] + back2[i], _frame(i, True, size, vlan=True)))
+        taps[0].append((echo[i] + back2[i] + back1[i], _frame(i, True, size)))
+    taps[1].append((sent[5] + hop1[5] + 1, _frame(5, False, vlan=True)))  # a mirrored duplicate
+    for tap in taps:
+        tap.sort(key=lambda packet: packet[0])
+    paths = [_write_pcapng(tmp_path / 'tap0.pcapng', taps[0]),
+             _write_pcap(tmp_path / 'tap1.pcap', taps[1], nanoseconds=True),
+             _write_pcap(tmp_path / 'tap2.pcap', taps[2], nanoseconds=True, order='>')]
+    return paths, hop1, hop2, back1
+
+
+def test_reads_pcap_and_pcapng_alike(tmp_path):
+    packets = [(START_NS + i * 1_000, _frame(i, i % 2 == 1, 64 + 8 * (i % 5))) for i in range(300)]
+    packets.append((START_NS + 400_000, b'\x02' * 12 + b'\x08\x06' + b'\0' * 28))  # ARP
+    a = pcap.read_capture(_write_pcapng(tmp_path / 'a.pcapng', packets))
+    b = pcap.read_capture(_write_pcap(tmp_path / 'b.pcap', packets, nanoseconds=True))
+    c = pcap.read_capture(_write_pcap(tmp_path / 'c.pcap', packets, order='>'))
+    assert a['packets'] == b['packets'] == 301 and len(a['seq']) == 300
+    for key in ('seq', 'direction', 'length', 'ts_ns'):
+        np.testing.assert_array_equal(a[key], b[key])
+    np.testing.assert_array_equal(a['seq'], np.arange(300))
+    np.testing.assert_array_equal(a['direction'], np.arange(300) % 2)
+    np.testing.assert_array_equal(c['ts_ns'], a['ts_ns'] // 1000 * 1000)  # µs pcap
+    assert a['length'][0] == 64 and a['server'] == '192.168.1.3'
+
+
+def test_sub_second_resolutions():
+    raw = np.array([3 * 2 ** 20 + 2 ** 19], dtype=np.int64)
+    assert pcap._to_ns(raw, 0x80 | 20)[0] == 3_500_000_000
+    assert pcap._to_ns(raw, 6)[0] == raw[0] * 1000 and pcap._to_ns(raw, 12)[0] == raw[0] // 1000
+
+
+def test_hops_match_by_sequence(three_taps):
+    paths, hop1, hop2, back1 = three_taps
+    captures = [pcap.read_capture(path) for path in paths]
+    hops = pcap.match_taps(captures, ['host A', 'between', 'host B'])
+    assert [hop['name'] for hop in hops] == ['host A → between', 'between → host B', 'host A → host B']
+    first, second, end_to_end = hops
+
+    seq, ingress, latency = pcap.hop_latencies(first)
+    np.testing.assert_array_equal(seq, np.arange(2000))
+    np.testing.assert_allclose(latency, hop1 * 1e-3)
+    assert first['lost'] == 0 and np.all(np.diff(ingress) > 0)
+
+    seq, _, latency = pcap.hop_latencies(second)
+    assert 700 not in seq and second['lost'] == 1
+    np.testing.assert_allclose(latency, np.delete(hop2, 700) * 1e-3)
+    _, _, latency = pcap.hop_latencies(end_to_end)
+    np.testing.assert_allclose(latency, np.delete(hop1 + hop2, 700) * 1e-3)
+
+    _, _, replies = pcap.hop_latencies(first, direction=1)
+    np.testing.assert_allclose(replies, np.delete(back1, 700) * 1e-3)
+    stats = pcap.hop_stats(second)
+    assert stats['total_observations'] == 1999 and 'delay_variation' in stats
+
+
+def test_exported_hops_read_like_sockperf_runs(three_taps, tmp_path, capsys):
+    paths, hop1, hop2, _ = three_taps
+    output = tmp_path / 'hops'
+    pcap.main([str(path) for path in paths] + ['--names', 'A,B,C', '-o', str(output),
+                                               '--plot', str(tmp_path / 'hops.png'), '--dpi', '30'])
+    out = capsys.readouterr().out
+    assert 'B → C' in out and '(5 panels drawn' in out
+
+    runs = pcap.load_hops(output / pcap.MANIFEST)
+    assert list(runs) == ['A → B', 'B → C', 'A → C']
+    result = runs['A → B']
+    assert result.test_type == 'ping-pong' and result.msg_size == 64
+    assert result['avg_latency_us'] == pytest.approx(hop1.mean() * 1e-3)
+    assert result['max_latency_us'] == pytest.approx(hop1.max() * 1e-3)
+    assert runs['B → C'].received_messages == 1999 and runs['B → C']['packet_loss_pct'] == pytest.approx(0.05)
+
+    summary = parse_sockperf_file(output / 'b-c' / 'sockperf_pingpong_udp.txt')
+    stats = full_log_stats(output / 'b-c' / 'sockperf_pingpong_udp.sps')
+    assert summary['percentiles'][99.0] == stats['percentiles'][99.0]
+    assert stats['percentiles'][99.0] == pytest.approx(np.percentile(np.delete(hop2, 700) * 1e-3, 99, method='inverted_cdf'))
+
+
+def test_needs_two_taps(tmp_path):
+    with pytest.raises(SystemExit):
+        pcap.main([str(tmp_path / 'one.pcap')])
@@ -0,0 +1,130 @@
+import numpy as np
+import pytest
+
+from sockperf_tools import playback
+
+START_NS = 1_730_790_000 * 10 ** 9
+
+
+@pytest.mark.parametrize('shape', playback.SHAPES)
+def test_shapes_keep_rate_and_order(shape):
+    times, sizes = playback.generate(shape, 50_000, rate=20_000, sizes=[64, 512, 1472], weights=[6, 3, 1], seed=2)
+    assert len(times) == len(sizes) == 50_000 and times[0] == 0
+    assert np.all(np.diff(times) >= 0)
+    assert len(times) / (times[-1] / 1e9) == pytest.approx(20_000, rel=0.03)
+    assert set(np.unique(sizes)) <= {64, 512, 1472}
+
+
+def test_periodic_streams_repeat_every_cycle():
+    times, sizes = playback.generate('periodic', 1000, rate=10_000, sizes=[64, 1472], cycle_us=1000, seed=1)
+    cycles = times.reshape(-1, 10)
+    np.testing.assert_array_equal(cycles - cycles[:, :1], np.broadcast_to(cycles[0], cycles.shape))
+    np.testing.assert_array_equal(cycles[:, 0], np.arange(100) * 1_000_000)
+    np.testing.assert_array_equal(sizes.reshape(-1, 10), np.broadcast_to(sizes[:10], (100, 10)))
+    np.testing.assert_array_equal(np.diff(cycles[0]), playback.wire_ns(sizes[:9]))
+
+
+def test_bursts_are_back_to_back():
+    times, sizes = playback.generate('bursty', 640, rate=10_000, sizes=[1472], burst=32)
+    bursts = times.reshape(-1, 32)
+    np.testing.assert_array_equal(bursts[:, 0], np.arange(20) * 3_200_000)
+    assert np.all(np.diff(bursts, axis=1) == playback.wire_ns([1472])[0])
+
+
+def test_too_much_for_the_line():
+    with pytest.raises(ValueError):
+        playback.generate('periodic', 100, rate=1_000_000, sizes=[1472])
+    with pytest.raises(ValueError):
+        playback.generate('bursty', 100, rate=1_000_000, sizes=[1472])
+    with pytest.raises(ValueError):
+        playback.generate('poisson', 100, sizes=[9])
+
+
+def test_mixed_messages_never_overlap_on_the_wire():
+    times, sizes = playback.generate('mixed', 50_000, rate=40_000, sizes=[64, 1472], seed=2)
+    assert times[0] == 0 and len(np.unique(times)) == len(times)
+    assert np.all(np.diff(times) >= playback.wire_ns(sizes[:-1]))
+    # Half the rate is still periodic, half Poisson
+    assert len(times) / (times[-1] * 1e-9) == pytest.approx(40_000, rel=0.05)
+
+
+def test_schedule_round_trip(tmp_path):
+    times, sizes = playback.generate('mixed', 30_000, rate=5_000, sizes=[14, 100, 9000], seed=4)
+    path = tmp_path / 'playback.csv'
+    playback.write_schedule(path, times, sizes)
+    lines = path.read_text().splitlines()
+    assert {len(line) for line in lines} == {len('0.000000000, 9000')} and lines[0].startswith('0.000000000, ')
+    read_times, read_sizes = playback.read_schedule(path, chunk_bytes=1 << 12)
+    np.testing.assert_array_equal(read_times, times)
+    np.testing.assert_array_equal(read_sizes, sizes)
+
+    path.write_text('# time, size\n' + path.read_text())
+    np.testing.assert_array_equal(playback.read_schedule(path)[0], times)
+
+
+def test_many_sizes_are_binned():
+    group, labels = playback.size_groups(np.arange(14, 1500))
+    assert labels == ['14-127B', '128-255B', '256-511B', '512-1023B', '1024-1472B', '1473-8999B']
+    assert group[0] == 0 and group[-1] == 5
+
+
+@pytest.fixture
+def playback_run(tmp_path, write_full_log):
+    """A 2 s Poisson schedule whose second half doubles in rate; latency grows with size"""
+    first, _ = playback.generate('poisson', 10_000, rate=10_000, sizes=[64], seed=5)
+    second, _ = playback.generate('poisson', 20_000, rate=20_000, sizes=[64], seed=6)
+    times = np.r_[first, first[-1] + 50_000 + second]
+    sizes = np.random.default_rng(7).choice([64, 512, 1472], len(times))
+    schedule = tmp_path / 'playback.csv'
+    playback.write_schedule(schedule, times, sizes)
+
+    seq = np.delete(np.arange(len(times)), np.arange(0, len(times), 10))  # every 10th message lost
+    tx = START_NS + times[seq]
+    latency = 10_000 + sizes[seq] * 10  # ns one way: 10.64, 15.12 or 24.72 µs
+    log = write_full_log(tmp_path / 'sockperf_playback_udp.csv', seq, tx, tx + 2 * latency)
+    return log, schedule, times, sizes
+
+
+def test_analysis_by_size_and_slice(playback_run):
+    log, schedule, times, sizes = playback_run
+    analysis = playback.analyze_playback(log, schedule, slice_s=0.25, chunk_bytes=1 << 14)
+    assert analysis['rows'] == 30_000 and analysis['records'] == 27_000 and analysis['unmatched'] == 0
+
+    by_size = analysis['sizes']
+    assert by_size['label'] == ['64B', '512B', '1472B']
+    np.testing.assert_array_equal(by_size['scheduled'], [np.count_nonzero(sizes == s) for s in (64, 512, 1472)])
+    assert by_size['count'].sum() == 27_000
+    np.testing.assert_allclose(by_size['avg_us'], [10.64, 15.12, 24.72])
+    np.testing.assert_allclose(by_size['p99_us'], [10.64, 15.12, 24.72], rtol=1e-3)
+
+    slices = analysis['slices']
+    assert slices['window_s'] == 0.25 and len(slices['time_s']) == 8
+    np.testing.assert_allclose(slices['offered_rate'][[0, 1, 2]], 10_000, rtol=0.1)
+    np.testing.assert_allclose(slices['offered_rate'][[5, 6]], 20_000, rtol=0.1)
+    np.testing.assert_allclose(slices['replied_rate'][:7], slices['offered_rate'][:7] * 0.9, rtol=0.02)
+    assert slices['offered_mbps'][0] == pytest.approx(slices['offered_rate'][0] * sizes.mean() * 8e-6, rel=0.1)
+
+
+def test_unmatched_records_and_seq_base(playback_run, tmp_path, write_full_log):
+    _, schedule, times, _ = playback_run
+    seq = np.arange(1000, 1100)
+    log = write_full_log(tmp_path / 'shifted.csv', seq, START_NS + times[:100], START_NS + times[:100] + 20_000)
+    analysis = playback.analyze_playback(log, schedule, seq_base=1000)
+    assert analysis['unmatched'] == 0 and analysis['sizes']['count'].sum() == 100
+    assert playback.analyze_playback(log, schedule, seq_base=-28_950)['unmatched'] == 50
+
+
+def test_main(playback_run, tmp_path, capsys):
+    log, schedule, _, _ = playback_run
+    output = tmp_path / 'generated.csv'
+    playback.main(['generate', str(output), '--shape', 'bursty', '--rows', '1000', '--sizes', '64,1472',
+                   '--weights', '3,1', '--seed', '1'])
+    assert 'bursty schedule of 1,000 messages' in capsys.readouterr().out
+    assert len(playback.read_schedule(output)[0]) == 1000
+
+    playback.main(['analyze', str(log), '--data-file', str(schedule), '--slice', '0.5',
+                   '-o', str(tmp_path / 'playback.png'), '--dpi', '30'])
+    out = capsys.readouterr().out
+    assert 'Schedule: 30,000 messages' in out and '1472B' in out
+    assert 'Worst 500 ms slices by p99' in out and '(4 panels drawn' in out
+    assert (tmp_path / 'playback.png').exists()
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from sockperf_tools import overview, render
+from sockperf_tools.batch import load_results
+from sockperf_tools.render import render_dashboard
+
+
+def _draw_text(ax, text):
+    ax.text(0.5, 0.5, text)
+
+
+@pytest.fixture
+def results(tmp_path, repo_result):
+    for name in ('sockperf_pingpong_udp.txt', 'sockperf_throughput_udp.txt'):
+        repo_result(name, directory=tmp_path / 'runs')
+    return load_results([tmp_path / 'runs'], topology='dual')
+
+
+def test_fingerprint_covers_inputs_module_and_version(monkeypatch):
+    key = render._fingerprint(_draw_text, ('a',), (2, 2), 50)
+    assert key == render._fingerprint(_draw_text, ('a',), (2, 2), 50)
+    assert key != render._fingerprint(_draw_text, ('b',), (2, 2), 50)
+    assert key != render._fingerprint(_draw_text, ('a',), (2, 2), 60)
+    monkeypatch.setattr(render, 'RENDER_VERSION', render.RENDER_VERSION + 1)
+    assert key != render._fingerprint(_draw_text, ('a',), (2, 2), 50)
+
+
+def test_fingerprint_follows_helpers_in_the_panel_module(monkeypatch):
+    key = render._fingerprint(_draw_text, ('a',), (2, 2), 50)
+    # An edit outside the draw function itself (a helper or a threshold)
+    monkeypatch.setattr(render, '_module_source', lambda name: 'edited')
+    assert key != render._fingerprint(_draw_text, ('a',), (2, 2), 50)
+
+
+def test_stitch_composites_in_uint8():
+    import io
+
+    from PIL import Image
+
+    def png(color, size):
+        buf = io.BytesIO()
+        Image.new('RGBA', size, color).save(buf, format='png')
+        return buf.getvalue()
+
+    tiles = [png((0, 0, 0, 255), (30, 5)), png((255, 0, 0, 255), (10, 10)), png((0, 0, 255, 255), (10, 8))]
+    canvas = render._stitch(tiles, (1, 2))
+    assert canvas.dtype == np.uint8 and canvas.shape == (15, 20, 4)
+    assert tuple(canvas[0, 0]) == (0, 0, 0, 255)
+    assert tuple(canvas[5, 0]) == (255, 0, 0, 255)
+    assert tuple(canvas[5, 10]) == (0, 0, 255, 255)
+    assert tuple(canvas[14, 10]) == (255, 255, 255, 255)  # short tile padded with white
+
+
+def test_unchanged_panels_are_reused(tmp_path, results):
+    output = tmp_path / 'overview.png'
+    options = dict(dpi=40, jobs=1, cache_dir=tmp_path / 'cache')
+    assert render_dashboard(overview.PANELS, (results,), (2, 3), (16, 10), 'T', output, **options) == (7, 0)
+    assert render_dashboard(overview.PANELS, (results,), (2, 3), (16, 10), 'T', output, **options) == (0, 7)
+
+    results['Throughput'].bandwidth_mbps = 1.0
+    # Only the throughput panel shows the throughput run
+    assert render_dashboard(overview.PANELS, (results,), (2, 3), (16, 10), 'T', output, **options) == (1, 6)
@@ -0,0 +1,88 @@
+import os
+
+import numpy as np
+import pytest
+
+from sockperf_tools import samples as samples_module
+from sockperf_tools.fulllog import full_log_stats, iter_full_log, latency_stats, read_latencies
+from sockperf_tools.parser import full_log_path, parse_sockperf_file
+from sockperf_tools.samples import SampleFile, convert, is_sample_file
+
+
+@pytest.fixture
+def csv_log(tmp_path, write_full_log, ping_pong_samples):
+    return write_full_log(tmp_path / 'sockperf_pingpong_udp.csv', *ping_pong_samples)
+
+
+def test_round_trip_is_exact(csv_log, ping_pong_samples):
+    seq, tx, rx = ping_pong_samples
+    output = convert(csv_log, chunk_bytes=10_000)  # many parse chunks
+    assert is_sample_file(output) and not is_sample_file(csv_log)
+    samples = SampleFile(output)
+    assert len(samples) == len(seq)
+    for column, expected in zip((samples.seq, samples.tx_ns, samples.rx_ns), (seq, tx, rx)):
+        assert isinstance(column, np.memmap)
+        np.testing.assert_array_equal(column, expected)
+    assert samples.meta['parameters'] == 'pp -i 192.168.1.3 -t 30'
+    assert samples.meta['columns']['seq'] % samples_module.PAGE == 0
+
+
+def test_stats_match_the_csv(csv_log):
+    from_csv = full_log_stats(csv_log)
+    sps = convert(csv_log)
+    assert full_log_stats(sps) == from_csv
+    np.testing.assert_array_equal(read_latencies(sps), read_latencies(csv_log))
+    assert [len(c[0]) for c in iter_full_log(sps)] == [5000]
+
+
+def test_time_window(csv_log, ping_pong_samples):
+    _, tx, rx = ping_pong_samples
+    samples = SampleFile(convert(csv_log))
+    rows = samples.window(0.1, 0.2)
+    offset = tx - tx[0]
+    wanted = (offset >= 100_000_000) & (offset < 200_000_000)
+    assert (rows.start, rows.stop) == (np.flatnonzero(wanted)[0], np.flatnonzero(wanted)[-1] + 1)
+    np.testing.assert_allclose(samples.latencies(rows), (rx - tx)[wanted] / 2000.0)
+    assert samples.window() == slice(0, len(tx))
+    assert samples.window(100, None) == slice(len(tx), len(tx))
+    hist = samples.histogram(rows=rows)
+    assert hist.count == wanted.sum()
+
+
+def test_parser_prefers_the_newer_format(tmp_path, repo_result, write_full_log, ping_pong_samples):
+    summary = repo_result('sockperf_pingpong_udp.txt')
+    csv = write_full_log(summary.with_suffix('.csv'), *ping_pong_samples)
+    sps = convert(csv)
+    assert full_log_path(summary) == sps
+    from_sps = parse_sockperf_file(summary)
+    os.utime(csv, ns=(sps.stat().st_mtime_ns + 10 ** 9,) * 2)
+    assert full_log_path(summary) == csv
+    assert parse_sockperf_file(summary).as_dict() == from_sps.as_dict()
+
+
+def test_empty_log(tmp_path, write_full_log):
+    samples = SampleFile(convert(write_full_log(tmp_path / 'empty.csv', [], [], [])))
+    assert len(samples) == 0 and samples.stats == {}
+    assert samples.window(1, 2) == slice(0, 0)
+
+
+def test_rejects_other_files_and_newer_formats(tmp_path, csv_log):
+    with pytest.raises(ValueError):
+        SampleFile(csv_log)
+    output = convert(csv_log)
+    data = bytearray(output.read_bytes())
+    data[data.index(b'"version": 1') + 11] = ord('9')
+    output.write_bytes(bytes(data))
+    with pytest.raises(ValueError, match='format 9'):
+        SampleFile(output)
+
+
+def test_window_command(csv_log, capsys):
+    samples_module.main(['window', str(convert(csv_log)), '--start', '0.1', '--stop', '0.2'])
+    out = capsys.readouterr().out
+    assert '[0.1 s, 0.2 s)' in out and 'IPDV' in out
+
+
+def test_stored_stats_equal_latency_stats(csv_log):
+    stats = SampleFile(convert(csv_log)).stats
+    assert stats == latency_stats(read_latencies(csv_log), jitter=True)
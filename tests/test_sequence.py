@@ -0,0 +1,111 @@
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from sockperf_tools import sequence
+from sockperf_tools.parser import parse_sockperf_file
+
+
+def _messy_sequence(step=1, n=20_000, seed=3):
+    """Sequence numbers with random loss, a long outage, swaps and repeats"""
+    rng = np.random.default_rng(seed)
+    seq = np.arange(n, dtype=np.int64) * step + 7 * step
+    seq = seq[rng.random(n) > 0.03]
+    seq = np.delete(seq, np.arange(5000, 5400))
+    swap = rng.choice(len(seq) - 4, 150, replace=False)
+    seq[swap], seq[swap + 3] = seq[swap + 3].copy(), seq[swap].copy()
+    return np.insert(seq, [100, 200, 200, 9000], seq[[90, 150, 150, 8000]])
+
+
+def _naive(seq, step):
+    """Reference: one Python pass with a set"""
+    seen, duplicates, distances, highest = set(), 0, [], None
+    for s in seq.tolist():
+        if s in seen:
+            duplicates += 1
+            continue
+        seen.add(s)
+        if highest is not None and s < highest:
+            distances.append((highest - s) // step)
+        highest = s if highest is None else max(highest, s)
+    present = sorted(seen)
+    gaps = [(b - a) // step - 1 for a, b in zip(present, present[1:])]
+    return duplicates, distances, [g for g in gaps if g], (present[-1] - present[0]) // step + 1 - len(present)
+
+
+def _write(path, write_full_log, seq):
+    tx = 1_730_790_000 * 10 ** 9 + np.arange(len(seq), dtype=np.int64) * 100_000
+    return write_full_log(path, seq, tx, tx + 90_000)
+
+
+@pytest.mark.parametrize('step', [1, 100])
+@pytest.mark.parametrize('chunk_bytes', [1 << 12, 1 << 24])
+def test_matches_a_set_based_pass(tmp_path, write_full_log, step, chunk_bytes):
+    seq = _messy_sequence(step)
+    stats = sequence.sequence_stats(_write(tmp_path / 'run.csv', write_full_log, seq), chunk_bytes=chunk_bytes)
+    duplicates, distances, bursts, lost = _naive(seq, step)
+    assert stats['step'] == step and stats['first_seq'] == 7 * step
+    assert stats['records'] == len(seq) and stats['duplicates'] == duplicates == 4
+    assert stats['received'] == len(seq) - duplicates and stats['lost'] == lost
+    assert stats['reordered'] == len(distances) and stats['reorder_max'] == max(distances)
+    assert stats['reorder_hist'].sum() == len(distances)
+    assert stats['bursts'] == len(bursts) and stats['burst_max'] == max(bursts) >= 400
+    assert stats['burst_mean'] == pytest.approx(np.mean(bursts))
+    np.testing.assert_array_equal(stats['burst_hist'][:sequence.HIST_LIMIT],
+                                  np.bincount(bursts, minlength=sequence.HIST_LIMIT)[:sequence.HIST_LIMIT])
+
+
+def test_long_bursts_share_the_last_bucket(tmp_path, write_full_log):
+    seq = np.r_[0:10, 3000:3010, 6000:6010]
+    stats = sequence.sequence_stats(_write(tmp_path / 'run.csv', write_full_log, seq))
+    assert stats['bursts'] == 2 and stats['burst_max'] == 2990
+    assert stats['burst_hist'][sequence.HIST_LIMIT] == 2 and stats['burst_hist'].sum() == 2
+
+
+def test_off_grid_records_are_not_received(tmp_path, write_full_log):
+    seq = np.r_[np.arange(0, 1000, 10), [55, 501]]
+    stats = sequence.sequence_stats(_write(tmp_path / 'run.csv', write_full_log, seq), step=10)
+    assert stats['misaligned'] == 2 and stats['received'] == 100 and stats['lost'] == 0
+
+
+def test_expected_count_includes_the_tail(tmp_path, write_full_log):
+    log = _write(tmp_path / 'run.csv', write_full_log, np.arange(0, 9_000, 100))
+    stats = sequence.sequence_stats(log, expected=100)
+    assert stats['lost'] == 10 and stats['loss_pct'] == pytest.approx(10.0)
+    assert stats['bursts'] == 0
+
+
+def test_under_load_summary_and_log(tmp_path, repo_result, write_full_log, capsys):
+    summary = repo_result('sockperf_underload_udp.txt')
+    result = parse_sockperf_file(summary, use_full_log=False)
+    assert sequence.expected_records(result) == 2952
+    seq = np.delete(np.arange(2952, dtype=np.int64) * 100, [10, 11, 12, 500])
+    _write(summary.with_suffix('.csv'), write_full_log, seq)
+    stats = sequence.sequence_stats_for(result)
+    assert stats['step'] == 100 and stats['lost'] == 4 and stats['bursts'] == 2
+    sequence.main([str(summary)])
+    out = capsys.readouterr().out
+    assert 'Received: 2,948 of 2,952 expected; lost 4 (0.1355%)' in out
+    assert 'lengths: 1×1, 3×1' in out
+
+
+def test_memory_is_the_bitmap_plus_one_chunk(monkeypatch):
+    chunk = 1 << 16
+    n = 64 * chunk
+
+    def chunks(filename, chunk_bytes):
+        for start in range(0, n, chunk):
+            seq = np.arange(start, start + chunk, dtype=np.int64)
+            yield seq, seq, seq
+
+    monkeypatch.setattr('sockperf_tools.fulllog.iter_full_log', chunks)
+    tracemalloc.start()
+    try:
+        stats = sequence.sequence_stats('unused', step=1)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert stats['received'] == n and stats['lost'] == 0
+    # The bitmap is n / 8 bytes (doubled while growing); one chunk is ~0.5 MB per column
+    assert peak < n / 8 * 2 + 40 * chunk * 8
@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from sockperf_tools.cache import ParseCache
+from sockperf_tools.histogram import LatencyHistogram
+from sockperf_tools.parser import parse_sockperf_file
+from sockperf_tools.significance import _support, bootstrap, compare_runs, mann_whitney, print_significance
+
+
+@pytest.fixture
+def runs(tmp_path, repo_result, write_full_log, ping_pong_samples):
+    seq, tx, rx = ping_pong_samples
+    dual = repo_result('sockperf_pingpong_udp.txt', directory=tmp_path / 'dual')
+    single = repo_result('sockperf_single_pingpong_udp.txt', 'sockperf_pingpong_udp.txt', tmp_path / 'single')
+    write_full_log(dual.with_suffix('.csv'), seq, tx, rx)
+    # Same shape, 10 µs faster one way
+    write_full_log(single.with_suffix('.csv'), seq, tx, rx - 20_000)
+    return parse_sockperf_file(dual), parse_sockperf_file(single)
+
+
+def test_bootstrap_is_deterministic_with_a_seed():
+    rng = np.random.default_rng(0)
+    values, counts = _support(LatencyHistogram.from_samples(40 + rng.gamma(2.0, 3.0, 20_000)))
+    first = bootstrap(values, counts, resamples=700, rng=5)
+    assert first.shape == (4, 700)
+    np.testing.assert_array_equal(first, bootstrap(values, counts, resamples=700, rng=5))
+    assert not np.array_equal(first, bootstrap(values, counts, resamples=700, rng=6))
+
+
+def test_compare_runs_is_reproducible(runs):
+    a = compare_runs(*runs, resamples=300, seed=1)
+    assert a == compare_runs(*runs, resamples=300, seed=1)
+
+
+def test_full_logs_are_used_without_a_cache(runs):
+    uncached = compare_runs(*runs, resamples=300, seed=1)
+    cached = compare_runs(*runs, resamples=300, seed=1, cache=ParseCache())
+    assert uncached['source'] == cached['source'] == ('full-log', 'full-log')
+    assert uncached['observations'] == (5000, 5000)
+    mean = uncached['statistics']['mean']
+    assert mean['reduction'] == pytest.approx(10.0)
+    assert mean['significant'] and mean['reduction_ci'][0] <= 10.0 <= mean['reduction_ci'][1] + 1e-9
+    assert uncached['statistics'] == cached['statistics']
+
+
+def test_summary_only_runs_are_not_tested(repo_result, tmp_path, runs, capsys):
+    dual = parse_sockperf_file(repo_result('sockperf_pingpong_udp.txt'))
+    single = parse_sockperf_file(repo_result('sockperf_single_pingpong_udp.txt'))
+    comparison = compare_runs(dual, single, resamples=200, seed=0)
+    assert comparison['source'] == ('summary', 'summary') and not comparison['tested']
+    assert comparison['p_value'] is None and comparison['cliffs_delta'] is None and comparison['resamples'] == 0
+    mean = comparison['statistics']['mean']
+    assert mean['a'] == dual.avg_latency_us and mean['reduction'] == pytest.approx(
+        dual.avg_latency_us - single.avg_latency_us)
+    assert 'reduction_ci' not in mean and 'significant' not in mean
+    mixed = compare_runs(runs[0], single, resamples=200, seed=0)
+    assert mixed['source'] == ('full-log', 'summary') and not mixed['tested']
+
+    print_significance({'Ping-Pong (Default)': comparison})
+    out = capsys.readouterr().out
+    rows = [line for line in out.splitlines() if line.startswith('Ping-Pong')]
+    assert len(rows) == 4 and all(line.split()[-1] == 'n/a' and ' n/a ' in line for line in rows)
+    assert 'Mann-Whitney n/a' in out and '0 resamples' in out
+
+
+def test_mann_whitney():
+    values = np.array([1.0, 2.0, 3.0])
+    _, p_same, delta_same = mann_whitney(values, np.array([10, 10, 10]), values, np.array([10, 10, 10]))
+    assert p_same == pytest.approx(1.0) and delta_same == 0.0
+    _, p, delta = mann_whitney(values + 10, np.array([10, 10, 10]), values, np.array([10, 10, 10]))
+    assert delta == 1.0 and p < 1e-6
@@ -0,0 +1,85 @@
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from sockperf_tools.batch import parse_files
+from sockperf_tools.histogram import LatencyHistogram
+from sockperf_tools.store import ResultStore, metric_column
+
+
+@pytest.fixture
+def store(tmp_path):
+    with ResultStore(str(tmp_path / 'results.db')) as store:
+        yield store
+
+
+@pytest.fixture
+def runs(repo_result):
+    today = date.today()
+    entries = [
+        (repo_result('sockperf_pingpong_udp.txt'), {'topology': 'dual', 'date': str(today - timedelta(days=200))}),
+        (repo_result('sockperf_pingpong_1472B.txt'), {'topology': 'dual', 'date': str(today - timedelta(days=3)),
+                                                      'firmware': 'v2'}),
+        (repo_result('sockperf_single_pingpong_1472B.txt'), {'topology': 'single', 'date': str(today)}),
+        (repo_result('sockperf_throughput_udp.txt'), {'topology': 'dual', 'date': str(today)}),
+    ]
+    return parse_files(entries, jobs=1)
+
+
+def test_metric_column_aliases():
+    assert metric_column('p99.9') == 'p99_9'
+    assert metric_column('99.999') == 'p99_999'
+    assert metric_column('avg') == 'avg_latency_us'
+    assert metric_column('msg_rate') == 'msg_rate'
+    with pytest.raises(ValueError):
+        metric_column('p42')
+
+
+def test_ingest_and_query(store, runs):
+    assert store.ingest(runs) == 4
+    rows = store.query(topology='dual', msg_size=1472, test_type='ping-pong', columns=['p99.9', 'avg'])
+    assert len(rows) == 1
+    assert rows[0]['p99_9'] == runs[1].percentiles[99.9]
+    assert rows[0]['avg_latency_us'] == runs[1].avg_latency_us
+    assert [r['topology'] for r in store.query(msg_size=1472, test_type='ping-pong')] == ['dual', 'single']
+    assert store.query(test_type='throughput')[0]['bandwidth_mbps'] == 912.723
+    assert len(store.query(firmware='v2')) == 1
+
+
+def test_date_filters(store, runs):
+    store.ingest(runs)
+    assert len(store.query(days=90)) == 3
+    assert len(store.query(until=str(date.today() - timedelta(days=100)))) == 1
+    assert len(store.query(since=str(date.today()))) == 2
+
+
+def test_reingest_updates_in_place(store, runs):
+    store.ingest(runs)
+    runs[0].topology = 'dual'
+    runs[0].firmware = 'v3'
+    store.ingest(runs[:1])
+    assert len(store.query()) == 4
+    assert store.query(firmware='v3')[0]['path'] == runs[0].filename
+
+
+def test_merged_histogram_counts_every_observation(store, runs):
+    store.ingest(runs)
+    merged = store.merged_histogram(msg_size=1472, test_type='ping-pong')
+    assert merged.count == runs[1].total_observations + runs[2].total_observations
+    assert merged.mean == pytest.approx((runs[1].avg_latency_us * runs[1].total_observations
+                                         + runs[2].avg_latency_us * runs[2].total_observations) / merged.count,
+                                        rel=0.01)
+
+
+def test_full_log_samples_round_trip(store, repo_result, write_full_log, ping_pong_samples):
+    summary = repo_result('sockperf_pingpong_udp.txt')
+    seq, tx, rx = ping_pong_samples
+    write_full_log(summary.with_suffix('.csv'), seq, tx, rx)
+    store.ingest(parse_files([summary], jobs=1))
+    [row] = store.query()
+    np.testing.assert_allclose(store.samples(row['id']), (rx - tx) / 2000.0)
+    # Without a cache the stored histogram is still the exact one
+    merged = store.merged_histogram()
+    assert merged.count == len(seq)
+    np.testing.assert_array_equal(merged.counts, LatencyHistogram.from_samples((rx - tx) / 2000.0).counts)
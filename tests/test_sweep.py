@@ -0,0 +1,129 @@
+import numpy as np
+import pytest
+
+from sockperf_tools import sweep
+from sockperf_tools.batch import discover, parse_files
+
+RATES = np.arange(5_000, 85_000, 5_000)
+
+
+def _hockey_stick(rates, knee, base, slope_after):
+    """Latency in µs: 0.1 µs per 1000 msg/s up to the knee, slope_after beyond"""
+    k = rates / 1000.0
+    return base + 0.1 * k + (slope_after - 0.1) * np.maximum(k - knee / 1000.0, 0)
+
+
+@pytest.fixture
+def sweep_tree(tmp_path, repo_result, write_under_load):
+    for topology, knee, base in (('dual', 50_000, 90.0), ('single', 60_000, 80.0)):
+        for rate in RATES:
+            percentiles = {p: float(_hockey_stick(rate, knee, base * scale, 3.0 * scale))
+                           for p, scale in ((50.0, 1.0), (99.0, 1.5), (99.9, 2.0))}
+            write_under_load(tmp_path / topology / f'sockperf_underload_udp_{rate}mps.txt', int(rate), percentiles)
+    repo_result('sockperf_throughput_udp.txt', directory=tmp_path / 'dual')
+    return tmp_path
+
+
+def _naive_knee(x, y, knots):
+    best = None
+    for k in knots:
+        design = np.column_stack([np.ones_like(x), x, np.maximum(x - k, 0)])
+        beta, *_ = np.linalg.lstsq(design, y, rcond=None)
+        error = ((design @ beta - y) ** 2).sum()
+        if best is None or error < best[0]:
+            best = (error, k)
+    return best[1]
+
+
+def test_curves_group_rates_and_average_repeats(tmp_path, sweep_tree, write_under_load):
+    write_under_load(tmp_path / 'dual' / 'sockperf_underload_udp_5000mps_r2.txt', 5000,
+                     {50.0: 100.0, 99.0: 200.0, 99.9: 300.0})
+    curves = sweep.sweep_curves(parse_files(discover([sweep_tree]), jobs=1))
+    assert set(curves) == {('dual', 'UDP', None), ('single', 'UDP', None)}
+    dual = curves['dual', 'UDP', None]
+    np.testing.assert_array_equal(dual['offered'], RATES)
+    assert dual['runs'][0] == 2 and dual['runs'][1:].tolist() == [1] * (len(RATES) - 1)
+    assert dual['latency'][0, 0] == pytest.approx((_hockey_stick(5000, 50_000, 90.0, 3.0) + 100.0) / 2)
+    assert dual['achieved'][3] == pytest.approx(20_000, rel=1e-3)
+    assert dual['ceiling'] is None  # the throughput run sent 1472 B messages
+    assert curves['single', 'UDP', None]['ceiling'] is None
+
+
+def test_repeats_and_ceiling_through_load_sweep(tmp_path, repo_result, write_under_load, capsys):
+    for rate, repeat, p50 in ((10_000, '', 60.0), (10_000, '_r2', 80.0), (20_000, '', 70.0),
+                              (30_000, '', 75.0), (40_000, '', 90.0)):
+        write_under_load(tmp_path / f'sockperf_underload_udp_1472B_{rate}mps{repeat}.txt', rate,
+                         {50.0: p50, 99.0: 2 * p50, 99.9: 3 * p50})
+    write_under_load(tmp_path / 'sockperf_underload_udp_10000mps.txt', 10_000, {50.0: 40.0, 99.0: 80.0, 99.9: 120.0})
+    repo_result('sockperf_throughput_udp.txt')
+    runs = sweep.load_sweep([tmp_path], jobs=1)
+    assert len(runs) == 7
+    curves = sweep.sweep_curves(runs.values())
+    sized = curves['dual', 'UDP', 1472]
+    assert sized['runs'].tolist() == [2, 1, 1, 1] and sized['latency'][0, 0] == pytest.approx(70.0)
+    assert sized['ceiling'] == pytest.approx(81_272, rel=1e-3)
+    assert curves['dual', 'UDP', None]['ceiling'] is None
+
+    sweep.main([str(tmp_path), '--no-plot', '-j', '1'])
+    out = capsys.readouterr().out
+    assert 'Dual UDP 1472B: 4 rates, 5 runs, throughput ceiling 81,272 msg/s' in out
+    assert 'Dual UDP default: 1 rates, 1 runs\n' in out
+
+
+def test_knee_found_for_every_percentile(sweep_tree):
+    curves = sweep.sweep_curves(parse_files(discover([sweep_tree]), jobs=1))
+    fits = sweep.knees(curves)
+    step = (RATES[-2] - RATES[1]) / (sweep.KNEE_GRID - 1)
+    for topology, knee in (('dual', 50_000), ('single', 60_000)):
+        fit = fits[topology, 'UDP', None]
+        assert fit['significant'].all()
+        np.testing.assert_allclose(fit['knee'], knee, atol=step)
+        np.testing.assert_allclose(fit['slope_after'], [3.0, 4.5, 6.0], rtol=0.05)
+        assert (fit['gain'] > 0.95).all()
+
+
+def test_batched_fit_matches_one_fit_per_knot():
+    rng = np.random.default_rng(5)
+    x = np.sort(rng.uniform(1_000, 90_000, 12))
+    y = np.column_stack([_hockey_stick(x, 40_000, 50, 2) + rng.normal(0, 0.5, len(x)),
+                         _hockey_stick(x, 70_000, 80, 5) + rng.normal(0, 0.5, len(x))])
+    fit = sweep.find_knee(x, y)
+    knots = np.linspace(x[1], x[-2], sweep.KNEE_GRID)
+    for column in range(2):
+        assert fit['knee'][column] == pytest.approx(_naive_knee(x, y[:, column], knots))
+
+
+def test_straight_lines_and_short_sweeps_have_no_knee():
+    x = RATES.astype(float)
+    fit = sweep.find_knee(x, 50 + 0.2 * x / 1000)
+    assert not fit['significant'].any()
+    falling = sweep.find_knee(x, np.where(x < 40_000, 900 - 21 * x / 1000, 60 + 2.5 * (x - 40_000) / 1000))
+    assert falling['slope_before'][0] < 0 < falling['slope_after'][0] and not falling['significant'].any()
+    short = sweep.find_knee(x[:3], x[:3])
+    assert np.isnan(short['knee']).all() and not short['significant'].any()
+
+
+def test_dual_vs_single(sweep_tree):
+    curves = sweep.sweep_curves(parse_files(discover([sweep_tree]), jobs=1))
+    [(key, diff)] = sweep.compare_topologies(curves).items()
+    assert key == ('UDP', None)
+    np.testing.assert_array_equal(diff['rates'], RATES)
+    assert diff['delta'][0, 0] == pytest.approx(10.0, abs=0.01)  # 90 vs 80 µs base before either knee
+    step = (RATES[-2] - RATES[1]) / (sweep.KNEE_GRID - 1)
+    np.testing.assert_allclose(diff['knee_delta'], -10_000, atol=2 * step)
+
+
+def test_main_reports_and_renders(sweep_tree, tmp_path, capsys):
+    output = tmp_path / 'sweep.png'
+    sweep.main([str(sweep_tree), '-o', str(output), '--dpi', '30', '-j', '1'])
+    out = capsys.readouterr().out
+    assert 'Dual UDP default: 16 rates, 16 runs\n' in out
+    assert 'p99 knee at ' in out and 'Dual - single, UDP default (16 common rates)' in out
+    assert output.exists() and '(4 panels drawn' in out
+
+
+def test_checked_in_runs_are_too_few_for_a_knee(repo_result, tmp_path, capsys):
+    repo_result('sockperf_underload_udp.txt')
+    sweep.main([str(tmp_path), '--no-plot', '-j', '1'])
+    out = capsys.readouterr().out
+    assert '1 rates, 1 runs' in out and 'p99: no knee in the swept range' in out
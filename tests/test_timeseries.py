@@ -0,0 +1,131 @@
+import numpy as np
+import pytest
+
+from sockperf_tools import comparison, overview, timeseries
+from sockperf_tools.batch import load_by_topology
+from sockperf_tools.samples import convert
+
+
+@pytest.fixture
+def full_log(tmp_path, write_full_log, ping_pong_samples):
+    return write_full_log(tmp_path / 'run.csv', *ping_pong_samples)
+
+
+def _naive_series(tx, rx, window_ns):
+    windows = (tx - tx[0]) // window_ns
+    latencies = (rx - tx) * 0.5e-3
+    rows = {}
+    for w in np.unique(windows):
+        ordered = np.sort(latencies[windows == w])
+        rows[int(w)] = (len(ordered), ordered[int(np.ceil(0.99 * len(ordered))) - 1], ordered[-1])
+    return rows
+
+
+def test_window_for_uses_a_1_2_5_scale():
+    assert timeseries.window_for(0.5) == pytest.approx(0.002)
+    assert timeseries.window_for(30.0) == pytest.approx(0.1)
+    assert timeseries.window_for(3.0, bins=10) == pytest.approx(0.5)
+    assert timeseries.window_for(0.0) == pytest.approx(1e-6)
+
+
+@pytest.mark.parametrize('chunk_bytes', [1 << 12, 1 << 24])
+def test_bin_series_matches_a_per_window_sort(full_log, ping_pong_samples, chunk_bytes):
+    _, tx, rx = ping_pong_samples
+    series = timeseries.bin_series(full_log, 0.01, chunk_bytes=chunk_bytes)
+    expected = _naive_series(tx, rx, 10 ** 7)
+    assert series['window_s'] == 0.01 and series['start_ns'] == tx[0]
+    assert len(series['count']) == max(expected) + 1
+    assert series['count'].sum() == len(tx)
+    for w, (count, p99, peak) in expected.items():
+        assert series['count'][w] == count
+        assert series['p99_us'][w] == p99 and series['max_us'][w] == peak
+    np.testing.assert_allclose(series['msg_rate'], series['count'] / 0.01)
+
+
+def test_gaps_are_empty_windows(tmp_path, write_full_log, ping_pong_samples):
+    seq, tx, rx = ping_pong_samples
+    tx, rx = tx.copy(), rx.copy()
+    tx[2500:] += 10 ** 9
+    rx[2500:] += 10 ** 9
+    series = timeseries.bin_series(write_full_log(tmp_path / 'gap.csv', seq, tx, rx), 0.1)
+    empty = series['count'] == 0
+    assert empty.sum() >= 9
+    assert np.isnan(series['p99_us'][empty]).all() and not np.isnan(series['p99_us'][~empty]).any()
+
+
+def test_spikes_are_placed_in_time(full_log, ping_pong_samples):
+    _, tx, _ = ping_pong_samples
+    series = timeseries.bin_series(full_log)
+    worst = int(np.nanargmax(series['max_us']))
+    spike_at = (tx[[1500, 3100, 4200]] - tx[0]) / 1e9
+    assert np.any(np.abs(spike_at - series['time_s'][worst] - series['window_s'] / 2) <= series['window_s'])
+
+
+def test_sample_files_and_csv_agree(full_log, tmp_path):
+    binary = convert(full_log, tmp_path / 'run.sps')
+    assert timeseries.log_span(binary) == timeseries.log_span(full_log)
+    a, b = timeseries.bin_series(full_log, 0.02), timeseries.bin_series(binary, 0.02)
+    for key in ('count', 'p50_us', 'p99_us', 'max_us'):
+        np.testing.assert_array_equal(a[key], b[key])
+
+
+def test_minmax_keeps_every_bucket_extreme():
+    rng = np.random.default_rng(1)
+    y = rng.normal(size=100_003)
+    keep = timeseries.minmax(y, 100)
+    assert keep[0] == 0 and keep[-1] == len(y) - 1 and np.all(np.diff(keep) > 0)
+    assert len(keep) <= 2 * 101 + 2
+    assert y.argmax() in keep and y.argmin() in keep
+
+
+def test_lttb_keeps_the_shape():
+    x = np.arange(10_000, dtype=float)
+    y = np.sin(x / 500)
+    y[6000] = 5.0
+    keep = timeseries.lttb(x, y, 200)
+    assert len(keep) == 200 and keep[0] == 0 and keep[-1] == len(x) - 1
+    assert np.all(np.diff(keep) > 0)
+    assert 6000 in keep
+    np.testing.assert_array_equal(timeseries.lttb(x[:50], y[:50], 200), np.arange(50))
+
+
+def test_downsampled_log_keeps_the_global_max(full_log, ping_pong_samples):
+    _, tx, rx = ping_pong_samples
+    latencies = (rx - tx) * 0.5e-3
+    times, values = timeseries.downsample_log(full_log, 200, 'minmax', chunk_bytes=1 << 14)
+    assert len(values) <= 200 and np.all(np.diff(times) >= 0)
+    assert values.max() == latencies.max() and values.min() == latencies.min()
+    # LTTB keeps the shape rather than every extreme, but a spike is the shape
+    times, values = timeseries.downsample_log(full_log, 200, 'lttb', chunk_bytes=1 << 14)
+    assert len(values) == 200 and np.all(np.diff(times) >= 0)
+    assert values.max() == latencies.max()
+    with pytest.raises(ValueError):
+        timeseries.downsample_log(full_log, 200, 'mean')
+
+
+def test_panels_only_with_full_logs(tmp_path, repo_result, write_full_log, ping_pong_samples, capsys):
+    for topology in ('dual', 'single'):
+        repo_result('sockperf_pingpong_udp.txt', directory=tmp_path / topology)
+    by_topology = load_by_topology([tmp_path], jobs=1)
+    assert not timeseries.has_full_log(*by_topology.values())
+    assert comparison._select_timeline(by_topology['dual'], by_topology['single']) == ({},)
+
+    write_full_log(tmp_path / 'dual' / 'sockperf_pingpong_udp.csv', *ping_pong_samples)
+    write_full_log(tmp_path / 'single' / 'sockperf_pingpong_udp.csv', *ping_pong_samples)
+    by_topology = load_by_topology([tmp_path], jobs=1)
+    assert list(timeseries.full_log_runs(by_topology['dual'])) == ['Ping-Pong (Default)']
+    [runs] = comparison._select_timeline(by_topology['dual'], by_topology['single'])
+    assert list(runs) == ['Dual Ping-Pong (Default)', 'Single Ping-Pong (Default)']
+
+    overview.render_overview(by_topology['dual'], tmp_path / 'overview.png', dpi=30, jobs=1)
+    assert '(10 panels drawn' in capsys.readouterr().out  # nine panels and the title
+
+
+def test_main_writes_the_series(full_log, tmp_path, capsys):
+    timeseries.main([str(full_log), '--window', '0.05', '--csv', str(tmp_path / 's.csv'),
+                     '--samples', str(tmp_path / 'd.csv'), '--points', '100', '--method', 'lttb'])
+    assert 'windows of 50 ms, 5,000 samples' in capsys.readouterr().out
+    header = (tmp_path / 's.csv').read_text().split('\n', 1)[0].split(',')
+    rows = np.loadtxt(tmp_path / 's.csv', delimiter=',', skiprows=1)
+    assert rows[:, header.index('count')].sum() == 5000
+    assert len(np.loadtxt(tmp_path / 'd.csv', delimiter=',', skiprows=1)) == 100
@@ -0,0 +1,82 @@
+import io
+
+import numpy as np
+import pytest
+
+from sockperf_tools.fulllog import FullLogTail
+from sockperf_tools.watch import LiveStats, RunningStats, render_html, render_text, watch
+
+
+def test_running_stats_match_numpy():
+    values = np.random.default_rng(1).gamma(3.0, 5.0, 10_001)
+    chunked = RunningStats()
+    for chunk in np.array_split(values, 13):
+        chunked.update(chunk)
+    one_by_one = RunningStats()
+    for value in values[:500]:
+        one_by_one.push(value)
+    assert chunked.count == len(values)
+    assert chunked.mean == pytest.approx(values.mean())
+    assert chunked.std_dev == pytest.approx(values.std())
+    assert (chunked.min, chunked.max) == (values.min(), values.max())
+    assert one_by_one.std_dev == pytest.approx(values[:500].std())
+
+
+def _stream(seconds, rate, seed=2):
+    """tx/rx ns for `seconds` of traffic at `rate` msg/s; latency 50 µs one-way plus noise"""
+    rng = np.random.default_rng(seed)
+    tx = 1_730_790_000 * 10 ** 9 + np.arange(seconds * rate, dtype=np.int64) * (10 ** 9 // rate)
+    return tx, tx + 100_000 + rng.integers(0, 2_000, len(tx))
+
+
+def test_window_keeps_only_recent_seconds():
+    tx, rx = _stream(30, 1000)
+    rx[-1] += 10_000_000  # a 5 ms spike in the last second
+    live = LiveStats(window=5)
+    for part in np.array_split(np.arange(len(tx)), 7):
+        live.add(tx[part], rx[part])
+    snap = live.snapshot()
+    assert snap['observations'] == 30_000
+    assert snap['window_sec'] == 5
+    assert snap['window']['observations'] == 5000
+    assert snap['window']['msg_rate'] == 1000
+    assert snap['spikes'] == snap['window']['spikes'] == 1
+    assert snap['max_latency_us'] == snap['window']['max_latency_us'] == pytest.approx((rx[-1] - tx[-1]) / 2000)
+    assert len(snap['history']) == 30
+    assert 'msg/sec' in render_text('run', snap) and '<svg' in render_html('run', snap, 1.0)
+
+
+def test_tail_holds_back_partial_lines(tmp_path, write_full_log, ping_pong_samples):
+    seq, tx, rx = ping_pong_samples
+    text = write_full_log(tmp_path / 'run.csv', seq, tx, rx).read_bytes()
+    growing = tmp_path / 'growing.csv'
+    tail = FullLogTail(growing, chunk_bytes=4096)
+    got = []
+    for end in range(0, len(text) + 9999, 9999):
+        growing.write_bytes(text[:end])
+        while True:
+            before = tail.offset
+            got.append(tail.read_new()[0])
+            if tail.offset - before < tail.chunk_bytes:
+                break
+    np.testing.assert_array_equal(np.concatenate(got), seq)
+
+
+def test_watch_once_on_a_full_log(tmp_path, repo_result, write_full_log, ping_pong_samples):
+    seq, tx, rx = ping_pong_samples
+    summary = repo_result('sockperf_pingpong_udp.txt')
+    write_full_log(summary.with_suffix('.csv'), seq, tx, rx)
+    html = tmp_path / 'live.html'
+    snap = watch(summary, once=True, html=str(html), out=io.StringIO())
+    latencies = (rx - tx) / 2000.0
+    assert snap['observations'] == len(seq)
+    assert snap['avg_latency_us'] == pytest.approx(latencies.mean())
+    assert snap['max_latency_us'] == pytest.approx(latencies.max())
+    assert html.read_text().startswith('<!DOCTYPE html>')
+
+
+def test_watch_summary_without_full_log(repo_result):
+    out = io.StringIO()
+    result = watch(repo_result('sockperf_pingpong_udp.txt'), interval=0, idle_exit=0, out=out)
+    assert result.avg_latency_us == 52.688
+    assert 'finished (ping-pong)' in out.getvalue()